@@ -0,0 +1,205 @@
+//请求字典转换为结构体的耗时测试
+//
+//对比改造前逐键contains+get+cast的解析方式与getDictItem单次查找、直接拷贝字符串缓冲区的方式：
+//  QUEUES=mutex sh benchmark/run_cpp.sh marshal_benchmark
+#include <chrono>
+#include <cstdio>
+
+#include "vnnh.h"
+#include "pybind11/embed.h"
+#include "nh/futures/NhFtdcTraderApi.h"
+#include "nh/stock/NhStockTraderApi.h"
+
+using namespace nhtd;
+
+//改造前的解析函数
+struct LegacyHelper
+{
+	static void getInt(const dict &d, const char *key, int *value)
+	{
+		if (d.contains(key))
+		{
+			object o = d[key];
+			*value = o.cast<int>();
+		}
+	}
+
+	static void getDouble(const dict &d, const char *key, double *value)
+	{
+		if (d.contains(key))
+		{
+			object o = d[key];
+			*value = o.cast<double>();
+		}
+	}
+
+	static void getChar(const dict &d, const char *key, char *value)
+	{
+		if (d.contains(key))
+		{
+			object o = d[key];
+			*value = o.cast<char>();
+		}
+	}
+
+	template <size_t size>
+	static void getString(const dict &d, const char *key, string_literal<size> &value)
+	{
+		if (d.contains(key))
+		{
+			object o = d[key];
+			string s = o.cast<string>();
+			const char *buf = s.c_str();
+			strcpy(value, buf);
+		}
+	}
+};
+
+//当前vnnh.h中的解析函数
+struct CurrentHelper
+{
+	static void getInt(const dict &d, const char *key, int *value)
+	{
+		::getInt(d, key, value);
+	}
+
+	static void getDouble(const dict &d, const char *key, double *value)
+	{
+		::getDouble(d, key, value);
+	}
+
+	static void getChar(const dict &d, const char *key, char *value)
+	{
+		::getChar(d, key, value);
+	}
+
+	template <size_t size>
+	static void getString(const dict &d, const char *key, string_literal<size> &value)
+	{
+		::getString(d, key, value);
+	}
+};
+
+//与FuturesTdApi::reqOrderInsert相同的解析过程
+template <typename Helper>
+static void fillOrderInsert(const dict &req, CThostFtdcInputOrderField &myreq)
+{
+	memset(&myreq, 0, sizeof(myreq));
+	Helper::getString(req, "BrokerID", myreq.BrokerID);
+	Helper::getString(req, "InvestorID", myreq.InvestorID);
+	Helper::getString(req, "InstrumentID", myreq.InstrumentID);
+	Helper::getString(req, "OrderRef", myreq.OrderRef);
+	Helper::getString(req, "UserID", myreq.UserID);
+	Helper::getChar(req, "OrderPriceType", &myreq.OrderPriceType);
+	Helper::getChar(req, "Direction", &myreq.Direction);
+	Helper::getString(req, "CombOffsetFlag", myreq.CombOffsetFlag);
+	Helper::getString(req, "CombHedgeFlag", myreq.CombHedgeFlag);
+	Helper::getDouble(req, "LimitPrice", &myreq.LimitPrice);
+	Helper::getInt(req, "VolumeTotalOriginal", &myreq.VolumeTotalOriginal);
+	Helper::getChar(req, "TimeCondition", &myreq.TimeCondition);
+	Helper::getString(req, "GTDDate", myreq.GTDDate);
+	Helper::getChar(req, "VolumeCondition", &myreq.VolumeCondition);
+	Helper::getInt(req, "MinVolume", &myreq.MinVolume);
+	Helper::getChar(req, "ContingentCondition", &myreq.ContingentCondition);
+	Helper::getDouble(req, "StopPrice", &myreq.StopPrice);
+	Helper::getChar(req, "ForceCloseReason", &myreq.ForceCloseReason);
+	Helper::getInt(req, "IsAutoSuspend", &myreq.IsAutoSuspend);
+	Helper::getString(req, "BusinessUnit", myreq.BusinessUnit);
+	Helper::getInt(req, "RequestID", &myreq.RequestID);
+	Helper::getInt(req, "UserForceClose", &myreq.UserForceClose);
+	Helper::getInt(req, "IsSwapOrder", &myreq.IsSwapOrder);
+	Helper::getString(req, "ExchangeID", myreq.ExchangeID);
+	Helper::getString(req, "InvestUnitID", myreq.InvestUnitID);
+	Helper::getString(req, "AccountID", myreq.AccountID);
+	Helper::getString(req, "CurrencyID", myreq.CurrencyID);
+	Helper::getString(req, "ClientID", myreq.ClientID);
+	Helper::getString(req, "IPAddress", myreq.IPAddress);
+	Helper::getString(req, "MacAddress", myreq.MacAddress);
+}
+
+//与StockTdApi::reqOptionsInsert相同的解析过程
+template <typename Helper>
+static void fillOptionsInsert(const dict &req, CStockFtdcOptionsInsertReqField &myreq)
+{
+	memset(&myreq, 0, sizeof(myreq));
+	Helper::getInt(req, "ClOrdID", &myreq.ClOrdID);
+	Helper::getString(req, "SecurityID", myreq.SecurityID);
+	Helper::getInt(req, "OwnerType", &myreq.OwnerType);
+	Helper::getDouble(req, "Price", &myreq.Price);
+	Helper::getInt(req, "OrderQty", &myreq.OrderQty);
+	Helper::getChar(req, "Side", &myreq.Side);
+	Helper::getChar(req, "PositionEffect", &myreq.PositionEffect);
+	Helper::getChar(req, "OrdType", &myreq.OrdType);
+	Helper::getChar(req, "TimeInForce", &myreq.TimeInForce);
+	Helper::getString(req, "PartyID", myreq.PartyID);
+
+	int buf = 0;
+	Helper::getInt(req, "CoveredOrUncovered", &buf);
+	myreq.CoveredOrUncovered = buf;
+}
+
+template <typename Func>
+static double measure(int count, Func func)
+{
+	//先预热一轮，使键值缓存和分支预测进入稳定状态
+	for (int i = 0; i < count / 10; ++i)
+		func();
+
+	auto start = chrono::steady_clock::now();
+	for (int i = 0; i < count; ++i)
+		func();
+	auto end = chrono::steady_clock::now();
+	return chrono::duration<double, nano>(end - start).count() / count;
+}
+
+int main()
+{
+	scoped_interpreter guard;
+
+	//与NhFuturesTdApi.send_order生成的字典一致
+	dict order;
+	order["InstrumentID"] = "rb2310";
+	order["ExchangeID"] = "SHFE";
+	order["LimitPrice"] = 3800.0;
+	order["VolumeTotalOriginal"] = 1;
+	order["OrderPriceType"] = "2";
+	order["Direction"] = "0";
+	order["CombOffsetFlag"] = "0";
+	order["OrderRef"] = "12";
+	order["InvestorID"] = "8001";
+	order["UserID"] = "8001";
+	order["BrokerID"] = "9999";
+	order["CombHedgeFlag"] = "1";
+	order["ContingentCondition"] = "1";
+	order["ForceCloseReason"] = "0";
+	order["IsAutoSuspend"] = 0;
+	order["TimeCondition"] = "3";
+	order["VolumeCondition"] = "1";
+	order["MinVolume"] = 1;
+
+	//与NhStockTdApi.send_order生成的字典一致
+	dict options;
+	options["PartyID"] = "A123";
+	options["SecurityID"] = "10004000";
+	options["Side"] = "1";
+	options["OrderQty"] = 1;
+	options["OrdType"] = "2";
+	options["Price"] = 0.1;
+	options["PositionEffect"] = "O";
+	options["TimeInForce"] = "0";
+	options["ClOrdID"] = 1;
+	options["CoveredOrUncovered"] = 0;
+
+	const int count = 300000;
+	CThostFtdcInputOrderField order_req;
+	CStockFtdcOptionsInsertReqField options_req;
+
+	double order_legacy = measure(count, [&]() { fillOrderInsert<LegacyHelper>(order, order_req); });
+	double order_current = measure(count, [&]() { fillOrderInsert<CurrentHelper>(order, order_req); });
+	double options_legacy = measure(count, [&]() { fillOptionsInsert<LegacyHelper>(options, options_req); });
+	double options_current = measure(count, [&]() { fillOptionsInsert<CurrentHelper>(options, options_req); });
+
+	printf("reqOrderInsert   legacy=%7.1fns current=%7.1fns\n", order_legacy, order_current);
+	printf("reqOptionsInsert legacy=%7.1fns current=%7.1fns\n", options_legacy, options_current);
+	return 0;
+}
@@ -0,0 +1,114 @@
+"""期权链构建耗时对比：注册表增量索引与遍历全部合约分组"""
+from datetime import datetime, timedelta
+from timeit import repeat
+from typing import Dict, List
+
+from vnpy.trader.constant import Exchange, OptionType, Product
+from vnpy.trader.object import ContractData
+
+from vnpy_nhtd.gateway.nh_gateway import CHINA_TZ, ContractRegistry
+
+
+UNDERLYINGS: int = 9
+EXPIRIES: int = 4
+STRIKES: int = 110
+REPEAT: int = 5
+
+
+def generate_contracts() -> List[ContractData]:
+    """生成上交所、深交所规模的模拟期权合约"""
+    contracts: List[ContractData] = []
+    start: datetime = CHINA_TZ.localize(datetime(2026, 1, 28))
+
+    for u in range(UNDERLYINGS):
+        exchange: Exchange = Exchange.SSE if u % 2 else Exchange.SZSE
+        underlying: str = f"51{u:04d}"
+        portfolio: str = f"{underlying}_O"
+
+        for e in range(EXPIRIES):
+            expiry: datetime = start + timedelta(days=28 * e)
+
+            for s in range(STRIKES):
+                strike: float = round(2 + s * 0.05, 2)
+
+                for option_type in (OptionType.CALL, OptionType.PUT):
+                    n: int = len(contracts)
+                    contracts.append(ContractData(
+                        symbol=f"1000{n:04d}",
+                        exchange=exchange,
+                        name=f"{underlying}-{option_type.value}-{expiry:%m}-{strike}",
+                        product=Product.OPTION,
+                        size=10000,
+                        pricetick=0.0001,
+                        option_strike=strike,
+                        option_underlying=underlying,
+                        option_type=option_type,
+                        option_expiry=expiry,
+                        option_portfolio=portfolio,
+                        option_index=str(strike),
+                        gateway_name="NH"
+                    ))
+
+    return contracts
+
+
+def build_registry(contracts: List[ContractData]) -> ContractRegistry:
+    """逐个添加合约，同时维护期权链索引"""
+    registry: ContractRegistry = ContractRegistry()
+    for contract in contracts:
+        registry.add(contract)
+    return registry
+
+
+def get_chains(registry: ContractRegistry) -> Dict[str, dict]:
+    """从索引生成全部期权链"""
+    return {
+        portfolio: registry.get_option_chain(portfolio)
+        for portfolio in registry.get_option_portfolios()
+    }
+
+
+def scan_chains(contracts: List[ContractData]) -> Dict[str, dict]:
+    """没有索引时遍历全部合约，按产品、到期日和行权价分组"""
+    chains: Dict[str, dict] = {}
+    for contract in contracts:
+        if not contract.option_type:
+            continue
+        (
+            chains.setdefault(contract.option_portfolio, {})
+            .setdefault(contract.option_expiry, {})
+            .setdefault(contract.option_strike, {})
+        )[contract.option_type] = contract
+
+    return {
+        portfolio: {
+            expiry: {strike: dict(options) for strike, options in sorted(strikes.items())}
+            for expiry, strikes in sorted(expiries.items())
+        }
+        for portfolio, expiries in chains.items()
+    }
+
+
+def best(func) -> float:
+    """多次运行取最短耗时（毫秒）"""
+    return min(repeat(func, number=1, repeat=REPEAT)) * 1000
+
+
+def main() -> None:
+    """运行测试"""
+    contracts: List[ContractData] = generate_contracts()
+    registry: ContractRegistry = build_registry(contracts)
+    assert get_chains(registry) == scan_chains(contracts)
+
+    portfolio: str = registry.get_option_portfolios()[0]
+
+    print(f"contracts:              {len(contracts)}")
+    print(f"registry add (indexed): {best(lambda: build_registry(contracts)):.1f}ms")
+    print(f"all chains from index:  {best(lambda: get_chains(registry)):.1f}ms")
+    print(f"all chains by scan:     {best(lambda: scan_chains(contracts)):.1f}ms")
+    print(f"one chain from index:   {best(lambda: registry.get_option_chain(portfolio)):.2f}ms")
+    print(f"one chain by scan:      {best(lambda: scan_chains(registry.get_all())[portfolio]):.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+#!/bin/sh
+# 编译并运行C++基准测试，分别使用默认互斥锁队列和无锁环形队列各运行一次
+# 用法：sh benchmark/run_cpp.sh <测试名>，例如 sh benchmark/run_cpp.sh task_queue_benchmark
+# 只需测试一种队列时可设置QUEUES，例如 QUEUES=mutex sh benchmark/run_cpp.sh to_utf_benchmark
+set -e
+
+NAME=$1
+ROOT=$(cd "$(dirname "$0")/.." && pwd)
+API=$ROOT/vnpy_nhtd/api
+PYTHON=${PYTHON:-python3}
+
+PY_INCLUDE=$($PYTHON -c "import sysconfig; print(sysconfig.get_paths()['include'])")
+PY_LIBDIR=$($PYTHON -c "import sysconfig; print(sysconfig.get_config_var('LIBDIR'))")
+PY_LIB=$($PYTHON -c "import sysconfig; print('python' + sysconfig.get_config_var('LDVERSION'))")
+
+BUILD=$(mktemp -d)
+trap 'rm -rf "$BUILD"' EXIT
+
+for QUEUE in ${QUEUES:-mutex spsc}; do
+    FLAGS=""
+    if [ "$QUEUE" = "spsc" ]; then
+        FLAGS="-DVNNH_SPSC_QUEUE"
+    fi
+
+    g++ -std=c++17 -O3 -w $FLAGS \
+        -I"$API/include" -I"$API/vnnh" -I"$PY_INCLUDE" \
+        "$ROOT/benchmark/$NAME.cpp" -o "$BUILD/$NAME-$QUEUE" \
+        -L"$PY_LIBDIR" -l"$PY_LIB" -lpthread
+
+    LD_LIBRARY_PATH="$PY_LIBDIR:$LD_LIBRARY_PATH" "$BUILD/$NAME-$QUEUE"
+done
@@ -0,0 +1,243 @@
+//期货委托下单的单笔耗时分布测试
+//
+//在嵌入式解释器中分别按改造前后的send_order流程调用C++接口，统计每笔委托的p50/p99耗时：
+//  改造前：Python逐笔构造19个键的字典，reqOrderInsert逐键解析
+//  改造后：按合约、方向、开平复用报单模板，reqOrderInsertByTemplate只填写价格、数量和报单引用
+//接口只完成请求结构体的填写，不调用柜台API：
+//  QUEUES=mutex sh benchmark/run_cpp.sh send_order_benchmark
+#include <cstdio>
+
+#include "vnnh.h"
+#include "pybind11/embed.h"
+#include "nh/futures/NhFtdcTraderApi.h"
+
+using namespace nhtd;
+
+//与FuturesTdApi中报单相关的函数一致，只保留请求结构体的填写
+class OrderApi
+{
+public:
+	CThostFtdcInputOrderField order_template = CThostFtdcInputOrderField();
+	vector<CThostFtdcInputOrderField> order_templates;
+	CThostFtdcInputOrderField last_req = CThostFtdcInputOrderField();
+
+	int reqOrderInsert(const dict &req, int reqid)
+	{
+		CThostFtdcInputOrderField myreq = CThostFtdcInputOrderField();
+		memset(&myreq, 0, sizeof(myreq));
+		getString(req, "BrokerID", myreq.BrokerID);
+		getString(req, "InvestorID", myreq.InvestorID);
+		getString(req, "InstrumentID", myreq.InstrumentID);
+		getString(req, "OrderRef", myreq.OrderRef);
+		getString(req, "UserID", myreq.UserID);
+		getChar(req, "OrderPriceType", &myreq.OrderPriceType);
+		getChar(req, "Direction", &myreq.Direction);
+		getString(req, "CombOffsetFlag", myreq.CombOffsetFlag);
+		getString(req, "CombHedgeFlag", myreq.CombHedgeFlag);
+		getDouble(req, "LimitPrice", &myreq.LimitPrice);
+		getInt(req, "VolumeTotalOriginal", &myreq.VolumeTotalOriginal);
+		getChar(req, "TimeCondition", &myreq.TimeCondition);
+		getString(req, "GTDDate", myreq.GTDDate);
+		getChar(req, "VolumeCondition", &myreq.VolumeCondition);
+		getInt(req, "MinVolume", &myreq.MinVolume);
+		getChar(req, "ContingentCondition", &myreq.ContingentCondition);
+		getDouble(req, "StopPrice", &myreq.StopPrice);
+		getChar(req, "ForceCloseReason", &myreq.ForceCloseReason);
+		getInt(req, "IsAutoSuspend", &myreq.IsAutoSuspend);
+		getString(req, "BusinessUnit", myreq.BusinessUnit);
+		getInt(req, "RequestID", &myreq.RequestID);
+		getInt(req, "UserForceClose", &myreq.UserForceClose);
+		getInt(req, "IsSwapOrder", &myreq.IsSwapOrder);
+		getString(req, "ExchangeID", myreq.ExchangeID);
+		getString(req, "InvestUnitID", myreq.InvestUnitID);
+		getString(req, "AccountID", myreq.AccountID);
+		getString(req, "CurrencyID", myreq.CurrencyID);
+		getString(req, "ClientID", myreq.ClientID);
+		getString(req, "IPAddress", myreq.IPAddress);
+		getString(req, "MacAddress", myreq.MacAddress);
+		this->last_req = myreq;
+		return 0;
+	}
+
+	void setOrderInsertTemplate(const dict &req)
+	{
+		CThostFtdcInputOrderField myreq = CThostFtdcInputOrderField();
+		memset(&myreq, 0, sizeof(myreq));
+		getString(req, "BrokerID", myreq.BrokerID);
+		getString(req, "InvestorID", myreq.InvestorID);
+		getString(req, "UserID", myreq.UserID);
+		getString(req, "CombHedgeFlag", myreq.CombHedgeFlag);
+		getInt(req, "MinVolume", &myreq.MinVolume);
+		getChar(req, "ContingentCondition", &myreq.ContingentCondition);
+		getChar(req, "ForceCloseReason", &myreq.ForceCloseReason);
+		getInt(req, "IsAutoSuspend", &myreq.IsAutoSuspend);
+		this->order_template = myreq;
+	}
+
+	int addOrderTemplate(const dict &req)
+	{
+		CThostFtdcInputOrderField myreq = this->order_template;
+		getString(req, "InstrumentID", myreq.InstrumentID);
+		getString(req, "ExchangeID", myreq.ExchangeID);
+		getChar(req, "OrderPriceType", &myreq.OrderPriceType);
+		getChar(req, "Direction", &myreq.Direction);
+		getString(req, "CombOffsetFlag", myreq.CombOffsetFlag);
+		getChar(req, "TimeCondition", &myreq.TimeCondition);
+		getChar(req, "VolumeCondition", &myreq.VolumeCondition);
+		this->order_templates.push_back(myreq);
+		return (int)this->order_templates.size() - 1;
+	}
+
+	int reqOrderInsertByTemplate(int template_id, double price, int volume, string order_ref, int reqid)
+	{
+		if (template_id < 0 || template_id >= (int)this->order_templates.size())
+			throw index_error("invalid order template id");
+
+		CThostFtdcInputOrderField myreq = this->order_templates[template_id];
+		setString(myreq.OrderRef, order_ref);
+		myreq.LimitPrice = price;
+		myreq.VolumeTotalOriginal = volume;
+		this->last_req = myreq;
+		return 0;
+	}
+};
+
+PYBIND11_EMBEDDED_MODULE(order_api, m)
+{
+	class_<OrderApi>(m, "OrderApi")
+		.def(init<>())
+		.def("reqOrderInsert", &OrderApi::reqOrderInsert)
+		.def("setOrderInsertTemplate", &OrderApi::setOrderInsertTemplate)
+		.def("addOrderTemplate", &OrderApi::addOrderTemplate)
+		.def("reqOrderInsertByTemplate", &OrderApi::reqOrderInsertByTemplate);
+}
+
+//与NhFuturesTdApi.send_order改造前后的流程一致，OrderRequest简化为元组
+static const char *SCRIPT = R"(
+from time import perf_counter_ns
+
+from order_api import OrderApi
+
+COUNT = 200000
+REQS = [
+    ("rb2310", "SHFE", 3800.0 + (n % 10), 1, "2", "0" if n % 2 else "1", "0" if n % 3 else "1")
+    for n in range(64)
+]
+
+
+class LegacyTdApi(OrderApi):
+
+    def __init__(self):
+        super().__init__()
+        self.userid = "8001"
+        self.brokerid = "9999"
+        self.order_ref = 0
+        self.reqid = 0
+
+    def send_order(self, req):
+        symbol, exchange, price, volume, price_type, direction, offset = req
+        self.order_ref += 1
+
+        nh_req = {
+            "InstrumentID": symbol,
+            "ExchangeID": exchange,
+            "LimitPrice": price,
+            "VolumeTotalOriginal": int(volume),
+            "OrderPriceType": price_type,
+            "Direction": direction,
+            "CombOffsetFlag": offset,
+            "OrderRef": str(self.order_ref),
+            "InvestorID": self.userid,
+            "UserID": self.userid,
+            "BrokerID": self.brokerid,
+            "CombHedgeFlag": "1",
+            "ContingentCondition": "1",
+            "ForceCloseReason": "0",
+            "IsAutoSuspend": 0,
+            "TimeCondition": "3",
+            "VolumeCondition": "1",
+            "MinVolume": 1
+        }
+
+        self.reqid += 1
+        self.reqOrderInsert(nh_req, self.reqid)
+
+
+class TemplateTdApi(OrderApi):
+
+    def __init__(self):
+        super().__init__()
+        self.order_ref = 0
+        self.reqid = 0
+        self.order_templates = {}
+        self.setOrderInsertTemplate({
+            "BrokerID": "9999",
+            "InvestorID": "8001",
+            "UserID": "8001",
+            "CombHedgeFlag": "1",
+            "ContingentCondition": "1",
+            "ForceCloseReason": "0",
+            "IsAutoSuspend": 0,
+            "MinVolume": 1
+        })
+
+    def send_order(self, req):
+        symbol, exchange, price, volume, price_type, direction, offset = req
+        self.order_ref += 1
+        template_id = self.get_order_template(req)
+
+        self.reqid += 1
+        self.reqOrderInsertByTemplate(template_id, price, int(volume), str(self.order_ref), self.reqid)
+
+    def get_order_template(self, req):
+        symbol, exchange, price, volume, price_type, direction, offset = req
+        key = (symbol, exchange, price_type, offset, direction)
+
+        template_id = self.order_templates.get(key, None)
+        if template_id is None:
+            template_id = self.addOrderTemplate({
+                "InstrumentID": symbol,
+                "ExchangeID": exchange,
+                "OrderPriceType": price_type,
+                "Direction": direction,
+                "CombOffsetFlag": offset,
+                "TimeCondition": "3",
+                "VolumeCondition": "1"
+            })
+            self.order_templates[key] = template_id
+
+        return template_id
+
+
+def measure(api):
+    for n in range(COUNT // 10):
+        api.send_order(REQS[n % len(REQS)])
+
+    costs = []
+    for n in range(COUNT):
+        req = REQS[n % len(REQS)]
+        start = perf_counter_ns()
+        api.send_order(req)
+        costs.append(perf_counter_ns() - start)
+
+    costs.sort()
+    return costs
+
+
+for name, api in (("dict", LegacyTdApi()), ("template", TemplateTdApi())):
+    costs = measure(api)
+    print(
+        f"{name:<9} "
+        f"p50={costs[COUNT // 2]:>6}ns "
+        f"p90={costs[COUNT * 90 // 100]:>6}ns "
+        f"p99={costs[COUNT * 99 // 100]:>6}ns "
+        f"p99.9={costs[COUNT * 999 // 1000]:>7}ns"
+    )
+)";
+
+int main()
+{
+	scoped_interpreter guard;
+	exec(SCRIPT);
+	return 0;
+}
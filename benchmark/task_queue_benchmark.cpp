@@ -0,0 +1,86 @@
+//任务队列推送到取出的延时测试
+//
+//分别编译默认的互斥锁队列和无锁环形队列后对比运行结果：
+//  sh benchmark/run_cpp.sh task_queue_benchmark
+//
+//测试两种场景：
+//  burst：生产者连续推送，对应开盘时的行情突发
+//  paced：生产者每次推送后休眠约20微秒，对应平稳行情，消费者经常处于等待状态
+#include <algorithm>
+#include <chrono>
+#include <cstdio>
+
+#include "vnnh.h"
+
+static void report(const char *name, vector<long long> &values)
+{
+	sort(values.begin(), values.end());
+	size_t n = values.size();
+	printf("%-14s p50=%7lldns p90=%7lldns p99=%7lldns p99.9=%8lldns max=%9lldns\n",
+		name,
+		values[n / 2],
+		values[n * 90 / 100],
+		values[n * 99 / 100],
+		values[n * 999 / 1000],
+		values[n - 1]);
+}
+
+static void run(const char *scenario, int count, long long interval)
+{
+	TaskQueue queue;
+	vector<long long> latency;
+	vector<long long> push_cost;
+	latency.reserve(count);
+	push_cost.reserve(count);
+
+	//消费者记录每个任务从入队到取出的延时
+	thread consumer([&]() {
+		try
+		{
+			while (true)
+			{
+				Task task = queue.pop();
+				latency.push_back(getTimestamp() - task.task_time);
+				if (task.task_id == count - 1)
+					break;
+			}
+		}
+		catch (const TerminatedError&)
+		{
+		}
+	});
+
+	//生产者记录每次推送的耗时，即SPI回调线程上的开销
+	for (int i = 0; i < count; ++i)
+	{
+		if (interval)
+			this_thread::sleep_for(chrono::nanoseconds(interval));
+
+		Task task = Task();
+		task.task_name = 0;
+		task.task_id = i;
+
+		long long start = getTimestamp();
+		queue.push(task);
+		push_cost.push_back(getTimestamp() - start);
+	}
+
+	consumer.join();
+
+	printf("[%s]\n", scenario);
+	report("push-to-pop", latency);
+	report("push cost", push_cost);
+}
+
+int main()
+{
+#ifdef VNNH_SPSC_QUEUE
+	printf("TaskQueue: SPSC ring buffer\n");
+#else
+	printf("TaskQueue: mutex + condition_variable\n");
+#endif
+
+	run("burst", 1000000, 0);
+	run("paced", 200000, 20000);
+	return 0;
+}
@@ -0,0 +1,31 @@
+"""行情时间戳生成耗时对比：逐笔字符串解析与复用当日零点"""
+from datetime import datetime
+from timeit import timeit
+from types import SimpleNamespace
+
+from vnpy_nhtd.gateway.nh_gateway import CHINA_TZ, NhMdApi
+
+
+COUNT = 200000
+
+
+def parse_tick_datetime(current_date: str, update_time: str, update_millisec: int) -> datetime:
+    """改造前逐笔解析字符串的实现"""
+    timestamp: str = f"{current_date} {update_time}.{int(update_millisec/100)}"
+    dt: datetime = datetime.strptime(timestamp, "%Y%m%d %H:%M:%S.%f")
+    return CHINA_TZ.localize(dt)
+
+
+def main() -> None:
+    """运行测试"""
+    api = SimpleNamespace(current_date="20260105", midnight_date="", midnight=None)
+
+    legacy: float = timeit(lambda: parse_tick_datetime("20260105", "09:30:01", 500), number=COUNT)
+    current: float = timeit(lambda: NhMdApi.get_tick_datetime(api, "09:30:01", 500), number=COUNT)
+
+    print(f"strptime:          {legacy / COUNT * 1e6:.2f}us")
+    print(f"get_tick_datetime: {current / COUNT * 1e6:.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+//GBK转UTF8的耗时测试
+//
+//对比改造前的toUtf、带ASCII快速路径的toUtf以及toUtfCached，
+//每种方式都包含构造Python字符串对象的开销，与行情回调中的实际用法一致：
+//  QUEUES=mutex sh benchmark/run_cpp.sh to_utf_benchmark
+//
+//改造前的转换函数和非ASCII的测试需要系统安装zh_CN.GB18030语言环境，未安装时跳过
+#include <chrono>
+#include <cstdio>
+
+#include "vnnh.h"
+#include "pybind11/embed.h"
+
+//改造前的转换函数，每次调用都新建缓冲区和转换器
+static string toUtfLegacy(const string &gb2312)
+{
+#ifdef _MSC_VER
+	const static locale loc("zh-CN");
+#else
+	const static locale loc("zh_CN.GB18030");
+#endif
+
+	vector<wchar_t> wstr(gb2312.size());
+	wchar_t* wstrEnd = nullptr;
+	const char* gbEnd = nullptr;
+	mbstate_t state = {};
+	int res = use_facet<codecvt<wchar_t, char, mbstate_t> >
+		(loc).in(state,
+			gb2312.data(), gb2312.data() + gb2312.size(), gbEnd,
+			wstr.data(), wstr.data() + wstr.size(), wstrEnd);
+
+	if (codecvt_base::ok == res)
+	{
+		wstring_convert<codecvt_utf8<wchar_t>> cutf8;
+		return cutf8.to_bytes(wstring(wstr.data(), wstrEnd));
+	}
+
+	return string();
+}
+
+template <typename Func>
+static double measure(int count, Func func)
+{
+	auto start = chrono::steady_clock::now();
+	for (int i = 0; i < count; ++i)
+		func();
+	auto end = chrono::steady_clock::now();
+	return chrono::duration<double, nano>(end - start).count() / count;
+}
+
+static bool hasLocale()
+{
+	try
+	{
+#ifdef _MSC_VER
+		locale loc("zh-CN");
+#else
+		locale loc("zh_CN.GB18030");
+#endif
+		return true;
+	}
+	catch (const runtime_error &)
+	{
+		return false;
+	}
+}
+
+static void run(const char *name, const string &value, bool legacy)
+{
+	const int count = 1000000;
+
+	printf("%-8s", name);
+	if (legacy)
+		printf(" legacy=%7.1fns", measure(count, [&]() { object o = str(toUtfLegacy(value)); }));
+	printf(" toUtf=%7.1fns", measure(count, [&]() { object o = str(toUtf(value)); }));
+	printf(" toUtfCached=%7.1fns\n", measure(count, [&]() { object o = toUtfCached(value); }));
+}
+
+int main()
+{
+	scoped_interpreter guard;
+
+	bool locale_ready = hasLocale();
+	if (!locale_ready)
+		printf("zh_CN.GB18030 locale not available, legacy and gbk cases skipped\n");
+
+	//合约代码、日期、时间等行情字段均为纯ASCII
+	run("ascii", "rb2310", locale_ready);
+
+	if (locale_ready)
+		run("gbk", "\xc4\xcf\xbb\xaa\xc6\xda\xbb\xf5", true);		//“南华期货”的GBK编码
+
+	return 0;
+}
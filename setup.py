@@ -1,3 +1,4 @@
+import os
 import platform
 
 from setuptools import Extension, setup
@@ -22,6 +23,11 @@ def get_ext_modules() -> list:
     extra_link_args = ["-lstdc++"]
     runtime_library_dirs = ["$ORIGIN"]
 
+    # 设置环境变量VNNH_TASK_QUEUE=spsc，使用无锁环形任务队列
+    define_macros = []
+    if os.environ.get("VNNH_TASK_QUEUE", "") == "spsc":
+        define_macros.append(("VNNH_SPSC_QUEUE", None))
+
     vnnhmd = Extension(
         "vnpy_nhtd.api.vnnhmd",
         [
@@ -29,7 +35,7 @@ def get_ext_modules() -> list:
         ],
         include_dirs=["vnpy_nhtd/api/include",
                       "vnpy_nhtd/api/vnnh"],
-        define_macros=[],
+        define_macros=define_macros,
         undef_macros=[],
         library_dirs=["vnpy_nhtd/api/libs", "vnpy_nhtd/api"],
         libraries=["nhmdapi", "nhtd2traderapi", "nhtdstockapi"],
@@ -47,7 +53,7 @@ def get_ext_modules() -> list:
         ],
         include_dirs=["vnpy_nhtd/api/include",
                       "vnpy_nhtd/api/vnnh"],
-        define_macros=[],
+        define_macros=define_macros,
         undef_macros=[],
         library_dirs=["vnpy_nhtd/api/libs", "vnpy_nhtd/api"],
         libraries=["nhmdapi", "nhtd2traderapi", "nhtdstockapi"],
@@ -65,7 +71,7 @@ def get_ext_modules() -> list:
         ],
         include_dirs=["vnpy_nhtd/api/include",
                       "vnpy_nhtd/api/vnnh"],
-        define_macros=[],
+        define_macros=define_macros,
         undef_macros=[],
         library_dirs=["vnpy_nhtd/api/libs", "vnpy_nhtd/api"],
         libraries=["nhmdapi", "nhtd2traderapi", "nhtdstockapi"],
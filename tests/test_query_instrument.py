@@ -0,0 +1,87 @@
+"""合约查询失败后按退避间隔重试的测试"""
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+nh_gateway = pytest.importorskip("vnpy_nhtd.gateway.nh_gateway")
+
+
+class StubEventEngine:
+    """只记录定时事件注册状态的事件引擎"""
+
+    def __init__(self) -> None:
+        self.handlers: list = []
+
+    def register(self, type: str, handler) -> None:
+        self.handlers.append(handler)
+
+    def unregister(self, type: str, handler) -> None:
+        self.handlers.remove(handler)
+
+
+def create_api(api_class, func_name: str, results: List[int]):
+    """创建请求函数按results依次返回的交易接口"""
+    gateway = SimpleNamespace(
+        gateway_name="NH",
+        contracts=nh_gateway.ContractRegistry(),
+        position_book=nh_gateway.PositionBook("NH"),
+        event_engine=StubEventEngine()
+    )
+    api = api_class(gateway)
+
+    calls: List[int] = []
+
+    def request(req: dict, reqid: int) -> int:
+        calls.append(reqid)
+        return results.pop(0)
+
+    setattr(api, func_name, request)
+    return api, calls
+
+
+def run_timer(api, count: int) -> List[int]:
+    """触发count次定时事件，返回发出请求时的秒数"""
+    sent: List[int] = []
+    for second in range(1, count + 1):
+        reqid: int = api.reqid
+        for handler in list(api.gateway.event_engine.handlers):
+            handler(None)
+        if api.reqid != reqid:
+            sent.append(second)
+    return sent
+
+
+@pytest.mark.parametrize("api_class, func_name", [
+    ("NhFuturesTdApi", "reqQryInstrument"),
+    ("NhStockTdApi", "reqQryOptions"),
+])
+def test_query_instrument_backoff(api_class: str, func_name: str) -> None:
+    """请求连续失败时间隔按2、4、8秒递增，成功后停止重试"""
+    api, calls = create_api(getattr(nh_gateway, api_class), func_name, [-3, -3, -3, 0])
+
+    api.instrument_countdown = 1
+    api.instrument_interval = 1
+    api.gateway.event_engine.register("eTimer", api.query_instrument)
+
+    sent: List[int] = run_timer(api, 20)
+
+    assert sent == [1, 3, 7, 15]
+    assert calls == [1, 2, 3, 4]
+    assert not api.gateway.event_engine.handlers
+
+
+def test_query_instrument_backoff_capped() -> None:
+    """退避间隔不超过16秒"""
+    api, calls = create_api(nh_gateway.NhFuturesTdApi, "reqQryInstrument", [-3] * 10)
+
+    api.instrument_countdown = 1
+    api.instrument_interval = 1
+    api.gateway.event_engine.register("eTimer", api.query_instrument)
+
+    sent: List[int] = run_timer(api, 80)
+
+    assert sent == [1, 3, 7, 15, 31, 47, 63, 79]
+    assert len(calls) == 8
+    assert api.instrument_interval == 16
+    assert api.gateway.event_engine.handlers
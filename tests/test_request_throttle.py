@@ -0,0 +1,135 @@
+"""RequestThrottle延后查询的测试（编译C++测试程序运行）"""
+import os
+import shutil
+import subprocess
+import sysconfig
+from pathlib import Path
+
+import pytest
+
+
+API_PATH = Path(__file__).parent.parent.joinpath("vnpy_nhtd", "api")
+
+SOURCE = r"""
+#include "vnnh.h"
+#include "pybind11/embed.h"
+
+int main()
+{
+    pybind11::scoped_interpreter guard;
+    RequestThrottle throttle;
+    throttle.set_limit(10, 2, 1);
+
+    mutex m;
+    vector<int> results = {-2, -3, 0};
+    int calls = 0;
+
+    //令牌耗尽后延后发送，前两次被柜台拒绝
+    while (throttle.acquire_query()) {}
+    int n = throttle.defer([&]() {
+        lock_guard<mutex> l(m);
+        return results[calls++];
+    });
+    printf("defer %d\n", n);
+
+    for (int i = 0; i < 100; i++)
+    {
+        {
+            lock_guard<mutex> l(m);
+            if (calls == 3)
+                break;
+        }
+        pybind11::gil_scoped_release release;
+        this_thread::sleep_for(chrono::milliseconds(50));
+    }
+    printf("calls %d\n", calls);
+
+    {
+        pybind11::gil_scoped_release release;
+        throttle.stop();
+    }
+    pybind11::dict d = throttle.to_dict();
+    printf("retried %d\n", d["query_retried"].cast<int>());
+    printf("stopped %d\n", throttle.defer([]() { return 0; }));
+
+    //重新启用后可以继续延后发送
+    throttle.start();
+    bool sent = false;
+    printf("restarted %d\n", throttle.defer([&]() {
+        lock_guard<mutex> l(m);
+        sent = true;
+        return 0;
+    }));
+    for (int i = 0; i < 40; i++)
+    {
+        {
+            lock_guard<mutex> l(m);
+            if (sent)
+                break;
+        }
+        pybind11::gil_scoped_release release;
+        this_thread::sleep_for(chrono::milliseconds(50));
+    }
+    printf("sent %d\n", sent);
+
+    pybind11::gil_scoped_release release;
+    throttle.stop();
+    return 0;
+}
+"""
+
+
+@pytest.fixture(scope="module")
+def harness(tmp_path_factory) -> Path:
+    """编译测试程序，缺少编译器或Python开发库时跳过"""
+    compiler = shutil.which("g++")
+    if not compiler:
+        pytest.skip("g++ not found")
+
+    include = sysconfig.get_paths()["include"]
+    libdir = sysconfig.get_config_var("LIBDIR")
+    version = sysconfig.get_config_var("LDVERSION") or sysconfig.get_config_var("VERSION")
+    if not Path(include, "Python.h").exists():
+        pytest.skip("Python headers not found")
+
+    folder = tmp_path_factory.mktemp("throttle")
+    source = folder.joinpath("throttle.cpp")
+    source.write_text(SOURCE)
+    output = folder.joinpath("throttle")
+
+    result = subprocess.run(
+        [
+            compiler, "-std=c++17", "-O1", "-w",
+            f"-I{API_PATH.joinpath('vnnh')}", f"-I{API_PATH.joinpath('include')}", f"-I{include}",
+            str(source), "-o", str(output),
+            f"-L{libdir}", f"-lpython{version}", "-lpthread",
+        ],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode:
+        pytest.skip(f"failed to build harness: {result.stderr[-500:]}")
+
+    return output
+
+
+def test_deferred_query_retried(harness: Path) -> None:
+    """柜台拒绝的延后查询会退避重试直到发送成功，exit后重新init可继续延后发送"""
+    env = dict(os.environ)
+    env["LD_LIBRARY_PATH"] = os.pathsep.join(
+        filter(None, [sysconfig.get_config_var("LIBDIR"), env.get("LD_LIBRARY_PATH")])
+    )
+    env["PYTHONHOME"] = sysconfig.get_config_var("prefix")
+
+    result = subprocess.run([str(harness)], capture_output=True, text=True, env=env, timeout=60)
+    assert result.returncode == 0, result.stderr
+
+    lines = dict(line.split() for line in result.stdout.splitlines())
+    assert lines == {
+        "defer": "0",
+        "calls": "3",
+        "retried": "2",
+        "stopped": "-3",
+        "restarted": "0",
+        "sent": "1",
+    }
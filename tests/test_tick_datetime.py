@@ -0,0 +1,79 @@
+"""行情时间戳生成与原字符串解析方式的差分测试"""
+import random
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+nh_gateway = pytest.importorskip("vnpy_nhtd.gateway.nh_gateway")
+
+CHINA_TZ = nh_gateway.CHINA_TZ
+get_tick_datetime = nh_gateway.NhMdApi.get_tick_datetime
+
+
+def parse_tick_datetime(current_date: str, update_time: str, update_millisec: int) -> datetime:
+    """改造前逐笔解析字符串的实现"""
+    timestamp: str = f"{current_date} {update_time}.{int(update_millisec/100)}"
+    dt: datetime = datetime.strptime(timestamp, "%Y%m%d %H:%M:%S.%f")
+    return CHINA_TZ.localize(dt)
+
+
+def create_api(current_date: str) -> SimpleNamespace:
+    """只包含时间戳生成所需属性的行情接口"""
+    return SimpleNamespace(current_date=current_date, midnight_date="", midnight=None)
+
+
+@pytest.mark.parametrize("current_date", ["20260105", "20261231", "20240229"])
+def test_random_times_match_strptime(current_date: str) -> None:
+    """随机时间与原实现结果一致"""
+    rng = random.Random(current_date)
+    api = create_api(current_date)
+
+    for _ in range(20000):
+        update_time: str = f"{rng.randrange(24):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}"
+        update_millisec: int = rng.randrange(1000)
+
+        expected: datetime = parse_tick_datetime(current_date, update_time, update_millisec)
+        result: datetime = get_tick_datetime(api, update_time, update_millisec)
+
+        assert result == expected
+        assert result.isoformat() == expected.isoformat()
+
+
+def test_trading_day_switch() -> None:
+    """交易日切换后使用新的零点"""
+    api = create_api("20260105")
+    get_tick_datetime(api, "21:00:00", 0)
+
+    api.current_date = "20260106"
+    result: datetime = get_tick_datetime(api, "09:00:00", 500)
+
+    assert result == parse_tick_datetime("20260106", "09:00:00", 500)
+
+
+@pytest.mark.parametrize("update_time", ["9:30:00", "09:30:00.5"])
+def test_nonstandard_time_falls_back(update_time: str) -> None:
+    """非标准格式的时间沿用字符串解析"""
+    api = create_api("20260105")
+
+    try:
+        expected = parse_tick_datetime("20260105", update_time, 0)
+    except ValueError:
+        with pytest.raises(ValueError):
+            get_tick_datetime(api, update_time, 0)
+    else:
+        assert get_tick_datetime(api, update_time, 0) == expected
+
+
+@pytest.mark.parametrize("update_millisec", [1000, 1500, 999999, -50])
+def test_out_of_range_millisec_matches_strptime(update_millisec: int) -> None:
+    """毫秒数越界时与原实现行为一致"""
+    api = create_api("20260105")
+
+    try:
+        expected = parse_tick_datetime("20260105", "09:30:00", update_millisec)
+    except ValueError:
+        with pytest.raises(ValueError):
+            get_tick_datetime(api, "09:30:00", update_millisec)
+    else:
+        assert get_tick_datetime(api, "09:30:00", update_millisec) == expected
@@ -0,0 +1,87 @@
+"""成交和持仓推送测试"""
+from typing import List
+
+import pytest
+
+nh_gateway = pytest.importorskip("vnpy_nhtd.gateway.nh_gateway")
+
+from vnpy.event import EventEngine                                      # noqa: E402
+from vnpy.trader.constant import Direction, Exchange, Offset, Product   # noqa: E402
+from vnpy.trader.event import EVENT_POSITION, EVENT_TRADE               # noqa: E402
+from vnpy.trader.object import ContractData, PositionData               # noqa: E402
+
+
+def create_gateway():
+    """创建合约已就绪、未登录资金账户的期权接口，记录推送的事件"""
+    gateway = nh_gateway.NhStockGateway(EventEngine(), "NH")
+
+    events: List[tuple] = []
+    gateway.on_event = lambda type, data=None: events.append((type, data))
+
+    contract: ContractData = ContractData(
+        symbol="10004321",
+        exchange=Exchange.SSE,
+        name="50ETF购6月2500",
+        product=Product.OPTION,
+        size=10000,
+        pricetick=0.0001,
+        gateway_name="NH"
+    )
+    gateway.contracts.add(contract)
+    gateway.td_api.contract_inited = True
+    gateway.td_api.today_date = "20260617"
+
+    return gateway, events
+
+
+def test_trade_without_party_id() -> None:
+    """未设置PartyID时持仓查询无法发出，成交仍立即推送且不累加到持仓簿"""
+    gateway, events = create_gateway()
+    td_api = gateway.td_api
+
+    gateway.query_position()
+    assert not td_api.party_id
+    assert not gateway.position_book.inited
+
+    td_api.onRtnOptionsTrade({
+        "SecurityID": "10004321",
+        "ClOrdID": 1,
+        "ExecID": "T1",
+        "Side": nh_gateway.DIRECTION_VT2STOCK[Direction.LONG],
+        "PositionEffect": nh_gateway.OFFSET_VT2STOCK[Offset.OPEN],
+        "LastPx": 0.1,
+        "LastQty": 2,
+        "TransactTimeOnly": "093000",
+    })
+
+    trades = [data for type, data in events if type == EVENT_TRADE]
+    assert len(trades) == 1
+    assert trades[0].tradeid == "T1"
+    assert trades[0].volume == 2
+
+    assert not td_api.trade_data
+    assert not [data for type, data in events if type == EVENT_POSITION]
+    assert not gateway.position_book.positions
+
+
+def test_refresh_skips_closed_position() -> None:
+    """定时全量推送时跳过已清零推送过的持仓"""
+    gateway, events = create_gateway()
+
+    for volume in (2, 0):
+        gateway.on_positions([
+            PositionData(
+                symbol="10004321",
+                exchange=Exchange.SSE,
+                direction=Direction.LONG,
+                volume=volume,
+                gateway_name="NH"
+            )
+        ])
+
+    positions = [data for type, data in events if type.startswith(EVENT_POSITION)]
+    assert [position.volume for position in positions] == [2, 2, 0, 0]
+
+    events.clear()
+    gateway.refresh_all()
+    assert not [data for type, data in events if type.startswith(EVENT_POSITION)]
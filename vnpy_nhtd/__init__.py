@@ -24,8 +24,8 @@
 
 import importlib_metadata
 
-from .gateway import NhtdFuturesGateway
-from .gateway import NhtdStockGateway
+from .gateway import NhFuturesGateway
+from .gateway import NhStockGateway
 
 
 try:
@@ -120,3 +120,129 @@
 #define ONRTNOPENACCOUNTBYBANK 119
 #define ONRTNCANCELACCOUNTBYBANK 120
 #define ONRTNCHANGEACCOUNTBYBANK 121
+
+//صƣ˳
+static const char *TASK_NAMES[] = {
+	"onFrontConnected",
+	"onFrontDisconnected",
+	"onHeartBeatWarning",
+	"onRspAuthenticate",
+	"onRspUserLogin",
+	"onRspUserLogout",
+	"onRspUserPasswordUpdate",
+	"onRspTradingAccountPasswordUpdate",
+	"onRspOrderInsert",
+	"onRspParkedOrderInsert",
+	"onRspParkedOrderAction",
+	"onRspOrderAction",
+	"onRspQueryMaxOrderVolume",
+	"onRspSettlementInfoConfirm",
+	"onRspRemoveParkedOrder",
+	"onRspRemoveParkedOrderAction",
+	"onRspExecOrderInsert",
+	"onRspExecOrderAction",
+	"onRspForQuoteInsert",
+	"onRspQuoteInsert",
+	"onRspQuoteAction",
+	"onRspBatchOrderAction",
+	"onRspOptionSelfCloseInsert",
+	"onRspOptionSelfCloseAction",
+	"onRspCombActionInsert",
+	"onRspQryOrder",
+	"onRspQryTrade",
+	"onRspQryInvestorPosition",
+	"onRspQryTradingAccount",
+	"onRspQryInvestor",
+	"onRspQryTradingCode",
+	"onRspQryInstrumentMarginRate",
+	"onRspQryInstrumentCommissionRate",
+	"onRspQryExchange",
+	"onRspQryProduct",
+	"onRspQryInstrument",
+	"onRspQryDepthMarketData",
+	"onRspQrySettlementInfo",
+	"onRspQryTransferBank",
+	"onRspQryInvestorPositionDetail",
+	"onRspQryNotice",
+	"onRspQrySettlementInfoConfirm",
+	"onRspQryInvestorPositionCombineDetail",
+	"onRspQryCFMMCTradingAccountKey",
+	"onRspQryEWarrantOffset",
+	"onRspQryInvestorProductGroupMargin",
+	"onRspQryExchangeMarginRate",
+	"onRspQryExchangeMarginRateAdjust",
+	"onRspQryExchangeRate",
+	"onRspQrySecAgentACIDMap",
+	"onRspQryProductExchRate",
+	"onRspQryProductGroup",
+	"onRspQryMMInstrumentCommissionRate",
+	"onRspQryMMOptionInstrCommRate",
+	"onRspQryInstrumentOrderCommRate",
+	"onRspQrySecAgentTradingAccount",
+	"onRspQrySecAgentCheckMode",
+	"onRspQryOptionInstrTradeCost",
+	"onRspQryOptionInstrCommRate",
+	"onRspQryExecOrder",
+	"onRspQryForQuote",
+	"onRspQryQuote",
+	"onRspQryOptionSelfClose",
+	"onRspQryInvestUnit",
+	"onRspQryCombInstrumentGuard",
+	"onRspQryCombAction",
+	"onRspQryTransferSerial",
+	"onRspQryAccountregister",
+	"onRspForQuote",
+	"onRspError",
+	"onRtnOrder",
+	"onRtnTrade",
+	"onErrRtnOrderInsert",
+	"onErrRtnOrderAction",
+	"onRtnInstrumentStatus",
+	"onRtnBulletin",
+	"onRtnTradingNotice",
+	"onRtnErrorConditionalOrder",
+	"onRtnExecOrder",
+	"onErrRtnExecOrderInsert",
+	"onErrRtnExecOrderAction",
+	"onErrRtnForQuoteInsert",
+	"onRtnQuote",
+	"onErrRtnQuoteInsert",
+	"onErrRtnQuoteAction",
+	"onRtnForQuote",
+	"onRtnCFMMCTradingAccountToken",
+	"onErrRtnBatchOrderAction",
+	"onRtnOptionSelfClose",
+	"onErrRtnOptionSelfCloseInsert",
+	"onErrRtnOptionSelfCloseAction",
+	"onRtnCombAction",
+	"onErrRtnCombActionInsert",
+	"onRspQryContractBank",
+	"onRspQryParkedOrder",
+	"onRspQryParkedOrderAction",
+	"onRspQryTradingNotice",
+	"onRspQryBrokerTradingParams",
+	"onRspQryBrokerTradingAlgos",
+	"onRspQueryCFMMCTradingAccountToken",
+	"onRtnFromBankToFutureByBank",
+	"onRtnFromFutureToBankByBank",
+	"onRtnRepealFromBankToFutureByBank",
+	"onRtnRepealFromFutureToBankByBank",
+	"onRtnFromBankToFutureByFuture",
+	"onRtnFromFutureToBankByFuture",
+	"onRtnRepealFromBankToFutureByFutureManual",
+	"onRtnRepealFromFutureToBankByFutureManual",
+	"onRtnQueryBankBalanceByFuture",
+	"onErrRtnBankToFutureByFuture",
+	"onErrRtnFutureToBankByFuture",
+	"onErrRtnRepealBankToFutureByFutureManual",
+	"onErrRtnRepealFutureToBankByFutureManual",
+	"onErrRtnQueryBankBalanceByFuture",
+	"onRtnRepealFromBankToFutureByFuture",
+	"onRtnRepealFromFutureToBankByFuture",
+	"onRspFromBankToFutureByFuture",
+	"onRspFromFutureToBankByFuture",
+	"onRspQueryBankAccountMoneyByFuture",
+	"onRtnOpenAccountByBank",
+	"onRtnCancelAccountByBank",
+	"onRtnChangeAccountByBank",
+};
@@ -130,6 +130,7 @@ int FuturesTdApi::reqOrderInsert(const dict &req, int reqid)
 	getString(req, "ClientID", myreq.ClientID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqOrderInsert(&myreq, reqid);
 	return i;
 };
@@ -173,6 +174,7 @@ int FuturesTdApi::reqParkedOrderInsert(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqParkedOrderInsert(&myreq, reqid);
 	return i;
 };
@@ -203,6 +205,7 @@ int FuturesTdApi::reqParkedOrderAction(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqParkedOrderAction(&myreq, reqid);
 	return i;
 };
@@ -228,6 +231,7 @@ int FuturesTdApi::reqOrderAction(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqOrderAction(&myreq, reqid);
 	return i;
 };
@@ -245,6 +249,8 @@ int FuturesTdApi::reqQueryMaxOrderVolume(const dict &req, int reqid)
 	getInt(req, "MaxVolume", &myreq.MaxVolume);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQueryMaxOrderVolume(&myreq, reqid); });
 	int i = this->api->ReqQueryMaxOrderVolume(&myreq, reqid);
 	return i;
 };
@@ -284,6 +290,7 @@ int FuturesTdApi::reqRemoveParkedOrderAction(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "ParkedOrderActionID", myreq.ParkedOrderActionID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqRemoveParkedOrderAction(&myreq, reqid);
 	return i;
 };
@@ -313,6 +320,7 @@ int FuturesTdApi::reqExecOrderInsert(const dict &req, int reqid)
 	getString(req, "ClientID", myreq.ClientID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqExecOrderInsert(&myreq, reqid);
 	return i;
 };
@@ -336,6 +344,7 @@ int FuturesTdApi::reqExecOrderAction(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqExecOrderAction(&myreq, reqid);
 	return i;
 };
@@ -354,6 +363,7 @@ int FuturesTdApi::reqForQuoteInsert(const dict &req, int reqid)
 	getString(req, "ClientID", myreq.ClientID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqForQuoteInsert(&myreq, reqid);
 	return i;
 };
@@ -385,6 +395,7 @@ int FuturesTdApi::reqQuoteInsert(const dict &req, int reqid)
 	getString(req, "ClientID", myreq.ClientID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqQuoteInsert(&myreq, reqid);
 	return i;
 };
@@ -408,6 +419,7 @@ int FuturesTdApi::reqQuoteAction(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqQuoteAction(&myreq, reqid);
 	return i;
 };
@@ -427,6 +439,7 @@ int FuturesTdApi::reqBatchOrderAction(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqBatchOrderAction(&myreq, reqid);
 	return i;
 };
@@ -452,6 +465,7 @@ int FuturesTdApi::reqOptionSelfCloseInsert(const dict &req, int reqid)
 	getString(req, "ClientID", myreq.ClientID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqOptionSelfCloseInsert(&myreq, reqid);
 	return i;
 };
@@ -475,6 +489,7 @@ int FuturesTdApi::reqOptionSelfCloseAction(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqOptionSelfCloseAction(&myreq, reqid);
 	return i;
 };
@@ -496,6 +511,7 @@ int FuturesTdApi::reqCombActionInsert(const dict &req, int reqid)
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqCombActionInsert(&myreq, reqid);
 	return i;
 };
@@ -512,6 +528,8 @@ int FuturesTdApi::reqQryOrder(const dict &req, int reqid)
 	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOrder(&myreq, reqid); });
 	int i = this->api->ReqQryOrder(&myreq, reqid);
 	return i;
 };
@@ -528,6 +546,8 @@ int FuturesTdApi::reqQryTrade(const dict &req, int reqid)
 	getString(req, "TradeTimeStart", myreq.TradeTimeStart);
 	getString(req, "TradeTimeEnd", myreq.TradeTimeEnd);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTrade(&myreq, reqid); });
 	int i = this->api->ReqQryTrade(&myreq, reqid);
 	return i;
 };
@@ -541,6 +561,8 @@ int FuturesTdApi::reqQryInvestorPosition(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInvestorPosition(&myreq, reqid); });
 	int i = this->api->ReqQryInvestorPosition(&myreq, reqid);
 	return i;
 };
@@ -554,6 +576,8 @@ int FuturesTdApi::reqQryTradingAccount(const dict &req, int reqid)
 	getString(req, "CurrencyID", myreq.CurrencyID);
 	getChar(req, "BizType", &myreq.BizType);
 	getString(req, "AccountID", myreq.AccountID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTradingAccount(&myreq, reqid); });
 	int i = this->api->ReqQryTradingAccount(&myreq, reqid);
 	return i;
 };
@@ -564,6 +588,8 @@ int FuturesTdApi::reqQryInvestor(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInvestor(&myreq, reqid); });
 	int i = this->api->ReqQryInvestor(&myreq, reqid);
 	return i;
 };
@@ -578,6 +604,8 @@ int FuturesTdApi::reqQryTradingCode(const dict &req, int reqid)
 	getString(req, "ClientID", myreq.ClientID);
 	getChar(req, "ClientIDType", &myreq.ClientIDType);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTradingCode(&myreq, reqid); });
 	int i = this->api->ReqQryTradingCode(&myreq, reqid);
 	return i;
 };
@@ -592,6 +620,8 @@ int FuturesTdApi::reqQryInstrumentMarginRate(const dict &req, int reqid)
 	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInstrumentMarginRate(&myreq, reqid); });
 	int i = this->api->ReqQryInstrumentMarginRate(&myreq, reqid);
 	return i;
 };
@@ -605,6 +635,8 @@ int FuturesTdApi::reqQryInstrumentCommissionRate(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInstrumentCommissionRate(&myreq, reqid); });
 	int i = this->api->ReqQryInstrumentCommissionRate(&myreq, reqid);
 	return i;
 };
@@ -614,6 +646,8 @@ int FuturesTdApi::reqQryExchange(const dict &req, int reqid)
 	CThostFtdcQryExchangeField myreq = CThostFtdcQryExchangeField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryExchange(&myreq, reqid); });
 	int i = this->api->ReqQryExchange(&myreq, reqid);
 	return i;
 };
@@ -625,6 +659,8 @@ int FuturesTdApi::reqQryProduct(const dict &req, int reqid)
 	getString(req, "ProductID", myreq.ProductID);
 	getChar(req, "ProductClass", &myreq.ProductClass);
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryProduct(&myreq, reqid); });
 	int i = this->api->ReqQryProduct(&myreq, reqid);
 	return i;
 };
@@ -637,6 +673,8 @@ int FuturesTdApi::reqQryInstrument(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "ExchangeInstID", myreq.ExchangeInstID);
 	getString(req, "ProductID", myreq.ProductID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInstrument(&myreq, reqid); });
 	int i = this->api->ReqQryInstrument(&myreq, reqid);
 	return i;
 };
@@ -647,6 +685,8 @@ int FuturesTdApi::reqQryDepthMarketData(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryDepthMarketData(&myreq, reqid); });
 	int i = this->api->ReqQryDepthMarketData(&myreq, reqid);
 	return i;
 };
@@ -660,6 +700,8 @@ int FuturesTdApi::reqQrySettlementInfo(const dict &req, int reqid)
 	getString(req, "TradingDay", myreq.TradingDay);
 	getString(req, "AccountID", myreq.AccountID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQrySettlementInfo(&myreq, reqid); });
 	int i = this->api->ReqQrySettlementInfo(&myreq, reqid);
 	return i;
 };
@@ -670,6 +712,8 @@ int FuturesTdApi::reqQryTransferBank(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BankID", myreq.BankID);
 	getString(req, "BankBrchID", myreq.BankBrchID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTransferBank(&myreq, reqid); });
 	int i = this->api->ReqQryTransferBank(&myreq, reqid);
 	return i;
 };
@@ -683,6 +727,8 @@ int FuturesTdApi::reqQryInvestorPositionDetail(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInvestorPositionDetail(&myreq, reqid); });
 	int i = this->api->ReqQryInvestorPositionDetail(&myreq, reqid);
 	return i;
 };
@@ -692,6 +738,8 @@ int FuturesTdApi::reqQryNotice(const dict &req, int reqid)
 	CThostFtdcQryNoticeField myreq = CThostFtdcQryNoticeField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryNotice(&myreq, reqid); });
 	int i = this->api->ReqQryNotice(&myreq, reqid);
 	return i;
 };
@@ -704,6 +752,8 @@ int FuturesTdApi::reqQrySettlementInfoConfirm(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "AccountID", myreq.AccountID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQrySettlementInfoConfirm(&myreq, reqid); });
 	int i = this->api->ReqQrySettlementInfoConfirm(&myreq, reqid);
 	return i;
 };
@@ -717,6 +767,8 @@ int FuturesTdApi::reqQryInvestorPositionCombineDetail(const dict &req, int reqid
 	getString(req, "CombInstrumentID", myreq.CombInstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInvestorPositionCombineDetail(&myreq, reqid); });
 	int i = this->api->ReqQryInvestorPositionCombineDetail(&myreq, reqid);
 	return i;
 };
@@ -727,6 +779,8 @@ int FuturesTdApi::reqQryCFMMCTradingAccountKey(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryCFMMCTradingAccountKey(&myreq, reqid); });
 	int i = this->api->ReqQryCFMMCTradingAccountKey(&myreq, reqid);
 	return i;
 };
@@ -740,6 +794,8 @@ int FuturesTdApi::reqQryEWarrantOffset(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryEWarrantOffset(&myreq, reqid); });
 	int i = this->api->ReqQryEWarrantOffset(&myreq, reqid);
 	return i;
 };
@@ -754,6 +810,8 @@ int FuturesTdApi::reqQryInvestorProductGroupMargin(const dict &req, int reqid)
 	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInvestorProductGroupMargin(&myreq, reqid); });
 	int i = this->api->ReqQryInvestorProductGroupMargin(&myreq, reqid);
 	return i;
 };
@@ -766,6 +824,8 @@ int FuturesTdApi::reqQryExchangeMarginRate(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryExchangeMarginRate(&myreq, reqid); });
 	int i = this->api->ReqQryExchangeMarginRate(&myreq, reqid);
 	return i;
 };
@@ -777,6 +837,8 @@ int FuturesTdApi::reqQryExchangeMarginRateAdjust(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryExchangeMarginRateAdjust(&myreq, reqid); });
 	int i = this->api->ReqQryExchangeMarginRateAdjust(&myreq, reqid);
 	return i;
 };
@@ -788,6 +850,8 @@ int FuturesTdApi::reqQryExchangeRate(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "FromCurrencyID", myreq.FromCurrencyID);
 	getString(req, "ToCurrencyID", myreq.ToCurrencyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryExchangeRate(&myreq, reqid); });
 	int i = this->api->ReqQryExchangeRate(&myreq, reqid);
 	return i;
 };
@@ -800,6 +864,8 @@ int FuturesTdApi::reqQrySecAgentACIDMap(const dict &req, int reqid)
 	getString(req, "UserID", myreq.UserID);
 	getString(req, "AccountID", myreq.AccountID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQrySecAgentACIDMap(&myreq, reqid); });
 	int i = this->api->ReqQrySecAgentACIDMap(&myreq, reqid);
 	return i;
 };
@@ -810,6 +876,8 @@ int FuturesTdApi::reqQryProductExchRate(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ProductID", myreq.ProductID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryProductExchRate(&myreq, reqid); });
 	int i = this->api->ReqQryProductExchRate(&myreq, reqid);
 	return i;
 };
@@ -820,6 +888,8 @@ int FuturesTdApi::reqQryProductGroup(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ProductID", myreq.ProductID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryProductGroup(&myreq, reqid); });
 	int i = this->api->ReqQryProductGroup(&myreq, reqid);
 	return i;
 };
@@ -831,6 +901,8 @@ int FuturesTdApi::reqQryMMInstrumentCommissionRate(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryMMInstrumentCommissionRate(&myreq, reqid); });
 	int i = this->api->ReqQryMMInstrumentCommissionRate(&myreq, reqid);
 	return i;
 };
@@ -842,6 +914,8 @@ int FuturesTdApi::reqQryMMOptionInstrCommRate(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryMMOptionInstrCommRate(&myreq, reqid); });
 	int i = this->api->ReqQryMMOptionInstrCommRate(&myreq, reqid);
 	return i;
 };
@@ -853,6 +927,8 @@ int FuturesTdApi::reqQryInstrumentOrderCommRate(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInstrumentOrderCommRate(&myreq, reqid); });
 	int i = this->api->ReqQryInstrumentOrderCommRate(&myreq, reqid);
 	return i;
 };
@@ -866,6 +942,8 @@ int FuturesTdApi::reqQrySecAgentTradingAccount(const dict &req, int reqid)
 	getString(req, "CurrencyID", myreq.CurrencyID);
 	getChar(req, "BizType", &myreq.BizType);
 	getString(req, "AccountID", myreq.AccountID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQrySecAgentTradingAccount(&myreq, reqid); });
 	int i = this->api->ReqQrySecAgentTradingAccount(&myreq, reqid);
 	return i;
 };
@@ -876,6 +954,8 @@ int FuturesTdApi::reqQrySecAgentCheckMode(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQrySecAgentCheckMode(&myreq, reqid); });
 	int i = this->api->ReqQrySecAgentCheckMode(&myreq, reqid);
 	return i;
 };
@@ -892,6 +972,8 @@ int FuturesTdApi::reqQryOptionInstrTradeCost(const dict &req, int reqid)
 	getDouble(req, "UnderlyingPrice", &myreq.UnderlyingPrice);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOptionInstrTradeCost(&myreq, reqid); });
 	int i = this->api->ReqQryOptionInstrTradeCost(&myreq, reqid);
 	return i;
 };
@@ -905,6 +987,8 @@ int FuturesTdApi::reqQryOptionInstrCommRate(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOptionInstrCommRate(&myreq, reqid); });
 	int i = this->api->ReqQryOptionInstrCommRate(&myreq, reqid);
 	return i;
 };
@@ -920,6 +1004,8 @@ int FuturesTdApi::reqQryExecOrder(const dict &req, int reqid)
 	getString(req, "ExecOrderSysID", myreq.ExecOrderSysID);
 	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryExecOrder(&myreq, reqid); });
 	int i = this->api->ReqQryExecOrder(&myreq, reqid);
 	return i;
 };
@@ -935,6 +1021,8 @@ int FuturesTdApi::reqQryForQuote(const dict &req, int reqid)
 	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryForQuote(&myreq, reqid); });
 	int i = this->api->ReqQryForQuote(&myreq, reqid);
 	return i;
 };
@@ -951,6 +1039,8 @@ int FuturesTdApi::reqQryQuote(const dict &req, int reqid)
 	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryQuote(&myreq, reqid); });
 	int i = this->api->ReqQryQuote(&myreq, reqid);
 	return i;
 };
@@ -966,6 +1056,8 @@ int FuturesTdApi::reqQryOptionSelfClose(const dict &req, int reqid)
 	getString(req, "OptionSelfCloseSysID", myreq.OptionSelfCloseSysID);
 	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOptionSelfClose(&myreq, reqid); });
 	int i = this->api->ReqQryOptionSelfClose(&myreq, reqid);
 	return i;
 };
@@ -977,6 +1069,8 @@ int FuturesTdApi::reqQryInvestUnit(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInvestUnit(&myreq, reqid); });
 	int i = this->api->ReqQryInvestUnit(&myreq, reqid);
 	return i;
 };
@@ -988,6 +1082,8 @@ int FuturesTdApi::reqQryCombInstrumentGuard(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryCombInstrumentGuard(&myreq, reqid); });
 	int i = this->api->ReqQryCombInstrumentGuard(&myreq, reqid);
 	return i;
 };
@@ -1001,6 +1097,8 @@ int FuturesTdApi::reqQryCombAction(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryCombAction(&myreq, reqid); });
 	int i = this->api->ReqQryCombAction(&myreq, reqid);
 	return i;
 };
@@ -1013,6 +1111,8 @@ int FuturesTdApi::reqQryTransferSerial(const dict &req, int reqid)
 	getString(req, "AccountID", myreq.AccountID);
 	getString(req, "BankID", myreq.BankID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTransferSerial(&myreq, reqid); });
 	int i = this->api->ReqQryTransferSerial(&myreq, reqid);
 	return i;
 };
@@ -1026,6 +1126,8 @@ int FuturesTdApi::reqQryAccountregister(const dict &req, int reqid)
 	getString(req, "BankID", myreq.BankID);
 	getString(req, "BankBranchID", myreq.BankBranchID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryAccountregister(&myreq, reqid); });
 	int i = this->api->ReqQryAccountregister(&myreq, reqid);
 	return i;
 };
@@ -1037,6 +1139,8 @@ int FuturesTdApi::reqQryContractBank(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "BankID", myreq.BankID);
 	getString(req, "BankBrchID", myreq.BankBrchID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryContractBank(&myreq, reqid); });
 	int i = this->api->ReqQryContractBank(&myreq, reqid);
 	return i;
 };
@@ -1050,6 +1154,8 @@ int FuturesTdApi::reqQryParkedOrder(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryParkedOrder(&myreq, reqid); });
 	int i = this->api->ReqQryParkedOrder(&myreq, reqid);
 	return i;
 };
@@ -1063,6 +1169,8 @@ int FuturesTdApi::reqQryParkedOrderAction(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryParkedOrderAction(&myreq, reqid); });
 	int i = this->api->ReqQryParkedOrderAction(&myreq, reqid);
 	return i;
 };
@@ -1074,6 +1182,8 @@ int FuturesTdApi::reqQryTradingNotice(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTradingNotice(&myreq, reqid); });
 	int i = this->api->ReqQryTradingNotice(&myreq, reqid);
 	return i;
 };
@@ -1086,6 +1196,8 @@ int FuturesTdApi::reqQryBrokerTradingParams(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
 	getString(req, "AccountID", myreq.AccountID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryBrokerTradingParams(&myreq, reqid); });
 	int i = this->api->ReqQryBrokerTradingParams(&myreq, reqid);
 	return i;
 };
@@ -1097,6 +1209,8 @@ int FuturesTdApi::reqQryBrokerTradingAlgos(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryBrokerTradingAlgos(&myreq, reqid); });
 	int i = this->api->ReqQryBrokerTradingAlgos(&myreq, reqid);
 	return i;
 };
@@ -1108,6 +1222,8 @@ int FuturesTdApi::reqQueryCFMMCTradingAccountToken(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQueryCFMMCTradingAccountToken(&myreq, reqid); });
 	int i = this->api->ReqQueryCFMMCTradingAccountToken(&myreq, reqid);
 	return i;
 };
@@ -1257,6 +1373,8 @@ int FuturesTdApi::reqQueryBankAccountMoneyByFuture(const dict &req, int reqid)
 	getInt(req, "RequestID", &myreq.RequestID);
 	getInt(req, "TID", &myreq.TID);
 	getString(req, "LongCustomerName", myreq.LongCustomerName);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQueryBankAccountMoneyByFuture(&myreq, reqid); });
 	int i = this->api->ReqQueryBankAccountMoneyByFuture(&myreq, reqid);
 	return i;
 };
@@ -0,0 +1,904 @@
+static handle KEY_BrokerID;
+static handle KEY_UserID;
+static handle KEY_UserProductInfo;
+static handle KEY_AppID;
+static handle KEY_AppType;
+static handle KEY_ErrorID;
+static handle KEY_ErrorMsg;
+static handle KEY_TradingDay;
+static handle KEY_LoginTime;
+static handle KEY_SystemName;
+static handle KEY_FrontID;
+static handle KEY_SessionID;
+static handle KEY_MaxOrderRef;
+static handle KEY_SHFETime;
+static handle KEY_DCETime;
+static handle KEY_CZCETime;
+static handle KEY_FFEXTime;
+static handle KEY_INETime;
+static handle KEY_OldPassword;
+static handle KEY_NewPassword;
+static handle KEY_AccountID;
+static handle KEY_CurrencyID;
+static handle KEY_InvestorID;
+static handle KEY_InstrumentID;
+static handle KEY_OrderRef;
+static handle KEY_OrderPriceType;
+static handle KEY_Direction;
+static handle KEY_CombOffsetFlag;
+static handle KEY_CombHedgeFlag;
+static handle KEY_LimitPrice;
+static handle KEY_VolumeTotalOriginal;
+static handle KEY_TimeCondition;
+static handle KEY_GTDDate;
+static handle KEY_VolumeCondition;
+static handle KEY_MinVolume;
+static handle KEY_ContingentCondition;
+static handle KEY_StopPrice;
+static handle KEY_ForceCloseReason;
+static handle KEY_IsAutoSuspend;
+static handle KEY_BusinessUnit;
+static handle KEY_RequestID;
+static handle KEY_UserForceClose;
+static handle KEY_IsSwapOrder;
+static handle KEY_ExchangeID;
+static handle KEY_InvestUnitID;
+static handle KEY_ClientID;
+static handle KEY_IPAddress;
+static handle KEY_MacAddress;
+static handle KEY_ParkedOrderID;
+static handle KEY_UserType;
+static handle KEY_Status;
+static handle KEY_OrderActionRef;
+static handle KEY_OrderSysID;
+static handle KEY_ActionFlag;
+static handle KEY_VolumeChange;
+static handle KEY_ParkedOrderActionID;
+static handle KEY_OffsetFlag;
+static handle KEY_HedgeFlag;
+static handle KEY_MaxVolume;
+static handle KEY_ConfirmDate;
+static handle KEY_ConfirmTime;
+static handle KEY_SettlementID;
+static handle KEY_ExecOrderRef;
+static handle KEY_Volume;
+static handle KEY_ActionType;
+static handle KEY_PosiDirection;
+static handle KEY_ReservePositionFlag;
+static handle KEY_CloseFlag;
+static handle KEY_ExecOrderActionRef;
+static handle KEY_ExecOrderSysID;
+static handle KEY_ForQuoteRef;
+static handle KEY_QuoteRef;
+static handle KEY_AskPrice;
+static handle KEY_BidPrice;
+static handle KEY_AskVolume;
+static handle KEY_BidVolume;
+static handle KEY_AskOffsetFlag;
+static handle KEY_BidOffsetFlag;
+static handle KEY_AskHedgeFlag;
+static handle KEY_BidHedgeFlag;
+static handle KEY_AskOrderRef;
+static handle KEY_BidOrderRef;
+static handle KEY_ForQuoteSysID;
+static handle KEY_QuoteActionRef;
+static handle KEY_QuoteSysID;
+static handle KEY_OptionSelfCloseRef;
+static handle KEY_OptSelfCloseFlag;
+static handle KEY_OptionSelfCloseActionRef;
+static handle KEY_OptionSelfCloseSysID;
+static handle KEY_CombActionRef;
+static handle KEY_CombDirection;
+static handle KEY_OrderLocalID;
+static handle KEY_ParticipantID;
+static handle KEY_ExchangeInstID;
+static handle KEY_TraderID;
+static handle KEY_InstallID;
+static handle KEY_OrderSubmitStatus;
+static handle KEY_NotifySequence;
+static handle KEY_OrderSource;
+static handle KEY_OrderStatus;
+static handle KEY_OrderType;
+static handle KEY_VolumeTraded;
+static handle KEY_VolumeTotal;
+static handle KEY_InsertDate;
+static handle KEY_InsertTime;
+static handle KEY_ActiveTime;
+static handle KEY_SuspendTime;
+static handle KEY_UpdateTime;
+static handle KEY_CancelTime;
+static handle KEY_ActiveTraderID;
+static handle KEY_ClearingPartID;
+static handle KEY_SequenceNo;
+static handle KEY_StatusMsg;
+static handle KEY_ActiveUserID;
+static handle KEY_BrokerOrderSeq;
+static handle KEY_RelativeOrderSysID;
+static handle KEY_ZCETotalTradedVolume;
+static handle KEY_BranchID;
+static handle KEY_TradeID;
+static handle KEY_TradingRole;
+static handle KEY_Price;
+static handle KEY_TradeDate;
+static handle KEY_TradeTime;
+static handle KEY_TradeType;
+static handle KEY_PriceSource;
+static handle KEY_TradeSource;
+static handle KEY_PositionDate;
+static handle KEY_YdPosition;
+static handle KEY_Position;
+static handle KEY_LongFrozen;
+static handle KEY_ShortFrozen;
+static handle KEY_LongFrozenAmount;
+static handle KEY_ShortFrozenAmount;
+static handle KEY_OpenVolume;
+static handle KEY_CloseVolume;
+static handle KEY_OpenAmount;
+static handle KEY_CloseAmount;
+static handle KEY_PositionCost;
+static handle KEY_PreMargin;
+static handle KEY_UseMargin;
+static handle KEY_FrozenMargin;
+static handle KEY_FrozenCash;
+static handle KEY_FrozenCommission;
+static handle KEY_CashIn;
+static handle KEY_Commission;
+static handle KEY_CloseProfit;
+static handle KEY_PositionProfit;
+static handle KEY_PreSettlementPrice;
+static handle KEY_SettlementPrice;
+static handle KEY_OpenCost;
+static handle KEY_ExchangeMargin;
+static handle KEY_CombPosition;
+static handle KEY_CombLongFrozen;
+static handle KEY_CombShortFrozen;
+static handle KEY_CloseProfitByDate;
+static handle KEY_CloseProfitByTrade;
+static handle KEY_TodayPosition;
+static handle KEY_MarginRateByMoney;
+static handle KEY_MarginRateByVolume;
+static handle KEY_StrikeFrozen;
+static handle KEY_StrikeFrozenAmount;
+static handle KEY_AbandonFrozen;
+static handle KEY_YdStrikeFrozen;
+static handle KEY_PreMortgage;
+static handle KEY_PreCredit;
+static handle KEY_PreDeposit;
+static handle KEY_PreBalance;
+static handle KEY_InterestBase;
+static handle KEY_Interest;
+static handle KEY_Deposit;
+static handle KEY_Withdraw;
+static handle KEY_CurrMargin;
+static handle KEY_Balance;
+static handle KEY_Available;
+static handle KEY_WithdrawQuota;
+static handle KEY_Reserve;
+static handle KEY_Credit;
+static handle KEY_Mortgage;
+static handle KEY_DeliveryMargin;
+static handle KEY_ExchangeDeliveryMargin;
+static handle KEY_ReserveBalance;
+static handle KEY_PreFundMortgageIn;
+static handle KEY_PreFundMortgageOut;
+static handle KEY_FundMortgageIn;
+static handle KEY_FundMortgageOut;
+static handle KEY_FundMortgageAvailable;
+static handle KEY_MortgageableFund;
+static handle KEY_SpecProductMargin;
+static handle KEY_SpecProductFrozenMargin;
+static handle KEY_SpecProductCommission;
+static handle KEY_SpecProductFrozenCommission;
+static handle KEY_SpecProductPositionProfit;
+static handle KEY_SpecProductCloseProfit;
+static handle KEY_SpecProductPositionProfitByAlg;
+static handle KEY_SpecProductExchangeMargin;
+static handle KEY_BizType;
+static handle KEY_FrozenSwap;
+static handle KEY_RemainSwap;
+static handle KEY_InvestorGroupID;
+static handle KEY_InvestorName;
+static handle KEY_IdentifiedCardType;
+static handle KEY_IdentifiedCardNo;
+static handle KEY_IsActive;
+static handle KEY_Telephone;
+static handle KEY_Address;
+static handle KEY_OpenDate;
+static handle KEY_Mobile;
+static handle KEY_CommModelID;
+static handle KEY_MarginModelID;
+static handle KEY_ClientIDType;
+static handle KEY_InvestorRange;
+static handle KEY_LongMarginRatioByMoney;
+static handle KEY_LongMarginRatioByVolume;
+static handle KEY_ShortMarginRatioByMoney;
+static handle KEY_ShortMarginRatioByVolume;
+static handle KEY_IsRelative;
+static handle KEY_OpenRatioByMoney;
+static handle KEY_OpenRatioByVolume;
+static handle KEY_CloseRatioByMoney;
+static handle KEY_CloseRatioByVolume;
+static handle KEY_CloseTodayRatioByMoney;
+static handle KEY_CloseTodayRatioByVolume;
+static handle KEY_ExchangeName;
+static handle KEY_ExchangeProperty;
+static handle KEY_ProductID;
+static handle KEY_ProductName;
+static handle KEY_ProductClass;
+static handle KEY_VolumeMultiple;
+static handle KEY_PriceTick;
+static handle KEY_MaxMarketOrderVolume;
+static handle KEY_MinMarketOrderVolume;
+static handle KEY_MaxLimitOrderVolume;
+static handle KEY_MinLimitOrderVolume;
+static handle KEY_PositionType;
+static handle KEY_PositionDateType;
+static handle KEY_CloseDealType;
+static handle KEY_TradeCurrencyID;
+static handle KEY_MortgageFundUseRange;
+static handle KEY_ExchangeProductID;
+static handle KEY_UnderlyingMultiple;
+static handle KEY_InstrumentName;
+static handle KEY_DeliveryYear;
+static handle KEY_DeliveryMonth;
+static handle KEY_CreateDate;
+static handle KEY_ExpireDate;
+static handle KEY_StartDelivDate;
+static handle KEY_EndDelivDate;
+static handle KEY_InstLifePhase;
+static handle KEY_IsTrading;
+static handle KEY_LongMarginRatio;
+static handle KEY_ShortMarginRatio;
+static handle KEY_MaxMarginSideAlgorithm;
+static handle KEY_UnderlyingInstrID;
+static handle KEY_StrikePrice;
+static handle KEY_OptionsType;
+static handle KEY_CombinationType;
+static handle KEY_LastPrice;
+static handle KEY_PreClosePrice;
+static handle KEY_PreOpenInterest;
+static handle KEY_OpenPrice;
+static handle KEY_HighestPrice;
+static handle KEY_LowestPrice;
+static handle KEY_Turnover;
+static handle KEY_OpenInterest;
+static handle KEY_ClosePrice;
+static handle KEY_UpperLimitPrice;
+static handle KEY_LowerLimitPrice;
+static handle KEY_PreDelta;
+static handle KEY_CurrDelta;
+static handle KEY_UpdateMillisec;
+static handle KEY_BidPrice1;
+static handle KEY_BidVolume1;
+static handle KEY_AskPrice1;
+static handle KEY_AskVolume1;
+static handle KEY_BidPrice2;
+static handle KEY_BidVolume2;
+static handle KEY_AskPrice2;
+static handle KEY_AskVolume2;
+static handle KEY_BidPrice3;
+static handle KEY_BidVolume3;
+static handle KEY_AskPrice3;
+static handle KEY_AskVolume3;
+static handle KEY_BidPrice4;
+static handle KEY_BidVolume4;
+static handle KEY_AskPrice4;
+static handle KEY_AskVolume4;
+static handle KEY_BidPrice5;
+static handle KEY_BidVolume5;
+static handle KEY_AskPrice5;
+static handle KEY_AskVolume5;
+static handle KEY_AveragePrice;
+static handle KEY_ActionDay;
+static handle KEY_Content;
+static handle KEY_BankID;
+static handle KEY_BankBrchID;
+static handle KEY_BankName;
+static handle KEY_CombInstrumentID;
+static handle KEY_PositionProfitByDate;
+static handle KEY_PositionProfitByTrade;
+static handle KEY_Margin;
+static handle KEY_ExchMargin;
+static handle KEY_LastSettlementPrice;
+static handle KEY_SequenceLabel;
+static handle KEY_ComTradeID;
+static handle KEY_TotalAmt;
+static handle KEY_LegID;
+static handle KEY_LegMultiple;
+static handle KEY_TradeGroupID;
+static handle KEY_KeyID;
+static handle KEY_CurrentKey;
+static handle KEY_ProductGroupID;
+static handle KEY_LongFrozenMargin;
+static handle KEY_ShortFrozenMargin;
+static handle KEY_LongUseMargin;
+static handle KEY_ShortUseMargin;
+static handle KEY_LongExchMargin;
+static handle KEY_ShortExchMargin;
+static handle KEY_OffsetAmount;
+static handle KEY_LongOffsetAmount;
+static handle KEY_ShortOffsetAmount;
+static handle KEY_ExchOffsetAmount;
+static handle KEY_LongExchOffsetAmount;
+static handle KEY_ShortExchOffsetAmount;
+static handle KEY_ExchLongMarginRatioByMoney;
+static handle KEY_ExchLongMarginRatioByVolume;
+static handle KEY_ExchShortMarginRatioByMoney;
+static handle KEY_ExchShortMarginRatioByVolume;
+static handle KEY_NoLongMarginRatioByMoney;
+static handle KEY_NoLongMarginRatioByVolume;
+static handle KEY_NoShortMarginRatioByMoney;
+static handle KEY_NoShortMarginRatioByVolume;
+static handle KEY_FromCurrencyID;
+static handle KEY_FromCurrencyUnit;
+static handle KEY_ToCurrencyID;
+static handle KEY_ExchangeRate;
+static handle KEY_BrokerSecAgentID;
+static handle KEY_QuoteCurrencyID;
+static handle KEY_StrikeRatioByMoney;
+static handle KEY_StrikeRatioByVolume;
+static handle KEY_OrderCommByVolume;
+static handle KEY_OrderActionCommByVolume;
+static handle KEY_CheckSelfAccount;
+static handle KEY_FixedMargin;
+static handle KEY_MiniMargin;
+static handle KEY_Royalty;
+static handle KEY_ExchFixedMargin;
+static handle KEY_ExchMiniMargin;
+static handle KEY_ExecOrderLocalID;
+static handle KEY_ExecResult;
+static handle KEY_BrokerExecOrderSeq;
+static handle KEY_ForQuoteLocalID;
+static handle KEY_ForQuoteStatus;
+static handle KEY_BrokerForQutoSeq;
+static handle KEY_QuoteLocalID;
+static handle KEY_QuoteStatus;
+static handle KEY_AskOrderSysID;
+static handle KEY_BidOrderSysID;
+static handle KEY_BrokerQuoteSeq;
+static handle KEY_OptionSelfCloseLocalID;
+static handle KEY_BrokerOptionSelfCloseSeq;
+static handle KEY_InvestorUnitName;
+static handle KEY_GuarantRatio;
+static handle KEY_ActionLocalID;
+static handle KEY_ActionStatus;
+static handle KEY_PlateSerial;
+static handle KEY_TradeCode;
+static handle KEY_BankBranchID;
+static handle KEY_BankAccType;
+static handle KEY_BankAccount;
+static handle KEY_BankSerial;
+static handle KEY_BrokerBranchID;
+static handle KEY_FutureAccType;
+static handle KEY_FutureSerial;
+static handle KEY_IdCardType;
+static handle KEY_TradeAmount;
+static handle KEY_CustFee;
+static handle KEY_BrokerFee;
+static handle KEY_AvailabilityFlag;
+static handle KEY_OperatorCode;
+static handle KEY_BankNewAccount;
+static handle KEY_TradeDay;
+static handle KEY_CustomerName;
+static handle KEY_OpenOrDestroy;
+static handle KEY_RegDate;
+static handle KEY_OutDate;
+static handle KEY_TID;
+static handle KEY_CustType;
+static handle KEY_LongCustomerName;
+static handle KEY_ActionDate;
+static handle KEY_ActionTime;
+static handle KEY_OrderActionStatus;
+static handle KEY_SettlementGroupID;
+static handle KEY_InstrumentStatus;
+static handle KEY_TradingSegmentSN;
+static handle KEY_EnterTime;
+static handle KEY_EnterReason;
+static handle KEY_BulletinID;
+static handle KEY_NewsType;
+static handle KEY_NewsUrgency;
+static handle KEY_SendTime;
+static handle KEY_Abstract;
+static handle KEY_ComeFrom;
+static handle KEY_URLLink;
+static handle KEY_MarketID;
+static handle KEY_FieldContent;
+static handle KEY_SequenceSeries;
+static handle KEY_ForQuoteTime;
+static handle KEY_Token;
+static handle KEY_MarginPriceType;
+static handle KEY_Algorithm;
+static handle KEY_AvailIncludeCloseProfit;
+static handle KEY_OptionRoyaltyPriceType;
+static handle KEY_HandlePositionAlgoID;
+static handle KEY_FindMarginRateAlgoID;
+static handle KEY_HandleTradingAccountAlgoID;
+static handle KEY_LastFragment;
+static handle KEY_BankPassWord;
+static handle KEY_Password;
+static handle KEY_VerifyCertNoFlag;
+static handle KEY_FutureFetchAmount;
+static handle KEY_FeePayFlag;
+static handle KEY_Message;
+static handle KEY_Digest;
+static handle KEY_DeviceID;
+static handle KEY_BankSecuAccType;
+static handle KEY_BrokerIDByBank;
+static handle KEY_BankSecuAcc;
+static handle KEY_BankPwdFlag;
+static handle KEY_SecuPwdFlag;
+static handle KEY_OperNo;
+static handle KEY_TransferStatus;
+static handle KEY_RepealTimeInterval;
+static handle KEY_RepealedTimes;
+static handle KEY_BankRepealFlag;
+static handle KEY_BrokerRepealFlag;
+static handle KEY_PlateRepealSerial;
+static handle KEY_BankRepealSerial;
+static handle KEY_FutureRepealSerial;
+static handle KEY_BankUseAmount;
+static handle KEY_BankFetchAmount;
+static handle KEY_Gender;
+static handle KEY_CountryCode;
+static handle KEY_ZipCode;
+static handle KEY_MobilePhone;
+static handle KEY_Fax;
+static handle KEY_EMail;
+static handle KEY_MoneyAccountStatus;
+static handle KEY_CashExchangeCode;
+static handle KEY_NewBankAccount;
+static handle KEY_NewBankPassWord;
+
+void initDictKeys()
+{
+	KEY_BrokerID = PyUnicode_InternFromString("BrokerID");
+	KEY_UserID = PyUnicode_InternFromString("UserID");
+	KEY_UserProductInfo = PyUnicode_InternFromString("UserProductInfo");
+	KEY_AppID = PyUnicode_InternFromString("AppID");
+	KEY_AppType = PyUnicode_InternFromString("AppType");
+	KEY_ErrorID = PyUnicode_InternFromString("ErrorID");
+	KEY_ErrorMsg = PyUnicode_InternFromString("ErrorMsg");
+	KEY_TradingDay = PyUnicode_InternFromString("TradingDay");
+	KEY_LoginTime = PyUnicode_InternFromString("LoginTime");
+	KEY_SystemName = PyUnicode_InternFromString("SystemName");
+	KEY_FrontID = PyUnicode_InternFromString("FrontID");
+	KEY_SessionID = PyUnicode_InternFromString("SessionID");
+	KEY_MaxOrderRef = PyUnicode_InternFromString("MaxOrderRef");
+	KEY_SHFETime = PyUnicode_InternFromString("SHFETime");
+	KEY_DCETime = PyUnicode_InternFromString("DCETime");
+	KEY_CZCETime = PyUnicode_InternFromString("CZCETime");
+	KEY_FFEXTime = PyUnicode_InternFromString("FFEXTime");
+	KEY_INETime = PyUnicode_InternFromString("INETime");
+	KEY_OldPassword = PyUnicode_InternFromString("OldPassword");
+	KEY_NewPassword = PyUnicode_InternFromString("NewPassword");
+	KEY_AccountID = PyUnicode_InternFromString("AccountID");
+	KEY_CurrencyID = PyUnicode_InternFromString("CurrencyID");
+	KEY_InvestorID = PyUnicode_InternFromString("InvestorID");
+	KEY_InstrumentID = PyUnicode_InternFromString("InstrumentID");
+	KEY_OrderRef = PyUnicode_InternFromString("OrderRef");
+	KEY_OrderPriceType = PyUnicode_InternFromString("OrderPriceType");
+	KEY_Direction = PyUnicode_InternFromString("Direction");
+	KEY_CombOffsetFlag = PyUnicode_InternFromString("CombOffsetFlag");
+	KEY_CombHedgeFlag = PyUnicode_InternFromString("CombHedgeFlag");
+	KEY_LimitPrice = PyUnicode_InternFromString("LimitPrice");
+	KEY_VolumeTotalOriginal = PyUnicode_InternFromString("VolumeTotalOriginal");
+	KEY_TimeCondition = PyUnicode_InternFromString("TimeCondition");
+	KEY_GTDDate = PyUnicode_InternFromString("GTDDate");
+	KEY_VolumeCondition = PyUnicode_InternFromString("VolumeCondition");
+	KEY_MinVolume = PyUnicode_InternFromString("MinVolume");
+	KEY_ContingentCondition = PyUnicode_InternFromString("ContingentCondition");
+	KEY_StopPrice = PyUnicode_InternFromString("StopPrice");
+	KEY_ForceCloseReason = PyUnicode_InternFromString("ForceCloseReason");
+	KEY_IsAutoSuspend = PyUnicode_InternFromString("IsAutoSuspend");
+	KEY_BusinessUnit = PyUnicode_InternFromString("BusinessUnit");
+	KEY_RequestID = PyUnicode_InternFromString("RequestID");
+	KEY_UserForceClose = PyUnicode_InternFromString("UserForceClose");
+	KEY_IsSwapOrder = PyUnicode_InternFromString("IsSwapOrder");
+	KEY_ExchangeID = PyUnicode_InternFromString("ExchangeID");
+	KEY_InvestUnitID = PyUnicode_InternFromString("InvestUnitID");
+	KEY_ClientID = PyUnicode_InternFromString("ClientID");
+	KEY_IPAddress = PyUnicode_InternFromString("IPAddress");
+	KEY_MacAddress = PyUnicode_InternFromString("MacAddress");
+	KEY_ParkedOrderID = PyUnicode_InternFromString("ParkedOrderID");
+	KEY_UserType = PyUnicode_InternFromString("UserType");
+	KEY_Status = PyUnicode_InternFromString("Status");
+	KEY_OrderActionRef = PyUnicode_InternFromString("OrderActionRef");
+	KEY_OrderSysID = PyUnicode_InternFromString("OrderSysID");
+	KEY_ActionFlag = PyUnicode_InternFromString("ActionFlag");
+	KEY_VolumeChange = PyUnicode_InternFromString("VolumeChange");
+	KEY_ParkedOrderActionID = PyUnicode_InternFromString("ParkedOrderActionID");
+	KEY_OffsetFlag = PyUnicode_InternFromString("OffsetFlag");
+	KEY_HedgeFlag = PyUnicode_InternFromString("HedgeFlag");
+	KEY_MaxVolume = PyUnicode_InternFromString("MaxVolume");
+	KEY_ConfirmDate = PyUnicode_InternFromString("ConfirmDate");
+	KEY_ConfirmTime = PyUnicode_InternFromString("ConfirmTime");
+	KEY_SettlementID = PyUnicode_InternFromString("SettlementID");
+	KEY_ExecOrderRef = PyUnicode_InternFromString("ExecOrderRef");
+	KEY_Volume = PyUnicode_InternFromString("Volume");
+	KEY_ActionType = PyUnicode_InternFromString("ActionType");
+	KEY_PosiDirection = PyUnicode_InternFromString("PosiDirection");
+	KEY_ReservePositionFlag = PyUnicode_InternFromString("ReservePositionFlag");
+	KEY_CloseFlag = PyUnicode_InternFromString("CloseFlag");
+	KEY_ExecOrderActionRef = PyUnicode_InternFromString("ExecOrderActionRef");
+	KEY_ExecOrderSysID = PyUnicode_InternFromString("ExecOrderSysID");
+	KEY_ForQuoteRef = PyUnicode_InternFromString("ForQuoteRef");
+	KEY_QuoteRef = PyUnicode_InternFromString("QuoteRef");
+	KEY_AskPrice = PyUnicode_InternFromString("AskPrice");
+	KEY_BidPrice = PyUnicode_InternFromString("BidPrice");
+	KEY_AskVolume = PyUnicode_InternFromString("AskVolume");
+	KEY_BidVolume = PyUnicode_InternFromString("BidVolume");
+	KEY_AskOffsetFlag = PyUnicode_InternFromString("AskOffsetFlag");
+	KEY_BidOffsetFlag = PyUnicode_InternFromString("BidOffsetFlag");
+	KEY_AskHedgeFlag = PyUnicode_InternFromString("AskHedgeFlag");
+	KEY_BidHedgeFlag = PyUnicode_InternFromString("BidHedgeFlag");
+	KEY_AskOrderRef = PyUnicode_InternFromString("AskOrderRef");
+	KEY_BidOrderRef = PyUnicode_InternFromString("BidOrderRef");
+	KEY_ForQuoteSysID = PyUnicode_InternFromString("ForQuoteSysID");
+	KEY_QuoteActionRef = PyUnicode_InternFromString("QuoteActionRef");
+	KEY_QuoteSysID = PyUnicode_InternFromString("QuoteSysID");
+	KEY_OptionSelfCloseRef = PyUnicode_InternFromString("OptionSelfCloseRef");
+	KEY_OptSelfCloseFlag = PyUnicode_InternFromString("OptSelfCloseFlag");
+	KEY_OptionSelfCloseActionRef = PyUnicode_InternFromString("OptionSelfCloseActionRef");
+	KEY_OptionSelfCloseSysID = PyUnicode_InternFromString("OptionSelfCloseSysID");
+	KEY_CombActionRef = PyUnicode_InternFromString("CombActionRef");
+	KEY_CombDirection = PyUnicode_InternFromString("CombDirection");
+	KEY_OrderLocalID = PyUnicode_InternFromString("OrderLocalID");
+	KEY_ParticipantID = PyUnicode_InternFromString("ParticipantID");
+	KEY_ExchangeInstID = PyUnicode_InternFromString("ExchangeInstID");
+	KEY_TraderID = PyUnicode_InternFromString("TraderID");
+	KEY_InstallID = PyUnicode_InternFromString("InstallID");
+	KEY_OrderSubmitStatus = PyUnicode_InternFromString("OrderSubmitStatus");
+	KEY_NotifySequence = PyUnicode_InternFromString("NotifySequence");
+	KEY_OrderSource = PyUnicode_InternFromString("OrderSource");
+	KEY_OrderStatus = PyUnicode_InternFromString("OrderStatus");
+	KEY_OrderType = PyUnicode_InternFromString("OrderType");
+	KEY_VolumeTraded = PyUnicode_InternFromString("VolumeTraded");
+	KEY_VolumeTotal = PyUnicode_InternFromString("VolumeTotal");
+	KEY_InsertDate = PyUnicode_InternFromString("InsertDate");
+	KEY_InsertTime = PyUnicode_InternFromString("InsertTime");
+	KEY_ActiveTime = PyUnicode_InternFromString("ActiveTime");
+	KEY_SuspendTime = PyUnicode_InternFromString("SuspendTime");
+	KEY_UpdateTime = PyUnicode_InternFromString("UpdateTime");
+	KEY_CancelTime = PyUnicode_InternFromString("CancelTime");
+	KEY_ActiveTraderID = PyUnicode_InternFromString("ActiveTraderID");
+	KEY_ClearingPartID = PyUnicode_InternFromString("ClearingPartID");
+	KEY_SequenceNo = PyUnicode_InternFromString("SequenceNo");
+	KEY_StatusMsg = PyUnicode_InternFromString("StatusMsg");
+	KEY_ActiveUserID = PyUnicode_InternFromString("ActiveUserID");
+	KEY_BrokerOrderSeq = PyUnicode_InternFromString("BrokerOrderSeq");
+	KEY_RelativeOrderSysID = PyUnicode_InternFromString("RelativeOrderSysID");
+	KEY_ZCETotalTradedVolume = PyUnicode_InternFromString("ZCETotalTradedVolume");
+	KEY_BranchID = PyUnicode_InternFromString("BranchID");
+	KEY_TradeID = PyUnicode_InternFromString("TradeID");
+	KEY_TradingRole = PyUnicode_InternFromString("TradingRole");
+	KEY_Price = PyUnicode_InternFromString("Price");
+	KEY_TradeDate = PyUnicode_InternFromString("TradeDate");
+	KEY_TradeTime = PyUnicode_InternFromString("TradeTime");
+	KEY_TradeType = PyUnicode_InternFromString("TradeType");
+	KEY_PriceSource = PyUnicode_InternFromString("PriceSource");
+	KEY_TradeSource = PyUnicode_InternFromString("TradeSource");
+	KEY_PositionDate = PyUnicode_InternFromString("PositionDate");
+	KEY_YdPosition = PyUnicode_InternFromString("YdPosition");
+	KEY_Position = PyUnicode_InternFromString("Position");
+	KEY_LongFrozen = PyUnicode_InternFromString("LongFrozen");
+	KEY_ShortFrozen = PyUnicode_InternFromString("ShortFrozen");
+	KEY_LongFrozenAmount = PyUnicode_InternFromString("LongFrozenAmount");
+	KEY_ShortFrozenAmount = PyUnicode_InternFromString("ShortFrozenAmount");
+	KEY_OpenVolume = PyUnicode_InternFromString("OpenVolume");
+	KEY_CloseVolume = PyUnicode_InternFromString("CloseVolume");
+	KEY_OpenAmount = PyUnicode_InternFromString("OpenAmount");
+	KEY_CloseAmount = PyUnicode_InternFromString("CloseAmount");
+	KEY_PositionCost = PyUnicode_InternFromString("PositionCost");
+	KEY_PreMargin = PyUnicode_InternFromString("PreMargin");
+	KEY_UseMargin = PyUnicode_InternFromString("UseMargin");
+	KEY_FrozenMargin = PyUnicode_InternFromString("FrozenMargin");
+	KEY_FrozenCash = PyUnicode_InternFromString("FrozenCash");
+	KEY_FrozenCommission = PyUnicode_InternFromString("FrozenCommission");
+	KEY_CashIn = PyUnicode_InternFromString("CashIn");
+	KEY_Commission = PyUnicode_InternFromString("Commission");
+	KEY_CloseProfit = PyUnicode_InternFromString("CloseProfit");
+	KEY_PositionProfit = PyUnicode_InternFromString("PositionProfit");
+	KEY_PreSettlementPrice = PyUnicode_InternFromString("PreSettlementPrice");
+	KEY_SettlementPrice = PyUnicode_InternFromString("SettlementPrice");
+	KEY_OpenCost = PyUnicode_InternFromString("OpenCost");
+	KEY_ExchangeMargin = PyUnicode_InternFromString("ExchangeMargin");
+	KEY_CombPosition = PyUnicode_InternFromString("CombPosition");
+	KEY_CombLongFrozen = PyUnicode_InternFromString("CombLongFrozen");
+	KEY_CombShortFrozen = PyUnicode_InternFromString("CombShortFrozen");
+	KEY_CloseProfitByDate = PyUnicode_InternFromString("CloseProfitByDate");
+	KEY_CloseProfitByTrade = PyUnicode_InternFromString("CloseProfitByTrade");
+	KEY_TodayPosition = PyUnicode_InternFromString("TodayPosition");
+	KEY_MarginRateByMoney = PyUnicode_InternFromString("MarginRateByMoney");
+	KEY_MarginRateByVolume = PyUnicode_InternFromString("MarginRateByVolume");
+	KEY_StrikeFrozen = PyUnicode_InternFromString("StrikeFrozen");
+	KEY_StrikeFrozenAmount = PyUnicode_InternFromString("StrikeFrozenAmount");
+	KEY_AbandonFrozen = PyUnicode_InternFromString("AbandonFrozen");
+	KEY_YdStrikeFrozen = PyUnicode_InternFromString("YdStrikeFrozen");
+	KEY_PreMortgage = PyUnicode_InternFromString("PreMortgage");
+	KEY_PreCredit = PyUnicode_InternFromString("PreCredit");
+	KEY_PreDeposit = PyUnicode_InternFromString("PreDeposit");
+	KEY_PreBalance = PyUnicode_InternFromString("PreBalance");
+	KEY_InterestBase = PyUnicode_InternFromString("InterestBase");
+	KEY_Interest = PyUnicode_InternFromString("Interest");
+	KEY_Deposit = PyUnicode_InternFromString("Deposit");
+	KEY_Withdraw = PyUnicode_InternFromString("Withdraw");
+	KEY_CurrMargin = PyUnicode_InternFromString("CurrMargin");
+	KEY_Balance = PyUnicode_InternFromString("Balance");
+	KEY_Available = PyUnicode_InternFromString("Available");
+	KEY_WithdrawQuota = PyUnicode_InternFromString("WithdrawQuota");
+	KEY_Reserve = PyUnicode_InternFromString("Reserve");
+	KEY_Credit = PyUnicode_InternFromString("Credit");
+	KEY_Mortgage = PyUnicode_InternFromString("Mortgage");
+	KEY_DeliveryMargin = PyUnicode_InternFromString("DeliveryMargin");
+	KEY_ExchangeDeliveryMargin = PyUnicode_InternFromString("ExchangeDeliveryMargin");
+	KEY_ReserveBalance = PyUnicode_InternFromString("ReserveBalance");
+	KEY_PreFundMortgageIn = PyUnicode_InternFromString("PreFundMortgageIn");
+	KEY_PreFundMortgageOut = PyUnicode_InternFromString("PreFundMortgageOut");
+	KEY_FundMortgageIn = PyUnicode_InternFromString("FundMortgageIn");
+	KEY_FundMortgageOut = PyUnicode_InternFromString("FundMortgageOut");
+	KEY_FundMortgageAvailable = PyUnicode_InternFromString("FundMortgageAvailable");
+	KEY_MortgageableFund = PyUnicode_InternFromString("MortgageableFund");
+	KEY_SpecProductMargin = PyUnicode_InternFromString("SpecProductMargin");
+	KEY_SpecProductFrozenMargin = PyUnicode_InternFromString("SpecProductFrozenMargin");
+	KEY_SpecProductCommission = PyUnicode_InternFromString("SpecProductCommission");
+	KEY_SpecProductFrozenCommission = PyUnicode_InternFromString("SpecProductFrozenCommission");
+	KEY_SpecProductPositionProfit = PyUnicode_InternFromString("SpecProductPositionProfit");
+	KEY_SpecProductCloseProfit = PyUnicode_InternFromString("SpecProductCloseProfit");
+	KEY_SpecProductPositionProfitByAlg = PyUnicode_InternFromString("SpecProductPositionProfitByAlg");
+	KEY_SpecProductExchangeMargin = PyUnicode_InternFromString("SpecProductExchangeMargin");
+	KEY_BizType = PyUnicode_InternFromString("BizType");
+	KEY_FrozenSwap = PyUnicode_InternFromString("FrozenSwap");
+	KEY_RemainSwap = PyUnicode_InternFromString("RemainSwap");
+	KEY_InvestorGroupID = PyUnicode_InternFromString("InvestorGroupID");
+	KEY_InvestorName = PyUnicode_InternFromString("InvestorName");
+	KEY_IdentifiedCardType = PyUnicode_InternFromString("IdentifiedCardType");
+	KEY_IdentifiedCardNo = PyUnicode_InternFromString("IdentifiedCardNo");
+	KEY_IsActive = PyUnicode_InternFromString("IsActive");
+	KEY_Telephone = PyUnicode_InternFromString("Telephone");
+	KEY_Address = PyUnicode_InternFromString("Address");
+	KEY_OpenDate = PyUnicode_InternFromString("OpenDate");
+	KEY_Mobile = PyUnicode_InternFromString("Mobile");
+	KEY_CommModelID = PyUnicode_InternFromString("CommModelID");
+	KEY_MarginModelID = PyUnicode_InternFromString("MarginModelID");
+	KEY_ClientIDType = PyUnicode_InternFromString("ClientIDType");
+	KEY_InvestorRange = PyUnicode_InternFromString("InvestorRange");
+	KEY_LongMarginRatioByMoney = PyUnicode_InternFromString("LongMarginRatioByMoney");
+	KEY_LongMarginRatioByVolume = PyUnicode_InternFromString("LongMarginRatioByVolume");
+	KEY_ShortMarginRatioByMoney = PyUnicode_InternFromString("ShortMarginRatioByMoney");
+	KEY_ShortMarginRatioByVolume = PyUnicode_InternFromString("ShortMarginRatioByVolume");
+	KEY_IsRelative = PyUnicode_InternFromString("IsRelative");
+	KEY_OpenRatioByMoney = PyUnicode_InternFromString("OpenRatioByMoney");
+	KEY_OpenRatioByVolume = PyUnicode_InternFromString("OpenRatioByVolume");
+	KEY_CloseRatioByMoney = PyUnicode_InternFromString("CloseRatioByMoney");
+	KEY_CloseRatioByVolume = PyUnicode_InternFromString("CloseRatioByVolume");
+	KEY_CloseTodayRatioByMoney = PyUnicode_InternFromString("CloseTodayRatioByMoney");
+	KEY_CloseTodayRatioByVolume = PyUnicode_InternFromString("CloseTodayRatioByVolume");
+	KEY_ExchangeName = PyUnicode_InternFromString("ExchangeName");
+	KEY_ExchangeProperty = PyUnicode_InternFromString("ExchangeProperty");
+	KEY_ProductID = PyUnicode_InternFromString("ProductID");
+	KEY_ProductName = PyUnicode_InternFromString("ProductName");
+	KEY_ProductClass = PyUnicode_InternFromString("ProductClass");
+	KEY_VolumeMultiple = PyUnicode_InternFromString("VolumeMultiple");
+	KEY_PriceTick = PyUnicode_InternFromString("PriceTick");
+	KEY_MaxMarketOrderVolume = PyUnicode_InternFromString("MaxMarketOrderVolume");
+	KEY_MinMarketOrderVolume = PyUnicode_InternFromString("MinMarketOrderVolume");
+	KEY_MaxLimitOrderVolume = PyUnicode_InternFromString("MaxLimitOrderVolume");
+	KEY_MinLimitOrderVolume = PyUnicode_InternFromString("MinLimitOrderVolume");
+	KEY_PositionType = PyUnicode_InternFromString("PositionType");
+	KEY_PositionDateType = PyUnicode_InternFromString("PositionDateType");
+	KEY_CloseDealType = PyUnicode_InternFromString("CloseDealType");
+	KEY_TradeCurrencyID = PyUnicode_InternFromString("TradeCurrencyID");
+	KEY_MortgageFundUseRange = PyUnicode_InternFromString("MortgageFundUseRange");
+	KEY_ExchangeProductID = PyUnicode_InternFromString("ExchangeProductID");
+	KEY_UnderlyingMultiple = PyUnicode_InternFromString("UnderlyingMultiple");
+	KEY_InstrumentName = PyUnicode_InternFromString("InstrumentName");
+	KEY_DeliveryYear = PyUnicode_InternFromString("DeliveryYear");
+	KEY_DeliveryMonth = PyUnicode_InternFromString("DeliveryMonth");
+	KEY_CreateDate = PyUnicode_InternFromString("CreateDate");
+	KEY_ExpireDate = PyUnicode_InternFromString("ExpireDate");
+	KEY_StartDelivDate = PyUnicode_InternFromString("StartDelivDate");
+	KEY_EndDelivDate = PyUnicode_InternFromString("EndDelivDate");
+	KEY_InstLifePhase = PyUnicode_InternFromString("InstLifePhase");
+	KEY_IsTrading = PyUnicode_InternFromString("IsTrading");
+	KEY_LongMarginRatio = PyUnicode_InternFromString("LongMarginRatio");
+	KEY_ShortMarginRatio = PyUnicode_InternFromString("ShortMarginRatio");
+	KEY_MaxMarginSideAlgorithm = PyUnicode_InternFromString("MaxMarginSideAlgorithm");
+	KEY_UnderlyingInstrID = PyUnicode_InternFromString("UnderlyingInstrID");
+	KEY_StrikePrice = PyUnicode_InternFromString("StrikePrice");
+	KEY_OptionsType = PyUnicode_InternFromString("OptionsType");
+	KEY_CombinationType = PyUnicode_InternFromString("CombinationType");
+	KEY_LastPrice = PyUnicode_InternFromString("LastPrice");
+	KEY_PreClosePrice = PyUnicode_InternFromString("PreClosePrice");
+	KEY_PreOpenInterest = PyUnicode_InternFromString("PreOpenInterest");
+	KEY_OpenPrice = PyUnicode_InternFromString("OpenPrice");
+	KEY_HighestPrice = PyUnicode_InternFromString("HighestPrice");
+	KEY_LowestPrice = PyUnicode_InternFromString("LowestPrice");
+	KEY_Turnover = PyUnicode_InternFromString("Turnover");
+	KEY_OpenInterest = PyUnicode_InternFromString("OpenInterest");
+	KEY_ClosePrice = PyUnicode_InternFromString("ClosePrice");
+	KEY_UpperLimitPrice = PyUnicode_InternFromString("UpperLimitPrice");
+	KEY_LowerLimitPrice = PyUnicode_InternFromString("LowerLimitPrice");
+	KEY_PreDelta = PyUnicode_InternFromString("PreDelta");
+	KEY_CurrDelta = PyUnicode_InternFromString("CurrDelta");
+	KEY_UpdateMillisec = PyUnicode_InternFromString("UpdateMillisec");
+	KEY_BidPrice1 = PyUnicode_InternFromString("BidPrice1");
+	KEY_BidVolume1 = PyUnicode_InternFromString("BidVolume1");
+	KEY_AskPrice1 = PyUnicode_InternFromString("AskPrice1");
+	KEY_AskVolume1 = PyUnicode_InternFromString("AskVolume1");
+	KEY_BidPrice2 = PyUnicode_InternFromString("BidPrice2");
+	KEY_BidVolume2 = PyUnicode_InternFromString("BidVolume2");
+	KEY_AskPrice2 = PyUnicode_InternFromString("AskPrice2");
+	KEY_AskVolume2 = PyUnicode_InternFromString("AskVolume2");
+	KEY_BidPrice3 = PyUnicode_InternFromString("BidPrice3");
+	KEY_BidVolume3 = PyUnicode_InternFromString("BidVolume3");
+	KEY_AskPrice3 = PyUnicode_InternFromString("AskPrice3");
+	KEY_AskVolume3 = PyUnicode_InternFromString("AskVolume3");
+	KEY_BidPrice4 = PyUnicode_InternFromString("BidPrice4");
+	KEY_BidVolume4 = PyUnicode_InternFromString("BidVolume4");
+	KEY_AskPrice4 = PyUnicode_InternFromString("AskPrice4");
+	KEY_AskVolume4 = PyUnicode_InternFromString("AskVolume4");
+	KEY_BidPrice5 = PyUnicode_InternFromString("BidPrice5");
+	KEY_BidVolume5 = PyUnicode_InternFromString("BidVolume5");
+	KEY_AskPrice5 = PyUnicode_InternFromString("AskPrice5");
+	KEY_AskVolume5 = PyUnicode_InternFromString("AskVolume5");
+	KEY_AveragePrice = PyUnicode_InternFromString("AveragePrice");
+	KEY_ActionDay = PyUnicode_InternFromString("ActionDay");
+	KEY_Content = PyUnicode_InternFromString("Content");
+	KEY_BankID = PyUnicode_InternFromString("BankID");
+	KEY_BankBrchID = PyUnicode_InternFromString("BankBrchID");
+	KEY_BankName = PyUnicode_InternFromString("BankName");
+	KEY_CombInstrumentID = PyUnicode_InternFromString("CombInstrumentID");
+	KEY_PositionProfitByDate = PyUnicode_InternFromString("PositionProfitByDate");
+	KEY_PositionProfitByTrade = PyUnicode_InternFromString("PositionProfitByTrade");
+	KEY_Margin = PyUnicode_InternFromString("Margin");
+	KEY_ExchMargin = PyUnicode_InternFromString("ExchMargin");
+	KEY_LastSettlementPrice = PyUnicode_InternFromString("LastSettlementPrice");
+	KEY_SequenceLabel = PyUnicode_InternFromString("SequenceLabel");
+	KEY_ComTradeID = PyUnicode_InternFromString("ComTradeID");
+	KEY_TotalAmt = PyUnicode_InternFromString("TotalAmt");
+	KEY_LegID = PyUnicode_InternFromString("LegID");
+	KEY_LegMultiple = PyUnicode_InternFromString("LegMultiple");
+	KEY_TradeGroupID = PyUnicode_InternFromString("TradeGroupID");
+	KEY_KeyID = PyUnicode_InternFromString("KeyID");
+	KEY_CurrentKey = PyUnicode_InternFromString("CurrentKey");
+	KEY_ProductGroupID = PyUnicode_InternFromString("ProductGroupID");
+	KEY_LongFrozenMargin = PyUnicode_InternFromString("LongFrozenMargin");
+	KEY_ShortFrozenMargin = PyUnicode_InternFromString("ShortFrozenMargin");
+	KEY_LongUseMargin = PyUnicode_InternFromString("LongUseMargin");
+	KEY_ShortUseMargin = PyUnicode_InternFromString("ShortUseMargin");
+	KEY_LongExchMargin = PyUnicode_InternFromString("LongExchMargin");
+	KEY_ShortExchMargin = PyUnicode_InternFromString("ShortExchMargin");
+	KEY_OffsetAmount = PyUnicode_InternFromString("OffsetAmount");
+	KEY_LongOffsetAmount = PyUnicode_InternFromString("LongOffsetAmount");
+	KEY_ShortOffsetAmount = PyUnicode_InternFromString("ShortOffsetAmount");
+	KEY_ExchOffsetAmount = PyUnicode_InternFromString("ExchOffsetAmount");
+	KEY_LongExchOffsetAmount = PyUnicode_InternFromString("LongExchOffsetAmount");
+	KEY_ShortExchOffsetAmount = PyUnicode_InternFromString("ShortExchOffsetAmount");
+	KEY_ExchLongMarginRatioByMoney = PyUnicode_InternFromString("ExchLongMarginRatioByMoney");
+	KEY_ExchLongMarginRatioByVolume = PyUnicode_InternFromString("ExchLongMarginRatioByVolume");
+	KEY_ExchShortMarginRatioByMoney = PyUnicode_InternFromString("ExchShortMarginRatioByMoney");
+	KEY_ExchShortMarginRatioByVolume = PyUnicode_InternFromString("ExchShortMarginRatioByVolume");
+	KEY_NoLongMarginRatioByMoney = PyUnicode_InternFromString("NoLongMarginRatioByMoney");
+	KEY_NoLongMarginRatioByVolume = PyUnicode_InternFromString("NoLongMarginRatioByVolume");
+	KEY_NoShortMarginRatioByMoney = PyUnicode_InternFromString("NoShortMarginRatioByMoney");
+	KEY_NoShortMarginRatioByVolume = PyUnicode_InternFromString("NoShortMarginRatioByVolume");
+	KEY_FromCurrencyID = PyUnicode_InternFromString("FromCurrencyID");
+	KEY_FromCurrencyUnit = PyUnicode_InternFromString("FromCurrencyUnit");
+	KEY_ToCurrencyID = PyUnicode_InternFromString("ToCurrencyID");
+	KEY_ExchangeRate = PyUnicode_InternFromString("ExchangeRate");
+	KEY_BrokerSecAgentID = PyUnicode_InternFromString("BrokerSecAgentID");
+	KEY_QuoteCurrencyID = PyUnicode_InternFromString("QuoteCurrencyID");
+	KEY_StrikeRatioByMoney = PyUnicode_InternFromString("StrikeRatioByMoney");
+	KEY_StrikeRatioByVolume = PyUnicode_InternFromString("StrikeRatioByVolume");
+	KEY_OrderCommByVolume = PyUnicode_InternFromString("OrderCommByVolume");
+	KEY_OrderActionCommByVolume = PyUnicode_InternFromString("OrderActionCommByVolume");
+	KEY_CheckSelfAccount = PyUnicode_InternFromString("CheckSelfAccount");
+	KEY_FixedMargin = PyUnicode_InternFromString("FixedMargin");
+	KEY_MiniMargin = PyUnicode_InternFromString("MiniMargin");
+	KEY_Royalty = PyUnicode_InternFromString("Royalty");
+	KEY_ExchFixedMargin = PyUnicode_InternFromString("ExchFixedMargin");
+	KEY_ExchMiniMargin = PyUnicode_InternFromString("ExchMiniMargin");
+	KEY_ExecOrderLocalID = PyUnicode_InternFromString("ExecOrderLocalID");
+	KEY_ExecResult = PyUnicode_InternFromString("ExecResult");
+	KEY_BrokerExecOrderSeq = PyUnicode_InternFromString("BrokerExecOrderSeq");
+	KEY_ForQuoteLocalID = PyUnicode_InternFromString("ForQuoteLocalID");
+	KEY_ForQuoteStatus = PyUnicode_InternFromString("ForQuoteStatus");
+	KEY_BrokerForQutoSeq = PyUnicode_InternFromString("BrokerForQutoSeq");
+	KEY_QuoteLocalID = PyUnicode_InternFromString("QuoteLocalID");
+	KEY_QuoteStatus = PyUnicode_InternFromString("QuoteStatus");
+	KEY_AskOrderSysID = PyUnicode_InternFromString("AskOrderSysID");
+	KEY_BidOrderSysID = PyUnicode_InternFromString("BidOrderSysID");
+	KEY_BrokerQuoteSeq = PyUnicode_InternFromString("BrokerQuoteSeq");
+	KEY_OptionSelfCloseLocalID = PyUnicode_InternFromString("OptionSelfCloseLocalID");
+	KEY_BrokerOptionSelfCloseSeq = PyUnicode_InternFromString("BrokerOptionSelfCloseSeq");
+	KEY_InvestorUnitName = PyUnicode_InternFromString("InvestorUnitName");
+	KEY_GuarantRatio = PyUnicode_InternFromString("GuarantRatio");
+	KEY_ActionLocalID = PyUnicode_InternFromString("ActionLocalID");
+	KEY_ActionStatus = PyUnicode_InternFromString("ActionStatus");
+	KEY_PlateSerial = PyUnicode_InternFromString("PlateSerial");
+	KEY_TradeCode = PyUnicode_InternFromString("TradeCode");
+	KEY_BankBranchID = PyUnicode_InternFromString("BankBranchID");
+	KEY_BankAccType = PyUnicode_InternFromString("BankAccType");
+	KEY_BankAccount = PyUnicode_InternFromString("BankAccount");
+	KEY_BankSerial = PyUnicode_InternFromString("BankSerial");
+	KEY_BrokerBranchID = PyUnicode_InternFromString("BrokerBranchID");
+	KEY_FutureAccType = PyUnicode_InternFromString("FutureAccType");
+	KEY_FutureSerial = PyUnicode_InternFromString("FutureSerial");
+	KEY_IdCardType = PyUnicode_InternFromString("IdCardType");
+	KEY_TradeAmount = PyUnicode_InternFromString("TradeAmount");
+	KEY_CustFee = PyUnicode_InternFromString("CustFee");
+	KEY_BrokerFee = PyUnicode_InternFromString("BrokerFee");
+	KEY_AvailabilityFlag = PyUnicode_InternFromString("AvailabilityFlag");
+	KEY_OperatorCode = PyUnicode_InternFromString("OperatorCode");
+	KEY_BankNewAccount = PyUnicode_InternFromString("BankNewAccount");
+	KEY_TradeDay = PyUnicode_InternFromString("TradeDay");
+	KEY_CustomerName = PyUnicode_InternFromString("CustomerName");
+	KEY_OpenOrDestroy = PyUnicode_InternFromString("OpenOrDestroy");
+	KEY_RegDate = PyUnicode_InternFromString("RegDate");
+	KEY_OutDate = PyUnicode_InternFromString("OutDate");
+	KEY_TID = PyUnicode_InternFromString("TID");
+	KEY_CustType = PyUnicode_InternFromString("CustType");
+	KEY_LongCustomerName = PyUnicode_InternFromString("LongCustomerName");
+	KEY_ActionDate = PyUnicode_InternFromString("ActionDate");
+	KEY_ActionTime = PyUnicode_InternFromString("ActionTime");
+	KEY_OrderActionStatus = PyUnicode_InternFromString("OrderActionStatus");
+	KEY_SettlementGroupID = PyUnicode_InternFromString("SettlementGroupID");
+	KEY_InstrumentStatus = PyUnicode_InternFromString("InstrumentStatus");
+	KEY_TradingSegmentSN = PyUnicode_InternFromString("TradingSegmentSN");
+	KEY_EnterTime = PyUnicode_InternFromString("EnterTime");
+	KEY_EnterReason = PyUnicode_InternFromString("EnterReason");
+	KEY_BulletinID = PyUnicode_InternFromString("BulletinID");
+	KEY_NewsType = PyUnicode_InternFromString("NewsType");
+	KEY_NewsUrgency = PyUnicode_InternFromString("NewsUrgency");
+	KEY_SendTime = PyUnicode_InternFromString("SendTime");
+	KEY_Abstract = PyUnicode_InternFromString("Abstract");
+	KEY_ComeFrom = PyUnicode_InternFromString("ComeFrom");
+	KEY_URLLink = PyUnicode_InternFromString("URLLink");
+	KEY_MarketID = PyUnicode_InternFromString("MarketID");
+	KEY_FieldContent = PyUnicode_InternFromString("FieldContent");
+	KEY_SequenceSeries = PyUnicode_InternFromString("SequenceSeries");
+	KEY_ForQuoteTime = PyUnicode_InternFromString("ForQuoteTime");
+	KEY_Token = PyUnicode_InternFromString("Token");
+	KEY_MarginPriceType = PyUnicode_InternFromString("MarginPriceType");
+	KEY_Algorithm = PyUnicode_InternFromString("Algorithm");
+	KEY_AvailIncludeCloseProfit = PyUnicode_InternFromString("AvailIncludeCloseProfit");
+	KEY_OptionRoyaltyPriceType = PyUnicode_InternFromString("OptionRoyaltyPriceType");
+	KEY_HandlePositionAlgoID = PyUnicode_InternFromString("HandlePositionAlgoID");
+	KEY_FindMarginRateAlgoID = PyUnicode_InternFromString("FindMarginRateAlgoID");
+	KEY_HandleTradingAccountAlgoID = PyUnicode_InternFromString("HandleTradingAccountAlgoID");
+	KEY_LastFragment = PyUnicode_InternFromString("LastFragment");
+	KEY_BankPassWord = PyUnicode_InternFromString("BankPassWord");
+	KEY_Password = PyUnicode_InternFromString("Password");
+	KEY_VerifyCertNoFlag = PyUnicode_InternFromString("VerifyCertNoFlag");
+	KEY_FutureFetchAmount = PyUnicode_InternFromString("FutureFetchAmount");
+	KEY_FeePayFlag = PyUnicode_InternFromString("FeePayFlag");
+	KEY_Message = PyUnicode_InternFromString("Message");
+	KEY_Digest = PyUnicode_InternFromString("Digest");
+	KEY_DeviceID = PyUnicode_InternFromString("DeviceID");
+	KEY_BankSecuAccType = PyUnicode_InternFromString("BankSecuAccType");
+	KEY_BrokerIDByBank = PyUnicode_InternFromString("BrokerIDByBank");
+	KEY_BankSecuAcc = PyUnicode_InternFromString("BankSecuAcc");
+	KEY_BankPwdFlag = PyUnicode_InternFromString("BankPwdFlag");
+	KEY_SecuPwdFlag = PyUnicode_InternFromString("SecuPwdFlag");
+	KEY_OperNo = PyUnicode_InternFromString("OperNo");
+	KEY_TransferStatus = PyUnicode_InternFromString("TransferStatus");
+	KEY_RepealTimeInterval = PyUnicode_InternFromString("RepealTimeInterval");
+	KEY_RepealedTimes = PyUnicode_InternFromString("RepealedTimes");
+	KEY_BankRepealFlag = PyUnicode_InternFromString("BankRepealFlag");
+	KEY_BrokerRepealFlag = PyUnicode_InternFromString("BrokerRepealFlag");
+	KEY_PlateRepealSerial = PyUnicode_InternFromString("PlateRepealSerial");
+	KEY_BankRepealSerial = PyUnicode_InternFromString("BankRepealSerial");
+	KEY_FutureRepealSerial = PyUnicode_InternFromString("FutureRepealSerial");
+	KEY_BankUseAmount = PyUnicode_InternFromString("BankUseAmount");
+	KEY_BankFetchAmount = PyUnicode_InternFromString("BankFetchAmount");
+	KEY_Gender = PyUnicode_InternFromString("Gender");
+	KEY_CountryCode = PyUnicode_InternFromString("CountryCode");
+	KEY_ZipCode = PyUnicode_InternFromString("ZipCode");
+	KEY_MobilePhone = PyUnicode_InternFromString("MobilePhone");
+	KEY_Fax = PyUnicode_InternFromString("Fax");
+	KEY_EMail = PyUnicode_InternFromString("EMail");
+	KEY_MoneyAccountStatus = PyUnicode_InternFromString("MoneyAccountStatus");
+	KEY_CashExchangeCode = PyUnicode_InternFromString("CashExchangeCode");
+	KEY_NewBankAccount = PyUnicode_InternFromString("NewBankAccount");
+	KEY_NewBankPassWord = PyUnicode_InternFromString("NewBankPassWord");
+};
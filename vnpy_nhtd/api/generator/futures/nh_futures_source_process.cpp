@@ -23,20 +23,20 @@ void FuturesTdApi::processRspAuthenticate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspAuthenticateField *task_data = (CThostFtdcRspAuthenticateField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["AppID"] = toUtf(task_data->AppID);
-		data["AppType"] = task_data->AppType;
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_AppID] = toUtf(task_data->AppID);
+		data[KEY_AppType] = task_data->AppType;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspAuthenticate(data, error, task->task_id, task->task_last);
 };
@@ -48,28 +48,28 @@ void FuturesTdApi::processRspUserLogin(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspUserLoginField *task_data = (CThostFtdcRspUserLoginField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["LoginTime"] = toUtf(task_data->LoginTime);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["SystemName"] = toUtf(task_data->SystemName);
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["MaxOrderRef"] = toUtf(task_data->MaxOrderRef);
-		data["SHFETime"] = toUtf(task_data->SHFETime);
-		data["DCETime"] = toUtf(task_data->DCETime);
-		data["CZCETime"] = toUtf(task_data->CZCETime);
-		data["FFEXTime"] = toUtf(task_data->FFEXTime);
-		data["INETime"] = toUtf(task_data->INETime);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_LoginTime] = toUtf(task_data->LoginTime);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_SystemName] = toUtf(task_data->SystemName);
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_MaxOrderRef] = toUtf(task_data->MaxOrderRef);
+		data[KEY_SHFETime] = toUtf(task_data->SHFETime);
+		data[KEY_DCETime] = toUtf(task_data->DCETime);
+		data[KEY_CZCETime] = toUtf(task_data->CZCETime);
+		data[KEY_FFEXTime] = toUtf(task_data->FFEXTime);
+		data[KEY_INETime] = toUtf(task_data->INETime);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspUserLogin(data, error, task->task_id, task->task_last);
 };
@@ -81,17 +81,17 @@ void FuturesTdApi::processRspUserLogout(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcUserLogoutField *task_data = (CThostFtdcUserLogoutField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspUserLogout(data, error, task->task_id, task->task_last);
 };
@@ -103,19 +103,19 @@ void FuturesTdApi::processRspUserPasswordUpdate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcUserPasswordUpdateField *task_data = (CThostFtdcUserPasswordUpdateField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OldPassword"] = toUtf(task_data->OldPassword);
-		data["NewPassword"] = toUtf(task_data->NewPassword);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OldPassword] = toUtf(task_data->OldPassword);
+		data[KEY_NewPassword] = toUtf(task_data->NewPassword);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspUserPasswordUpdate(data, error, task->task_id, task->task_last);
 };
@@ -127,20 +127,20 @@ void FuturesTdApi::processRspTradingAccountPasswordUpdate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradingAccountPasswordUpdateField *task_data = (CThostFtdcTradingAccountPasswordUpdateField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["OldPassword"] = toUtf(task_data->OldPassword);
-		data["NewPassword"] = toUtf(task_data->NewPassword);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_OldPassword] = toUtf(task_data->OldPassword);
+		data[KEY_NewPassword] = toUtf(task_data->NewPassword);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspTradingAccountPasswordUpdate(data, error, task->task_id, task->task_last);
 };
@@ -152,45 +152,45 @@ void FuturesTdApi::processRspOrderInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputOrderField *task_data = (CThostFtdcInputOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspOrderInsert(data, error, task->task_id, task->task_last);
 };
@@ -202,50 +202,50 @@ void FuturesTdApi::processRspParkedOrderInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcParkedOrderField *task_data = (CThostFtdcParkedOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParkedOrderID"] = toUtf(task_data->ParkedOrderID);
-		data["UserType"] = task_data->UserType;
-		data["Status"] = task_data->Status;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParkedOrderID] = toUtf(task_data->ParkedOrderID);
+		data[KEY_UserType] = task_data->UserType;
+		data[KEY_Status] = task_data->Status;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspParkedOrderInsert(data, error, task->task_id, task->task_last);
 };
@@ -257,37 +257,37 @@ void FuturesTdApi::processRspParkedOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcParkedOrderActionField *task_data = (CThostFtdcParkedOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OrderActionRef"] = task_data->OrderActionRef;
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeChange"] = task_data->VolumeChange;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ParkedOrderActionID"] = toUtf(task_data->ParkedOrderActionID);
-		data["UserType"] = task_data->UserType;
-		data["Status"] = task_data->Status;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OrderActionRef] = task_data->OrderActionRef;
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeChange] = task_data->VolumeChange;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ParkedOrderActionID] = toUtf(task_data->ParkedOrderActionID);
+		data[KEY_UserType] = task_data->UserType;
+		data[KEY_Status] = task_data->Status;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspParkedOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -299,32 +299,32 @@ void FuturesTdApi::processRspOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputOrderActionField *task_data = (CThostFtdcInputOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OrderActionRef"] = task_data->OrderActionRef;
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeChange"] = task_data->VolumeChange;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OrderActionRef] = task_data->OrderActionRef;
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeChange] = task_data->VolumeChange;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -336,24 +336,24 @@ void FuturesTdApi::processRspQueryMaxOrderVolume(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcQueryMaxOrderVolumeField *task_data = (CThostFtdcQueryMaxOrderVolumeField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["Direction"] = task_data->Direction;
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["MaxVolume"] = task_data->MaxVolume;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_MaxVolume] = task_data->MaxVolume;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQueryMaxOrderVolume(data, error, task->task_id, task->task_last);
 };
@@ -365,22 +365,22 @@ void FuturesTdApi::processRspSettlementInfoConfirm(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcSettlementInfoConfirmField *task_data = (CThostFtdcSettlementInfoConfirmField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ConfirmDate"] = toUtf(task_data->ConfirmDate);
-		data["ConfirmTime"] = toUtf(task_data->ConfirmTime);
-		data["SettlementID"] = task_data->SettlementID;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ConfirmDate] = toUtf(task_data->ConfirmDate);
+		data[KEY_ConfirmTime] = toUtf(task_data->ConfirmTime);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspSettlementInfoConfirm(data, error, task->task_id, task->task_last);
 };
@@ -392,19 +392,19 @@ void FuturesTdApi::processRspRemoveParkedOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRemoveParkedOrderField *task_data = (CThostFtdcRemoveParkedOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ParkedOrderID"] = toUtf(task_data->ParkedOrderID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ParkedOrderID] = toUtf(task_data->ParkedOrderID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspRemoveParkedOrder(data, error, task->task_id, task->task_last);
 };
@@ -416,19 +416,19 @@ void FuturesTdApi::processRspRemoveParkedOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRemoveParkedOrderActionField *task_data = (CThostFtdcRemoveParkedOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ParkedOrderActionID"] = toUtf(task_data->ParkedOrderActionID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ParkedOrderActionID] = toUtf(task_data->ParkedOrderActionID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspRemoveParkedOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -440,36 +440,36 @@ void FuturesTdApi::processRspExecOrderInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputExecOrderField *task_data = (CThostFtdcInputExecOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExecOrderRef"] = toUtf(task_data->ExecOrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ActionType"] = task_data->ActionType;
-		data["PosiDirection"] = task_data->PosiDirection;
-		data["ReservePositionFlag"] = task_data->ReservePositionFlag;
-		data["CloseFlag"] = task_data->CloseFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ExecOrderRef] = toUtf(task_data->ExecOrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ActionType] = task_data->ActionType;
+		data[KEY_PosiDirection] = task_data->PosiDirection;
+		data[KEY_ReservePositionFlag] = task_data->ReservePositionFlag;
+		data[KEY_CloseFlag] = task_data->CloseFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspExecOrderInsert(data, error, task->task_id, task->task_last);
 };
@@ -481,30 +481,30 @@ void FuturesTdApi::processRspExecOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputExecOrderActionField *task_data = (CThostFtdcInputExecOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ExecOrderActionRef"] = task_data->ExecOrderActionRef;
-		data["ExecOrderRef"] = toUtf(task_data->ExecOrderRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ExecOrderSysID"] = toUtf(task_data->ExecOrderSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ExecOrderActionRef] = task_data->ExecOrderActionRef;
+		data[KEY_ExecOrderRef] = toUtf(task_data->ExecOrderRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ExecOrderSysID] = toUtf(task_data->ExecOrderSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspExecOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -516,25 +516,25 @@ void FuturesTdApi::processRspForQuoteInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputForQuoteField *task_data = (CThostFtdcInputForQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ForQuoteRef"] = toUtf(task_data->ForQuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ForQuoteRef] = toUtf(task_data->ForQuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspForQuoteInsert(data, error, task->task_id, task->task_last);
 };
@@ -546,38 +546,38 @@ void FuturesTdApi::processRspQuoteInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputQuoteField *task_data = (CThostFtdcInputQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["QuoteRef"] = toUtf(task_data->QuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["AskPrice"] = task_data->AskPrice;
-		data["BidPrice"] = task_data->BidPrice;
-		data["AskVolume"] = task_data->AskVolume;
-		data["BidVolume"] = task_data->BidVolume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["AskOffsetFlag"] = task_data->AskOffsetFlag;
-		data["BidOffsetFlag"] = task_data->BidOffsetFlag;
-		data["AskHedgeFlag"] = task_data->AskHedgeFlag;
-		data["BidHedgeFlag"] = task_data->BidHedgeFlag;
-		data["AskOrderRef"] = toUtf(task_data->AskOrderRef);
-		data["BidOrderRef"] = toUtf(task_data->BidOrderRef);
-		data["ForQuoteSysID"] = toUtf(task_data->ForQuoteSysID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_QuoteRef] = toUtf(task_data->QuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_AskPrice] = task_data->AskPrice;
+		data[KEY_BidPrice] = task_data->BidPrice;
+		data[KEY_AskVolume] = task_data->AskVolume;
+		data[KEY_BidVolume] = task_data->BidVolume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_AskOffsetFlag] = task_data->AskOffsetFlag;
+		data[KEY_BidOffsetFlag] = task_data->BidOffsetFlag;
+		data[KEY_AskHedgeFlag] = task_data->AskHedgeFlag;
+		data[KEY_BidHedgeFlag] = task_data->BidHedgeFlag;
+		data[KEY_AskOrderRef] = toUtf(task_data->AskOrderRef);
+		data[KEY_BidOrderRef] = toUtf(task_data->BidOrderRef);
+		data[KEY_ForQuoteSysID] = toUtf(task_data->ForQuoteSysID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQuoteInsert(data, error, task->task_id, task->task_last);
 };
@@ -589,30 +589,30 @@ void FuturesTdApi::processRspQuoteAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputQuoteActionField *task_data = (CThostFtdcInputQuoteActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["QuoteActionRef"] = task_data->QuoteActionRef;
-		data["QuoteRef"] = toUtf(task_data->QuoteRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["QuoteSysID"] = toUtf(task_data->QuoteSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_QuoteActionRef] = task_data->QuoteActionRef;
+		data[KEY_QuoteRef] = toUtf(task_data->QuoteRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_QuoteSysID] = toUtf(task_data->QuoteSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQuoteAction(data, error, task->task_id, task->task_last);
 };
@@ -624,26 +624,26 @@ void FuturesTdApi::processRspBatchOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputBatchOrderActionField *task_data = (CThostFtdcInputBatchOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OrderActionRef"] = task_data->OrderActionRef;
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OrderActionRef] = task_data->OrderActionRef;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspBatchOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -655,32 +655,32 @@ void FuturesTdApi::processRspOptionSelfCloseInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputOptionSelfCloseField *task_data = (CThostFtdcInputOptionSelfCloseField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OptionSelfCloseRef"] = toUtf(task_data->OptionSelfCloseRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["OptSelfCloseFlag"] = task_data->OptSelfCloseFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OptionSelfCloseRef] = toUtf(task_data->OptionSelfCloseRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_OptSelfCloseFlag] = task_data->OptSelfCloseFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspOptionSelfCloseInsert(data, error, task->task_id, task->task_last);
 };
@@ -692,30 +692,30 @@ void FuturesTdApi::processRspOptionSelfCloseAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputOptionSelfCloseActionField *task_data = (CThostFtdcInputOptionSelfCloseActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OptionSelfCloseActionRef"] = task_data->OptionSelfCloseActionRef;
-		data["OptionSelfCloseRef"] = toUtf(task_data->OptionSelfCloseRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["OptionSelfCloseSysID"] = toUtf(task_data->OptionSelfCloseSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OptionSelfCloseActionRef] = task_data->OptionSelfCloseActionRef;
+		data[KEY_OptionSelfCloseRef] = toUtf(task_data->OptionSelfCloseRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_OptionSelfCloseSysID] = toUtf(task_data->OptionSelfCloseSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspOptionSelfCloseAction(data, error, task->task_id, task->task_last);
 };
@@ -727,28 +727,28 @@ void FuturesTdApi::processRspCombActionInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputCombActionField *task_data = (CThostFtdcInputCombActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["CombActionRef"] = toUtf(task_data->CombActionRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Direction"] = task_data->Direction;
-		data["Volume"] = task_data->Volume;
-		data["CombDirection"] = task_data->CombDirection;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_CombActionRef] = toUtf(task_data->CombActionRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_CombDirection] = task_data->CombDirection;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspCombActionInsert(data, error, task->task_id, task->task_last);
 };
@@ -760,78 +760,78 @@ void FuturesTdApi::processRspQryOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOrderField *task_data = (CThostFtdcOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["OrderSource"] = task_data->OrderSource;
-		data["OrderStatus"] = task_data->OrderStatus;
-		data["OrderType"] = task_data->OrderType;
-		data["VolumeTraded"] = task_data->VolumeTraded;
-		data["VolumeTotal"] = task_data->VolumeTotal;
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ActiveTime"] = toUtf(task_data->ActiveTime);
-		data["SuspendTime"] = toUtf(task_data->SuspendTime);
-		data["UpdateTime"] = toUtf(task_data->UpdateTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ActiveTraderID"] = toUtf(task_data->ActiveTraderID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["RelativeOrderSysID"] = toUtf(task_data->RelativeOrderSysID);
-		data["ZCETotalTradedVolume"] = task_data->ZCETotalTradedVolume;
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_OrderLocalID] = toUtf(task_data->OrderLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_OrderSource] = task_data->OrderSource;
+		data[KEY_OrderStatus] = task_data->OrderStatus;
+		data[KEY_OrderType] = task_data->OrderType;
+		data[KEY_VolumeTraded] = task_data->VolumeTraded;
+		data[KEY_VolumeTotal] = task_data->VolumeTotal;
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ActiveTime] = toUtf(task_data->ActiveTime);
+		data[KEY_SuspendTime] = toUtf(task_data->SuspendTime);
+		data[KEY_UpdateTime] = toUtf(task_data->UpdateTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ActiveTraderID] = toUtf(task_data->ActiveTraderID);
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerOrderSeq] = task_data->BrokerOrderSeq;
+		data[KEY_RelativeOrderSysID] = toUtf(task_data->RelativeOrderSysID);
+		data[KEY_ZCETotalTradedVolume] = task_data->ZCETotalTradedVolume;
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOrder(data, error, task->task_id, task->task_last);
 };
@@ -843,46 +843,46 @@ void FuturesTdApi::processRspQryTrade(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradeField *task_data = (CThostFtdcTradeField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["Direction"] = task_data->Direction;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["TradingRole"] = task_data->TradingRole;
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["Price"] = task_data->Price;
-		data["Volume"] = task_data->Volume;
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["TradeType"] = task_data->TradeType;
-		data["PriceSource"] = task_data->PriceSource;
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["TradeSource"] = task_data->TradeSource;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_TradeID] = toUtf(task_data->TradeID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_TradingRole] = task_data->TradingRole;
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_Price] = task_data->Price;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_TradeType] = task_data->TradeType;
+		data[KEY_PriceSource] = task_data->PriceSource;
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_OrderLocalID] = toUtf(task_data->OrderLocalID);
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_BrokerOrderSeq] = task_data->BrokerOrderSeq;
+		data[KEY_TradeSource] = task_data->TradeSource;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTrade(data, error, task->task_id, task->task_last);
 };
@@ -894,61 +894,61 @@ void FuturesTdApi::processRspQryInvestorPosition(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInvestorPositionField *task_data = (CThostFtdcInvestorPositionField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["PosiDirection"] = task_data->PosiDirection;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["PositionDate"] = task_data->PositionDate;
-		data["YdPosition"] = task_data->YdPosition;
-		data["Position"] = task_data->Position;
-		data["LongFrozen"] = task_data->LongFrozen;
-		data["ShortFrozen"] = task_data->ShortFrozen;
-		data["LongFrozenAmount"] = task_data->LongFrozenAmount;
-		data["ShortFrozenAmount"] = task_data->ShortFrozenAmount;
-		data["OpenVolume"] = task_data->OpenVolume;
-		data["CloseVolume"] = task_data->CloseVolume;
-		data["OpenAmount"] = task_data->OpenAmount;
-		data["CloseAmount"] = task_data->CloseAmount;
-		data["PositionCost"] = task_data->PositionCost;
-		data["PreMargin"] = task_data->PreMargin;
-		data["UseMargin"] = task_data->UseMargin;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["CashIn"] = task_data->CashIn;
-		data["Commission"] = task_data->Commission;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["PositionProfit"] = task_data->PositionProfit;
-		data["PreSettlementPrice"] = task_data->PreSettlementPrice;
-		data["SettlementPrice"] = task_data->SettlementPrice;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OpenCost"] = task_data->OpenCost;
-		data["ExchangeMargin"] = task_data->ExchangeMargin;
-		data["CombPosition"] = task_data->CombPosition;
-		data["CombLongFrozen"] = task_data->CombLongFrozen;
-		data["CombShortFrozen"] = task_data->CombShortFrozen;
-		data["CloseProfitByDate"] = task_data->CloseProfitByDate;
-		data["CloseProfitByTrade"] = task_data->CloseProfitByTrade;
-		data["TodayPosition"] = task_data->TodayPosition;
-		data["MarginRateByMoney"] = task_data->MarginRateByMoney;
-		data["MarginRateByVolume"] = task_data->MarginRateByVolume;
-		data["StrikeFrozen"] = task_data->StrikeFrozen;
-		data["StrikeFrozenAmount"] = task_data->StrikeFrozenAmount;
-		data["AbandonFrozen"] = task_data->AbandonFrozen;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["YdStrikeFrozen"] = task_data->YdStrikeFrozen;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_PosiDirection] = task_data->PosiDirection;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_PositionDate] = task_data->PositionDate;
+		data[KEY_YdPosition] = task_data->YdPosition;
+		data[KEY_Position] = task_data->Position;
+		data[KEY_LongFrozen] = task_data->LongFrozen;
+		data[KEY_ShortFrozen] = task_data->ShortFrozen;
+		data[KEY_LongFrozenAmount] = task_data->LongFrozenAmount;
+		data[KEY_ShortFrozenAmount] = task_data->ShortFrozenAmount;
+		data[KEY_OpenVolume] = task_data->OpenVolume;
+		data[KEY_CloseVolume] = task_data->CloseVolume;
+		data[KEY_OpenAmount] = task_data->OpenAmount;
+		data[KEY_CloseAmount] = task_data->CloseAmount;
+		data[KEY_PositionCost] = task_data->PositionCost;
+		data[KEY_PreMargin] = task_data->PreMargin;
+		data[KEY_UseMargin] = task_data->UseMargin;
+		data[KEY_FrozenMargin] = task_data->FrozenMargin;
+		data[KEY_FrozenCash] = task_data->FrozenCash;
+		data[KEY_FrozenCommission] = task_data->FrozenCommission;
+		data[KEY_CashIn] = task_data->CashIn;
+		data[KEY_Commission] = task_data->Commission;
+		data[KEY_CloseProfit] = task_data->CloseProfit;
+		data[KEY_PositionProfit] = task_data->PositionProfit;
+		data[KEY_PreSettlementPrice] = task_data->PreSettlementPrice;
+		data[KEY_SettlementPrice] = task_data->SettlementPrice;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_OpenCost] = task_data->OpenCost;
+		data[KEY_ExchangeMargin] = task_data->ExchangeMargin;
+		data[KEY_CombPosition] = task_data->CombPosition;
+		data[KEY_CombLongFrozen] = task_data->CombLongFrozen;
+		data[KEY_CombShortFrozen] = task_data->CombShortFrozen;
+		data[KEY_CloseProfitByDate] = task_data->CloseProfitByDate;
+		data[KEY_CloseProfitByTrade] = task_data->CloseProfitByTrade;
+		data[KEY_TodayPosition] = task_data->TodayPosition;
+		data[KEY_MarginRateByMoney] = task_data->MarginRateByMoney;
+		data[KEY_MarginRateByVolume] = task_data->MarginRateByVolume;
+		data[KEY_StrikeFrozen] = task_data->StrikeFrozen;
+		data[KEY_StrikeFrozenAmount] = task_data->StrikeFrozenAmount;
+		data[KEY_AbandonFrozen] = task_data->AbandonFrozen;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_YdStrikeFrozen] = task_data->YdStrikeFrozen;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInvestorPosition(data, error, task->task_id, task->task_last);
 };
@@ -960,64 +960,64 @@ void FuturesTdApi::processRspQryTradingAccount(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradingAccountField *task_data = (CThostFtdcTradingAccountField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["PreMortgage"] = task_data->PreMortgage;
-		data["PreCredit"] = task_data->PreCredit;
-		data["PreDeposit"] = task_data->PreDeposit;
-		data["PreBalance"] = task_data->PreBalance;
-		data["PreMargin"] = task_data->PreMargin;
-		data["InterestBase"] = task_data->InterestBase;
-		data["Interest"] = task_data->Interest;
-		data["Deposit"] = task_data->Deposit;
-		data["Withdraw"] = task_data->Withdraw;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["CurrMargin"] = task_data->CurrMargin;
-		data["CashIn"] = task_data->CashIn;
-		data["Commission"] = task_data->Commission;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["PositionProfit"] = task_data->PositionProfit;
-		data["Balance"] = task_data->Balance;
-		data["Available"] = task_data->Available;
-		data["WithdrawQuota"] = task_data->WithdrawQuota;
-		data["Reserve"] = task_data->Reserve;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["Credit"] = task_data->Credit;
-		data["Mortgage"] = task_data->Mortgage;
-		data["ExchangeMargin"] = task_data->ExchangeMargin;
-		data["DeliveryMargin"] = task_data->DeliveryMargin;
-		data["ExchangeDeliveryMargin"] = task_data->ExchangeDeliveryMargin;
-		data["ReserveBalance"] = task_data->ReserveBalance;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["PreFundMortgageIn"] = task_data->PreFundMortgageIn;
-		data["PreFundMortgageOut"] = task_data->PreFundMortgageOut;
-		data["FundMortgageIn"] = task_data->FundMortgageIn;
-		data["FundMortgageOut"] = task_data->FundMortgageOut;
-		data["FundMortgageAvailable"] = task_data->FundMortgageAvailable;
-		data["MortgageableFund"] = task_data->MortgageableFund;
-		data["SpecProductMargin"] = task_data->SpecProductMargin;
-		data["SpecProductFrozenMargin"] = task_data->SpecProductFrozenMargin;
-		data["SpecProductCommission"] = task_data->SpecProductCommission;
-		data["SpecProductFrozenCommission"] = task_data->SpecProductFrozenCommission;
-		data["SpecProductPositionProfit"] = task_data->SpecProductPositionProfit;
-		data["SpecProductCloseProfit"] = task_data->SpecProductCloseProfit;
-		data["SpecProductPositionProfitByAlg"] = task_data->SpecProductPositionProfitByAlg;
-		data["SpecProductExchangeMargin"] = task_data->SpecProductExchangeMargin;
-		data["BizType"] = task_data->BizType;
-		data["FrozenSwap"] = task_data->FrozenSwap;
-		data["RemainSwap"] = task_data->RemainSwap;
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_PreMortgage] = task_data->PreMortgage;
+		data[KEY_PreCredit] = task_data->PreCredit;
+		data[KEY_PreDeposit] = task_data->PreDeposit;
+		data[KEY_PreBalance] = task_data->PreBalance;
+		data[KEY_PreMargin] = task_data->PreMargin;
+		data[KEY_InterestBase] = task_data->InterestBase;
+		data[KEY_Interest] = task_data->Interest;
+		data[KEY_Deposit] = task_data->Deposit;
+		data[KEY_Withdraw] = task_data->Withdraw;
+		data[KEY_FrozenMargin] = task_data->FrozenMargin;
+		data[KEY_FrozenCash] = task_data->FrozenCash;
+		data[KEY_FrozenCommission] = task_data->FrozenCommission;
+		data[KEY_CurrMargin] = task_data->CurrMargin;
+		data[KEY_CashIn] = task_data->CashIn;
+		data[KEY_Commission] = task_data->Commission;
+		data[KEY_CloseProfit] = task_data->CloseProfit;
+		data[KEY_PositionProfit] = task_data->PositionProfit;
+		data[KEY_Balance] = task_data->Balance;
+		data[KEY_Available] = task_data->Available;
+		data[KEY_WithdrawQuota] = task_data->WithdrawQuota;
+		data[KEY_Reserve] = task_data->Reserve;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_Credit] = task_data->Credit;
+		data[KEY_Mortgage] = task_data->Mortgage;
+		data[KEY_ExchangeMargin] = task_data->ExchangeMargin;
+		data[KEY_DeliveryMargin] = task_data->DeliveryMargin;
+		data[KEY_ExchangeDeliveryMargin] = task_data->ExchangeDeliveryMargin;
+		data[KEY_ReserveBalance] = task_data->ReserveBalance;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_PreFundMortgageIn] = task_data->PreFundMortgageIn;
+		data[KEY_PreFundMortgageOut] = task_data->PreFundMortgageOut;
+		data[KEY_FundMortgageIn] = task_data->FundMortgageIn;
+		data[KEY_FundMortgageOut] = task_data->FundMortgageOut;
+		data[KEY_FundMortgageAvailable] = task_data->FundMortgageAvailable;
+		data[KEY_MortgageableFund] = task_data->MortgageableFund;
+		data[KEY_SpecProductMargin] = task_data->SpecProductMargin;
+		data[KEY_SpecProductFrozenMargin] = task_data->SpecProductFrozenMargin;
+		data[KEY_SpecProductCommission] = task_data->SpecProductCommission;
+		data[KEY_SpecProductFrozenCommission] = task_data->SpecProductFrozenCommission;
+		data[KEY_SpecProductPositionProfit] = task_data->SpecProductPositionProfit;
+		data[KEY_SpecProductCloseProfit] = task_data->SpecProductCloseProfit;
+		data[KEY_SpecProductPositionProfitByAlg] = task_data->SpecProductPositionProfitByAlg;
+		data[KEY_SpecProductExchangeMargin] = task_data->SpecProductExchangeMargin;
+		data[KEY_BizType] = task_data->BizType;
+		data[KEY_FrozenSwap] = task_data->FrozenSwap;
+		data[KEY_RemainSwap] = task_data->RemainSwap;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTradingAccount(data, error, task->task_id, task->task_last);
 };
@@ -1029,28 +1029,28 @@ void FuturesTdApi::processRspQryInvestor(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInvestorField *task_data = (CThostFtdcInvestorField*)task->task_data;
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorGroupID"] = toUtf(task_data->InvestorGroupID);
-		data["InvestorName"] = toUtf(task_data->InvestorName);
-		data["IdentifiedCardType"] = task_data->IdentifiedCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["IsActive"] = task_data->IsActive;
-		data["Telephone"] = toUtf(task_data->Telephone);
-		data["Address"] = toUtf(task_data->Address);
-		data["OpenDate"] = toUtf(task_data->OpenDate);
-		data["Mobile"] = toUtf(task_data->Mobile);
-		data["CommModelID"] = toUtf(task_data->CommModelID);
-		data["MarginModelID"] = toUtf(task_data->MarginModelID);
-		delete task_data;
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorGroupID] = toUtf(task_data->InvestorGroupID);
+		data[KEY_InvestorName] = toUtf(task_data->InvestorName);
+		data[KEY_IdentifiedCardType] = task_data->IdentifiedCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_IsActive] = task_data->IsActive;
+		data[KEY_Telephone] = toUtf(task_data->Telephone);
+		data[KEY_Address] = toUtf(task_data->Address);
+		data[KEY_OpenDate] = toUtf(task_data->OpenDate);
+		data[KEY_Mobile] = toUtf(task_data->Mobile);
+		data[KEY_CommModelID] = toUtf(task_data->CommModelID);
+		data[KEY_MarginModelID] = toUtf(task_data->MarginModelID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInvestor(data, error, task->task_id, task->task_last);
 };
@@ -1062,24 +1062,24 @@ void FuturesTdApi::processRspQryTradingCode(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradingCodeField *task_data = (CThostFtdcTradingCodeField*)task->task_data;
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IsActive"] = task_data->IsActive;
-		data["ClientIDType"] = task_data->ClientIDType;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["BizType"] = task_data->BizType;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IsActive] = task_data->IsActive;
+		data[KEY_ClientIDType] = task_data->ClientIDType;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_BizType] = task_data->BizType;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTradingCode(data, error, task->task_id, task->task_last);
 };
@@ -1091,27 +1091,27 @@ void FuturesTdApi::processRspQryInstrumentMarginRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInstrumentMarginRateField *task_data = (CThostFtdcInstrumentMarginRateField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["LongMarginRatioByMoney"] = task_data->LongMarginRatioByMoney;
-		data["LongMarginRatioByVolume"] = task_data->LongMarginRatioByVolume;
-		data["ShortMarginRatioByMoney"] = task_data->ShortMarginRatioByMoney;
-		data["ShortMarginRatioByVolume"] = task_data->ShortMarginRatioByVolume;
-		data["IsRelative"] = task_data->IsRelative;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_LongMarginRatioByMoney] = task_data->LongMarginRatioByMoney;
+		data[KEY_LongMarginRatioByVolume] = task_data->LongMarginRatioByVolume;
+		data[KEY_ShortMarginRatioByMoney] = task_data->ShortMarginRatioByMoney;
+		data[KEY_ShortMarginRatioByVolume] = task_data->ShortMarginRatioByVolume;
+		data[KEY_IsRelative] = task_data->IsRelative;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInstrumentMarginRate(data, error, task->task_id, task->task_last);
 };
@@ -1123,28 +1123,28 @@ void FuturesTdApi::processRspQryInstrumentCommissionRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInstrumentCommissionRateField *task_data = (CThostFtdcInstrumentCommissionRateField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OpenRatioByMoney"] = task_data->OpenRatioByMoney;
-		data["OpenRatioByVolume"] = task_data->OpenRatioByVolume;
-		data["CloseRatioByMoney"] = task_data->CloseRatioByMoney;
-		data["CloseRatioByVolume"] = task_data->CloseRatioByVolume;
-		data["CloseTodayRatioByMoney"] = task_data->CloseTodayRatioByMoney;
-		data["CloseTodayRatioByVolume"] = task_data->CloseTodayRatioByVolume;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["BizType"] = task_data->BizType;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OpenRatioByMoney] = task_data->OpenRatioByMoney;
+		data[KEY_OpenRatioByVolume] = task_data->OpenRatioByVolume;
+		data[KEY_CloseRatioByMoney] = task_data->CloseRatioByMoney;
+		data[KEY_CloseRatioByVolume] = task_data->CloseRatioByVolume;
+		data[KEY_CloseTodayRatioByMoney] = task_data->CloseTodayRatioByMoney;
+		data[KEY_CloseTodayRatioByVolume] = task_data->CloseTodayRatioByVolume;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_BizType] = task_data->BizType;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInstrumentCommissionRate(data, error, task->task_id, task->task_last);
 };
@@ -1156,18 +1156,18 @@ void FuturesTdApi::processRspQryExchange(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExchangeField *task_data = (CThostFtdcExchangeField*)task->task_data;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ExchangeName"] = toUtf(task_data->ExchangeName);
-		data["ExchangeProperty"] = task_data->ExchangeProperty;
-		delete task_data;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ExchangeName] = toUtf(task_data->ExchangeName);
+		data[KEY_ExchangeProperty] = task_data->ExchangeProperty;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryExchange(data, error, task->task_id, task->task_last);
 };
@@ -1179,32 +1179,32 @@ void FuturesTdApi::processRspQryProduct(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcProductField *task_data = (CThostFtdcProductField*)task->task_data;
-		data["ProductID"] = toUtf(task_data->ProductID);
-		data["ProductName"] = toUtf(task_data->ProductName);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ProductClass"] = task_data->ProductClass;
-		data["VolumeMultiple"] = task_data->VolumeMultiple;
-		data["PriceTick"] = task_data->PriceTick;
-		data["MaxMarketOrderVolume"] = task_data->MaxMarketOrderVolume;
-		data["MinMarketOrderVolume"] = task_data->MinMarketOrderVolume;
-		data["MaxLimitOrderVolume"] = task_data->MaxLimitOrderVolume;
-		data["MinLimitOrderVolume"] = task_data->MinLimitOrderVolume;
-		data["PositionType"] = task_data->PositionType;
-		data["PositionDateType"] = task_data->PositionDateType;
-		data["CloseDealType"] = task_data->CloseDealType;
-		data["TradeCurrencyID"] = toUtf(task_data->TradeCurrencyID);
-		data["MortgageFundUseRange"] = task_data->MortgageFundUseRange;
-		data["ExchangeProductID"] = toUtf(task_data->ExchangeProductID);
-		data["UnderlyingMultiple"] = task_data->UnderlyingMultiple;
-		delete task_data;
+		data[KEY_ProductID] = toUtf(task_data->ProductID);
+		data[KEY_ProductName] = toUtf(task_data->ProductName);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ProductClass] = task_data->ProductClass;
+		data[KEY_VolumeMultiple] = task_data->VolumeMultiple;
+		data[KEY_PriceTick] = task_data->PriceTick;
+		data[KEY_MaxMarketOrderVolume] = task_data->MaxMarketOrderVolume;
+		data[KEY_MinMarketOrderVolume] = task_data->MinMarketOrderVolume;
+		data[KEY_MaxLimitOrderVolume] = task_data->MaxLimitOrderVolume;
+		data[KEY_MinLimitOrderVolume] = task_data->MinLimitOrderVolume;
+		data[KEY_PositionType] = task_data->PositionType;
+		data[KEY_PositionDateType] = task_data->PositionDateType;
+		data[KEY_CloseDealType] = task_data->CloseDealType;
+		data[KEY_TradeCurrencyID] = toUtf(task_data->TradeCurrencyID);
+		data[KEY_MortgageFundUseRange] = task_data->MortgageFundUseRange;
+		data[KEY_ExchangeProductID] = toUtf(task_data->ExchangeProductID);
+		data[KEY_UnderlyingMultiple] = task_data->UnderlyingMultiple;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryProduct(data, error, task->task_id, task->task_last);
 };
@@ -1216,46 +1216,46 @@ void FuturesTdApi::processRspQryInstrument(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInstrumentField *task_data = (CThostFtdcInstrumentField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InstrumentName"] = toUtf(task_data->InstrumentName);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["ProductID"] = toUtf(task_data->ProductID);
-		data["ProductClass"] = task_data->ProductClass;
-		data["DeliveryYear"] = task_data->DeliveryYear;
-		data["DeliveryMonth"] = task_data->DeliveryMonth;
-		data["MaxMarketOrderVolume"] = task_data->MaxMarketOrderVolume;
-		data["MinMarketOrderVolume"] = task_data->MinMarketOrderVolume;
-		data["MaxLimitOrderVolume"] = task_data->MaxLimitOrderVolume;
-		data["MinLimitOrderVolume"] = task_data->MinLimitOrderVolume;
-		data["VolumeMultiple"] = task_data->VolumeMultiple;
-		data["PriceTick"] = task_data->PriceTick;
-		data["CreateDate"] = toUtf(task_data->CreateDate);
-		data["OpenDate"] = toUtf(task_data->OpenDate);
-		data["ExpireDate"] = toUtf(task_data->ExpireDate);
-		data["StartDelivDate"] = toUtf(task_data->StartDelivDate);
-		data["EndDelivDate"] = toUtf(task_data->EndDelivDate);
-		data["InstLifePhase"] = task_data->InstLifePhase;
-		data["IsTrading"] = task_data->IsTrading;
-		data["PositionType"] = task_data->PositionType;
-		data["PositionDateType"] = task_data->PositionDateType;
-		data["LongMarginRatio"] = task_data->LongMarginRatio;
-		data["ShortMarginRatio"] = task_data->ShortMarginRatio;
-		data["MaxMarginSideAlgorithm"] = task_data->MaxMarginSideAlgorithm;
-		data["UnderlyingInstrID"] = toUtf(task_data->UnderlyingInstrID);
-		data["StrikePrice"] = task_data->StrikePrice;
-		data["OptionsType"] = task_data->OptionsType;
-		data["UnderlyingMultiple"] = task_data->UnderlyingMultiple;
-		data["CombinationType"] = task_data->CombinationType;
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InstrumentName] = toUtf(task_data->InstrumentName);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_ProductID] = toUtf(task_data->ProductID);
+		data[KEY_ProductClass] = task_data->ProductClass;
+		data[KEY_DeliveryYear] = task_data->DeliveryYear;
+		data[KEY_DeliveryMonth] = task_data->DeliveryMonth;
+		data[KEY_MaxMarketOrderVolume] = task_data->MaxMarketOrderVolume;
+		data[KEY_MinMarketOrderVolume] = task_data->MinMarketOrderVolume;
+		data[KEY_MaxLimitOrderVolume] = task_data->MaxLimitOrderVolume;
+		data[KEY_MinLimitOrderVolume] = task_data->MinLimitOrderVolume;
+		data[KEY_VolumeMultiple] = task_data->VolumeMultiple;
+		data[KEY_PriceTick] = task_data->PriceTick;
+		data[KEY_CreateDate] = toUtf(task_data->CreateDate);
+		data[KEY_OpenDate] = toUtf(task_data->OpenDate);
+		data[KEY_ExpireDate] = toUtf(task_data->ExpireDate);
+		data[KEY_StartDelivDate] = toUtf(task_data->StartDelivDate);
+		data[KEY_EndDelivDate] = toUtf(task_data->EndDelivDate);
+		data[KEY_InstLifePhase] = task_data->InstLifePhase;
+		data[KEY_IsTrading] = task_data->IsTrading;
+		data[KEY_PositionType] = task_data->PositionType;
+		data[KEY_PositionDateType] = task_data->PositionDateType;
+		data[KEY_LongMarginRatio] = task_data->LongMarginRatio;
+		data[KEY_ShortMarginRatio] = task_data->ShortMarginRatio;
+		data[KEY_MaxMarginSideAlgorithm] = task_data->MaxMarginSideAlgorithm;
+		data[KEY_UnderlyingInstrID] = toUtf(task_data->UnderlyingInstrID);
+		data[KEY_StrikePrice] = task_data->StrikePrice;
+		data[KEY_OptionsType] = task_data->OptionsType;
+		data[KEY_UnderlyingMultiple] = task_data->UnderlyingMultiple;
+		data[KEY_CombinationType] = task_data->CombinationType;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInstrument(data, error, task->task_id, task->task_last);
 };
@@ -1267,59 +1267,59 @@ void FuturesTdApi::processRspQryDepthMarketData(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcDepthMarketDataField *task_data = (CThostFtdcDepthMarketDataField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["LastPrice"] = task_data->LastPrice;
-		data["PreSettlementPrice"] = task_data->PreSettlementPrice;
-		data["PreClosePrice"] = task_data->PreClosePrice;
-		data["PreOpenInterest"] = task_data->PreOpenInterest;
-		data["OpenPrice"] = task_data->OpenPrice;
-		data["HighestPrice"] = task_data->HighestPrice;
-		data["LowestPrice"] = task_data->LowestPrice;
-		data["Volume"] = task_data->Volume;
-		data["Turnover"] = task_data->Turnover;
-		data["OpenInterest"] = task_data->OpenInterest;
-		data["ClosePrice"] = task_data->ClosePrice;
-		data["SettlementPrice"] = task_data->SettlementPrice;
-		data["UpperLimitPrice"] = task_data->UpperLimitPrice;
-		data["LowerLimitPrice"] = task_data->LowerLimitPrice;
-		data["PreDelta"] = task_data->PreDelta;
-		data["CurrDelta"] = task_data->CurrDelta;
-		data["UpdateTime"] = toUtf(task_data->UpdateTime);
-		data["UpdateMillisec"] = task_data->UpdateMillisec;
-		data["BidPrice1"] = task_data->BidPrice1;
-		data["BidVolume1"] = task_data->BidVolume1;
-		data["AskPrice1"] = task_data->AskPrice1;
-		data["AskVolume1"] = task_data->AskVolume1;
-		data["BidPrice2"] = task_data->BidPrice2;
-		data["BidVolume2"] = task_data->BidVolume2;
-		data["AskPrice2"] = task_data->AskPrice2;
-		data["AskVolume2"] = task_data->AskVolume2;
-		data["BidPrice3"] = task_data->BidPrice3;
-		data["BidVolume3"] = task_data->BidVolume3;
-		data["AskPrice3"] = task_data->AskPrice3;
-		data["AskVolume3"] = task_data->AskVolume3;
-		data["BidPrice4"] = task_data->BidPrice4;
-		data["BidVolume4"] = task_data->BidVolume4;
-		data["AskPrice4"] = task_data->AskPrice4;
-		data["AskVolume4"] = task_data->AskVolume4;
-		data["BidPrice5"] = task_data->BidPrice5;
-		data["BidVolume5"] = task_data->BidVolume5;
-		data["AskPrice5"] = task_data->AskPrice5;
-		data["AskVolume5"] = task_data->AskVolume5;
-		data["AveragePrice"] = task_data->AveragePrice;
-		data["ActionDay"] = toUtf(task_data->ActionDay);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_LastPrice] = task_data->LastPrice;
+		data[KEY_PreSettlementPrice] = task_data->PreSettlementPrice;
+		data[KEY_PreClosePrice] = task_data->PreClosePrice;
+		data[KEY_PreOpenInterest] = task_data->PreOpenInterest;
+		data[KEY_OpenPrice] = task_data->OpenPrice;
+		data[KEY_HighestPrice] = task_data->HighestPrice;
+		data[KEY_LowestPrice] = task_data->LowestPrice;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_Turnover] = task_data->Turnover;
+		data[KEY_OpenInterest] = task_data->OpenInterest;
+		data[KEY_ClosePrice] = task_data->ClosePrice;
+		data[KEY_SettlementPrice] = task_data->SettlementPrice;
+		data[KEY_UpperLimitPrice] = task_data->UpperLimitPrice;
+		data[KEY_LowerLimitPrice] = task_data->LowerLimitPrice;
+		data[KEY_PreDelta] = task_data->PreDelta;
+		data[KEY_CurrDelta] = task_data->CurrDelta;
+		data[KEY_UpdateTime] = toUtf(task_data->UpdateTime);
+		data[KEY_UpdateMillisec] = task_data->UpdateMillisec;
+		data[KEY_BidPrice1] = task_data->BidPrice1;
+		data[KEY_BidVolume1] = task_data->BidVolume1;
+		data[KEY_AskPrice1] = task_data->AskPrice1;
+		data[KEY_AskVolume1] = task_data->AskVolume1;
+		data[KEY_BidPrice2] = task_data->BidPrice2;
+		data[KEY_BidVolume2] = task_data->BidVolume2;
+		data[KEY_AskPrice2] = task_data->AskPrice2;
+		data[KEY_AskVolume2] = task_data->AskVolume2;
+		data[KEY_BidPrice3] = task_data->BidPrice3;
+		data[KEY_BidVolume3] = task_data->BidVolume3;
+		data[KEY_AskPrice3] = task_data->AskPrice3;
+		data[KEY_AskVolume3] = task_data->AskVolume3;
+		data[KEY_BidPrice4] = task_data->BidPrice4;
+		data[KEY_BidVolume4] = task_data->BidVolume4;
+		data[KEY_AskPrice4] = task_data->AskPrice4;
+		data[KEY_AskVolume4] = task_data->AskVolume4;
+		data[KEY_BidPrice5] = task_data->BidPrice5;
+		data[KEY_BidVolume5] = task_data->BidVolume5;
+		data[KEY_AskPrice5] = task_data->AskPrice5;
+		data[KEY_AskVolume5] = task_data->AskVolume5;
+		data[KEY_AveragePrice] = task_data->AveragePrice;
+		data[KEY_ActionDay] = toUtf(task_data->ActionDay);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryDepthMarketData(data, error, task->task_id, task->task_last);
 };
@@ -1331,23 +1331,23 @@ void FuturesTdApi::processRspQrySettlementInfo(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcSettlementInfoField *task_data = (CThostFtdcSettlementInfoField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["Content"] = toUtf(task_data->Content);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_Content] = toUtf(task_data->Content);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQrySettlementInfo(data, error, task->task_id, task->task_last);
 };
@@ -1359,19 +1359,19 @@ void FuturesTdApi::processRspQryTransferBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTransferBankField *task_data = (CThostFtdcTransferBankField*)task->task_data;
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBrchID"] = toUtf(task_data->BankBrchID);
-		data["BankName"] = toUtf(task_data->BankName);
-		data["IsActive"] = task_data->IsActive;
-		delete task_data;
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBrchID] = toUtf(task_data->BankBrchID);
+		data[KEY_BankName] = toUtf(task_data->BankName);
+		data[KEY_IsActive] = task_data->IsActive;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTransferBank(data, error, task->task_id, task->task_last);
 };
@@ -1383,42 +1383,42 @@ void FuturesTdApi::processRspQryInvestorPositionDetail(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInvestorPositionDetailField *task_data = (CThostFtdcInvestorPositionDetailField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["Direction"] = task_data->Direction;
-		data["OpenDate"] = toUtf(task_data->OpenDate);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["Volume"] = task_data->Volume;
-		data["OpenPrice"] = task_data->OpenPrice;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["TradeType"] = task_data->TradeType;
-		data["CombInstrumentID"] = toUtf(task_data->CombInstrumentID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["CloseProfitByDate"] = task_data->CloseProfitByDate;
-		data["CloseProfitByTrade"] = task_data->CloseProfitByTrade;
-		data["PositionProfitByDate"] = task_data->PositionProfitByDate;
-		data["PositionProfitByTrade"] = task_data->PositionProfitByTrade;
-		data["Margin"] = task_data->Margin;
-		data["ExchMargin"] = task_data->ExchMargin;
-		data["MarginRateByMoney"] = task_data->MarginRateByMoney;
-		data["MarginRateByVolume"] = task_data->MarginRateByVolume;
-		data["LastSettlementPrice"] = task_data->LastSettlementPrice;
-		data["SettlementPrice"] = task_data->SettlementPrice;
-		data["CloseVolume"] = task_data->CloseVolume;
-		data["CloseAmount"] = task_data->CloseAmount;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_OpenDate] = toUtf(task_data->OpenDate);
+		data[KEY_TradeID] = toUtf(task_data->TradeID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_OpenPrice] = task_data->OpenPrice;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_TradeType] = task_data->TradeType;
+		data[KEY_CombInstrumentID] = toUtf(task_data->CombInstrumentID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_CloseProfitByDate] = task_data->CloseProfitByDate;
+		data[KEY_CloseProfitByTrade] = task_data->CloseProfitByTrade;
+		data[KEY_PositionProfitByDate] = task_data->PositionProfitByDate;
+		data[KEY_PositionProfitByTrade] = task_data->PositionProfitByTrade;
+		data[KEY_Margin] = task_data->Margin;
+		data[KEY_ExchMargin] = task_data->ExchMargin;
+		data[KEY_MarginRateByMoney] = task_data->MarginRateByMoney;
+		data[KEY_MarginRateByVolume] = task_data->MarginRateByVolume;
+		data[KEY_LastSettlementPrice] = task_data->LastSettlementPrice;
+		data[KEY_SettlementPrice] = task_data->SettlementPrice;
+		data[KEY_CloseVolume] = task_data->CloseVolume;
+		data[KEY_CloseAmount] = task_data->CloseAmount;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInvestorPositionDetail(data, error, task->task_id, task->task_last);
 };
@@ -1430,18 +1430,18 @@ void FuturesTdApi::processRspQryNotice(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcNoticeField *task_data = (CThostFtdcNoticeField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["Content"] = toUtf(task_data->Content);
-		data["SequenceLabel"] = toUtf(task_data->SequenceLabel);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_Content] = toUtf(task_data->Content);
+		data[KEY_SequenceLabel] = toUtf(task_data->SequenceLabel);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryNotice(data, error, task->task_id, task->task_last);
 };
@@ -1453,22 +1453,22 @@ void FuturesTdApi::processRspQrySettlementInfoConfirm(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcSettlementInfoConfirmField *task_data = (CThostFtdcSettlementInfoConfirmField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ConfirmDate"] = toUtf(task_data->ConfirmDate);
-		data["ConfirmTime"] = toUtf(task_data->ConfirmTime);
-		data["SettlementID"] = task_data->SettlementID;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ConfirmDate] = toUtf(task_data->ConfirmDate);
+		data[KEY_ConfirmTime] = toUtf(task_data->ConfirmTime);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQrySettlementInfoConfirm(data, error, task->task_id, task->task_last);
 };
@@ -1480,36 +1480,36 @@ void FuturesTdApi::processRspQryInvestorPositionCombineDetail(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInvestorPositionCombineDetailField *task_data = (CThostFtdcInvestorPositionCombineDetailField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["OpenDate"] = toUtf(task_data->OpenDate);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["SettlementID"] = task_data->SettlementID;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ComTradeID"] = toUtf(task_data->ComTradeID);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["Direction"] = task_data->Direction;
-		data["TotalAmt"] = task_data->TotalAmt;
-		data["Margin"] = task_data->Margin;
-		data["ExchMargin"] = task_data->ExchMargin;
-		data["MarginRateByMoney"] = task_data->MarginRateByMoney;
-		data["MarginRateByVolume"] = task_data->MarginRateByVolume;
-		data["LegID"] = task_data->LegID;
-		data["LegMultiple"] = task_data->LegMultiple;
-		data["CombInstrumentID"] = toUtf(task_data->CombInstrumentID);
-		data["TradeGroupID"] = task_data->TradeGroupID;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_OpenDate] = toUtf(task_data->OpenDate);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ComTradeID] = toUtf(task_data->ComTradeID);
+		data[KEY_TradeID] = toUtf(task_data->TradeID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_TotalAmt] = task_data->TotalAmt;
+		data[KEY_Margin] = task_data->Margin;
+		data[KEY_ExchMargin] = task_data->ExchMargin;
+		data[KEY_MarginRateByMoney] = task_data->MarginRateByMoney;
+		data[KEY_MarginRateByVolume] = task_data->MarginRateByVolume;
+		data[KEY_LegID] = task_data->LegID;
+		data[KEY_LegMultiple] = task_data->LegMultiple;
+		data[KEY_CombInstrumentID] = toUtf(task_data->CombInstrumentID);
+		data[KEY_TradeGroupID] = task_data->TradeGroupID;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInvestorPositionCombineDetail(data, error, task->task_id, task->task_last);
 };
@@ -1521,20 +1521,20 @@ void FuturesTdApi::processRspQryCFMMCTradingAccountKey(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcCFMMCTradingAccountKeyField *task_data = (CThostFtdcCFMMCTradingAccountKeyField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["KeyID"] = task_data->KeyID;
-		data["CurrentKey"] = toUtf(task_data->CurrentKey);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_KeyID] = task_data->KeyID;
+		data[KEY_CurrentKey] = toUtf(task_data->CurrentKey);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryCFMMCTradingAccountKey(data, error, task->task_id, task->task_last);
 };
@@ -1546,24 +1546,24 @@ void FuturesTdApi::processRspQryEWarrantOffset(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcEWarrantOffsetField *task_data = (CThostFtdcEWarrantOffsetField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["Direction"] = task_data->Direction;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["Volume"] = task_data->Volume;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryEWarrantOffset(data, error, task->task_id, task->task_last);
 };
@@ -1575,44 +1575,44 @@ void FuturesTdApi::processRspQryInvestorProductGroupMargin(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInvestorProductGroupMarginField *task_data = (CThostFtdcInvestorProductGroupMarginField*)task->task_data;
-		data["ProductGroupID"] = toUtf(task_data->ProductGroupID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["LongFrozenMargin"] = task_data->LongFrozenMargin;
-		data["ShortFrozenMargin"] = task_data->ShortFrozenMargin;
-		data["UseMargin"] = task_data->UseMargin;
-		data["LongUseMargin"] = task_data->LongUseMargin;
-		data["ShortUseMargin"] = task_data->ShortUseMargin;
-		data["ExchMargin"] = task_data->ExchMargin;
-		data["LongExchMargin"] = task_data->LongExchMargin;
-		data["ShortExchMargin"] = task_data->ShortExchMargin;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["Commission"] = task_data->Commission;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["CashIn"] = task_data->CashIn;
-		data["PositionProfit"] = task_data->PositionProfit;
-		data["OffsetAmount"] = task_data->OffsetAmount;
-		data["LongOffsetAmount"] = task_data->LongOffsetAmount;
-		data["ShortOffsetAmount"] = task_data->ShortOffsetAmount;
-		data["ExchOffsetAmount"] = task_data->ExchOffsetAmount;
-		data["LongExchOffsetAmount"] = task_data->LongExchOffsetAmount;
-		data["ShortExchOffsetAmount"] = task_data->ShortExchOffsetAmount;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_ProductGroupID] = toUtf(task_data->ProductGroupID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_FrozenMargin] = task_data->FrozenMargin;
+		data[KEY_LongFrozenMargin] = task_data->LongFrozenMargin;
+		data[KEY_ShortFrozenMargin] = task_data->ShortFrozenMargin;
+		data[KEY_UseMargin] = task_data->UseMargin;
+		data[KEY_LongUseMargin] = task_data->LongUseMargin;
+		data[KEY_ShortUseMargin] = task_data->ShortUseMargin;
+		data[KEY_ExchMargin] = task_data->ExchMargin;
+		data[KEY_LongExchMargin] = task_data->LongExchMargin;
+		data[KEY_ShortExchMargin] = task_data->ShortExchMargin;
+		data[KEY_CloseProfit] = task_data->CloseProfit;
+		data[KEY_FrozenCommission] = task_data->FrozenCommission;
+		data[KEY_Commission] = task_data->Commission;
+		data[KEY_FrozenCash] = task_data->FrozenCash;
+		data[KEY_CashIn] = task_data->CashIn;
+		data[KEY_PositionProfit] = task_data->PositionProfit;
+		data[KEY_OffsetAmount] = task_data->OffsetAmount;
+		data[KEY_LongOffsetAmount] = task_data->LongOffsetAmount;
+		data[KEY_ShortOffsetAmount] = task_data->ShortOffsetAmount;
+		data[KEY_ExchOffsetAmount] = task_data->ExchOffsetAmount;
+		data[KEY_LongExchOffsetAmount] = task_data->LongExchOffsetAmount;
+		data[KEY_ShortExchOffsetAmount] = task_data->ShortExchOffsetAmount;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInvestorProductGroupMargin(data, error, task->task_id, task->task_last);
 };
@@ -1624,23 +1624,23 @@ void FuturesTdApi::processRspQryExchangeMarginRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExchangeMarginRateField *task_data = (CThostFtdcExchangeMarginRateField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["LongMarginRatioByMoney"] = task_data->LongMarginRatioByMoney;
-		data["LongMarginRatioByVolume"] = task_data->LongMarginRatioByVolume;
-		data["ShortMarginRatioByMoney"] = task_data->ShortMarginRatioByMoney;
-		data["ShortMarginRatioByVolume"] = task_data->ShortMarginRatioByVolume;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_LongMarginRatioByMoney] = task_data->LongMarginRatioByMoney;
+		data[KEY_LongMarginRatioByVolume] = task_data->LongMarginRatioByVolume;
+		data[KEY_ShortMarginRatioByMoney] = task_data->ShortMarginRatioByMoney;
+		data[KEY_ShortMarginRatioByVolume] = task_data->ShortMarginRatioByVolume;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryExchangeMarginRate(data, error, task->task_id, task->task_last);
 };
@@ -1652,30 +1652,30 @@ void FuturesTdApi::processRspQryExchangeMarginRateAdjust(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExchangeMarginRateAdjustField *task_data = (CThostFtdcExchangeMarginRateAdjustField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["LongMarginRatioByMoney"] = task_data->LongMarginRatioByMoney;
-		data["LongMarginRatioByVolume"] = task_data->LongMarginRatioByVolume;
-		data["ShortMarginRatioByMoney"] = task_data->ShortMarginRatioByMoney;
-		data["ShortMarginRatioByVolume"] = task_data->ShortMarginRatioByVolume;
-		data["ExchLongMarginRatioByMoney"] = task_data->ExchLongMarginRatioByMoney;
-		data["ExchLongMarginRatioByVolume"] = task_data->ExchLongMarginRatioByVolume;
-		data["ExchShortMarginRatioByMoney"] = task_data->ExchShortMarginRatioByMoney;
-		data["ExchShortMarginRatioByVolume"] = task_data->ExchShortMarginRatioByVolume;
-		data["NoLongMarginRatioByMoney"] = task_data->NoLongMarginRatioByMoney;
-		data["NoLongMarginRatioByVolume"] = task_data->NoLongMarginRatioByVolume;
-		data["NoShortMarginRatioByMoney"] = task_data->NoShortMarginRatioByMoney;
-		data["NoShortMarginRatioByVolume"] = task_data->NoShortMarginRatioByVolume;
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_LongMarginRatioByMoney] = task_data->LongMarginRatioByMoney;
+		data[KEY_LongMarginRatioByVolume] = task_data->LongMarginRatioByVolume;
+		data[KEY_ShortMarginRatioByMoney] = task_data->ShortMarginRatioByMoney;
+		data[KEY_ShortMarginRatioByVolume] = task_data->ShortMarginRatioByVolume;
+		data[KEY_ExchLongMarginRatioByMoney] = task_data->ExchLongMarginRatioByMoney;
+		data[KEY_ExchLongMarginRatioByVolume] = task_data->ExchLongMarginRatioByVolume;
+		data[KEY_ExchShortMarginRatioByMoney] = task_data->ExchShortMarginRatioByMoney;
+		data[KEY_ExchShortMarginRatioByVolume] = task_data->ExchShortMarginRatioByVolume;
+		data[KEY_NoLongMarginRatioByMoney] = task_data->NoLongMarginRatioByMoney;
+		data[KEY_NoLongMarginRatioByVolume] = task_data->NoLongMarginRatioByVolume;
+		data[KEY_NoShortMarginRatioByMoney] = task_data->NoShortMarginRatioByMoney;
+		data[KEY_NoShortMarginRatioByVolume] = task_data->NoShortMarginRatioByVolume;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryExchangeMarginRateAdjust(data, error, task->task_id, task->task_last);
 };
@@ -1687,20 +1687,20 @@ void FuturesTdApi::processRspQryExchangeRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExchangeRateField *task_data = (CThostFtdcExchangeRateField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["FromCurrencyID"] = toUtf(task_data->FromCurrencyID);
-		data["FromCurrencyUnit"] = task_data->FromCurrencyUnit;
-		data["ToCurrencyID"] = toUtf(task_data->ToCurrencyID);
-		data["ExchangeRate"] = task_data->ExchangeRate;
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_FromCurrencyID] = toUtf(task_data->FromCurrencyID);
+		data[KEY_FromCurrencyUnit] = task_data->FromCurrencyUnit;
+		data[KEY_ToCurrencyID] = toUtf(task_data->ToCurrencyID);
+		data[KEY_ExchangeRate] = task_data->ExchangeRate;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryExchangeRate(data, error, task->task_id, task->task_last);
 };
@@ -1712,20 +1712,20 @@ void FuturesTdApi::processRspQrySecAgentACIDMap(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcSecAgentACIDMapField *task_data = (CThostFtdcSecAgentACIDMapField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["BrokerSecAgentID"] = toUtf(task_data->BrokerSecAgentID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_BrokerSecAgentID] = toUtf(task_data->BrokerSecAgentID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQrySecAgentACIDMap(data, error, task->task_id, task->task_last);
 };
@@ -1737,19 +1737,19 @@ void FuturesTdApi::processRspQryProductExchRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcProductExchRateField *task_data = (CThostFtdcProductExchRateField*)task->task_data;
-		data["ProductID"] = toUtf(task_data->ProductID);
-		data["QuoteCurrencyID"] = toUtf(task_data->QuoteCurrencyID);
-		data["ExchangeRate"] = task_data->ExchangeRate;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		delete task_data;
+		data[KEY_ProductID] = toUtf(task_data->ProductID);
+		data[KEY_QuoteCurrencyID] = toUtf(task_data->QuoteCurrencyID);
+		data[KEY_ExchangeRate] = task_data->ExchangeRate;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryProductExchRate(data, error, task->task_id, task->task_last);
 };
@@ -1761,18 +1761,18 @@ void FuturesTdApi::processRspQryProductGroup(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcProductGroupField *task_data = (CThostFtdcProductGroupField*)task->task_data;
-		data["ProductID"] = toUtf(task_data->ProductID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ProductGroupID"] = toUtf(task_data->ProductGroupID);
-		delete task_data;
+		data[KEY_ProductID] = toUtf(task_data->ProductID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ProductGroupID] = toUtf(task_data->ProductGroupID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryProductGroup(data, error, task->task_id, task->task_last);
 };
@@ -1784,25 +1784,25 @@ void FuturesTdApi::processRspQryMMInstrumentCommissionRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcMMInstrumentCommissionRateField *task_data = (CThostFtdcMMInstrumentCommissionRateField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OpenRatioByMoney"] = task_data->OpenRatioByMoney;
-		data["OpenRatioByVolume"] = task_data->OpenRatioByVolume;
-		data["CloseRatioByMoney"] = task_data->CloseRatioByMoney;
-		data["CloseRatioByVolume"] = task_data->CloseRatioByVolume;
-		data["CloseTodayRatioByMoney"] = task_data->CloseTodayRatioByMoney;
-		data["CloseTodayRatioByVolume"] = task_data->CloseTodayRatioByVolume;
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OpenRatioByMoney] = task_data->OpenRatioByMoney;
+		data[KEY_OpenRatioByVolume] = task_data->OpenRatioByVolume;
+		data[KEY_CloseRatioByMoney] = task_data->CloseRatioByMoney;
+		data[KEY_CloseRatioByVolume] = task_data->CloseRatioByVolume;
+		data[KEY_CloseTodayRatioByMoney] = task_data->CloseTodayRatioByMoney;
+		data[KEY_CloseTodayRatioByVolume] = task_data->CloseTodayRatioByVolume;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryMMInstrumentCommissionRate(data, error, task->task_id, task->task_last);
 };
@@ -1814,27 +1814,27 @@ void FuturesTdApi::processRspQryMMOptionInstrCommRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcMMOptionInstrCommRateField *task_data = (CThostFtdcMMOptionInstrCommRateField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OpenRatioByMoney"] = task_data->OpenRatioByMoney;
-		data["OpenRatioByVolume"] = task_data->OpenRatioByVolume;
-		data["CloseRatioByMoney"] = task_data->CloseRatioByMoney;
-		data["CloseRatioByVolume"] = task_data->CloseRatioByVolume;
-		data["CloseTodayRatioByMoney"] = task_data->CloseTodayRatioByMoney;
-		data["CloseTodayRatioByVolume"] = task_data->CloseTodayRatioByVolume;
-		data["StrikeRatioByMoney"] = task_data->StrikeRatioByMoney;
-		data["StrikeRatioByVolume"] = task_data->StrikeRatioByVolume;
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OpenRatioByMoney] = task_data->OpenRatioByMoney;
+		data[KEY_OpenRatioByVolume] = task_data->OpenRatioByVolume;
+		data[KEY_CloseRatioByMoney] = task_data->CloseRatioByMoney;
+		data[KEY_CloseRatioByVolume] = task_data->CloseRatioByVolume;
+		data[KEY_CloseTodayRatioByMoney] = task_data->CloseTodayRatioByMoney;
+		data[KEY_CloseTodayRatioByVolume] = task_data->CloseTodayRatioByVolume;
+		data[KEY_StrikeRatioByMoney] = task_data->StrikeRatioByMoney;
+		data[KEY_StrikeRatioByVolume] = task_data->StrikeRatioByVolume;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryMMOptionInstrCommRate(data, error, task->task_id, task->task_last);
 };
@@ -1846,24 +1846,24 @@ void FuturesTdApi::processRspQryInstrumentOrderCommRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInstrumentOrderCommRateField *task_data = (CThostFtdcInstrumentOrderCommRateField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["OrderCommByVolume"] = task_data->OrderCommByVolume;
-		data["OrderActionCommByVolume"] = task_data->OrderActionCommByVolume;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_OrderCommByVolume] = task_data->OrderCommByVolume;
+		data[KEY_OrderActionCommByVolume] = task_data->OrderActionCommByVolume;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInstrumentOrderCommRate(data, error, task->task_id, task->task_last);
 };
@@ -1875,64 +1875,64 @@ void FuturesTdApi::processRspQrySecAgentTradingAccount(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradingAccountField *task_data = (CThostFtdcTradingAccountField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["PreMortgage"] = task_data->PreMortgage;
-		data["PreCredit"] = task_data->PreCredit;
-		data["PreDeposit"] = task_data->PreDeposit;
-		data["PreBalance"] = task_data->PreBalance;
-		data["PreMargin"] = task_data->PreMargin;
-		data["InterestBase"] = task_data->InterestBase;
-		data["Interest"] = task_data->Interest;
-		data["Deposit"] = task_data->Deposit;
-		data["Withdraw"] = task_data->Withdraw;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["CurrMargin"] = task_data->CurrMargin;
-		data["CashIn"] = task_data->CashIn;
-		data["Commission"] = task_data->Commission;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["PositionProfit"] = task_data->PositionProfit;
-		data["Balance"] = task_data->Balance;
-		data["Available"] = task_data->Available;
-		data["WithdrawQuota"] = task_data->WithdrawQuota;
-		data["Reserve"] = task_data->Reserve;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["Credit"] = task_data->Credit;
-		data["Mortgage"] = task_data->Mortgage;
-		data["ExchangeMargin"] = task_data->ExchangeMargin;
-		data["DeliveryMargin"] = task_data->DeliveryMargin;
-		data["ExchangeDeliveryMargin"] = task_data->ExchangeDeliveryMargin;
-		data["ReserveBalance"] = task_data->ReserveBalance;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["PreFundMortgageIn"] = task_data->PreFundMortgageIn;
-		data["PreFundMortgageOut"] = task_data->PreFundMortgageOut;
-		data["FundMortgageIn"] = task_data->FundMortgageIn;
-		data["FundMortgageOut"] = task_data->FundMortgageOut;
-		data["FundMortgageAvailable"] = task_data->FundMortgageAvailable;
-		data["MortgageableFund"] = task_data->MortgageableFund;
-		data["SpecProductMargin"] = task_data->SpecProductMargin;
-		data["SpecProductFrozenMargin"] = task_data->SpecProductFrozenMargin;
-		data["SpecProductCommission"] = task_data->SpecProductCommission;
-		data["SpecProductFrozenCommission"] = task_data->SpecProductFrozenCommission;
-		data["SpecProductPositionProfit"] = task_data->SpecProductPositionProfit;
-		data["SpecProductCloseProfit"] = task_data->SpecProductCloseProfit;
-		data["SpecProductPositionProfitByAlg"] = task_data->SpecProductPositionProfitByAlg;
-		data["SpecProductExchangeMargin"] = task_data->SpecProductExchangeMargin;
-		data["BizType"] = task_data->BizType;
-		data["FrozenSwap"] = task_data->FrozenSwap;
-		data["RemainSwap"] = task_data->RemainSwap;
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_PreMortgage] = task_data->PreMortgage;
+		data[KEY_PreCredit] = task_data->PreCredit;
+		data[KEY_PreDeposit] = task_data->PreDeposit;
+		data[KEY_PreBalance] = task_data->PreBalance;
+		data[KEY_PreMargin] = task_data->PreMargin;
+		data[KEY_InterestBase] = task_data->InterestBase;
+		data[KEY_Interest] = task_data->Interest;
+		data[KEY_Deposit] = task_data->Deposit;
+		data[KEY_Withdraw] = task_data->Withdraw;
+		data[KEY_FrozenMargin] = task_data->FrozenMargin;
+		data[KEY_FrozenCash] = task_data->FrozenCash;
+		data[KEY_FrozenCommission] = task_data->FrozenCommission;
+		data[KEY_CurrMargin] = task_data->CurrMargin;
+		data[KEY_CashIn] = task_data->CashIn;
+		data[KEY_Commission] = task_data->Commission;
+		data[KEY_CloseProfit] = task_data->CloseProfit;
+		data[KEY_PositionProfit] = task_data->PositionProfit;
+		data[KEY_Balance] = task_data->Balance;
+		data[KEY_Available] = task_data->Available;
+		data[KEY_WithdrawQuota] = task_data->WithdrawQuota;
+		data[KEY_Reserve] = task_data->Reserve;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_Credit] = task_data->Credit;
+		data[KEY_Mortgage] = task_data->Mortgage;
+		data[KEY_ExchangeMargin] = task_data->ExchangeMargin;
+		data[KEY_DeliveryMargin] = task_data->DeliveryMargin;
+		data[KEY_ExchangeDeliveryMargin] = task_data->ExchangeDeliveryMargin;
+		data[KEY_ReserveBalance] = task_data->ReserveBalance;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_PreFundMortgageIn] = task_data->PreFundMortgageIn;
+		data[KEY_PreFundMortgageOut] = task_data->PreFundMortgageOut;
+		data[KEY_FundMortgageIn] = task_data->FundMortgageIn;
+		data[KEY_FundMortgageOut] = task_data->FundMortgageOut;
+		data[KEY_FundMortgageAvailable] = task_data->FundMortgageAvailable;
+		data[KEY_MortgageableFund] = task_data->MortgageableFund;
+		data[KEY_SpecProductMargin] = task_data->SpecProductMargin;
+		data[KEY_SpecProductFrozenMargin] = task_data->SpecProductFrozenMargin;
+		data[KEY_SpecProductCommission] = task_data->SpecProductCommission;
+		data[KEY_SpecProductFrozenCommission] = task_data->SpecProductFrozenCommission;
+		data[KEY_SpecProductPositionProfit] = task_data->SpecProductPositionProfit;
+		data[KEY_SpecProductCloseProfit] = task_data->SpecProductCloseProfit;
+		data[KEY_SpecProductPositionProfitByAlg] = task_data->SpecProductPositionProfitByAlg;
+		data[KEY_SpecProductExchangeMargin] = task_data->SpecProductExchangeMargin;
+		data[KEY_BizType] = task_data->BizType;
+		data[KEY_FrozenSwap] = task_data->FrozenSwap;
+		data[KEY_RemainSwap] = task_data->RemainSwap;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQrySecAgentTradingAccount(data, error, task->task_id, task->task_last);
 };
@@ -1944,20 +1944,20 @@ void FuturesTdApi::processRspQrySecAgentCheckMode(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcSecAgentCheckModeField *task_data = (CThostFtdcSecAgentCheckModeField*)task->task_data;
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["BrokerSecAgentID"] = toUtf(task_data->BrokerSecAgentID);
-		data["CheckSelfAccount"] = task_data->CheckSelfAccount;
-		delete task_data;
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_BrokerSecAgentID] = toUtf(task_data->BrokerSecAgentID);
+		data[KEY_CheckSelfAccount] = task_data->CheckSelfAccount;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQrySecAgentCheckMode(data, error, task->task_id, task->task_last);
 };
@@ -1969,26 +1969,26 @@ void FuturesTdApi::processRspQryOptionInstrTradeCost(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOptionInstrTradeCostField *task_data = (CThostFtdcOptionInstrTradeCostField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["FixedMargin"] = task_data->FixedMargin;
-		data["MiniMargin"] = task_data->MiniMargin;
-		data["Royalty"] = task_data->Royalty;
-		data["ExchFixedMargin"] = task_data->ExchFixedMargin;
-		data["ExchMiniMargin"] = task_data->ExchMiniMargin;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_FixedMargin] = task_data->FixedMargin;
+		data[KEY_MiniMargin] = task_data->MiniMargin;
+		data[KEY_Royalty] = task_data->Royalty;
+		data[KEY_ExchFixedMargin] = task_data->ExchFixedMargin;
+		data[KEY_ExchMiniMargin] = task_data->ExchMiniMargin;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOptionInstrTradeCost(data, error, task->task_id, task->task_last);
 };
@@ -2000,29 +2000,29 @@ void FuturesTdApi::processRspQryOptionInstrCommRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOptionInstrCommRateField *task_data = (CThostFtdcOptionInstrCommRateField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OpenRatioByMoney"] = task_data->OpenRatioByMoney;
-		data["OpenRatioByVolume"] = task_data->OpenRatioByVolume;
-		data["CloseRatioByMoney"] = task_data->CloseRatioByMoney;
-		data["CloseRatioByVolume"] = task_data->CloseRatioByVolume;
-		data["CloseTodayRatioByMoney"] = task_data->CloseTodayRatioByMoney;
-		data["CloseTodayRatioByVolume"] = task_data->CloseTodayRatioByVolume;
-		data["StrikeRatioByMoney"] = task_data->StrikeRatioByMoney;
-		data["StrikeRatioByVolume"] = task_data->StrikeRatioByVolume;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OpenRatioByMoney] = task_data->OpenRatioByMoney;
+		data[KEY_OpenRatioByVolume] = task_data->OpenRatioByVolume;
+		data[KEY_CloseRatioByMoney] = task_data->CloseRatioByMoney;
+		data[KEY_CloseRatioByVolume] = task_data->CloseRatioByVolume;
+		data[KEY_CloseTodayRatioByMoney] = task_data->CloseTodayRatioByMoney;
+		data[KEY_CloseTodayRatioByVolume] = task_data->CloseTodayRatioByVolume;
+		data[KEY_StrikeRatioByMoney] = task_data->StrikeRatioByMoney;
+		data[KEY_StrikeRatioByVolume] = task_data->StrikeRatioByVolume;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOptionInstrCommRate(data, error, task->task_id, task->task_last);
 };
@@ -2034,59 +2034,59 @@ void FuturesTdApi::processRspQryExecOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExecOrderField *task_data = (CThostFtdcExecOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExecOrderRef"] = toUtf(task_data->ExecOrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ActionType"] = task_data->ActionType;
-		data["PosiDirection"] = task_data->PosiDirection;
-		data["ReservePositionFlag"] = task_data->ReservePositionFlag;
-		data["CloseFlag"] = task_data->CloseFlag;
-		data["ExecOrderLocalID"] = toUtf(task_data->ExecOrderLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["ExecOrderSysID"] = toUtf(task_data->ExecOrderSysID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ExecResult"] = task_data->ExecResult;
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerExecOrderSeq"] = task_data->BrokerExecOrderSeq;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ExecOrderRef] = toUtf(task_data->ExecOrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ActionType] = task_data->ActionType;
+		data[KEY_PosiDirection] = task_data->PosiDirection;
+		data[KEY_ReservePositionFlag] = task_data->ReservePositionFlag;
+		data[KEY_CloseFlag] = task_data->CloseFlag;
+		data[KEY_ExecOrderLocalID] = toUtf(task_data->ExecOrderLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_ExecOrderSysID] = toUtf(task_data->ExecOrderSysID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ExecResult] = task_data->ExecResult;
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerExecOrderSeq] = task_data->BrokerExecOrderSeq;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryExecOrder(data, error, task->task_id, task->task_last);
 };
@@ -2098,38 +2098,38 @@ void FuturesTdApi::processRspQryForQuote(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcForQuoteField *task_data = (CThostFtdcForQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ForQuoteRef"] = toUtf(task_data->ForQuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ForQuoteLocalID"] = toUtf(task_data->ForQuoteLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ForQuoteStatus"] = task_data->ForQuoteStatus;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerForQutoSeq"] = task_data->BrokerForQutoSeq;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ForQuoteRef] = toUtf(task_data->ForQuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ForQuoteLocalID] = toUtf(task_data->ForQuoteLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ForQuoteStatus] = task_data->ForQuoteStatus;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerForQutoSeq] = task_data->BrokerForQutoSeq;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryForQuote(data, error, task->task_id, task->task_last);
 };
@@ -2141,65 +2141,65 @@ void FuturesTdApi::processRspQryQuote(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcQuoteField *task_data = (CThostFtdcQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["QuoteRef"] = toUtf(task_data->QuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["AskPrice"] = task_data->AskPrice;
-		data["BidPrice"] = task_data->BidPrice;
-		data["AskVolume"] = task_data->AskVolume;
-		data["BidVolume"] = task_data->BidVolume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["AskOffsetFlag"] = task_data->AskOffsetFlag;
-		data["BidOffsetFlag"] = task_data->BidOffsetFlag;
-		data["AskHedgeFlag"] = task_data->AskHedgeFlag;
-		data["BidHedgeFlag"] = task_data->BidHedgeFlag;
-		data["QuoteLocalID"] = toUtf(task_data->QuoteLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["QuoteSysID"] = toUtf(task_data->QuoteSysID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["QuoteStatus"] = task_data->QuoteStatus;
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["AskOrderSysID"] = toUtf(task_data->AskOrderSysID);
-		data["BidOrderSysID"] = toUtf(task_data->BidOrderSysID);
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerQuoteSeq"] = task_data->BrokerQuoteSeq;
-		data["AskOrderRef"] = toUtf(task_data->AskOrderRef);
-		data["BidOrderRef"] = toUtf(task_data->BidOrderRef);
-		data["ForQuoteSysID"] = toUtf(task_data->ForQuoteSysID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_QuoteRef] = toUtf(task_data->QuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_AskPrice] = task_data->AskPrice;
+		data[KEY_BidPrice] = task_data->BidPrice;
+		data[KEY_AskVolume] = task_data->AskVolume;
+		data[KEY_BidVolume] = task_data->BidVolume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_AskOffsetFlag] = task_data->AskOffsetFlag;
+		data[KEY_BidOffsetFlag] = task_data->BidOffsetFlag;
+		data[KEY_AskHedgeFlag] = task_data->AskHedgeFlag;
+		data[KEY_BidHedgeFlag] = task_data->BidHedgeFlag;
+		data[KEY_QuoteLocalID] = toUtf(task_data->QuoteLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_QuoteSysID] = toUtf(task_data->QuoteSysID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_QuoteStatus] = task_data->QuoteStatus;
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_AskOrderSysID] = toUtf(task_data->AskOrderSysID);
+		data[KEY_BidOrderSysID] = toUtf(task_data->BidOrderSysID);
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerQuoteSeq] = task_data->BrokerQuoteSeq;
+		data[KEY_AskOrderRef] = toUtf(task_data->AskOrderRef);
+		data[KEY_BidOrderRef] = toUtf(task_data->BidOrderRef);
+		data[KEY_ForQuoteSysID] = toUtf(task_data->ForQuoteSysID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryQuote(data, error, task->task_id, task->task_last);
 };
@@ -2211,55 +2211,55 @@ void FuturesTdApi::processRspQryOptionSelfClose(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOptionSelfCloseField *task_data = (CThostFtdcOptionSelfCloseField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OptionSelfCloseRef"] = toUtf(task_data->OptionSelfCloseRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["OptSelfCloseFlag"] = task_data->OptSelfCloseFlag;
-		data["OptionSelfCloseLocalID"] = toUtf(task_data->OptionSelfCloseLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OptionSelfCloseSysID"] = toUtf(task_data->OptionSelfCloseSysID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ExecResult"] = task_data->ExecResult;
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerOptionSelfCloseSeq"] = task_data->BrokerOptionSelfCloseSeq;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OptionSelfCloseRef] = toUtf(task_data->OptionSelfCloseRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_OptSelfCloseFlag] = task_data->OptSelfCloseFlag;
+		data[KEY_OptionSelfCloseLocalID] = toUtf(task_data->OptionSelfCloseLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_OptionSelfCloseSysID] = toUtf(task_data->OptionSelfCloseSysID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ExecResult] = task_data->ExecResult;
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerOptionSelfCloseSeq] = task_data->BrokerOptionSelfCloseSeq;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOptionSelfClose(data, error, task->task_id, task->task_last);
 };
@@ -2271,24 +2271,24 @@ void FuturesTdApi::processRspQryInvestUnit(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInvestUnitField *task_data = (CThostFtdcInvestUnitField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["InvestorUnitName"] = toUtf(task_data->InvestorUnitName);
-		data["InvestorGroupID"] = toUtf(task_data->InvestorGroupID);
-		data["CommModelID"] = toUtf(task_data->CommModelID);
-		data["MarginModelID"] = toUtf(task_data->MarginModelID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_InvestorUnitName] = toUtf(task_data->InvestorUnitName);
+		data[KEY_InvestorGroupID] = toUtf(task_data->InvestorGroupID);
+		data[KEY_CommModelID] = toUtf(task_data->CommModelID);
+		data[KEY_MarginModelID] = toUtf(task_data->MarginModelID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInvestUnit(data, error, task->task_id, task->task_last);
 };
@@ -2300,19 +2300,19 @@ void FuturesTdApi::processRspQryCombInstrumentGuard(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcCombInstrumentGuardField *task_data = (CThostFtdcCombInstrumentGuardField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["GuarantRatio"] = task_data->GuarantRatio;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_GuarantRatio] = task_data->GuarantRatio;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryCombInstrumentGuard(data, error, task->task_id, task->task_last);
 };
@@ -2324,45 +2324,45 @@ void FuturesTdApi::processRspQryCombAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcCombActionField *task_data = (CThostFtdcCombActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["CombActionRef"] = toUtf(task_data->CombActionRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Direction"] = task_data->Direction;
-		data["Volume"] = task_data->Volume;
-		data["CombDirection"] = task_data->CombDirection;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["ActionStatus"] = task_data->ActionStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		data["ComTradeID"] = toUtf(task_data->ComTradeID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_CombActionRef] = toUtf(task_data->CombActionRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_CombDirection] = task_data->CombDirection;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_ActionStatus] = task_data->ActionStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		data[KEY_ComTradeID] = toUtf(task_data->ComTradeID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryCombAction(data, error, task->task_id, task->task_last);
 };
@@ -2374,43 +2374,43 @@ void FuturesTdApi::processRspQryTransferSerial(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTransferSerialField *task_data = (CThostFtdcTransferSerialField*)task->task_data;
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["SessionID"] = task_data->SessionID;
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BankAccType"] = task_data->BankAccType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["FutureAccType"] = task_data->FutureAccType;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["AvailabilityFlag"] = task_data->AvailabilityFlag;
-		data["OperatorCode"] = toUtf(task_data->OperatorCode);
-		data["BankNewAccount"] = toUtf(task_data->BankNewAccount);
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		delete task_data;
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_FutureAccType] = task_data->FutureAccType;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_AvailabilityFlag] = task_data->AvailabilityFlag;
+		data[KEY_OperatorCode] = toUtf(task_data->OperatorCode);
+		data[KEY_BankNewAccount] = toUtf(task_data->BankNewAccount);
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTransferSerial(data, error, task->task_id, task->task_last);
 };
@@ -2422,33 +2422,33 @@ void FuturesTdApi::processRspQryAccountregister(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcAccountregisterField *task_data = (CThostFtdcAccountregisterField*)task->task_data;
-		data["TradeDay"] = toUtf(task_data->TradeDay);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["OpenOrDestroy"] = task_data->OpenOrDestroy;
-		data["RegDate"] = toUtf(task_data->RegDate);
-		data["OutDate"] = toUtf(task_data->OutDate);
-		data["TID"] = task_data->TID;
-		data["CustType"] = task_data->CustType;
-		data["BankAccType"] = task_data->BankAccType;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeDay] = toUtf(task_data->TradeDay);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_OpenOrDestroy] = task_data->OpenOrDestroy;
+		data[KEY_RegDate] = toUtf(task_data->RegDate);
+		data[KEY_OutDate] = toUtf(task_data->OutDate);
+		data[KEY_TID] = task_data->TID;
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryAccountregister(data, error, task->task_id, task->task_last);
 };
@@ -2460,25 +2460,25 @@ void FuturesTdApi::processRspForQuote(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputForQuoteField *task_data = (CThostFtdcInputForQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ForQuoteRef"] = toUtf(task_data->ForQuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ForQuoteRef] = toUtf(task_data->ForQuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspForQuote(data, error, task->task_id, task->task_last);
 };
@@ -2490,9 +2490,9 @@ void FuturesTdApi::processRspError(Task *task)
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspError(error, task->task_id, task->task_last);
 };
@@ -2504,70 +2504,70 @@ void FuturesTdApi::processRtnOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOrderField *task_data = (CThostFtdcOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["OrderSource"] = task_data->OrderSource;
-		data["OrderStatus"] = task_data->OrderStatus;
-		data["OrderType"] = task_data->OrderType;
-		data["VolumeTraded"] = task_data->VolumeTraded;
-		data["VolumeTotal"] = task_data->VolumeTotal;
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ActiveTime"] = toUtf(task_data->ActiveTime);
-		data["SuspendTime"] = toUtf(task_data->SuspendTime);
-		data["UpdateTime"] = toUtf(task_data->UpdateTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ActiveTraderID"] = toUtf(task_data->ActiveTraderID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["RelativeOrderSysID"] = toUtf(task_data->RelativeOrderSysID);
-		data["ZCETotalTradedVolume"] = task_data->ZCETotalTradedVolume;
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_OrderLocalID] = toUtf(task_data->OrderLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_OrderSource] = task_data->OrderSource;
+		data[KEY_OrderStatus] = task_data->OrderStatus;
+		data[KEY_OrderType] = task_data->OrderType;
+		data[KEY_VolumeTraded] = task_data->VolumeTraded;
+		data[KEY_VolumeTotal] = task_data->VolumeTotal;
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ActiveTime] = toUtf(task_data->ActiveTime);
+		data[KEY_SuspendTime] = toUtf(task_data->SuspendTime);
+		data[KEY_UpdateTime] = toUtf(task_data->UpdateTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ActiveTraderID] = toUtf(task_data->ActiveTraderID);
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerOrderSeq] = task_data->BrokerOrderSeq;
+		data[KEY_RelativeOrderSysID] = toUtf(task_data->RelativeOrderSysID);
+		data[KEY_ZCETotalTradedVolume] = task_data->ZCETotalTradedVolume;
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	this->onRtnOrder(data);
 };
@@ -2579,38 +2579,38 @@ void FuturesTdApi::processRtnTrade(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradeField *task_data = (CThostFtdcTradeField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["Direction"] = task_data->Direction;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["TradingRole"] = task_data->TradingRole;
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["Price"] = task_data->Price;
-		data["Volume"] = task_data->Volume;
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["TradeType"] = task_data->TradeType;
-		data["PriceSource"] = task_data->PriceSource;
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["TradeSource"] = task_data->TradeSource;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_TradeID] = toUtf(task_data->TradeID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_TradingRole] = task_data->TradingRole;
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_Price] = task_data->Price;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_TradeType] = task_data->TradeType;
+		data[KEY_PriceSource] = task_data->PriceSource;
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_OrderLocalID] = toUtf(task_data->OrderLocalID);
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_BrokerOrderSeq] = task_data->BrokerOrderSeq;
+		data[KEY_TradeSource] = task_data->TradeSource;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	this->onRtnTrade(data);
 };
@@ -2622,45 +2622,45 @@ void FuturesTdApi::processErrRtnOrderInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputOrderField *task_data = (CThostFtdcInputOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnOrderInsert(data, error);
 };
@@ -2672,44 +2672,44 @@ void FuturesTdApi::processErrRtnOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOrderActionField *task_data = (CThostFtdcOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OrderActionRef"] = task_data->OrderActionRef;
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeChange"] = task_data->VolumeChange;
-		data["ActionDate"] = toUtf(task_data->ActionDate);
-		data["ActionTime"] = toUtf(task_data->ActionTime);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OrderActionStatus"] = task_data->OrderActionStatus;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OrderActionRef] = task_data->OrderActionRef;
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeChange] = task_data->VolumeChange;
+		data[KEY_ActionDate] = toUtf(task_data->ActionDate);
+		data[KEY_ActionTime] = toUtf(task_data->ActionTime);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderLocalID] = toUtf(task_data->OrderLocalID);
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OrderActionStatus] = task_data->OrderActionStatus;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnOrderAction(data, error);
 };
@@ -2721,15 +2721,15 @@ void FuturesTdApi::processRtnInstrumentStatus(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInstrumentStatusField *task_data = (CThostFtdcInstrumentStatusField*)task->task_data;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["SettlementGroupID"] = toUtf(task_data->SettlementGroupID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InstrumentStatus"] = task_data->InstrumentStatus;
-		data["TradingSegmentSN"] = task_data->TradingSegmentSN;
-		data["EnterTime"] = toUtf(task_data->EnterTime);
-		data["EnterReason"] = task_data->EnterReason;
-		delete task_data;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_SettlementGroupID] = toUtf(task_data->SettlementGroupID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InstrumentStatus] = task_data->InstrumentStatus;
+		data[KEY_TradingSegmentSN] = task_data->TradingSegmentSN;
+		data[KEY_EnterTime] = toUtf(task_data->EnterTime);
+		data[KEY_EnterReason] = task_data->EnterReason;
+		releaseTaskData(task_data);
 	}
 	this->onRtnInstrumentStatus(data);
 };
@@ -2741,19 +2741,19 @@ void FuturesTdApi::processRtnBulletin(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcBulletinField *task_data = (CThostFtdcBulletinField*)task->task_data;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["BulletinID"] = task_data->BulletinID;
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["NewsType"] = toUtf(task_data->NewsType);
-		data["NewsUrgency"] = task_data->NewsUrgency;
-		data["SendTime"] = toUtf(task_data->SendTime);
-		data["Abstract"] = toUtf(task_data->Abstract);
-		data["ComeFrom"] = toUtf(task_data->ComeFrom);
-		data["Content"] = toUtf(task_data->Content);
-		data["URLLink"] = toUtf(task_data->URLLink);
-		data["MarketID"] = toUtf(task_data->MarketID);
-		delete task_data;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_BulletinID] = task_data->BulletinID;
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_NewsType] = toUtf(task_data->NewsType);
+		data[KEY_NewsUrgency] = task_data->NewsUrgency;
+		data[KEY_SendTime] = toUtf(task_data->SendTime);
+		data[KEY_Abstract] = toUtf(task_data->Abstract);
+		data[KEY_ComeFrom] = toUtf(task_data->ComeFrom);
+		data[KEY_Content] = toUtf(task_data->Content);
+		data[KEY_URLLink] = toUtf(task_data->URLLink);
+		data[KEY_MarketID] = toUtf(task_data->MarketID);
+		releaseTaskData(task_data);
 	}
 	this->onRtnBulletin(data);
 };
@@ -2765,14 +2765,14 @@ void FuturesTdApi::processRtnTradingNotice(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradingNoticeInfoField *task_data = (CThostFtdcTradingNoticeInfoField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["SendTime"] = toUtf(task_data->SendTime);
-		data["FieldContent"] = toUtf(task_data->FieldContent);
-		data["SequenceSeries"] = task_data->SequenceSeries;
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_SendTime] = toUtf(task_data->SendTime);
+		data[KEY_FieldContent] = toUtf(task_data->FieldContent);
+		data[KEY_SequenceSeries] = task_data->SequenceSeries;
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	this->onRtnTradingNotice(data);
 };
@@ -2784,72 +2784,72 @@ void FuturesTdApi::processRtnErrorConditionalOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcErrorConditionalOrderField *task_data = (CThostFtdcErrorConditionalOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["OrderSource"] = task_data->OrderSource;
-		data["OrderStatus"] = task_data->OrderStatus;
-		data["OrderType"] = task_data->OrderType;
-		data["VolumeTraded"] = task_data->VolumeTraded;
-		data["VolumeTotal"] = task_data->VolumeTotal;
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ActiveTime"] = toUtf(task_data->ActiveTime);
-		data["SuspendTime"] = toUtf(task_data->SuspendTime);
-		data["UpdateTime"] = toUtf(task_data->UpdateTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ActiveTraderID"] = toUtf(task_data->ActiveTraderID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["RelativeOrderSysID"] = toUtf(task_data->RelativeOrderSysID);
-		data["ZCETotalTradedVolume"] = task_data->ZCETotalTradedVolume;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_OrderLocalID] = toUtf(task_data->OrderLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_OrderSource] = task_data->OrderSource;
+		data[KEY_OrderStatus] = task_data->OrderStatus;
+		data[KEY_OrderType] = task_data->OrderType;
+		data[KEY_VolumeTraded] = task_data->VolumeTraded;
+		data[KEY_VolumeTotal] = task_data->VolumeTotal;
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ActiveTime] = toUtf(task_data->ActiveTime);
+		data[KEY_SuspendTime] = toUtf(task_data->SuspendTime);
+		data[KEY_UpdateTime] = toUtf(task_data->UpdateTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ActiveTraderID] = toUtf(task_data->ActiveTraderID);
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerOrderSeq] = task_data->BrokerOrderSeq;
+		data[KEY_RelativeOrderSysID] = toUtf(task_data->RelativeOrderSysID);
+		data[KEY_ZCETotalTradedVolume] = task_data->ZCETotalTradedVolume;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	this->onRtnErrorConditionalOrder(data);
 };
@@ -2861,51 +2861,51 @@ void FuturesTdApi::processRtnExecOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExecOrderField *task_data = (CThostFtdcExecOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExecOrderRef"] = toUtf(task_data->ExecOrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ActionType"] = task_data->ActionType;
-		data["PosiDirection"] = task_data->PosiDirection;
-		data["ReservePositionFlag"] = task_data->ReservePositionFlag;
-		data["CloseFlag"] = task_data->CloseFlag;
-		data["ExecOrderLocalID"] = toUtf(task_data->ExecOrderLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["ExecOrderSysID"] = toUtf(task_data->ExecOrderSysID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ExecResult"] = task_data->ExecResult;
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerExecOrderSeq"] = task_data->BrokerExecOrderSeq;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ExecOrderRef] = toUtf(task_data->ExecOrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ActionType] = task_data->ActionType;
+		data[KEY_PosiDirection] = task_data->PosiDirection;
+		data[KEY_ReservePositionFlag] = task_data->ReservePositionFlag;
+		data[KEY_CloseFlag] = task_data->CloseFlag;
+		data[KEY_ExecOrderLocalID] = toUtf(task_data->ExecOrderLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_ExecOrderSysID] = toUtf(task_data->ExecOrderSysID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ExecResult] = task_data->ExecResult;
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerExecOrderSeq] = task_data->BrokerExecOrderSeq;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	this->onRtnExecOrder(data);
 };
@@ -2917,36 +2917,36 @@ void FuturesTdApi::processErrRtnExecOrderInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputExecOrderField *task_data = (CThostFtdcInputExecOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExecOrderRef"] = toUtf(task_data->ExecOrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ActionType"] = task_data->ActionType;
-		data["PosiDirection"] = task_data->PosiDirection;
-		data["ReservePositionFlag"] = task_data->ReservePositionFlag;
-		data["CloseFlag"] = task_data->CloseFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ExecOrderRef] = toUtf(task_data->ExecOrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ActionType] = task_data->ActionType;
+		data[KEY_PosiDirection] = task_data->PosiDirection;
+		data[KEY_ReservePositionFlag] = task_data->ReservePositionFlag;
+		data[KEY_CloseFlag] = task_data->CloseFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnExecOrderInsert(data, error);
 };
@@ -2958,43 +2958,43 @@ void FuturesTdApi::processErrRtnExecOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExecOrderActionField *task_data = (CThostFtdcExecOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ExecOrderActionRef"] = task_data->ExecOrderActionRef;
-		data["ExecOrderRef"] = toUtf(task_data->ExecOrderRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ExecOrderSysID"] = toUtf(task_data->ExecOrderSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["ActionDate"] = toUtf(task_data->ActionDate);
-		data["ActionTime"] = toUtf(task_data->ActionTime);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["ExecOrderLocalID"] = toUtf(task_data->ExecOrderLocalID);
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OrderActionStatus"] = task_data->OrderActionStatus;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ActionType"] = task_data->ActionType;
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ExecOrderActionRef] = task_data->ExecOrderActionRef;
+		data[KEY_ExecOrderRef] = toUtf(task_data->ExecOrderRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ExecOrderSysID] = toUtf(task_data->ExecOrderSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_ActionDate] = toUtf(task_data->ActionDate);
+		data[KEY_ActionTime] = toUtf(task_data->ActionTime);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_ExecOrderLocalID] = toUtf(task_data->ExecOrderLocalID);
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OrderActionStatus] = task_data->OrderActionStatus;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ActionType] = task_data->ActionType;
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnExecOrderAction(data, error);
 };
@@ -3006,25 +3006,25 @@ void FuturesTdApi::processErrRtnForQuoteInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputForQuoteField *task_data = (CThostFtdcInputForQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ForQuoteRef"] = toUtf(task_data->ForQuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ForQuoteRef] = toUtf(task_data->ForQuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnForQuoteInsert(data, error);
 };
@@ -3036,57 +3036,57 @@ void FuturesTdApi::processRtnQuote(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcQuoteField *task_data = (CThostFtdcQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["QuoteRef"] = toUtf(task_data->QuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["AskPrice"] = task_data->AskPrice;
-		data["BidPrice"] = task_data->BidPrice;
-		data["AskVolume"] = task_data->AskVolume;
-		data["BidVolume"] = task_data->BidVolume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["AskOffsetFlag"] = task_data->AskOffsetFlag;
-		data["BidOffsetFlag"] = task_data->BidOffsetFlag;
-		data["AskHedgeFlag"] = task_data->AskHedgeFlag;
-		data["BidHedgeFlag"] = task_data->BidHedgeFlag;
-		data["QuoteLocalID"] = toUtf(task_data->QuoteLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["QuoteSysID"] = toUtf(task_data->QuoteSysID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["QuoteStatus"] = task_data->QuoteStatus;
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["AskOrderSysID"] = toUtf(task_data->AskOrderSysID);
-		data["BidOrderSysID"] = toUtf(task_data->BidOrderSysID);
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerQuoteSeq"] = task_data->BrokerQuoteSeq;
-		data["AskOrderRef"] = toUtf(task_data->AskOrderRef);
-		data["BidOrderRef"] = toUtf(task_data->BidOrderRef);
-		data["ForQuoteSysID"] = toUtf(task_data->ForQuoteSysID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_QuoteRef] = toUtf(task_data->QuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_AskPrice] = task_data->AskPrice;
+		data[KEY_BidPrice] = task_data->BidPrice;
+		data[KEY_AskVolume] = task_data->AskVolume;
+		data[KEY_BidVolume] = task_data->BidVolume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_AskOffsetFlag] = task_data->AskOffsetFlag;
+		data[KEY_BidOffsetFlag] = task_data->BidOffsetFlag;
+		data[KEY_AskHedgeFlag] = task_data->AskHedgeFlag;
+		data[KEY_BidHedgeFlag] = task_data->BidHedgeFlag;
+		data[KEY_QuoteLocalID] = toUtf(task_data->QuoteLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_QuoteSysID] = toUtf(task_data->QuoteSysID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_QuoteStatus] = task_data->QuoteStatus;
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_AskOrderSysID] = toUtf(task_data->AskOrderSysID);
+		data[KEY_BidOrderSysID] = toUtf(task_data->BidOrderSysID);
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerQuoteSeq] = task_data->BrokerQuoteSeq;
+		data[KEY_AskOrderRef] = toUtf(task_data->AskOrderRef);
+		data[KEY_BidOrderRef] = toUtf(task_data->BidOrderRef);
+		data[KEY_ForQuoteSysID] = toUtf(task_data->ForQuoteSysID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	this->onRtnQuote(data);
 };
@@ -3098,38 +3098,38 @@ void FuturesTdApi::processErrRtnQuoteInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputQuoteField *task_data = (CThostFtdcInputQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["QuoteRef"] = toUtf(task_data->QuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["AskPrice"] = task_data->AskPrice;
-		data["BidPrice"] = task_data->BidPrice;
-		data["AskVolume"] = task_data->AskVolume;
-		data["BidVolume"] = task_data->BidVolume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["AskOffsetFlag"] = task_data->AskOffsetFlag;
-		data["BidOffsetFlag"] = task_data->BidOffsetFlag;
-		data["AskHedgeFlag"] = task_data->AskHedgeFlag;
-		data["BidHedgeFlag"] = task_data->BidHedgeFlag;
-		data["AskOrderRef"] = toUtf(task_data->AskOrderRef);
-		data["BidOrderRef"] = toUtf(task_data->BidOrderRef);
-		data["ForQuoteSysID"] = toUtf(task_data->ForQuoteSysID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_QuoteRef] = toUtf(task_data->QuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_AskPrice] = task_data->AskPrice;
+		data[KEY_BidPrice] = task_data->BidPrice;
+		data[KEY_AskVolume] = task_data->AskVolume;
+		data[KEY_BidVolume] = task_data->BidVolume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_AskOffsetFlag] = task_data->AskOffsetFlag;
+		data[KEY_BidOffsetFlag] = task_data->BidOffsetFlag;
+		data[KEY_AskHedgeFlag] = task_data->AskHedgeFlag;
+		data[KEY_BidHedgeFlag] = task_data->BidHedgeFlag;
+		data[KEY_AskOrderRef] = toUtf(task_data->AskOrderRef);
+		data[KEY_BidOrderRef] = toUtf(task_data->BidOrderRef);
+		data[KEY_ForQuoteSysID] = toUtf(task_data->ForQuoteSysID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnQuoteInsert(data, error);
 };
@@ -3141,42 +3141,42 @@ void FuturesTdApi::processErrRtnQuoteAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcQuoteActionField *task_data = (CThostFtdcQuoteActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["QuoteActionRef"] = task_data->QuoteActionRef;
-		data["QuoteRef"] = toUtf(task_data->QuoteRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["QuoteSysID"] = toUtf(task_data->QuoteSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["ActionDate"] = toUtf(task_data->ActionDate);
-		data["ActionTime"] = toUtf(task_data->ActionTime);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["QuoteLocalID"] = toUtf(task_data->QuoteLocalID);
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OrderActionStatus"] = task_data->OrderActionStatus;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_QuoteActionRef] = task_data->QuoteActionRef;
+		data[KEY_QuoteRef] = toUtf(task_data->QuoteRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_QuoteSysID] = toUtf(task_data->QuoteSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_ActionDate] = toUtf(task_data->ActionDate);
+		data[KEY_ActionTime] = toUtf(task_data->ActionTime);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_QuoteLocalID] = toUtf(task_data->QuoteLocalID);
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OrderActionStatus] = task_data->OrderActionStatus;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnQuoteAction(data, error);
 };
@@ -3188,13 +3188,13 @@ void FuturesTdApi::processRtnForQuote(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcForQuoteRspField *task_data = (CThostFtdcForQuoteRspField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ForQuoteSysID"] = toUtf(task_data->ForQuoteSysID);
-		data["ForQuoteTime"] = toUtf(task_data->ForQuoteTime);
-		data["ActionDay"] = toUtf(task_data->ActionDay);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ForQuoteSysID] = toUtf(task_data->ForQuoteSysID);
+		data[KEY_ForQuoteTime] = toUtf(task_data->ForQuoteTime);
+		data[KEY_ActionDay] = toUtf(task_data->ActionDay);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		releaseTaskData(task_data);
 	}
 	this->onRtnForQuote(data);
 };
@@ -3206,12 +3206,12 @@ void FuturesTdApi::processRtnCFMMCTradingAccountToken(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcCFMMCTradingAccountTokenField *task_data = (CThostFtdcCFMMCTradingAccountTokenField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["KeyID"] = task_data->KeyID;
-		data["Token"] = toUtf(task_data->Token);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_KeyID] = task_data->KeyID;
+		data[KEY_Token] = toUtf(task_data->Token);
+		releaseTaskData(task_data);
 	}
 	this->onRtnCFMMCTradingAccountToken(data);
 };
@@ -3223,36 +3223,36 @@ void FuturesTdApi::processErrRtnBatchOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcBatchOrderActionField *task_data = (CThostFtdcBatchOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OrderActionRef"] = task_data->OrderActionRef;
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ActionDate"] = toUtf(task_data->ActionDate);
-		data["ActionTime"] = toUtf(task_data->ActionTime);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OrderActionStatus"] = task_data->OrderActionStatus;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OrderActionRef] = task_data->OrderActionRef;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ActionDate] = toUtf(task_data->ActionDate);
+		data[KEY_ActionTime] = toUtf(task_data->ActionTime);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OrderActionStatus] = task_data->OrderActionStatus;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnBatchOrderAction(data, error);
 };
@@ -3264,47 +3264,47 @@ void FuturesTdApi::processRtnOptionSelfClose(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOptionSelfCloseField *task_data = (CThostFtdcOptionSelfCloseField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OptionSelfCloseRef"] = toUtf(task_data->OptionSelfCloseRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["OptSelfCloseFlag"] = task_data->OptSelfCloseFlag;
-		data["OptionSelfCloseLocalID"] = toUtf(task_data->OptionSelfCloseLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OptionSelfCloseSysID"] = toUtf(task_data->OptionSelfCloseSysID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ExecResult"] = task_data->ExecResult;
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerOptionSelfCloseSeq"] = task_data->BrokerOptionSelfCloseSeq;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OptionSelfCloseRef] = toUtf(task_data->OptionSelfCloseRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_OptSelfCloseFlag] = task_data->OptSelfCloseFlag;
+		data[KEY_OptionSelfCloseLocalID] = toUtf(task_data->OptionSelfCloseLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_OptionSelfCloseSysID] = toUtf(task_data->OptionSelfCloseSysID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ExecResult] = task_data->ExecResult;
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerOptionSelfCloseSeq] = task_data->BrokerOptionSelfCloseSeq;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	this->onRtnOptionSelfClose(data);
 };
@@ -3316,32 +3316,32 @@ void FuturesTdApi::processErrRtnOptionSelfCloseInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputOptionSelfCloseField *task_data = (CThostFtdcInputOptionSelfCloseField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OptionSelfCloseRef"] = toUtf(task_data->OptionSelfCloseRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["OptSelfCloseFlag"] = task_data->OptSelfCloseFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OptionSelfCloseRef] = toUtf(task_data->OptionSelfCloseRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_OptSelfCloseFlag] = task_data->OptSelfCloseFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnOptionSelfCloseInsert(data, error);
 };
@@ -3353,42 +3353,42 @@ void FuturesTdApi::processErrRtnOptionSelfCloseAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOptionSelfCloseActionField *task_data = (CThostFtdcOptionSelfCloseActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OptionSelfCloseActionRef"] = task_data->OptionSelfCloseActionRef;
-		data["OptionSelfCloseRef"] = toUtf(task_data->OptionSelfCloseRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["OptionSelfCloseSysID"] = toUtf(task_data->OptionSelfCloseSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["ActionDate"] = toUtf(task_data->ActionDate);
-		data["ActionTime"] = toUtf(task_data->ActionTime);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OptionSelfCloseLocalID"] = toUtf(task_data->OptionSelfCloseLocalID);
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OrderActionStatus"] = task_data->OrderActionStatus;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OptionSelfCloseActionRef] = task_data->OptionSelfCloseActionRef;
+		data[KEY_OptionSelfCloseRef] = toUtf(task_data->OptionSelfCloseRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_OptionSelfCloseSysID] = toUtf(task_data->OptionSelfCloseSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_ActionDate] = toUtf(task_data->ActionDate);
+		data[KEY_ActionTime] = toUtf(task_data->ActionTime);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OptionSelfCloseLocalID] = toUtf(task_data->OptionSelfCloseLocalID);
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OrderActionStatus] = task_data->OrderActionStatus;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnOptionSelfCloseAction(data, error);
 };
@@ -3400,37 +3400,37 @@ void FuturesTdApi::processRtnCombAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcCombActionField *task_data = (CThostFtdcCombActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["CombActionRef"] = toUtf(task_data->CombActionRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Direction"] = task_data->Direction;
-		data["Volume"] = task_data->Volume;
-		data["CombDirection"] = task_data->CombDirection;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["ActionStatus"] = task_data->ActionStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		data["ComTradeID"] = toUtf(task_data->ComTradeID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_CombActionRef] = toUtf(task_data->CombActionRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_CombDirection] = task_data->CombDirection;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_ActionStatus] = task_data->ActionStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		data[KEY_ComTradeID] = toUtf(task_data->ComTradeID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	this->onRtnCombAction(data);
 };
@@ -3442,28 +3442,28 @@ void FuturesTdApi::processErrRtnCombActionInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputCombActionField *task_data = (CThostFtdcInputCombActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["CombActionRef"] = toUtf(task_data->CombActionRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Direction"] = task_data->Direction;
-		data["Volume"] = task_data->Volume;
-		data["CombDirection"] = task_data->CombDirection;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_CombActionRef] = toUtf(task_data->CombActionRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_CombDirection] = task_data->CombDirection;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnCombActionInsert(data, error);
 };
@@ -3475,19 +3475,19 @@ void FuturesTdApi::processRspQryContractBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcContractBankField *task_data = (CThostFtdcContractBankField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBrchID"] = toUtf(task_data->BankBrchID);
-		data["BankName"] = toUtf(task_data->BankName);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBrchID] = toUtf(task_data->BankBrchID);
+		data[KEY_BankName] = toUtf(task_data->BankName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryContractBank(data, error, task->task_id, task->task_last);
 };
@@ -3499,50 +3499,50 @@ void FuturesTdApi::processRspQryParkedOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcParkedOrderField *task_data = (CThostFtdcParkedOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParkedOrderID"] = toUtf(task_data->ParkedOrderID);
-		data["UserType"] = task_data->UserType;
-		data["Status"] = task_data->Status;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParkedOrderID] = toUtf(task_data->ParkedOrderID);
+		data[KEY_UserType] = task_data->UserType;
+		data[KEY_Status] = task_data->Status;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryParkedOrder(data, error, task->task_id, task->task_last);
 };
@@ -3554,37 +3554,37 @@ void FuturesTdApi::processRspQryParkedOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcParkedOrderActionField *task_data = (CThostFtdcParkedOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OrderActionRef"] = task_data->OrderActionRef;
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeChange"] = task_data->VolumeChange;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ParkedOrderActionID"] = toUtf(task_data->ParkedOrderActionID);
-		data["UserType"] = task_data->UserType;
-		data["Status"] = task_data->Status;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OrderActionRef] = task_data->OrderActionRef;
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeChange] = task_data->VolumeChange;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ParkedOrderActionID] = toUtf(task_data->ParkedOrderActionID);
+		data[KEY_UserType] = task_data->UserType;
+		data[KEY_Status] = task_data->Status;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryParkedOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -3596,24 +3596,24 @@ void FuturesTdApi::processRspQryTradingNotice(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradingNoticeField *task_data = (CThostFtdcTradingNoticeField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["SequenceSeries"] = task_data->SequenceSeries;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["SendTime"] = toUtf(task_data->SendTime);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FieldContent"] = toUtf(task_data->FieldContent);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_SequenceSeries] = task_data->SequenceSeries;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_SendTime] = toUtf(task_data->SendTime);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FieldContent] = toUtf(task_data->FieldContent);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTradingNotice(data, error, task->task_id, task->task_last);
 };
@@ -3625,23 +3625,23 @@ void FuturesTdApi::processRspQryBrokerTradingParams(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcBrokerTradingParamsField *task_data = (CThostFtdcBrokerTradingParamsField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["MarginPriceType"] = task_data->MarginPriceType;
-		data["Algorithm"] = task_data->Algorithm;
-		data["AvailIncludeCloseProfit"] = task_data->AvailIncludeCloseProfit;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["OptionRoyaltyPriceType"] = task_data->OptionRoyaltyPriceType;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_MarginPriceType] = task_data->MarginPriceType;
+		data[KEY_Algorithm] = task_data->Algorithm;
+		data[KEY_AvailIncludeCloseProfit] = task_data->AvailIncludeCloseProfit;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_OptionRoyaltyPriceType] = task_data->OptionRoyaltyPriceType;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryBrokerTradingParams(data, error, task->task_id, task->task_last);
 };
@@ -3653,21 +3653,21 @@ void FuturesTdApi::processRspQryBrokerTradingAlgos(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcBrokerTradingAlgosField *task_data = (CThostFtdcBrokerTradingAlgosField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["HandlePositionAlgoID"] = task_data->HandlePositionAlgoID;
-		data["FindMarginRateAlgoID"] = task_data->FindMarginRateAlgoID;
-		data["HandleTradingAccountAlgoID"] = task_data->HandleTradingAccountAlgoID;
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_HandlePositionAlgoID] = task_data->HandlePositionAlgoID;
+		data[KEY_FindMarginRateAlgoID] = task_data->FindMarginRateAlgoID;
+		data[KEY_HandleTradingAccountAlgoID] = task_data->HandleTradingAccountAlgoID;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryBrokerTradingAlgos(data, error, task->task_id, task->task_last);
 };
@@ -3679,18 +3679,18 @@ void FuturesTdApi::processRspQueryCFMMCTradingAccountToken(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcQueryCFMMCTradingAccountTokenField *task_data = (CThostFtdcQueryCFMMCTradingAccountTokenField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQueryCFMMCTradingAccountToken(data, error, task->task_id, task->task_last);
 };
@@ -3702,53 +3702,53 @@ void FuturesTdApi::processRtnFromBankToFutureByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspTransferField *task_data = (CThostFtdcRspTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnFromBankToFutureByBank(data);
 };
@@ -3760,53 +3760,53 @@ void FuturesTdApi::processRtnFromFutureToBankByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspTransferField *task_data = (CThostFtdcRspTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnFromFutureToBankByBank(data);
 };
@@ -3818,60 +3818,60 @@ void FuturesTdApi::processRtnRepealFromBankToFutureByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspRepealField *task_data = (CThostFtdcRspRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnRepealFromBankToFutureByBank(data);
 };
@@ -3883,60 +3883,60 @@ void FuturesTdApi::processRtnRepealFromFutureToBankByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspRepealField *task_data = (CThostFtdcRspRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnRepealFromFutureToBankByBank(data);
 };
@@ -3948,53 +3948,53 @@ void FuturesTdApi::processRtnFromBankToFutureByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspTransferField *task_data = (CThostFtdcRspTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnFromBankToFutureByFuture(data);
 };
@@ -4006,53 +4006,53 @@ void FuturesTdApi::processRtnFromFutureToBankByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspTransferField *task_data = (CThostFtdcRspTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnFromFutureToBankByFuture(data);
 };
@@ -4064,60 +4064,60 @@ void FuturesTdApi::processRtnRepealFromBankToFutureByFutureManual(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspRepealField *task_data = (CThostFtdcRspRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnRepealFromBankToFutureByFutureManual(data);
 };
@@ -4129,60 +4129,60 @@ void FuturesTdApi::processRtnRepealFromFutureToBankByFutureManual(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspRepealField *task_data = (CThostFtdcRspRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnRepealFromFutureToBankByFutureManual(data);
 };
@@ -4194,48 +4194,48 @@ void FuturesTdApi::processRtnQueryBankBalanceByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcNotifyQueryAccountField *task_data = (CThostFtdcNotifyQueryAccountField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["InstallID"] = task_data->InstallID;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["BankUseAmount"] = task_data->BankUseAmount;
-		data["BankFetchAmount"] = task_data->BankFetchAmount;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_BankUseAmount] = task_data->BankUseAmount;
+		data[KEY_BankFetchAmount] = task_data->BankFetchAmount;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnQueryBankBalanceByFuture(data);
 };
@@ -4247,59 +4247,59 @@ void FuturesTdApi::processErrRtnBankToFutureByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqTransferField *task_data = (CThostFtdcReqTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnBankToFutureByFuture(data, error);
 };
@@ -4311,59 +4311,59 @@ void FuturesTdApi::processErrRtnFutureToBankByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqTransferField *task_data = (CThostFtdcReqTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnFutureToBankByFuture(data, error);
 };
@@ -4375,66 +4375,66 @@ void FuturesTdApi::processErrRtnRepealBankToFutureByFutureManual(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqRepealField *task_data = (CThostFtdcReqRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnRepealBankToFutureByFutureManual(data, error);
 };
@@ -4446,66 +4446,66 @@ void FuturesTdApi::processErrRtnRepealFutureToBankByFutureManual(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqRepealField *task_data = (CThostFtdcReqRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnRepealFutureToBankByFutureManual(data, error);
 };
@@ -4517,52 +4517,52 @@ void FuturesTdApi::processErrRtnQueryBankBalanceByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqQueryAccountField *task_data = (CThostFtdcReqQueryAccountField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["InstallID"] = task_data->InstallID;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnQueryBankBalanceByFuture(data, error);
 };
@@ -4574,60 +4574,60 @@ void FuturesTdApi::processRtnRepealFromBankToFutureByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspRepealField *task_data = (CThostFtdcRspRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnRepealFromBankToFutureByFuture(data);
 };
@@ -4639,60 +4639,60 @@ void FuturesTdApi::processRtnRepealFromFutureToBankByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspRepealField *task_data = (CThostFtdcRspRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnRepealFromFutureToBankByFuture(data);
 };
@@ -4704,59 +4704,59 @@ void FuturesTdApi::processRspFromBankToFutureByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqTransferField *task_data = (CThostFtdcReqTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspFromBankToFutureByFuture(data, error, task->task_id, task->task_last);
 };
@@ -4768,59 +4768,59 @@ void FuturesTdApi::processRspFromFutureToBankByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqTransferField *task_data = (CThostFtdcReqTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspFromFutureToBankByFuture(data, error, task->task_id, task->task_last);
 };
@@ -4832,52 +4832,52 @@ void FuturesTdApi::processRspQueryBankAccountMoneyByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqQueryAccountField *task_data = (CThostFtdcReqQueryAccountField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["InstallID"] = task_data->InstallID;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQueryBankAccountMoneyByFuture(data, error, task->task_id, task->task_last);
 };
@@ -4889,54 +4889,54 @@ void FuturesTdApi::processRtnOpenAccountByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOpenAccountField *task_data = (CThostFtdcOpenAccountField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["Gender"] = task_data->Gender;
-		data["CountryCode"] = toUtf(task_data->CountryCode);
-		data["CustType"] = task_data->CustType;
-		data["Address"] = toUtf(task_data->Address);
-		data["ZipCode"] = toUtf(task_data->ZipCode);
-		data["Telephone"] = toUtf(task_data->Telephone);
-		data["MobilePhone"] = toUtf(task_data->MobilePhone);
-		data["Fax"] = toUtf(task_data->Fax);
-		data["EMail"] = toUtf(task_data->EMail);
-		data["MoneyAccountStatus"] = task_data->MoneyAccountStatus;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["CashExchangeCode"] = task_data->CashExchangeCode;
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["TID"] = task_data->TID;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_Gender] = task_data->Gender;
+		data[KEY_CountryCode] = toUtf(task_data->CountryCode);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_Address] = toUtf(task_data->Address);
+		data[KEY_ZipCode] = toUtf(task_data->ZipCode);
+		data[KEY_Telephone] = toUtf(task_data->Telephone);
+		data[KEY_MobilePhone] = toUtf(task_data->MobilePhone);
+		data[KEY_Fax] = toUtf(task_data->Fax);
+		data[KEY_EMail] = toUtf(task_data->EMail);
+		data[KEY_MoneyAccountStatus] = task_data->MoneyAccountStatus;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_CashExchangeCode] = task_data->CashExchangeCode;
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_TID] = task_data->TID;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnOpenAccountByBank(data);
 };
@@ -4948,54 +4948,54 @@ void FuturesTdApi::processRtnCancelAccountByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcCancelAccountField *task_data = (CThostFtdcCancelAccountField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["Gender"] = task_data->Gender;
-		data["CountryCode"] = toUtf(task_data->CountryCode);
-		data["CustType"] = task_data->CustType;
-		data["Address"] = toUtf(task_data->Address);
-		data["ZipCode"] = toUtf(task_data->ZipCode);
-		data["Telephone"] = toUtf(task_data->Telephone);
-		data["MobilePhone"] = toUtf(task_data->MobilePhone);
-		data["Fax"] = toUtf(task_data->Fax);
-		data["EMail"] = toUtf(task_data->EMail);
-		data["MoneyAccountStatus"] = task_data->MoneyAccountStatus;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["CashExchangeCode"] = task_data->CashExchangeCode;
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["TID"] = task_data->TID;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_Gender] = task_data->Gender;
+		data[KEY_CountryCode] = toUtf(task_data->CountryCode);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_Address] = toUtf(task_data->Address);
+		data[KEY_ZipCode] = toUtf(task_data->ZipCode);
+		data[KEY_Telephone] = toUtf(task_data->Telephone);
+		data[KEY_MobilePhone] = toUtf(task_data->MobilePhone);
+		data[KEY_Fax] = toUtf(task_data->Fax);
+		data[KEY_EMail] = toUtf(task_data->EMail);
+		data[KEY_MoneyAccountStatus] = task_data->MoneyAccountStatus;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_CashExchangeCode] = task_data->CashExchangeCode;
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_TID] = task_data->TID;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnCancelAccountByBank(data);
 };
@@ -5007,50 +5007,50 @@ void FuturesTdApi::processRtnChangeAccountByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcChangeAccountField *task_data = (CThostFtdcChangeAccountField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["Gender"] = task_data->Gender;
-		data["CountryCode"] = toUtf(task_data->CountryCode);
-		data["CustType"] = task_data->CustType;
-		data["Address"] = toUtf(task_data->Address);
-		data["ZipCode"] = toUtf(task_data->ZipCode);
-		data["Telephone"] = toUtf(task_data->Telephone);
-		data["MobilePhone"] = toUtf(task_data->MobilePhone);
-		data["Fax"] = toUtf(task_data->Fax);
-		data["EMail"] = toUtf(task_data->EMail);
-		data["MoneyAccountStatus"] = task_data->MoneyAccountStatus;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["NewBankAccount"] = toUtf(task_data->NewBankAccount);
-		data["NewBankPassWord"] = toUtf(task_data->NewBankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["BankAccType"] = task_data->BankAccType;
-		data["InstallID"] = task_data->InstallID;
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["TID"] = task_data->TID;
-		data["Digest"] = toUtf(task_data->Digest);
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_Gender] = task_data->Gender;
+		data[KEY_CountryCode] = toUtf(task_data->CountryCode);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_Address] = toUtf(task_data->Address);
+		data[KEY_ZipCode] = toUtf(task_data->ZipCode);
+		data[KEY_Telephone] = toUtf(task_data->Telephone);
+		data[KEY_MobilePhone] = toUtf(task_data->MobilePhone);
+		data[KEY_Fax] = toUtf(task_data->Fax);
+		data[KEY_EMail] = toUtf(task_data->EMail);
+		data[KEY_MoneyAccountStatus] = task_data->MoneyAccountStatus;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_NewBankAccount] = toUtf(task_data->NewBankAccount);
+		data[KEY_NewBankPassWord] = toUtf(task_data->NewBankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnChangeAccountByBank(data);
 };
@@ -27,13 +27,13 @@ void FuturesTdApi::OnRspAuthenticate(CThostFtdcRspAuthenticateField *pRspAuthent
 	task.task_name = ONRSPAUTHENTICATE;
 	if (pRspAuthenticateField)
 	{
-		CThostFtdcRspAuthenticateField *task_data = new CThostFtdcRspAuthenticateField();
+		CThostFtdcRspAuthenticateField *task_data = createTaskData<CThostFtdcRspAuthenticateField>();
 		*task_data = *pRspAuthenticateField;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -48,13 +48,13 @@ void FuturesTdApi::OnRspUserLogin(CThostFtdcRspUserLoginField *pRspUserLogin, CT
 	task.task_name = ONRSPUSERLOGIN;
 	if (pRspUserLogin)
 	{
-		CThostFtdcRspUserLoginField *task_data = new CThostFtdcRspUserLoginField();
+		CThostFtdcRspUserLoginField *task_data = createTaskData<CThostFtdcRspUserLoginField>();
 		*task_data = *pRspUserLogin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -69,13 +69,13 @@ void FuturesTdApi::OnRspUserLogout(CThostFtdcUserLogoutField *pUserLogout, CThos
 	task.task_name = ONRSPUSERLOGOUT;
 	if (pUserLogout)
 	{
-		CThostFtdcUserLogoutField *task_data = new CThostFtdcUserLogoutField();
+		CThostFtdcUserLogoutField *task_data = createTaskData<CThostFtdcUserLogoutField>();
 		*task_data = *pUserLogout;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -90,13 +90,13 @@ void FuturesTdApi::OnRspUserPasswordUpdate(CThostFtdcUserPasswordUpdateField *pU
 	task.task_name = ONRSPUSERPASSWORDUPDATE;
 	if (pUserPasswordUpdate)
 	{
-		CThostFtdcUserPasswordUpdateField *task_data = new CThostFtdcUserPasswordUpdateField();
+		CThostFtdcUserPasswordUpdateField *task_data = createTaskData<CThostFtdcUserPasswordUpdateField>();
 		*task_data = *pUserPasswordUpdate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -111,13 +111,13 @@ void FuturesTdApi::OnRspTradingAccountPasswordUpdate(CThostFtdcTradingAccountPas
 	task.task_name = ONRSPTRADINGACCOUNTPASSWORDUPDATE;
 	if (pTradingAccountPasswordUpdate)
 	{
-		CThostFtdcTradingAccountPasswordUpdateField *task_data = new CThostFtdcTradingAccountPasswordUpdateField();
+		CThostFtdcTradingAccountPasswordUpdateField *task_data = createTaskData<CThostFtdcTradingAccountPasswordUpdateField>();
 		*task_data = *pTradingAccountPasswordUpdate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -132,13 +132,13 @@ void FuturesTdApi::OnRspOrderInsert(CThostFtdcInputOrderField *pInputOrder, CTho
 	task.task_name = ONRSPORDERINSERT;
 	if (pInputOrder)
 	{
-		CThostFtdcInputOrderField *task_data = new CThostFtdcInputOrderField();
+		CThostFtdcInputOrderField *task_data = createTaskData<CThostFtdcInputOrderField>();
 		*task_data = *pInputOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -153,13 +153,13 @@ void FuturesTdApi::OnRspParkedOrderInsert(CThostFtdcParkedOrderField *pParkedOrd
 	task.task_name = ONRSPPARKEDORDERINSERT;
 	if (pParkedOrder)
 	{
-		CThostFtdcParkedOrderField *task_data = new CThostFtdcParkedOrderField();
+		CThostFtdcParkedOrderField *task_data = createTaskData<CThostFtdcParkedOrderField>();
 		*task_data = *pParkedOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -174,13 +174,13 @@ void FuturesTdApi::OnRspParkedOrderAction(CThostFtdcParkedOrderActionField *pPar
 	task.task_name = ONRSPPARKEDORDERACTION;
 	if (pParkedOrderAction)
 	{
-		CThostFtdcParkedOrderActionField *task_data = new CThostFtdcParkedOrderActionField();
+		CThostFtdcParkedOrderActionField *task_data = createTaskData<CThostFtdcParkedOrderActionField>();
 		*task_data = *pParkedOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -195,13 +195,13 @@ void FuturesTdApi::OnRspOrderAction(CThostFtdcInputOrderActionField *pInputOrder
 	task.task_name = ONRSPORDERACTION;
 	if (pInputOrderAction)
 	{
-		CThostFtdcInputOrderActionField *task_data = new CThostFtdcInputOrderActionField();
+		CThostFtdcInputOrderActionField *task_data = createTaskData<CThostFtdcInputOrderActionField>();
 		*task_data = *pInputOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -216,13 +216,13 @@ void FuturesTdApi::OnRspQueryMaxOrderVolume(CThostFtdcQueryMaxOrderVolumeField *
 	task.task_name = ONRSPQUERYMAXORDERVOLUME;
 	if (pQueryMaxOrderVolume)
 	{
-		CThostFtdcQueryMaxOrderVolumeField *task_data = new CThostFtdcQueryMaxOrderVolumeField();
+		CThostFtdcQueryMaxOrderVolumeField *task_data = createTaskData<CThostFtdcQueryMaxOrderVolumeField>();
 		*task_data = *pQueryMaxOrderVolume;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -237,13 +237,13 @@ void FuturesTdApi::OnRspSettlementInfoConfirm(CThostFtdcSettlementInfoConfirmFie
 	task.task_name = ONRSPSETTLEMENTINFOCONFIRM;
 	if (pSettlementInfoConfirm)
 	{
-		CThostFtdcSettlementInfoConfirmField *task_data = new CThostFtdcSettlementInfoConfirmField();
+		CThostFtdcSettlementInfoConfirmField *task_data = createTaskData<CThostFtdcSettlementInfoConfirmField>();
 		*task_data = *pSettlementInfoConfirm;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -258,13 +258,13 @@ void FuturesTdApi::OnRspRemoveParkedOrder(CThostFtdcRemoveParkedOrderField *pRem
 	task.task_name = ONRSPREMOVEPARKEDORDER;
 	if (pRemoveParkedOrder)
 	{
-		CThostFtdcRemoveParkedOrderField *task_data = new CThostFtdcRemoveParkedOrderField();
+		CThostFtdcRemoveParkedOrderField *task_data = createTaskData<CThostFtdcRemoveParkedOrderField>();
 		*task_data = *pRemoveParkedOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -279,13 +279,13 @@ void FuturesTdApi::OnRspRemoveParkedOrderAction(CThostFtdcRemoveParkedOrderActio
 	task.task_name = ONRSPREMOVEPARKEDORDERACTION;
 	if (pRemoveParkedOrderAction)
 	{
-		CThostFtdcRemoveParkedOrderActionField *task_data = new CThostFtdcRemoveParkedOrderActionField();
+		CThostFtdcRemoveParkedOrderActionField *task_data = createTaskData<CThostFtdcRemoveParkedOrderActionField>();
 		*task_data = *pRemoveParkedOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -300,13 +300,13 @@ void FuturesTdApi::OnRspExecOrderInsert(CThostFtdcInputExecOrderField *pInputExe
 	task.task_name = ONRSPEXECORDERINSERT;
 	if (pInputExecOrder)
 	{
-		CThostFtdcInputExecOrderField *task_data = new CThostFtdcInputExecOrderField();
+		CThostFtdcInputExecOrderField *task_data = createTaskData<CThostFtdcInputExecOrderField>();
 		*task_data = *pInputExecOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -321,13 +321,13 @@ void FuturesTdApi::OnRspExecOrderAction(CThostFtdcInputExecOrderActionField *pIn
 	task.task_name = ONRSPEXECORDERACTION;
 	if (pInputExecOrderAction)
 	{
-		CThostFtdcInputExecOrderActionField *task_data = new CThostFtdcInputExecOrderActionField();
+		CThostFtdcInputExecOrderActionField *task_data = createTaskData<CThostFtdcInputExecOrderActionField>();
 		*task_data = *pInputExecOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -342,13 +342,13 @@ void FuturesTdApi::OnRspForQuoteInsert(CThostFtdcInputForQuoteField *pInputForQu
 	task.task_name = ONRSPFORQUOTEINSERT;
 	if (pInputForQuote)
 	{
-		CThostFtdcInputForQuoteField *task_data = new CThostFtdcInputForQuoteField();
+		CThostFtdcInputForQuoteField *task_data = createTaskData<CThostFtdcInputForQuoteField>();
 		*task_data = *pInputForQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -363,13 +363,13 @@ void FuturesTdApi::OnRspQuoteInsert(CThostFtdcInputQuoteField *pInputQuote, CTho
 	task.task_name = ONRSPQUOTEINSERT;
 	if (pInputQuote)
 	{
-		CThostFtdcInputQuoteField *task_data = new CThostFtdcInputQuoteField();
+		CThostFtdcInputQuoteField *task_data = createTaskData<CThostFtdcInputQuoteField>();
 		*task_data = *pInputQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -384,13 +384,13 @@ void FuturesTdApi::OnRspQuoteAction(CThostFtdcInputQuoteActionField *pInputQuote
 	task.task_name = ONRSPQUOTEACTION;
 	if (pInputQuoteAction)
 	{
-		CThostFtdcInputQuoteActionField *task_data = new CThostFtdcInputQuoteActionField();
+		CThostFtdcInputQuoteActionField *task_data = createTaskData<CThostFtdcInputQuoteActionField>();
 		*task_data = *pInputQuoteAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -405,13 +405,13 @@ void FuturesTdApi::OnRspBatchOrderAction(CThostFtdcInputBatchOrderActionField *p
 	task.task_name = ONRSPBATCHORDERACTION;
 	if (pInputBatchOrderAction)
 	{
-		CThostFtdcInputBatchOrderActionField *task_data = new CThostFtdcInputBatchOrderActionField();
+		CThostFtdcInputBatchOrderActionField *task_data = createTaskData<CThostFtdcInputBatchOrderActionField>();
 		*task_data = *pInputBatchOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -426,13 +426,13 @@ void FuturesTdApi::OnRspOptionSelfCloseInsert(CThostFtdcInputOptionSelfCloseFiel
 	task.task_name = ONRSPOPTIONSELFCLOSEINSERT;
 	if (pInputOptionSelfClose)
 	{
-		CThostFtdcInputOptionSelfCloseField *task_data = new CThostFtdcInputOptionSelfCloseField();
+		CThostFtdcInputOptionSelfCloseField *task_data = createTaskData<CThostFtdcInputOptionSelfCloseField>();
 		*task_data = *pInputOptionSelfClose;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -447,13 +447,13 @@ void FuturesTdApi::OnRspOptionSelfCloseAction(CThostFtdcInputOptionSelfCloseActi
 	task.task_name = ONRSPOPTIONSELFCLOSEACTION;
 	if (pInputOptionSelfCloseAction)
 	{
-		CThostFtdcInputOptionSelfCloseActionField *task_data = new CThostFtdcInputOptionSelfCloseActionField();
+		CThostFtdcInputOptionSelfCloseActionField *task_data = createTaskData<CThostFtdcInputOptionSelfCloseActionField>();
 		*task_data = *pInputOptionSelfCloseAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -468,13 +468,13 @@ void FuturesTdApi::OnRspCombActionInsert(CThostFtdcInputCombActionField *pInputC
 	task.task_name = ONRSPCOMBACTIONINSERT;
 	if (pInputCombAction)
 	{
-		CThostFtdcInputCombActionField *task_data = new CThostFtdcInputCombActionField();
+		CThostFtdcInputCombActionField *task_data = createTaskData<CThostFtdcInputCombActionField>();
 		*task_data = *pInputCombAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -489,13 +489,13 @@ void FuturesTdApi::OnRspQryOrder(CThostFtdcOrderField *pOrder, CThostFtdcRspInfo
 	task.task_name = ONRSPQRYORDER;
 	if (pOrder)
 	{
-		CThostFtdcOrderField *task_data = new CThostFtdcOrderField();
+		CThostFtdcOrderField *task_data = createTaskData<CThostFtdcOrderField>();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -510,13 +510,13 @@ void FuturesTdApi::OnRspQryTrade(CThostFtdcTradeField *pTrade, CThostFtdcRspInfo
 	task.task_name = ONRSPQRYTRADE;
 	if (pTrade)
 	{
-		CThostFtdcTradeField *task_data = new CThostFtdcTradeField();
+		CThostFtdcTradeField *task_data = createTaskData<CThostFtdcTradeField>();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -531,13 +531,13 @@ void FuturesTdApi::OnRspQryInvestorPosition(CThostFtdcInvestorPositionField *pIn
 	task.task_name = ONRSPQRYINVESTORPOSITION;
 	if (pInvestorPosition)
 	{
-		CThostFtdcInvestorPositionField *task_data = new CThostFtdcInvestorPositionField();
+		CThostFtdcInvestorPositionField *task_data = createTaskData<CThostFtdcInvestorPositionField>();
 		*task_data = *pInvestorPosition;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -552,13 +552,13 @@ void FuturesTdApi::OnRspQryTradingAccount(CThostFtdcTradingAccountField *pTradin
 	task.task_name = ONRSPQRYTRADINGACCOUNT;
 	if (pTradingAccount)
 	{
-		CThostFtdcTradingAccountField *task_data = new CThostFtdcTradingAccountField();
+		CThostFtdcTradingAccountField *task_data = createTaskData<CThostFtdcTradingAccountField>();
 		*task_data = *pTradingAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -573,13 +573,13 @@ void FuturesTdApi::OnRspQryInvestor(CThostFtdcInvestorField *pInvestor, CThostFt
 	task.task_name = ONRSPQRYINVESTOR;
 	if (pInvestor)
 	{
-		CThostFtdcInvestorField *task_data = new CThostFtdcInvestorField();
+		CThostFtdcInvestorField *task_data = createTaskData<CThostFtdcInvestorField>();
 		*task_data = *pInvestor;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -594,13 +594,13 @@ void FuturesTdApi::OnRspQryTradingCode(CThostFtdcTradingCodeField *pTradingCode,
 	task.task_name = ONRSPQRYTRADINGCODE;
 	if (pTradingCode)
 	{
-		CThostFtdcTradingCodeField *task_data = new CThostFtdcTradingCodeField();
+		CThostFtdcTradingCodeField *task_data = createTaskData<CThostFtdcTradingCodeField>();
 		*task_data = *pTradingCode;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -615,13 +615,13 @@ void FuturesTdApi::OnRspQryInstrumentMarginRate(CThostFtdcInstrumentMarginRateFi
 	task.task_name = ONRSPQRYINSTRUMENTMARGINRATE;
 	if (pInstrumentMarginRate)
 	{
-		CThostFtdcInstrumentMarginRateField *task_data = new CThostFtdcInstrumentMarginRateField();
+		CThostFtdcInstrumentMarginRateField *task_data = createTaskData<CThostFtdcInstrumentMarginRateField>();
 		*task_data = *pInstrumentMarginRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -636,13 +636,13 @@ void FuturesTdApi::OnRspQryInstrumentCommissionRate(CThostFtdcInstrumentCommissi
 	task.task_name = ONRSPQRYINSTRUMENTCOMMISSIONRATE;
 	if (pInstrumentCommissionRate)
 	{
-		CThostFtdcInstrumentCommissionRateField *task_data = new CThostFtdcInstrumentCommissionRateField();
+		CThostFtdcInstrumentCommissionRateField *task_data = createTaskData<CThostFtdcInstrumentCommissionRateField>();
 		*task_data = *pInstrumentCommissionRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -657,13 +657,13 @@ void FuturesTdApi::OnRspQryExchange(CThostFtdcExchangeField *pExchange, CThostFt
 	task.task_name = ONRSPQRYEXCHANGE;
 	if (pExchange)
 	{
-		CThostFtdcExchangeField *task_data = new CThostFtdcExchangeField();
+		CThostFtdcExchangeField *task_data = createTaskData<CThostFtdcExchangeField>();
 		*task_data = *pExchange;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -678,13 +678,13 @@ void FuturesTdApi::OnRspQryProduct(CThostFtdcProductField *pProduct, CThostFtdcR
 	task.task_name = ONRSPQRYPRODUCT;
 	if (pProduct)
 	{
-		CThostFtdcProductField *task_data = new CThostFtdcProductField();
+		CThostFtdcProductField *task_data = createTaskData<CThostFtdcProductField>();
 		*task_data = *pProduct;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -699,13 +699,13 @@ void FuturesTdApi::OnRspQryInstrument(CThostFtdcInstrumentField *pInstrument, CT
 	task.task_name = ONRSPQRYINSTRUMENT;
 	if (pInstrument)
 	{
-		CThostFtdcInstrumentField *task_data = new CThostFtdcInstrumentField();
+		CThostFtdcInstrumentField *task_data = createTaskData<CThostFtdcInstrumentField>();
 		*task_data = *pInstrument;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -720,13 +720,13 @@ void FuturesTdApi::OnRspQryDepthMarketData(CThostFtdcDepthMarketDataField *pDept
 	task.task_name = ONRSPQRYDEPTHMARKETDATA;
 	if (pDepthMarketData)
 	{
-		CThostFtdcDepthMarketDataField *task_data = new CThostFtdcDepthMarketDataField();
+		CThostFtdcDepthMarketDataField *task_data = createTaskData<CThostFtdcDepthMarketDataField>();
 		*task_data = *pDepthMarketData;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -741,13 +741,13 @@ void FuturesTdApi::OnRspQrySettlementInfo(CThostFtdcSettlementInfoField *pSettle
 	task.task_name = ONRSPQRYSETTLEMENTINFO;
 	if (pSettlementInfo)
 	{
-		CThostFtdcSettlementInfoField *task_data = new CThostFtdcSettlementInfoField();
+		CThostFtdcSettlementInfoField *task_data = createTaskData<CThostFtdcSettlementInfoField>();
 		*task_data = *pSettlementInfo;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -762,13 +762,13 @@ void FuturesTdApi::OnRspQryTransferBank(CThostFtdcTransferBankField *pTransferBa
 	task.task_name = ONRSPQRYTRANSFERBANK;
 	if (pTransferBank)
 	{
-		CThostFtdcTransferBankField *task_data = new CThostFtdcTransferBankField();
+		CThostFtdcTransferBankField *task_data = createTaskData<CThostFtdcTransferBankField>();
 		*task_data = *pTransferBank;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -783,13 +783,13 @@ void FuturesTdApi::OnRspQryInvestorPositionDetail(CThostFtdcInvestorPositionDeta
 	task.task_name = ONRSPQRYINVESTORPOSITIONDETAIL;
 	if (pInvestorPositionDetail)
 	{
-		CThostFtdcInvestorPositionDetailField *task_data = new CThostFtdcInvestorPositionDetailField();
+		CThostFtdcInvestorPositionDetailField *task_data = createTaskData<CThostFtdcInvestorPositionDetailField>();
 		*task_data = *pInvestorPositionDetail;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -804,13 +804,13 @@ void FuturesTdApi::OnRspQryNotice(CThostFtdcNoticeField *pNotice, CThostFtdcRspI
 	task.task_name = ONRSPQRYNOTICE;
 	if (pNotice)
 	{
-		CThostFtdcNoticeField *task_data = new CThostFtdcNoticeField();
+		CThostFtdcNoticeField *task_data = createTaskData<CThostFtdcNoticeField>();
 		*task_data = *pNotice;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -825,13 +825,13 @@ void FuturesTdApi::OnRspQrySettlementInfoConfirm(CThostFtdcSettlementInfoConfirm
 	task.task_name = ONRSPQRYSETTLEMENTINFOCONFIRM;
 	if (pSettlementInfoConfirm)
 	{
-		CThostFtdcSettlementInfoConfirmField *task_data = new CThostFtdcSettlementInfoConfirmField();
+		CThostFtdcSettlementInfoConfirmField *task_data = createTaskData<CThostFtdcSettlementInfoConfirmField>();
 		*task_data = *pSettlementInfoConfirm;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -846,13 +846,13 @@ void FuturesTdApi::OnRspQryInvestorPositionCombineDetail(CThostFtdcInvestorPosit
 	task.task_name = ONRSPQRYINVESTORPOSITIONCOMBINEDETAIL;
 	if (pInvestorPositionCombineDetail)
 	{
-		CThostFtdcInvestorPositionCombineDetailField *task_data = new CThostFtdcInvestorPositionCombineDetailField();
+		CThostFtdcInvestorPositionCombineDetailField *task_data = createTaskData<CThostFtdcInvestorPositionCombineDetailField>();
 		*task_data = *pInvestorPositionCombineDetail;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -867,13 +867,13 @@ void FuturesTdApi::OnRspQryCFMMCTradingAccountKey(CThostFtdcCFMMCTradingAccountK
 	task.task_name = ONRSPQRYCFMMCTRADINGACCOUNTKEY;
 	if (pCFMMCTradingAccountKey)
 	{
-		CThostFtdcCFMMCTradingAccountKeyField *task_data = new CThostFtdcCFMMCTradingAccountKeyField();
+		CThostFtdcCFMMCTradingAccountKeyField *task_data = createTaskData<CThostFtdcCFMMCTradingAccountKeyField>();
 		*task_data = *pCFMMCTradingAccountKey;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -888,13 +888,13 @@ void FuturesTdApi::OnRspQryEWarrantOffset(CThostFtdcEWarrantOffsetField *pEWarra
 	task.task_name = ONRSPQRYEWARRANTOFFSET;
 	if (pEWarrantOffset)
 	{
-		CThostFtdcEWarrantOffsetField *task_data = new CThostFtdcEWarrantOffsetField();
+		CThostFtdcEWarrantOffsetField *task_data = createTaskData<CThostFtdcEWarrantOffsetField>();
 		*task_data = *pEWarrantOffset;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -909,13 +909,13 @@ void FuturesTdApi::OnRspQryInvestorProductGroupMargin(CThostFtdcInvestorProductG
 	task.task_name = ONRSPQRYINVESTORPRODUCTGROUPMARGIN;
 	if (pInvestorProductGroupMargin)
 	{
-		CThostFtdcInvestorProductGroupMarginField *task_data = new CThostFtdcInvestorProductGroupMarginField();
+		CThostFtdcInvestorProductGroupMarginField *task_data = createTaskData<CThostFtdcInvestorProductGroupMarginField>();
 		*task_data = *pInvestorProductGroupMargin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -930,13 +930,13 @@ void FuturesTdApi::OnRspQryExchangeMarginRate(CThostFtdcExchangeMarginRateField
 	task.task_name = ONRSPQRYEXCHANGEMARGINRATE;
 	if (pExchangeMarginRate)
 	{
-		CThostFtdcExchangeMarginRateField *task_data = new CThostFtdcExchangeMarginRateField();
+		CThostFtdcExchangeMarginRateField *task_data = createTaskData<CThostFtdcExchangeMarginRateField>();
 		*task_data = *pExchangeMarginRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -951,13 +951,13 @@ void FuturesTdApi::OnRspQryExchangeMarginRateAdjust(CThostFtdcExchangeMarginRate
 	task.task_name = ONRSPQRYEXCHANGEMARGINRATEADJUST;
 	if (pExchangeMarginRateAdjust)
 	{
-		CThostFtdcExchangeMarginRateAdjustField *task_data = new CThostFtdcExchangeMarginRateAdjustField();
+		CThostFtdcExchangeMarginRateAdjustField *task_data = createTaskData<CThostFtdcExchangeMarginRateAdjustField>();
 		*task_data = *pExchangeMarginRateAdjust;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -972,13 +972,13 @@ void FuturesTdApi::OnRspQryExchangeRate(CThostFtdcExchangeRateField *pExchangeRa
 	task.task_name = ONRSPQRYEXCHANGERATE;
 	if (pExchangeRate)
 	{
-		CThostFtdcExchangeRateField *task_data = new CThostFtdcExchangeRateField();
+		CThostFtdcExchangeRateField *task_data = createTaskData<CThostFtdcExchangeRateField>();
 		*task_data = *pExchangeRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -993,13 +993,13 @@ void FuturesTdApi::OnRspQrySecAgentACIDMap(CThostFtdcSecAgentACIDMapField *pSecA
 	task.task_name = ONRSPQRYSECAGENTACIDMAP;
 	if (pSecAgentACIDMap)
 	{
-		CThostFtdcSecAgentACIDMapField *task_data = new CThostFtdcSecAgentACIDMapField();
+		CThostFtdcSecAgentACIDMapField *task_data = createTaskData<CThostFtdcSecAgentACIDMapField>();
 		*task_data = *pSecAgentACIDMap;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1014,13 +1014,13 @@ void FuturesTdApi::OnRspQryProductExchRate(CThostFtdcProductExchRateField *pProd
 	task.task_name = ONRSPQRYPRODUCTEXCHRATE;
 	if (pProductExchRate)
 	{
-		CThostFtdcProductExchRateField *task_data = new CThostFtdcProductExchRateField();
+		CThostFtdcProductExchRateField *task_data = createTaskData<CThostFtdcProductExchRateField>();
 		*task_data = *pProductExchRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1035,13 +1035,13 @@ void FuturesTdApi::OnRspQryProductGroup(CThostFtdcProductGroupField *pProductGro
 	task.task_name = ONRSPQRYPRODUCTGROUP;
 	if (pProductGroup)
 	{
-		CThostFtdcProductGroupField *task_data = new CThostFtdcProductGroupField();
+		CThostFtdcProductGroupField *task_data = createTaskData<CThostFtdcProductGroupField>();
 		*task_data = *pProductGroup;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1056,13 +1056,13 @@ void FuturesTdApi::OnRspQryMMInstrumentCommissionRate(CThostFtdcMMInstrumentComm
 	task.task_name = ONRSPQRYMMINSTRUMENTCOMMISSIONRATE;
 	if (pMMInstrumentCommissionRate)
 	{
-		CThostFtdcMMInstrumentCommissionRateField *task_data = new CThostFtdcMMInstrumentCommissionRateField();
+		CThostFtdcMMInstrumentCommissionRateField *task_data = createTaskData<CThostFtdcMMInstrumentCommissionRateField>();
 		*task_data = *pMMInstrumentCommissionRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1077,13 +1077,13 @@ void FuturesTdApi::OnRspQryMMOptionInstrCommRate(CThostFtdcMMOptionInstrCommRate
 	task.task_name = ONRSPQRYMMOPTIONINSTRCOMMRATE;
 	if (pMMOptionInstrCommRate)
 	{
-		CThostFtdcMMOptionInstrCommRateField *task_data = new CThostFtdcMMOptionInstrCommRateField();
+		CThostFtdcMMOptionInstrCommRateField *task_data = createTaskData<CThostFtdcMMOptionInstrCommRateField>();
 		*task_data = *pMMOptionInstrCommRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1098,13 +1098,13 @@ void FuturesTdApi::OnRspQryInstrumentOrderCommRate(CThostFtdcInstrumentOrderComm
 	task.task_name = ONRSPQRYINSTRUMENTORDERCOMMRATE;
 	if (pInstrumentOrderCommRate)
 	{
-		CThostFtdcInstrumentOrderCommRateField *task_data = new CThostFtdcInstrumentOrderCommRateField();
+		CThostFtdcInstrumentOrderCommRateField *task_data = createTaskData<CThostFtdcInstrumentOrderCommRateField>();
 		*task_data = *pInstrumentOrderCommRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1119,13 +1119,13 @@ void FuturesTdApi::OnRspQrySecAgentTradingAccount(CThostFtdcTradingAccountField
 	task.task_name = ONRSPQRYSECAGENTTRADINGACCOUNT;
 	if (pTradingAccount)
 	{
-		CThostFtdcTradingAccountField *task_data = new CThostFtdcTradingAccountField();
+		CThostFtdcTradingAccountField *task_data = createTaskData<CThostFtdcTradingAccountField>();
 		*task_data = *pTradingAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1140,13 +1140,13 @@ void FuturesTdApi::OnRspQrySecAgentCheckMode(CThostFtdcSecAgentCheckModeField *p
 	task.task_name = ONRSPQRYSECAGENTCHECKMODE;
 	if (pSecAgentCheckMode)
 	{
-		CThostFtdcSecAgentCheckModeField *task_data = new CThostFtdcSecAgentCheckModeField();
+		CThostFtdcSecAgentCheckModeField *task_data = createTaskData<CThostFtdcSecAgentCheckModeField>();
 		*task_data = *pSecAgentCheckMode;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1161,13 +1161,13 @@ void FuturesTdApi::OnRspQryOptionInstrTradeCost(CThostFtdcOptionInstrTradeCostFi
 	task.task_name = ONRSPQRYOPTIONINSTRTRADECOST;
 	if (pOptionInstrTradeCost)
 	{
-		CThostFtdcOptionInstrTradeCostField *task_data = new CThostFtdcOptionInstrTradeCostField();
+		CThostFtdcOptionInstrTradeCostField *task_data = createTaskData<CThostFtdcOptionInstrTradeCostField>();
 		*task_data = *pOptionInstrTradeCost;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1182,13 +1182,13 @@ void FuturesTdApi::OnRspQryOptionInstrCommRate(CThostFtdcOptionInstrCommRateFiel
 	task.task_name = ONRSPQRYOPTIONINSTRCOMMRATE;
 	if (pOptionInstrCommRate)
 	{
-		CThostFtdcOptionInstrCommRateField *task_data = new CThostFtdcOptionInstrCommRateField();
+		CThostFtdcOptionInstrCommRateField *task_data = createTaskData<CThostFtdcOptionInstrCommRateField>();
 		*task_data = *pOptionInstrCommRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1203,13 +1203,13 @@ void FuturesTdApi::OnRspQryExecOrder(CThostFtdcExecOrderField *pExecOrder, CThos
 	task.task_name = ONRSPQRYEXECORDER;
 	if (pExecOrder)
 	{
-		CThostFtdcExecOrderField *task_data = new CThostFtdcExecOrderField();
+		CThostFtdcExecOrderField *task_data = createTaskData<CThostFtdcExecOrderField>();
 		*task_data = *pExecOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1224,13 +1224,13 @@ void FuturesTdApi::OnRspQryForQuote(CThostFtdcForQuoteField *pForQuote, CThostFt
 	task.task_name = ONRSPQRYFORQUOTE;
 	if (pForQuote)
 	{
-		CThostFtdcForQuoteField *task_data = new CThostFtdcForQuoteField();
+		CThostFtdcForQuoteField *task_data = createTaskData<CThostFtdcForQuoteField>();
 		*task_data = *pForQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1245,13 +1245,13 @@ void FuturesTdApi::OnRspQryQuote(CThostFtdcQuoteField *pQuote, CThostFtdcRspInfo
 	task.task_name = ONRSPQRYQUOTE;
 	if (pQuote)
 	{
-		CThostFtdcQuoteField *task_data = new CThostFtdcQuoteField();
+		CThostFtdcQuoteField *task_data = createTaskData<CThostFtdcQuoteField>();
 		*task_data = *pQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1266,13 +1266,13 @@ void FuturesTdApi::OnRspQryOptionSelfClose(CThostFtdcOptionSelfCloseField *pOpti
 	task.task_name = ONRSPQRYOPTIONSELFCLOSE;
 	if (pOptionSelfClose)
 	{
-		CThostFtdcOptionSelfCloseField *task_data = new CThostFtdcOptionSelfCloseField();
+		CThostFtdcOptionSelfCloseField *task_data = createTaskData<CThostFtdcOptionSelfCloseField>();
 		*task_data = *pOptionSelfClose;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1287,13 +1287,13 @@ void FuturesTdApi::OnRspQryInvestUnit(CThostFtdcInvestUnitField *pInvestUnit, CT
 	task.task_name = ONRSPQRYINVESTUNIT;
 	if (pInvestUnit)
 	{
-		CThostFtdcInvestUnitField *task_data = new CThostFtdcInvestUnitField();
+		CThostFtdcInvestUnitField *task_data = createTaskData<CThostFtdcInvestUnitField>();
 		*task_data = *pInvestUnit;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1308,13 +1308,13 @@ void FuturesTdApi::OnRspQryCombInstrumentGuard(CThostFtdcCombInstrumentGuardFiel
 	task.task_name = ONRSPQRYCOMBINSTRUMENTGUARD;
 	if (pCombInstrumentGuard)
 	{
-		CThostFtdcCombInstrumentGuardField *task_data = new CThostFtdcCombInstrumentGuardField();
+		CThostFtdcCombInstrumentGuardField *task_data = createTaskData<CThostFtdcCombInstrumentGuardField>();
 		*task_data = *pCombInstrumentGuard;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1329,13 +1329,13 @@ void FuturesTdApi::OnRspQryCombAction(CThostFtdcCombActionField *pCombAction, CT
 	task.task_name = ONRSPQRYCOMBACTION;
 	if (pCombAction)
 	{
-		CThostFtdcCombActionField *task_data = new CThostFtdcCombActionField();
+		CThostFtdcCombActionField *task_data = createTaskData<CThostFtdcCombActionField>();
 		*task_data = *pCombAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1350,13 +1350,13 @@ void FuturesTdApi::OnRspQryTransferSerial(CThostFtdcTransferSerialField *pTransf
 	task.task_name = ONRSPQRYTRANSFERSERIAL;
 	if (pTransferSerial)
 	{
-		CThostFtdcTransferSerialField *task_data = new CThostFtdcTransferSerialField();
+		CThostFtdcTransferSerialField *task_data = createTaskData<CThostFtdcTransferSerialField>();
 		*task_data = *pTransferSerial;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1371,13 +1371,13 @@ void FuturesTdApi::OnRspQryAccountregister(CThostFtdcAccountregisterField *pAcco
 	task.task_name = ONRSPQRYACCOUNTREGISTER;
 	if (pAccountregister)
 	{
-		CThostFtdcAccountregisterField *task_data = new CThostFtdcAccountregisterField();
+		CThostFtdcAccountregisterField *task_data = createTaskData<CThostFtdcAccountregisterField>();
 		*task_data = *pAccountregister;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1392,13 +1392,13 @@ void FuturesTdApi::OnRspForQuote(CThostFtdcInputForQuoteField *pForQuoteRsp, CTh
 	task.task_name = ONRSPFORQUOTE;
 	if (pForQuoteRsp)
 	{
-		CThostFtdcInputForQuoteField *task_data = new CThostFtdcInputForQuoteField();
+		CThostFtdcInputForQuoteField *task_data = createTaskData<CThostFtdcInputForQuoteField>();
 		*task_data = *pForQuoteRsp;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1413,7 +1413,7 @@ void FuturesTdApi::OnRspError(CThostFtdcRspInfoField *pRspInfo, int nRequestID,
 	task.task_name = ONRSPERROR;
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1428,7 +1428,7 @@ void FuturesTdApi::OnRtnOrder(CThostFtdcOrderField *pOrder)
 	task.task_name = ONRTNORDER;
 	if (pOrder)
 	{
-		CThostFtdcOrderField *task_data = new CThostFtdcOrderField();
+		CThostFtdcOrderField *task_data = createTaskData<CThostFtdcOrderField>();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
@@ -1441,7 +1441,7 @@ void FuturesTdApi::OnRtnTrade(CThostFtdcTradeField *pTrade)
 	task.task_name = ONRTNTRADE;
 	if (pTrade)
 	{
-		CThostFtdcTradeField *task_data = new CThostFtdcTradeField();
+		CThostFtdcTradeField *task_data = createTaskData<CThostFtdcTradeField>();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
@@ -1454,13 +1454,13 @@ void FuturesTdApi::OnErrRtnOrderInsert(CThostFtdcInputOrderField *pInputOrder, C
 	task.task_name = ONERRRTNORDERINSERT;
 	if (pInputOrder)
 	{
-		CThostFtdcInputOrderField *task_data = new CThostFtdcInputOrderField();
+		CThostFtdcInputOrderField *task_data = createTaskData<CThostFtdcInputOrderField>();
 		*task_data = *pInputOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1473,13 +1473,13 @@ void FuturesTdApi::OnErrRtnOrderAction(CThostFtdcOrderActionField *pOrderAction,
 	task.task_name = ONERRRTNORDERACTION;
 	if (pOrderAction)
 	{
-		CThostFtdcOrderActionField *task_data = new CThostFtdcOrderActionField();
+		CThostFtdcOrderActionField *task_data = createTaskData<CThostFtdcOrderActionField>();
 		*task_data = *pOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1492,7 +1492,7 @@ void FuturesTdApi::OnRtnInstrumentStatus(CThostFtdcInstrumentStatusField *pInstr
 	task.task_name = ONRTNINSTRUMENTSTATUS;
 	if (pInstrumentStatus)
 	{
-		CThostFtdcInstrumentStatusField *task_data = new CThostFtdcInstrumentStatusField();
+		CThostFtdcInstrumentStatusField *task_data = createTaskData<CThostFtdcInstrumentStatusField>();
 		*task_data = *pInstrumentStatus;
 		task.task_data = task_data;
 	}
@@ -1505,7 +1505,7 @@ void FuturesTdApi::OnRtnBulletin(CThostFtdcBulletinField *pBulletin)
 	task.task_name = ONRTNBULLETIN;
 	if (pBulletin)
 	{
-		CThostFtdcBulletinField *task_data = new CThostFtdcBulletinField();
+		CThostFtdcBulletinField *task_data = createTaskData<CThostFtdcBulletinField>();
 		*task_data = *pBulletin;
 		task.task_data = task_data;
 	}
@@ -1518,7 +1518,7 @@ void FuturesTdApi::OnRtnTradingNotice(CThostFtdcTradingNoticeInfoField *pTrading
 	task.task_name = ONRTNTRADINGNOTICE;
 	if (pTradingNoticeInfo)
 	{
-		CThostFtdcTradingNoticeInfoField *task_data = new CThostFtdcTradingNoticeInfoField();
+		CThostFtdcTradingNoticeInfoField *task_data = createTaskData<CThostFtdcTradingNoticeInfoField>();
 		*task_data = *pTradingNoticeInfo;
 		task.task_data = task_data;
 	}
@@ -1531,7 +1531,7 @@ void FuturesTdApi::OnRtnErrorConditionalOrder(CThostFtdcErrorConditionalOrderFie
 	task.task_name = ONRTNERRORCONDITIONALORDER;
 	if (pErrorConditionalOrder)
 	{
-		CThostFtdcErrorConditionalOrderField *task_data = new CThostFtdcErrorConditionalOrderField();
+		CThostFtdcErrorConditionalOrderField *task_data = createTaskData<CThostFtdcErrorConditionalOrderField>();
 		*task_data = *pErrorConditionalOrder;
 		task.task_data = task_data;
 	}
@@ -1544,7 +1544,7 @@ void FuturesTdApi::OnRtnExecOrder(CThostFtdcExecOrderField *pExecOrder)
 	task.task_name = ONRTNEXECORDER;
 	if (pExecOrder)
 	{
-		CThostFtdcExecOrderField *task_data = new CThostFtdcExecOrderField();
+		CThostFtdcExecOrderField *task_data = createTaskData<CThostFtdcExecOrderField>();
 		*task_data = *pExecOrder;
 		task.task_data = task_data;
 	}
@@ -1557,13 +1557,13 @@ void FuturesTdApi::OnErrRtnExecOrderInsert(CThostFtdcInputExecOrderField *pInput
 	task.task_name = ONERRRTNEXECORDERINSERT;
 	if (pInputExecOrder)
 	{
-		CThostFtdcInputExecOrderField *task_data = new CThostFtdcInputExecOrderField();
+		CThostFtdcInputExecOrderField *task_data = createTaskData<CThostFtdcInputExecOrderField>();
 		*task_data = *pInputExecOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1576,13 +1576,13 @@ void FuturesTdApi::OnErrRtnExecOrderAction(CThostFtdcExecOrderActionField *pExec
 	task.task_name = ONERRRTNEXECORDERACTION;
 	if (pExecOrderAction)
 	{
-		CThostFtdcExecOrderActionField *task_data = new CThostFtdcExecOrderActionField();
+		CThostFtdcExecOrderActionField *task_data = createTaskData<CThostFtdcExecOrderActionField>();
 		*task_data = *pExecOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1595,13 +1595,13 @@ void FuturesTdApi::OnErrRtnForQuoteInsert(CThostFtdcInputForQuoteField *pInputFo
 	task.task_name = ONERRRTNFORQUOTEINSERT;
 	if (pInputForQuote)
 	{
-		CThostFtdcInputForQuoteField *task_data = new CThostFtdcInputForQuoteField();
+		CThostFtdcInputForQuoteField *task_data = createTaskData<CThostFtdcInputForQuoteField>();
 		*task_data = *pInputForQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1614,7 +1614,7 @@ void FuturesTdApi::OnRtnQuote(CThostFtdcQuoteField *pQuote)
 	task.task_name = ONRTNQUOTE;
 	if (pQuote)
 	{
-		CThostFtdcQuoteField *task_data = new CThostFtdcQuoteField();
+		CThostFtdcQuoteField *task_data = createTaskData<CThostFtdcQuoteField>();
 		*task_data = *pQuote;
 		task.task_data = task_data;
 	}
@@ -1627,13 +1627,13 @@ void FuturesTdApi::OnErrRtnQuoteInsert(CThostFtdcInputQuoteField *pInputQuote, C
 	task.task_name = ONERRRTNQUOTEINSERT;
 	if (pInputQuote)
 	{
-		CThostFtdcInputQuoteField *task_data = new CThostFtdcInputQuoteField();
+		CThostFtdcInputQuoteField *task_data = createTaskData<CThostFtdcInputQuoteField>();
 		*task_data = *pInputQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1646,13 +1646,13 @@ void FuturesTdApi::OnErrRtnQuoteAction(CThostFtdcQuoteActionField *pQuoteAction,
 	task.task_name = ONERRRTNQUOTEACTION;
 	if (pQuoteAction)
 	{
-		CThostFtdcQuoteActionField *task_data = new CThostFtdcQuoteActionField();
+		CThostFtdcQuoteActionField *task_data = createTaskData<CThostFtdcQuoteActionField>();
 		*task_data = *pQuoteAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1665,7 +1665,7 @@ void FuturesTdApi::OnRtnForQuote(CThostFtdcForQuoteRspField *pForQuoteRsp)
 	task.task_name = ONRTNFORQUOTE;
 	if (pForQuoteRsp)
 	{
-		CThostFtdcForQuoteRspField *task_data = new CThostFtdcForQuoteRspField();
+		CThostFtdcForQuoteRspField *task_data = createTaskData<CThostFtdcForQuoteRspField>();
 		*task_data = *pForQuoteRsp;
 		task.task_data = task_data;
 	}
@@ -1678,7 +1678,7 @@ void FuturesTdApi::OnRtnCFMMCTradingAccountToken(CThostFtdcCFMMCTradingAccountTo
 	task.task_name = ONRTNCFMMCTRADINGACCOUNTTOKEN;
 	if (pCFMMCTradingAccountToken)
 	{
-		CThostFtdcCFMMCTradingAccountTokenField *task_data = new CThostFtdcCFMMCTradingAccountTokenField();
+		CThostFtdcCFMMCTradingAccountTokenField *task_data = createTaskData<CThostFtdcCFMMCTradingAccountTokenField>();
 		*task_data = *pCFMMCTradingAccountToken;
 		task.task_data = task_data;
 	}
@@ -1691,13 +1691,13 @@ void FuturesTdApi::OnErrRtnBatchOrderAction(CThostFtdcBatchOrderActionField *pBa
 	task.task_name = ONERRRTNBATCHORDERACTION;
 	if (pBatchOrderAction)
 	{
-		CThostFtdcBatchOrderActionField *task_data = new CThostFtdcBatchOrderActionField();
+		CThostFtdcBatchOrderActionField *task_data = createTaskData<CThostFtdcBatchOrderActionField>();
 		*task_data = *pBatchOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1710,7 +1710,7 @@ void FuturesTdApi::OnRtnOptionSelfClose(CThostFtdcOptionSelfCloseField *pOptionS
 	task.task_name = ONRTNOPTIONSELFCLOSE;
 	if (pOptionSelfClose)
 	{
-		CThostFtdcOptionSelfCloseField *task_data = new CThostFtdcOptionSelfCloseField();
+		CThostFtdcOptionSelfCloseField *task_data = createTaskData<CThostFtdcOptionSelfCloseField>();
 		*task_data = *pOptionSelfClose;
 		task.task_data = task_data;
 	}
@@ -1723,13 +1723,13 @@ void FuturesTdApi::OnErrRtnOptionSelfCloseInsert(CThostFtdcInputOptionSelfCloseF
 	task.task_name = ONERRRTNOPTIONSELFCLOSEINSERT;
 	if (pInputOptionSelfClose)
 	{
-		CThostFtdcInputOptionSelfCloseField *task_data = new CThostFtdcInputOptionSelfCloseField();
+		CThostFtdcInputOptionSelfCloseField *task_data = createTaskData<CThostFtdcInputOptionSelfCloseField>();
 		*task_data = *pInputOptionSelfClose;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1742,13 +1742,13 @@ void FuturesTdApi::OnErrRtnOptionSelfCloseAction(CThostFtdcOptionSelfCloseAction
 	task.task_name = ONERRRTNOPTIONSELFCLOSEACTION;
 	if (pOptionSelfCloseAction)
 	{
-		CThostFtdcOptionSelfCloseActionField *task_data = new CThostFtdcOptionSelfCloseActionField();
+		CThostFtdcOptionSelfCloseActionField *task_data = createTaskData<CThostFtdcOptionSelfCloseActionField>();
 		*task_data = *pOptionSelfCloseAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1761,7 +1761,7 @@ void FuturesTdApi::OnRtnCombAction(CThostFtdcCombActionField *pCombAction)
 	task.task_name = ONRTNCOMBACTION;
 	if (pCombAction)
 	{
-		CThostFtdcCombActionField *task_data = new CThostFtdcCombActionField();
+		CThostFtdcCombActionField *task_data = createTaskData<CThostFtdcCombActionField>();
 		*task_data = *pCombAction;
 		task.task_data = task_data;
 	}
@@ -1774,13 +1774,13 @@ void FuturesTdApi::OnErrRtnCombActionInsert(CThostFtdcInputCombActionField *pInp
 	task.task_name = ONERRRTNCOMBACTIONINSERT;
 	if (pInputCombAction)
 	{
-		CThostFtdcInputCombActionField *task_data = new CThostFtdcInputCombActionField();
+		CThostFtdcInputCombActionField *task_data = createTaskData<CThostFtdcInputCombActionField>();
 		*task_data = *pInputCombAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1793,13 +1793,13 @@ void FuturesTdApi::OnRspQryContractBank(CThostFtdcContractBankField *pContractBa
 	task.task_name = ONRSPQRYCONTRACTBANK;
 	if (pContractBank)
 	{
-		CThostFtdcContractBankField *task_data = new CThostFtdcContractBankField();
+		CThostFtdcContractBankField *task_data = createTaskData<CThostFtdcContractBankField>();
 		*task_data = *pContractBank;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1814,13 +1814,13 @@ void FuturesTdApi::OnRspQryParkedOrder(CThostFtdcParkedOrderField *pParkedOrder,
 	task.task_name = ONRSPQRYPARKEDORDER;
 	if (pParkedOrder)
 	{
-		CThostFtdcParkedOrderField *task_data = new CThostFtdcParkedOrderField();
+		CThostFtdcParkedOrderField *task_data = createTaskData<CThostFtdcParkedOrderField>();
 		*task_data = *pParkedOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1835,13 +1835,13 @@ void FuturesTdApi::OnRspQryParkedOrderAction(CThostFtdcParkedOrderActionField *p
 	task.task_name = ONRSPQRYPARKEDORDERACTION;
 	if (pParkedOrderAction)
 	{
-		CThostFtdcParkedOrderActionField *task_data = new CThostFtdcParkedOrderActionField();
+		CThostFtdcParkedOrderActionField *task_data = createTaskData<CThostFtdcParkedOrderActionField>();
 		*task_data = *pParkedOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1856,13 +1856,13 @@ void FuturesTdApi::OnRspQryTradingNotice(CThostFtdcTradingNoticeField *pTradingN
 	task.task_name = ONRSPQRYTRADINGNOTICE;
 	if (pTradingNotice)
 	{
-		CThostFtdcTradingNoticeField *task_data = new CThostFtdcTradingNoticeField();
+		CThostFtdcTradingNoticeField *task_data = createTaskData<CThostFtdcTradingNoticeField>();
 		*task_data = *pTradingNotice;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1877,13 +1877,13 @@ void FuturesTdApi::OnRspQryBrokerTradingParams(CThostFtdcBrokerTradingParamsFiel
 	task.task_name = ONRSPQRYBROKERTRADINGPARAMS;
 	if (pBrokerTradingParams)
 	{
-		CThostFtdcBrokerTradingParamsField *task_data = new CThostFtdcBrokerTradingParamsField();
+		CThostFtdcBrokerTradingParamsField *task_data = createTaskData<CThostFtdcBrokerTradingParamsField>();
 		*task_data = *pBrokerTradingParams;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1898,13 +1898,13 @@ void FuturesTdApi::OnRspQryBrokerTradingAlgos(CThostFtdcBrokerTradingAlgosField
 	task.task_name = ONRSPQRYBROKERTRADINGALGOS;
 	if (pBrokerTradingAlgos)
 	{
-		CThostFtdcBrokerTradingAlgosField *task_data = new CThostFtdcBrokerTradingAlgosField();
+		CThostFtdcBrokerTradingAlgosField *task_data = createTaskData<CThostFtdcBrokerTradingAlgosField>();
 		*task_data = *pBrokerTradingAlgos;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1919,13 +1919,13 @@ void FuturesTdApi::OnRspQueryCFMMCTradingAccountToken(CThostFtdcQueryCFMMCTradin
 	task.task_name = ONRSPQUERYCFMMCTRADINGACCOUNTTOKEN;
 	if (pQueryCFMMCTradingAccountToken)
 	{
-		CThostFtdcQueryCFMMCTradingAccountTokenField *task_data = new CThostFtdcQueryCFMMCTradingAccountTokenField();
+		CThostFtdcQueryCFMMCTradingAccountTokenField *task_data = createTaskData<CThostFtdcQueryCFMMCTradingAccountTokenField>();
 		*task_data = *pQueryCFMMCTradingAccountToken;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1940,7 +1940,7 @@ void FuturesTdApi::OnRtnFromBankToFutureByBank(CThostFtdcRspTransferField *pRspT
 	task.task_name = ONRTNFROMBANKTOFUTUREBYBANK;
 	if (pRspTransfer)
 	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
+		CThostFtdcRspTransferField *task_data = createTaskData<CThostFtdcRspTransferField>();
 		*task_data = *pRspTransfer;
 		task.task_data = task_data;
 	}
@@ -1953,7 +1953,7 @@ void FuturesTdApi::OnRtnFromFutureToBankByBank(CThostFtdcRspTransferField *pRspT
 	task.task_name = ONRTNFROMFUTURETOBANKBYBANK;
 	if (pRspTransfer)
 	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
+		CThostFtdcRspTransferField *task_data = createTaskData<CThostFtdcRspTransferField>();
 		*task_data = *pRspTransfer;
 		task.task_data = task_data;
 	}
@@ -1966,7 +1966,7 @@ void FuturesTdApi::OnRtnRepealFromBankToFutureByBank(CThostFtdcRspRepealField *p
 	task.task_name = ONRTNREPEALFROMBANKTOFUTUREBYBANK;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = createTaskData<CThostFtdcRspRepealField>();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -1979,7 +1979,7 @@ void FuturesTdApi::OnRtnRepealFromFutureToBankByBank(CThostFtdcRspRepealField *p
 	task.task_name = ONRTNREPEALFROMFUTURETOBANKBYBANK;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = createTaskData<CThostFtdcRspRepealField>();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -1992,7 +1992,7 @@ void FuturesTdApi::OnRtnFromBankToFutureByFuture(CThostFtdcRspTransferField *pRs
 	task.task_name = ONRTNFROMBANKTOFUTUREBYFUTURE;
 	if (pRspTransfer)
 	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
+		CThostFtdcRspTransferField *task_data = createTaskData<CThostFtdcRspTransferField>();
 		*task_data = *pRspTransfer;
 		task.task_data = task_data;
 	}
@@ -2005,7 +2005,7 @@ void FuturesTdApi::OnRtnFromFutureToBankByFuture(CThostFtdcRspTransferField *pRs
 	task.task_name = ONRTNFROMFUTURETOBANKBYFUTURE;
 	if (pRspTransfer)
 	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
+		CThostFtdcRspTransferField *task_data = createTaskData<CThostFtdcRspTransferField>();
 		*task_data = *pRspTransfer;
 		task.task_data = task_data;
 	}
@@ -2018,7 +2018,7 @@ void FuturesTdApi::OnRtnRepealFromBankToFutureByFutureManual(CThostFtdcRspRepeal
 	task.task_name = ONRTNREPEALFROMBANKTOFUTUREBYFUTUREMANUAL;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = createTaskData<CThostFtdcRspRepealField>();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2031,7 +2031,7 @@ void FuturesTdApi::OnRtnRepealFromFutureToBankByFutureManual(CThostFtdcRspRepeal
 	task.task_name = ONRTNREPEALFROMFUTURETOBANKBYFUTUREMANUAL;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = createTaskData<CThostFtdcRspRepealField>();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2044,7 +2044,7 @@ void FuturesTdApi::OnRtnQueryBankBalanceByFuture(CThostFtdcNotifyQueryAccountFie
 	task.task_name = ONRTNQUERYBANKBALANCEBYFUTURE;
 	if (pNotifyQueryAccount)
 	{
-		CThostFtdcNotifyQueryAccountField *task_data = new CThostFtdcNotifyQueryAccountField();
+		CThostFtdcNotifyQueryAccountField *task_data = createTaskData<CThostFtdcNotifyQueryAccountField>();
 		*task_data = *pNotifyQueryAccount;
 		task.task_data = task_data;
 	}
@@ -2057,13 +2057,13 @@ void FuturesTdApi::OnErrRtnBankToFutureByFuture(CThostFtdcReqTransferField *pReq
 	task.task_name = ONERRRTNBANKTOFUTUREBYFUTURE;
 	if (pReqTransfer)
 	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
+		CThostFtdcReqTransferField *task_data = createTaskData<CThostFtdcReqTransferField>();
 		*task_data = *pReqTransfer;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2076,13 +2076,13 @@ void FuturesTdApi::OnErrRtnFutureToBankByFuture(CThostFtdcReqTransferField *pReq
 	task.task_name = ONERRRTNFUTURETOBANKBYFUTURE;
 	if (pReqTransfer)
 	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
+		CThostFtdcReqTransferField *task_data = createTaskData<CThostFtdcReqTransferField>();
 		*task_data = *pReqTransfer;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2095,13 +2095,13 @@ void FuturesTdApi::OnErrRtnRepealBankToFutureByFutureManual(CThostFtdcReqRepealF
 	task.task_name = ONERRRTNREPEALBANKTOFUTUREBYFUTUREMANUAL;
 	if (pReqRepeal)
 	{
-		CThostFtdcReqRepealField *task_data = new CThostFtdcReqRepealField();
+		CThostFtdcReqRepealField *task_data = createTaskData<CThostFtdcReqRepealField>();
 		*task_data = *pReqRepeal;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2114,13 +2114,13 @@ void FuturesTdApi::OnErrRtnRepealFutureToBankByFutureManual(CThostFtdcReqRepealF
 	task.task_name = ONERRRTNREPEALFUTURETOBANKBYFUTUREMANUAL;
 	if (pReqRepeal)
 	{
-		CThostFtdcReqRepealField *task_data = new CThostFtdcReqRepealField();
+		CThostFtdcReqRepealField *task_data = createTaskData<CThostFtdcReqRepealField>();
 		*task_data = *pReqRepeal;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2133,13 +2133,13 @@ void FuturesTdApi::OnErrRtnQueryBankBalanceByFuture(CThostFtdcReqQueryAccountFie
 	task.task_name = ONERRRTNQUERYBANKBALANCEBYFUTURE;
 	if (pReqQueryAccount)
 	{
-		CThostFtdcReqQueryAccountField *task_data = new CThostFtdcReqQueryAccountField();
+		CThostFtdcReqQueryAccountField *task_data = createTaskData<CThostFtdcReqQueryAccountField>();
 		*task_data = *pReqQueryAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2152,7 +2152,7 @@ void FuturesTdApi::OnRtnRepealFromBankToFutureByFuture(CThostFtdcRspRepealField
 	task.task_name = ONRTNREPEALFROMBANKTOFUTUREBYFUTURE;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = createTaskData<CThostFtdcRspRepealField>();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2165,7 +2165,7 @@ void FuturesTdApi::OnRtnRepealFromFutureToBankByFuture(CThostFtdcRspRepealField
 	task.task_name = ONRTNREPEALFROMFUTURETOBANKBYFUTURE;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = createTaskData<CThostFtdcRspRepealField>();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2178,13 +2178,13 @@ void FuturesTdApi::OnRspFromBankToFutureByFuture(CThostFtdcReqTransferField *pRe
 	task.task_name = ONRSPFROMBANKTOFUTUREBYFUTURE;
 	if (pReqTransfer)
 	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
+		CThostFtdcReqTransferField *task_data = createTaskData<CThostFtdcReqTransferField>();
 		*task_data = *pReqTransfer;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2199,13 +2199,13 @@ void FuturesTdApi::OnRspFromFutureToBankByFuture(CThostFtdcReqTransferField *pRe
 	task.task_name = ONRSPFROMFUTURETOBANKBYFUTURE;
 	if (pReqTransfer)
 	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
+		CThostFtdcReqTransferField *task_data = createTaskData<CThostFtdcReqTransferField>();
 		*task_data = *pReqTransfer;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2220,13 +2220,13 @@ void FuturesTdApi::OnRspQueryBankAccountMoneyByFuture(CThostFtdcReqQueryAccountF
 	task.task_name = ONRSPQUERYBANKACCOUNTMONEYBYFUTURE;
 	if (pReqQueryAccount)
 	{
-		CThostFtdcReqQueryAccountField *task_data = new CThostFtdcReqQueryAccountField();
+		CThostFtdcReqQueryAccountField *task_data = createTaskData<CThostFtdcReqQueryAccountField>();
 		*task_data = *pReqQueryAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2241,7 +2241,7 @@ void FuturesTdApi::OnRtnOpenAccountByBank(CThostFtdcOpenAccountField *pOpenAccou
 	task.task_name = ONRTNOPENACCOUNTBYBANK;
 	if (pOpenAccount)
 	{
-		CThostFtdcOpenAccountField *task_data = new CThostFtdcOpenAccountField();
+		CThostFtdcOpenAccountField *task_data = createTaskData<CThostFtdcOpenAccountField>();
 		*task_data = *pOpenAccount;
 		task.task_data = task_data;
 	}
@@ -2254,7 +2254,7 @@ void FuturesTdApi::OnRtnCancelAccountByBank(CThostFtdcCancelAccountField *pCance
 	task.task_name = ONRTNCANCELACCOUNTBYBANK;
 	if (pCancelAccount)
 	{
-		CThostFtdcCancelAccountField *task_data = new CThostFtdcCancelAccountField();
+		CThostFtdcCancelAccountField *task_data = createTaskData<CThostFtdcCancelAccountField>();
 		*task_data = *pCancelAccount;
 		task.task_data = task_data;
 	}
@@ -2267,7 +2267,7 @@ void FuturesTdApi::OnRtnChangeAccountByBank(CThostFtdcChangeAccountField *pChang
 	task.task_name = ONRTNCHANGEACCOUNTBYBANK;
 	if (pChangeAccount)
 	{
-		CThostFtdcChangeAccountField *task_data = new CThostFtdcChangeAccountField();
+		CThostFtdcChangeAccountField *task_data = createTaskData<CThostFtdcChangeAccountField>();
 		*task_data = *pChangeAccount;
 		task.task_data = task_data;
 	}
@@ -2,6 +2,17 @@
 import importlib
 
 
+# 重复出现的字符串字段，使用缓存转换
+CACHED_FIELDS = {
+    "trading_day",
+    "update_time",
+    "instrument_id",
+    "exchange_id",
+    "exchange_inst_id",
+    "md_source",
+}
+
+
 class ApiGenerator:
     """API生成器"""""
 
@@ -48,6 +59,8 @@ class ApiGenerator:
         self.generate_source_function()
         self.generate_source_on()
         self.generate_source_module()
+        self.generate_source_key()
+        self.generate_source_dtype()
 
         print("API生成成功")
 
@@ -104,6 +117,13 @@ class ApiGenerator:
                 line = f"#define {name.upper()} {n}\n"
                 f.write(line)
 
+            f.write("\n//回调函数名称，按常量顺序排列\n")
+            f.write("static const char *TASK_NAMES[] = {\n")
+            for name in self.callbacks.keys():
+                on_name = name.replace("On", "on", 1)
+                f.write(f"\t\"{on_name}\",\n")
+            f.write("};\n")
+
     def generate_header_process(self):
         """"""
         filename = f"{self.prefix}_{self.name}_header_process.h"
@@ -169,12 +189,12 @@ class ApiGenerator:
                         f.write(f"\ttask.task_last = {field};\n")
                     elif type_ == "ERRORMSGINFO_t":
                         f.write("\n")
-                        f.write(f"\t{type_} *task_error = new {type_}();\n")
+                        f.write(f"\t{type_} *task_error = createTaskData<{type_}>();\n")
                         f.write(f"\t*task_error = {field};\n")
                         f.write(f"\ttask.task_error = task_error;\n")
                     else:
                         f.write("\n")
-                        f.write(f"\t{type_} *task_data = new {type_}();\n")
+                        f.write(f"\t{type_} *task_data = createTaskData<{type_}>();\n")
                         f.write(f"\t*task_data = {field};\n")
                         f.write(f"\ttask.task_data = task_data;\n")
 
@@ -228,12 +248,12 @@ class ApiGenerator:
                         for struct_field, struct_type in struct_fields.items():
                             if struct_type == "string":
                                 f.write(
-                                    f"\t\terror[\"{struct_field}\"] = toUtf(task_error->{struct_field});\n")
+                                    f"\t\terror[KEY_{struct_field}] = toUtf(task_error->{struct_field});\n")
                             else:
                                 f.write(
-                                    f"\t\terror[\"{struct_field}\"] = task_error->{struct_field};\n")
+                                    f"\t\terror[KEY_{struct_field}] = task_error->{struct_field};\n")
 
-                        f.write("\t\tdelete task_error;\n")
+                        f.write("\t\treleaseTaskData(task_error);\n")
                         f.write("\t}\n")
                     else:
                         args.append("data")
@@ -246,14 +266,17 @@ class ApiGenerator:
 
                         struct_fields = self.structs[type_]
                         for struct_field, struct_type in struct_fields.items():
-                            if struct_type == "string":
+                            if struct_type == "string" and struct_field in CACHED_FIELDS:
                                 f.write(
-                                    f"\t\tdata[\"{struct_field}\"] = toUtf(task_data->{struct_field});\n")
+                                    f"\t\tdata[KEY_{struct_field}] = toUtfCached(task_data->{struct_field});\n")
+                            elif struct_type == "string":
+                                f.write(
+                                    f"\t\tdata[KEY_{struct_field}] = toUtf(task_data->{struct_field});\n")
                             else:
                                 f.write(
-                                    f"\t\tdata[\"{struct_field}\"] = task_data->{struct_field};\n")
+                                    f"\t\tdata[KEY_{struct_field}] = task_data->{struct_field};\n")
 
-                        f.write("\t\tdelete task_data;\n")
+                        f.write("\t\treleaseTaskData(task_data);\n")
                         f.write("\t}\n")
 
                 args_str = ", ".join(args)
@@ -343,6 +366,38 @@ class ApiGenerator:
 
             f.write(";\n")
 
+    def generate_source_dtype(self):
+        """"""
+        filename = f"{self.prefix}_{self.name}_source_dtype.cpp"
+        with open(filename, "w") as f:
+            struct_fields = self.structs["STKMarketData_t"]
+            fields_str = ", ".join(struct_fields.keys())
+            f.write(f"PYBIND11_NUMPY_DTYPE(STKMarketData_t, {fields_str});\n")
+
+    def generate_source_key(self):
+        """"""
+        keys = []
+        for d in self.callbacks.values():
+            for type_ in d.values():
+                if type_ not in self.structs:
+                    continue
+
+                for struct_field in self.structs[type_].keys():
+                    if struct_field not in keys:
+                        keys.append(struct_field)
+
+        filename = f"{self.prefix}_{self.name}_source_key.cpp"
+        with open(filename, "w") as f:
+            for key in keys:
+                f.write(f"static handle KEY_{key};\n")
+
+            f.write("\n")
+            f.write("void initDictKeys()\n")
+            f.write("{\n")
+            for key in keys:
+                f.write(f"\tKEY_{key} = PyUnicode_InternFromString(\"{key}\");\n")
+            f.write("};\n")
+
 
 if __name__ == "__main__":
     generator = ApiGenerator("../../include/nh/md/CNhMdApi.h", "nh", "md", "MdApi")
@@ -9,3 +9,18 @@
 #define ONRSPUNSUBSCRIBE 8
 #define ONRSPQRYEXCHANGE 9
 #define ONRSPQRYINSTRUMENT 10
+
+//صƣ˳
+static const char *TASK_NAMES[] = {
+	"onFrontConnected",
+	"onFrontDisConnected",
+	"onHeartBeatWarning",
+	"onRspError",
+	"onRtnMarketData",
+	"onRspUtpLogin",
+	"onRspUtpLogout",
+	"onRspSubscribe",
+	"onRspUnSubscribe",
+	"onRspQryExchange",
+	"onRspQryInstrument",
+};
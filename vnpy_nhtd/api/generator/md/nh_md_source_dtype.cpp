@@ -0,0 +1 @@
+PYBIND11_NUMPY_DTYPE(STKMarketData_t, trading_day, update_time, update_millisec, update_sequence, instrument_id, exchange_id, exchange_inst_id, instrument_status, last_price, volume, last_volume, turnover, open_interest, open_price, highest_price, lowest_price, close_price, settlement_price, average_price, change_price, change_markup, change_swing, upper_limit_price, lower_limit_price, pre_settlement_price, pre_close_price, pre_open_interest, pre_delta, curr_delta, best_ask_price, best_ask_volume, best_bid_price, best_bid_volume, ask_price1, ask_volume1, bid_price1, bid_volume1, ask_price2, ask_volume2, bid_price2, bid_volume2, ask_price3, ask_volume3, bid_price3, bid_volume3, ask_price4, ask_volume4, bid_price4, bid_volume4, ask_price5, ask_volume5, bid_price5, bid_volume5, ask_price6, ask_volume6, bid_price6, bid_volume6, ask_price7, ask_volume7, bid_price7, bid_volume7, ask_price8, ask_volume8, bid_price8, bid_volume8, ask_price9, ask_volume9, bid_price9, bid_volume9, ask_price10, ask_volume10, bid_price10, bid_volume10, md_source);
@@ -0,0 +1,224 @@
+static handle KEY_error_code;
+static handle KEY_error_message;
+static handle KEY_response_code;
+static handle KEY_response_string;
+static handle KEY_utp_server_id;
+static handle KEY_oms_server_id;
+static handle KEY_trading_day;
+static handle KEY_update_time;
+static handle KEY_update_millisec;
+static handle KEY_update_sequence;
+static handle KEY_instrument_id;
+static handle KEY_exchange_id;
+static handle KEY_exchange_inst_id;
+static handle KEY_instrument_status;
+static handle KEY_last_price;
+static handle KEY_volume;
+static handle KEY_last_volume;
+static handle KEY_turnover;
+static handle KEY_open_interest;
+static handle KEY_open_price;
+static handle KEY_highest_price;
+static handle KEY_lowest_price;
+static handle KEY_close_price;
+static handle KEY_settlement_price;
+static handle KEY_average_price;
+static handle KEY_change_price;
+static handle KEY_change_markup;
+static handle KEY_change_swing;
+static handle KEY_upper_limit_price;
+static handle KEY_lower_limit_price;
+static handle KEY_pre_settlement_price;
+static handle KEY_pre_close_price;
+static handle KEY_pre_open_interest;
+static handle KEY_pre_delta;
+static handle KEY_curr_delta;
+static handle KEY_best_ask_price;
+static handle KEY_best_ask_volume;
+static handle KEY_best_bid_price;
+static handle KEY_best_bid_volume;
+static handle KEY_ask_price1;
+static handle KEY_ask_volume1;
+static handle KEY_bid_price1;
+static handle KEY_bid_volume1;
+static handle KEY_ask_price2;
+static handle KEY_ask_volume2;
+static handle KEY_bid_price2;
+static handle KEY_bid_volume2;
+static handle KEY_ask_price3;
+static handle KEY_ask_volume3;
+static handle KEY_bid_price3;
+static handle KEY_bid_volume3;
+static handle KEY_ask_price4;
+static handle KEY_ask_volume4;
+static handle KEY_bid_price4;
+static handle KEY_bid_volume4;
+static handle KEY_ask_price5;
+static handle KEY_ask_volume5;
+static handle KEY_bid_price5;
+static handle KEY_bid_volume5;
+static handle KEY_ask_price6;
+static handle KEY_ask_volume6;
+static handle KEY_bid_price6;
+static handle KEY_bid_volume6;
+static handle KEY_ask_price7;
+static handle KEY_ask_volume7;
+static handle KEY_bid_price7;
+static handle KEY_bid_volume7;
+static handle KEY_ask_price8;
+static handle KEY_ask_volume8;
+static handle KEY_bid_price8;
+static handle KEY_bid_volume8;
+static handle KEY_ask_price9;
+static handle KEY_ask_volume9;
+static handle KEY_bid_price9;
+static handle KEY_bid_volume9;
+static handle KEY_ask_price10;
+static handle KEY_ask_volume10;
+static handle KEY_bid_price10;
+static handle KEY_bid_volume10;
+static handle KEY_md_source;
+static handle KEY_session_public_key;
+static handle KEY_utp_checking_server_id;
+static handle KEY_utp_checking_server_time;
+static handle KEY_last_login_ip_address;
+static handle KEY_last_login_time;
+static handle KEY_session_encrypted;
+static handle KEY_routing_key;
+static handle KEY_exchange_name;
+static handle KEY_exchange_status;
+static handle KEY_product_id;
+static handle KEY_product_name;
+static handle KEY_product_class;
+static handle KEY_instrument_name;
+static handle KEY_instrument_class;
+static handle KEY_delivery_year;
+static handle KEY_delivery_month;
+static handle KEY_volume_multiple;
+static handle KEY_price_tick;
+static handle KEY_price_tick_dividend;
+static handle KEY_max_marketorder_volume;
+static handle KEY_min_marketorder_volume;
+static handle KEY_max_limitorder_volume;
+static handle KEY_min_limitorder_volume;
+static handle KEY_create_date;
+static handle KEY_open_date;
+static handle KEY_expire_date;
+static handle KEY_last_trading_date;
+static handle KEY_start_delivery_date;
+static handle KEY_end_delivery_date;
+static handle KEY_first_notice_date;
+
+void initDictKeys()
+{
+	KEY_error_code = PyUnicode_InternFromString("error_code");
+	KEY_error_message = PyUnicode_InternFromString("error_message");
+	KEY_response_code = PyUnicode_InternFromString("response_code");
+	KEY_response_string = PyUnicode_InternFromString("response_string");
+	KEY_utp_server_id = PyUnicode_InternFromString("utp_server_id");
+	KEY_oms_server_id = PyUnicode_InternFromString("oms_server_id");
+	KEY_trading_day = PyUnicode_InternFromString("trading_day");
+	KEY_update_time = PyUnicode_InternFromString("update_time");
+	KEY_update_millisec = PyUnicode_InternFromString("update_millisec");
+	KEY_update_sequence = PyUnicode_InternFromString("update_sequence");
+	KEY_instrument_id = PyUnicode_InternFromString("instrument_id");
+	KEY_exchange_id = PyUnicode_InternFromString("exchange_id");
+	KEY_exchange_inst_id = PyUnicode_InternFromString("exchange_inst_id");
+	KEY_instrument_status = PyUnicode_InternFromString("instrument_status");
+	KEY_last_price = PyUnicode_InternFromString("last_price");
+	KEY_volume = PyUnicode_InternFromString("volume");
+	KEY_last_volume = PyUnicode_InternFromString("last_volume");
+	KEY_turnover = PyUnicode_InternFromString("turnover");
+	KEY_open_interest = PyUnicode_InternFromString("open_interest");
+	KEY_open_price = PyUnicode_InternFromString("open_price");
+	KEY_highest_price = PyUnicode_InternFromString("highest_price");
+	KEY_lowest_price = PyUnicode_InternFromString("lowest_price");
+	KEY_close_price = PyUnicode_InternFromString("close_price");
+	KEY_settlement_price = PyUnicode_InternFromString("settlement_price");
+	KEY_average_price = PyUnicode_InternFromString("average_price");
+	KEY_change_price = PyUnicode_InternFromString("change_price");
+	KEY_change_markup = PyUnicode_InternFromString("change_markup");
+	KEY_change_swing = PyUnicode_InternFromString("change_swing");
+	KEY_upper_limit_price = PyUnicode_InternFromString("upper_limit_price");
+	KEY_lower_limit_price = PyUnicode_InternFromString("lower_limit_price");
+	KEY_pre_settlement_price = PyUnicode_InternFromString("pre_settlement_price");
+	KEY_pre_close_price = PyUnicode_InternFromString("pre_close_price");
+	KEY_pre_open_interest = PyUnicode_InternFromString("pre_open_interest");
+	KEY_pre_delta = PyUnicode_InternFromString("pre_delta");
+	KEY_curr_delta = PyUnicode_InternFromString("curr_delta");
+	KEY_best_ask_price = PyUnicode_InternFromString("best_ask_price");
+	KEY_best_ask_volume = PyUnicode_InternFromString("best_ask_volume");
+	KEY_best_bid_price = PyUnicode_InternFromString("best_bid_price");
+	KEY_best_bid_volume = PyUnicode_InternFromString("best_bid_volume");
+	KEY_ask_price1 = PyUnicode_InternFromString("ask_price1");
+	KEY_ask_volume1 = PyUnicode_InternFromString("ask_volume1");
+	KEY_bid_price1 = PyUnicode_InternFromString("bid_price1");
+	KEY_bid_volume1 = PyUnicode_InternFromString("bid_volume1");
+	KEY_ask_price2 = PyUnicode_InternFromString("ask_price2");
+	KEY_ask_volume2 = PyUnicode_InternFromString("ask_volume2");
+	KEY_bid_price2 = PyUnicode_InternFromString("bid_price2");
+	KEY_bid_volume2 = PyUnicode_InternFromString("bid_volume2");
+	KEY_ask_price3 = PyUnicode_InternFromString("ask_price3");
+	KEY_ask_volume3 = PyUnicode_InternFromString("ask_volume3");
+	KEY_bid_price3 = PyUnicode_InternFromString("bid_price3");
+	KEY_bid_volume3 = PyUnicode_InternFromString("bid_volume3");
+	KEY_ask_price4 = PyUnicode_InternFromString("ask_price4");
+	KEY_ask_volume4 = PyUnicode_InternFromString("ask_volume4");
+	KEY_bid_price4 = PyUnicode_InternFromString("bid_price4");
+	KEY_bid_volume4 = PyUnicode_InternFromString("bid_volume4");
+	KEY_ask_price5 = PyUnicode_InternFromString("ask_price5");
+	KEY_ask_volume5 = PyUnicode_InternFromString("ask_volume5");
+	KEY_bid_price5 = PyUnicode_InternFromString("bid_price5");
+	KEY_bid_volume5 = PyUnicode_InternFromString("bid_volume5");
+	KEY_ask_price6 = PyUnicode_InternFromString("ask_price6");
+	KEY_ask_volume6 = PyUnicode_InternFromString("ask_volume6");
+	KEY_bid_price6 = PyUnicode_InternFromString("bid_price6");
+	KEY_bid_volume6 = PyUnicode_InternFromString("bid_volume6");
+	KEY_ask_price7 = PyUnicode_InternFromString("ask_price7");
+	KEY_ask_volume7 = PyUnicode_InternFromString("ask_volume7");
+	KEY_bid_price7 = PyUnicode_InternFromString("bid_price7");
+	KEY_bid_volume7 = PyUnicode_InternFromString("bid_volume7");
+	KEY_ask_price8 = PyUnicode_InternFromString("ask_price8");
+	KEY_ask_volume8 = PyUnicode_InternFromString("ask_volume8");
+	KEY_bid_price8 = PyUnicode_InternFromString("bid_price8");
+	KEY_bid_volume8 = PyUnicode_InternFromString("bid_volume8");
+	KEY_ask_price9 = PyUnicode_InternFromString("ask_price9");
+	KEY_ask_volume9 = PyUnicode_InternFromString("ask_volume9");
+	KEY_bid_price9 = PyUnicode_InternFromString("bid_price9");
+	KEY_bid_volume9 = PyUnicode_InternFromString("bid_volume9");
+	KEY_ask_price10 = PyUnicode_InternFromString("ask_price10");
+	KEY_ask_volume10 = PyUnicode_InternFromString("ask_volume10");
+	KEY_bid_price10 = PyUnicode_InternFromString("bid_price10");
+	KEY_bid_volume10 = PyUnicode_InternFromString("bid_volume10");
+	KEY_md_source = PyUnicode_InternFromString("md_source");
+	KEY_session_public_key = PyUnicode_InternFromString("session_public_key");
+	KEY_utp_checking_server_id = PyUnicode_InternFromString("utp_checking_server_id");
+	KEY_utp_checking_server_time = PyUnicode_InternFromString("utp_checking_server_time");
+	KEY_last_login_ip_address = PyUnicode_InternFromString("last_login_ip_address");
+	KEY_last_login_time = PyUnicode_InternFromString("last_login_time");
+	KEY_session_encrypted = PyUnicode_InternFromString("session_encrypted");
+	KEY_routing_key = PyUnicode_InternFromString("routing_key");
+	KEY_exchange_name = PyUnicode_InternFromString("exchange_name");
+	KEY_exchange_status = PyUnicode_InternFromString("exchange_status");
+	KEY_product_id = PyUnicode_InternFromString("product_id");
+	KEY_product_name = PyUnicode_InternFromString("product_name");
+	KEY_product_class = PyUnicode_InternFromString("product_class");
+	KEY_instrument_name = PyUnicode_InternFromString("instrument_name");
+	KEY_instrument_class = PyUnicode_InternFromString("instrument_class");
+	KEY_delivery_year = PyUnicode_InternFromString("delivery_year");
+	KEY_delivery_month = PyUnicode_InternFromString("delivery_month");
+	KEY_volume_multiple = PyUnicode_InternFromString("volume_multiple");
+	KEY_price_tick = PyUnicode_InternFromString("price_tick");
+	KEY_price_tick_dividend = PyUnicode_InternFromString("price_tick_dividend");
+	KEY_max_marketorder_volume = PyUnicode_InternFromString("max_marketorder_volume");
+	KEY_min_marketorder_volume = PyUnicode_InternFromString("min_marketorder_volume");
+	KEY_max_limitorder_volume = PyUnicode_InternFromString("max_limitorder_volume");
+	KEY_min_limitorder_volume = PyUnicode_InternFromString("min_limitorder_volume");
+	KEY_create_date = PyUnicode_InternFromString("create_date");
+	KEY_open_date = PyUnicode_InternFromString("open_date");
+	KEY_expire_date = PyUnicode_InternFromString("expire_date");
+	KEY_last_trading_date = PyUnicode_InternFromString("last_trading_date");
+	KEY_start_delivery_date = PyUnicode_InternFromString("start_delivery_date");
+	KEY_end_delivery_date = PyUnicode_InternFromString("end_delivery_date");
+	KEY_first_notice_date = PyUnicode_InternFromString("first_notice_date");
+};
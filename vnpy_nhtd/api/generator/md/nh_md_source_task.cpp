@@ -19,7 +19,7 @@ void MdApi::OnHeartBeatWarning(int nTimeLapse)
 	Task task = Task();
 	task.task_name = ONHEARTBEATWARNING;
 
-	int *task_data = new int();
+	int *task_data = createTaskData<int>();
 	*task_data = nTimeLapse;
 	task.task_data = task_data;
 
@@ -31,7 +31,7 @@ void MdApi::OnRspError(ERRORMSGINFO_t &pRspInfo,TSequenceIDType nRequestID)
 	Task task = Task();
 	task.task_name = ONRSPERROR;
 
-	ERRORMSGINFO_t *task_error = new ERRORMSGINFO_t();
+	ERRORMSGINFO_t *task_error = createTaskData<ERRORMSGINFO_t>();
 	*task_error = pRspInfo;
 	task.task_error = task_error;
 
@@ -45,7 +45,7 @@ void MdApi::OnRtnMarketData(STKMarketData_t &pData)
 	Task task = Task();
 	task.task_name = ONRTNMARKETDATA;
 
-	STKMarketData_t *task_data = new STKMarketData_t();
+	STKMarketData_t *task_data = createTaskData<STKMarketData_t>();
 	*task_data = pData;
 	task.task_data = task_data;
 
@@ -57,7 +57,7 @@ void MdApi::OnRspUtpLogin(const RspUtpLoginField_t& rsp,TSequenceIDType nRequest
 	Task task = Task();
 	task.task_name = ONRSPUTPLOGIN;
 
-	RspUtpLoginField_t *task_data = new RspUtpLoginField_t();
+	RspUtpLoginField_t *task_data = createTaskData<RspUtpLoginField_t>();
 	*task_data = rsp;
 	task.task_data = task_data;
 
@@ -71,7 +71,7 @@ void MdApi::OnRspUtpLogout(const RspUtpLogoutField_t& rsp,TSequenceIDType nReque
 	Task task = Task();
 	task.task_name = ONRSPUTPLOGOUT;
 
-	RspUtpLogoutField_t *task_data = new RspUtpLogoutField_t();
+	RspUtpLogoutField_t *task_data = createTaskData<RspUtpLogoutField_t>();
 	*task_data = rsp;
 	task.task_data = task_data;
 
@@ -85,7 +85,7 @@ void MdApi::OnRspSubscribe(const RspSubscribeField_t& rsp,TSequenceIDType nReque
 	Task task = Task();
 	task.task_name = ONRSPSUBSCRIBE;
 
-	RspSubscribeField_t *task_data = new RspSubscribeField_t();
+	RspSubscribeField_t *task_data = createTaskData<RspSubscribeField_t>();
 	*task_data = rsp;
 	task.task_data = task_data;
 
@@ -99,7 +99,7 @@ void MdApi::OnRspUnSubscribe(const RspUnSubscribeField_t& rsp,TSequenceIDType nR
 	Task task = Task();
 	task.task_name = ONRSPUNSUBSCRIBE;
 
-	RspUnSubscribeField_t *task_data = new RspUnSubscribeField_t();
+	RspUnSubscribeField_t *task_data = createTaskData<RspUnSubscribeField_t>();
 	*task_data = rsp;
 	task.task_data = task_data;
 
@@ -113,7 +113,7 @@ void MdApi::OnRspQryExchange(const RspQryExchangeField_t& rsp,TSequenceIDType nR
 	Task task = Task();
 	task.task_name = ONRSPQRYEXCHANGE;
 
-	RspQryExchangeField_t *task_data = new RspQryExchangeField_t();
+	RspQryExchangeField_t *task_data = createTaskData<RspQryExchangeField_t>();
 	*task_data = rsp;
 	task.task_data = task_data;
 
@@ -127,7 +127,7 @@ void MdApi::OnRspQryInstrument(const RspQryInstrumentField_t& rsp,TSequenceIDTyp
 	Task task = Task();
 	task.task_name = ONRSPQRYINSTRUMENT;
 
-	RspQryInstrumentField_t *task_data = new RspQryInstrumentField_t();
+	RspQryInstrumentField_t *task_data = createTaskData<RspQryInstrumentField_t>();
 	*task_data = rsp;
 	task.task_data = task_data;
 
@@ -48,6 +48,7 @@ class ApiGenerator:
         self.generate_source_function()
         self.generate_source_on()
         self.generate_source_module()
+        self.generate_source_key()
 
         print("API生成成功")
 
@@ -102,6 +103,13 @@ class ApiGenerator:
                 line = f"#define {name.upper()} {n}\n"
                 f.write(line)
 
+            f.write("\n//回调函数名称，按常量顺序排列\n")
+            f.write("static const char *TASK_NAMES[] = {\n")
+            for name in self.callbacks.keys():
+                on_name = name.replace("On", "on", 1)
+                f.write(f"\t\"{on_name}\",\n")
+            f.write("};\n")
+
     def generate_header_process(self):
         """"""
         filename = f"{self.prefix}_{self.name}_header_process.h"
@@ -166,14 +174,14 @@ class ApiGenerator:
                     elif type_ == "CStockFtdcRspInfoField":
                         f.write(f"\tif ({field})\n")
                         f.write("\t{\n")
-                        f.write(f"\t\t{type_} *task_error = new {type_}();\n")
+                        f.write(f"\t\t{type_} *task_error = createTaskData<{type_}>();\n")
                         f.write(f"\t\t*task_error = *{field};\n")
                         f.write(f"\t\ttask.task_error = task_error;\n")
                         f.write("\t}\n")
                     else:
                         f.write(f"\tif ({field})\n")
                         f.write("\t{\n")
-                        f.write(f"\t\t{type_} *task_data = new {type_}();\n")
+                        f.write(f"\t\t{type_} *task_data = createTaskData<{type_}>();\n")
                         f.write(f"\t\t*task_data = *{field};\n")
                         f.write(f"\t\ttask.task_data = task_data;\n")
                         f.write("\t}\n")
@@ -227,12 +235,12 @@ class ApiGenerator:
                         for struct_field, struct_type in struct_fields.items():
                             if struct_type == "string":
                                 f.write(
-                                    f"\t\terror[\"{struct_field}\"] = toUtf(task_error->{struct_field});\n")
+                                    f"\t\terror[KEY_{struct_field}] = toUtf(task_error->{struct_field});\n")
                             else:
                                 f.write(
-                                    f"\t\terror[\"{struct_field}\"] = task_error->{struct_field};\n")
+                                    f"\t\terror[KEY_{struct_field}] = task_error->{struct_field};\n")
 
-                        f.write("\t\tdelete task_error;\n")
+                        f.write("\t\treleaseTaskData(task_error);\n")
                         f.write("\t}\n")
                     else:
                         args.append("data")
@@ -247,12 +255,12 @@ class ApiGenerator:
                         for struct_field, struct_type in struct_fields.items():
                             if struct_type == "string":
                                 f.write(
-                                    f"\t\tdata[\"{struct_field}\"] = toUtf(task_data->{struct_field});\n")
+                                    f"\t\tdata[KEY_{struct_field}] = toUtf(task_data->{struct_field});\n")
                             else:
                                 f.write(
-                                    f"\t\tdata[\"{struct_field}\"] = task_data->{struct_field};\n")
+                                    f"\t\tdata[KEY_{struct_field}] = task_data->{struct_field};\n")
 
-                        f.write("\t\tdelete task_data;\n")
+                        f.write("\t\treleaseTaskData(task_data);\n")
                         f.write("\t}\n")
 
                 args_str = ", ".join(args)
@@ -284,6 +292,14 @@ class ApiGenerator:
                         line = f"\tget{struct_type.capitalize()}(req, \"{struct_field}\", &myreq.{struct_field});\n"
                     f.write(line)
 
+                # 查询请求在流控时延后到下次补充令牌后发送，报撤单请求等待令牌
+                # 登录、认证等请求在回调线程中发出，不经过流控以免阻塞回调处理
+                if req_name.startswith("reqQry") or req_name.startswith("reqQuery"):
+                    f.write("\tif (!this->throttle.acquire_query())\n")
+                    f.write(f"\t\treturn this->throttle.defer([=]() mutable {{ return this->api->{name}(&myreq, reqid); }});\n")
+                elif req_name.endswith(("Insert", "Action", "Cancel")):
+                    f.write("\tthis->throttle.acquire_order();\n")
+
                 f.write(f"\tint i = this->api->{name}(&myreq, reqid);\n")
                 f.write("\treturn i;\n")
                 f.write("};\n\n")
@@ -342,6 +358,30 @@ class ApiGenerator:
 
             f.write(";\n")
 
+    def generate_source_key(self):
+        """"""
+        keys = []
+        for d in self.callbacks.values():
+            for type_ in d.values():
+                if type_ not in self.structs:
+                    continue
+
+                for struct_field in self.structs[type_].keys():
+                    if struct_field not in keys:
+                        keys.append(struct_field)
+
+        filename = f"{self.prefix}_{self.name}_source_key.cpp"
+        with open(filename, "w") as f:
+            for key in keys:
+                f.write(f"static handle KEY_{key};\n")
+
+            f.write("\n")
+            f.write("void initDictKeys()\n")
+            f.write("{\n")
+            for key in keys:
+                f.write(f"\tKEY_{key} = PyUnicode_InternFromString(\"{key}\");\n")
+            f.write("};\n")
+
 
 if __name__ == "__main__":
     generator = ApiGenerator("../../include/nh/stock/NhStockTraderApi.h", "nh", "stock", "StockTdApi")
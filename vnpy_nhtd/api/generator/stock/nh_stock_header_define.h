@@ -42,3 +42,51 @@
 #define ONRTNMARGINCOMBACTION 41
 #define ONRSPQRYSSECOMBPOSITION 42
 #define ONRSPCOMBEXERCISE 43
+
+//صƣ˳
+static const char *TASK_NAMES[] = {
+	"onFrontConnected",
+	"onFrontDisconnected",
+	"onHeartBeatWarning",
+	"onPackageStart",
+	"onPackageEnd",
+	"onRspSubscribeTopic",
+	"onRspUserLogin",
+	"onRspUserLogout",
+	"onRspUserPasswordUpdate",
+	"onRspStockInsert",
+	"onRspStockCancel",
+	"onRspOptionsInsert",
+	"onRspOptionsCancel",
+	"onRspQuoteInsert",
+	"onRspForQuote",
+	"onRspQuoteCancel",
+	"onRspStockLock",
+	"onRspExercise",
+	"onRspExerciseCancel",
+	"onRspQryPartAccount",
+	"onRspQryStockOrder",
+	"onRspQryOptionsOrder",
+	"onRspQryQuoteOrder",
+	"onRspQryStockTrade",
+	"onRspQryOptionsTrade",
+	"onRspQryPosition",
+	"onRspQryTopic",
+	"onRspQryStock",
+	"onRspQryOptions",
+	"onRtnOptionsOrder",
+	"onRtnStockOrder",
+	"onRtnQuoteOrder",
+	"onRtnOptionsTrade",
+	"onRtnStockTrade",
+	"onRtnExercise",
+	"onRspQryRate",
+	"onRspQryClient",
+	"onRspQryClientMargin",
+	"onRspQryExercise",
+	"onRtnWithdrawDeposit",
+	"onRspMarginCombAction",
+	"onRtnMarginCombAction",
+	"onRspQrySseCombPosition",
+	"onRspCombExercise",
+};
@@ -56,6 +56,7 @@ int StockTdApi::reqStockInsert(const dict &req, int reqid)
 	getString(req, "PartyID", myreq.PartyID);
 	getInt(req, "OwnerType", &myreq.OwnerType);
 	getChar(req, "TimeInForce", &myreq.TimeInForce);
+	this->throttle.acquire_order();
 	int i = this->api->ReqStockInsert(&myreq, reqid);
 	return i;
 };
@@ -67,6 +68,7 @@ int StockTdApi::reqStockCancel(const dict &req, int reqid)
 	getInt(req, "ClOrdID", &myreq.ClOrdID);
 	getInt(req, "OrigClOrdID", &myreq.OrigClOrdID);
 	getString(req, "OrderID", myreq.OrderID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqStockCancel(&myreq, reqid);
 	return i;
 };
@@ -99,6 +101,7 @@ int StockTdApi::reqOptionsInsert(const dict &req, int reqid)
 	getChar(req, "TimeInForce", &myreq.TimeInForce);
 	getChar(req, "CoveredOrUncovered", &myreq.CoveredOrUncovered);
 	getString(req, "PartyID", myreq.PartyID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqOptionsInsert(&myreq, reqid);
 	return i;
 };
@@ -110,6 +113,7 @@ int StockTdApi::reqOptionsCancel(const dict &req, int reqid)
 	getInt(req, "ClOrdID", &myreq.ClOrdID);
 	getInt(req, "OrigClOrdID", &myreq.OrigClOrdID);
 	getString(req, "OrderID", myreq.OrderID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqOptionsCancel(&myreq, reqid);
 	return i;
 };
@@ -129,6 +133,7 @@ int StockTdApi::reqQuoteInsert(const dict &req, int reqid)
 	getInt(req, "AskSize", &myreq.AskSize);
 	getChar(req, "BidPositionEffect", &myreq.BidPositionEffect);
 	getChar(req, "AskPositionEffect", &myreq.AskPositionEffect);
+	this->throttle.acquire_order();
 	int i = this->api->ReqQuoteInsert(&myreq, reqid);
 	return i;
 };
@@ -140,6 +145,7 @@ int StockTdApi::reqQuoteCancel(const dict &req, int reqid)
 	getInt(req, "ClOrdID", &myreq.ClOrdID);
 	getInt(req, "OrigClOrdID", &myreq.OrigClOrdID);
 	getString(req, "OrderID", myreq.OrderID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqQuoteCancel(&myreq, reqid);
 	return i;
 };
@@ -176,6 +182,7 @@ int StockTdApi::reqExerciseCancel(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getInt(req, "OrigClOrdID", &myreq.OrigClOrdID);
 	getString(req, "OrderID", myreq.OrderID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqExerciseCancel(&myreq, reqid);
 	return i;
 };
@@ -185,6 +192,8 @@ int StockTdApi::reqQryPartAccount(const dict &req, int reqid)
 	CStockFtdcQryPartAccountField myreq = CStockFtdcQryPartAccountField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "PartyID", myreq.PartyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryPartAccount(&myreq, reqid); });
 	int i = this->api->ReqQryPartAccount(&myreq, reqid);
 	return i;
 };
@@ -196,6 +205,8 @@ int StockTdApi::reqQryStockOrder(const dict &req, int reqid)
 	getString(req, "PartyID", myreq.PartyID);
 	getInt(req, "ClOrdID", &myreq.ClOrdID);
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryStockOrder(&myreq, reqid); });
 	int i = this->api->ReqQryStockOrder(&myreq, reqid);
 	return i;
 };
@@ -207,6 +218,8 @@ int StockTdApi::reqQryOptionsOrder(const dict &req, int reqid)
 	getString(req, "PartyID", myreq.PartyID);
 	getInt(req, "ClOrdID", &myreq.ClOrdID);
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOptionsOrder(&myreq, reqid); });
 	int i = this->api->ReqQryOptionsOrder(&myreq, reqid);
 	return i;
 };
@@ -218,6 +231,8 @@ int StockTdApi::reqQryQuoteOrder(const dict &req, int reqid)
 	getString(req, "PartyID", myreq.PartyID);
 	getInt(req, "ClOrdID", &myreq.ClOrdID);
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryQuoteOrder(&myreq, reqid); });
 	int i = this->api->ReqQryQuoteOrder(&myreq, reqid);
 	return i;
 };
@@ -229,6 +244,8 @@ int StockTdApi::reqQryStockTrade(const dict &req, int reqid)
 	getString(req, "PartyID", myreq.PartyID);
 	getString(req, "SecurityID", myreq.SecurityID);
 	getString(req, "TradeID", myreq.TradeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryStockTrade(&myreq, reqid); });
 	int i = this->api->ReqQryStockTrade(&myreq, reqid);
 	return i;
 };
@@ -240,6 +257,8 @@ int StockTdApi::reqQryOptionsTrade(const dict &req, int reqid)
 	getString(req, "PartyID", myreq.PartyID);
 	getString(req, "SecurityID", myreq.SecurityID);
 	getString(req, "ExecID", myreq.ExecID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOptionsTrade(&myreq, reqid); });
 	int i = this->api->ReqQryOptionsTrade(&myreq, reqid);
 	return i;
 };
@@ -250,6 +269,8 @@ int StockTdApi::reqQryPosition(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "PartyID", myreq.PartyID);
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryPosition(&myreq, reqid); });
 	int i = this->api->ReqQryPosition(&myreq, reqid);
 	return i;
 };
@@ -260,6 +281,8 @@ int StockTdApi::reqQryTopic(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getInt(req, "SequenceSeries", &myreq.SequenceSeries);
 	getInt(req, "SequenceNo", &myreq.SequenceNo);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTopic(&myreq, reqid); });
 	int i = this->api->ReqQryTopic(&myreq, reqid);
 	return i;
 };
@@ -269,6 +292,8 @@ int StockTdApi::reqQryStock(const dict &req, int reqid)
 	CStockFtdcQryStockField myreq = CStockFtdcQryStockField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryStock(&myreq, reqid); });
 	int i = this->api->ReqQryStock(&myreq, reqid);
 	return i;
 };
@@ -278,6 +303,8 @@ int StockTdApi::reqQryOptions(const dict &req, int reqid)
 	CStockFtdcQryOptionsField myreq = CStockFtdcQryOptionsField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOptions(&myreq, reqid); });
 	int i = this->api->ReqQryOptions(&myreq, reqid);
 	return i;
 };
@@ -288,6 +315,8 @@ int StockTdApi::reqQryRate(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "PartyID", myreq.PartyID);
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryRate(&myreq, reqid); });
 	int i = this->api->ReqQryRate(&myreq, reqid);
 	return i;
 };
@@ -298,6 +327,8 @@ int StockTdApi::reqQryClientMargin(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "PartyID", myreq.PartyID);
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryClientMargin(&myreq, reqid); });
 	int i = this->api->ReqQryClientMargin(&myreq, reqid);
 	return i;
 };
@@ -307,6 +338,8 @@ int StockTdApi::reqQryExercise(const dict &req, int reqid)
 	CStockFtdcQryExerciseField myreq = CStockFtdcQryExerciseField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "PartyID", myreq.PartyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryExercise(&myreq, reqid); });
 	int i = this->api->ReqQryExercise(&myreq, reqid);
 	return i;
 };
@@ -320,6 +353,7 @@ int StockTdApi::reqMarginCombAction(const dict &req, int reqid)
 	getInt(req, "OwnerType", &myreq.OwnerType);
 	getInt(req, "OrderQty", &myreq.OrderQty);
 	getString(req, "PartyID", myreq.PartyID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqMarginCombAction(&myreq, reqid);
 	return i;
 };
@@ -329,6 +363,8 @@ int StockTdApi::reqQrySseCombPosition(const dict &req, int reqid)
 	CStockFtdcCombPositionField myreq = CStockFtdcCombPositionField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "PartyID", myreq.PartyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQrySseCombPosition(&myreq, reqid); });
 	int i = this->api->ReqQrySseCombPosition(&myreq, reqid);
 	return i;
 };
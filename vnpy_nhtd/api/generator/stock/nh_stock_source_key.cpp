@@ -0,0 +1,256 @@
+static handle KEY_SequenceSeries;
+static handle KEY_SequenceNo;
+static handle KEY_ErrorID;
+static handle KEY_ErrorMsg;
+static handle KEY_TradingDay;
+static handle KEY_LoginTime;
+static handle KEY_MaxClOrdID;
+static handle KEY_UserID;
+static handle KEY_TradingSystemName;
+static handle KEY_DataCenterID;
+static handle KEY_PrivateFlowSize;
+static handle KEY_UserFlowSize;
+static handle KEY_ActionDay;
+static handle KEY_OldPassword;
+static handle KEY_NewPassword;
+static handle KEY_OrderID;
+static handle KEY_InsertDate;
+static handle KEY_InsertTime;
+static handle KEY_ClOrdID;
+static handle KEY_SecurityID;
+static handle KEY_OrdType;
+static handle KEY_Price;
+static handle KEY_OrderQty;
+static handle KEY_Side;
+static handle KEY_PartyID;
+static handle KEY_Qty2;
+static handle KEY_OrigClOrdId;
+static handle KEY_ExecType;
+static handle KEY_OrdStatus;
+static handle KEY_TransactTimeOnly;
+static handle KEY_DiscretionPrice;
+static handle KEY_LeavesQty;
+static handle KEY_OrigClOrdID;
+static handle KEY_OwnerType;
+static handle KEY_QuoteReqID;
+static handle KEY_BidPx;
+static handle KEY_AskPx;
+static handle KEY_BidSize;
+static handle KEY_AskSize;
+static handle KEY_BidPositionEffect;
+static handle KEY_AskPositionEffect;
+static handle KEY_PreBalance;
+static handle KEY_Balance;
+static handle KEY_Available;
+static handle KEY_CurrMargin;
+static handle KEY_FrozenMargin;
+static handle KEY_CombMargin;
+static handle KEY_Premium;
+static handle KEY_FrozenPremium;
+static handle KEY_Commi;
+static handle KEY_FrozenCommi;
+static handle KEY_CloseProfit;
+static handle KEY_PosiProfit;
+static handle KEY_Deposit;
+static handle KEY_Withdraw;
+static handle KEY_BaseReserve;
+static handle KEY_SaveDouble1;
+static handle KEY_SaveDouble2;
+static handle KEY_SaveDouble3;
+static handle KEY_PositionEffect;
+static handle KEY_TimeInForce;
+static handle KEY_CoveredOrUncovered;
+static handle KEY_TradeID;
+static handle KEY_TradeTime;
+static handle KEY_TradeVolume;
+static handle KEY_Cjjg;
+static handle KEY_Cjje;
+static handle KEY_ExecID;
+static handle KEY_LastPx;
+static handle KEY_LastQty;
+static handle KEY_OrigTime;
+static handle KEY_TotalValueTraded;
+static handle KEY_Converd;
+static handle KEY_YdPosition;
+static handle KEY_Position;
+static handle KEY_TodayPosition;
+static handle KEY_BuyTradeVolume;
+static handle KEY_SellTradeVolume;
+static handle KEY_PositionCost;
+static handle KEY_YdPositionCost;
+static handle KEY_UseMargin;
+static handle KEY_contractmultiplierunit;
+static handle KEY_startdate;
+static handle KEY_enddate;
+static handle KEY_totallongposition;
+static handle KEY_securityclosepx;
+static handle KEY_settlprice;
+static handle KEY_underlyingclosepx;
+static handle KEY_dailypriceuplimit;
+static handle KEY_dailypricedownlimit;
+static handle KEY_marginunit;
+static handle KEY_marginratioparam1;
+static handle KEY_marginratioparam2;
+static handle KEY_roundlot;
+static handle KEY_lmtordminfloor;
+static handle KEY_lmtordmaxfloor;
+static handle KEY_mktordminfloor;
+static handle KEY_mktordmaxfloor;
+static handle KEY_ticksize;
+static handle KEY_lastprice;
+static handle KEY_contractid;
+static handle KEY_contractsymbol;
+static handle KEY_underlyingsecurityid;
+static handle KEY_optiontype;
+static handle KEY_callorput;
+static handle KEY_exerciseprice;
+static handle KEY_exercisedate;
+static handle KEY_deliverydate;
+static handle KEY_expiredate;
+static handle KEY_TradeQty;
+static handle KEY_CancelQty;
+static handle KEY_OrdRejReason;
+static handle KEY_Margin;
+static handle KEY_Status;
+static handle KEY_MarginRatio;
+static handle KEY_MinMarginRatio;
+static handle KEY_AccountID;
+static handle KEY_deposit;
+static handle KEY_withdraw;
+static handle KEY_CombID;
+static handle KEY_commargin;
+static handle KEY_PosiQty;
+static handle KEY_LegSecurityID1;
+static handle KEY_LegOrderQty1;
+static handle KEY_LegSecurityID2;
+static handle KEY_LegOrderQty2;
+
+void initDictKeys()
+{
+	KEY_SequenceSeries = PyUnicode_InternFromString("SequenceSeries");
+	KEY_SequenceNo = PyUnicode_InternFromString("SequenceNo");
+	KEY_ErrorID = PyUnicode_InternFromString("ErrorID");
+	KEY_ErrorMsg = PyUnicode_InternFromString("ErrorMsg");
+	KEY_TradingDay = PyUnicode_InternFromString("TradingDay");
+	KEY_LoginTime = PyUnicode_InternFromString("LoginTime");
+	KEY_MaxClOrdID = PyUnicode_InternFromString("MaxClOrdID");
+	KEY_UserID = PyUnicode_InternFromString("UserID");
+	KEY_TradingSystemName = PyUnicode_InternFromString("TradingSystemName");
+	KEY_DataCenterID = PyUnicode_InternFromString("DataCenterID");
+	KEY_PrivateFlowSize = PyUnicode_InternFromString("PrivateFlowSize");
+	KEY_UserFlowSize = PyUnicode_InternFromString("UserFlowSize");
+	KEY_ActionDay = PyUnicode_InternFromString("ActionDay");
+	KEY_OldPassword = PyUnicode_InternFromString("OldPassword");
+	KEY_NewPassword = PyUnicode_InternFromString("NewPassword");
+	KEY_OrderID = PyUnicode_InternFromString("OrderID");
+	KEY_InsertDate = PyUnicode_InternFromString("InsertDate");
+	KEY_InsertTime = PyUnicode_InternFromString("InsertTime");
+	KEY_ClOrdID = PyUnicode_InternFromString("ClOrdID");
+	KEY_SecurityID = PyUnicode_InternFromString("SecurityID");
+	KEY_OrdType = PyUnicode_InternFromString("OrdType");
+	KEY_Price = PyUnicode_InternFromString("Price");
+	KEY_OrderQty = PyUnicode_InternFromString("OrderQty");
+	KEY_Side = PyUnicode_InternFromString("Side");
+	KEY_PartyID = PyUnicode_InternFromString("PartyID");
+	KEY_Qty2 = PyUnicode_InternFromString("Qty2");
+	KEY_OrigClOrdId = PyUnicode_InternFromString("OrigClOrdId");
+	KEY_ExecType = PyUnicode_InternFromString("ExecType");
+	KEY_OrdStatus = PyUnicode_InternFromString("OrdStatus");
+	KEY_TransactTimeOnly = PyUnicode_InternFromString("TransactTimeOnly");
+	KEY_DiscretionPrice = PyUnicode_InternFromString("DiscretionPrice");
+	KEY_LeavesQty = PyUnicode_InternFromString("LeavesQty");
+	KEY_OrigClOrdID = PyUnicode_InternFromString("OrigClOrdID");
+	KEY_OwnerType = PyUnicode_InternFromString("OwnerType");
+	KEY_QuoteReqID = PyUnicode_InternFromString("QuoteReqID");
+	KEY_BidPx = PyUnicode_InternFromString("BidPx");
+	KEY_AskPx = PyUnicode_InternFromString("AskPx");
+	KEY_BidSize = PyUnicode_InternFromString("BidSize");
+	KEY_AskSize = PyUnicode_InternFromString("AskSize");
+	KEY_BidPositionEffect = PyUnicode_InternFromString("BidPositionEffect");
+	KEY_AskPositionEffect = PyUnicode_InternFromString("AskPositionEffect");
+	KEY_PreBalance = PyUnicode_InternFromString("PreBalance");
+	KEY_Balance = PyUnicode_InternFromString("Balance");
+	KEY_Available = PyUnicode_InternFromString("Available");
+	KEY_CurrMargin = PyUnicode_InternFromString("CurrMargin");
+	KEY_FrozenMargin = PyUnicode_InternFromString("FrozenMargin");
+	KEY_CombMargin = PyUnicode_InternFromString("CombMargin");
+	KEY_Premium = PyUnicode_InternFromString("Premium");
+	KEY_FrozenPremium = PyUnicode_InternFromString("FrozenPremium");
+	KEY_Commi = PyUnicode_InternFromString("Commi");
+	KEY_FrozenCommi = PyUnicode_InternFromString("FrozenCommi");
+	KEY_CloseProfit = PyUnicode_InternFromString("CloseProfit");
+	KEY_PosiProfit = PyUnicode_InternFromString("PosiProfit");
+	KEY_Deposit = PyUnicode_InternFromString("Deposit");
+	KEY_Withdraw = PyUnicode_InternFromString("Withdraw");
+	KEY_BaseReserve = PyUnicode_InternFromString("BaseReserve");
+	KEY_SaveDouble1 = PyUnicode_InternFromString("SaveDouble1");
+	KEY_SaveDouble2 = PyUnicode_InternFromString("SaveDouble2");
+	KEY_SaveDouble3 = PyUnicode_InternFromString("SaveDouble3");
+	KEY_PositionEffect = PyUnicode_InternFromString("PositionEffect");
+	KEY_TimeInForce = PyUnicode_InternFromString("TimeInForce");
+	KEY_CoveredOrUncovered = PyUnicode_InternFromString("CoveredOrUncovered");
+	KEY_TradeID = PyUnicode_InternFromString("TradeID");
+	KEY_TradeTime = PyUnicode_InternFromString("TradeTime");
+	KEY_TradeVolume = PyUnicode_InternFromString("TradeVolume");
+	KEY_Cjjg = PyUnicode_InternFromString("Cjjg");
+	KEY_Cjje = PyUnicode_InternFromString("Cjje");
+	KEY_ExecID = PyUnicode_InternFromString("ExecID");
+	KEY_LastPx = PyUnicode_InternFromString("LastPx");
+	KEY_LastQty = PyUnicode_InternFromString("LastQty");
+	KEY_OrigTime = PyUnicode_InternFromString("OrigTime");
+	KEY_TotalValueTraded = PyUnicode_InternFromString("TotalValueTraded");
+	KEY_Converd = PyUnicode_InternFromString("Converd");
+	KEY_YdPosition = PyUnicode_InternFromString("YdPosition");
+	KEY_Position = PyUnicode_InternFromString("Position");
+	KEY_TodayPosition = PyUnicode_InternFromString("TodayPosition");
+	KEY_BuyTradeVolume = PyUnicode_InternFromString("BuyTradeVolume");
+	KEY_SellTradeVolume = PyUnicode_InternFromString("SellTradeVolume");
+	KEY_PositionCost = PyUnicode_InternFromString("PositionCost");
+	KEY_YdPositionCost = PyUnicode_InternFromString("YdPositionCost");
+	KEY_UseMargin = PyUnicode_InternFromString("UseMargin");
+	KEY_contractmultiplierunit = PyUnicode_InternFromString("contractmultiplierunit");
+	KEY_startdate = PyUnicode_InternFromString("startdate");
+	KEY_enddate = PyUnicode_InternFromString("enddate");
+	KEY_totallongposition = PyUnicode_InternFromString("totallongposition");
+	KEY_securityclosepx = PyUnicode_InternFromString("securityclosepx");
+	KEY_settlprice = PyUnicode_InternFromString("settlprice");
+	KEY_underlyingclosepx = PyUnicode_InternFromString("underlyingclosepx");
+	KEY_dailypriceuplimit = PyUnicode_InternFromString("dailypriceuplimit");
+	KEY_dailypricedownlimit = PyUnicode_InternFromString("dailypricedownlimit");
+	KEY_marginunit = PyUnicode_InternFromString("marginunit");
+	KEY_marginratioparam1 = PyUnicode_InternFromString("marginratioparam1");
+	KEY_marginratioparam2 = PyUnicode_InternFromString("marginratioparam2");
+	KEY_roundlot = PyUnicode_InternFromString("roundlot");
+	KEY_lmtordminfloor = PyUnicode_InternFromString("lmtordminfloor");
+	KEY_lmtordmaxfloor = PyUnicode_InternFromString("lmtordmaxfloor");
+	KEY_mktordminfloor = PyUnicode_InternFromString("mktordminfloor");
+	KEY_mktordmaxfloor = PyUnicode_InternFromString("mktordmaxfloor");
+	KEY_ticksize = PyUnicode_InternFromString("ticksize");
+	KEY_lastprice = PyUnicode_InternFromString("lastprice");
+	KEY_contractid = PyUnicode_InternFromString("contractid");
+	KEY_contractsymbol = PyUnicode_InternFromString("contractsymbol");
+	KEY_underlyingsecurityid = PyUnicode_InternFromString("underlyingsecurityid");
+	KEY_optiontype = PyUnicode_InternFromString("optiontype");
+	KEY_callorput = PyUnicode_InternFromString("callorput");
+	KEY_exerciseprice = PyUnicode_InternFromString("exerciseprice");
+	KEY_exercisedate = PyUnicode_InternFromString("exercisedate");
+	KEY_deliverydate = PyUnicode_InternFromString("deliverydate");
+	KEY_expiredate = PyUnicode_InternFromString("expiredate");
+	KEY_TradeQty = PyUnicode_InternFromString("TradeQty");
+	KEY_CancelQty = PyUnicode_InternFromString("CancelQty");
+	KEY_OrdRejReason = PyUnicode_InternFromString("OrdRejReason");
+	KEY_Margin = PyUnicode_InternFromString("Margin");
+	KEY_Status = PyUnicode_InternFromString("Status");
+	KEY_MarginRatio = PyUnicode_InternFromString("MarginRatio");
+	KEY_MinMarginRatio = PyUnicode_InternFromString("MinMarginRatio");
+	KEY_AccountID = PyUnicode_InternFromString("AccountID");
+	KEY_deposit = PyUnicode_InternFromString("deposit");
+	KEY_withdraw = PyUnicode_InternFromString("withdraw");
+	KEY_CombID = PyUnicode_InternFromString("CombID");
+	KEY_commargin = PyUnicode_InternFromString("commargin");
+	KEY_PosiQty = PyUnicode_InternFromString("PosiQty");
+	KEY_LegSecurityID1 = PyUnicode_InternFromString("LegSecurityID1");
+	KEY_LegOrderQty1 = PyUnicode_InternFromString("LegOrderQty1");
+	KEY_LegSecurityID2 = PyUnicode_InternFromString("LegSecurityID2");
+	KEY_LegOrderQty2 = PyUnicode_InternFromString("LegOrderQty2");
+};
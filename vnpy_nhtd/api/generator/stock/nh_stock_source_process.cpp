@@ -35,17 +35,17 @@ void StockTdApi::processRspSubscribeTopic(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcDisseminationField *task_data = (CStockFtdcDisseminationField*)task->task_data;
-		data["SequenceSeries"] = task_data->SequenceSeries;
-		data["SequenceNo"] = task_data->SequenceNo;
-		delete task_data;
+		data[KEY_SequenceSeries] = task_data->SequenceSeries;
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspSubscribeTopic(data, error, task->task_id, task->task_last);
 };
@@ -57,24 +57,24 @@ void StockTdApi::processRspUserLogin(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspUserLoginField *task_data = (CStockFtdcRspUserLoginField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["LoginTime"] = toUtf(task_data->LoginTime);
-		data["MaxClOrdID"] = task_data->MaxClOrdID;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["TradingSystemName"] = toUtf(task_data->TradingSystemName);
-		data["DataCenterID"] = task_data->DataCenterID;
-		data["PrivateFlowSize"] = task_data->PrivateFlowSize;
-		data["UserFlowSize"] = task_data->UserFlowSize;
-		data["ActionDay"] = toUtf(task_data->ActionDay);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_LoginTime] = toUtf(task_data->LoginTime);
+		data[KEY_MaxClOrdID] = task_data->MaxClOrdID;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_TradingSystemName] = toUtf(task_data->TradingSystemName);
+		data[KEY_DataCenterID] = task_data->DataCenterID;
+		data[KEY_PrivateFlowSize] = task_data->PrivateFlowSize;
+		data[KEY_UserFlowSize] = task_data->UserFlowSize;
+		data[KEY_ActionDay] = toUtf(task_data->ActionDay);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspUserLogin(data, error, task->task_id, task->task_last);
 };
@@ -86,16 +86,16 @@ void StockTdApi::processRspUserLogout(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspUserLogoutField *task_data = (CStockFtdcRspUserLogoutField*)task->task_data;
-		data["UserID"] = toUtf(task_data->UserID);
-		delete task_data;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspUserLogout(data, error, task->task_id, task->task_last);
 };
@@ -107,18 +107,18 @@ void StockTdApi::processRspUserPasswordUpdate(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcUserPasswordUpdateField *task_data = (CStockFtdcUserPasswordUpdateField*)task->task_data;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OldPassword"] = toUtf(task_data->OldPassword);
-		data["NewPassword"] = toUtf(task_data->NewPassword);
-		delete task_data;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OldPassword] = toUtf(task_data->OldPassword);
+		data[KEY_NewPassword] = toUtf(task_data->NewPassword);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspUserPasswordUpdate(data, error, task->task_id, task->task_last);
 };
@@ -130,26 +130,26 @@ void StockTdApi::processRspStockInsert(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcStockInsertRspField *task_data = (CStockFtdcStockInsertRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OrdType"] = task_data->OrdType;
-		data["Price"] = task_data->Price;
-		data["OrderQty"] = task_data->OrderQty;
-		data["Side"] = task_data->Side;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["Qty2"] = task_data->Qty2;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OrdType] = task_data->OrdType;
+		data[KEY_Price] = task_data->Price;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_Qty2] = task_data->Qty2;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspStockInsert(data, error, task->task_id, task->task_last);
 };
@@ -161,26 +161,26 @@ void StockTdApi::processRspStockCancel(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcStockCancelRspField *task_data = (CStockFtdcStockCancelRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["Price"] = task_data->Price;
-		data["OrderQty"] = task_data->OrderQty;
-		data["Side"] = task_data->Side;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["OrigClOrdId"] = task_data->OrigClOrdId;
-		data["Qty2"] = task_data->Qty2;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_Price] = task_data->Price;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_OrigClOrdId] = task_data->OrigClOrdId;
+		data[KEY_Qty2] = task_data->Qty2;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspStockCancel(data, error, task->task_id, task->task_last);
 };
@@ -192,23 +192,23 @@ void StockTdApi::processRspOptionsInsert(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcOptionsInsertRspField *task_data = (CStockFtdcOptionsInsertRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ExecType"] = task_data->ExecType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["DiscretionPrice"] = task_data->DiscretionPrice;
-		data["LeavesQty"] = task_data->LeavesQty;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_DiscretionPrice] = task_data->DiscretionPrice;
+		data[KEY_LeavesQty] = task_data->LeavesQty;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspOptionsInsert(data, error, task->task_id, task->task_last);
 };
@@ -220,24 +220,24 @@ void StockTdApi::processRspOptionsCancel(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcOptionsCancelRspField *task_data = (CStockFtdcOptionsCancelRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ExecType"] = task_data->ExecType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["OrigClOrdID"] = task_data->OrigClOrdID;
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["DiscretionPrice"] = task_data->DiscretionPrice;
-		data["LeavesQty"] = task_data->LeavesQty;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_OrigClOrdID] = task_data->OrigClOrdID;
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_DiscretionPrice] = task_data->DiscretionPrice;
+		data[KEY_LeavesQty] = task_data->LeavesQty;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspOptionsCancel(data, error, task->task_id, task->task_last);
 };
@@ -249,29 +249,29 @@ void StockTdApi::processRspQuoteInsert(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcQuoteInsertRspField *task_data = (CStockFtdcQuoteInsertRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ExecType"] = task_data->ExecType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["QuoteReqID"] = toUtf(task_data->QuoteReqID);
-		data["BidPx"] = task_data->BidPx;
-		data["AskPx"] = task_data->AskPx;
-		data["BidSize"] = task_data->BidSize;
-		data["AskSize"] = task_data->AskSize;
-		data["BidPositionEffect"] = task_data->BidPositionEffect;
-		data["AskPositionEffect"] = task_data->AskPositionEffect;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_QuoteReqID] = toUtf(task_data->QuoteReqID);
+		data[KEY_BidPx] = task_data->BidPx;
+		data[KEY_AskPx] = task_data->AskPx;
+		data[KEY_BidSize] = task_data->BidSize;
+		data[KEY_AskSize] = task_data->AskSize;
+		data[KEY_BidPositionEffect] = task_data->BidPositionEffect;
+		data[KEY_AskPositionEffect] = task_data->AskPositionEffect;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQuoteInsert(data, error, task->task_id, task->task_last);
 };
@@ -283,20 +283,20 @@ void StockTdApi::processRspForQuote(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcForQuoteRspField *task_data = (CStockFtdcForQuoteRspField*)task->task_data;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["QuoteReqID"] = toUtf(task_data->QuoteReqID);
-		delete task_data;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_QuoteReqID] = toUtf(task_data->QuoteReqID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspForQuote(data, error, task->task_id, task->task_last);
 };
@@ -308,21 +308,21 @@ void StockTdApi::processRspQuoteCancel(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcQuoteCancelRspField *task_data = (CStockFtdcQuoteCancelRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ExecType"] = task_data->ExecType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["OrigClOrdID"] = task_data->OrigClOrdID;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_OrigClOrdID] = task_data->OrigClOrdID;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQuoteCancel(data, error, task->task_id, task->task_last);
 };
@@ -334,19 +334,19 @@ void StockTdApi::processRspStockLock(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcStockLockRspField *task_data = (CStockFtdcStockLockRspField*)task->task_data;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OrderQty"] = task_data->OrderQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		delete task_data;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspStockLock(data, error, task->task_id, task->task_last);
 };
@@ -358,21 +358,21 @@ void StockTdApi::processRspExercise(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcExerciseRspField *task_data = (CStockFtdcExerciseRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrderQty"] = task_data->OrderQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspExercise(data, error, task->task_id, task->task_last);
 };
@@ -384,16 +384,16 @@ void StockTdApi::processRspExerciseCancel(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcExerciseCancelRspField *task_data = (CStockFtdcExerciseCancelRspField*)task->task_data;
-		data["OrigClOrdID"] = task_data->OrigClOrdID;
-		delete task_data;
+		data[KEY_OrigClOrdID] = task_data->OrigClOrdID;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspExerciseCancel(data, error, task->task_id, task->task_last);
 };
@@ -405,35 +405,35 @@ void StockTdApi::processRspQryPartAccount(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspPartAccountField *task_data = (CStockFtdcRspPartAccountField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PreBalance"] = task_data->PreBalance;
-		data["Balance"] = task_data->Balance;
-		data["Available"] = task_data->Available;
-		data["CurrMargin"] = task_data->CurrMargin;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["CombMargin"] = task_data->CombMargin;
-		data["Premium"] = task_data->Premium;
-		data["FrozenPremium"] = task_data->FrozenPremium;
-		data["Commi"] = task_data->Commi;
-		data["FrozenCommi"] = task_data->FrozenCommi;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["PosiProfit"] = task_data->PosiProfit;
-		data["Deposit"] = task_data->Deposit;
-		data["Withdraw"] = task_data->Withdraw;
-		data["BaseReserve"] = task_data->BaseReserve;
-		data["SaveDouble1"] = task_data->SaveDouble1;
-		data["SaveDouble2"] = task_data->SaveDouble2;
-		data["SaveDouble3"] = task_data->SaveDouble3;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PreBalance] = task_data->PreBalance;
+		data[KEY_Balance] = task_data->Balance;
+		data[KEY_Available] = task_data->Available;
+		data[KEY_CurrMargin] = task_data->CurrMargin;
+		data[KEY_FrozenMargin] = task_data->FrozenMargin;
+		data[KEY_CombMargin] = task_data->CombMargin;
+		data[KEY_Premium] = task_data->Premium;
+		data[KEY_FrozenPremium] = task_data->FrozenPremium;
+		data[KEY_Commi] = task_data->Commi;
+		data[KEY_FrozenCommi] = task_data->FrozenCommi;
+		data[KEY_CloseProfit] = task_data->CloseProfit;
+		data[KEY_PosiProfit] = task_data->PosiProfit;
+		data[KEY_Deposit] = task_data->Deposit;
+		data[KEY_Withdraw] = task_data->Withdraw;
+		data[KEY_BaseReserve] = task_data->BaseReserve;
+		data[KEY_SaveDouble1] = task_data->SaveDouble1;
+		data[KEY_SaveDouble2] = task_data->SaveDouble2;
+		data[KEY_SaveDouble3] = task_data->SaveDouble3;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryPartAccount(data, error, task->task_id, task->task_last);
 };
@@ -445,26 +445,26 @@ void StockTdApi::processRspQryStockOrder(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryStockOrderField *task_data = (CStockFtdcRspQryStockOrderField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OrdType"] = task_data->OrdType;
-		data["Price"] = task_data->Price;
-		data["OrderQty"] = task_data->OrderQty;
-		data["Side"] = task_data->Side;
-		data["Qty2"] = task_data->Qty2;
-		data["OrdStatus"] = task_data->OrdStatus;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OrdType] = task_data->OrdType;
+		data[KEY_Price] = task_data->Price;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_Qty2] = task_data->Qty2;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryStockOrder(data, error, task->task_id, task->task_last);
 };
@@ -476,33 +476,33 @@ void StockTdApi::processRspQryOptionsOrder(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryOptionsOrderField *task_data = (CStockFtdcRspQryOptionsOrderField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ExecType"] = task_data->ExecType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["DiscretionPrice"] = task_data->DiscretionPrice;
-		data["LeavesQty"] = task_data->LeavesQty;
-		data["OwnerType"] = task_data->OwnerType;
-		data["Price"] = task_data->Price;
-		data["OrderQty"] = task_data->OrderQty;
-		data["Side"] = task_data->Side;
-		data["PositionEffect"] = task_data->PositionEffect;
-		data["OrdType"] = task_data->OrdType;
-		data["TimeInForce"] = task_data->TimeInForce;
-		data["CoveredOrUncovered"] = task_data->CoveredOrUncovered;
-		data["UserID"] = toUtf(task_data->UserID);
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_DiscretionPrice] = task_data->DiscretionPrice;
+		data[KEY_LeavesQty] = task_data->LeavesQty;
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_Price] = task_data->Price;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_PositionEffect] = task_data->PositionEffect;
+		data[KEY_OrdType] = task_data->OrdType;
+		data[KEY_TimeInForce] = task_data->TimeInForce;
+		data[KEY_CoveredOrUncovered] = task_data->CoveredOrUncovered;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOptionsOrder(data, error, task->task_id, task->task_last);
 };
@@ -514,28 +514,28 @@ void StockTdApi::processRspQryQuoteOrder(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryQuoteOrderField *task_data = (CStockFtdcRspQryQuoteOrderField*)task->task_data;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["QuoteReqID"] = toUtf(task_data->QuoteReqID);
-		data["BidPx"] = task_data->BidPx;
-		data["AskPx"] = task_data->AskPx;
-		data["BidSize"] = task_data->BidSize;
-		data["AskSize"] = task_data->AskSize;
-		data["BidPositionEffect"] = task_data->BidPositionEffect;
-		data["AskPositionEffect"] = task_data->AskPositionEffect;
-		delete task_data;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_QuoteReqID] = toUtf(task_data->QuoteReqID);
+		data[KEY_BidPx] = task_data->BidPx;
+		data[KEY_AskPx] = task_data->AskPx;
+		data[KEY_BidSize] = task_data->BidSize;
+		data[KEY_AskSize] = task_data->AskSize;
+		data[KEY_BidPositionEffect] = task_data->BidPositionEffect;
+		data[KEY_AskPositionEffect] = task_data->AskPositionEffect;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryQuoteOrder(data, error, task->task_id, task->task_last);
 };
@@ -547,27 +547,27 @@ void StockTdApi::processRspQryStockTrade(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcStockTradeField *task_data = (CStockFtdcStockTradeField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["TradeVolume"] = task_data->TradeVolume;
-		data["Side"] = task_data->Side;
-		data["Cjjg"] = task_data->Cjjg;
-		data["Cjje"] = task_data->Cjje;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_TradeID] = toUtf(task_data->TradeID);
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_TradeVolume] = task_data->TradeVolume;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_Cjjg] = task_data->Cjjg;
+		data[KEY_Cjje] = task_data->Cjje;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryStockTrade(data, error, task->task_id, task->task_last);
 };
@@ -579,32 +579,32 @@ void StockTdApi::processRspQryOptionsTrade(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcOptionsTradeField *task_data = (CStockFtdcOptionsTradeField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["ExecID"] = toUtf(task_data->ExecID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["LastPx"] = task_data->LastPx;
-		data["LastQty"] = task_data->LastQty;
-		data["LeavesQty"] = task_data->LeavesQty;
-		data["Side"] = task_data->Side;
-		data["PositionEffect"] = task_data->PositionEffect;
-		data["CoveredOrUncovered"] = task_data->CoveredOrUncovered;
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["OrigTime"] = toUtf(task_data->OrigTime);
-		data["ExecType"] = task_data->ExecType;
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["TotalValueTraded"] = task_data->TotalValueTraded;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_ExecID] = toUtf(task_data->ExecID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_LastPx] = task_data->LastPx;
+		data[KEY_LastQty] = task_data->LastQty;
+		data[KEY_LeavesQty] = task_data->LeavesQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_PositionEffect] = task_data->PositionEffect;
+		data[KEY_CoveredOrUncovered] = task_data->CoveredOrUncovered;
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_OrigTime] = toUtf(task_data->OrigTime);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_TotalValueTraded] = task_data->TotalValueTraded;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOptionsTrade(data, error, task->task_id, task->task_last);
 };
@@ -616,27 +616,27 @@ void StockTdApi::processRspQryPosition(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspPositionField *task_data = (CStockFtdcRspPositionField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["Converd"] = task_data->Converd;
-		data["Side"] = task_data->Side;
-		data["YdPosition"] = task_data->YdPosition;
-		data["Position"] = task_data->Position;
-		data["TodayPosition"] = task_data->TodayPosition;
-		data["BuyTradeVolume"] = task_data->BuyTradeVolume;
-		data["SellTradeVolume"] = task_data->SellTradeVolume;
-		data["PositionCost"] = task_data->PositionCost;
-		data["YdPositionCost"] = task_data->YdPositionCost;
-		data["UseMargin"] = task_data->UseMargin;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_Converd] = task_data->Converd;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_YdPosition] = task_data->YdPosition;
+		data[KEY_Position] = task_data->Position;
+		data[KEY_TodayPosition] = task_data->TodayPosition;
+		data[KEY_BuyTradeVolume] = task_data->BuyTradeVolume;
+		data[KEY_SellTradeVolume] = task_data->SellTradeVolume;
+		data[KEY_PositionCost] = task_data->PositionCost;
+		data[KEY_YdPositionCost] = task_data->YdPositionCost;
+		data[KEY_UseMargin] = task_data->UseMargin;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryPosition(data, error, task->task_id, task->task_last);
 };
@@ -648,17 +648,17 @@ void StockTdApi::processRspQryTopic(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcDisseminationField *task_data = (CStockFtdcDisseminationField*)task->task_data;
-		data["SequenceSeries"] = task_data->SequenceSeries;
-		data["SequenceNo"] = task_data->SequenceNo;
-		delete task_data;
+		data[KEY_SequenceSeries] = task_data->SequenceSeries;
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTopic(data, error, task->task_id, task->task_last);
 };
@@ -670,35 +670,35 @@ void StockTdApi::processRspQryStock(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryStockField *task_data = (CStockFtdcRspQryStockField*)task->task_data;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["contractmultiplierunit"] = task_data->contractmultiplierunit;
-		data["startdate"] = toUtf(task_data->startdate);
-		data["enddate"] = toUtf(task_data->enddate);
-		data["totallongposition"] = task_data->totallongposition;
-		data["securityclosepx"] = task_data->securityclosepx;
-		data["settlprice"] = task_data->settlprice;
-		data["underlyingclosepx"] = task_data->underlyingclosepx;
-		data["dailypriceuplimit"] = task_data->dailypriceuplimit;
-		data["dailypricedownlimit"] = task_data->dailypricedownlimit;
-		data["marginunit"] = task_data->marginunit;
-		data["marginratioparam1"] = task_data->marginratioparam1;
-		data["marginratioparam2"] = task_data->marginratioparam2;
-		data["roundlot"] = task_data->roundlot;
-		data["lmtordminfloor"] = task_data->lmtordminfloor;
-		data["lmtordmaxfloor"] = task_data->lmtordmaxfloor;
-		data["mktordminfloor"] = task_data->mktordminfloor;
-		data["mktordmaxfloor"] = task_data->mktordmaxfloor;
-		data["ticksize"] = task_data->ticksize;
-		data["lastprice"] = task_data->lastprice;
-		delete task_data;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_contractmultiplierunit] = task_data->contractmultiplierunit;
+		data[KEY_startdate] = toUtf(task_data->startdate);
+		data[KEY_enddate] = toUtf(task_data->enddate);
+		data[KEY_totallongposition] = task_data->totallongposition;
+		data[KEY_securityclosepx] = task_data->securityclosepx;
+		data[KEY_settlprice] = task_data->settlprice;
+		data[KEY_underlyingclosepx] = task_data->underlyingclosepx;
+		data[KEY_dailypriceuplimit] = task_data->dailypriceuplimit;
+		data[KEY_dailypricedownlimit] = task_data->dailypricedownlimit;
+		data[KEY_marginunit] = task_data->marginunit;
+		data[KEY_marginratioparam1] = task_data->marginratioparam1;
+		data[KEY_marginratioparam2] = task_data->marginratioparam2;
+		data[KEY_roundlot] = task_data->roundlot;
+		data[KEY_lmtordminfloor] = task_data->lmtordminfloor;
+		data[KEY_lmtordmaxfloor] = task_data->lmtordmaxfloor;
+		data[KEY_mktordminfloor] = task_data->mktordminfloor;
+		data[KEY_mktordmaxfloor] = task_data->mktordmaxfloor;
+		data[KEY_ticksize] = task_data->ticksize;
+		data[KEY_lastprice] = task_data->lastprice;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryStock(data, error, task->task_id, task->task_last);
 };
@@ -710,42 +710,44 @@ void StockTdApi::processRspQryOptions(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryOptionsField *task_data = (CStockFtdcRspQryOptionsField*)task->task_data;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["underlyingsecurityid"] = toUtf(task_data->underlyingsecurityid);
-		data["optiontype"] = task_data->optiontype;
-		data["callorput"] = task_data->callorput;
-		data["contractmultiplierunit"] = task_data->contractmultiplierunit;
-		data["exerciseprice"] = task_data->exerciseprice;
-		data["startdate"] = toUtf(task_data->startdate);
-		data["enddate"] = toUtf(task_data->enddate);
-		data["exercisedate"] = toUtf(task_data->exercisedate);
-		data["deliverydate"] = toUtf(task_data->deliverydate);
-		data["expiredate"] = toUtf(task_data->expiredate);
-		data["totallongposition"] = task_data->totallongposition;
-		data["securityclosepx"] = task_data->securityclosepx;
-		data["settlprice"] = task_data->settlprice;
-		data["underlyingclosepx"] = task_data->underlyingclosepx;
-		data["dailypriceuplimit"] = task_data->dailypriceuplimit;
-		data["dailypricedownlimit"] = task_data->dailypricedownlimit;
-		data["marginunit"] = task_data->marginunit;
-		data["marginratioparam1"] = task_data->marginratioparam1;
-		data["marginratioparam2"] = task_data->marginratioparam2;
-		data["roundlot"] = task_data->roundlot;
-		data["lmtordminfloor"] = task_data->lmtordminfloor;
-		data["lmtordmaxfloor"] = task_data->lmtordmaxfloor;
-		data["mktordminfloor"] = task_data->mktordminfloor;
-		data["mktordmaxfloor"] = task_data->mktordmaxfloor;
-		data["ticksize"] = task_data->ticksize;
-		data["lastprice"] = task_data->lastprice;
-		delete task_data;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_contractid] = toUtf(task_data->contractid);
+		data[KEY_contractsymbol] = toUtf(task_data->contractsymbol);
+		data[KEY_underlyingsecurityid] = toUtf(task_data->underlyingsecurityid);
+		data[KEY_optiontype] = task_data->optiontype;
+		data[KEY_callorput] = task_data->callorput;
+		data[KEY_contractmultiplierunit] = task_data->contractmultiplierunit;
+		data[KEY_exerciseprice] = task_data->exerciseprice;
+		data[KEY_startdate] = toUtf(task_data->startdate);
+		data[KEY_enddate] = toUtf(task_data->enddate);
+		data[KEY_exercisedate] = toUtf(task_data->exercisedate);
+		data[KEY_deliverydate] = toUtf(task_data->deliverydate);
+		data[KEY_expiredate] = toUtf(task_data->expiredate);
+		data[KEY_totallongposition] = task_data->totallongposition;
+		data[KEY_securityclosepx] = task_data->securityclosepx;
+		data[KEY_settlprice] = task_data->settlprice;
+		data[KEY_underlyingclosepx] = task_data->underlyingclosepx;
+		data[KEY_dailypriceuplimit] = task_data->dailypriceuplimit;
+		data[KEY_dailypricedownlimit] = task_data->dailypricedownlimit;
+		data[KEY_marginunit] = task_data->marginunit;
+		data[KEY_marginratioparam1] = task_data->marginratioparam1;
+		data[KEY_marginratioparam2] = task_data->marginratioparam2;
+		data[KEY_roundlot] = task_data->roundlot;
+		data[KEY_lmtordminfloor] = task_data->lmtordminfloor;
+		data[KEY_lmtordmaxfloor] = task_data->lmtordmaxfloor;
+		data[KEY_mktordminfloor] = task_data->mktordminfloor;
+		data[KEY_mktordmaxfloor] = task_data->mktordmaxfloor;
+		data[KEY_ticksize] = task_data->ticksize;
+		data[KEY_lastprice] = task_data->lastprice;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOptions(data, error, task->task_id, task->task_last);
 };
@@ -757,26 +759,26 @@ void StockTdApi::processRtnOptionsOrder(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcOptionsOrderField *task_data = (CStockFtdcOptionsOrderField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["TradeQty"] = task_data->TradeQty;
-		data["CancelQty"] = task_data->CancelQty;
-		data["Price"] = task_data->Price;
-		data["OrderQty"] = task_data->OrderQty;
-		data["Side"] = task_data->Side;
-		data["DiscretionPrice"] = task_data->DiscretionPrice;
-		data["PositionEffect"] = task_data->PositionEffect;
-		data["CoveredOrUncovered"] = task_data->CoveredOrUncovered;
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["OrdType"] = task_data->OrdType;
-		data["TimeInForce"] = task_data->TimeInForce;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrdRejReason"] = task_data->OrdRejReason;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_TradeQty] = task_data->TradeQty;
+		data[KEY_CancelQty] = task_data->CancelQty;
+		data[KEY_Price] = task_data->Price;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_DiscretionPrice] = task_data->DiscretionPrice;
+		data[KEY_PositionEffect] = task_data->PositionEffect;
+		data[KEY_CoveredOrUncovered] = task_data->CoveredOrUncovered;
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_OrdType] = task_data->OrdType;
+		data[KEY_TimeInForce] = task_data->TimeInForce;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrdRejReason] = task_data->OrdRejReason;
+		releaseTaskData(task_data);
 	}
 	this->onRtnOptionsOrder(data);
 };
@@ -788,21 +790,21 @@ void StockTdApi::processRtnStockOrder(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcStockOrderField *task_data = (CStockFtdcStockOrderField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["Price"] = task_data->Price;
-		data["OrderQty"] = task_data->OrderQty;
-		data["Side"] = task_data->Side;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["Qty2"] = task_data->Qty2;
-		data["TradeQty"] = task_data->TradeQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["TimeInForce"] = task_data->TimeInForce;
-		data["OrdRejReason"] = task_data->OrdRejReason;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_Price] = task_data->Price;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_Qty2] = task_data->Qty2;
+		data[KEY_TradeQty] = task_data->TradeQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_TimeInForce] = task_data->TimeInForce;
+		data[KEY_OrdRejReason] = task_data->OrdRejReason;
+		releaseTaskData(task_data);
 	}
 	this->onRtnStockOrder(data);
 };
@@ -814,21 +816,21 @@ void StockTdApi::processRtnQuoteOrder(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcQuoteOrderField *task_data = (CStockFtdcQuoteOrderField*)task->task_data;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["QuoteReqID"] = toUtf(task_data->QuoteReqID);
-		data["BidPx"] = task_data->BidPx;
-		data["AskPx"] = task_data->AskPx;
-		data["BidSize"] = task_data->BidSize;
-		data["AskSize"] = task_data->AskSize;
-		data["BidPositionEffect"] = task_data->BidPositionEffect;
-		data["AskPositionEffect"] = task_data->AskPositionEffect;
-		data["OrdRejReason"] = task_data->OrdRejReason;
-		delete task_data;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_QuoteReqID] = toUtf(task_data->QuoteReqID);
+		data[KEY_BidPx] = task_data->BidPx;
+		data[KEY_AskPx] = task_data->AskPx;
+		data[KEY_BidSize] = task_data->BidSize;
+		data[KEY_AskSize] = task_data->AskSize;
+		data[KEY_BidPositionEffect] = task_data->BidPositionEffect;
+		data[KEY_AskPositionEffect] = task_data->AskPositionEffect;
+		data[KEY_OrdRejReason] = task_data->OrdRejReason;
+		releaseTaskData(task_data);
 	}
 	this->onRtnQuoteOrder(data);
 };
@@ -840,24 +842,24 @@ void StockTdApi::processRtnOptionsTrade(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcOptionsTradeField *task_data = (CStockFtdcOptionsTradeField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["ExecID"] = toUtf(task_data->ExecID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["LastPx"] = task_data->LastPx;
-		data["LastQty"] = task_data->LastQty;
-		data["LeavesQty"] = task_data->LeavesQty;
-		data["Side"] = task_data->Side;
-		data["PositionEffect"] = task_data->PositionEffect;
-		data["CoveredOrUncovered"] = task_data->CoveredOrUncovered;
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["OrigTime"] = toUtf(task_data->OrigTime);
-		data["ExecType"] = task_data->ExecType;
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["TotalValueTraded"] = task_data->TotalValueTraded;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_ExecID] = toUtf(task_data->ExecID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_LastPx] = task_data->LastPx;
+		data[KEY_LastQty] = task_data->LastQty;
+		data[KEY_LeavesQty] = task_data->LeavesQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_PositionEffect] = task_data->PositionEffect;
+		data[KEY_CoveredOrUncovered] = task_data->CoveredOrUncovered;
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_OrigTime] = toUtf(task_data->OrigTime);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_TotalValueTraded] = task_data->TotalValueTraded;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		releaseTaskData(task_data);
 	}
 	this->onRtnOptionsTrade(data);
 };
@@ -869,19 +871,19 @@ void StockTdApi::processRtnStockTrade(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcStockTradeField *task_data = (CStockFtdcStockTradeField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["TradeVolume"] = task_data->TradeVolume;
-		data["Side"] = task_data->Side;
-		data["Cjjg"] = task_data->Cjjg;
-		data["Cjje"] = task_data->Cjje;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_TradeID] = toUtf(task_data->TradeID);
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_TradeVolume] = task_data->TradeVolume;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_Cjjg] = task_data->Cjjg;
+		data[KEY_Cjje] = task_data->Cjje;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		releaseTaskData(task_data);
 	}
 	this->onRtnStockTrade(data);
 };
@@ -893,14 +895,14 @@ void StockTdApi::processRtnExercise(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcExerciseRtnField *task_data = (CStockFtdcExerciseRtnField*)task->task_data;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrderQty"] = task_data->OrderQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		delete task_data;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		releaseTaskData(task_data);
 	}
 	this->onRtnExercise(data);
 };
@@ -912,18 +914,18 @@ void StockTdApi::processRspQryRate(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryRateField *task_data = (CStockFtdcRspQryRateField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["Margin"] = task_data->Margin;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_Margin] = task_data->Margin;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryRate(data, error, task->task_id, task->task_last);
 };
@@ -935,17 +937,17 @@ void StockTdApi::processRspQryClient(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspClientField *task_data = (CStockFtdcRspClientField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["Status"] = task_data->Status;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_Status] = task_data->Status;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryClient(data, error, task->task_id, task->task_last);
 };
@@ -957,20 +959,20 @@ void StockTdApi::processRspQryClientMargin(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryClientMarginField *task_data = (CStockFtdcRspQryClientMarginField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["Margin"] = task_data->Margin;
-		data["MarginRatio"] = task_data->MarginRatio;
-		data["MinMarginRatio"] = task_data->MinMarginRatio;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_Margin] = task_data->Margin;
+		data[KEY_MarginRatio] = task_data->MarginRatio;
+		data[KEY_MinMarginRatio] = task_data->MinMarginRatio;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryClientMargin(data, error, task->task_id, task->task_last);
 };
@@ -982,22 +984,22 @@ void StockTdApi::processRspQryExercise(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcExerciseRtnField *task_data = (CStockFtdcExerciseRtnField*)task->task_data;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrderQty"] = task_data->OrderQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		delete task_data;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryExercise(data, error, task->task_id, task->task_last);
 };
@@ -1009,11 +1011,11 @@ void StockTdApi::processRtnWithdrawDeposit(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcWithdrawDepositRtnField *task_data = (CStockFtdcWithdrawDepositRtnField*)task->task_data;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["deposit"] = task_data->deposit;
-		data["withdraw"] = task_data->withdraw;
-		delete task_data;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_deposit] = task_data->deposit;
+		data[KEY_withdraw] = task_data->withdraw;
+		releaseTaskData(task_data);
 	}
 	this->onRtnWithdrawDeposit(data);
 };
@@ -1025,21 +1027,21 @@ void StockTdApi::processRspMarginCombAction(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcMarginCombActionRspField *task_data = (CStockFtdcMarginCombActionRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["CombID"] = toUtf(task_data->CombID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrderQty"] = task_data->OrderQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_CombID] = toUtf(task_data->CombID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspMarginCombAction(data, error, task->task_id, task->task_last);
 };
@@ -1051,15 +1053,15 @@ void StockTdApi::processRtnMarginCombAction(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcMarginCombActionRtnField *task_data = (CStockFtdcMarginCombActionRtnField*)task->task_data;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["ExecID"] = toUtf(task_data->ExecID);
-		data["CombID"] = toUtf(task_data->CombID);
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["OrigTime"] = toUtf(task_data->OrigTime);
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["LastQty"] = task_data->LastQty;
-		data["commargin"] = task_data->commargin;
-		delete task_data;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_ExecID] = toUtf(task_data->ExecID);
+		data[KEY_CombID] = toUtf(task_data->CombID);
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_OrigTime] = toUtf(task_data->OrigTime);
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_LastQty] = task_data->LastQty;
+		data[KEY_commargin] = task_data->commargin;
+		releaseTaskData(task_data);
 	}
 	this->onRtnMarginCombAction(data);
 };
@@ -1071,18 +1073,18 @@ void StockTdApi::processRspQrySseCombPosition(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcCombPositionRspField *task_data = (CStockFtdcCombPositionRspField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["PosiQty"] = task_data->PosiQty;
-		data["commargin"] = task_data->commargin;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_PosiQty] = task_data->PosiQty;
+		data[KEY_commargin] = task_data->commargin;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQrySseCombPosition(data, error, task->task_id, task->task_last);
 };
@@ -1094,24 +1096,24 @@ void StockTdApi::processRspCombExercise(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcCombExerciseRspField *task_data = (CStockFtdcCombExerciseRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrderQty"] = task_data->OrderQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["LegSecurityID1"] = toUtf(task_data->LegSecurityID1);
-		data["LegOrderQty1"] = task_data->LegOrderQty1;
-		data["LegSecurityID2"] = toUtf(task_data->LegSecurityID2);
-		data["LegOrderQty2"] = task_data->LegOrderQty2;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_LegSecurityID1] = toUtf(task_data->LegSecurityID1);
+		data[KEY_LegOrderQty1] = task_data->LegOrderQty1;
+		data[KEY_LegSecurityID2] = toUtf(task_data->LegSecurityID2);
+		data[KEY_LegOrderQty2] = task_data->LegOrderQty2;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspCombExercise(data, error, task->task_id, task->task_last);
 };
@@ -45,13 +45,13 @@ void StockTdApi::OnRspSubscribeTopic(CStockFtdcDisseminationField *pDisseminatio
 	task.task_name = ONRSPSUBSCRIBETOPIC;
 	if (pDissemination)
 	{
-		CStockFtdcDisseminationField *task_data = new CStockFtdcDisseminationField();
+		CStockFtdcDisseminationField *task_data = createTaskData<CStockFtdcDisseminationField>();
 		*task_data = *pDissemination;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -66,13 +66,13 @@ void StockTdApi::OnRspUserLogin(CStockFtdcRspUserLoginField *pRspUserLogin, CSto
 	task.task_name = ONRSPUSERLOGIN;
 	if (pRspUserLogin)
 	{
-		CStockFtdcRspUserLoginField *task_data = new CStockFtdcRspUserLoginField();
+		CStockFtdcRspUserLoginField *task_data = createTaskData<CStockFtdcRspUserLoginField>();
 		*task_data = *pRspUserLogin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -87,13 +87,13 @@ void StockTdApi::OnRspUserLogout(CStockFtdcRspUserLogoutField *pRspUserLogout, C
 	task.task_name = ONRSPUSERLOGOUT;
 	if (pRspUserLogout)
 	{
-		CStockFtdcRspUserLogoutField *task_data = new CStockFtdcRspUserLogoutField();
+		CStockFtdcRspUserLogoutField *task_data = createTaskData<CStockFtdcRspUserLogoutField>();
 		*task_data = *pRspUserLogout;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -108,13 +108,13 @@ void StockTdApi::OnRspUserPasswordUpdate(CStockFtdcUserPasswordUpdateField *pUse
 	task.task_name = ONRSPUSERPASSWORDUPDATE;
 	if (pUserPasswordUpdate)
 	{
-		CStockFtdcUserPasswordUpdateField *task_data = new CStockFtdcUserPasswordUpdateField();
+		CStockFtdcUserPasswordUpdateField *task_data = createTaskData<CStockFtdcUserPasswordUpdateField>();
 		*task_data = *pUserPasswordUpdate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -129,13 +129,13 @@ void StockTdApi::OnRspStockInsert(CStockFtdcStockInsertRspField *pStockInsert, C
 	task.task_name = ONRSPSTOCKINSERT;
 	if (pStockInsert)
 	{
-		CStockFtdcStockInsertRspField *task_data = new CStockFtdcStockInsertRspField();
+		CStockFtdcStockInsertRspField *task_data = createTaskData<CStockFtdcStockInsertRspField>();
 		*task_data = *pStockInsert;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -150,13 +150,13 @@ void StockTdApi::OnRspStockCancel(CStockFtdcStockCancelRspField *pStockCancel, C
 	task.task_name = ONRSPSTOCKCANCEL;
 	if (pStockCancel)
 	{
-		CStockFtdcStockCancelRspField *task_data = new CStockFtdcStockCancelRspField();
+		CStockFtdcStockCancelRspField *task_data = createTaskData<CStockFtdcStockCancelRspField>();
 		*task_data = *pStockCancel;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -171,13 +171,13 @@ void StockTdApi::OnRspOptionsInsert(CStockFtdcOptionsInsertRspField *pOptionsIns
 	task.task_name = ONRSPOPTIONSINSERT;
 	if (pOptionsInsert)
 	{
-		CStockFtdcOptionsInsertRspField *task_data = new CStockFtdcOptionsInsertRspField();
+		CStockFtdcOptionsInsertRspField *task_data = createTaskData<CStockFtdcOptionsInsertRspField>();
 		*task_data = *pOptionsInsert;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -192,13 +192,13 @@ void StockTdApi::OnRspOptionsCancel(CStockFtdcOptionsCancelRspField *pOptionsCan
 	task.task_name = ONRSPOPTIONSCANCEL;
 	if (pOptionsCancel)
 	{
-		CStockFtdcOptionsCancelRspField *task_data = new CStockFtdcOptionsCancelRspField();
+		CStockFtdcOptionsCancelRspField *task_data = createTaskData<CStockFtdcOptionsCancelRspField>();
 		*task_data = *pOptionsCancel;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -213,13 +213,13 @@ void StockTdApi::OnRspQuoteInsert(CStockFtdcQuoteInsertRspField *pQuoteInsert, C
 	task.task_name = ONRSPQUOTEINSERT;
 	if (pQuoteInsert)
 	{
-		CStockFtdcQuoteInsertRspField *task_data = new CStockFtdcQuoteInsertRspField();
+		CStockFtdcQuoteInsertRspField *task_data = createTaskData<CStockFtdcQuoteInsertRspField>();
 		*task_data = *pQuoteInsert;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -234,13 +234,13 @@ void StockTdApi::OnRspForQuote(CStockFtdcForQuoteRspField *pForQuote, CStockFtdc
 	task.task_name = ONRSPFORQUOTE;
 	if (pForQuote)
 	{
-		CStockFtdcForQuoteRspField *task_data = new CStockFtdcForQuoteRspField();
+		CStockFtdcForQuoteRspField *task_data = createTaskData<CStockFtdcForQuoteRspField>();
 		*task_data = *pForQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -255,13 +255,13 @@ void StockTdApi::OnRspQuoteCancel(CStockFtdcQuoteCancelRspField *pQuoteCancel, C
 	task.task_name = ONRSPQUOTECANCEL;
 	if (pQuoteCancel)
 	{
-		CStockFtdcQuoteCancelRspField *task_data = new CStockFtdcQuoteCancelRspField();
+		CStockFtdcQuoteCancelRspField *task_data = createTaskData<CStockFtdcQuoteCancelRspField>();
 		*task_data = *pQuoteCancel;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -276,13 +276,13 @@ void StockTdApi::OnRspStockLock(CStockFtdcStockLockRspField *pStockLock, CStockF
 	task.task_name = ONRSPSTOCKLOCK;
 	if (pStockLock)
 	{
-		CStockFtdcStockLockRspField *task_data = new CStockFtdcStockLockRspField();
+		CStockFtdcStockLockRspField *task_data = createTaskData<CStockFtdcStockLockRspField>();
 		*task_data = *pStockLock;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -297,13 +297,13 @@ void StockTdApi::OnRspExercise(CStockFtdcExerciseRspField *pExercise, CStockFtdc
 	task.task_name = ONRSPEXERCISE;
 	if (pExercise)
 	{
-		CStockFtdcExerciseRspField *task_data = new CStockFtdcExerciseRspField();
+		CStockFtdcExerciseRspField *task_data = createTaskData<CStockFtdcExerciseRspField>();
 		*task_data = *pExercise;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -318,13 +318,13 @@ void StockTdApi::OnRspExerciseCancel(CStockFtdcExerciseCancelRspField *pExercise
 	task.task_name = ONRSPEXERCISECANCEL;
 	if (pExercise)
 	{
-		CStockFtdcExerciseCancelRspField *task_data = new CStockFtdcExerciseCancelRspField();
+		CStockFtdcExerciseCancelRspField *task_data = createTaskData<CStockFtdcExerciseCancelRspField>();
 		*task_data = *pExercise;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -339,13 +339,13 @@ void StockTdApi::OnRspQryPartAccount(CStockFtdcRspPartAccountField *pRspPartAcco
 	task.task_name = ONRSPQRYPARTACCOUNT;
 	if (pRspPartAccount)
 	{
-		CStockFtdcRspPartAccountField *task_data = new CStockFtdcRspPartAccountField();
+		CStockFtdcRspPartAccountField *task_data = createTaskData<CStockFtdcRspPartAccountField>();
 		*task_data = *pRspPartAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -360,13 +360,13 @@ void StockTdApi::OnRspQryStockOrder(CStockFtdcRspQryStockOrderField *pOrder, CSt
 	task.task_name = ONRSPQRYSTOCKORDER;
 	if (pOrder)
 	{
-		CStockFtdcRspQryStockOrderField *task_data = new CStockFtdcRspQryStockOrderField();
+		CStockFtdcRspQryStockOrderField *task_data = createTaskData<CStockFtdcRspQryStockOrderField>();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -381,13 +381,13 @@ void StockTdApi::OnRspQryOptionsOrder(CStockFtdcRspQryOptionsOrderField *pOrder,
 	task.task_name = ONRSPQRYOPTIONSORDER;
 	if (pOrder)
 	{
-		CStockFtdcRspQryOptionsOrderField *task_data = new CStockFtdcRspQryOptionsOrderField();
+		CStockFtdcRspQryOptionsOrderField *task_data = createTaskData<CStockFtdcRspQryOptionsOrderField>();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -402,13 +402,13 @@ void StockTdApi::OnRspQryQuoteOrder(CStockFtdcRspQryQuoteOrderField *pQuote, CSt
 	task.task_name = ONRSPQRYQUOTEORDER;
 	if (pQuote)
 	{
-		CStockFtdcRspQryQuoteOrderField *task_data = new CStockFtdcRspQryQuoteOrderField();
+		CStockFtdcRspQryQuoteOrderField *task_data = createTaskData<CStockFtdcRspQryQuoteOrderField>();
 		*task_data = *pQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -423,13 +423,13 @@ void StockTdApi::OnRspQryStockTrade(CStockFtdcStockTradeField *pTrade, CStockFtd
 	task.task_name = ONRSPQRYSTOCKTRADE;
 	if (pTrade)
 	{
-		CStockFtdcStockTradeField *task_data = new CStockFtdcStockTradeField();
+		CStockFtdcStockTradeField *task_data = createTaskData<CStockFtdcStockTradeField>();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -444,13 +444,13 @@ void StockTdApi::OnRspQryOptionsTrade(CStockFtdcOptionsTradeField *pTrade, CStoc
 	task.task_name = ONRSPQRYOPTIONSTRADE;
 	if (pTrade)
 	{
-		CStockFtdcOptionsTradeField *task_data = new CStockFtdcOptionsTradeField();
+		CStockFtdcOptionsTradeField *task_data = createTaskData<CStockFtdcOptionsTradeField>();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -465,13 +465,13 @@ void StockTdApi::OnRspQryPosition(CStockFtdcRspPositionField *pPosition, CStockF
 	task.task_name = ONRSPQRYPOSITION;
 	if (pPosition)
 	{
-		CStockFtdcRspPositionField *task_data = new CStockFtdcRspPositionField();
+		CStockFtdcRspPositionField *task_data = createTaskData<CStockFtdcRspPositionField>();
 		*task_data = *pPosition;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -486,13 +486,13 @@ void StockTdApi::OnRspQryTopic(CStockFtdcDisseminationField *pDissemination, CSt
 	task.task_name = ONRSPQRYTOPIC;
 	if (pDissemination)
 	{
-		CStockFtdcDisseminationField *task_data = new CStockFtdcDisseminationField();
+		CStockFtdcDisseminationField *task_data = createTaskData<CStockFtdcDisseminationField>();
 		*task_data = *pDissemination;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -507,13 +507,13 @@ void StockTdApi::OnRspQryStock(CStockFtdcRspQryStockField *pStock, CStockFtdcRsp
 	task.task_name = ONRSPQRYSTOCK;
 	if (pStock)
 	{
-		CStockFtdcRspQryStockField *task_data = new CStockFtdcRspQryStockField();
+		CStockFtdcRspQryStockField *task_data = createTaskData<CStockFtdcRspQryStockField>();
 		*task_data = *pStock;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -528,13 +528,13 @@ void StockTdApi::OnRspQryOptions(CStockFtdcRspQryOptionsField *pOptions, CStockF
 	task.task_name = ONRSPQRYOPTIONS;
 	if (pOptions)
 	{
-		CStockFtdcRspQryOptionsField *task_data = new CStockFtdcRspQryOptionsField();
+		CStockFtdcRspQryOptionsField *task_data = createTaskData<CStockFtdcRspQryOptionsField>();
 		*task_data = *pOptions;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -549,7 +549,7 @@ void StockTdApi::OnRtnOptionsOrder(CStockFtdcOptionsOrderField *pOrder)
 	task.task_name = ONRTNOPTIONSORDER;
 	if (pOrder)
 	{
-		CStockFtdcOptionsOrderField *task_data = new CStockFtdcOptionsOrderField();
+		CStockFtdcOptionsOrderField *task_data = createTaskData<CStockFtdcOptionsOrderField>();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
@@ -562,7 +562,7 @@ void StockTdApi::OnRtnStockOrder(CStockFtdcStockOrderField *pOrder)
 	task.task_name = ONRTNSTOCKORDER;
 	if (pOrder)
 	{
-		CStockFtdcStockOrderField *task_data = new CStockFtdcStockOrderField();
+		CStockFtdcStockOrderField *task_data = createTaskData<CStockFtdcStockOrderField>();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
@@ -575,7 +575,7 @@ void StockTdApi::OnRtnQuoteOrder(CStockFtdcQuoteOrderField *pQuote)
 	task.task_name = ONRTNQUOTEORDER;
 	if (pQuote)
 	{
-		CStockFtdcQuoteOrderField *task_data = new CStockFtdcQuoteOrderField();
+		CStockFtdcQuoteOrderField *task_data = createTaskData<CStockFtdcQuoteOrderField>();
 		*task_data = *pQuote;
 		task.task_data = task_data;
 	}
@@ -588,7 +588,7 @@ void StockTdApi::OnRtnOptionsTrade(CStockFtdcOptionsTradeField *pTrade)
 	task.task_name = ONRTNOPTIONSTRADE;
 	if (pTrade)
 	{
-		CStockFtdcOptionsTradeField *task_data = new CStockFtdcOptionsTradeField();
+		CStockFtdcOptionsTradeField *task_data = createTaskData<CStockFtdcOptionsTradeField>();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
@@ -601,7 +601,7 @@ void StockTdApi::OnRtnStockTrade(CStockFtdcStockTradeField *pTrade)
 	task.task_name = ONRTNSTOCKTRADE;
 	if (pTrade)
 	{
-		CStockFtdcStockTradeField *task_data = new CStockFtdcStockTradeField();
+		CStockFtdcStockTradeField *task_data = createTaskData<CStockFtdcStockTradeField>();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
@@ -614,7 +614,7 @@ void StockTdApi::OnRtnExercise(CStockFtdcExerciseRtnField *pExercise)
 	task.task_name = ONRTNEXERCISE;
 	if (pExercise)
 	{
-		CStockFtdcExerciseRtnField *task_data = new CStockFtdcExerciseRtnField();
+		CStockFtdcExerciseRtnField *task_data = createTaskData<CStockFtdcExerciseRtnField>();
 		*task_data = *pExercise;
 		task.task_data = task_data;
 	}
@@ -627,13 +627,13 @@ void StockTdApi::OnRspQryRate(CStockFtdcRspQryRateField *pRate, CStockFtdcRspInf
 	task.task_name = ONRSPQRYRATE;
 	if (pRate)
 	{
-		CStockFtdcRspQryRateField *task_data = new CStockFtdcRspQryRateField();
+		CStockFtdcRspQryRateField *task_data = createTaskData<CStockFtdcRspQryRateField>();
 		*task_data = *pRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -648,13 +648,13 @@ void StockTdApi::OnRspQryClient(CStockFtdcRspClientField *pRspClient, CStockFtdc
 	task.task_name = ONRSPQRYCLIENT;
 	if (pRspClient)
 	{
-		CStockFtdcRspClientField *task_data = new CStockFtdcRspClientField();
+		CStockFtdcRspClientField *task_data = createTaskData<CStockFtdcRspClientField>();
 		*task_data = *pRspClient;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -669,13 +669,13 @@ void StockTdApi::OnRspQryClientMargin(CStockFtdcRspQryClientMarginField *pRspMar
 	task.task_name = ONRSPQRYCLIENTMARGIN;
 	if (pRspMargin)
 	{
-		CStockFtdcRspQryClientMarginField *task_data = new CStockFtdcRspQryClientMarginField();
+		CStockFtdcRspQryClientMarginField *task_data = createTaskData<CStockFtdcRspQryClientMarginField>();
 		*task_data = *pRspMargin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -690,13 +690,13 @@ void StockTdApi::OnRspQryExercise(CStockFtdcExerciseRtnField *pExercise, CStockF
 	task.task_name = ONRSPQRYEXERCISE;
 	if (pExercise)
 	{
-		CStockFtdcExerciseRtnField *task_data = new CStockFtdcExerciseRtnField();
+		CStockFtdcExerciseRtnField *task_data = createTaskData<CStockFtdcExerciseRtnField>();
 		*task_data = *pExercise;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -711,7 +711,7 @@ void StockTdApi::OnRtnWithdrawDeposit(CStockFtdcWithdrawDepositRtnField *pWithdr
 	task.task_name = ONRTNWITHDRAWDEPOSIT;
 	if (pWithdrawDeposit)
 	{
-		CStockFtdcWithdrawDepositRtnField *task_data = new CStockFtdcWithdrawDepositRtnField();
+		CStockFtdcWithdrawDepositRtnField *task_data = createTaskData<CStockFtdcWithdrawDepositRtnField>();
 		*task_data = *pWithdrawDeposit;
 		task.task_data = task_data;
 	}
@@ -724,13 +724,13 @@ void StockTdApi::OnRspMarginCombAction(CStockFtdcMarginCombActionRspField *pMarg
 	task.task_name = ONRSPMARGINCOMBACTION;
 	if (pMarginCombAction)
 	{
-		CStockFtdcMarginCombActionRspField *task_data = new CStockFtdcMarginCombActionRspField();
+		CStockFtdcMarginCombActionRspField *task_data = createTaskData<CStockFtdcMarginCombActionRspField>();
 		*task_data = *pMarginCombAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -745,7 +745,7 @@ void StockTdApi::OnRtnMarginCombAction(CStockFtdcMarginCombActionRtnField *pMarg
 	task.task_name = ONRTNMARGINCOMBACTION;
 	if (pMarginCombAction)
 	{
-		CStockFtdcMarginCombActionRtnField *task_data = new CStockFtdcMarginCombActionRtnField();
+		CStockFtdcMarginCombActionRtnField *task_data = createTaskData<CStockFtdcMarginCombActionRtnField>();
 		*task_data = *pMarginCombAction;
 		task.task_data = task_data;
 	}
@@ -758,13 +758,13 @@ void StockTdApi::OnRspQrySseCombPosition(CStockFtdcCombPositionRspField *pPosi,
 	task.task_name = ONRSPQRYSSECOMBPOSITION;
 	if (pPosi)
 	{
-		CStockFtdcCombPositionRspField *task_data = new CStockFtdcCombPositionRspField();
+		CStockFtdcCombPositionRspField *task_data = createTaskData<CStockFtdcCombPositionRspField>();
 		*task_data = *pPosi;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -779,13 +779,13 @@ void StockTdApi::OnRspCombExercise(CStockFtdcCombExerciseRspField *pExercise, CS
 	task.task_name = ONRSPCOMBEXERCISE;
 	if (pExercise)
 	{
-		CStockFtdcCombExerciseRspField *task_data = new CStockFtdcCombExerciseRspField();
+		CStockFtdcCombExerciseRspField *task_data = createTaskData<CStockFtdcCombExerciseRspField>();
 		*task_data = *pExercise;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -505,6 +505,8 @@ CStockFtdcQryOptionsField = {
 
 CStockFtdcRspQryOptionsField = {
     "SecurityID": "string",
+    "contractid": "string",
+    "contractsymbol": "string",
     "underlyingsecurityid": "string",
     "optiontype": "char",
     "callorput": "char",
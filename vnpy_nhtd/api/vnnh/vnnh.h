@@ -1,4 +1,5 @@
 #include <string>
+#include <vector>
 #include <queue>
 #include <thread>
 #include <mutex>
@@ -6,6 +7,17 @@
 #include <codecvt>
 #include <condition_variable>
 #include <locale>
+#include <unordered_map>
+#include <atomic>
+#include <chrono>
+#include <deque>
+#include <functional>
+
+#if defined(_M_X64) || defined(_M_IX86)
+#include <intrin.h>
+#elif defined(__x86_64__) || defined(__i386__)
+#include <immintrin.h>
+#endif
 
 #include "pybind11/pybind11.h"
 
@@ -22,11 +34,113 @@ struct Task
     void *task_error;	//ָ
     int task_id;		//id
     bool task_last;		//ǷΪ󷵻
+    long long task_time;	//ʱ䣨룩
 };
 
 class TerminatedError : std::exception
 {};
 
+//ȡʱӵĵǰʱ䣨룩
+inline long long getTimestamp()
+{
+    return chrono::duration_cast<chrono::nanoseconds>(
+        chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+//ȴʱCPUռ
+inline void cpuRelax()
+{
+#if defined(_M_X64) || defined(_M_IX86) || defined(__x86_64__) || defined(__i386__)
+    _mm_pause();
+#endif
+}
+
+//ݶأմϵݽṹ幩صãÿλصжڴ
+template <typename T>
+class TaskDataPool
+{
+private:
+    static const size_t max_size_ = 1024;	//໺Ķ
+
+    vector<T*> objects_;					//ж
+    atomic_flag lock_ = ATOMIC_FLAG_INIT;	//
+
+    void lock()
+    {
+        while (lock_.test_and_set(memory_order_acquire))
+            cpuRelax();
+    }
+
+    void unlock()
+    {
+        lock_.clear(memory_order_release);
+    }
+
+public:
+    TaskDataPool()
+    {
+        objects_.reserve(max_size_);
+    }
+
+    ~TaskDataPool()
+    {
+        for (T *object : objects_)
+            delete object;
+    }
+
+    static TaskDataPool<T> &instance()
+    {
+        static TaskDataPool<T> pool;
+        return pool;
+    }
+
+    //ȡжûʱٷ
+    T *acquire()
+    {
+        lock();
+        if (objects_.empty())
+        {
+            unlock();
+            return new T();
+        }
+
+        T *object = objects_.back();
+        objects_.pop_back();
+        unlock();
+        return object;
+    }
+
+    //ն󣬳ʱֱͷ
+    void release(T *object)
+    {
+        lock();
+        if (objects_.size() < max_size_)
+        {
+            objects_.push_back(object);
+            unlock();
+        }
+        else
+        {
+            unlock();
+            delete object;
+        }
+    }
+};
+
+template <typename T>
+inline T *createTaskData()
+{
+    return TaskDataPool<T>::instance().acquire();
+}
+
+template <typename T>
+inline void releaseTaskData(T *object)
+{
+    TaskDataPool<T>::instance().release(object);
+}
+
+#ifndef VNNH_SPSC_QUEUE
+
 class TaskQueue
 {
 private:
@@ -34,6 +148,8 @@ private:
     mutex mutex_;							//
     condition_variable cond_;				//
 
+    size_t high_water_ = 0;					//гȵʷֵ
+
     bool _terminate = false;
 
 public:
@@ -43,6 +159,9 @@ public:
     {
         unique_lock<mutex > mlock(mutex_);
         queue_.push(task);					//д
+        queue_.back().task_time = getTimestamp();
+        if (queue_.size() > high_water_)
+            high_water_ = queue_.size();
         mlock.unlock();						//ͷ
         cond_.notify_one();					//֪ͨȴ߳
     }
@@ -61,6 +180,31 @@ public:
         return task;						//ظ
     }
 
+    //Ϊָ͵ȡ
+    bool pop_if(int task_name, Task &task)
+    {
+        unique_lock<mutex> mlock(mutex_);
+        if (_terminate || queue_.empty() || queue_.front().task_name != task_name)
+            return false;
+        task = queue_.front();
+        queue_.pop();
+        return true;
+    }
+
+    //ǰг
+    size_t depth()
+    {
+        lock_guard<mutex> mlock(mutex_);
+        return queue_.size();
+    }
+
+    //гȵʷֵ
+    size_t high_water()
+    {
+        lock_guard<mutex> mlock(mutex_);
+        return high_water_;
+    }
+
     void terminate()
     {
         _terminate = true;
@@ -68,14 +212,502 @@ public:
     }
 };
 
+#else
+
+#ifndef VNNH_QUEUE_CAPACITY
+#define VNNH_QUEUE_CAPACITY 65536			//ζΪ2
+#endif
+
+#ifndef VNNH_QUEUE_SPIN
+#define VNNH_QUEUE_SPIN 2000				//ǰ
+#endif
+
+//ߵߵζУSPIصͬһ̵߳ĳ
+class TaskQueue
+{
+private:
+    static const size_t capacity_ = VNNH_QUEUE_CAPACITY;
+    static const size_t mask_ = VNNH_QUEUE_CAPACITY - 1;
+    static_assert((VNNH_QUEUE_CAPACITY & (VNNH_QUEUE_CAPACITY - 1)) == 0, "VNNH_QUEUE_CAPACITY must be a power of 2");
+
+    vector<Task> buffer_ = vector<Task>(VNNH_QUEUE_CAPACITY);	//񻺳
+    alignas(64) atomic<size_t> head_{ 0 };	//λ
+    alignas(64) atomic<size_t> tail_{ 0 };	//λ
+    alignas(64) atomic<bool> sleeping_{ false };	//Ƿ
+    atomic<size_t> high_water_{ 0 };		//гȵʷֵд
+
+    mutex mutex_;							//û
+    condition_variable cond_;				//
+
+    atomic<bool> _terminate{ false };
+
+public:
+
+    //µ
+    void push(const Task &task)
+    {
+        size_t tail = tail_.load(memory_order_relaxed);
+
+        //ʱȴڳռ
+        while (tail - head_.load(memory_order_acquire) >= capacity_)
+        {
+            if (_terminate)
+                return;
+            this_thread::yield();
+        }
+
+        buffer_[tail & mask_] = task;
+        buffer_[tail & mask_].task_time = getTimestamp();
+        tail_.store(tail + 1, memory_order_seq_cst);
+
+        size_t size = tail + 1 - head_.load(memory_order_relaxed);
+        if (size > high_water_.load(memory_order_relaxed))
+            high_water_.store(size, memory_order_relaxed);
+
+        //ʱŽϵͳû
+        if (sleeping_.load(memory_order_seq_cst))
+        {
+            lock_guard<mutex> mlock(mutex_);
+            cond_.notify_one();
+        }
+    }
+
+    //ȡϵóʱƬߵȴ
+    Task pop()
+    {
+        size_t head = head_.load(memory_order_relaxed);
+
+        int count = 0;
+        while (tail_.load(memory_order_acquire) == head)
+        {
+            if (_terminate)
+                throw TerminatedError();
+
+            if (count < VNNH_QUEUE_SPIN)
+            {
+                cpuRelax();
+            }
+            else if (count < VNNH_QUEUE_SPIN * 2)
+            {
+                this_thread::yield();
+            }
+            else
+            {
+                unique_lock<mutex> mlock(mutex_);
+                sleeping_.store(true, memory_order_seq_cst);
+                cond_.wait(mlock, [&]() {
+                    return tail_.load(memory_order_seq_cst) != head || _terminate;
+                });
+                sleeping_.store(false, memory_order_relaxed);
+            }
+
+            count++;
+        }
+
+        if (_terminate)
+            throw TerminatedError();
+
+        Task task = buffer_[head & mask_];
+        head_.store(head + 1, memory_order_release);
+        return task;
+    }
+
+    //Ϊָ͵ȡ
+    bool pop_if(int task_name, Task &task)
+    {
+        size_t head = head_.load(memory_order_relaxed);
+        if (_terminate || tail_.load(memory_order_acquire) == head)
+            return false;
+
+        const Task &front = buffer_[head & mask_];
+        if (front.task_name != task_name)
+            return false;
+
+        task = front;
+        head_.store(head + 1, memory_order_release);
+        return true;
+    }
+
+    //ǰг
+    size_t depth()
+    {
+        size_t head = head_.load(memory_order_acquire);
+        return tail_.load(memory_order_acquire) - head;
+    }
+
+    //гȵʷֵ
+    size_t high_water()
+    {
+        return high_water_.load(memory_order_relaxed);
+    }
+
+    void terminate()
+    {
+        _terminate = true;
+        lock_guard<mutex> mlock(mutex_);
+        cond_.notify_all();					//֪ͨȴ߳
+    }
+};
+
+#endif
+
+
+//ͳƣصͼ¼ӵַʱԼصʱķֲ
+class TaskStats
+{
+public:
+    static const int bucket_count = 32;		//0Ϊ1΢ڣiΪ[2^(i-1), 2^i)΢
+
+private:
+    struct Record
+    {
+        long long latency[bucket_count] = {};	//ӵַʱ
+        long long callback[bucket_count] = {};	//صʱ
+    };
+
+    mutex mutex_;
+    unordered_map<int, Record> records_;
+
+    static int bucket(long long nanoseconds)
+    {
+        long long us = nanoseconds / 1000;
+        int n = 0;
+        while (us > 0 && n < bucket_count - 1)
+        {
+            us >>= 1;
+            n++;
+        }
+        return n;
+    }
+
+public:
+    //¼һڹ߳е
+    void record(int task_name, long long latency, long long callback)
+    {
+        lock_guard<mutex> mlock(mutex_);
+        Record &record = records_[task_name];
+        record.latency[bucket(latency)]++;
+        record.callback[bucket(callback)]++;
+    }
+
+    //תΪPythonֵ䣬ԻصΪGILã
+    dict to_dict(const char *const names[], int count)
+    {
+        dict latency;
+        dict callback;
+
+        lock_guard<mutex> mlock(mutex_);
+        for (auto &item : records_)
+        {
+            str name = (item.first >= 0 && item.first < count) ? str(names[item.first]) : str(std::to_string(item.first));
+
+            pybind11::list latency_list;
+            pybind11::list callback_list;
+            for (int i = 0; i < bucket_count; i++)
+            {
+                latency_list.append(item.second.latency[i]);
+                callback_list.append(item.second.callback[i]);
+            }
+
+            latency[name] = latency_list;
+            callback[name] = callback_list;
+        }
+
+        dict d;
+        d["latency"] = latency;
+        d["callback"] = callback;
+        return d;
+    }
+};
+
+
+//أͰ㷨ίгȣѯڿƲʱֱӾܾ
+class RequestThrottle
+{
+private:
+    mutex mutex_;
+    double rate_ = 0;					//ÿ벹Ϊ0ʱ
+    double burst_ = 1;					//Ͱ
+    double reserve_ = 0;				//Ϊίѯ󲻿ʹ
+    double tokens_ = 0;					//ǰ
+    long long last_ = 0;				//ϴβƵʱ
+
+    long long order_count_ = 0;			//ί
+    long long order_delayed_ = 0;		//ضȴί
+    long long order_delay_ = 0;			//ίۼƵȴʱ䣨룩
+    long long query_count_ = 0;			//ѯ
+    long long query_deferred_ = 0;		//ضӺ͵Ĳѯ
+    long long query_rejected_ = 0;		//ӺܾĲѯ
+    long long query_retried_ = 0;		//ӺʧܺԵĴ
+
+    //Ӻ͵Ĳѯ
+    struct DeferredQuery
+    {
+        std::function<int()> request;	//ع̨APIķֵ
+        long long ready = 0;			//Է͵ʱ
+        int retries = 0;				//Դ
+    };
+
+    static const size_t max_deferred_ = 64;		//Ӻг
+    static const int max_backoff_ = 16;			//ʧܺԼ룩
+    deque<DeferredQuery> deferred_;		//ȴƵĲѯ
+    condition_variable cond_;			//Ӻ֪ͨ
+    thread worker_;						//Ӻѯ߳
+    bool stopped_ = false;				//Ƿֹͣ
+
+    void refill(long long now)
+    {
+        tokens_ += (now - last_) * rate_ / 1e9;
+        if (tokens_ > burst_)
+            tokens_ = burst_;
+        last_ = now;
+    }
+
+    //ȡ
+    bool try_order()
+    {
+        lock_guard<mutex> mlock(mutex_);
+        if (rate_ > 0)
+        {
+            refill(getTimestamp());
+            if (tokens_ < 1)
+                return false;
+            tokens_ -= 1;
+        }
+        order_count_++;
+        return true;
+    }
+
+    //Ӻѯ̣߳ÿβƺ˳ͶеĲѯͬռΪί
+    //̨ط0ʱػδࣩ124...˱ܺԣֱͳɹֹͣ
+    void run_deferred()
+    {
+        unique_lock<mutex> mlock(mutex_);
+        while (true)
+        {
+            if (stopped_)
+                return;
+
+            if (deferred_.empty())
+            {
+                cond_.wait(mlock);
+                continue;
+            }
+
+            long long now = getTimestamp();
+            if (deferred_.front().ready > now)
+            {
+                cond_.wait_for(mlock, chrono::nanoseconds(deferred_.front().ready - now));
+                continue;
+            }
+
+            if (rate_ > 0)
+            {
+                refill(getTimestamp());
+                if (tokens_ < reserve_ + 1)
+                {
+                    long long wait = (long long)((reserve_ + 1 - tokens_) / rate_ * 1e9);
+                    cond_.wait_for(mlock, chrono::nanoseconds(wait));
+                    continue;
+                }
+                tokens_ -= 1;
+            }
+
+            DeferredQuery query = move(deferred_.front());
+            deferred_.pop_front();
+
+            mlock.unlock();
+            int result = query.request();
+            mlock.lock();
+
+            if (!result || stopped_)
+                continue;
+
+            //ʧܵŻضף֤ѯ԰˳
+            int backoff = query.retries < 4 ? 1 << query.retries : max_backoff_;
+            query.retries++;
+            query.ready = getTimestamp() + backoff * 1000000000LL;
+            deferred_.push_front(move(query));
+            query_retried_++;
+        }
+    }
+
+public:
+    ~RequestThrottle()
+    {
+        stop();
+    }
+
+    //ÿͰԼΪίrateΪ0ʱر
+    void set_limit(double rate, int burst, int reserve)
+    {
+        lock_guard<mutex> mlock(mutex_);
+        rate_ = rate;
+        burst_ = burst > 0 ? burst : 1;
+        reserve_ = reserve;
+        tokens_ = burst_;
+        last_ = getTimestamp();
+        cond_.notify_one();
+    }
+
+    //ίƲʱȴʱܳGIL
+    void wait_order()
+    {
+        if (try_order())
+            return;
+
+        long long start = getTimestamp();
+        while (true)
+        {
+            unique_lock<mutex> mlock(mutex_);
+            long long now = getTimestamp();
+            refill(now);
+            if (tokens_ >= 1 || rate_ <= 0)
+            {
+                if (rate_ > 0)
+                    tokens_ -= 1;
+                order_count_++;
+                order_delayed_++;
+                order_delay_ += now - start;
+                return;
+            }
+
+            long long wait = (long long)((1 - tokens_) / rate_ * 1e9);
+            mlock.unlock();
+            this_thread::sleep_for(chrono::nanoseconds(wait));
+        }
+    }
+
+    //ίƲʱͷGILȴGILã
+    void acquire_order()
+    {
+        if (try_order())
+            return;
+
+        gil_scoped_release release;
+        wait_order();
+    }
+
+    //ѯ󣬿ƲвѯڵȴʱfalseʱӦͨdeferӺ
+    bool acquire_query()
+    {
+        lock_guard<mutex> mlock(mutex_);
+        query_count_++;
+        if (rate_ <= 0)
+            return true;
+
+        //ӺĲѯʱ󣬱֤ѯ˳
+        if (!deferred_.empty())
+            return false;
+
+        refill(getTimestamp());
+        if (tokens_ < reserve_ + 1)
+            return false;
+
+        tokens_ -= 1;
+        return true;
+    }
+
+    //صĲѯӺУ´βƺɷ̷߳0
+    //ʱ-3̨ÿ޵ķֵһ£
+    int defer(std::function<int()> request)
+    {
+        lock_guard<mutex> mlock(mutex_);
+        if (stopped_)
+            return -3;
+
+        if (deferred_.size() >= max_deferred_)
+        {
+            query_rejected_++;
+            return -3;
+        }
+
+        if (!worker_.joinable())
+            worker_ = thread(&RequestThrottle::run_deferred, this);
+
+        DeferredQuery query;
+        query.request = move(request);
+        deferred_.push_back(move(query));
+        query_deferred_++;
+        cond_.notify_one();
+        return 0;
+    }
+
+    //Ӻѯexit֮ٴinitʱ
+    void start()
+    {
+        lock_guard<mutex> mlock(mutex_);
+        stopped_ = false;
+    }
+
+    //ֹͣӺѯ̣߳δ͵ĲѯͷŹ̨APIǰã
+    void stop()
+    {
+        {
+            lock_guard<mutex> mlock(mutex_);
+            stopped_ = true;
+            deferred_.clear();
+            cond_.notify_one();
+        }
+
+        if (worker_.joinable() && worker_.get_id() != this_thread::get_id())
+            worker_.join();
+    }
+
+    //תΪPythonֵ䣨GILã
+    dict to_dict()
+    {
+        lock_guard<mutex> mlock(mutex_);
+        dict d;
+        d["order_count"] = order_count_;
+        d["order_delayed"] = order_delayed_;
+        d["order_delay"] = order_delay_ / 1e9;
+        d["query_count"] = query_count_;
+        d["query_deferred"] = query_deferred_;
+        d["query_pending"] = deferred_.size();
+        d["query_rejected"] = query_rejected_;
+        d["query_retried"] = query_retried_;
+        return d;
+    }
+};
+
+//ֵвҼֵؽãʱNULLGILã
+inline PyObject *getDictItem(const dict &d, const char *key)
+{
+    //ļΪַַפPythonַÿβʱ´ϣ
+    static unordered_map<const char*, PyObject*> keys;
+
+    PyObject *k;
+    auto it = keys.find(key);
+    if (it != keys.end() && strcmp(PyUnicode_AsUTF8(it->second), key) == 0)
+    {
+        k = it->second;
+    }
+    else
+    {
+        k = PyUnicode_InternFromString(key);
+        if (it != keys.end())
+        {
+            Py_DECREF(it->second);
+            it->second = k;
+        }
+        else
+        {
+            keys.emplace(key, k);
+        }
+    }
+
+    return PyDict_GetItem(d.ptr(), k);
+};
+
 
 //ֵлȡĳֵӦֵṹֵ
 void getInt(const dict &d, const char *key, int *value)
 {
-    if (d.contains(key))		//ֵǷڸüֵ
+    PyObject *o = getDictItem(d, key);	//ֻһ
+    if (o)
     {
-        object o = d[key];		//ȡüֵ
-        *value = o.cast<int>();
+        *value = reinterpret_borrow<object>(o).cast<int>();
     }
 };
 
@@ -83,10 +715,10 @@ void getInt(const dict &d, const char *key, int *value)
 //ֵлȡĳֵӦĸֵṹֵ
 void getDouble(const dict &d, const char *key, double *value)
 {
-    if (d.contains(key))
+    PyObject *o = getDictItem(d, key);
+    if (o)
     {
-        object o = d[key];
-        *value = o.cast<double>();
+        *value = reinterpret_borrow<object>(o).cast<double>();
     }
 };
 
@@ -94,10 +726,10 @@ void getDouble(const dict &d, const char *key, double *value)
 //ֵлȡĳֵӦֵַṹֵ
 void getChar(const dict &d, const char *key, char *value)
 {
-    if (d.contains(key))
+    PyObject *o = getDictItem(d, key);
+    if (o)
     {
-        object o = d[key];
-        *value = o.cast<char>();
+        *value = reinterpret_borrow<object>(o).cast<char>();
     }
 };
 
@@ -105,29 +737,76 @@ void getChar(const dict &d, const char *key, char *value)
 template <size_t size>
 using string_literal = char[size];
 
+//ַṹַУȵĲֽض
+template <size_t size>
+inline void setString(string_literal<size> &value, const char *buf, size_t n)
+{
+    if (n > size - 1)
+        n = size - 1;
+    memcpy(value, buf, n);
+    value[n] = '\0';
+};
+
+template <size_t size>
+inline void setString(string_literal<size> &value, const string &s)
+{
+    setString(value, s.data(), s.size());
+};
+
 //ֵлȡĳֵӦֵַṹֵ
 template <size_t size>
 void getString(const pybind11::dict &d, const char *key, string_literal<size> &value)
 {
-    if (d.contains(key))
+    PyObject *o = getDictItem(d, key);
+    if (!o)
+        return;
+
+    //strbytesֱӴڲͨpybind11ת
+    if (PyUnicode_Check(o))
+    {
+        Py_ssize_t n = 0;
+        const char *buf = PyUnicode_AsUTF8AndSize(o, &n);
+        if (!buf)
+            throw error_already_set();
+        setString(value, buf, n);
+    }
+    else if (PyBytes_Check(o))
     {
-        object o = d[key];
-        string s = o.cast<string>();
-        const char *buf = s.c_str();
-        strcpy(value, buf);
+        setString(value, PyBytes_AS_STRING(o), PyBytes_GET_SIZE(o));
+    }
+    else
+    {
+        setString(value, reinterpret_borrow<object>(o).cast<string>());
     }
 };
 
+//жַǷֻASCIIַ
+inline bool isAscii(const string &s)
+{
+    for (unsigned char c : s)
+    {
+        if (c & 0x80)
+            return false;
+    }
+    return true;
+}
+
 //GBKַתΪUTF8
 inline string toUtf(const string &gb2312)
 {
+    //ASCIIַGBKUTF8ͬת
+    if (isAscii(gb2312))
+        return gb2312;
+
 #ifdef _MSC_VER
     const static locale loc("zh-CN");
 #else
     const static locale loc("zh_CN.GB18030");
 #endif
 
-    vector<wchar_t> wstr(gb2312.size());
+    thread_local vector<wchar_t> wstr;
+    wstr.resize(gb2312.size());
+
     wchar_t* wstrEnd = nullptr;
     const char* gbEnd = nullptr;
     mbstate_t state = {};
@@ -138,9 +817,32 @@ inline string toUtf(const string &gb2312)
 
     if (codecvt_base::ok == res)
     {
-        wstring_convert<codecvt_utf8<wchar_t>> cutf8;
-        return cutf8.to_bytes(wstring(wstr.data(), wstrEnd));
+        thread_local wstring_convert<codecvt_utf8<wchar_t>> cutf8;
+        return cutf8.to_bytes(wstr.data(), wstrEnd);
     }
 
     return string();
 }
+
+//GBKַתΪPythonַԺԼظֵֶθͬһGILã
+inline object toUtfCached(const string &gb2312)
+{
+    static const size_t max_size = 4096;				//
+    static unordered_map<string, PyObject*> cache;		//GBKַPythonַĻ
+
+    auto it = cache.find(gb2312);
+    if (it != cache.end())
+        return reinterpret_borrow<object>(it->second);
+
+    //ʱջ棬
+    if (cache.size() >= max_size)
+    {
+        for (auto &item : cache)
+            Py_DECREF(item.second);
+        cache.clear();
+    }
+
+    str value(toUtf(gb2312));
+    cache.emplace(gb2312, value.inc_ref().ptr());
+    return std::move(value);
+}
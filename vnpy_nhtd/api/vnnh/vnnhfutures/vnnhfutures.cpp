@@ -4,6 +4,916 @@
 #include "vnnhfutures.h"
 
 
+///-------------------------------------------------------------------------------------
+///Python字典键，在模块导入时创建一次并重复使用
+///-------------------------------------------------------------------------------------
+
+static handle KEY_BrokerID;
+static handle KEY_UserID;
+static handle KEY_UserProductInfo;
+static handle KEY_AppID;
+static handle KEY_AppType;
+static handle KEY_ErrorID;
+static handle KEY_ErrorMsg;
+static handle KEY_TradingDay;
+static handle KEY_LoginTime;
+static handle KEY_SystemName;
+static handle KEY_FrontID;
+static handle KEY_SessionID;
+static handle KEY_MaxOrderRef;
+static handle KEY_SHFETime;
+static handle KEY_DCETime;
+static handle KEY_CZCETime;
+static handle KEY_FFEXTime;
+static handle KEY_INETime;
+static handle KEY_OldPassword;
+static handle KEY_NewPassword;
+static handle KEY_AccountID;
+static handle KEY_CurrencyID;
+static handle KEY_InvestorID;
+static handle KEY_InstrumentID;
+static handle KEY_OrderRef;
+static handle KEY_OrderPriceType;
+static handle KEY_Direction;
+static handle KEY_CombOffsetFlag;
+static handle KEY_CombHedgeFlag;
+static handle KEY_LimitPrice;
+static handle KEY_VolumeTotalOriginal;
+static handle KEY_TimeCondition;
+static handle KEY_GTDDate;
+static handle KEY_VolumeCondition;
+static handle KEY_MinVolume;
+static handle KEY_ContingentCondition;
+static handle KEY_StopPrice;
+static handle KEY_ForceCloseReason;
+static handle KEY_IsAutoSuspend;
+static handle KEY_BusinessUnit;
+static handle KEY_RequestID;
+static handle KEY_UserForceClose;
+static handle KEY_IsSwapOrder;
+static handle KEY_ExchangeID;
+static handle KEY_InvestUnitID;
+static handle KEY_ClientID;
+static handle KEY_IPAddress;
+static handle KEY_MacAddress;
+static handle KEY_ParkedOrderID;
+static handle KEY_UserType;
+static handle KEY_Status;
+static handle KEY_OrderActionRef;
+static handle KEY_OrderSysID;
+static handle KEY_ActionFlag;
+static handle KEY_VolumeChange;
+static handle KEY_ParkedOrderActionID;
+static handle KEY_OffsetFlag;
+static handle KEY_HedgeFlag;
+static handle KEY_MaxVolume;
+static handle KEY_ConfirmDate;
+static handle KEY_ConfirmTime;
+static handle KEY_SettlementID;
+static handle KEY_ExecOrderRef;
+static handle KEY_Volume;
+static handle KEY_ActionType;
+static handle KEY_PosiDirection;
+static handle KEY_ReservePositionFlag;
+static handle KEY_CloseFlag;
+static handle KEY_ExecOrderActionRef;
+static handle KEY_ExecOrderSysID;
+static handle KEY_ForQuoteRef;
+static handle KEY_QuoteRef;
+static handle KEY_AskPrice;
+static handle KEY_BidPrice;
+static handle KEY_AskVolume;
+static handle KEY_BidVolume;
+static handle KEY_AskOffsetFlag;
+static handle KEY_BidOffsetFlag;
+static handle KEY_AskHedgeFlag;
+static handle KEY_BidHedgeFlag;
+static handle KEY_AskOrderRef;
+static handle KEY_BidOrderRef;
+static handle KEY_ForQuoteSysID;
+static handle KEY_QuoteActionRef;
+static handle KEY_QuoteSysID;
+static handle KEY_OptionSelfCloseRef;
+static handle KEY_OptSelfCloseFlag;
+static handle KEY_OptionSelfCloseActionRef;
+static handle KEY_OptionSelfCloseSysID;
+static handle KEY_CombActionRef;
+static handle KEY_CombDirection;
+static handle KEY_OrderLocalID;
+static handle KEY_ParticipantID;
+static handle KEY_ExchangeInstID;
+static handle KEY_TraderID;
+static handle KEY_InstallID;
+static handle KEY_OrderSubmitStatus;
+static handle KEY_NotifySequence;
+static handle KEY_OrderSource;
+static handle KEY_OrderStatus;
+static handle KEY_OrderType;
+static handle KEY_VolumeTraded;
+static handle KEY_VolumeTotal;
+static handle KEY_InsertDate;
+static handle KEY_InsertTime;
+static handle KEY_ActiveTime;
+static handle KEY_SuspendTime;
+static handle KEY_UpdateTime;
+static handle KEY_CancelTime;
+static handle KEY_ActiveTraderID;
+static handle KEY_ClearingPartID;
+static handle KEY_SequenceNo;
+static handle KEY_StatusMsg;
+static handle KEY_ActiveUserID;
+static handle KEY_BrokerOrderSeq;
+static handle KEY_RelativeOrderSysID;
+static handle KEY_ZCETotalTradedVolume;
+static handle KEY_BranchID;
+static handle KEY_TradeID;
+static handle KEY_TradingRole;
+static handle KEY_Price;
+static handle KEY_TradeDate;
+static handle KEY_TradeTime;
+static handle KEY_TradeType;
+static handle KEY_PriceSource;
+static handle KEY_TradeSource;
+static handle KEY_PositionDate;
+static handle KEY_YdPosition;
+static handle KEY_Position;
+static handle KEY_LongFrozen;
+static handle KEY_ShortFrozen;
+static handle KEY_LongFrozenAmount;
+static handle KEY_ShortFrozenAmount;
+static handle KEY_OpenVolume;
+static handle KEY_CloseVolume;
+static handle KEY_OpenAmount;
+static handle KEY_CloseAmount;
+static handle KEY_PositionCost;
+static handle KEY_PreMargin;
+static handle KEY_UseMargin;
+static handle KEY_FrozenMargin;
+static handle KEY_FrozenCash;
+static handle KEY_FrozenCommission;
+static handle KEY_CashIn;
+static handle KEY_Commission;
+static handle KEY_CloseProfit;
+static handle KEY_PositionProfit;
+static handle KEY_PreSettlementPrice;
+static handle KEY_SettlementPrice;
+static handle KEY_OpenCost;
+static handle KEY_ExchangeMargin;
+static handle KEY_CombPosition;
+static handle KEY_CombLongFrozen;
+static handle KEY_CombShortFrozen;
+static handle KEY_CloseProfitByDate;
+static handle KEY_CloseProfitByTrade;
+static handle KEY_TodayPosition;
+static handle KEY_MarginRateByMoney;
+static handle KEY_MarginRateByVolume;
+static handle KEY_StrikeFrozen;
+static handle KEY_StrikeFrozenAmount;
+static handle KEY_AbandonFrozen;
+static handle KEY_YdStrikeFrozen;
+static handle KEY_PreMortgage;
+static handle KEY_PreCredit;
+static handle KEY_PreDeposit;
+static handle KEY_PreBalance;
+static handle KEY_InterestBase;
+static handle KEY_Interest;
+static handle KEY_Deposit;
+static handle KEY_Withdraw;
+static handle KEY_CurrMargin;
+static handle KEY_Balance;
+static handle KEY_Available;
+static handle KEY_WithdrawQuota;
+static handle KEY_Reserve;
+static handle KEY_Credit;
+static handle KEY_Mortgage;
+static handle KEY_DeliveryMargin;
+static handle KEY_ExchangeDeliveryMargin;
+static handle KEY_ReserveBalance;
+static handle KEY_PreFundMortgageIn;
+static handle KEY_PreFundMortgageOut;
+static handle KEY_FundMortgageIn;
+static handle KEY_FundMortgageOut;
+static handle KEY_FundMortgageAvailable;
+static handle KEY_MortgageableFund;
+static handle KEY_SpecProductMargin;
+static handle KEY_SpecProductFrozenMargin;
+static handle KEY_SpecProductCommission;
+static handle KEY_SpecProductFrozenCommission;
+static handle KEY_SpecProductPositionProfit;
+static handle KEY_SpecProductCloseProfit;
+static handle KEY_SpecProductPositionProfitByAlg;
+static handle KEY_SpecProductExchangeMargin;
+static handle KEY_BizType;
+static handle KEY_FrozenSwap;
+static handle KEY_RemainSwap;
+static handle KEY_InvestorGroupID;
+static handle KEY_InvestorName;
+static handle KEY_IdentifiedCardType;
+static handle KEY_IdentifiedCardNo;
+static handle KEY_IsActive;
+static handle KEY_Telephone;
+static handle KEY_Address;
+static handle KEY_OpenDate;
+static handle KEY_Mobile;
+static handle KEY_CommModelID;
+static handle KEY_MarginModelID;
+static handle KEY_ClientIDType;
+static handle KEY_InvestorRange;
+static handle KEY_LongMarginRatioByMoney;
+static handle KEY_LongMarginRatioByVolume;
+static handle KEY_ShortMarginRatioByMoney;
+static handle KEY_ShortMarginRatioByVolume;
+static handle KEY_IsRelative;
+static handle KEY_OpenRatioByMoney;
+static handle KEY_OpenRatioByVolume;
+static handle KEY_CloseRatioByMoney;
+static handle KEY_CloseRatioByVolume;
+static handle KEY_CloseTodayRatioByMoney;
+static handle KEY_CloseTodayRatioByVolume;
+static handle KEY_ExchangeName;
+static handle KEY_ExchangeProperty;
+static handle KEY_ProductID;
+static handle KEY_ProductName;
+static handle KEY_ProductClass;
+static handle KEY_VolumeMultiple;
+static handle KEY_PriceTick;
+static handle KEY_MaxMarketOrderVolume;
+static handle KEY_MinMarketOrderVolume;
+static handle KEY_MaxLimitOrderVolume;
+static handle KEY_MinLimitOrderVolume;
+static handle KEY_PositionType;
+static handle KEY_PositionDateType;
+static handle KEY_CloseDealType;
+static handle KEY_TradeCurrencyID;
+static handle KEY_MortgageFundUseRange;
+static handle KEY_ExchangeProductID;
+static handle KEY_UnderlyingMultiple;
+static handle KEY_InstrumentName;
+static handle KEY_DeliveryYear;
+static handle KEY_DeliveryMonth;
+static handle KEY_CreateDate;
+static handle KEY_ExpireDate;
+static handle KEY_StartDelivDate;
+static handle KEY_EndDelivDate;
+static handle KEY_InstLifePhase;
+static handle KEY_IsTrading;
+static handle KEY_LongMarginRatio;
+static handle KEY_ShortMarginRatio;
+static handle KEY_MaxMarginSideAlgorithm;
+static handle KEY_UnderlyingInstrID;
+static handle KEY_StrikePrice;
+static handle KEY_OptionsType;
+static handle KEY_CombinationType;
+static handle KEY_LastPrice;
+static handle KEY_PreClosePrice;
+static handle KEY_PreOpenInterest;
+static handle KEY_OpenPrice;
+static handle KEY_HighestPrice;
+static handle KEY_LowestPrice;
+static handle KEY_Turnover;
+static handle KEY_OpenInterest;
+static handle KEY_ClosePrice;
+static handle KEY_UpperLimitPrice;
+static handle KEY_LowerLimitPrice;
+static handle KEY_PreDelta;
+static handle KEY_CurrDelta;
+static handle KEY_UpdateMillisec;
+static handle KEY_BidPrice1;
+static handle KEY_BidVolume1;
+static handle KEY_AskPrice1;
+static handle KEY_AskVolume1;
+static handle KEY_BidPrice2;
+static handle KEY_BidVolume2;
+static handle KEY_AskPrice2;
+static handle KEY_AskVolume2;
+static handle KEY_BidPrice3;
+static handle KEY_BidVolume3;
+static handle KEY_AskPrice3;
+static handle KEY_AskVolume3;
+static handle KEY_BidPrice4;
+static handle KEY_BidVolume4;
+static handle KEY_AskPrice4;
+static handle KEY_AskVolume4;
+static handle KEY_BidPrice5;
+static handle KEY_BidVolume5;
+static handle KEY_AskPrice5;
+static handle KEY_AskVolume5;
+static handle KEY_AveragePrice;
+static handle KEY_ActionDay;
+static handle KEY_Content;
+static handle KEY_BankID;
+static handle KEY_BankBrchID;
+static handle KEY_BankName;
+static handle KEY_CombInstrumentID;
+static handle KEY_PositionProfitByDate;
+static handle KEY_PositionProfitByTrade;
+static handle KEY_Margin;
+static handle KEY_ExchMargin;
+static handle KEY_LastSettlementPrice;
+static handle KEY_SequenceLabel;
+static handle KEY_ComTradeID;
+static handle KEY_TotalAmt;
+static handle KEY_LegID;
+static handle KEY_LegMultiple;
+static handle KEY_TradeGroupID;
+static handle KEY_KeyID;
+static handle KEY_CurrentKey;
+static handle KEY_ProductGroupID;
+static handle KEY_LongFrozenMargin;
+static handle KEY_ShortFrozenMargin;
+static handle KEY_LongUseMargin;
+static handle KEY_ShortUseMargin;
+static handle KEY_LongExchMargin;
+static handle KEY_ShortExchMargin;
+static handle KEY_OffsetAmount;
+static handle KEY_LongOffsetAmount;
+static handle KEY_ShortOffsetAmount;
+static handle KEY_ExchOffsetAmount;
+static handle KEY_LongExchOffsetAmount;
+static handle KEY_ShortExchOffsetAmount;
+static handle KEY_ExchLongMarginRatioByMoney;
+static handle KEY_ExchLongMarginRatioByVolume;
+static handle KEY_ExchShortMarginRatioByMoney;
+static handle KEY_ExchShortMarginRatioByVolume;
+static handle KEY_NoLongMarginRatioByMoney;
+static handle KEY_NoLongMarginRatioByVolume;
+static handle KEY_NoShortMarginRatioByMoney;
+static handle KEY_NoShortMarginRatioByVolume;
+static handle KEY_FromCurrencyID;
+static handle KEY_FromCurrencyUnit;
+static handle KEY_ToCurrencyID;
+static handle KEY_ExchangeRate;
+static handle KEY_BrokerSecAgentID;
+static handle KEY_QuoteCurrencyID;
+static handle KEY_StrikeRatioByMoney;
+static handle KEY_StrikeRatioByVolume;
+static handle KEY_OrderCommByVolume;
+static handle KEY_OrderActionCommByVolume;
+static handle KEY_CheckSelfAccount;
+static handle KEY_FixedMargin;
+static handle KEY_MiniMargin;
+static handle KEY_Royalty;
+static handle KEY_ExchFixedMargin;
+static handle KEY_ExchMiniMargin;
+static handle KEY_ExecOrderLocalID;
+static handle KEY_ExecResult;
+static handle KEY_BrokerExecOrderSeq;
+static handle KEY_ForQuoteLocalID;
+static handle KEY_ForQuoteStatus;
+static handle KEY_BrokerForQutoSeq;
+static handle KEY_QuoteLocalID;
+static handle KEY_QuoteStatus;
+static handle KEY_AskOrderSysID;
+static handle KEY_BidOrderSysID;
+static handle KEY_BrokerQuoteSeq;
+static handle KEY_OptionSelfCloseLocalID;
+static handle KEY_BrokerOptionSelfCloseSeq;
+static handle KEY_InvestorUnitName;
+static handle KEY_GuarantRatio;
+static handle KEY_ActionLocalID;
+static handle KEY_ActionStatus;
+static handle KEY_PlateSerial;
+static handle KEY_TradeCode;
+static handle KEY_BankBranchID;
+static handle KEY_BankAccType;
+static handle KEY_BankAccount;
+static handle KEY_BankSerial;
+static handle KEY_BrokerBranchID;
+static handle KEY_FutureAccType;
+static handle KEY_FutureSerial;
+static handle KEY_IdCardType;
+static handle KEY_TradeAmount;
+static handle KEY_CustFee;
+static handle KEY_BrokerFee;
+static handle KEY_AvailabilityFlag;
+static handle KEY_OperatorCode;
+static handle KEY_BankNewAccount;
+static handle KEY_TradeDay;
+static handle KEY_CustomerName;
+static handle KEY_OpenOrDestroy;
+static handle KEY_RegDate;
+static handle KEY_OutDate;
+static handle KEY_TID;
+static handle KEY_CustType;
+static handle KEY_LongCustomerName;
+static handle KEY_ActionDate;
+static handle KEY_ActionTime;
+static handle KEY_OrderActionStatus;
+static handle KEY_SettlementGroupID;
+static handle KEY_InstrumentStatus;
+static handle KEY_TradingSegmentSN;
+static handle KEY_EnterTime;
+static handle KEY_EnterReason;
+static handle KEY_BulletinID;
+static handle KEY_NewsType;
+static handle KEY_NewsUrgency;
+static handle KEY_SendTime;
+static handle KEY_Abstract;
+static handle KEY_ComeFrom;
+static handle KEY_URLLink;
+static handle KEY_MarketID;
+static handle KEY_FieldContent;
+static handle KEY_SequenceSeries;
+static handle KEY_ForQuoteTime;
+static handle KEY_Token;
+static handle KEY_MarginPriceType;
+static handle KEY_Algorithm;
+static handle KEY_AvailIncludeCloseProfit;
+static handle KEY_OptionRoyaltyPriceType;
+static handle KEY_HandlePositionAlgoID;
+static handle KEY_FindMarginRateAlgoID;
+static handle KEY_HandleTradingAccountAlgoID;
+static handle KEY_LastFragment;
+static handle KEY_BankPassWord;
+static handle KEY_Password;
+static handle KEY_VerifyCertNoFlag;
+static handle KEY_FutureFetchAmount;
+static handle KEY_FeePayFlag;
+static handle KEY_Message;
+static handle KEY_Digest;
+static handle KEY_DeviceID;
+static handle KEY_BankSecuAccType;
+static handle KEY_BrokerIDByBank;
+static handle KEY_BankSecuAcc;
+static handle KEY_BankPwdFlag;
+static handle KEY_SecuPwdFlag;
+static handle KEY_OperNo;
+static handle KEY_TransferStatus;
+static handle KEY_RepealTimeInterval;
+static handle KEY_RepealedTimes;
+static handle KEY_BankRepealFlag;
+static handle KEY_BrokerRepealFlag;
+static handle KEY_PlateRepealSerial;
+static handle KEY_BankRepealSerial;
+static handle KEY_FutureRepealSerial;
+static handle KEY_BankUseAmount;
+static handle KEY_BankFetchAmount;
+static handle KEY_Gender;
+static handle KEY_CountryCode;
+static handle KEY_ZipCode;
+static handle KEY_MobilePhone;
+static handle KEY_Fax;
+static handle KEY_EMail;
+static handle KEY_MoneyAccountStatus;
+static handle KEY_CashExchangeCode;
+static handle KEY_NewBankAccount;
+static handle KEY_NewBankPassWord;
+
+void initDictKeys()
+{
+	KEY_BrokerID = PyUnicode_InternFromString("BrokerID");
+	KEY_UserID = PyUnicode_InternFromString("UserID");
+	KEY_UserProductInfo = PyUnicode_InternFromString("UserProductInfo");
+	KEY_AppID = PyUnicode_InternFromString("AppID");
+	KEY_AppType = PyUnicode_InternFromString("AppType");
+	KEY_ErrorID = PyUnicode_InternFromString("ErrorID");
+	KEY_ErrorMsg = PyUnicode_InternFromString("ErrorMsg");
+	KEY_TradingDay = PyUnicode_InternFromString("TradingDay");
+	KEY_LoginTime = PyUnicode_InternFromString("LoginTime");
+	KEY_SystemName = PyUnicode_InternFromString("SystemName");
+	KEY_FrontID = PyUnicode_InternFromString("FrontID");
+	KEY_SessionID = PyUnicode_InternFromString("SessionID");
+	KEY_MaxOrderRef = PyUnicode_InternFromString("MaxOrderRef");
+	KEY_SHFETime = PyUnicode_InternFromString("SHFETime");
+	KEY_DCETime = PyUnicode_InternFromString("DCETime");
+	KEY_CZCETime = PyUnicode_InternFromString("CZCETime");
+	KEY_FFEXTime = PyUnicode_InternFromString("FFEXTime");
+	KEY_INETime = PyUnicode_InternFromString("INETime");
+	KEY_OldPassword = PyUnicode_InternFromString("OldPassword");
+	KEY_NewPassword = PyUnicode_InternFromString("NewPassword");
+	KEY_AccountID = PyUnicode_InternFromString("AccountID");
+	KEY_CurrencyID = PyUnicode_InternFromString("CurrencyID");
+	KEY_InvestorID = PyUnicode_InternFromString("InvestorID");
+	KEY_InstrumentID = PyUnicode_InternFromString("InstrumentID");
+	KEY_OrderRef = PyUnicode_InternFromString("OrderRef");
+	KEY_OrderPriceType = PyUnicode_InternFromString("OrderPriceType");
+	KEY_Direction = PyUnicode_InternFromString("Direction");
+	KEY_CombOffsetFlag = PyUnicode_InternFromString("CombOffsetFlag");
+	KEY_CombHedgeFlag = PyUnicode_InternFromString("CombHedgeFlag");
+	KEY_LimitPrice = PyUnicode_InternFromString("LimitPrice");
+	KEY_VolumeTotalOriginal = PyUnicode_InternFromString("VolumeTotalOriginal");
+	KEY_TimeCondition = PyUnicode_InternFromString("TimeCondition");
+	KEY_GTDDate = PyUnicode_InternFromString("GTDDate");
+	KEY_VolumeCondition = PyUnicode_InternFromString("VolumeCondition");
+	KEY_MinVolume = PyUnicode_InternFromString("MinVolume");
+	KEY_ContingentCondition = PyUnicode_InternFromString("ContingentCondition");
+	KEY_StopPrice = PyUnicode_InternFromString("StopPrice");
+	KEY_ForceCloseReason = PyUnicode_InternFromString("ForceCloseReason");
+	KEY_IsAutoSuspend = PyUnicode_InternFromString("IsAutoSuspend");
+	KEY_BusinessUnit = PyUnicode_InternFromString("BusinessUnit");
+	KEY_RequestID = PyUnicode_InternFromString("RequestID");
+	KEY_UserForceClose = PyUnicode_InternFromString("UserForceClose");
+	KEY_IsSwapOrder = PyUnicode_InternFromString("IsSwapOrder");
+	KEY_ExchangeID = PyUnicode_InternFromString("ExchangeID");
+	KEY_InvestUnitID = PyUnicode_InternFromString("InvestUnitID");
+	KEY_ClientID = PyUnicode_InternFromString("ClientID");
+	KEY_IPAddress = PyUnicode_InternFromString("IPAddress");
+	KEY_MacAddress = PyUnicode_InternFromString("MacAddress");
+	KEY_ParkedOrderID = PyUnicode_InternFromString("ParkedOrderID");
+	KEY_UserType = PyUnicode_InternFromString("UserType");
+	KEY_Status = PyUnicode_InternFromString("Status");
+	KEY_OrderActionRef = PyUnicode_InternFromString("OrderActionRef");
+	KEY_OrderSysID = PyUnicode_InternFromString("OrderSysID");
+	KEY_ActionFlag = PyUnicode_InternFromString("ActionFlag");
+	KEY_VolumeChange = PyUnicode_InternFromString("VolumeChange");
+	KEY_ParkedOrderActionID = PyUnicode_InternFromString("ParkedOrderActionID");
+	KEY_OffsetFlag = PyUnicode_InternFromString("OffsetFlag");
+	KEY_HedgeFlag = PyUnicode_InternFromString("HedgeFlag");
+	KEY_MaxVolume = PyUnicode_InternFromString("MaxVolume");
+	KEY_ConfirmDate = PyUnicode_InternFromString("ConfirmDate");
+	KEY_ConfirmTime = PyUnicode_InternFromString("ConfirmTime");
+	KEY_SettlementID = PyUnicode_InternFromString("SettlementID");
+	KEY_ExecOrderRef = PyUnicode_InternFromString("ExecOrderRef");
+	KEY_Volume = PyUnicode_InternFromString("Volume");
+	KEY_ActionType = PyUnicode_InternFromString("ActionType");
+	KEY_PosiDirection = PyUnicode_InternFromString("PosiDirection");
+	KEY_ReservePositionFlag = PyUnicode_InternFromString("ReservePositionFlag");
+	KEY_CloseFlag = PyUnicode_InternFromString("CloseFlag");
+	KEY_ExecOrderActionRef = PyUnicode_InternFromString("ExecOrderActionRef");
+	KEY_ExecOrderSysID = PyUnicode_InternFromString("ExecOrderSysID");
+	KEY_ForQuoteRef = PyUnicode_InternFromString("ForQuoteRef");
+	KEY_QuoteRef = PyUnicode_InternFromString("QuoteRef");
+	KEY_AskPrice = PyUnicode_InternFromString("AskPrice");
+	KEY_BidPrice = PyUnicode_InternFromString("BidPrice");
+	KEY_AskVolume = PyUnicode_InternFromString("AskVolume");
+	KEY_BidVolume = PyUnicode_InternFromString("BidVolume");
+	KEY_AskOffsetFlag = PyUnicode_InternFromString("AskOffsetFlag");
+	KEY_BidOffsetFlag = PyUnicode_InternFromString("BidOffsetFlag");
+	KEY_AskHedgeFlag = PyUnicode_InternFromString("AskHedgeFlag");
+	KEY_BidHedgeFlag = PyUnicode_InternFromString("BidHedgeFlag");
+	KEY_AskOrderRef = PyUnicode_InternFromString("AskOrderRef");
+	KEY_BidOrderRef = PyUnicode_InternFromString("BidOrderRef");
+	KEY_ForQuoteSysID = PyUnicode_InternFromString("ForQuoteSysID");
+	KEY_QuoteActionRef = PyUnicode_InternFromString("QuoteActionRef");
+	KEY_QuoteSysID = PyUnicode_InternFromString("QuoteSysID");
+	KEY_OptionSelfCloseRef = PyUnicode_InternFromString("OptionSelfCloseRef");
+	KEY_OptSelfCloseFlag = PyUnicode_InternFromString("OptSelfCloseFlag");
+	KEY_OptionSelfCloseActionRef = PyUnicode_InternFromString("OptionSelfCloseActionRef");
+	KEY_OptionSelfCloseSysID = PyUnicode_InternFromString("OptionSelfCloseSysID");
+	KEY_CombActionRef = PyUnicode_InternFromString("CombActionRef");
+	KEY_CombDirection = PyUnicode_InternFromString("CombDirection");
+	KEY_OrderLocalID = PyUnicode_InternFromString("OrderLocalID");
+	KEY_ParticipantID = PyUnicode_InternFromString("ParticipantID");
+	KEY_ExchangeInstID = PyUnicode_InternFromString("ExchangeInstID");
+	KEY_TraderID = PyUnicode_InternFromString("TraderID");
+	KEY_InstallID = PyUnicode_InternFromString("InstallID");
+	KEY_OrderSubmitStatus = PyUnicode_InternFromString("OrderSubmitStatus");
+	KEY_NotifySequence = PyUnicode_InternFromString("NotifySequence");
+	KEY_OrderSource = PyUnicode_InternFromString("OrderSource");
+	KEY_OrderStatus = PyUnicode_InternFromString("OrderStatus");
+	KEY_OrderType = PyUnicode_InternFromString("OrderType");
+	KEY_VolumeTraded = PyUnicode_InternFromString("VolumeTraded");
+	KEY_VolumeTotal = PyUnicode_InternFromString("VolumeTotal");
+	KEY_InsertDate = PyUnicode_InternFromString("InsertDate");
+	KEY_InsertTime = PyUnicode_InternFromString("InsertTime");
+	KEY_ActiveTime = PyUnicode_InternFromString("ActiveTime");
+	KEY_SuspendTime = PyUnicode_InternFromString("SuspendTime");
+	KEY_UpdateTime = PyUnicode_InternFromString("UpdateTime");
+	KEY_CancelTime = PyUnicode_InternFromString("CancelTime");
+	KEY_ActiveTraderID = PyUnicode_InternFromString("ActiveTraderID");
+	KEY_ClearingPartID = PyUnicode_InternFromString("ClearingPartID");
+	KEY_SequenceNo = PyUnicode_InternFromString("SequenceNo");
+	KEY_StatusMsg = PyUnicode_InternFromString("StatusMsg");
+	KEY_ActiveUserID = PyUnicode_InternFromString("ActiveUserID");
+	KEY_BrokerOrderSeq = PyUnicode_InternFromString("BrokerOrderSeq");
+	KEY_RelativeOrderSysID = PyUnicode_InternFromString("RelativeOrderSysID");
+	KEY_ZCETotalTradedVolume = PyUnicode_InternFromString("ZCETotalTradedVolume");
+	KEY_BranchID = PyUnicode_InternFromString("BranchID");
+	KEY_TradeID = PyUnicode_InternFromString("TradeID");
+	KEY_TradingRole = PyUnicode_InternFromString("TradingRole");
+	KEY_Price = PyUnicode_InternFromString("Price");
+	KEY_TradeDate = PyUnicode_InternFromString("TradeDate");
+	KEY_TradeTime = PyUnicode_InternFromString("TradeTime");
+	KEY_TradeType = PyUnicode_InternFromString("TradeType");
+	KEY_PriceSource = PyUnicode_InternFromString("PriceSource");
+	KEY_TradeSource = PyUnicode_InternFromString("TradeSource");
+	KEY_PositionDate = PyUnicode_InternFromString("PositionDate");
+	KEY_YdPosition = PyUnicode_InternFromString("YdPosition");
+	KEY_Position = PyUnicode_InternFromString("Position");
+	KEY_LongFrozen = PyUnicode_InternFromString("LongFrozen");
+	KEY_ShortFrozen = PyUnicode_InternFromString("ShortFrozen");
+	KEY_LongFrozenAmount = PyUnicode_InternFromString("LongFrozenAmount");
+	KEY_ShortFrozenAmount = PyUnicode_InternFromString("ShortFrozenAmount");
+	KEY_OpenVolume = PyUnicode_InternFromString("OpenVolume");
+	KEY_CloseVolume = PyUnicode_InternFromString("CloseVolume");
+	KEY_OpenAmount = PyUnicode_InternFromString("OpenAmount");
+	KEY_CloseAmount = PyUnicode_InternFromString("CloseAmount");
+	KEY_PositionCost = PyUnicode_InternFromString("PositionCost");
+	KEY_PreMargin = PyUnicode_InternFromString("PreMargin");
+	KEY_UseMargin = PyUnicode_InternFromString("UseMargin");
+	KEY_FrozenMargin = PyUnicode_InternFromString("FrozenMargin");
+	KEY_FrozenCash = PyUnicode_InternFromString("FrozenCash");
+	KEY_FrozenCommission = PyUnicode_InternFromString("FrozenCommission");
+	KEY_CashIn = PyUnicode_InternFromString("CashIn");
+	KEY_Commission = PyUnicode_InternFromString("Commission");
+	KEY_CloseProfit = PyUnicode_InternFromString("CloseProfit");
+	KEY_PositionProfit = PyUnicode_InternFromString("PositionProfit");
+	KEY_PreSettlementPrice = PyUnicode_InternFromString("PreSettlementPrice");
+	KEY_SettlementPrice = PyUnicode_InternFromString("SettlementPrice");
+	KEY_OpenCost = PyUnicode_InternFromString("OpenCost");
+	KEY_ExchangeMargin = PyUnicode_InternFromString("ExchangeMargin");
+	KEY_CombPosition = PyUnicode_InternFromString("CombPosition");
+	KEY_CombLongFrozen = PyUnicode_InternFromString("CombLongFrozen");
+	KEY_CombShortFrozen = PyUnicode_InternFromString("CombShortFrozen");
+	KEY_CloseProfitByDate = PyUnicode_InternFromString("CloseProfitByDate");
+	KEY_CloseProfitByTrade = PyUnicode_InternFromString("CloseProfitByTrade");
+	KEY_TodayPosition = PyUnicode_InternFromString("TodayPosition");
+	KEY_MarginRateByMoney = PyUnicode_InternFromString("MarginRateByMoney");
+	KEY_MarginRateByVolume = PyUnicode_InternFromString("MarginRateByVolume");
+	KEY_StrikeFrozen = PyUnicode_InternFromString("StrikeFrozen");
+	KEY_StrikeFrozenAmount = PyUnicode_InternFromString("StrikeFrozenAmount");
+	KEY_AbandonFrozen = PyUnicode_InternFromString("AbandonFrozen");
+	KEY_YdStrikeFrozen = PyUnicode_InternFromString("YdStrikeFrozen");
+	KEY_PreMortgage = PyUnicode_InternFromString("PreMortgage");
+	KEY_PreCredit = PyUnicode_InternFromString("PreCredit");
+	KEY_PreDeposit = PyUnicode_InternFromString("PreDeposit");
+	KEY_PreBalance = PyUnicode_InternFromString("PreBalance");
+	KEY_InterestBase = PyUnicode_InternFromString("InterestBase");
+	KEY_Interest = PyUnicode_InternFromString("Interest");
+	KEY_Deposit = PyUnicode_InternFromString("Deposit");
+	KEY_Withdraw = PyUnicode_InternFromString("Withdraw");
+	KEY_CurrMargin = PyUnicode_InternFromString("CurrMargin");
+	KEY_Balance = PyUnicode_InternFromString("Balance");
+	KEY_Available = PyUnicode_InternFromString("Available");
+	KEY_WithdrawQuota = PyUnicode_InternFromString("WithdrawQuota");
+	KEY_Reserve = PyUnicode_InternFromString("Reserve");
+	KEY_Credit = PyUnicode_InternFromString("Credit");
+	KEY_Mortgage = PyUnicode_InternFromString("Mortgage");
+	KEY_DeliveryMargin = PyUnicode_InternFromString("DeliveryMargin");
+	KEY_ExchangeDeliveryMargin = PyUnicode_InternFromString("ExchangeDeliveryMargin");
+	KEY_ReserveBalance = PyUnicode_InternFromString("ReserveBalance");
+	KEY_PreFundMortgageIn = PyUnicode_InternFromString("PreFundMortgageIn");
+	KEY_PreFundMortgageOut = PyUnicode_InternFromString("PreFundMortgageOut");
+	KEY_FundMortgageIn = PyUnicode_InternFromString("FundMortgageIn");
+	KEY_FundMortgageOut = PyUnicode_InternFromString("FundMortgageOut");
+	KEY_FundMortgageAvailable = PyUnicode_InternFromString("FundMortgageAvailable");
+	KEY_MortgageableFund = PyUnicode_InternFromString("MortgageableFund");
+	KEY_SpecProductMargin = PyUnicode_InternFromString("SpecProductMargin");
+	KEY_SpecProductFrozenMargin = PyUnicode_InternFromString("SpecProductFrozenMargin");
+	KEY_SpecProductCommission = PyUnicode_InternFromString("SpecProductCommission");
+	KEY_SpecProductFrozenCommission = PyUnicode_InternFromString("SpecProductFrozenCommission");
+	KEY_SpecProductPositionProfit = PyUnicode_InternFromString("SpecProductPositionProfit");
+	KEY_SpecProductCloseProfit = PyUnicode_InternFromString("SpecProductCloseProfit");
+	KEY_SpecProductPositionProfitByAlg = PyUnicode_InternFromString("SpecProductPositionProfitByAlg");
+	KEY_SpecProductExchangeMargin = PyUnicode_InternFromString("SpecProductExchangeMargin");
+	KEY_BizType = PyUnicode_InternFromString("BizType");
+	KEY_FrozenSwap = PyUnicode_InternFromString("FrozenSwap");
+	KEY_RemainSwap = PyUnicode_InternFromString("RemainSwap");
+	KEY_InvestorGroupID = PyUnicode_InternFromString("InvestorGroupID");
+	KEY_InvestorName = PyUnicode_InternFromString("InvestorName");
+	KEY_IdentifiedCardType = PyUnicode_InternFromString("IdentifiedCardType");
+	KEY_IdentifiedCardNo = PyUnicode_InternFromString("IdentifiedCardNo");
+	KEY_IsActive = PyUnicode_InternFromString("IsActive");
+	KEY_Telephone = PyUnicode_InternFromString("Telephone");
+	KEY_Address = PyUnicode_InternFromString("Address");
+	KEY_OpenDate = PyUnicode_InternFromString("OpenDate");
+	KEY_Mobile = PyUnicode_InternFromString("Mobile");
+	KEY_CommModelID = PyUnicode_InternFromString("CommModelID");
+	KEY_MarginModelID = PyUnicode_InternFromString("MarginModelID");
+	KEY_ClientIDType = PyUnicode_InternFromString("ClientIDType");
+	KEY_InvestorRange = PyUnicode_InternFromString("InvestorRange");
+	KEY_LongMarginRatioByMoney = PyUnicode_InternFromString("LongMarginRatioByMoney");
+	KEY_LongMarginRatioByVolume = PyUnicode_InternFromString("LongMarginRatioByVolume");
+	KEY_ShortMarginRatioByMoney = PyUnicode_InternFromString("ShortMarginRatioByMoney");
+	KEY_ShortMarginRatioByVolume = PyUnicode_InternFromString("ShortMarginRatioByVolume");
+	KEY_IsRelative = PyUnicode_InternFromString("IsRelative");
+	KEY_OpenRatioByMoney = PyUnicode_InternFromString("OpenRatioByMoney");
+	KEY_OpenRatioByVolume = PyUnicode_InternFromString("OpenRatioByVolume");
+	KEY_CloseRatioByMoney = PyUnicode_InternFromString("CloseRatioByMoney");
+	KEY_CloseRatioByVolume = PyUnicode_InternFromString("CloseRatioByVolume");
+	KEY_CloseTodayRatioByMoney = PyUnicode_InternFromString("CloseTodayRatioByMoney");
+	KEY_CloseTodayRatioByVolume = PyUnicode_InternFromString("CloseTodayRatioByVolume");
+	KEY_ExchangeName = PyUnicode_InternFromString("ExchangeName");
+	KEY_ExchangeProperty = PyUnicode_InternFromString("ExchangeProperty");
+	KEY_ProductID = PyUnicode_InternFromString("ProductID");
+	KEY_ProductName = PyUnicode_InternFromString("ProductName");
+	KEY_ProductClass = PyUnicode_InternFromString("ProductClass");
+	KEY_VolumeMultiple = PyUnicode_InternFromString("VolumeMultiple");
+	KEY_PriceTick = PyUnicode_InternFromString("PriceTick");
+	KEY_MaxMarketOrderVolume = PyUnicode_InternFromString("MaxMarketOrderVolume");
+	KEY_MinMarketOrderVolume = PyUnicode_InternFromString("MinMarketOrderVolume");
+	KEY_MaxLimitOrderVolume = PyUnicode_InternFromString("MaxLimitOrderVolume");
+	KEY_MinLimitOrderVolume = PyUnicode_InternFromString("MinLimitOrderVolume");
+	KEY_PositionType = PyUnicode_InternFromString("PositionType");
+	KEY_PositionDateType = PyUnicode_InternFromString("PositionDateType");
+	KEY_CloseDealType = PyUnicode_InternFromString("CloseDealType");
+	KEY_TradeCurrencyID = PyUnicode_InternFromString("TradeCurrencyID");
+	KEY_MortgageFundUseRange = PyUnicode_InternFromString("MortgageFundUseRange");
+	KEY_ExchangeProductID = PyUnicode_InternFromString("ExchangeProductID");
+	KEY_UnderlyingMultiple = PyUnicode_InternFromString("UnderlyingMultiple");
+	KEY_InstrumentName = PyUnicode_InternFromString("InstrumentName");
+	KEY_DeliveryYear = PyUnicode_InternFromString("DeliveryYear");
+	KEY_DeliveryMonth = PyUnicode_InternFromString("DeliveryMonth");
+	KEY_CreateDate = PyUnicode_InternFromString("CreateDate");
+	KEY_ExpireDate = PyUnicode_InternFromString("ExpireDate");
+	KEY_StartDelivDate = PyUnicode_InternFromString("StartDelivDate");
+	KEY_EndDelivDate = PyUnicode_InternFromString("EndDelivDate");
+	KEY_InstLifePhase = PyUnicode_InternFromString("InstLifePhase");
+	KEY_IsTrading = PyUnicode_InternFromString("IsTrading");
+	KEY_LongMarginRatio = PyUnicode_InternFromString("LongMarginRatio");
+	KEY_ShortMarginRatio = PyUnicode_InternFromString("ShortMarginRatio");
+	KEY_MaxMarginSideAlgorithm = PyUnicode_InternFromString("MaxMarginSideAlgorithm");
+	KEY_UnderlyingInstrID = PyUnicode_InternFromString("UnderlyingInstrID");
+	KEY_StrikePrice = PyUnicode_InternFromString("StrikePrice");
+	KEY_OptionsType = PyUnicode_InternFromString("OptionsType");
+	KEY_CombinationType = PyUnicode_InternFromString("CombinationType");
+	KEY_LastPrice = PyUnicode_InternFromString("LastPrice");
+	KEY_PreClosePrice = PyUnicode_InternFromString("PreClosePrice");
+	KEY_PreOpenInterest = PyUnicode_InternFromString("PreOpenInterest");
+	KEY_OpenPrice = PyUnicode_InternFromString("OpenPrice");
+	KEY_HighestPrice = PyUnicode_InternFromString("HighestPrice");
+	KEY_LowestPrice = PyUnicode_InternFromString("LowestPrice");
+	KEY_Turnover = PyUnicode_InternFromString("Turnover");
+	KEY_OpenInterest = PyUnicode_InternFromString("OpenInterest");
+	KEY_ClosePrice = PyUnicode_InternFromString("ClosePrice");
+	KEY_UpperLimitPrice = PyUnicode_InternFromString("UpperLimitPrice");
+	KEY_LowerLimitPrice = PyUnicode_InternFromString("LowerLimitPrice");
+	KEY_PreDelta = PyUnicode_InternFromString("PreDelta");
+	KEY_CurrDelta = PyUnicode_InternFromString("CurrDelta");
+	KEY_UpdateMillisec = PyUnicode_InternFromString("UpdateMillisec");
+	KEY_BidPrice1 = PyUnicode_InternFromString("BidPrice1");
+	KEY_BidVolume1 = PyUnicode_InternFromString("BidVolume1");
+	KEY_AskPrice1 = PyUnicode_InternFromString("AskPrice1");
+	KEY_AskVolume1 = PyUnicode_InternFromString("AskVolume1");
+	KEY_BidPrice2 = PyUnicode_InternFromString("BidPrice2");
+	KEY_BidVolume2 = PyUnicode_InternFromString("BidVolume2");
+	KEY_AskPrice2 = PyUnicode_InternFromString("AskPrice2");
+	KEY_AskVolume2 = PyUnicode_InternFromString("AskVolume2");
+	KEY_BidPrice3 = PyUnicode_InternFromString("BidPrice3");
+	KEY_BidVolume3 = PyUnicode_InternFromString("BidVolume3");
+	KEY_AskPrice3 = PyUnicode_InternFromString("AskPrice3");
+	KEY_AskVolume3 = PyUnicode_InternFromString("AskVolume3");
+	KEY_BidPrice4 = PyUnicode_InternFromString("BidPrice4");
+	KEY_BidVolume4 = PyUnicode_InternFromString("BidVolume4");
+	KEY_AskPrice4 = PyUnicode_InternFromString("AskPrice4");
+	KEY_AskVolume4 = PyUnicode_InternFromString("AskVolume4");
+	KEY_BidPrice5 = PyUnicode_InternFromString("BidPrice5");
+	KEY_BidVolume5 = PyUnicode_InternFromString("BidVolume5");
+	KEY_AskPrice5 = PyUnicode_InternFromString("AskPrice5");
+	KEY_AskVolume5 = PyUnicode_InternFromString("AskVolume5");
+	KEY_AveragePrice = PyUnicode_InternFromString("AveragePrice");
+	KEY_ActionDay = PyUnicode_InternFromString("ActionDay");
+	KEY_Content = PyUnicode_InternFromString("Content");
+	KEY_BankID = PyUnicode_InternFromString("BankID");
+	KEY_BankBrchID = PyUnicode_InternFromString("BankBrchID");
+	KEY_BankName = PyUnicode_InternFromString("BankName");
+	KEY_CombInstrumentID = PyUnicode_InternFromString("CombInstrumentID");
+	KEY_PositionProfitByDate = PyUnicode_InternFromString("PositionProfitByDate");
+	KEY_PositionProfitByTrade = PyUnicode_InternFromString("PositionProfitByTrade");
+	KEY_Margin = PyUnicode_InternFromString("Margin");
+	KEY_ExchMargin = PyUnicode_InternFromString("ExchMargin");
+	KEY_LastSettlementPrice = PyUnicode_InternFromString("LastSettlementPrice");
+	KEY_SequenceLabel = PyUnicode_InternFromString("SequenceLabel");
+	KEY_ComTradeID = PyUnicode_InternFromString("ComTradeID");
+	KEY_TotalAmt = PyUnicode_InternFromString("TotalAmt");
+	KEY_LegID = PyUnicode_InternFromString("LegID");
+	KEY_LegMultiple = PyUnicode_InternFromString("LegMultiple");
+	KEY_TradeGroupID = PyUnicode_InternFromString("TradeGroupID");
+	KEY_KeyID = PyUnicode_InternFromString("KeyID");
+	KEY_CurrentKey = PyUnicode_InternFromString("CurrentKey");
+	KEY_ProductGroupID = PyUnicode_InternFromString("ProductGroupID");
+	KEY_LongFrozenMargin = PyUnicode_InternFromString("LongFrozenMargin");
+	KEY_ShortFrozenMargin = PyUnicode_InternFromString("ShortFrozenMargin");
+	KEY_LongUseMargin = PyUnicode_InternFromString("LongUseMargin");
+	KEY_ShortUseMargin = PyUnicode_InternFromString("ShortUseMargin");
+	KEY_LongExchMargin = PyUnicode_InternFromString("LongExchMargin");
+	KEY_ShortExchMargin = PyUnicode_InternFromString("ShortExchMargin");
+	KEY_OffsetAmount = PyUnicode_InternFromString("OffsetAmount");
+	KEY_LongOffsetAmount = PyUnicode_InternFromString("LongOffsetAmount");
+	KEY_ShortOffsetAmount = PyUnicode_InternFromString("ShortOffsetAmount");
+	KEY_ExchOffsetAmount = PyUnicode_InternFromString("ExchOffsetAmount");
+	KEY_LongExchOffsetAmount = PyUnicode_InternFromString("LongExchOffsetAmount");
+	KEY_ShortExchOffsetAmount = PyUnicode_InternFromString("ShortExchOffsetAmount");
+	KEY_ExchLongMarginRatioByMoney = PyUnicode_InternFromString("ExchLongMarginRatioByMoney");
+	KEY_ExchLongMarginRatioByVolume = PyUnicode_InternFromString("ExchLongMarginRatioByVolume");
+	KEY_ExchShortMarginRatioByMoney = PyUnicode_InternFromString("ExchShortMarginRatioByMoney");
+	KEY_ExchShortMarginRatioByVolume = PyUnicode_InternFromString("ExchShortMarginRatioByVolume");
+	KEY_NoLongMarginRatioByMoney = PyUnicode_InternFromString("NoLongMarginRatioByMoney");
+	KEY_NoLongMarginRatioByVolume = PyUnicode_InternFromString("NoLongMarginRatioByVolume");
+	KEY_NoShortMarginRatioByMoney = PyUnicode_InternFromString("NoShortMarginRatioByMoney");
+	KEY_NoShortMarginRatioByVolume = PyUnicode_InternFromString("NoShortMarginRatioByVolume");
+	KEY_FromCurrencyID = PyUnicode_InternFromString("FromCurrencyID");
+	KEY_FromCurrencyUnit = PyUnicode_InternFromString("FromCurrencyUnit");
+	KEY_ToCurrencyID = PyUnicode_InternFromString("ToCurrencyID");
+	KEY_ExchangeRate = PyUnicode_InternFromString("ExchangeRate");
+	KEY_BrokerSecAgentID = PyUnicode_InternFromString("BrokerSecAgentID");
+	KEY_QuoteCurrencyID = PyUnicode_InternFromString("QuoteCurrencyID");
+	KEY_StrikeRatioByMoney = PyUnicode_InternFromString("StrikeRatioByMoney");
+	KEY_StrikeRatioByVolume = PyUnicode_InternFromString("StrikeRatioByVolume");
+	KEY_OrderCommByVolume = PyUnicode_InternFromString("OrderCommByVolume");
+	KEY_OrderActionCommByVolume = PyUnicode_InternFromString("OrderActionCommByVolume");
+	KEY_CheckSelfAccount = PyUnicode_InternFromString("CheckSelfAccount");
+	KEY_FixedMargin = PyUnicode_InternFromString("FixedMargin");
+	KEY_MiniMargin = PyUnicode_InternFromString("MiniMargin");
+	KEY_Royalty = PyUnicode_InternFromString("Royalty");
+	KEY_ExchFixedMargin = PyUnicode_InternFromString("ExchFixedMargin");
+	KEY_ExchMiniMargin = PyUnicode_InternFromString("ExchMiniMargin");
+	KEY_ExecOrderLocalID = PyUnicode_InternFromString("ExecOrderLocalID");
+	KEY_ExecResult = PyUnicode_InternFromString("ExecResult");
+	KEY_BrokerExecOrderSeq = PyUnicode_InternFromString("BrokerExecOrderSeq");
+	KEY_ForQuoteLocalID = PyUnicode_InternFromString("ForQuoteLocalID");
+	KEY_ForQuoteStatus = PyUnicode_InternFromString("ForQuoteStatus");
+	KEY_BrokerForQutoSeq = PyUnicode_InternFromString("BrokerForQutoSeq");
+	KEY_QuoteLocalID = PyUnicode_InternFromString("QuoteLocalID");
+	KEY_QuoteStatus = PyUnicode_InternFromString("QuoteStatus");
+	KEY_AskOrderSysID = PyUnicode_InternFromString("AskOrderSysID");
+	KEY_BidOrderSysID = PyUnicode_InternFromString("BidOrderSysID");
+	KEY_BrokerQuoteSeq = PyUnicode_InternFromString("BrokerQuoteSeq");
+	KEY_OptionSelfCloseLocalID = PyUnicode_InternFromString("OptionSelfCloseLocalID");
+	KEY_BrokerOptionSelfCloseSeq = PyUnicode_InternFromString("BrokerOptionSelfCloseSeq");
+	KEY_InvestorUnitName = PyUnicode_InternFromString("InvestorUnitName");
+	KEY_GuarantRatio = PyUnicode_InternFromString("GuarantRatio");
+	KEY_ActionLocalID = PyUnicode_InternFromString("ActionLocalID");
+	KEY_ActionStatus = PyUnicode_InternFromString("ActionStatus");
+	KEY_PlateSerial = PyUnicode_InternFromString("PlateSerial");
+	KEY_TradeCode = PyUnicode_InternFromString("TradeCode");
+	KEY_BankBranchID = PyUnicode_InternFromString("BankBranchID");
+	KEY_BankAccType = PyUnicode_InternFromString("BankAccType");
+	KEY_BankAccount = PyUnicode_InternFromString("BankAccount");
+	KEY_BankSerial = PyUnicode_InternFromString("BankSerial");
+	KEY_BrokerBranchID = PyUnicode_InternFromString("BrokerBranchID");
+	KEY_FutureAccType = PyUnicode_InternFromString("FutureAccType");
+	KEY_FutureSerial = PyUnicode_InternFromString("FutureSerial");
+	KEY_IdCardType = PyUnicode_InternFromString("IdCardType");
+	KEY_TradeAmount = PyUnicode_InternFromString("TradeAmount");
+	KEY_CustFee = PyUnicode_InternFromString("CustFee");
+	KEY_BrokerFee = PyUnicode_InternFromString("BrokerFee");
+	KEY_AvailabilityFlag = PyUnicode_InternFromString("AvailabilityFlag");
+	KEY_OperatorCode = PyUnicode_InternFromString("OperatorCode");
+	KEY_BankNewAccount = PyUnicode_InternFromString("BankNewAccount");
+	KEY_TradeDay = PyUnicode_InternFromString("TradeDay");
+	KEY_CustomerName = PyUnicode_InternFromString("CustomerName");
+	KEY_OpenOrDestroy = PyUnicode_InternFromString("OpenOrDestroy");
+	KEY_RegDate = PyUnicode_InternFromString("RegDate");
+	KEY_OutDate = PyUnicode_InternFromString("OutDate");
+	KEY_TID = PyUnicode_InternFromString("TID");
+	KEY_CustType = PyUnicode_InternFromString("CustType");
+	KEY_LongCustomerName = PyUnicode_InternFromString("LongCustomerName");
+	KEY_ActionDate = PyUnicode_InternFromString("ActionDate");
+	KEY_ActionTime = PyUnicode_InternFromString("ActionTime");
+	KEY_OrderActionStatus = PyUnicode_InternFromString("OrderActionStatus");
+	KEY_SettlementGroupID = PyUnicode_InternFromString("SettlementGroupID");
+	KEY_InstrumentStatus = PyUnicode_InternFromString("InstrumentStatus");
+	KEY_TradingSegmentSN = PyUnicode_InternFromString("TradingSegmentSN");
+	KEY_EnterTime = PyUnicode_InternFromString("EnterTime");
+	KEY_EnterReason = PyUnicode_InternFromString("EnterReason");
+	KEY_BulletinID = PyUnicode_InternFromString("BulletinID");
+	KEY_NewsType = PyUnicode_InternFromString("NewsType");
+	KEY_NewsUrgency = PyUnicode_InternFromString("NewsUrgency");
+	KEY_SendTime = PyUnicode_InternFromString("SendTime");
+	KEY_Abstract = PyUnicode_InternFromString("Abstract");
+	KEY_ComeFrom = PyUnicode_InternFromString("ComeFrom");
+	KEY_URLLink = PyUnicode_InternFromString("URLLink");
+	KEY_MarketID = PyUnicode_InternFromString("MarketID");
+	KEY_FieldContent = PyUnicode_InternFromString("FieldContent");
+	KEY_SequenceSeries = PyUnicode_InternFromString("SequenceSeries");
+	KEY_ForQuoteTime = PyUnicode_InternFromString("ForQuoteTime");
+	KEY_Token = PyUnicode_InternFromString("Token");
+	KEY_MarginPriceType = PyUnicode_InternFromString("MarginPriceType");
+	KEY_Algorithm = PyUnicode_InternFromString("Algorithm");
+	KEY_AvailIncludeCloseProfit = PyUnicode_InternFromString("AvailIncludeCloseProfit");
+	KEY_OptionRoyaltyPriceType = PyUnicode_InternFromString("OptionRoyaltyPriceType");
+	KEY_HandlePositionAlgoID = PyUnicode_InternFromString("HandlePositionAlgoID");
+	KEY_FindMarginRateAlgoID = PyUnicode_InternFromString("FindMarginRateAlgoID");
+	KEY_HandleTradingAccountAlgoID = PyUnicode_InternFromString("HandleTradingAccountAlgoID");
+	KEY_LastFragment = PyUnicode_InternFromString("LastFragment");
+	KEY_BankPassWord = PyUnicode_InternFromString("BankPassWord");
+	KEY_Password = PyUnicode_InternFromString("Password");
+	KEY_VerifyCertNoFlag = PyUnicode_InternFromString("VerifyCertNoFlag");
+	KEY_FutureFetchAmount = PyUnicode_InternFromString("FutureFetchAmount");
+	KEY_FeePayFlag = PyUnicode_InternFromString("FeePayFlag");
+	KEY_Message = PyUnicode_InternFromString("Message");
+	KEY_Digest = PyUnicode_InternFromString("Digest");
+	KEY_DeviceID = PyUnicode_InternFromString("DeviceID");
+	KEY_BankSecuAccType = PyUnicode_InternFromString("BankSecuAccType");
+	KEY_BrokerIDByBank = PyUnicode_InternFromString("BrokerIDByBank");
+	KEY_BankSecuAcc = PyUnicode_InternFromString("BankSecuAcc");
+	KEY_BankPwdFlag = PyUnicode_InternFromString("BankPwdFlag");
+	KEY_SecuPwdFlag = PyUnicode_InternFromString("SecuPwdFlag");
+	KEY_OperNo = PyUnicode_InternFromString("OperNo");
+	KEY_TransferStatus = PyUnicode_InternFromString("TransferStatus");
+	KEY_RepealTimeInterval = PyUnicode_InternFromString("RepealTimeInterval");
+	KEY_RepealedTimes = PyUnicode_InternFromString("RepealedTimes");
+	KEY_BankRepealFlag = PyUnicode_InternFromString("BankRepealFlag");
+	KEY_BrokerRepealFlag = PyUnicode_InternFromString("BrokerRepealFlag");
+	KEY_PlateRepealSerial = PyUnicode_InternFromString("PlateRepealSerial");
+	KEY_BankRepealSerial = PyUnicode_InternFromString("BankRepealSerial");
+	KEY_FutureRepealSerial = PyUnicode_InternFromString("FutureRepealSerial");
+	KEY_BankUseAmount = PyUnicode_InternFromString("BankUseAmount");
+	KEY_BankFetchAmount = PyUnicode_InternFromString("BankFetchAmount");
+	KEY_Gender = PyUnicode_InternFromString("Gender");
+	KEY_CountryCode = PyUnicode_InternFromString("CountryCode");
+	KEY_ZipCode = PyUnicode_InternFromString("ZipCode");
+	KEY_MobilePhone = PyUnicode_InternFromString("MobilePhone");
+	KEY_Fax = PyUnicode_InternFromString("Fax");
+	KEY_EMail = PyUnicode_InternFromString("EMail");
+	KEY_MoneyAccountStatus = PyUnicode_InternFromString("MoneyAccountStatus");
+	KEY_CashExchangeCode = PyUnicode_InternFromString("CashExchangeCode");
+	KEY_NewBankAccount = PyUnicode_InternFromString("NewBankAccount");
+	KEY_NewBankPassWord = PyUnicode_InternFromString("NewBankPassWord");
+};
+
+
 ///-------------------------------------------------------------------------------------
 ///C++的回调函数将数据保存到队列中
 ///-------------------------------------------------------------------------------------
@@ -37,13 +947,13 @@ void FuturesTdApi::OnRspAuthenticate(CThostFtdcRspAuthenticateField *pRspAuthent
 	task.task_name = ONRSPAUTHENTICATE;
 	if (pRspAuthenticateField)
 	{
-		CThostFtdcRspAuthenticateField *task_data = new CThostFtdcRspAuthenticateField();
+		CThostFtdcRspAuthenticateField *task_data = createTaskData<CThostFtdcRspAuthenticateField>();
 		*task_data = *pRspAuthenticateField;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -58,13 +968,13 @@ void FuturesTdApi::OnRspUserLogin(CThostFtdcRspUserLoginField *pRspUserLogin, CT
 	task.task_name = ONRSPUSERLOGIN;
 	if (pRspUserLogin)
 	{
-		CThostFtdcRspUserLoginField *task_data = new CThostFtdcRspUserLoginField();
+		CThostFtdcRspUserLoginField *task_data = createTaskData<CThostFtdcRspUserLoginField>();
 		*task_data = *pRspUserLogin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -79,13 +989,13 @@ void FuturesTdApi::OnRspUserLogout(CThostFtdcUserLogoutField *pUserLogout, CThos
 	task.task_name = ONRSPUSERLOGOUT;
 	if (pUserLogout)
 	{
-		CThostFtdcUserLogoutField *task_data = new CThostFtdcUserLogoutField();
+		CThostFtdcUserLogoutField *task_data = createTaskData<CThostFtdcUserLogoutField>();
 		*task_data = *pUserLogout;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -100,13 +1010,13 @@ void FuturesTdApi::OnRspUserPasswordUpdate(CThostFtdcUserPasswordUpdateField *pU
 	task.task_name = ONRSPUSERPASSWORDUPDATE;
 	if (pUserPasswordUpdate)
 	{
-		CThostFtdcUserPasswordUpdateField *task_data = new CThostFtdcUserPasswordUpdateField();
+		CThostFtdcUserPasswordUpdateField *task_data = createTaskData<CThostFtdcUserPasswordUpdateField>();
 		*task_data = *pUserPasswordUpdate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -121,13 +1031,13 @@ void FuturesTdApi::OnRspTradingAccountPasswordUpdate(CThostFtdcTradingAccountPas
 	task.task_name = ONRSPTRADINGACCOUNTPASSWORDUPDATE;
 	if (pTradingAccountPasswordUpdate)
 	{
-		CThostFtdcTradingAccountPasswordUpdateField *task_data = new CThostFtdcTradingAccountPasswordUpdateField();
+		CThostFtdcTradingAccountPasswordUpdateField *task_data = createTaskData<CThostFtdcTradingAccountPasswordUpdateField>();
 		*task_data = *pTradingAccountPasswordUpdate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -142,13 +1052,13 @@ void FuturesTdApi::OnRspOrderInsert(CThostFtdcInputOrderField *pInputOrder, CTho
 	task.task_name = ONRSPORDERINSERT;
 	if (pInputOrder)
 	{
-		CThostFtdcInputOrderField *task_data = new CThostFtdcInputOrderField();
+		CThostFtdcInputOrderField *task_data = createTaskData<CThostFtdcInputOrderField>();
 		*task_data = *pInputOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -163,13 +1073,13 @@ void FuturesTdApi::OnRspParkedOrderInsert(CThostFtdcParkedOrderField *pParkedOrd
 	task.task_name = ONRSPPARKEDORDERINSERT;
 	if (pParkedOrder)
 	{
-		CThostFtdcParkedOrderField *task_data = new CThostFtdcParkedOrderField();
+		CThostFtdcParkedOrderField *task_data = createTaskData<CThostFtdcParkedOrderField>();
 		*task_data = *pParkedOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -184,13 +1094,13 @@ void FuturesTdApi::OnRspParkedOrderAction(CThostFtdcParkedOrderActionField *pPar
 	task.task_name = ONRSPPARKEDORDERACTION;
 	if (pParkedOrderAction)
 	{
-		CThostFtdcParkedOrderActionField *task_data = new CThostFtdcParkedOrderActionField();
+		CThostFtdcParkedOrderActionField *task_data = createTaskData<CThostFtdcParkedOrderActionField>();
 		*task_data = *pParkedOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -205,13 +1115,13 @@ void FuturesTdApi::OnRspOrderAction(CThostFtdcInputOrderActionField *pInputOrder
 	task.task_name = ONRSPORDERACTION;
 	if (pInputOrderAction)
 	{
-		CThostFtdcInputOrderActionField *task_data = new CThostFtdcInputOrderActionField();
+		CThostFtdcInputOrderActionField *task_data = createTaskData<CThostFtdcInputOrderActionField>();
 		*task_data = *pInputOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -226,13 +1136,13 @@ void FuturesTdApi::OnRspQueryMaxOrderVolume(CThostFtdcQueryMaxOrderVolumeField *
 	task.task_name = ONRSPQUERYMAXORDERVOLUME;
 	if (pQueryMaxOrderVolume)
 	{
-		CThostFtdcQueryMaxOrderVolumeField *task_data = new CThostFtdcQueryMaxOrderVolumeField();
+		CThostFtdcQueryMaxOrderVolumeField *task_data = createTaskData<CThostFtdcQueryMaxOrderVolumeField>();
 		*task_data = *pQueryMaxOrderVolume;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -247,13 +1157,13 @@ void FuturesTdApi::OnRspSettlementInfoConfirm(CThostFtdcSettlementInfoConfirmFie
 	task.task_name = ONRSPSETTLEMENTINFOCONFIRM;
 	if (pSettlementInfoConfirm)
 	{
-		CThostFtdcSettlementInfoConfirmField *task_data = new CThostFtdcSettlementInfoConfirmField();
+		CThostFtdcSettlementInfoConfirmField *task_data = createTaskData<CThostFtdcSettlementInfoConfirmField>();
 		*task_data = *pSettlementInfoConfirm;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -268,13 +1178,13 @@ void FuturesTdApi::OnRspRemoveParkedOrder(CThostFtdcRemoveParkedOrderField *pRem
 	task.task_name = ONRSPREMOVEPARKEDORDER;
 	if (pRemoveParkedOrder)
 	{
-		CThostFtdcRemoveParkedOrderField *task_data = new CThostFtdcRemoveParkedOrderField();
+		CThostFtdcRemoveParkedOrderField *task_data = createTaskData<CThostFtdcRemoveParkedOrderField>();
 		*task_data = *pRemoveParkedOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -289,13 +1199,13 @@ void FuturesTdApi::OnRspRemoveParkedOrderAction(CThostFtdcRemoveParkedOrderActio
 	task.task_name = ONRSPREMOVEPARKEDORDERACTION;
 	if (pRemoveParkedOrderAction)
 	{
-		CThostFtdcRemoveParkedOrderActionField *task_data = new CThostFtdcRemoveParkedOrderActionField();
+		CThostFtdcRemoveParkedOrderActionField *task_data = createTaskData<CThostFtdcRemoveParkedOrderActionField>();
 		*task_data = *pRemoveParkedOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -310,13 +1220,13 @@ void FuturesTdApi::OnRspExecOrderInsert(CThostFtdcInputExecOrderField *pInputExe
 	task.task_name = ONRSPEXECORDERINSERT;
 	if (pInputExecOrder)
 	{
-		CThostFtdcInputExecOrderField *task_data = new CThostFtdcInputExecOrderField();
+		CThostFtdcInputExecOrderField *task_data = createTaskData<CThostFtdcInputExecOrderField>();
 		*task_data = *pInputExecOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -331,13 +1241,13 @@ void FuturesTdApi::OnRspExecOrderAction(CThostFtdcInputExecOrderActionField *pIn
 	task.task_name = ONRSPEXECORDERACTION;
 	if (pInputExecOrderAction)
 	{
-		CThostFtdcInputExecOrderActionField *task_data = new CThostFtdcInputExecOrderActionField();
+		CThostFtdcInputExecOrderActionField *task_data = createTaskData<CThostFtdcInputExecOrderActionField>();
 		*task_data = *pInputExecOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -352,13 +1262,13 @@ void FuturesTdApi::OnRspForQuoteInsert(CThostFtdcInputForQuoteField *pInputForQu
 	task.task_name = ONRSPFORQUOTEINSERT;
 	if (pInputForQuote)
 	{
-		CThostFtdcInputForQuoteField *task_data = new CThostFtdcInputForQuoteField();
+		CThostFtdcInputForQuoteField *task_data = createTaskData<CThostFtdcInputForQuoteField>();
 		*task_data = *pInputForQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -373,13 +1283,13 @@ void FuturesTdApi::OnRspQuoteInsert(CThostFtdcInputQuoteField *pInputQuote, CTho
 	task.task_name = ONRSPQUOTEINSERT;
 	if (pInputQuote)
 	{
-		CThostFtdcInputQuoteField *task_data = new CThostFtdcInputQuoteField();
+		CThostFtdcInputQuoteField *task_data = createTaskData<CThostFtdcInputQuoteField>();
 		*task_data = *pInputQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -394,13 +1304,13 @@ void FuturesTdApi::OnRspQuoteAction(CThostFtdcInputQuoteActionField *pInputQuote
 	task.task_name = ONRSPQUOTEACTION;
 	if (pInputQuoteAction)
 	{
-		CThostFtdcInputQuoteActionField *task_data = new CThostFtdcInputQuoteActionField();
+		CThostFtdcInputQuoteActionField *task_data = createTaskData<CThostFtdcInputQuoteActionField>();
 		*task_data = *pInputQuoteAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -415,13 +1325,13 @@ void FuturesTdApi::OnRspBatchOrderAction(CThostFtdcInputBatchOrderActionField *p
 	task.task_name = ONRSPBATCHORDERACTION;
 	if (pInputBatchOrderAction)
 	{
-		CThostFtdcInputBatchOrderActionField *task_data = new CThostFtdcInputBatchOrderActionField();
+		CThostFtdcInputBatchOrderActionField *task_data = createTaskData<CThostFtdcInputBatchOrderActionField>();
 		*task_data = *pInputBatchOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -436,13 +1346,13 @@ void FuturesTdApi::OnRspOptionSelfCloseInsert(CThostFtdcInputOptionSelfCloseFiel
 	task.task_name = ONRSPOPTIONSELFCLOSEINSERT;
 	if (pInputOptionSelfClose)
 	{
-		CThostFtdcInputOptionSelfCloseField *task_data = new CThostFtdcInputOptionSelfCloseField();
+		CThostFtdcInputOptionSelfCloseField *task_data = createTaskData<CThostFtdcInputOptionSelfCloseField>();
 		*task_data = *pInputOptionSelfClose;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -457,13 +1367,13 @@ void FuturesTdApi::OnRspOptionSelfCloseAction(CThostFtdcInputOptionSelfCloseActi
 	task.task_name = ONRSPOPTIONSELFCLOSEACTION;
 	if (pInputOptionSelfCloseAction)
 	{
-		CThostFtdcInputOptionSelfCloseActionField *task_data = new CThostFtdcInputOptionSelfCloseActionField();
+		CThostFtdcInputOptionSelfCloseActionField *task_data = createTaskData<CThostFtdcInputOptionSelfCloseActionField>();
 		*task_data = *pInputOptionSelfCloseAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -478,13 +1388,13 @@ void FuturesTdApi::OnRspCombActionInsert(CThostFtdcInputCombActionField *pInputC
 	task.task_name = ONRSPCOMBACTIONINSERT;
 	if (pInputCombAction)
 	{
-		CThostFtdcInputCombActionField *task_data = new CThostFtdcInputCombActionField();
+		CThostFtdcInputCombActionField *task_data = createTaskData<CThostFtdcInputCombActionField>();
 		*task_data = *pInputCombAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -499,13 +1409,13 @@ void FuturesTdApi::OnRspQryOrder(CThostFtdcOrderField *pOrder, CThostFtdcRspInfo
 	task.task_name = ONRSPQRYORDER;
 	if (pOrder)
 	{
-		CThostFtdcOrderField *task_data = new CThostFtdcOrderField();
+		CThostFtdcOrderField *task_data = createTaskData<CThostFtdcOrderField>();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -520,13 +1430,13 @@ void FuturesTdApi::OnRspQryTrade(CThostFtdcTradeField *pTrade, CThostFtdcRspInfo
 	task.task_name = ONRSPQRYTRADE;
 	if (pTrade)
 	{
-		CThostFtdcTradeField *task_data = new CThostFtdcTradeField();
+		CThostFtdcTradeField *task_data = createTaskData<CThostFtdcTradeField>();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -541,13 +1451,13 @@ void FuturesTdApi::OnRspQryInvestorPosition(CThostFtdcInvestorPositionField *pIn
 	task.task_name = ONRSPQRYINVESTORPOSITION;
 	if (pInvestorPosition)
 	{
-		CThostFtdcInvestorPositionField *task_data = new CThostFtdcInvestorPositionField();
+		CThostFtdcInvestorPositionField *task_data = createTaskData<CThostFtdcInvestorPositionField>();
 		*task_data = *pInvestorPosition;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -562,13 +1472,13 @@ void FuturesTdApi::OnRspQryTradingAccount(CThostFtdcTradingAccountField *pTradin
 	task.task_name = ONRSPQRYTRADINGACCOUNT;
 	if (pTradingAccount)
 	{
-		CThostFtdcTradingAccountField *task_data = new CThostFtdcTradingAccountField();
+		CThostFtdcTradingAccountField *task_data = createTaskData<CThostFtdcTradingAccountField>();
 		*task_data = *pTradingAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -583,13 +1493,13 @@ void FuturesTdApi::OnRspQryInvestor(CThostFtdcInvestorField *pInvestor, CThostFt
 	task.task_name = ONRSPQRYINVESTOR;
 	if (pInvestor)
 	{
-		CThostFtdcInvestorField *task_data = new CThostFtdcInvestorField();
+		CThostFtdcInvestorField *task_data = createTaskData<CThostFtdcInvestorField>();
 		*task_data = *pInvestor;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -604,13 +1514,13 @@ void FuturesTdApi::OnRspQryTradingCode(CThostFtdcTradingCodeField *pTradingCode,
 	task.task_name = ONRSPQRYTRADINGCODE;
 	if (pTradingCode)
 	{
-		CThostFtdcTradingCodeField *task_data = new CThostFtdcTradingCodeField();
+		CThostFtdcTradingCodeField *task_data = createTaskData<CThostFtdcTradingCodeField>();
 		*task_data = *pTradingCode;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -625,13 +1535,13 @@ void FuturesTdApi::OnRspQryInstrumentMarginRate(CThostFtdcInstrumentMarginRateFi
 	task.task_name = ONRSPQRYINSTRUMENTMARGINRATE;
 	if (pInstrumentMarginRate)
 	{
-		CThostFtdcInstrumentMarginRateField *task_data = new CThostFtdcInstrumentMarginRateField();
+		CThostFtdcInstrumentMarginRateField *task_data = createTaskData<CThostFtdcInstrumentMarginRateField>();
 		*task_data = *pInstrumentMarginRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -646,13 +1556,13 @@ void FuturesTdApi::OnRspQryInstrumentCommissionRate(CThostFtdcInstrumentCommissi
 	task.task_name = ONRSPQRYINSTRUMENTCOMMISSIONRATE;
 	if (pInstrumentCommissionRate)
 	{
-		CThostFtdcInstrumentCommissionRateField *task_data = new CThostFtdcInstrumentCommissionRateField();
+		CThostFtdcInstrumentCommissionRateField *task_data = createTaskData<CThostFtdcInstrumentCommissionRateField>();
 		*task_data = *pInstrumentCommissionRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -667,13 +1577,13 @@ void FuturesTdApi::OnRspQryExchange(CThostFtdcExchangeField *pExchange, CThostFt
 	task.task_name = ONRSPQRYEXCHANGE;
 	if (pExchange)
 	{
-		CThostFtdcExchangeField *task_data = new CThostFtdcExchangeField();
+		CThostFtdcExchangeField *task_data = createTaskData<CThostFtdcExchangeField>();
 		*task_data = *pExchange;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -688,13 +1598,13 @@ void FuturesTdApi::OnRspQryProduct(CThostFtdcProductField *pProduct, CThostFtdcR
 	task.task_name = ONRSPQRYPRODUCT;
 	if (pProduct)
 	{
-		CThostFtdcProductField *task_data = new CThostFtdcProductField();
+		CThostFtdcProductField *task_data = createTaskData<CThostFtdcProductField>();
 		*task_data = *pProduct;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -709,13 +1619,13 @@ void FuturesTdApi::OnRspQryInstrument(CThostFtdcInstrumentField *pInstrument, CT
 	task.task_name = ONRSPQRYINSTRUMENT;
 	if (pInstrument)
 	{
-		CThostFtdcInstrumentField *task_data = new CThostFtdcInstrumentField();
+		CThostFtdcInstrumentField *task_data = createTaskData<CThostFtdcInstrumentField>();
 		*task_data = *pInstrument;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -730,13 +1640,13 @@ void FuturesTdApi::OnRspQryDepthMarketData(CThostFtdcDepthMarketDataField *pDept
 	task.task_name = ONRSPQRYDEPTHMARKETDATA;
 	if (pDepthMarketData)
 	{
-		CThostFtdcDepthMarketDataField *task_data = new CThostFtdcDepthMarketDataField();
+		CThostFtdcDepthMarketDataField *task_data = createTaskData<CThostFtdcDepthMarketDataField>();
 		*task_data = *pDepthMarketData;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -751,13 +1661,13 @@ void FuturesTdApi::OnRspQrySettlementInfo(CThostFtdcSettlementInfoField *pSettle
 	task.task_name = ONRSPQRYSETTLEMENTINFO;
 	if (pSettlementInfo)
 	{
-		CThostFtdcSettlementInfoField *task_data = new CThostFtdcSettlementInfoField();
+		CThostFtdcSettlementInfoField *task_data = createTaskData<CThostFtdcSettlementInfoField>();
 		*task_data = *pSettlementInfo;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -772,13 +1682,13 @@ void FuturesTdApi::OnRspQryTransferBank(CThostFtdcTransferBankField *pTransferBa
 	task.task_name = ONRSPQRYTRANSFERBANK;
 	if (pTransferBank)
 	{
-		CThostFtdcTransferBankField *task_data = new CThostFtdcTransferBankField();
+		CThostFtdcTransferBankField *task_data = createTaskData<CThostFtdcTransferBankField>();
 		*task_data = *pTransferBank;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -793,13 +1703,13 @@ void FuturesTdApi::OnRspQryInvestorPositionDetail(CThostFtdcInvestorPositionDeta
 	task.task_name = ONRSPQRYINVESTORPOSITIONDETAIL;
 	if (pInvestorPositionDetail)
 	{
-		CThostFtdcInvestorPositionDetailField *task_data = new CThostFtdcInvestorPositionDetailField();
+		CThostFtdcInvestorPositionDetailField *task_data = createTaskData<CThostFtdcInvestorPositionDetailField>();
 		*task_data = *pInvestorPositionDetail;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -814,13 +1724,13 @@ void FuturesTdApi::OnRspQryNotice(CThostFtdcNoticeField *pNotice, CThostFtdcRspI
 	task.task_name = ONRSPQRYNOTICE;
 	if (pNotice)
 	{
-		CThostFtdcNoticeField *task_data = new CThostFtdcNoticeField();
+		CThostFtdcNoticeField *task_data = createTaskData<CThostFtdcNoticeField>();
 		*task_data = *pNotice;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -835,13 +1745,13 @@ void FuturesTdApi::OnRspQrySettlementInfoConfirm(CThostFtdcSettlementInfoConfirm
 	task.task_name = ONRSPQRYSETTLEMENTINFOCONFIRM;
 	if (pSettlementInfoConfirm)
 	{
-		CThostFtdcSettlementInfoConfirmField *task_data = new CThostFtdcSettlementInfoConfirmField();
+		CThostFtdcSettlementInfoConfirmField *task_data = createTaskData<CThostFtdcSettlementInfoConfirmField>();
 		*task_data = *pSettlementInfoConfirm;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -856,13 +1766,13 @@ void FuturesTdApi::OnRspQryInvestorPositionCombineDetail(CThostFtdcInvestorPosit
 	task.task_name = ONRSPQRYINVESTORPOSITIONCOMBINEDETAIL;
 	if (pInvestorPositionCombineDetail)
 	{
-		CThostFtdcInvestorPositionCombineDetailField *task_data = new CThostFtdcInvestorPositionCombineDetailField();
+		CThostFtdcInvestorPositionCombineDetailField *task_data = createTaskData<CThostFtdcInvestorPositionCombineDetailField>();
 		*task_data = *pInvestorPositionCombineDetail;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -877,13 +1787,13 @@ void FuturesTdApi::OnRspQryCFMMCTradingAccountKey(CThostFtdcCFMMCTradingAccountK
 	task.task_name = ONRSPQRYCFMMCTRADINGACCOUNTKEY;
 	if (pCFMMCTradingAccountKey)
 	{
-		CThostFtdcCFMMCTradingAccountKeyField *task_data = new CThostFtdcCFMMCTradingAccountKeyField();
+		CThostFtdcCFMMCTradingAccountKeyField *task_data = createTaskData<CThostFtdcCFMMCTradingAccountKeyField>();
 		*task_data = *pCFMMCTradingAccountKey;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -898,13 +1808,13 @@ void FuturesTdApi::OnRspQryEWarrantOffset(CThostFtdcEWarrantOffsetField *pEWarra
 	task.task_name = ONRSPQRYEWARRANTOFFSET;
 	if (pEWarrantOffset)
 	{
-		CThostFtdcEWarrantOffsetField *task_data = new CThostFtdcEWarrantOffsetField();
+		CThostFtdcEWarrantOffsetField *task_data = createTaskData<CThostFtdcEWarrantOffsetField>();
 		*task_data = *pEWarrantOffset;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -919,13 +1829,13 @@ void FuturesTdApi::OnRspQryInvestorProductGroupMargin(CThostFtdcInvestorProductG
 	task.task_name = ONRSPQRYINVESTORPRODUCTGROUPMARGIN;
 	if (pInvestorProductGroupMargin)
 	{
-		CThostFtdcInvestorProductGroupMarginField *task_data = new CThostFtdcInvestorProductGroupMarginField();
+		CThostFtdcInvestorProductGroupMarginField *task_data = createTaskData<CThostFtdcInvestorProductGroupMarginField>();
 		*task_data = *pInvestorProductGroupMargin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -940,13 +1850,13 @@ void FuturesTdApi::OnRspQryExchangeMarginRate(CThostFtdcExchangeMarginRateField
 	task.task_name = ONRSPQRYEXCHANGEMARGINRATE;
 	if (pExchangeMarginRate)
 	{
-		CThostFtdcExchangeMarginRateField *task_data = new CThostFtdcExchangeMarginRateField();
+		CThostFtdcExchangeMarginRateField *task_data = createTaskData<CThostFtdcExchangeMarginRateField>();
 		*task_data = *pExchangeMarginRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -961,13 +1871,13 @@ void FuturesTdApi::OnRspQryExchangeMarginRateAdjust(CThostFtdcExchangeMarginRate
 	task.task_name = ONRSPQRYEXCHANGEMARGINRATEADJUST;
 	if (pExchangeMarginRateAdjust)
 	{
-		CThostFtdcExchangeMarginRateAdjustField *task_data = new CThostFtdcExchangeMarginRateAdjustField();
+		CThostFtdcExchangeMarginRateAdjustField *task_data = createTaskData<CThostFtdcExchangeMarginRateAdjustField>();
 		*task_data = *pExchangeMarginRateAdjust;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -982,13 +1892,13 @@ void FuturesTdApi::OnRspQryExchangeRate(CThostFtdcExchangeRateField *pExchangeRa
 	task.task_name = ONRSPQRYEXCHANGERATE;
 	if (pExchangeRate)
 	{
-		CThostFtdcExchangeRateField *task_data = new CThostFtdcExchangeRateField();
+		CThostFtdcExchangeRateField *task_data = createTaskData<CThostFtdcExchangeRateField>();
 		*task_data = *pExchangeRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1003,13 +1913,13 @@ void FuturesTdApi::OnRspQrySecAgentACIDMap(CThostFtdcSecAgentACIDMapField *pSecA
 	task.task_name = ONRSPQRYSECAGENTACIDMAP;
 	if (pSecAgentACIDMap)
 	{
-		CThostFtdcSecAgentACIDMapField *task_data = new CThostFtdcSecAgentACIDMapField();
+		CThostFtdcSecAgentACIDMapField *task_data = createTaskData<CThostFtdcSecAgentACIDMapField>();
 		*task_data = *pSecAgentACIDMap;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1024,13 +1934,13 @@ void FuturesTdApi::OnRspQryProductExchRate(CThostFtdcProductExchRateField *pProd
 	task.task_name = ONRSPQRYPRODUCTEXCHRATE;
 	if (pProductExchRate)
 	{
-		CThostFtdcProductExchRateField *task_data = new CThostFtdcProductExchRateField();
+		CThostFtdcProductExchRateField *task_data = createTaskData<CThostFtdcProductExchRateField>();
 		*task_data = *pProductExchRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1045,13 +1955,13 @@ void FuturesTdApi::OnRspQryProductGroup(CThostFtdcProductGroupField *pProductGro
 	task.task_name = ONRSPQRYPRODUCTGROUP;
 	if (pProductGroup)
 	{
-		CThostFtdcProductGroupField *task_data = new CThostFtdcProductGroupField();
+		CThostFtdcProductGroupField *task_data = createTaskData<CThostFtdcProductGroupField>();
 		*task_data = *pProductGroup;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1066,13 +1976,13 @@ void FuturesTdApi::OnRspQryMMInstrumentCommissionRate(CThostFtdcMMInstrumentComm
 	task.task_name = ONRSPQRYMMINSTRUMENTCOMMISSIONRATE;
 	if (pMMInstrumentCommissionRate)
 	{
-		CThostFtdcMMInstrumentCommissionRateField *task_data = new CThostFtdcMMInstrumentCommissionRateField();
+		CThostFtdcMMInstrumentCommissionRateField *task_data = createTaskData<CThostFtdcMMInstrumentCommissionRateField>();
 		*task_data = *pMMInstrumentCommissionRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1087,13 +1997,13 @@ void FuturesTdApi::OnRspQryMMOptionInstrCommRate(CThostFtdcMMOptionInstrCommRate
 	task.task_name = ONRSPQRYMMOPTIONINSTRCOMMRATE;
 	if (pMMOptionInstrCommRate)
 	{
-		CThostFtdcMMOptionInstrCommRateField *task_data = new CThostFtdcMMOptionInstrCommRateField();
+		CThostFtdcMMOptionInstrCommRateField *task_data = createTaskData<CThostFtdcMMOptionInstrCommRateField>();
 		*task_data = *pMMOptionInstrCommRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1108,13 +2018,13 @@ void FuturesTdApi::OnRspQryInstrumentOrderCommRate(CThostFtdcInstrumentOrderComm
 	task.task_name = ONRSPQRYINSTRUMENTORDERCOMMRATE;
 	if (pInstrumentOrderCommRate)
 	{
-		CThostFtdcInstrumentOrderCommRateField *task_data = new CThostFtdcInstrumentOrderCommRateField();
+		CThostFtdcInstrumentOrderCommRateField *task_data = createTaskData<CThostFtdcInstrumentOrderCommRateField>();
 		*task_data = *pInstrumentOrderCommRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1129,13 +2039,13 @@ void FuturesTdApi::OnRspQrySecAgentTradingAccount(CThostFtdcTradingAccountField
 	task.task_name = ONRSPQRYSECAGENTTRADINGACCOUNT;
 	if (pTradingAccount)
 	{
-		CThostFtdcTradingAccountField *task_data = new CThostFtdcTradingAccountField();
+		CThostFtdcTradingAccountField *task_data = createTaskData<CThostFtdcTradingAccountField>();
 		*task_data = *pTradingAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1150,13 +2060,13 @@ void FuturesTdApi::OnRspQrySecAgentCheckMode(CThostFtdcSecAgentCheckModeField *p
 	task.task_name = ONRSPQRYSECAGENTCHECKMODE;
 	if (pSecAgentCheckMode)
 	{
-		CThostFtdcSecAgentCheckModeField *task_data = new CThostFtdcSecAgentCheckModeField();
+		CThostFtdcSecAgentCheckModeField *task_data = createTaskData<CThostFtdcSecAgentCheckModeField>();
 		*task_data = *pSecAgentCheckMode;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1171,13 +2081,13 @@ void FuturesTdApi::OnRspQryOptionInstrTradeCost(CThostFtdcOptionInstrTradeCostFi
 	task.task_name = ONRSPQRYOPTIONINSTRTRADECOST;
 	if (pOptionInstrTradeCost)
 	{
-		CThostFtdcOptionInstrTradeCostField *task_data = new CThostFtdcOptionInstrTradeCostField();
+		CThostFtdcOptionInstrTradeCostField *task_data = createTaskData<CThostFtdcOptionInstrTradeCostField>();
 		*task_data = *pOptionInstrTradeCost;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1192,13 +2102,13 @@ void FuturesTdApi::OnRspQryOptionInstrCommRate(CThostFtdcOptionInstrCommRateFiel
 	task.task_name = ONRSPQRYOPTIONINSTRCOMMRATE;
 	if (pOptionInstrCommRate)
 	{
-		CThostFtdcOptionInstrCommRateField *task_data = new CThostFtdcOptionInstrCommRateField();
+		CThostFtdcOptionInstrCommRateField *task_data = createTaskData<CThostFtdcOptionInstrCommRateField>();
 		*task_data = *pOptionInstrCommRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1213,13 +2123,13 @@ void FuturesTdApi::OnRspQryExecOrder(CThostFtdcExecOrderField *pExecOrder, CThos
 	task.task_name = ONRSPQRYEXECORDER;
 	if (pExecOrder)
 	{
-		CThostFtdcExecOrderField *task_data = new CThostFtdcExecOrderField();
+		CThostFtdcExecOrderField *task_data = createTaskData<CThostFtdcExecOrderField>();
 		*task_data = *pExecOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1234,13 +2144,13 @@ void FuturesTdApi::OnRspQryForQuote(CThostFtdcForQuoteField *pForQuote, CThostFt
 	task.task_name = ONRSPQRYFORQUOTE;
 	if (pForQuote)
 	{
-		CThostFtdcForQuoteField *task_data = new CThostFtdcForQuoteField();
+		CThostFtdcForQuoteField *task_data = createTaskData<CThostFtdcForQuoteField>();
 		*task_data = *pForQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1255,13 +2165,13 @@ void FuturesTdApi::OnRspQryQuote(CThostFtdcQuoteField *pQuote, CThostFtdcRspInfo
 	task.task_name = ONRSPQRYQUOTE;
 	if (pQuote)
 	{
-		CThostFtdcQuoteField *task_data = new CThostFtdcQuoteField();
+		CThostFtdcQuoteField *task_data = createTaskData<CThostFtdcQuoteField>();
 		*task_data = *pQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1276,13 +2186,13 @@ void FuturesTdApi::OnRspQryOptionSelfClose(CThostFtdcOptionSelfCloseField *pOpti
 	task.task_name = ONRSPQRYOPTIONSELFCLOSE;
 	if (pOptionSelfClose)
 	{
-		CThostFtdcOptionSelfCloseField *task_data = new CThostFtdcOptionSelfCloseField();
+		CThostFtdcOptionSelfCloseField *task_data = createTaskData<CThostFtdcOptionSelfCloseField>();
 		*task_data = *pOptionSelfClose;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1297,13 +2207,13 @@ void FuturesTdApi::OnRspQryInvestUnit(CThostFtdcInvestUnitField *pInvestUnit, CT
 	task.task_name = ONRSPQRYINVESTUNIT;
 	if (pInvestUnit)
 	{
-		CThostFtdcInvestUnitField *task_data = new CThostFtdcInvestUnitField();
+		CThostFtdcInvestUnitField *task_data = createTaskData<CThostFtdcInvestUnitField>();
 		*task_data = *pInvestUnit;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1318,13 +2228,13 @@ void FuturesTdApi::OnRspQryCombInstrumentGuard(CThostFtdcCombInstrumentGuardFiel
 	task.task_name = ONRSPQRYCOMBINSTRUMENTGUARD;
 	if (pCombInstrumentGuard)
 	{
-		CThostFtdcCombInstrumentGuardField *task_data = new CThostFtdcCombInstrumentGuardField();
+		CThostFtdcCombInstrumentGuardField *task_data = createTaskData<CThostFtdcCombInstrumentGuardField>();
 		*task_data = *pCombInstrumentGuard;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1339,13 +2249,13 @@ void FuturesTdApi::OnRspQryCombAction(CThostFtdcCombActionField *pCombAction, CT
 	task.task_name = ONRSPQRYCOMBACTION;
 	if (pCombAction)
 	{
-		CThostFtdcCombActionField *task_data = new CThostFtdcCombActionField();
+		CThostFtdcCombActionField *task_data = createTaskData<CThostFtdcCombActionField>();
 		*task_data = *pCombAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1360,13 +2270,13 @@ void FuturesTdApi::OnRspQryTransferSerial(CThostFtdcTransferSerialField *pTransf
 	task.task_name = ONRSPQRYTRANSFERSERIAL;
 	if (pTransferSerial)
 	{
-		CThostFtdcTransferSerialField *task_data = new CThostFtdcTransferSerialField();
+		CThostFtdcTransferSerialField *task_data = createTaskData<CThostFtdcTransferSerialField>();
 		*task_data = *pTransferSerial;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1381,13 +2291,13 @@ void FuturesTdApi::OnRspQryAccountregister(CThostFtdcAccountregisterField *pAcco
 	task.task_name = ONRSPQRYACCOUNTREGISTER;
 	if (pAccountregister)
 	{
-		CThostFtdcAccountregisterField *task_data = new CThostFtdcAccountregisterField();
+		CThostFtdcAccountregisterField *task_data = createTaskData<CThostFtdcAccountregisterField>();
 		*task_data = *pAccountregister;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1402,13 +2312,13 @@ void FuturesTdApi::OnRspForQuote(CThostFtdcInputForQuoteField *pForQuoteRsp, CTh
 	task.task_name = ONRSPFORQUOTE;
 	if (pForQuoteRsp)
 	{
-		CThostFtdcInputForQuoteField *task_data = new CThostFtdcInputForQuoteField();
+		CThostFtdcInputForQuoteField *task_data = createTaskData<CThostFtdcInputForQuoteField>();
 		*task_data = *pForQuoteRsp;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1423,7 +2333,7 @@ void FuturesTdApi::OnRspError(CThostFtdcRspInfoField *pRspInfo, int nRequestID,
 	task.task_name = ONRSPERROR;
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1438,7 +2348,7 @@ void FuturesTdApi::OnRtnOrder(CThostFtdcOrderField *pOrder)
 	task.task_name = ONRTNORDER;
 	if (pOrder)
 	{
-		CThostFtdcOrderField *task_data = new CThostFtdcOrderField();
+		CThostFtdcOrderField *task_data = createTaskData<CThostFtdcOrderField>();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
@@ -1451,7 +2361,7 @@ void FuturesTdApi::OnRtnTrade(CThostFtdcTradeField *pTrade)
 	task.task_name = ONRTNTRADE;
 	if (pTrade)
 	{
-		CThostFtdcTradeField *task_data = new CThostFtdcTradeField();
+		CThostFtdcTradeField *task_data = createTaskData<CThostFtdcTradeField>();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
@@ -1464,13 +2374,13 @@ void FuturesTdApi::OnErrRtnOrderInsert(CThostFtdcInputOrderField *pInputOrder, C
 	task.task_name = ONERRRTNORDERINSERT;
 	if (pInputOrder)
 	{
-		CThostFtdcInputOrderField *task_data = new CThostFtdcInputOrderField();
+		CThostFtdcInputOrderField *task_data = createTaskData<CThostFtdcInputOrderField>();
 		*task_data = *pInputOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1483,13 +2393,13 @@ void FuturesTdApi::OnErrRtnOrderAction(CThostFtdcOrderActionField *pOrderAction,
 	task.task_name = ONERRRTNORDERACTION;
 	if (pOrderAction)
 	{
-		CThostFtdcOrderActionField *task_data = new CThostFtdcOrderActionField();
+		CThostFtdcOrderActionField *task_data = createTaskData<CThostFtdcOrderActionField>();
 		*task_data = *pOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1502,7 +2412,7 @@ void FuturesTdApi::OnRtnInstrumentStatus(CThostFtdcInstrumentStatusField *pInstr
 	task.task_name = ONRTNINSTRUMENTSTATUS;
 	if (pInstrumentStatus)
 	{
-		CThostFtdcInstrumentStatusField *task_data = new CThostFtdcInstrumentStatusField();
+		CThostFtdcInstrumentStatusField *task_data = createTaskData<CThostFtdcInstrumentStatusField>();
 		*task_data = *pInstrumentStatus;
 		task.task_data = task_data;
 	}
@@ -1515,7 +2425,7 @@ void FuturesTdApi::OnRtnBulletin(CThostFtdcBulletinField *pBulletin)
 	task.task_name = ONRTNBULLETIN;
 	if (pBulletin)
 	{
-		CThostFtdcBulletinField *task_data = new CThostFtdcBulletinField();
+		CThostFtdcBulletinField *task_data = createTaskData<CThostFtdcBulletinField>();
 		*task_data = *pBulletin;
 		task.task_data = task_data;
 	}
@@ -1528,7 +2438,7 @@ void FuturesTdApi::OnRtnTradingNotice(CThostFtdcTradingNoticeInfoField *pTrading
 	task.task_name = ONRTNTRADINGNOTICE;
 	if (pTradingNoticeInfo)
 	{
-		CThostFtdcTradingNoticeInfoField *task_data = new CThostFtdcTradingNoticeInfoField();
+		CThostFtdcTradingNoticeInfoField *task_data = createTaskData<CThostFtdcTradingNoticeInfoField>();
 		*task_data = *pTradingNoticeInfo;
 		task.task_data = task_data;
 	}
@@ -1541,7 +2451,7 @@ void FuturesTdApi::OnRtnErrorConditionalOrder(CThostFtdcErrorConditionalOrderFie
 	task.task_name = ONRTNERRORCONDITIONALORDER;
 	if (pErrorConditionalOrder)
 	{
-		CThostFtdcErrorConditionalOrderField *task_data = new CThostFtdcErrorConditionalOrderField();
+		CThostFtdcErrorConditionalOrderField *task_data = createTaskData<CThostFtdcErrorConditionalOrderField>();
 		*task_data = *pErrorConditionalOrder;
 		task.task_data = task_data;
 	}
@@ -1554,7 +2464,7 @@ void FuturesTdApi::OnRtnExecOrder(CThostFtdcExecOrderField *pExecOrder)
 	task.task_name = ONRTNEXECORDER;
 	if (pExecOrder)
 	{
-		CThostFtdcExecOrderField *task_data = new CThostFtdcExecOrderField();
+		CThostFtdcExecOrderField *task_data = createTaskData<CThostFtdcExecOrderField>();
 		*task_data = *pExecOrder;
 		task.task_data = task_data;
 	}
@@ -1567,13 +2477,13 @@ void FuturesTdApi::OnErrRtnExecOrderInsert(CThostFtdcInputExecOrderField *pInput
 	task.task_name = ONERRRTNEXECORDERINSERT;
 	if (pInputExecOrder)
 	{
-		CThostFtdcInputExecOrderField *task_data = new CThostFtdcInputExecOrderField();
+		CThostFtdcInputExecOrderField *task_data = createTaskData<CThostFtdcInputExecOrderField>();
 		*task_data = *pInputExecOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1586,13 +2496,13 @@ void FuturesTdApi::OnErrRtnExecOrderAction(CThostFtdcExecOrderActionField *pExec
 	task.task_name = ONERRRTNEXECORDERACTION;
 	if (pExecOrderAction)
 	{
-		CThostFtdcExecOrderActionField *task_data = new CThostFtdcExecOrderActionField();
+		CThostFtdcExecOrderActionField *task_data = createTaskData<CThostFtdcExecOrderActionField>();
 		*task_data = *pExecOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1605,13 +2515,13 @@ void FuturesTdApi::OnErrRtnForQuoteInsert(CThostFtdcInputForQuoteField *pInputFo
 	task.task_name = ONERRRTNFORQUOTEINSERT;
 	if (pInputForQuote)
 	{
-		CThostFtdcInputForQuoteField *task_data = new CThostFtdcInputForQuoteField();
+		CThostFtdcInputForQuoteField *task_data = createTaskData<CThostFtdcInputForQuoteField>();
 		*task_data = *pInputForQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1624,7 +2534,7 @@ void FuturesTdApi::OnRtnQuote(CThostFtdcQuoteField *pQuote)
 	task.task_name = ONRTNQUOTE;
 	if (pQuote)
 	{
-		CThostFtdcQuoteField *task_data = new CThostFtdcQuoteField();
+		CThostFtdcQuoteField *task_data = createTaskData<CThostFtdcQuoteField>();
 		*task_data = *pQuote;
 		task.task_data = task_data;
 	}
@@ -1637,13 +2547,13 @@ void FuturesTdApi::OnErrRtnQuoteInsert(CThostFtdcInputQuoteField *pInputQuote, C
 	task.task_name = ONERRRTNQUOTEINSERT;
 	if (pInputQuote)
 	{
-		CThostFtdcInputQuoteField *task_data = new CThostFtdcInputQuoteField();
+		CThostFtdcInputQuoteField *task_data = createTaskData<CThostFtdcInputQuoteField>();
 		*task_data = *pInputQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1656,13 +2566,13 @@ void FuturesTdApi::OnErrRtnQuoteAction(CThostFtdcQuoteActionField *pQuoteAction,
 	task.task_name = ONERRRTNQUOTEACTION;
 	if (pQuoteAction)
 	{
-		CThostFtdcQuoteActionField *task_data = new CThostFtdcQuoteActionField();
+		CThostFtdcQuoteActionField *task_data = createTaskData<CThostFtdcQuoteActionField>();
 		*task_data = *pQuoteAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1675,7 +2585,7 @@ void FuturesTdApi::OnRtnForQuote(CThostFtdcForQuoteRspField *pForQuoteRsp)
 	task.task_name = ONRTNFORQUOTE;
 	if (pForQuoteRsp)
 	{
-		CThostFtdcForQuoteRspField *task_data = new CThostFtdcForQuoteRspField();
+		CThostFtdcForQuoteRspField *task_data = createTaskData<CThostFtdcForQuoteRspField>();
 		*task_data = *pForQuoteRsp;
 		task.task_data = task_data;
 	}
@@ -1688,7 +2598,7 @@ void FuturesTdApi::OnRtnCFMMCTradingAccountToken(CThostFtdcCFMMCTradingAccountTo
 	task.task_name = ONRTNCFMMCTRADINGACCOUNTTOKEN;
 	if (pCFMMCTradingAccountToken)
 	{
-		CThostFtdcCFMMCTradingAccountTokenField *task_data = new CThostFtdcCFMMCTradingAccountTokenField();
+		CThostFtdcCFMMCTradingAccountTokenField *task_data = createTaskData<CThostFtdcCFMMCTradingAccountTokenField>();
 		*task_data = *pCFMMCTradingAccountToken;
 		task.task_data = task_data;
 	}
@@ -1701,13 +2611,13 @@ void FuturesTdApi::OnErrRtnBatchOrderAction(CThostFtdcBatchOrderActionField *pBa
 	task.task_name = ONERRRTNBATCHORDERACTION;
 	if (pBatchOrderAction)
 	{
-		CThostFtdcBatchOrderActionField *task_data = new CThostFtdcBatchOrderActionField();
+		CThostFtdcBatchOrderActionField *task_data = createTaskData<CThostFtdcBatchOrderActionField>();
 		*task_data = *pBatchOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1720,7 +2630,7 @@ void FuturesTdApi::OnRtnOptionSelfClose(CThostFtdcOptionSelfCloseField *pOptionS
 	task.task_name = ONRTNOPTIONSELFCLOSE;
 	if (pOptionSelfClose)
 	{
-		CThostFtdcOptionSelfCloseField *task_data = new CThostFtdcOptionSelfCloseField();
+		CThostFtdcOptionSelfCloseField *task_data = createTaskData<CThostFtdcOptionSelfCloseField>();
 		*task_data = *pOptionSelfClose;
 		task.task_data = task_data;
 	}
@@ -1733,13 +2643,13 @@ void FuturesTdApi::OnErrRtnOptionSelfCloseInsert(CThostFtdcInputOptionSelfCloseF
 	task.task_name = ONERRRTNOPTIONSELFCLOSEINSERT;
 	if (pInputOptionSelfClose)
 	{
-		CThostFtdcInputOptionSelfCloseField *task_data = new CThostFtdcInputOptionSelfCloseField();
+		CThostFtdcInputOptionSelfCloseField *task_data = createTaskData<CThostFtdcInputOptionSelfCloseField>();
 		*task_data = *pInputOptionSelfClose;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1752,13 +2662,13 @@ void FuturesTdApi::OnErrRtnOptionSelfCloseAction(CThostFtdcOptionSelfCloseAction
 	task.task_name = ONERRRTNOPTIONSELFCLOSEACTION;
 	if (pOptionSelfCloseAction)
 	{
-		CThostFtdcOptionSelfCloseActionField *task_data = new CThostFtdcOptionSelfCloseActionField();
+		CThostFtdcOptionSelfCloseActionField *task_data = createTaskData<CThostFtdcOptionSelfCloseActionField>();
 		*task_data = *pOptionSelfCloseAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1771,7 +2681,7 @@ void FuturesTdApi::OnRtnCombAction(CThostFtdcCombActionField *pCombAction)
 	task.task_name = ONRTNCOMBACTION;
 	if (pCombAction)
 	{
-		CThostFtdcCombActionField *task_data = new CThostFtdcCombActionField();
+		CThostFtdcCombActionField *task_data = createTaskData<CThostFtdcCombActionField>();
 		*task_data = *pCombAction;
 		task.task_data = task_data;
 	}
@@ -1784,13 +2694,13 @@ void FuturesTdApi::OnErrRtnCombActionInsert(CThostFtdcInputCombActionField *pInp
 	task.task_name = ONERRRTNCOMBACTIONINSERT;
 	if (pInputCombAction)
 	{
-		CThostFtdcInputCombActionField *task_data = new CThostFtdcInputCombActionField();
+		CThostFtdcInputCombActionField *task_data = createTaskData<CThostFtdcInputCombActionField>();
 		*task_data = *pInputCombAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1803,13 +2713,13 @@ void FuturesTdApi::OnRspQryContractBank(CThostFtdcContractBankField *pContractBa
 	task.task_name = ONRSPQRYCONTRACTBANK;
 	if (pContractBank)
 	{
-		CThostFtdcContractBankField *task_data = new CThostFtdcContractBankField();
+		CThostFtdcContractBankField *task_data = createTaskData<CThostFtdcContractBankField>();
 		*task_data = *pContractBank;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1824,13 +2734,13 @@ void FuturesTdApi::OnRspQryParkedOrder(CThostFtdcParkedOrderField *pParkedOrder,
 	task.task_name = ONRSPQRYPARKEDORDER;
 	if (pParkedOrder)
 	{
-		CThostFtdcParkedOrderField *task_data = new CThostFtdcParkedOrderField();
+		CThostFtdcParkedOrderField *task_data = createTaskData<CThostFtdcParkedOrderField>();
 		*task_data = *pParkedOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1845,13 +2755,13 @@ void FuturesTdApi::OnRspQryParkedOrderAction(CThostFtdcParkedOrderActionField *p
 	task.task_name = ONRSPQRYPARKEDORDERACTION;
 	if (pParkedOrderAction)
 	{
-		CThostFtdcParkedOrderActionField *task_data = new CThostFtdcParkedOrderActionField();
+		CThostFtdcParkedOrderActionField *task_data = createTaskData<CThostFtdcParkedOrderActionField>();
 		*task_data = *pParkedOrderAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1866,13 +2776,13 @@ void FuturesTdApi::OnRspQryTradingNotice(CThostFtdcTradingNoticeField *pTradingN
 	task.task_name = ONRSPQRYTRADINGNOTICE;
 	if (pTradingNotice)
 	{
-		CThostFtdcTradingNoticeField *task_data = new CThostFtdcTradingNoticeField();
+		CThostFtdcTradingNoticeField *task_data = createTaskData<CThostFtdcTradingNoticeField>();
 		*task_data = *pTradingNotice;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1887,13 +2797,13 @@ void FuturesTdApi::OnRspQryBrokerTradingParams(CThostFtdcBrokerTradingParamsFiel
 	task.task_name = ONRSPQRYBROKERTRADINGPARAMS;
 	if (pBrokerTradingParams)
 	{
-		CThostFtdcBrokerTradingParamsField *task_data = new CThostFtdcBrokerTradingParamsField();
+		CThostFtdcBrokerTradingParamsField *task_data = createTaskData<CThostFtdcBrokerTradingParamsField>();
 		*task_data = *pBrokerTradingParams;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1908,13 +2818,13 @@ void FuturesTdApi::OnRspQryBrokerTradingAlgos(CThostFtdcBrokerTradingAlgosField
 	task.task_name = ONRSPQRYBROKERTRADINGALGOS;
 	if (pBrokerTradingAlgos)
 	{
-		CThostFtdcBrokerTradingAlgosField *task_data = new CThostFtdcBrokerTradingAlgosField();
+		CThostFtdcBrokerTradingAlgosField *task_data = createTaskData<CThostFtdcBrokerTradingAlgosField>();
 		*task_data = *pBrokerTradingAlgos;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1929,13 +2839,13 @@ void FuturesTdApi::OnRspQueryCFMMCTradingAccountToken(CThostFtdcQueryCFMMCTradin
 	task.task_name = ONRSPQUERYCFMMCTRADINGACCOUNTTOKEN;
 	if (pQueryCFMMCTradingAccountToken)
 	{
-		CThostFtdcQueryCFMMCTradingAccountTokenField *task_data = new CThostFtdcQueryCFMMCTradingAccountTokenField();
+		CThostFtdcQueryCFMMCTradingAccountTokenField *task_data = createTaskData<CThostFtdcQueryCFMMCTradingAccountTokenField>();
 		*task_data = *pQueryCFMMCTradingAccountToken;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -1950,7 +2860,7 @@ void FuturesTdApi::OnRtnFromBankToFutureByBank(CThostFtdcRspTransferField *pRspT
 	task.task_name = ONRTNFROMBANKTOFUTUREBYBANK;
 	if (pRspTransfer)
 	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
+		CThostFtdcRspTransferField *task_data = createTaskData<CThostFtdcRspTransferField>();
 		*task_data = *pRspTransfer;
 		task.task_data = task_data;
 	}
@@ -1963,7 +2873,7 @@ void FuturesTdApi::OnRtnFromFutureToBankByBank(CThostFtdcRspTransferField *pRspT
 	task.task_name = ONRTNFROMFUTURETOBANKBYBANK;
 	if (pRspTransfer)
 	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
+		CThostFtdcRspTransferField *task_data = createTaskData<CThostFtdcRspTransferField>();
 		*task_data = *pRspTransfer;
 		task.task_data = task_data;
 	}
@@ -1976,7 +2886,7 @@ void FuturesTdApi::OnRtnRepealFromBankToFutureByBank(CThostFtdcRspRepealField *p
 	task.task_name = ONRTNREPEALFROMBANKTOFUTUREBYBANK;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = createTaskData<CThostFtdcRspRepealField>();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -1989,7 +2899,7 @@ void FuturesTdApi::OnRtnRepealFromFutureToBankByBank(CThostFtdcRspRepealField *p
 	task.task_name = ONRTNREPEALFROMFUTURETOBANKBYBANK;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = createTaskData<CThostFtdcRspRepealField>();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2002,7 +2912,7 @@ void FuturesTdApi::OnRtnFromBankToFutureByFuture(CThostFtdcRspTransferField *pRs
 	task.task_name = ONRTNFROMBANKTOFUTUREBYFUTURE;
 	if (pRspTransfer)
 	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
+		CThostFtdcRspTransferField *task_data = createTaskData<CThostFtdcRspTransferField>();
 		*task_data = *pRspTransfer;
 		task.task_data = task_data;
 	}
@@ -2015,7 +2925,7 @@ void FuturesTdApi::OnRtnFromFutureToBankByFuture(CThostFtdcRspTransferField *pRs
 	task.task_name = ONRTNFROMFUTURETOBANKBYFUTURE;
 	if (pRspTransfer)
 	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
+		CThostFtdcRspTransferField *task_data = createTaskData<CThostFtdcRspTransferField>();
 		*task_data = *pRspTransfer;
 		task.task_data = task_data;
 	}
@@ -2028,7 +2938,7 @@ void FuturesTdApi::OnRtnRepealFromBankToFutureByFutureManual(CThostFtdcRspRepeal
 	task.task_name = ONRTNREPEALFROMBANKTOFUTUREBYFUTUREMANUAL;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = createTaskData<CThostFtdcRspRepealField>();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2041,7 +2951,7 @@ void FuturesTdApi::OnRtnRepealFromFutureToBankByFutureManual(CThostFtdcRspRepeal
 	task.task_name = ONRTNREPEALFROMFUTURETOBANKBYFUTUREMANUAL;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = createTaskData<CThostFtdcRspRepealField>();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2054,7 +2964,7 @@ void FuturesTdApi::OnRtnQueryBankBalanceByFuture(CThostFtdcNotifyQueryAccountFie
 	task.task_name = ONRTNQUERYBANKBALANCEBYFUTURE;
 	if (pNotifyQueryAccount)
 	{
-		CThostFtdcNotifyQueryAccountField *task_data = new CThostFtdcNotifyQueryAccountField();
+		CThostFtdcNotifyQueryAccountField *task_data = createTaskData<CThostFtdcNotifyQueryAccountField>();
 		*task_data = *pNotifyQueryAccount;
 		task.task_data = task_data;
 	}
@@ -2067,13 +2977,13 @@ void FuturesTdApi::OnErrRtnBankToFutureByFuture(CThostFtdcReqTransferField *pReq
 	task.task_name = ONERRRTNBANKTOFUTUREBYFUTURE;
 	if (pReqTransfer)
 	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
+		CThostFtdcReqTransferField *task_data = createTaskData<CThostFtdcReqTransferField>();
 		*task_data = *pReqTransfer;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2086,13 +2996,13 @@ void FuturesTdApi::OnErrRtnFutureToBankByFuture(CThostFtdcReqTransferField *pReq
 	task.task_name = ONERRRTNFUTURETOBANKBYFUTURE;
 	if (pReqTransfer)
 	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
+		CThostFtdcReqTransferField *task_data = createTaskData<CThostFtdcReqTransferField>();
 		*task_data = *pReqTransfer;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2105,13 +3015,13 @@ void FuturesTdApi::OnErrRtnRepealBankToFutureByFutureManual(CThostFtdcReqRepealF
 	task.task_name = ONERRRTNREPEALBANKTOFUTUREBYFUTUREMANUAL;
 	if (pReqRepeal)
 	{
-		CThostFtdcReqRepealField *task_data = new CThostFtdcReqRepealField();
+		CThostFtdcReqRepealField *task_data = createTaskData<CThostFtdcReqRepealField>();
 		*task_data = *pReqRepeal;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2124,13 +3034,13 @@ void FuturesTdApi::OnErrRtnRepealFutureToBankByFutureManual(CThostFtdcReqRepealF
 	task.task_name = ONERRRTNREPEALFUTURETOBANKBYFUTUREMANUAL;
 	if (pReqRepeal)
 	{
-		CThostFtdcReqRepealField *task_data = new CThostFtdcReqRepealField();
+		CThostFtdcReqRepealField *task_data = createTaskData<CThostFtdcReqRepealField>();
 		*task_data = *pReqRepeal;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2143,13 +3053,13 @@ void FuturesTdApi::OnErrRtnQueryBankBalanceByFuture(CThostFtdcReqQueryAccountFie
 	task.task_name = ONERRRTNQUERYBANKBALANCEBYFUTURE;
 	if (pReqQueryAccount)
 	{
-		CThostFtdcReqQueryAccountField *task_data = new CThostFtdcReqQueryAccountField();
+		CThostFtdcReqQueryAccountField *task_data = createTaskData<CThostFtdcReqQueryAccountField>();
 		*task_data = *pReqQueryAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2162,7 +3072,7 @@ void FuturesTdApi::OnRtnRepealFromBankToFutureByFuture(CThostFtdcRspRepealField
 	task.task_name = ONRTNREPEALFROMBANKTOFUTUREBYFUTURE;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = createTaskData<CThostFtdcRspRepealField>();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2175,7 +3085,7 @@ void FuturesTdApi::OnRtnRepealFromFutureToBankByFuture(CThostFtdcRspRepealField
 	task.task_name = ONRTNREPEALFROMFUTURETOBANKBYFUTURE;
 	if (pRspRepeal)
 	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
+		CThostFtdcRspRepealField *task_data = createTaskData<CThostFtdcRspRepealField>();
 		*task_data = *pRspRepeal;
 		task.task_data = task_data;
 	}
@@ -2188,13 +3098,13 @@ void FuturesTdApi::OnRspFromBankToFutureByFuture(CThostFtdcReqTransferField *pRe
 	task.task_name = ONRSPFROMBANKTOFUTUREBYFUTURE;
 	if (pReqTransfer)
 	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
+		CThostFtdcReqTransferField *task_data = createTaskData<CThostFtdcReqTransferField>();
 		*task_data = *pReqTransfer;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2209,13 +3119,13 @@ void FuturesTdApi::OnRspFromFutureToBankByFuture(CThostFtdcReqTransferField *pRe
 	task.task_name = ONRSPFROMFUTURETOBANKBYFUTURE;
 	if (pReqTransfer)
 	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
+		CThostFtdcReqTransferField *task_data = createTaskData<CThostFtdcReqTransferField>();
 		*task_data = *pReqTransfer;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2230,13 +3140,13 @@ void FuturesTdApi::OnRspQueryBankAccountMoneyByFuture(CThostFtdcReqQueryAccountF
 	task.task_name = ONRSPQUERYBANKACCOUNTMONEYBYFUTURE;
 	if (pReqQueryAccount)
 	{
-		CThostFtdcReqQueryAccountField *task_data = new CThostFtdcReqQueryAccountField();
+		CThostFtdcReqQueryAccountField *task_data = createTaskData<CThostFtdcReqQueryAccountField>();
 		*task_data = *pReqQueryAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
+		CThostFtdcRspInfoField *task_error = createTaskData<CThostFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -2251,7 +3161,7 @@ void FuturesTdApi::OnRtnOpenAccountByBank(CThostFtdcOpenAccountField *pOpenAccou
 	task.task_name = ONRTNOPENACCOUNTBYBANK;
 	if (pOpenAccount)
 	{
-		CThostFtdcOpenAccountField *task_data = new CThostFtdcOpenAccountField();
+		CThostFtdcOpenAccountField *task_data = createTaskData<CThostFtdcOpenAccountField>();
 		*task_data = *pOpenAccount;
 		task.task_data = task_data;
 	}
@@ -2264,7 +3174,7 @@ void FuturesTdApi::OnRtnCancelAccountByBank(CThostFtdcCancelAccountField *pCance
 	task.task_name = ONRTNCANCELACCOUNTBYBANK;
 	if (pCancelAccount)
 	{
-		CThostFtdcCancelAccountField *task_data = new CThostFtdcCancelAccountField();
+		CThostFtdcCancelAccountField *task_data = createTaskData<CThostFtdcCancelAccountField>();
 		*task_data = *pCancelAccount;
 		task.task_data = task_data;
 	}
@@ -2277,7 +3187,7 @@ void FuturesTdApi::OnRtnChangeAccountByBank(CThostFtdcChangeAccountField *pChang
 	task.task_name = ONRTNCHANGEACCOUNTBYBANK;
 	if (pChangeAccount)
 	{
-		CThostFtdcChangeAccountField *task_data = new CThostFtdcChangeAccountField();
+		CThostFtdcChangeAccountField *task_data = createTaskData<CThostFtdcChangeAccountField>();
 		*task_data = *pChangeAccount;
 		task.task_data = task_data;
 	}
@@ -2295,6 +3205,7 @@ void FuturesTdApi::processTask()
 		while (this->active)
 		{
 			Task task = this->task_queue.pop();
+			long long start = getTimestamp();
 
 			switch (task.task_name)
 			{
@@ -3030,6 +3941,9 @@ void FuturesTdApi::processTask()
 				break;
 			}
 			};
+
+			//记录入队到分发的延时以及回调处理耗时
+			this->task_stats.record(task.task_name, start - task.task_time, getTimestamp() - start);
 		}
 	}
 	catch (const TerminatedError&)
@@ -3062,20 +3976,20 @@ void FuturesTdApi::processRspAuthenticate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspAuthenticateField *task_data = (CThostFtdcRspAuthenticateField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["AppID"] = toUtf(task_data->AppID);
-		data["AppType"] = task_data->AppType;
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_AppID] = toUtf(task_data->AppID);
+		data[KEY_AppType] = task_data->AppType;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspAuthenticate(data, error, task->task_id, task->task_last);
 };
@@ -3087,28 +4001,28 @@ void FuturesTdApi::processRspUserLogin(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspUserLoginField *task_data = (CThostFtdcRspUserLoginField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["LoginTime"] = toUtf(task_data->LoginTime);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["SystemName"] = toUtf(task_data->SystemName);
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["MaxOrderRef"] = toUtf(task_data->MaxOrderRef);
-		data["SHFETime"] = toUtf(task_data->SHFETime);
-		data["DCETime"] = toUtf(task_data->DCETime);
-		data["CZCETime"] = toUtf(task_data->CZCETime);
-		data["FFEXTime"] = toUtf(task_data->FFEXTime);
-		data["INETime"] = toUtf(task_data->INETime);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_LoginTime] = toUtf(task_data->LoginTime);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_SystemName] = toUtf(task_data->SystemName);
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_MaxOrderRef] = toUtf(task_data->MaxOrderRef);
+		data[KEY_SHFETime] = toUtf(task_data->SHFETime);
+		data[KEY_DCETime] = toUtf(task_data->DCETime);
+		data[KEY_CZCETime] = toUtf(task_data->CZCETime);
+		data[KEY_FFEXTime] = toUtf(task_data->FFEXTime);
+		data[KEY_INETime] = toUtf(task_data->INETime);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspUserLogin(data, error, task->task_id, task->task_last);
 };
@@ -3120,17 +4034,17 @@ void FuturesTdApi::processRspUserLogout(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcUserLogoutField *task_data = (CThostFtdcUserLogoutField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspUserLogout(data, error, task->task_id, task->task_last);
 };
@@ -3142,19 +4056,19 @@ void FuturesTdApi::processRspUserPasswordUpdate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcUserPasswordUpdateField *task_data = (CThostFtdcUserPasswordUpdateField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OldPassword"] = toUtf(task_data->OldPassword);
-		data["NewPassword"] = toUtf(task_data->NewPassword);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OldPassword] = toUtf(task_data->OldPassword);
+		data[KEY_NewPassword] = toUtf(task_data->NewPassword);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspUserPasswordUpdate(data, error, task->task_id, task->task_last);
 };
@@ -3166,20 +4080,20 @@ void FuturesTdApi::processRspTradingAccountPasswordUpdate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradingAccountPasswordUpdateField *task_data = (CThostFtdcTradingAccountPasswordUpdateField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["OldPassword"] = toUtf(task_data->OldPassword);
-		data["NewPassword"] = toUtf(task_data->NewPassword);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_OldPassword] = toUtf(task_data->OldPassword);
+		data[KEY_NewPassword] = toUtf(task_data->NewPassword);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspTradingAccountPasswordUpdate(data, error, task->task_id, task->task_last);
 };
@@ -3191,45 +4105,45 @@ void FuturesTdApi::processRspOrderInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputOrderField *task_data = (CThostFtdcInputOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspOrderInsert(data, error, task->task_id, task->task_last);
 };
@@ -3241,50 +4155,50 @@ void FuturesTdApi::processRspParkedOrderInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcParkedOrderField *task_data = (CThostFtdcParkedOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParkedOrderID"] = toUtf(task_data->ParkedOrderID);
-		data["UserType"] = task_data->UserType;
-		data["Status"] = task_data->Status;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParkedOrderID] = toUtf(task_data->ParkedOrderID);
+		data[KEY_UserType] = task_data->UserType;
+		data[KEY_Status] = task_data->Status;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspParkedOrderInsert(data, error, task->task_id, task->task_last);
 };
@@ -3296,37 +4210,37 @@ void FuturesTdApi::processRspParkedOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcParkedOrderActionField *task_data = (CThostFtdcParkedOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OrderActionRef"] = task_data->OrderActionRef;
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeChange"] = task_data->VolumeChange;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ParkedOrderActionID"] = toUtf(task_data->ParkedOrderActionID);
-		data["UserType"] = task_data->UserType;
-		data["Status"] = task_data->Status;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OrderActionRef] = task_data->OrderActionRef;
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeChange] = task_data->VolumeChange;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ParkedOrderActionID] = toUtf(task_data->ParkedOrderActionID);
+		data[KEY_UserType] = task_data->UserType;
+		data[KEY_Status] = task_data->Status;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspParkedOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -3338,32 +4252,32 @@ void FuturesTdApi::processRspOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputOrderActionField *task_data = (CThostFtdcInputOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OrderActionRef"] = task_data->OrderActionRef;
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeChange"] = task_data->VolumeChange;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OrderActionRef] = task_data->OrderActionRef;
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeChange] = task_data->VolumeChange;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -3375,24 +4289,24 @@ void FuturesTdApi::processRspQueryMaxOrderVolume(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcQueryMaxOrderVolumeField *task_data = (CThostFtdcQueryMaxOrderVolumeField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["Direction"] = task_data->Direction;
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["MaxVolume"] = task_data->MaxVolume;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_MaxVolume] = task_data->MaxVolume;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQueryMaxOrderVolume(data, error, task->task_id, task->task_last);
 };
@@ -3404,22 +4318,22 @@ void FuturesTdApi::processRspSettlementInfoConfirm(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcSettlementInfoConfirmField *task_data = (CThostFtdcSettlementInfoConfirmField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ConfirmDate"] = toUtf(task_data->ConfirmDate);
-		data["ConfirmTime"] = toUtf(task_data->ConfirmTime);
-		data["SettlementID"] = task_data->SettlementID;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ConfirmDate] = toUtf(task_data->ConfirmDate);
+		data[KEY_ConfirmTime] = toUtf(task_data->ConfirmTime);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspSettlementInfoConfirm(data, error, task->task_id, task->task_last);
 };
@@ -3431,19 +4345,19 @@ void FuturesTdApi::processRspRemoveParkedOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRemoveParkedOrderField *task_data = (CThostFtdcRemoveParkedOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ParkedOrderID"] = toUtf(task_data->ParkedOrderID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ParkedOrderID] = toUtf(task_data->ParkedOrderID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspRemoveParkedOrder(data, error, task->task_id, task->task_last);
 };
@@ -3455,19 +4369,19 @@ void FuturesTdApi::processRspRemoveParkedOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRemoveParkedOrderActionField *task_data = (CThostFtdcRemoveParkedOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ParkedOrderActionID"] = toUtf(task_data->ParkedOrderActionID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ParkedOrderActionID] = toUtf(task_data->ParkedOrderActionID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspRemoveParkedOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -3479,36 +4393,36 @@ void FuturesTdApi::processRspExecOrderInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputExecOrderField *task_data = (CThostFtdcInputExecOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExecOrderRef"] = toUtf(task_data->ExecOrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ActionType"] = task_data->ActionType;
-		data["PosiDirection"] = task_data->PosiDirection;
-		data["ReservePositionFlag"] = task_data->ReservePositionFlag;
-		data["CloseFlag"] = task_data->CloseFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ExecOrderRef] = toUtf(task_data->ExecOrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ActionType] = task_data->ActionType;
+		data[KEY_PosiDirection] = task_data->PosiDirection;
+		data[KEY_ReservePositionFlag] = task_data->ReservePositionFlag;
+		data[KEY_CloseFlag] = task_data->CloseFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspExecOrderInsert(data, error, task->task_id, task->task_last);
 };
@@ -3520,30 +4434,30 @@ void FuturesTdApi::processRspExecOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputExecOrderActionField *task_data = (CThostFtdcInputExecOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ExecOrderActionRef"] = task_data->ExecOrderActionRef;
-		data["ExecOrderRef"] = toUtf(task_data->ExecOrderRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ExecOrderSysID"] = toUtf(task_data->ExecOrderSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ExecOrderActionRef] = task_data->ExecOrderActionRef;
+		data[KEY_ExecOrderRef] = toUtf(task_data->ExecOrderRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ExecOrderSysID] = toUtf(task_data->ExecOrderSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspExecOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -3555,25 +4469,25 @@ void FuturesTdApi::processRspForQuoteInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputForQuoteField *task_data = (CThostFtdcInputForQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ForQuoteRef"] = toUtf(task_data->ForQuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ForQuoteRef] = toUtf(task_data->ForQuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspForQuoteInsert(data, error, task->task_id, task->task_last);
 };
@@ -3585,38 +4499,38 @@ void FuturesTdApi::processRspQuoteInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputQuoteField *task_data = (CThostFtdcInputQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["QuoteRef"] = toUtf(task_data->QuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["AskPrice"] = task_data->AskPrice;
-		data["BidPrice"] = task_data->BidPrice;
-		data["AskVolume"] = task_data->AskVolume;
-		data["BidVolume"] = task_data->BidVolume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["AskOffsetFlag"] = task_data->AskOffsetFlag;
-		data["BidOffsetFlag"] = task_data->BidOffsetFlag;
-		data["AskHedgeFlag"] = task_data->AskHedgeFlag;
-		data["BidHedgeFlag"] = task_data->BidHedgeFlag;
-		data["AskOrderRef"] = toUtf(task_data->AskOrderRef);
-		data["BidOrderRef"] = toUtf(task_data->BidOrderRef);
-		data["ForQuoteSysID"] = toUtf(task_data->ForQuoteSysID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_QuoteRef] = toUtf(task_data->QuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_AskPrice] = task_data->AskPrice;
+		data[KEY_BidPrice] = task_data->BidPrice;
+		data[KEY_AskVolume] = task_data->AskVolume;
+		data[KEY_BidVolume] = task_data->BidVolume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_AskOffsetFlag] = task_data->AskOffsetFlag;
+		data[KEY_BidOffsetFlag] = task_data->BidOffsetFlag;
+		data[KEY_AskHedgeFlag] = task_data->AskHedgeFlag;
+		data[KEY_BidHedgeFlag] = task_data->BidHedgeFlag;
+		data[KEY_AskOrderRef] = toUtf(task_data->AskOrderRef);
+		data[KEY_BidOrderRef] = toUtf(task_data->BidOrderRef);
+		data[KEY_ForQuoteSysID] = toUtf(task_data->ForQuoteSysID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQuoteInsert(data, error, task->task_id, task->task_last);
 };
@@ -3628,30 +4542,30 @@ void FuturesTdApi::processRspQuoteAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputQuoteActionField *task_data = (CThostFtdcInputQuoteActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["QuoteActionRef"] = task_data->QuoteActionRef;
-		data["QuoteRef"] = toUtf(task_data->QuoteRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["QuoteSysID"] = toUtf(task_data->QuoteSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_QuoteActionRef] = task_data->QuoteActionRef;
+		data[KEY_QuoteRef] = toUtf(task_data->QuoteRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_QuoteSysID] = toUtf(task_data->QuoteSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQuoteAction(data, error, task->task_id, task->task_last);
 };
@@ -3663,26 +4577,26 @@ void FuturesTdApi::processRspBatchOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputBatchOrderActionField *task_data = (CThostFtdcInputBatchOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OrderActionRef"] = task_data->OrderActionRef;
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OrderActionRef] = task_data->OrderActionRef;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspBatchOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -3694,32 +4608,32 @@ void FuturesTdApi::processRspOptionSelfCloseInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputOptionSelfCloseField *task_data = (CThostFtdcInputOptionSelfCloseField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OptionSelfCloseRef"] = toUtf(task_data->OptionSelfCloseRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["OptSelfCloseFlag"] = task_data->OptSelfCloseFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OptionSelfCloseRef] = toUtf(task_data->OptionSelfCloseRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_OptSelfCloseFlag] = task_data->OptSelfCloseFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspOptionSelfCloseInsert(data, error, task->task_id, task->task_last);
 };
@@ -3731,30 +4645,30 @@ void FuturesTdApi::processRspOptionSelfCloseAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputOptionSelfCloseActionField *task_data = (CThostFtdcInputOptionSelfCloseActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OptionSelfCloseActionRef"] = task_data->OptionSelfCloseActionRef;
-		data["OptionSelfCloseRef"] = toUtf(task_data->OptionSelfCloseRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["OptionSelfCloseSysID"] = toUtf(task_data->OptionSelfCloseSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OptionSelfCloseActionRef] = task_data->OptionSelfCloseActionRef;
+		data[KEY_OptionSelfCloseRef] = toUtf(task_data->OptionSelfCloseRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_OptionSelfCloseSysID] = toUtf(task_data->OptionSelfCloseSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspOptionSelfCloseAction(data, error, task->task_id, task->task_last);
 };
@@ -3766,28 +4680,28 @@ void FuturesTdApi::processRspCombActionInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputCombActionField *task_data = (CThostFtdcInputCombActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["CombActionRef"] = toUtf(task_data->CombActionRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Direction"] = task_data->Direction;
-		data["Volume"] = task_data->Volume;
-		data["CombDirection"] = task_data->CombDirection;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_CombActionRef] = toUtf(task_data->CombActionRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_CombDirection] = task_data->CombDirection;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspCombActionInsert(data, error, task->task_id, task->task_last);
 };
@@ -3799,78 +4713,78 @@ void FuturesTdApi::processRspQryOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOrderField *task_data = (CThostFtdcOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["OrderSource"] = task_data->OrderSource;
-		data["OrderStatus"] = task_data->OrderStatus;
-		data["OrderType"] = task_data->OrderType;
-		data["VolumeTraded"] = task_data->VolumeTraded;
-		data["VolumeTotal"] = task_data->VolumeTotal;
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ActiveTime"] = toUtf(task_data->ActiveTime);
-		data["SuspendTime"] = toUtf(task_data->SuspendTime);
-		data["UpdateTime"] = toUtf(task_data->UpdateTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ActiveTraderID"] = toUtf(task_data->ActiveTraderID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["RelativeOrderSysID"] = toUtf(task_data->RelativeOrderSysID);
-		data["ZCETotalTradedVolume"] = task_data->ZCETotalTradedVolume;
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_OrderLocalID] = toUtf(task_data->OrderLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_OrderSource] = task_data->OrderSource;
+		data[KEY_OrderStatus] = task_data->OrderStatus;
+		data[KEY_OrderType] = task_data->OrderType;
+		data[KEY_VolumeTraded] = task_data->VolumeTraded;
+		data[KEY_VolumeTotal] = task_data->VolumeTotal;
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ActiveTime] = toUtf(task_data->ActiveTime);
+		data[KEY_SuspendTime] = toUtf(task_data->SuspendTime);
+		data[KEY_UpdateTime] = toUtf(task_data->UpdateTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ActiveTraderID] = toUtf(task_data->ActiveTraderID);
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerOrderSeq] = task_data->BrokerOrderSeq;
+		data[KEY_RelativeOrderSysID] = toUtf(task_data->RelativeOrderSysID);
+		data[KEY_ZCETotalTradedVolume] = task_data->ZCETotalTradedVolume;
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOrder(data, error, task->task_id, task->task_last);
 };
@@ -3882,46 +4796,46 @@ void FuturesTdApi::processRspQryTrade(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradeField *task_data = (CThostFtdcTradeField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["Direction"] = task_data->Direction;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["TradingRole"] = task_data->TradingRole;
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["Price"] = task_data->Price;
-		data["Volume"] = task_data->Volume;
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["TradeType"] = task_data->TradeType;
-		data["PriceSource"] = task_data->PriceSource;
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["TradeSource"] = task_data->TradeSource;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_TradeID] = toUtf(task_data->TradeID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_TradingRole] = task_data->TradingRole;
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_Price] = task_data->Price;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_TradeType] = task_data->TradeType;
+		data[KEY_PriceSource] = task_data->PriceSource;
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_OrderLocalID] = toUtf(task_data->OrderLocalID);
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_BrokerOrderSeq] = task_data->BrokerOrderSeq;
+		data[KEY_TradeSource] = task_data->TradeSource;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTrade(data, error, task->task_id, task->task_last);
 };
@@ -3933,61 +4847,61 @@ void FuturesTdApi::processRspQryInvestorPosition(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInvestorPositionField *task_data = (CThostFtdcInvestorPositionField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["PosiDirection"] = task_data->PosiDirection;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["PositionDate"] = task_data->PositionDate;
-		data["YdPosition"] = task_data->YdPosition;
-		data["Position"] = task_data->Position;
-		data["LongFrozen"] = task_data->LongFrozen;
-		data["ShortFrozen"] = task_data->ShortFrozen;
-		data["LongFrozenAmount"] = task_data->LongFrozenAmount;
-		data["ShortFrozenAmount"] = task_data->ShortFrozenAmount;
-		data["OpenVolume"] = task_data->OpenVolume;
-		data["CloseVolume"] = task_data->CloseVolume;
-		data["OpenAmount"] = task_data->OpenAmount;
-		data["CloseAmount"] = task_data->CloseAmount;
-		data["PositionCost"] = task_data->PositionCost;
-		data["PreMargin"] = task_data->PreMargin;
-		data["UseMargin"] = task_data->UseMargin;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["CashIn"] = task_data->CashIn;
-		data["Commission"] = task_data->Commission;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["PositionProfit"] = task_data->PositionProfit;
-		data["PreSettlementPrice"] = task_data->PreSettlementPrice;
-		data["SettlementPrice"] = task_data->SettlementPrice;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OpenCost"] = task_data->OpenCost;
-		data["ExchangeMargin"] = task_data->ExchangeMargin;
-		data["CombPosition"] = task_data->CombPosition;
-		data["CombLongFrozen"] = task_data->CombLongFrozen;
-		data["CombShortFrozen"] = task_data->CombShortFrozen;
-		data["CloseProfitByDate"] = task_data->CloseProfitByDate;
-		data["CloseProfitByTrade"] = task_data->CloseProfitByTrade;
-		data["TodayPosition"] = task_data->TodayPosition;
-		data["MarginRateByMoney"] = task_data->MarginRateByMoney;
-		data["MarginRateByVolume"] = task_data->MarginRateByVolume;
-		data["StrikeFrozen"] = task_data->StrikeFrozen;
-		data["StrikeFrozenAmount"] = task_data->StrikeFrozenAmount;
-		data["AbandonFrozen"] = task_data->AbandonFrozen;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["YdStrikeFrozen"] = task_data->YdStrikeFrozen;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_PosiDirection] = task_data->PosiDirection;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_PositionDate] = task_data->PositionDate;
+		data[KEY_YdPosition] = task_data->YdPosition;
+		data[KEY_Position] = task_data->Position;
+		data[KEY_LongFrozen] = task_data->LongFrozen;
+		data[KEY_ShortFrozen] = task_data->ShortFrozen;
+		data[KEY_LongFrozenAmount] = task_data->LongFrozenAmount;
+		data[KEY_ShortFrozenAmount] = task_data->ShortFrozenAmount;
+		data[KEY_OpenVolume] = task_data->OpenVolume;
+		data[KEY_CloseVolume] = task_data->CloseVolume;
+		data[KEY_OpenAmount] = task_data->OpenAmount;
+		data[KEY_CloseAmount] = task_data->CloseAmount;
+		data[KEY_PositionCost] = task_data->PositionCost;
+		data[KEY_PreMargin] = task_data->PreMargin;
+		data[KEY_UseMargin] = task_data->UseMargin;
+		data[KEY_FrozenMargin] = task_data->FrozenMargin;
+		data[KEY_FrozenCash] = task_data->FrozenCash;
+		data[KEY_FrozenCommission] = task_data->FrozenCommission;
+		data[KEY_CashIn] = task_data->CashIn;
+		data[KEY_Commission] = task_data->Commission;
+		data[KEY_CloseProfit] = task_data->CloseProfit;
+		data[KEY_PositionProfit] = task_data->PositionProfit;
+		data[KEY_PreSettlementPrice] = task_data->PreSettlementPrice;
+		data[KEY_SettlementPrice] = task_data->SettlementPrice;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_OpenCost] = task_data->OpenCost;
+		data[KEY_ExchangeMargin] = task_data->ExchangeMargin;
+		data[KEY_CombPosition] = task_data->CombPosition;
+		data[KEY_CombLongFrozen] = task_data->CombLongFrozen;
+		data[KEY_CombShortFrozen] = task_data->CombShortFrozen;
+		data[KEY_CloseProfitByDate] = task_data->CloseProfitByDate;
+		data[KEY_CloseProfitByTrade] = task_data->CloseProfitByTrade;
+		data[KEY_TodayPosition] = task_data->TodayPosition;
+		data[KEY_MarginRateByMoney] = task_data->MarginRateByMoney;
+		data[KEY_MarginRateByVolume] = task_data->MarginRateByVolume;
+		data[KEY_StrikeFrozen] = task_data->StrikeFrozen;
+		data[KEY_StrikeFrozenAmount] = task_data->StrikeFrozenAmount;
+		data[KEY_AbandonFrozen] = task_data->AbandonFrozen;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_YdStrikeFrozen] = task_data->YdStrikeFrozen;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInvestorPosition(data, error, task->task_id, task->task_last);
 };
@@ -3999,64 +4913,64 @@ void FuturesTdApi::processRspQryTradingAccount(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradingAccountField *task_data = (CThostFtdcTradingAccountField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["PreMortgage"] = task_data->PreMortgage;
-		data["PreCredit"] = task_data->PreCredit;
-		data["PreDeposit"] = task_data->PreDeposit;
-		data["PreBalance"] = task_data->PreBalance;
-		data["PreMargin"] = task_data->PreMargin;
-		data["InterestBase"] = task_data->InterestBase;
-		data["Interest"] = task_data->Interest;
-		data["Deposit"] = task_data->Deposit;
-		data["Withdraw"] = task_data->Withdraw;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["CurrMargin"] = task_data->CurrMargin;
-		data["CashIn"] = task_data->CashIn;
-		data["Commission"] = task_data->Commission;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["PositionProfit"] = task_data->PositionProfit;
-		data["Balance"] = task_data->Balance;
-		data["Available"] = task_data->Available;
-		data["WithdrawQuota"] = task_data->WithdrawQuota;
-		data["Reserve"] = task_data->Reserve;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["Credit"] = task_data->Credit;
-		data["Mortgage"] = task_data->Mortgage;
-		data["ExchangeMargin"] = task_data->ExchangeMargin;
-		data["DeliveryMargin"] = task_data->DeliveryMargin;
-		data["ExchangeDeliveryMargin"] = task_data->ExchangeDeliveryMargin;
-		data["ReserveBalance"] = task_data->ReserveBalance;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["PreFundMortgageIn"] = task_data->PreFundMortgageIn;
-		data["PreFundMortgageOut"] = task_data->PreFundMortgageOut;
-		data["FundMortgageIn"] = task_data->FundMortgageIn;
-		data["FundMortgageOut"] = task_data->FundMortgageOut;
-		data["FundMortgageAvailable"] = task_data->FundMortgageAvailable;
-		data["MortgageableFund"] = task_data->MortgageableFund;
-		data["SpecProductMargin"] = task_data->SpecProductMargin;
-		data["SpecProductFrozenMargin"] = task_data->SpecProductFrozenMargin;
-		data["SpecProductCommission"] = task_data->SpecProductCommission;
-		data["SpecProductFrozenCommission"] = task_data->SpecProductFrozenCommission;
-		data["SpecProductPositionProfit"] = task_data->SpecProductPositionProfit;
-		data["SpecProductCloseProfit"] = task_data->SpecProductCloseProfit;
-		data["SpecProductPositionProfitByAlg"] = task_data->SpecProductPositionProfitByAlg;
-		data["SpecProductExchangeMargin"] = task_data->SpecProductExchangeMargin;
-		data["BizType"] = task_data->BizType;
-		data["FrozenSwap"] = task_data->FrozenSwap;
-		data["RemainSwap"] = task_data->RemainSwap;
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_PreMortgage] = task_data->PreMortgage;
+		data[KEY_PreCredit] = task_data->PreCredit;
+		data[KEY_PreDeposit] = task_data->PreDeposit;
+		data[KEY_PreBalance] = task_data->PreBalance;
+		data[KEY_PreMargin] = task_data->PreMargin;
+		data[KEY_InterestBase] = task_data->InterestBase;
+		data[KEY_Interest] = task_data->Interest;
+		data[KEY_Deposit] = task_data->Deposit;
+		data[KEY_Withdraw] = task_data->Withdraw;
+		data[KEY_FrozenMargin] = task_data->FrozenMargin;
+		data[KEY_FrozenCash] = task_data->FrozenCash;
+		data[KEY_FrozenCommission] = task_data->FrozenCommission;
+		data[KEY_CurrMargin] = task_data->CurrMargin;
+		data[KEY_CashIn] = task_data->CashIn;
+		data[KEY_Commission] = task_data->Commission;
+		data[KEY_CloseProfit] = task_data->CloseProfit;
+		data[KEY_PositionProfit] = task_data->PositionProfit;
+		data[KEY_Balance] = task_data->Balance;
+		data[KEY_Available] = task_data->Available;
+		data[KEY_WithdrawQuota] = task_data->WithdrawQuota;
+		data[KEY_Reserve] = task_data->Reserve;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_Credit] = task_data->Credit;
+		data[KEY_Mortgage] = task_data->Mortgage;
+		data[KEY_ExchangeMargin] = task_data->ExchangeMargin;
+		data[KEY_DeliveryMargin] = task_data->DeliveryMargin;
+		data[KEY_ExchangeDeliveryMargin] = task_data->ExchangeDeliveryMargin;
+		data[KEY_ReserveBalance] = task_data->ReserveBalance;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_PreFundMortgageIn] = task_data->PreFundMortgageIn;
+		data[KEY_PreFundMortgageOut] = task_data->PreFundMortgageOut;
+		data[KEY_FundMortgageIn] = task_data->FundMortgageIn;
+		data[KEY_FundMortgageOut] = task_data->FundMortgageOut;
+		data[KEY_FundMortgageAvailable] = task_data->FundMortgageAvailable;
+		data[KEY_MortgageableFund] = task_data->MortgageableFund;
+		data[KEY_SpecProductMargin] = task_data->SpecProductMargin;
+		data[KEY_SpecProductFrozenMargin] = task_data->SpecProductFrozenMargin;
+		data[KEY_SpecProductCommission] = task_data->SpecProductCommission;
+		data[KEY_SpecProductFrozenCommission] = task_data->SpecProductFrozenCommission;
+		data[KEY_SpecProductPositionProfit] = task_data->SpecProductPositionProfit;
+		data[KEY_SpecProductCloseProfit] = task_data->SpecProductCloseProfit;
+		data[KEY_SpecProductPositionProfitByAlg] = task_data->SpecProductPositionProfitByAlg;
+		data[KEY_SpecProductExchangeMargin] = task_data->SpecProductExchangeMargin;
+		data[KEY_BizType] = task_data->BizType;
+		data[KEY_FrozenSwap] = task_data->FrozenSwap;
+		data[KEY_RemainSwap] = task_data->RemainSwap;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTradingAccount(data, error, task->task_id, task->task_last);
 };
@@ -4068,28 +4982,28 @@ void FuturesTdApi::processRspQryInvestor(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInvestorField *task_data = (CThostFtdcInvestorField*)task->task_data;
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorGroupID"] = toUtf(task_data->InvestorGroupID);
-		data["InvestorName"] = toUtf(task_data->InvestorName);
-		data["IdentifiedCardType"] = task_data->IdentifiedCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["IsActive"] = task_data->IsActive;
-		data["Telephone"] = toUtf(task_data->Telephone);
-		data["Address"] = toUtf(task_data->Address);
-		data["OpenDate"] = toUtf(task_data->OpenDate);
-		data["Mobile"] = toUtf(task_data->Mobile);
-		data["CommModelID"] = toUtf(task_data->CommModelID);
-		data["MarginModelID"] = toUtf(task_data->MarginModelID);
-		delete task_data;
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorGroupID] = toUtf(task_data->InvestorGroupID);
+		data[KEY_InvestorName] = toUtf(task_data->InvestorName);
+		data[KEY_IdentifiedCardType] = task_data->IdentifiedCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_IsActive] = task_data->IsActive;
+		data[KEY_Telephone] = toUtf(task_data->Telephone);
+		data[KEY_Address] = toUtf(task_data->Address);
+		data[KEY_OpenDate] = toUtf(task_data->OpenDate);
+		data[KEY_Mobile] = toUtf(task_data->Mobile);
+		data[KEY_CommModelID] = toUtf(task_data->CommModelID);
+		data[KEY_MarginModelID] = toUtf(task_data->MarginModelID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInvestor(data, error, task->task_id, task->task_last);
 };
@@ -4101,24 +5015,24 @@ void FuturesTdApi::processRspQryTradingCode(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradingCodeField *task_data = (CThostFtdcTradingCodeField*)task->task_data;
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IsActive"] = task_data->IsActive;
-		data["ClientIDType"] = task_data->ClientIDType;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["BizType"] = task_data->BizType;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IsActive] = task_data->IsActive;
+		data[KEY_ClientIDType] = task_data->ClientIDType;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_BizType] = task_data->BizType;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTradingCode(data, error, task->task_id, task->task_last);
 };
@@ -4130,27 +5044,27 @@ void FuturesTdApi::processRspQryInstrumentMarginRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInstrumentMarginRateField *task_data = (CThostFtdcInstrumentMarginRateField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["LongMarginRatioByMoney"] = task_data->LongMarginRatioByMoney;
-		data["LongMarginRatioByVolume"] = task_data->LongMarginRatioByVolume;
-		data["ShortMarginRatioByMoney"] = task_data->ShortMarginRatioByMoney;
-		data["ShortMarginRatioByVolume"] = task_data->ShortMarginRatioByVolume;
-		data["IsRelative"] = task_data->IsRelative;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_LongMarginRatioByMoney] = task_data->LongMarginRatioByMoney;
+		data[KEY_LongMarginRatioByVolume] = task_data->LongMarginRatioByVolume;
+		data[KEY_ShortMarginRatioByMoney] = task_data->ShortMarginRatioByMoney;
+		data[KEY_ShortMarginRatioByVolume] = task_data->ShortMarginRatioByVolume;
+		data[KEY_IsRelative] = task_data->IsRelative;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInstrumentMarginRate(data, error, task->task_id, task->task_last);
 };
@@ -4162,28 +5076,28 @@ void FuturesTdApi::processRspQryInstrumentCommissionRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInstrumentCommissionRateField *task_data = (CThostFtdcInstrumentCommissionRateField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OpenRatioByMoney"] = task_data->OpenRatioByMoney;
-		data["OpenRatioByVolume"] = task_data->OpenRatioByVolume;
-		data["CloseRatioByMoney"] = task_data->CloseRatioByMoney;
-		data["CloseRatioByVolume"] = task_data->CloseRatioByVolume;
-		data["CloseTodayRatioByMoney"] = task_data->CloseTodayRatioByMoney;
-		data["CloseTodayRatioByVolume"] = task_data->CloseTodayRatioByVolume;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["BizType"] = task_data->BizType;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OpenRatioByMoney] = task_data->OpenRatioByMoney;
+		data[KEY_OpenRatioByVolume] = task_data->OpenRatioByVolume;
+		data[KEY_CloseRatioByMoney] = task_data->CloseRatioByMoney;
+		data[KEY_CloseRatioByVolume] = task_data->CloseRatioByVolume;
+		data[KEY_CloseTodayRatioByMoney] = task_data->CloseTodayRatioByMoney;
+		data[KEY_CloseTodayRatioByVolume] = task_data->CloseTodayRatioByVolume;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_BizType] = task_data->BizType;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInstrumentCommissionRate(data, error, task->task_id, task->task_last);
 };
@@ -4195,18 +5109,18 @@ void FuturesTdApi::processRspQryExchange(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExchangeField *task_data = (CThostFtdcExchangeField*)task->task_data;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ExchangeName"] = toUtf(task_data->ExchangeName);
-		data["ExchangeProperty"] = task_data->ExchangeProperty;
-		delete task_data;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ExchangeName] = toUtf(task_data->ExchangeName);
+		data[KEY_ExchangeProperty] = task_data->ExchangeProperty;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryExchange(data, error, task->task_id, task->task_last);
 };
@@ -4218,32 +5132,32 @@ void FuturesTdApi::processRspQryProduct(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcProductField *task_data = (CThostFtdcProductField*)task->task_data;
-		data["ProductID"] = toUtf(task_data->ProductID);
-		data["ProductName"] = toUtf(task_data->ProductName);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ProductClass"] = task_data->ProductClass;
-		data["VolumeMultiple"] = task_data->VolumeMultiple;
-		data["PriceTick"] = task_data->PriceTick;
-		data["MaxMarketOrderVolume"] = task_data->MaxMarketOrderVolume;
-		data["MinMarketOrderVolume"] = task_data->MinMarketOrderVolume;
-		data["MaxLimitOrderVolume"] = task_data->MaxLimitOrderVolume;
-		data["MinLimitOrderVolume"] = task_data->MinLimitOrderVolume;
-		data["PositionType"] = task_data->PositionType;
-		data["PositionDateType"] = task_data->PositionDateType;
-		data["CloseDealType"] = task_data->CloseDealType;
-		data["TradeCurrencyID"] = toUtf(task_data->TradeCurrencyID);
-		data["MortgageFundUseRange"] = task_data->MortgageFundUseRange;
-		data["ExchangeProductID"] = toUtf(task_data->ExchangeProductID);
-		data["UnderlyingMultiple"] = task_data->UnderlyingMultiple;
-		delete task_data;
+		data[KEY_ProductID] = toUtf(task_data->ProductID);
+		data[KEY_ProductName] = toUtf(task_data->ProductName);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ProductClass] = task_data->ProductClass;
+		data[KEY_VolumeMultiple] = task_data->VolumeMultiple;
+		data[KEY_PriceTick] = task_data->PriceTick;
+		data[KEY_MaxMarketOrderVolume] = task_data->MaxMarketOrderVolume;
+		data[KEY_MinMarketOrderVolume] = task_data->MinMarketOrderVolume;
+		data[KEY_MaxLimitOrderVolume] = task_data->MaxLimitOrderVolume;
+		data[KEY_MinLimitOrderVolume] = task_data->MinLimitOrderVolume;
+		data[KEY_PositionType] = task_data->PositionType;
+		data[KEY_PositionDateType] = task_data->PositionDateType;
+		data[KEY_CloseDealType] = task_data->CloseDealType;
+		data[KEY_TradeCurrencyID] = toUtf(task_data->TradeCurrencyID);
+		data[KEY_MortgageFundUseRange] = task_data->MortgageFundUseRange;
+		data[KEY_ExchangeProductID] = toUtf(task_data->ExchangeProductID);
+		data[KEY_UnderlyingMultiple] = task_data->UnderlyingMultiple;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryProduct(data, error, task->task_id, task->task_last);
 };
@@ -4255,46 +5169,46 @@ void FuturesTdApi::processRspQryInstrument(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInstrumentField *task_data = (CThostFtdcInstrumentField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InstrumentName"] = toUtf(task_data->InstrumentName);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["ProductID"] = toUtf(task_data->ProductID);
-		data["ProductClass"] = task_data->ProductClass;
-		data["DeliveryYear"] = task_data->DeliveryYear;
-		data["DeliveryMonth"] = task_data->DeliveryMonth;
-		data["MaxMarketOrderVolume"] = task_data->MaxMarketOrderVolume;
-		data["MinMarketOrderVolume"] = task_data->MinMarketOrderVolume;
-		data["MaxLimitOrderVolume"] = task_data->MaxLimitOrderVolume;
-		data["MinLimitOrderVolume"] = task_data->MinLimitOrderVolume;
-		data["VolumeMultiple"] = task_data->VolumeMultiple;
-		data["PriceTick"] = task_data->PriceTick;
-		data["CreateDate"] = toUtf(task_data->CreateDate);
-		data["OpenDate"] = toUtf(task_data->OpenDate);
-		data["ExpireDate"] = toUtf(task_data->ExpireDate);
-		data["StartDelivDate"] = toUtf(task_data->StartDelivDate);
-		data["EndDelivDate"] = toUtf(task_data->EndDelivDate);
-		data["InstLifePhase"] = task_data->InstLifePhase;
-		data["IsTrading"] = task_data->IsTrading;
-		data["PositionType"] = task_data->PositionType;
-		data["PositionDateType"] = task_data->PositionDateType;
-		data["LongMarginRatio"] = task_data->LongMarginRatio;
-		data["ShortMarginRatio"] = task_data->ShortMarginRatio;
-		data["MaxMarginSideAlgorithm"] = task_data->MaxMarginSideAlgorithm;
-		data["UnderlyingInstrID"] = toUtf(task_data->UnderlyingInstrID);
-		data["StrikePrice"] = task_data->StrikePrice;
-		data["OptionsType"] = task_data->OptionsType;
-		data["UnderlyingMultiple"] = task_data->UnderlyingMultiple;
-		data["CombinationType"] = task_data->CombinationType;
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InstrumentName] = toUtf(task_data->InstrumentName);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_ProductID] = toUtf(task_data->ProductID);
+		data[KEY_ProductClass] = task_data->ProductClass;
+		data[KEY_DeliveryYear] = task_data->DeliveryYear;
+		data[KEY_DeliveryMonth] = task_data->DeliveryMonth;
+		data[KEY_MaxMarketOrderVolume] = task_data->MaxMarketOrderVolume;
+		data[KEY_MinMarketOrderVolume] = task_data->MinMarketOrderVolume;
+		data[KEY_MaxLimitOrderVolume] = task_data->MaxLimitOrderVolume;
+		data[KEY_MinLimitOrderVolume] = task_data->MinLimitOrderVolume;
+		data[KEY_VolumeMultiple] = task_data->VolumeMultiple;
+		data[KEY_PriceTick] = task_data->PriceTick;
+		data[KEY_CreateDate] = toUtf(task_data->CreateDate);
+		data[KEY_OpenDate] = toUtf(task_data->OpenDate);
+		data[KEY_ExpireDate] = toUtf(task_data->ExpireDate);
+		data[KEY_StartDelivDate] = toUtf(task_data->StartDelivDate);
+		data[KEY_EndDelivDate] = toUtf(task_data->EndDelivDate);
+		data[KEY_InstLifePhase] = task_data->InstLifePhase;
+		data[KEY_IsTrading] = task_data->IsTrading;
+		data[KEY_PositionType] = task_data->PositionType;
+		data[KEY_PositionDateType] = task_data->PositionDateType;
+		data[KEY_LongMarginRatio] = task_data->LongMarginRatio;
+		data[KEY_ShortMarginRatio] = task_data->ShortMarginRatio;
+		data[KEY_MaxMarginSideAlgorithm] = task_data->MaxMarginSideAlgorithm;
+		data[KEY_UnderlyingInstrID] = toUtf(task_data->UnderlyingInstrID);
+		data[KEY_StrikePrice] = task_data->StrikePrice;
+		data[KEY_OptionsType] = task_data->OptionsType;
+		data[KEY_UnderlyingMultiple] = task_data->UnderlyingMultiple;
+		data[KEY_CombinationType] = task_data->CombinationType;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInstrument(data, error, task->task_id, task->task_last);
 };
@@ -4306,59 +5220,59 @@ void FuturesTdApi::processRspQryDepthMarketData(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcDepthMarketDataField *task_data = (CThostFtdcDepthMarketDataField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["LastPrice"] = task_data->LastPrice;
-		data["PreSettlementPrice"] = task_data->PreSettlementPrice;
-		data["PreClosePrice"] = task_data->PreClosePrice;
-		data["PreOpenInterest"] = task_data->PreOpenInterest;
-		data["OpenPrice"] = task_data->OpenPrice;
-		data["HighestPrice"] = task_data->HighestPrice;
-		data["LowestPrice"] = task_data->LowestPrice;
-		data["Volume"] = task_data->Volume;
-		data["Turnover"] = task_data->Turnover;
-		data["OpenInterest"] = task_data->OpenInterest;
-		data["ClosePrice"] = task_data->ClosePrice;
-		data["SettlementPrice"] = task_data->SettlementPrice;
-		data["UpperLimitPrice"] = task_data->UpperLimitPrice;
-		data["LowerLimitPrice"] = task_data->LowerLimitPrice;
-		data["PreDelta"] = task_data->PreDelta;
-		data["CurrDelta"] = task_data->CurrDelta;
-		data["UpdateTime"] = toUtf(task_data->UpdateTime);
-		data["UpdateMillisec"] = task_data->UpdateMillisec;
-		data["BidPrice1"] = task_data->BidPrice1;
-		data["BidVolume1"] = task_data->BidVolume1;
-		data["AskPrice1"] = task_data->AskPrice1;
-		data["AskVolume1"] = task_data->AskVolume1;
-		data["BidPrice2"] = task_data->BidPrice2;
-		data["BidVolume2"] = task_data->BidVolume2;
-		data["AskPrice2"] = task_data->AskPrice2;
-		data["AskVolume2"] = task_data->AskVolume2;
-		data["BidPrice3"] = task_data->BidPrice3;
-		data["BidVolume3"] = task_data->BidVolume3;
-		data["AskPrice3"] = task_data->AskPrice3;
-		data["AskVolume3"] = task_data->AskVolume3;
-		data["BidPrice4"] = task_data->BidPrice4;
-		data["BidVolume4"] = task_data->BidVolume4;
-		data["AskPrice4"] = task_data->AskPrice4;
-		data["AskVolume4"] = task_data->AskVolume4;
-		data["BidPrice5"] = task_data->BidPrice5;
-		data["BidVolume5"] = task_data->BidVolume5;
-		data["AskPrice5"] = task_data->AskPrice5;
-		data["AskVolume5"] = task_data->AskVolume5;
-		data["AveragePrice"] = task_data->AveragePrice;
-		data["ActionDay"] = toUtf(task_data->ActionDay);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_LastPrice] = task_data->LastPrice;
+		data[KEY_PreSettlementPrice] = task_data->PreSettlementPrice;
+		data[KEY_PreClosePrice] = task_data->PreClosePrice;
+		data[KEY_PreOpenInterest] = task_data->PreOpenInterest;
+		data[KEY_OpenPrice] = task_data->OpenPrice;
+		data[KEY_HighestPrice] = task_data->HighestPrice;
+		data[KEY_LowestPrice] = task_data->LowestPrice;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_Turnover] = task_data->Turnover;
+		data[KEY_OpenInterest] = task_data->OpenInterest;
+		data[KEY_ClosePrice] = task_data->ClosePrice;
+		data[KEY_SettlementPrice] = task_data->SettlementPrice;
+		data[KEY_UpperLimitPrice] = task_data->UpperLimitPrice;
+		data[KEY_LowerLimitPrice] = task_data->LowerLimitPrice;
+		data[KEY_PreDelta] = task_data->PreDelta;
+		data[KEY_CurrDelta] = task_data->CurrDelta;
+		data[KEY_UpdateTime] = toUtf(task_data->UpdateTime);
+		data[KEY_UpdateMillisec] = task_data->UpdateMillisec;
+		data[KEY_BidPrice1] = task_data->BidPrice1;
+		data[KEY_BidVolume1] = task_data->BidVolume1;
+		data[KEY_AskPrice1] = task_data->AskPrice1;
+		data[KEY_AskVolume1] = task_data->AskVolume1;
+		data[KEY_BidPrice2] = task_data->BidPrice2;
+		data[KEY_BidVolume2] = task_data->BidVolume2;
+		data[KEY_AskPrice2] = task_data->AskPrice2;
+		data[KEY_AskVolume2] = task_data->AskVolume2;
+		data[KEY_BidPrice3] = task_data->BidPrice3;
+		data[KEY_BidVolume3] = task_data->BidVolume3;
+		data[KEY_AskPrice3] = task_data->AskPrice3;
+		data[KEY_AskVolume3] = task_data->AskVolume3;
+		data[KEY_BidPrice4] = task_data->BidPrice4;
+		data[KEY_BidVolume4] = task_data->BidVolume4;
+		data[KEY_AskPrice4] = task_data->AskPrice4;
+		data[KEY_AskVolume4] = task_data->AskVolume4;
+		data[KEY_BidPrice5] = task_data->BidPrice5;
+		data[KEY_BidVolume5] = task_data->BidVolume5;
+		data[KEY_AskPrice5] = task_data->AskPrice5;
+		data[KEY_AskVolume5] = task_data->AskVolume5;
+		data[KEY_AveragePrice] = task_data->AveragePrice;
+		data[KEY_ActionDay] = toUtf(task_data->ActionDay);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryDepthMarketData(data, error, task->task_id, task->task_last);
 };
@@ -4370,23 +5284,23 @@ void FuturesTdApi::processRspQrySettlementInfo(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcSettlementInfoField *task_data = (CThostFtdcSettlementInfoField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["Content"] = toUtf(task_data->Content);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_Content] = toUtf(task_data->Content);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQrySettlementInfo(data, error, task->task_id, task->task_last);
 };
@@ -4398,19 +5312,19 @@ void FuturesTdApi::processRspQryTransferBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTransferBankField *task_data = (CThostFtdcTransferBankField*)task->task_data;
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBrchID"] = toUtf(task_data->BankBrchID);
-		data["BankName"] = toUtf(task_data->BankName);
-		data["IsActive"] = task_data->IsActive;
-		delete task_data;
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBrchID] = toUtf(task_data->BankBrchID);
+		data[KEY_BankName] = toUtf(task_data->BankName);
+		data[KEY_IsActive] = task_data->IsActive;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTransferBank(data, error, task->task_id, task->task_last);
 };
@@ -4422,42 +5336,42 @@ void FuturesTdApi::processRspQryInvestorPositionDetail(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInvestorPositionDetailField *task_data = (CThostFtdcInvestorPositionDetailField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["Direction"] = task_data->Direction;
-		data["OpenDate"] = toUtf(task_data->OpenDate);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["Volume"] = task_data->Volume;
-		data["OpenPrice"] = task_data->OpenPrice;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["TradeType"] = task_data->TradeType;
-		data["CombInstrumentID"] = toUtf(task_data->CombInstrumentID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["CloseProfitByDate"] = task_data->CloseProfitByDate;
-		data["CloseProfitByTrade"] = task_data->CloseProfitByTrade;
-		data["PositionProfitByDate"] = task_data->PositionProfitByDate;
-		data["PositionProfitByTrade"] = task_data->PositionProfitByTrade;
-		data["Margin"] = task_data->Margin;
-		data["ExchMargin"] = task_data->ExchMargin;
-		data["MarginRateByMoney"] = task_data->MarginRateByMoney;
-		data["MarginRateByVolume"] = task_data->MarginRateByVolume;
-		data["LastSettlementPrice"] = task_data->LastSettlementPrice;
-		data["SettlementPrice"] = task_data->SettlementPrice;
-		data["CloseVolume"] = task_data->CloseVolume;
-		data["CloseAmount"] = task_data->CloseAmount;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_OpenDate] = toUtf(task_data->OpenDate);
+		data[KEY_TradeID] = toUtf(task_data->TradeID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_OpenPrice] = task_data->OpenPrice;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_TradeType] = task_data->TradeType;
+		data[KEY_CombInstrumentID] = toUtf(task_data->CombInstrumentID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_CloseProfitByDate] = task_data->CloseProfitByDate;
+		data[KEY_CloseProfitByTrade] = task_data->CloseProfitByTrade;
+		data[KEY_PositionProfitByDate] = task_data->PositionProfitByDate;
+		data[KEY_PositionProfitByTrade] = task_data->PositionProfitByTrade;
+		data[KEY_Margin] = task_data->Margin;
+		data[KEY_ExchMargin] = task_data->ExchMargin;
+		data[KEY_MarginRateByMoney] = task_data->MarginRateByMoney;
+		data[KEY_MarginRateByVolume] = task_data->MarginRateByVolume;
+		data[KEY_LastSettlementPrice] = task_data->LastSettlementPrice;
+		data[KEY_SettlementPrice] = task_data->SettlementPrice;
+		data[KEY_CloseVolume] = task_data->CloseVolume;
+		data[KEY_CloseAmount] = task_data->CloseAmount;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInvestorPositionDetail(data, error, task->task_id, task->task_last);
 };
@@ -4469,18 +5383,18 @@ void FuturesTdApi::processRspQryNotice(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcNoticeField *task_data = (CThostFtdcNoticeField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["Content"] = toUtf(task_data->Content);
-		data["SequenceLabel"] = toUtf(task_data->SequenceLabel);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_Content] = toUtf(task_data->Content);
+		data[KEY_SequenceLabel] = toUtf(task_data->SequenceLabel);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryNotice(data, error, task->task_id, task->task_last);
 };
@@ -4492,22 +5406,22 @@ void FuturesTdApi::processRspQrySettlementInfoConfirm(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcSettlementInfoConfirmField *task_data = (CThostFtdcSettlementInfoConfirmField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ConfirmDate"] = toUtf(task_data->ConfirmDate);
-		data["ConfirmTime"] = toUtf(task_data->ConfirmTime);
-		data["SettlementID"] = task_data->SettlementID;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ConfirmDate] = toUtf(task_data->ConfirmDate);
+		data[KEY_ConfirmTime] = toUtf(task_data->ConfirmTime);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQrySettlementInfoConfirm(data, error, task->task_id, task->task_last);
 };
@@ -4519,36 +5433,36 @@ void FuturesTdApi::processRspQryInvestorPositionCombineDetail(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInvestorPositionCombineDetailField *task_data = (CThostFtdcInvestorPositionCombineDetailField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["OpenDate"] = toUtf(task_data->OpenDate);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["SettlementID"] = task_data->SettlementID;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ComTradeID"] = toUtf(task_data->ComTradeID);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["Direction"] = task_data->Direction;
-		data["TotalAmt"] = task_data->TotalAmt;
-		data["Margin"] = task_data->Margin;
-		data["ExchMargin"] = task_data->ExchMargin;
-		data["MarginRateByMoney"] = task_data->MarginRateByMoney;
-		data["MarginRateByVolume"] = task_data->MarginRateByVolume;
-		data["LegID"] = task_data->LegID;
-		data["LegMultiple"] = task_data->LegMultiple;
-		data["CombInstrumentID"] = toUtf(task_data->CombInstrumentID);
-		data["TradeGroupID"] = task_data->TradeGroupID;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_OpenDate] = toUtf(task_data->OpenDate);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ComTradeID] = toUtf(task_data->ComTradeID);
+		data[KEY_TradeID] = toUtf(task_data->TradeID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_TotalAmt] = task_data->TotalAmt;
+		data[KEY_Margin] = task_data->Margin;
+		data[KEY_ExchMargin] = task_data->ExchMargin;
+		data[KEY_MarginRateByMoney] = task_data->MarginRateByMoney;
+		data[KEY_MarginRateByVolume] = task_data->MarginRateByVolume;
+		data[KEY_LegID] = task_data->LegID;
+		data[KEY_LegMultiple] = task_data->LegMultiple;
+		data[KEY_CombInstrumentID] = toUtf(task_data->CombInstrumentID);
+		data[KEY_TradeGroupID] = task_data->TradeGroupID;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInvestorPositionCombineDetail(data, error, task->task_id, task->task_last);
 };
@@ -4560,20 +5474,20 @@ void FuturesTdApi::processRspQryCFMMCTradingAccountKey(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcCFMMCTradingAccountKeyField *task_data = (CThostFtdcCFMMCTradingAccountKeyField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["KeyID"] = task_data->KeyID;
-		data["CurrentKey"] = toUtf(task_data->CurrentKey);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_KeyID] = task_data->KeyID;
+		data[KEY_CurrentKey] = toUtf(task_data->CurrentKey);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryCFMMCTradingAccountKey(data, error, task->task_id, task->task_last);
 };
@@ -4585,24 +5499,24 @@ void FuturesTdApi::processRspQryEWarrantOffset(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcEWarrantOffsetField *task_data = (CThostFtdcEWarrantOffsetField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["Direction"] = task_data->Direction;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["Volume"] = task_data->Volume;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryEWarrantOffset(data, error, task->task_id, task->task_last);
 };
@@ -4614,44 +5528,44 @@ void FuturesTdApi::processRspQryInvestorProductGroupMargin(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInvestorProductGroupMarginField *task_data = (CThostFtdcInvestorProductGroupMarginField*)task->task_data;
-		data["ProductGroupID"] = toUtf(task_data->ProductGroupID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["LongFrozenMargin"] = task_data->LongFrozenMargin;
-		data["ShortFrozenMargin"] = task_data->ShortFrozenMargin;
-		data["UseMargin"] = task_data->UseMargin;
-		data["LongUseMargin"] = task_data->LongUseMargin;
-		data["ShortUseMargin"] = task_data->ShortUseMargin;
-		data["ExchMargin"] = task_data->ExchMargin;
-		data["LongExchMargin"] = task_data->LongExchMargin;
-		data["ShortExchMargin"] = task_data->ShortExchMargin;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["Commission"] = task_data->Commission;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["CashIn"] = task_data->CashIn;
-		data["PositionProfit"] = task_data->PositionProfit;
-		data["OffsetAmount"] = task_data->OffsetAmount;
-		data["LongOffsetAmount"] = task_data->LongOffsetAmount;
-		data["ShortOffsetAmount"] = task_data->ShortOffsetAmount;
-		data["ExchOffsetAmount"] = task_data->ExchOffsetAmount;
-		data["LongExchOffsetAmount"] = task_data->LongExchOffsetAmount;
-		data["ShortExchOffsetAmount"] = task_data->ShortExchOffsetAmount;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_ProductGroupID] = toUtf(task_data->ProductGroupID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_FrozenMargin] = task_data->FrozenMargin;
+		data[KEY_LongFrozenMargin] = task_data->LongFrozenMargin;
+		data[KEY_ShortFrozenMargin] = task_data->ShortFrozenMargin;
+		data[KEY_UseMargin] = task_data->UseMargin;
+		data[KEY_LongUseMargin] = task_data->LongUseMargin;
+		data[KEY_ShortUseMargin] = task_data->ShortUseMargin;
+		data[KEY_ExchMargin] = task_data->ExchMargin;
+		data[KEY_LongExchMargin] = task_data->LongExchMargin;
+		data[KEY_ShortExchMargin] = task_data->ShortExchMargin;
+		data[KEY_CloseProfit] = task_data->CloseProfit;
+		data[KEY_FrozenCommission] = task_data->FrozenCommission;
+		data[KEY_Commission] = task_data->Commission;
+		data[KEY_FrozenCash] = task_data->FrozenCash;
+		data[KEY_CashIn] = task_data->CashIn;
+		data[KEY_PositionProfit] = task_data->PositionProfit;
+		data[KEY_OffsetAmount] = task_data->OffsetAmount;
+		data[KEY_LongOffsetAmount] = task_data->LongOffsetAmount;
+		data[KEY_ShortOffsetAmount] = task_data->ShortOffsetAmount;
+		data[KEY_ExchOffsetAmount] = task_data->ExchOffsetAmount;
+		data[KEY_LongExchOffsetAmount] = task_data->LongExchOffsetAmount;
+		data[KEY_ShortExchOffsetAmount] = task_data->ShortExchOffsetAmount;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInvestorProductGroupMargin(data, error, task->task_id, task->task_last);
 };
@@ -4663,23 +5577,23 @@ void FuturesTdApi::processRspQryExchangeMarginRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExchangeMarginRateField *task_data = (CThostFtdcExchangeMarginRateField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["LongMarginRatioByMoney"] = task_data->LongMarginRatioByMoney;
-		data["LongMarginRatioByVolume"] = task_data->LongMarginRatioByVolume;
-		data["ShortMarginRatioByMoney"] = task_data->ShortMarginRatioByMoney;
-		data["ShortMarginRatioByVolume"] = task_data->ShortMarginRatioByVolume;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_LongMarginRatioByMoney] = task_data->LongMarginRatioByMoney;
+		data[KEY_LongMarginRatioByVolume] = task_data->LongMarginRatioByVolume;
+		data[KEY_ShortMarginRatioByMoney] = task_data->ShortMarginRatioByMoney;
+		data[KEY_ShortMarginRatioByVolume] = task_data->ShortMarginRatioByVolume;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryExchangeMarginRate(data, error, task->task_id, task->task_last);
 };
@@ -4691,30 +5605,30 @@ void FuturesTdApi::processRspQryExchangeMarginRateAdjust(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExchangeMarginRateAdjustField *task_data = (CThostFtdcExchangeMarginRateAdjustField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["LongMarginRatioByMoney"] = task_data->LongMarginRatioByMoney;
-		data["LongMarginRatioByVolume"] = task_data->LongMarginRatioByVolume;
-		data["ShortMarginRatioByMoney"] = task_data->ShortMarginRatioByMoney;
-		data["ShortMarginRatioByVolume"] = task_data->ShortMarginRatioByVolume;
-		data["ExchLongMarginRatioByMoney"] = task_data->ExchLongMarginRatioByMoney;
-		data["ExchLongMarginRatioByVolume"] = task_data->ExchLongMarginRatioByVolume;
-		data["ExchShortMarginRatioByMoney"] = task_data->ExchShortMarginRatioByMoney;
-		data["ExchShortMarginRatioByVolume"] = task_data->ExchShortMarginRatioByVolume;
-		data["NoLongMarginRatioByMoney"] = task_data->NoLongMarginRatioByMoney;
-		data["NoLongMarginRatioByVolume"] = task_data->NoLongMarginRatioByVolume;
-		data["NoShortMarginRatioByMoney"] = task_data->NoShortMarginRatioByMoney;
-		data["NoShortMarginRatioByVolume"] = task_data->NoShortMarginRatioByVolume;
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_LongMarginRatioByMoney] = task_data->LongMarginRatioByMoney;
+		data[KEY_LongMarginRatioByVolume] = task_data->LongMarginRatioByVolume;
+		data[KEY_ShortMarginRatioByMoney] = task_data->ShortMarginRatioByMoney;
+		data[KEY_ShortMarginRatioByVolume] = task_data->ShortMarginRatioByVolume;
+		data[KEY_ExchLongMarginRatioByMoney] = task_data->ExchLongMarginRatioByMoney;
+		data[KEY_ExchLongMarginRatioByVolume] = task_data->ExchLongMarginRatioByVolume;
+		data[KEY_ExchShortMarginRatioByMoney] = task_data->ExchShortMarginRatioByMoney;
+		data[KEY_ExchShortMarginRatioByVolume] = task_data->ExchShortMarginRatioByVolume;
+		data[KEY_NoLongMarginRatioByMoney] = task_data->NoLongMarginRatioByMoney;
+		data[KEY_NoLongMarginRatioByVolume] = task_data->NoLongMarginRatioByVolume;
+		data[KEY_NoShortMarginRatioByMoney] = task_data->NoShortMarginRatioByMoney;
+		data[KEY_NoShortMarginRatioByVolume] = task_data->NoShortMarginRatioByVolume;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryExchangeMarginRateAdjust(data, error, task->task_id, task->task_last);
 };
@@ -4726,20 +5640,20 @@ void FuturesTdApi::processRspQryExchangeRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExchangeRateField *task_data = (CThostFtdcExchangeRateField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["FromCurrencyID"] = toUtf(task_data->FromCurrencyID);
-		data["FromCurrencyUnit"] = task_data->FromCurrencyUnit;
-		data["ToCurrencyID"] = toUtf(task_data->ToCurrencyID);
-		data["ExchangeRate"] = task_data->ExchangeRate;
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_FromCurrencyID] = toUtf(task_data->FromCurrencyID);
+		data[KEY_FromCurrencyUnit] = task_data->FromCurrencyUnit;
+		data[KEY_ToCurrencyID] = toUtf(task_data->ToCurrencyID);
+		data[KEY_ExchangeRate] = task_data->ExchangeRate;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryExchangeRate(data, error, task->task_id, task->task_last);
 };
@@ -4751,20 +5665,20 @@ void FuturesTdApi::processRspQrySecAgentACIDMap(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcSecAgentACIDMapField *task_data = (CThostFtdcSecAgentACIDMapField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["BrokerSecAgentID"] = toUtf(task_data->BrokerSecAgentID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_BrokerSecAgentID] = toUtf(task_data->BrokerSecAgentID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQrySecAgentACIDMap(data, error, task->task_id, task->task_last);
 };
@@ -4776,19 +5690,19 @@ void FuturesTdApi::processRspQryProductExchRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcProductExchRateField *task_data = (CThostFtdcProductExchRateField*)task->task_data;
-		data["ProductID"] = toUtf(task_data->ProductID);
-		data["QuoteCurrencyID"] = toUtf(task_data->QuoteCurrencyID);
-		data["ExchangeRate"] = task_data->ExchangeRate;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		delete task_data;
+		data[KEY_ProductID] = toUtf(task_data->ProductID);
+		data[KEY_QuoteCurrencyID] = toUtf(task_data->QuoteCurrencyID);
+		data[KEY_ExchangeRate] = task_data->ExchangeRate;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryProductExchRate(data, error, task->task_id, task->task_last);
 };
@@ -4800,18 +5714,18 @@ void FuturesTdApi::processRspQryProductGroup(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcProductGroupField *task_data = (CThostFtdcProductGroupField*)task->task_data;
-		data["ProductID"] = toUtf(task_data->ProductID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ProductGroupID"] = toUtf(task_data->ProductGroupID);
-		delete task_data;
+		data[KEY_ProductID] = toUtf(task_data->ProductID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ProductGroupID] = toUtf(task_data->ProductGroupID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryProductGroup(data, error, task->task_id, task->task_last);
 };
@@ -4823,25 +5737,25 @@ void FuturesTdApi::processRspQryMMInstrumentCommissionRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcMMInstrumentCommissionRateField *task_data = (CThostFtdcMMInstrumentCommissionRateField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OpenRatioByMoney"] = task_data->OpenRatioByMoney;
-		data["OpenRatioByVolume"] = task_data->OpenRatioByVolume;
-		data["CloseRatioByMoney"] = task_data->CloseRatioByMoney;
-		data["CloseRatioByVolume"] = task_data->CloseRatioByVolume;
-		data["CloseTodayRatioByMoney"] = task_data->CloseTodayRatioByMoney;
-		data["CloseTodayRatioByVolume"] = task_data->CloseTodayRatioByVolume;
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OpenRatioByMoney] = task_data->OpenRatioByMoney;
+		data[KEY_OpenRatioByVolume] = task_data->OpenRatioByVolume;
+		data[KEY_CloseRatioByMoney] = task_data->CloseRatioByMoney;
+		data[KEY_CloseRatioByVolume] = task_data->CloseRatioByVolume;
+		data[KEY_CloseTodayRatioByMoney] = task_data->CloseTodayRatioByMoney;
+		data[KEY_CloseTodayRatioByVolume] = task_data->CloseTodayRatioByVolume;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryMMInstrumentCommissionRate(data, error, task->task_id, task->task_last);
 };
@@ -4853,27 +5767,27 @@ void FuturesTdApi::processRspQryMMOptionInstrCommRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcMMOptionInstrCommRateField *task_data = (CThostFtdcMMOptionInstrCommRateField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OpenRatioByMoney"] = task_data->OpenRatioByMoney;
-		data["OpenRatioByVolume"] = task_data->OpenRatioByVolume;
-		data["CloseRatioByMoney"] = task_data->CloseRatioByMoney;
-		data["CloseRatioByVolume"] = task_data->CloseRatioByVolume;
-		data["CloseTodayRatioByMoney"] = task_data->CloseTodayRatioByMoney;
-		data["CloseTodayRatioByVolume"] = task_data->CloseTodayRatioByVolume;
-		data["StrikeRatioByMoney"] = task_data->StrikeRatioByMoney;
-		data["StrikeRatioByVolume"] = task_data->StrikeRatioByVolume;
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OpenRatioByMoney] = task_data->OpenRatioByMoney;
+		data[KEY_OpenRatioByVolume] = task_data->OpenRatioByVolume;
+		data[KEY_CloseRatioByMoney] = task_data->CloseRatioByMoney;
+		data[KEY_CloseRatioByVolume] = task_data->CloseRatioByVolume;
+		data[KEY_CloseTodayRatioByMoney] = task_data->CloseTodayRatioByMoney;
+		data[KEY_CloseTodayRatioByVolume] = task_data->CloseTodayRatioByVolume;
+		data[KEY_StrikeRatioByMoney] = task_data->StrikeRatioByMoney;
+		data[KEY_StrikeRatioByVolume] = task_data->StrikeRatioByVolume;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryMMOptionInstrCommRate(data, error, task->task_id, task->task_last);
 };
@@ -4885,24 +5799,24 @@ void FuturesTdApi::processRspQryInstrumentOrderCommRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInstrumentOrderCommRateField *task_data = (CThostFtdcInstrumentOrderCommRateField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["OrderCommByVolume"] = task_data->OrderCommByVolume;
-		data["OrderActionCommByVolume"] = task_data->OrderActionCommByVolume;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_OrderCommByVolume] = task_data->OrderCommByVolume;
+		data[KEY_OrderActionCommByVolume] = task_data->OrderActionCommByVolume;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInstrumentOrderCommRate(data, error, task->task_id, task->task_last);
 };
@@ -4914,64 +5828,64 @@ void FuturesTdApi::processRspQrySecAgentTradingAccount(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradingAccountField *task_data = (CThostFtdcTradingAccountField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["PreMortgage"] = task_data->PreMortgage;
-		data["PreCredit"] = task_data->PreCredit;
-		data["PreDeposit"] = task_data->PreDeposit;
-		data["PreBalance"] = task_data->PreBalance;
-		data["PreMargin"] = task_data->PreMargin;
-		data["InterestBase"] = task_data->InterestBase;
-		data["Interest"] = task_data->Interest;
-		data["Deposit"] = task_data->Deposit;
-		data["Withdraw"] = task_data->Withdraw;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["FrozenCash"] = task_data->FrozenCash;
-		data["FrozenCommission"] = task_data->FrozenCommission;
-		data["CurrMargin"] = task_data->CurrMargin;
-		data["CashIn"] = task_data->CashIn;
-		data["Commission"] = task_data->Commission;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["PositionProfit"] = task_data->PositionProfit;
-		data["Balance"] = task_data->Balance;
-		data["Available"] = task_data->Available;
-		data["WithdrawQuota"] = task_data->WithdrawQuota;
-		data["Reserve"] = task_data->Reserve;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["Credit"] = task_data->Credit;
-		data["Mortgage"] = task_data->Mortgage;
-		data["ExchangeMargin"] = task_data->ExchangeMargin;
-		data["DeliveryMargin"] = task_data->DeliveryMargin;
-		data["ExchangeDeliveryMargin"] = task_data->ExchangeDeliveryMargin;
-		data["ReserveBalance"] = task_data->ReserveBalance;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["PreFundMortgageIn"] = task_data->PreFundMortgageIn;
-		data["PreFundMortgageOut"] = task_data->PreFundMortgageOut;
-		data["FundMortgageIn"] = task_data->FundMortgageIn;
-		data["FundMortgageOut"] = task_data->FundMortgageOut;
-		data["FundMortgageAvailable"] = task_data->FundMortgageAvailable;
-		data["MortgageableFund"] = task_data->MortgageableFund;
-		data["SpecProductMargin"] = task_data->SpecProductMargin;
-		data["SpecProductFrozenMargin"] = task_data->SpecProductFrozenMargin;
-		data["SpecProductCommission"] = task_data->SpecProductCommission;
-		data["SpecProductFrozenCommission"] = task_data->SpecProductFrozenCommission;
-		data["SpecProductPositionProfit"] = task_data->SpecProductPositionProfit;
-		data["SpecProductCloseProfit"] = task_data->SpecProductCloseProfit;
-		data["SpecProductPositionProfitByAlg"] = task_data->SpecProductPositionProfitByAlg;
-		data["SpecProductExchangeMargin"] = task_data->SpecProductExchangeMargin;
-		data["BizType"] = task_data->BizType;
-		data["FrozenSwap"] = task_data->FrozenSwap;
-		data["RemainSwap"] = task_data->RemainSwap;
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_PreMortgage] = task_data->PreMortgage;
+		data[KEY_PreCredit] = task_data->PreCredit;
+		data[KEY_PreDeposit] = task_data->PreDeposit;
+		data[KEY_PreBalance] = task_data->PreBalance;
+		data[KEY_PreMargin] = task_data->PreMargin;
+		data[KEY_InterestBase] = task_data->InterestBase;
+		data[KEY_Interest] = task_data->Interest;
+		data[KEY_Deposit] = task_data->Deposit;
+		data[KEY_Withdraw] = task_data->Withdraw;
+		data[KEY_FrozenMargin] = task_data->FrozenMargin;
+		data[KEY_FrozenCash] = task_data->FrozenCash;
+		data[KEY_FrozenCommission] = task_data->FrozenCommission;
+		data[KEY_CurrMargin] = task_data->CurrMargin;
+		data[KEY_CashIn] = task_data->CashIn;
+		data[KEY_Commission] = task_data->Commission;
+		data[KEY_CloseProfit] = task_data->CloseProfit;
+		data[KEY_PositionProfit] = task_data->PositionProfit;
+		data[KEY_Balance] = task_data->Balance;
+		data[KEY_Available] = task_data->Available;
+		data[KEY_WithdrawQuota] = task_data->WithdrawQuota;
+		data[KEY_Reserve] = task_data->Reserve;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_Credit] = task_data->Credit;
+		data[KEY_Mortgage] = task_data->Mortgage;
+		data[KEY_ExchangeMargin] = task_data->ExchangeMargin;
+		data[KEY_DeliveryMargin] = task_data->DeliveryMargin;
+		data[KEY_ExchangeDeliveryMargin] = task_data->ExchangeDeliveryMargin;
+		data[KEY_ReserveBalance] = task_data->ReserveBalance;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_PreFundMortgageIn] = task_data->PreFundMortgageIn;
+		data[KEY_PreFundMortgageOut] = task_data->PreFundMortgageOut;
+		data[KEY_FundMortgageIn] = task_data->FundMortgageIn;
+		data[KEY_FundMortgageOut] = task_data->FundMortgageOut;
+		data[KEY_FundMortgageAvailable] = task_data->FundMortgageAvailable;
+		data[KEY_MortgageableFund] = task_data->MortgageableFund;
+		data[KEY_SpecProductMargin] = task_data->SpecProductMargin;
+		data[KEY_SpecProductFrozenMargin] = task_data->SpecProductFrozenMargin;
+		data[KEY_SpecProductCommission] = task_data->SpecProductCommission;
+		data[KEY_SpecProductFrozenCommission] = task_data->SpecProductFrozenCommission;
+		data[KEY_SpecProductPositionProfit] = task_data->SpecProductPositionProfit;
+		data[KEY_SpecProductCloseProfit] = task_data->SpecProductCloseProfit;
+		data[KEY_SpecProductPositionProfitByAlg] = task_data->SpecProductPositionProfitByAlg;
+		data[KEY_SpecProductExchangeMargin] = task_data->SpecProductExchangeMargin;
+		data[KEY_BizType] = task_data->BizType;
+		data[KEY_FrozenSwap] = task_data->FrozenSwap;
+		data[KEY_RemainSwap] = task_data->RemainSwap;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQrySecAgentTradingAccount(data, error, task->task_id, task->task_last);
 };
@@ -4983,20 +5897,20 @@ void FuturesTdApi::processRspQrySecAgentCheckMode(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcSecAgentCheckModeField *task_data = (CThostFtdcSecAgentCheckModeField*)task->task_data;
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["BrokerSecAgentID"] = toUtf(task_data->BrokerSecAgentID);
-		data["CheckSelfAccount"] = task_data->CheckSelfAccount;
-		delete task_data;
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_BrokerSecAgentID] = toUtf(task_data->BrokerSecAgentID);
+		data[KEY_CheckSelfAccount] = task_data->CheckSelfAccount;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQrySecAgentCheckMode(data, error, task->task_id, task->task_last);
 };
@@ -5008,26 +5922,26 @@ void FuturesTdApi::processRspQryOptionInstrTradeCost(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOptionInstrTradeCostField *task_data = (CThostFtdcOptionInstrTradeCostField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["FixedMargin"] = task_data->FixedMargin;
-		data["MiniMargin"] = task_data->MiniMargin;
-		data["Royalty"] = task_data->Royalty;
-		data["ExchFixedMargin"] = task_data->ExchFixedMargin;
-		data["ExchMiniMargin"] = task_data->ExchMiniMargin;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_FixedMargin] = task_data->FixedMargin;
+		data[KEY_MiniMargin] = task_data->MiniMargin;
+		data[KEY_Royalty] = task_data->Royalty;
+		data[KEY_ExchFixedMargin] = task_data->ExchFixedMargin;
+		data[KEY_ExchMiniMargin] = task_data->ExchMiniMargin;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOptionInstrTradeCost(data, error, task->task_id, task->task_last);
 };
@@ -5039,29 +5953,29 @@ void FuturesTdApi::processRspQryOptionInstrCommRate(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOptionInstrCommRateField *task_data = (CThostFtdcOptionInstrCommRateField*)task->task_data;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OpenRatioByMoney"] = task_data->OpenRatioByMoney;
-		data["OpenRatioByVolume"] = task_data->OpenRatioByVolume;
-		data["CloseRatioByMoney"] = task_data->CloseRatioByMoney;
-		data["CloseRatioByVolume"] = task_data->CloseRatioByVolume;
-		data["CloseTodayRatioByMoney"] = task_data->CloseTodayRatioByMoney;
-		data["CloseTodayRatioByVolume"] = task_data->CloseTodayRatioByVolume;
-		data["StrikeRatioByMoney"] = task_data->StrikeRatioByMoney;
-		data["StrikeRatioByVolume"] = task_data->StrikeRatioByVolume;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OpenRatioByMoney] = task_data->OpenRatioByMoney;
+		data[KEY_OpenRatioByVolume] = task_data->OpenRatioByVolume;
+		data[KEY_CloseRatioByMoney] = task_data->CloseRatioByMoney;
+		data[KEY_CloseRatioByVolume] = task_data->CloseRatioByVolume;
+		data[KEY_CloseTodayRatioByMoney] = task_data->CloseTodayRatioByMoney;
+		data[KEY_CloseTodayRatioByVolume] = task_data->CloseTodayRatioByVolume;
+		data[KEY_StrikeRatioByMoney] = task_data->StrikeRatioByMoney;
+		data[KEY_StrikeRatioByVolume] = task_data->StrikeRatioByVolume;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOptionInstrCommRate(data, error, task->task_id, task->task_last);
 };
@@ -5073,59 +5987,59 @@ void FuturesTdApi::processRspQryExecOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExecOrderField *task_data = (CThostFtdcExecOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExecOrderRef"] = toUtf(task_data->ExecOrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ActionType"] = task_data->ActionType;
-		data["PosiDirection"] = task_data->PosiDirection;
-		data["ReservePositionFlag"] = task_data->ReservePositionFlag;
-		data["CloseFlag"] = task_data->CloseFlag;
-		data["ExecOrderLocalID"] = toUtf(task_data->ExecOrderLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["ExecOrderSysID"] = toUtf(task_data->ExecOrderSysID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ExecResult"] = task_data->ExecResult;
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerExecOrderSeq"] = task_data->BrokerExecOrderSeq;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ExecOrderRef] = toUtf(task_data->ExecOrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ActionType] = task_data->ActionType;
+		data[KEY_PosiDirection] = task_data->PosiDirection;
+		data[KEY_ReservePositionFlag] = task_data->ReservePositionFlag;
+		data[KEY_CloseFlag] = task_data->CloseFlag;
+		data[KEY_ExecOrderLocalID] = toUtf(task_data->ExecOrderLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_ExecOrderSysID] = toUtf(task_data->ExecOrderSysID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ExecResult] = task_data->ExecResult;
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerExecOrderSeq] = task_data->BrokerExecOrderSeq;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryExecOrder(data, error, task->task_id, task->task_last);
 };
@@ -5137,38 +6051,38 @@ void FuturesTdApi::processRspQryForQuote(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcForQuoteField *task_data = (CThostFtdcForQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ForQuoteRef"] = toUtf(task_data->ForQuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ForQuoteLocalID"] = toUtf(task_data->ForQuoteLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ForQuoteStatus"] = task_data->ForQuoteStatus;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerForQutoSeq"] = task_data->BrokerForQutoSeq;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ForQuoteRef] = toUtf(task_data->ForQuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ForQuoteLocalID] = toUtf(task_data->ForQuoteLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ForQuoteStatus] = task_data->ForQuoteStatus;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerForQutoSeq] = task_data->BrokerForQutoSeq;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryForQuote(data, error, task->task_id, task->task_last);
 };
@@ -5180,65 +6094,65 @@ void FuturesTdApi::processRspQryQuote(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcQuoteField *task_data = (CThostFtdcQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["QuoteRef"] = toUtf(task_data->QuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["AskPrice"] = task_data->AskPrice;
-		data["BidPrice"] = task_data->BidPrice;
-		data["AskVolume"] = task_data->AskVolume;
-		data["BidVolume"] = task_data->BidVolume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["AskOffsetFlag"] = task_data->AskOffsetFlag;
-		data["BidOffsetFlag"] = task_data->BidOffsetFlag;
-		data["AskHedgeFlag"] = task_data->AskHedgeFlag;
-		data["BidHedgeFlag"] = task_data->BidHedgeFlag;
-		data["QuoteLocalID"] = toUtf(task_data->QuoteLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["QuoteSysID"] = toUtf(task_data->QuoteSysID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["QuoteStatus"] = task_data->QuoteStatus;
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["AskOrderSysID"] = toUtf(task_data->AskOrderSysID);
-		data["BidOrderSysID"] = toUtf(task_data->BidOrderSysID);
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerQuoteSeq"] = task_data->BrokerQuoteSeq;
-		data["AskOrderRef"] = toUtf(task_data->AskOrderRef);
-		data["BidOrderRef"] = toUtf(task_data->BidOrderRef);
-		data["ForQuoteSysID"] = toUtf(task_data->ForQuoteSysID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_QuoteRef] = toUtf(task_data->QuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_AskPrice] = task_data->AskPrice;
+		data[KEY_BidPrice] = task_data->BidPrice;
+		data[KEY_AskVolume] = task_data->AskVolume;
+		data[KEY_BidVolume] = task_data->BidVolume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_AskOffsetFlag] = task_data->AskOffsetFlag;
+		data[KEY_BidOffsetFlag] = task_data->BidOffsetFlag;
+		data[KEY_AskHedgeFlag] = task_data->AskHedgeFlag;
+		data[KEY_BidHedgeFlag] = task_data->BidHedgeFlag;
+		data[KEY_QuoteLocalID] = toUtf(task_data->QuoteLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_QuoteSysID] = toUtf(task_data->QuoteSysID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_QuoteStatus] = task_data->QuoteStatus;
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_AskOrderSysID] = toUtf(task_data->AskOrderSysID);
+		data[KEY_BidOrderSysID] = toUtf(task_data->BidOrderSysID);
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerQuoteSeq] = task_data->BrokerQuoteSeq;
+		data[KEY_AskOrderRef] = toUtf(task_data->AskOrderRef);
+		data[KEY_BidOrderRef] = toUtf(task_data->BidOrderRef);
+		data[KEY_ForQuoteSysID] = toUtf(task_data->ForQuoteSysID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryQuote(data, error, task->task_id, task->task_last);
 };
@@ -5250,55 +6164,55 @@ void FuturesTdApi::processRspQryOptionSelfClose(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOptionSelfCloseField *task_data = (CThostFtdcOptionSelfCloseField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OptionSelfCloseRef"] = toUtf(task_data->OptionSelfCloseRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["OptSelfCloseFlag"] = task_data->OptSelfCloseFlag;
-		data["OptionSelfCloseLocalID"] = toUtf(task_data->OptionSelfCloseLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OptionSelfCloseSysID"] = toUtf(task_data->OptionSelfCloseSysID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ExecResult"] = task_data->ExecResult;
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerOptionSelfCloseSeq"] = task_data->BrokerOptionSelfCloseSeq;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OptionSelfCloseRef] = toUtf(task_data->OptionSelfCloseRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_OptSelfCloseFlag] = task_data->OptSelfCloseFlag;
+		data[KEY_OptionSelfCloseLocalID] = toUtf(task_data->OptionSelfCloseLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_OptionSelfCloseSysID] = toUtf(task_data->OptionSelfCloseSysID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ExecResult] = task_data->ExecResult;
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerOptionSelfCloseSeq] = task_data->BrokerOptionSelfCloseSeq;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOptionSelfClose(data, error, task->task_id, task->task_last);
 };
@@ -5310,24 +6224,24 @@ void FuturesTdApi::processRspQryInvestUnit(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInvestUnitField *task_data = (CThostFtdcInvestUnitField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["InvestorUnitName"] = toUtf(task_data->InvestorUnitName);
-		data["InvestorGroupID"] = toUtf(task_data->InvestorGroupID);
-		data["CommModelID"] = toUtf(task_data->CommModelID);
-		data["MarginModelID"] = toUtf(task_data->MarginModelID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_InvestorUnitName] = toUtf(task_data->InvestorUnitName);
+		data[KEY_InvestorGroupID] = toUtf(task_data->InvestorGroupID);
+		data[KEY_CommModelID] = toUtf(task_data->CommModelID);
+		data[KEY_MarginModelID] = toUtf(task_data->MarginModelID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryInvestUnit(data, error, task->task_id, task->task_last);
 };
@@ -5339,19 +6253,19 @@ void FuturesTdApi::processRspQryCombInstrumentGuard(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcCombInstrumentGuardField *task_data = (CThostFtdcCombInstrumentGuardField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["GuarantRatio"] = task_data->GuarantRatio;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_GuarantRatio] = task_data->GuarantRatio;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryCombInstrumentGuard(data, error, task->task_id, task->task_last);
 };
@@ -5363,45 +6277,45 @@ void FuturesTdApi::processRspQryCombAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcCombActionField *task_data = (CThostFtdcCombActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["CombActionRef"] = toUtf(task_data->CombActionRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Direction"] = task_data->Direction;
-		data["Volume"] = task_data->Volume;
-		data["CombDirection"] = task_data->CombDirection;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["ActionStatus"] = task_data->ActionStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		data["ComTradeID"] = toUtf(task_data->ComTradeID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_CombActionRef] = toUtf(task_data->CombActionRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_CombDirection] = task_data->CombDirection;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_ActionStatus] = task_data->ActionStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		data[KEY_ComTradeID] = toUtf(task_data->ComTradeID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryCombAction(data, error, task->task_id, task->task_last);
 };
@@ -5413,43 +6327,43 @@ void FuturesTdApi::processRspQryTransferSerial(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTransferSerialField *task_data = (CThostFtdcTransferSerialField*)task->task_data;
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["SessionID"] = task_data->SessionID;
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BankAccType"] = task_data->BankAccType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["FutureAccType"] = task_data->FutureAccType;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["AvailabilityFlag"] = task_data->AvailabilityFlag;
-		data["OperatorCode"] = toUtf(task_data->OperatorCode);
-		data["BankNewAccount"] = toUtf(task_data->BankNewAccount);
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		delete task_data;
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_FutureAccType] = task_data->FutureAccType;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_AvailabilityFlag] = task_data->AvailabilityFlag;
+		data[KEY_OperatorCode] = toUtf(task_data->OperatorCode);
+		data[KEY_BankNewAccount] = toUtf(task_data->BankNewAccount);
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTransferSerial(data, error, task->task_id, task->task_last);
 };
@@ -5461,33 +6375,33 @@ void FuturesTdApi::processRspQryAccountregister(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcAccountregisterField *task_data = (CThostFtdcAccountregisterField*)task->task_data;
-		data["TradeDay"] = toUtf(task_data->TradeDay);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["OpenOrDestroy"] = task_data->OpenOrDestroy;
-		data["RegDate"] = toUtf(task_data->RegDate);
-		data["OutDate"] = toUtf(task_data->OutDate);
-		data["TID"] = task_data->TID;
-		data["CustType"] = task_data->CustType;
-		data["BankAccType"] = task_data->BankAccType;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeDay] = toUtf(task_data->TradeDay);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_OpenOrDestroy] = task_data->OpenOrDestroy;
+		data[KEY_RegDate] = toUtf(task_data->RegDate);
+		data[KEY_OutDate] = toUtf(task_data->OutDate);
+		data[KEY_TID] = task_data->TID;
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryAccountregister(data, error, task->task_id, task->task_last);
 };
@@ -5499,25 +6413,25 @@ void FuturesTdApi::processRspForQuote(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputForQuoteField *task_data = (CThostFtdcInputForQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ForQuoteRef"] = toUtf(task_data->ForQuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ForQuoteRef] = toUtf(task_data->ForQuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspForQuote(data, error, task->task_id, task->task_last);
 };
@@ -5529,9 +6443,9 @@ void FuturesTdApi::processRspError(Task *task)
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspError(error, task->task_id, task->task_last);
 };
@@ -5543,70 +6457,70 @@ void FuturesTdApi::processRtnOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOrderField *task_data = (CThostFtdcOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["OrderSource"] = task_data->OrderSource;
-		data["OrderStatus"] = task_data->OrderStatus;
-		data["OrderType"] = task_data->OrderType;
-		data["VolumeTraded"] = task_data->VolumeTraded;
-		data["VolumeTotal"] = task_data->VolumeTotal;
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ActiveTime"] = toUtf(task_data->ActiveTime);
-		data["SuspendTime"] = toUtf(task_data->SuspendTime);
-		data["UpdateTime"] = toUtf(task_data->UpdateTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ActiveTraderID"] = toUtf(task_data->ActiveTraderID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["RelativeOrderSysID"] = toUtf(task_data->RelativeOrderSysID);
-		data["ZCETotalTradedVolume"] = task_data->ZCETotalTradedVolume;
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_OrderLocalID] = toUtf(task_data->OrderLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_OrderSource] = task_data->OrderSource;
+		data[KEY_OrderStatus] = task_data->OrderStatus;
+		data[KEY_OrderType] = task_data->OrderType;
+		data[KEY_VolumeTraded] = task_data->VolumeTraded;
+		data[KEY_VolumeTotal] = task_data->VolumeTotal;
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ActiveTime] = toUtf(task_data->ActiveTime);
+		data[KEY_SuspendTime] = toUtf(task_data->SuspendTime);
+		data[KEY_UpdateTime] = toUtf(task_data->UpdateTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ActiveTraderID] = toUtf(task_data->ActiveTraderID);
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerOrderSeq] = task_data->BrokerOrderSeq;
+		data[KEY_RelativeOrderSysID] = toUtf(task_data->RelativeOrderSysID);
+		data[KEY_ZCETotalTradedVolume] = task_data->ZCETotalTradedVolume;
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	this->onRtnOrder(data);
 };
@@ -5618,38 +6532,38 @@ void FuturesTdApi::processRtnTrade(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradeField *task_data = (CThostFtdcTradeField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["Direction"] = task_data->Direction;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["TradingRole"] = task_data->TradingRole;
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["Price"] = task_data->Price;
-		data["Volume"] = task_data->Volume;
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["TradeType"] = task_data->TradeType;
-		data["PriceSource"] = task_data->PriceSource;
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["TradeSource"] = task_data->TradeSource;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_TradeID] = toUtf(task_data->TradeID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_TradingRole] = task_data->TradingRole;
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_Price] = task_data->Price;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_TradeType] = task_data->TradeType;
+		data[KEY_PriceSource] = task_data->PriceSource;
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_OrderLocalID] = toUtf(task_data->OrderLocalID);
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_BrokerOrderSeq] = task_data->BrokerOrderSeq;
+		data[KEY_TradeSource] = task_data->TradeSource;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	this->onRtnTrade(data);
 };
@@ -5661,45 +6575,45 @@ void FuturesTdApi::processErrRtnOrderInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputOrderField *task_data = (CThostFtdcInputOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnOrderInsert(data, error);
 };
@@ -5711,44 +6625,44 @@ void FuturesTdApi::processErrRtnOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOrderActionField *task_data = (CThostFtdcOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OrderActionRef"] = task_data->OrderActionRef;
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeChange"] = task_data->VolumeChange;
-		data["ActionDate"] = toUtf(task_data->ActionDate);
-		data["ActionTime"] = toUtf(task_data->ActionTime);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OrderActionStatus"] = task_data->OrderActionStatus;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OrderActionRef] = task_data->OrderActionRef;
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeChange] = task_data->VolumeChange;
+		data[KEY_ActionDate] = toUtf(task_data->ActionDate);
+		data[KEY_ActionTime] = toUtf(task_data->ActionTime);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderLocalID] = toUtf(task_data->OrderLocalID);
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OrderActionStatus] = task_data->OrderActionStatus;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnOrderAction(data, error);
 };
@@ -5760,15 +6674,15 @@ void FuturesTdApi::processRtnInstrumentStatus(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInstrumentStatusField *task_data = (CThostFtdcInstrumentStatusField*)task->task_data;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["SettlementGroupID"] = toUtf(task_data->SettlementGroupID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["InstrumentStatus"] = task_data->InstrumentStatus;
-		data["TradingSegmentSN"] = task_data->TradingSegmentSN;
-		data["EnterTime"] = toUtf(task_data->EnterTime);
-		data["EnterReason"] = task_data->EnterReason;
-		delete task_data;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_SettlementGroupID] = toUtf(task_data->SettlementGroupID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_InstrumentStatus] = task_data->InstrumentStatus;
+		data[KEY_TradingSegmentSN] = task_data->TradingSegmentSN;
+		data[KEY_EnterTime] = toUtf(task_data->EnterTime);
+		data[KEY_EnterReason] = task_data->EnterReason;
+		releaseTaskData(task_data);
 	}
 	this->onRtnInstrumentStatus(data);
 };
@@ -5780,19 +6694,19 @@ void FuturesTdApi::processRtnBulletin(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcBulletinField *task_data = (CThostFtdcBulletinField*)task->task_data;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["BulletinID"] = task_data->BulletinID;
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["NewsType"] = toUtf(task_data->NewsType);
-		data["NewsUrgency"] = task_data->NewsUrgency;
-		data["SendTime"] = toUtf(task_data->SendTime);
-		data["Abstract"] = toUtf(task_data->Abstract);
-		data["ComeFrom"] = toUtf(task_data->ComeFrom);
-		data["Content"] = toUtf(task_data->Content);
-		data["URLLink"] = toUtf(task_data->URLLink);
-		data["MarketID"] = toUtf(task_data->MarketID);
-		delete task_data;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_BulletinID] = task_data->BulletinID;
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_NewsType] = toUtf(task_data->NewsType);
+		data[KEY_NewsUrgency] = task_data->NewsUrgency;
+		data[KEY_SendTime] = toUtf(task_data->SendTime);
+		data[KEY_Abstract] = toUtf(task_data->Abstract);
+		data[KEY_ComeFrom] = toUtf(task_data->ComeFrom);
+		data[KEY_Content] = toUtf(task_data->Content);
+		data[KEY_URLLink] = toUtf(task_data->URLLink);
+		data[KEY_MarketID] = toUtf(task_data->MarketID);
+		releaseTaskData(task_data);
 	}
 	this->onRtnBulletin(data);
 };
@@ -5804,14 +6718,14 @@ void FuturesTdApi::processRtnTradingNotice(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradingNoticeInfoField *task_data = (CThostFtdcTradingNoticeInfoField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["SendTime"] = toUtf(task_data->SendTime);
-		data["FieldContent"] = toUtf(task_data->FieldContent);
-		data["SequenceSeries"] = task_data->SequenceSeries;
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_SendTime] = toUtf(task_data->SendTime);
+		data[KEY_FieldContent] = toUtf(task_data->FieldContent);
+		data[KEY_SequenceSeries] = task_data->SequenceSeries;
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	this->onRtnTradingNotice(data);
 };
@@ -5823,72 +6737,72 @@ void FuturesTdApi::processRtnErrorConditionalOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcErrorConditionalOrderField *task_data = (CThostFtdcErrorConditionalOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["OrderLocalID"] = toUtf(task_data->OrderLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["OrderSource"] = task_data->OrderSource;
-		data["OrderStatus"] = task_data->OrderStatus;
-		data["OrderType"] = task_data->OrderType;
-		data["VolumeTraded"] = task_data->VolumeTraded;
-		data["VolumeTotal"] = task_data->VolumeTotal;
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ActiveTime"] = toUtf(task_data->ActiveTime);
-		data["SuspendTime"] = toUtf(task_data->SuspendTime);
-		data["UpdateTime"] = toUtf(task_data->UpdateTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ActiveTraderID"] = toUtf(task_data->ActiveTraderID);
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerOrderSeq"] = task_data->BrokerOrderSeq;
-		data["RelativeOrderSysID"] = toUtf(task_data->RelativeOrderSysID);
-		data["ZCETotalTradedVolume"] = task_data->ZCETotalTradedVolume;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_OrderLocalID] = toUtf(task_data->OrderLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_OrderSource] = task_data->OrderSource;
+		data[KEY_OrderStatus] = task_data->OrderStatus;
+		data[KEY_OrderType] = task_data->OrderType;
+		data[KEY_VolumeTraded] = task_data->VolumeTraded;
+		data[KEY_VolumeTotal] = task_data->VolumeTotal;
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ActiveTime] = toUtf(task_data->ActiveTime);
+		data[KEY_SuspendTime] = toUtf(task_data->SuspendTime);
+		data[KEY_UpdateTime] = toUtf(task_data->UpdateTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ActiveTraderID] = toUtf(task_data->ActiveTraderID);
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerOrderSeq] = task_data->BrokerOrderSeq;
+		data[KEY_RelativeOrderSysID] = toUtf(task_data->RelativeOrderSysID);
+		data[KEY_ZCETotalTradedVolume] = task_data->ZCETotalTradedVolume;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	this->onRtnErrorConditionalOrder(data);
 };
@@ -5900,51 +6814,51 @@ void FuturesTdApi::processRtnExecOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExecOrderField *task_data = (CThostFtdcExecOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExecOrderRef"] = toUtf(task_data->ExecOrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ActionType"] = task_data->ActionType;
-		data["PosiDirection"] = task_data->PosiDirection;
-		data["ReservePositionFlag"] = task_data->ReservePositionFlag;
-		data["CloseFlag"] = task_data->CloseFlag;
-		data["ExecOrderLocalID"] = toUtf(task_data->ExecOrderLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["ExecOrderSysID"] = toUtf(task_data->ExecOrderSysID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ExecResult"] = task_data->ExecResult;
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerExecOrderSeq"] = task_data->BrokerExecOrderSeq;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ExecOrderRef] = toUtf(task_data->ExecOrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ActionType] = task_data->ActionType;
+		data[KEY_PosiDirection] = task_data->PosiDirection;
+		data[KEY_ReservePositionFlag] = task_data->ReservePositionFlag;
+		data[KEY_CloseFlag] = task_data->CloseFlag;
+		data[KEY_ExecOrderLocalID] = toUtf(task_data->ExecOrderLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_ExecOrderSysID] = toUtf(task_data->ExecOrderSysID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ExecResult] = task_data->ExecResult;
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerExecOrderSeq] = task_data->BrokerExecOrderSeq;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	this->onRtnExecOrder(data);
 };
@@ -5956,36 +6870,36 @@ void FuturesTdApi::processErrRtnExecOrderInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputExecOrderField *task_data = (CThostFtdcInputExecOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExecOrderRef"] = toUtf(task_data->ExecOrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OffsetFlag"] = task_data->OffsetFlag;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ActionType"] = task_data->ActionType;
-		data["PosiDirection"] = task_data->PosiDirection;
-		data["ReservePositionFlag"] = task_data->ReservePositionFlag;
-		data["CloseFlag"] = task_data->CloseFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ExecOrderRef] = toUtf(task_data->ExecOrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OffsetFlag] = task_data->OffsetFlag;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ActionType] = task_data->ActionType;
+		data[KEY_PosiDirection] = task_data->PosiDirection;
+		data[KEY_ReservePositionFlag] = task_data->ReservePositionFlag;
+		data[KEY_CloseFlag] = task_data->CloseFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnExecOrderInsert(data, error);
 };
@@ -5997,43 +6911,43 @@ void FuturesTdApi::processErrRtnExecOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcExecOrderActionField *task_data = (CThostFtdcExecOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["ExecOrderActionRef"] = task_data->ExecOrderActionRef;
-		data["ExecOrderRef"] = toUtf(task_data->ExecOrderRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ExecOrderSysID"] = toUtf(task_data->ExecOrderSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["ActionDate"] = toUtf(task_data->ActionDate);
-		data["ActionTime"] = toUtf(task_data->ActionTime);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["ExecOrderLocalID"] = toUtf(task_data->ExecOrderLocalID);
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OrderActionStatus"] = task_data->OrderActionStatus;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ActionType"] = task_data->ActionType;
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_ExecOrderActionRef] = task_data->ExecOrderActionRef;
+		data[KEY_ExecOrderRef] = toUtf(task_data->ExecOrderRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ExecOrderSysID] = toUtf(task_data->ExecOrderSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_ActionDate] = toUtf(task_data->ActionDate);
+		data[KEY_ActionTime] = toUtf(task_data->ActionTime);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_ExecOrderLocalID] = toUtf(task_data->ExecOrderLocalID);
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OrderActionStatus] = task_data->OrderActionStatus;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ActionType] = task_data->ActionType;
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnExecOrderAction(data, error);
 };
@@ -6045,25 +6959,25 @@ void FuturesTdApi::processErrRtnForQuoteInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputForQuoteField *task_data = (CThostFtdcInputForQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ForQuoteRef"] = toUtf(task_data->ForQuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ForQuoteRef] = toUtf(task_data->ForQuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnForQuoteInsert(data, error);
 };
@@ -6075,57 +6989,57 @@ void FuturesTdApi::processRtnQuote(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcQuoteField *task_data = (CThostFtdcQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["QuoteRef"] = toUtf(task_data->QuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["AskPrice"] = task_data->AskPrice;
-		data["BidPrice"] = task_data->BidPrice;
-		data["AskVolume"] = task_data->AskVolume;
-		data["BidVolume"] = task_data->BidVolume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["AskOffsetFlag"] = task_data->AskOffsetFlag;
-		data["BidOffsetFlag"] = task_data->BidOffsetFlag;
-		data["AskHedgeFlag"] = task_data->AskHedgeFlag;
-		data["BidHedgeFlag"] = task_data->BidHedgeFlag;
-		data["QuoteLocalID"] = toUtf(task_data->QuoteLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["QuoteSysID"] = toUtf(task_data->QuoteSysID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["QuoteStatus"] = task_data->QuoteStatus;
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["AskOrderSysID"] = toUtf(task_data->AskOrderSysID);
-		data["BidOrderSysID"] = toUtf(task_data->BidOrderSysID);
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerQuoteSeq"] = task_data->BrokerQuoteSeq;
-		data["AskOrderRef"] = toUtf(task_data->AskOrderRef);
-		data["BidOrderRef"] = toUtf(task_data->BidOrderRef);
-		data["ForQuoteSysID"] = toUtf(task_data->ForQuoteSysID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_QuoteRef] = toUtf(task_data->QuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_AskPrice] = task_data->AskPrice;
+		data[KEY_BidPrice] = task_data->BidPrice;
+		data[KEY_AskVolume] = task_data->AskVolume;
+		data[KEY_BidVolume] = task_data->BidVolume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_AskOffsetFlag] = task_data->AskOffsetFlag;
+		data[KEY_BidOffsetFlag] = task_data->BidOffsetFlag;
+		data[KEY_AskHedgeFlag] = task_data->AskHedgeFlag;
+		data[KEY_BidHedgeFlag] = task_data->BidHedgeFlag;
+		data[KEY_QuoteLocalID] = toUtf(task_data->QuoteLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_QuoteSysID] = toUtf(task_data->QuoteSysID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_QuoteStatus] = task_data->QuoteStatus;
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_AskOrderSysID] = toUtf(task_data->AskOrderSysID);
+		data[KEY_BidOrderSysID] = toUtf(task_data->BidOrderSysID);
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerQuoteSeq] = task_data->BrokerQuoteSeq;
+		data[KEY_AskOrderRef] = toUtf(task_data->AskOrderRef);
+		data[KEY_BidOrderRef] = toUtf(task_data->BidOrderRef);
+		data[KEY_ForQuoteSysID] = toUtf(task_data->ForQuoteSysID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	this->onRtnQuote(data);
 };
@@ -6137,38 +7051,38 @@ void FuturesTdApi::processErrRtnQuoteInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputQuoteField *task_data = (CThostFtdcInputQuoteField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["QuoteRef"] = toUtf(task_data->QuoteRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["AskPrice"] = task_data->AskPrice;
-		data["BidPrice"] = task_data->BidPrice;
-		data["AskVolume"] = task_data->AskVolume;
-		data["BidVolume"] = task_data->BidVolume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["AskOffsetFlag"] = task_data->AskOffsetFlag;
-		data["BidOffsetFlag"] = task_data->BidOffsetFlag;
-		data["AskHedgeFlag"] = task_data->AskHedgeFlag;
-		data["BidHedgeFlag"] = task_data->BidHedgeFlag;
-		data["AskOrderRef"] = toUtf(task_data->AskOrderRef);
-		data["BidOrderRef"] = toUtf(task_data->BidOrderRef);
-		data["ForQuoteSysID"] = toUtf(task_data->ForQuoteSysID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_QuoteRef] = toUtf(task_data->QuoteRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_AskPrice] = task_data->AskPrice;
+		data[KEY_BidPrice] = task_data->BidPrice;
+		data[KEY_AskVolume] = task_data->AskVolume;
+		data[KEY_BidVolume] = task_data->BidVolume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_AskOffsetFlag] = task_data->AskOffsetFlag;
+		data[KEY_BidOffsetFlag] = task_data->BidOffsetFlag;
+		data[KEY_AskHedgeFlag] = task_data->AskHedgeFlag;
+		data[KEY_BidHedgeFlag] = task_data->BidHedgeFlag;
+		data[KEY_AskOrderRef] = toUtf(task_data->AskOrderRef);
+		data[KEY_BidOrderRef] = toUtf(task_data->BidOrderRef);
+		data[KEY_ForQuoteSysID] = toUtf(task_data->ForQuoteSysID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnQuoteInsert(data, error);
 };
@@ -6180,42 +7094,42 @@ void FuturesTdApi::processErrRtnQuoteAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcQuoteActionField *task_data = (CThostFtdcQuoteActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["QuoteActionRef"] = task_data->QuoteActionRef;
-		data["QuoteRef"] = toUtf(task_data->QuoteRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["QuoteSysID"] = toUtf(task_data->QuoteSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["ActionDate"] = toUtf(task_data->ActionDate);
-		data["ActionTime"] = toUtf(task_data->ActionTime);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["QuoteLocalID"] = toUtf(task_data->QuoteLocalID);
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OrderActionStatus"] = task_data->OrderActionStatus;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_QuoteActionRef] = task_data->QuoteActionRef;
+		data[KEY_QuoteRef] = toUtf(task_data->QuoteRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_QuoteSysID] = toUtf(task_data->QuoteSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_ActionDate] = toUtf(task_data->ActionDate);
+		data[KEY_ActionTime] = toUtf(task_data->ActionTime);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_QuoteLocalID] = toUtf(task_data->QuoteLocalID);
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OrderActionStatus] = task_data->OrderActionStatus;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnQuoteAction(data, error);
 };
@@ -6227,13 +7141,13 @@ void FuturesTdApi::processRtnForQuote(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcForQuoteRspField *task_data = (CThostFtdcForQuoteRspField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ForQuoteSysID"] = toUtf(task_data->ForQuoteSysID);
-		data["ForQuoteTime"] = toUtf(task_data->ForQuoteTime);
-		data["ActionDay"] = toUtf(task_data->ActionDay);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ForQuoteSysID] = toUtf(task_data->ForQuoteSysID);
+		data[KEY_ForQuoteTime] = toUtf(task_data->ForQuoteTime);
+		data[KEY_ActionDay] = toUtf(task_data->ActionDay);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		releaseTaskData(task_data);
 	}
 	this->onRtnForQuote(data);
 };
@@ -6245,12 +7159,12 @@ void FuturesTdApi::processRtnCFMMCTradingAccountToken(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcCFMMCTradingAccountTokenField *task_data = (CThostFtdcCFMMCTradingAccountTokenField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["KeyID"] = task_data->KeyID;
-		data["Token"] = toUtf(task_data->Token);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_KeyID] = task_data->KeyID;
+		data[KEY_Token] = toUtf(task_data->Token);
+		releaseTaskData(task_data);
 	}
 	this->onRtnCFMMCTradingAccountToken(data);
 };
@@ -6262,36 +7176,36 @@ void FuturesTdApi::processErrRtnBatchOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcBatchOrderActionField *task_data = (CThostFtdcBatchOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OrderActionRef"] = task_data->OrderActionRef;
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ActionDate"] = toUtf(task_data->ActionDate);
-		data["ActionTime"] = toUtf(task_data->ActionTime);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OrderActionStatus"] = task_data->OrderActionStatus;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OrderActionRef] = task_data->OrderActionRef;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ActionDate] = toUtf(task_data->ActionDate);
+		data[KEY_ActionTime] = toUtf(task_data->ActionTime);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OrderActionStatus] = task_data->OrderActionStatus;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnBatchOrderAction(data, error);
 };
@@ -6303,47 +7217,47 @@ void FuturesTdApi::processRtnOptionSelfClose(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOptionSelfCloseField *task_data = (CThostFtdcOptionSelfCloseField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OptionSelfCloseRef"] = toUtf(task_data->OptionSelfCloseRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["OptSelfCloseFlag"] = task_data->OptSelfCloseFlag;
-		data["OptionSelfCloseLocalID"] = toUtf(task_data->OptionSelfCloseLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OrderSubmitStatus"] = task_data->OrderSubmitStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["OptionSelfCloseSysID"] = toUtf(task_data->OptionSelfCloseSysID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["CancelTime"] = toUtf(task_data->CancelTime);
-		data["ExecResult"] = task_data->ExecResult;
-		data["ClearingPartID"] = toUtf(task_data->ClearingPartID);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["ActiveUserID"] = toUtf(task_data->ActiveUserID);
-		data["BrokerOptionSelfCloseSeq"] = task_data->BrokerOptionSelfCloseSeq;
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OptionSelfCloseRef] = toUtf(task_data->OptionSelfCloseRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_OptSelfCloseFlag] = task_data->OptSelfCloseFlag;
+		data[KEY_OptionSelfCloseLocalID] = toUtf(task_data->OptionSelfCloseLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OrderSubmitStatus] = task_data->OrderSubmitStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_OptionSelfCloseSysID] = toUtf(task_data->OptionSelfCloseSysID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_CancelTime] = toUtf(task_data->CancelTime);
+		data[KEY_ExecResult] = task_data->ExecResult;
+		data[KEY_ClearingPartID] = toUtf(task_data->ClearingPartID);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_ActiveUserID] = toUtf(task_data->ActiveUserID);
+		data[KEY_BrokerOptionSelfCloseSeq] = task_data->BrokerOptionSelfCloseSeq;
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	this->onRtnOptionSelfClose(data);
 };
@@ -6355,32 +7269,32 @@ void FuturesTdApi::processErrRtnOptionSelfCloseInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputOptionSelfCloseField *task_data = (CThostFtdcInputOptionSelfCloseField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OptionSelfCloseRef"] = toUtf(task_data->OptionSelfCloseRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Volume"] = task_data->Volume;
-		data["RequestID"] = task_data->RequestID;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["OptSelfCloseFlag"] = task_data->OptSelfCloseFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OptionSelfCloseRef] = toUtf(task_data->OptionSelfCloseRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_OptSelfCloseFlag] = task_data->OptSelfCloseFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnOptionSelfCloseInsert(data, error);
 };
@@ -6392,42 +7306,42 @@ void FuturesTdApi::processErrRtnOptionSelfCloseAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOptionSelfCloseActionField *task_data = (CThostFtdcOptionSelfCloseActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OptionSelfCloseActionRef"] = task_data->OptionSelfCloseActionRef;
-		data["OptionSelfCloseRef"] = toUtf(task_data->OptionSelfCloseRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["OptionSelfCloseSysID"] = toUtf(task_data->OptionSelfCloseSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["ActionDate"] = toUtf(task_data->ActionDate);
-		data["ActionTime"] = toUtf(task_data->ActionTime);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["OptionSelfCloseLocalID"] = toUtf(task_data->OptionSelfCloseLocalID);
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["OrderActionStatus"] = task_data->OrderActionStatus;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OptionSelfCloseActionRef] = task_data->OptionSelfCloseActionRef;
+		data[KEY_OptionSelfCloseRef] = toUtf(task_data->OptionSelfCloseRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_OptionSelfCloseSysID] = toUtf(task_data->OptionSelfCloseSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_ActionDate] = toUtf(task_data->ActionDate);
+		data[KEY_ActionTime] = toUtf(task_data->ActionTime);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_OptionSelfCloseLocalID] = toUtf(task_data->OptionSelfCloseLocalID);
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_OrderActionStatus] = task_data->OrderActionStatus;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnOptionSelfCloseAction(data, error);
 };
@@ -6439,37 +7353,37 @@ void FuturesTdApi::processRtnCombAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcCombActionField *task_data = (CThostFtdcCombActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["CombActionRef"] = toUtf(task_data->CombActionRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Direction"] = task_data->Direction;
-		data["Volume"] = task_data->Volume;
-		data["CombDirection"] = task_data->CombDirection;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ActionLocalID"] = toUtf(task_data->ActionLocalID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParticipantID"] = toUtf(task_data->ParticipantID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["TraderID"] = toUtf(task_data->TraderID);
-		data["InstallID"] = task_data->InstallID;
-		data["ActionStatus"] = task_data->ActionStatus;
-		data["NotifySequence"] = task_data->NotifySequence;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["SettlementID"] = task_data->SettlementID;
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["UserProductInfo"] = toUtf(task_data->UserProductInfo);
-		data["StatusMsg"] = toUtf(task_data->StatusMsg);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		data["ComTradeID"] = toUtf(task_data->ComTradeID);
-		data["BranchID"] = toUtf(task_data->BranchID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_CombActionRef] = toUtf(task_data->CombActionRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_CombDirection] = task_data->CombDirection;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ActionLocalID] = toUtf(task_data->ActionLocalID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParticipantID] = toUtf(task_data->ParticipantID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_ExchangeInstID] = toUtf(task_data->ExchangeInstID);
+		data[KEY_TraderID] = toUtf(task_data->TraderID);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_ActionStatus] = task_data->ActionStatus;
+		data[KEY_NotifySequence] = task_data->NotifySequence;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_SettlementID] = task_data->SettlementID;
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_UserProductInfo] = toUtf(task_data->UserProductInfo);
+		data[KEY_StatusMsg] = toUtf(task_data->StatusMsg);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		data[KEY_ComTradeID] = toUtf(task_data->ComTradeID);
+		data[KEY_BranchID] = toUtf(task_data->BranchID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	this->onRtnCombAction(data);
 };
@@ -6481,28 +7395,28 @@ void FuturesTdApi::processErrRtnCombActionInsert(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcInputCombActionField *task_data = (CThostFtdcInputCombActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["CombActionRef"] = toUtf(task_data->CombActionRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["Direction"] = task_data->Direction;
-		data["Volume"] = task_data->Volume;
-		data["CombDirection"] = task_data->CombDirection;
-		data["HedgeFlag"] = task_data->HedgeFlag;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_CombActionRef] = toUtf(task_data->CombActionRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_Volume] = task_data->Volume;
+		data[KEY_CombDirection] = task_data->CombDirection;
+		data[KEY_HedgeFlag] = task_data->HedgeFlag;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnCombActionInsert(data, error);
 };
@@ -6514,19 +7428,19 @@ void FuturesTdApi::processRspQryContractBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcContractBankField *task_data = (CThostFtdcContractBankField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBrchID"] = toUtf(task_data->BankBrchID);
-		data["BankName"] = toUtf(task_data->BankName);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBrchID] = toUtf(task_data->BankBrchID);
+		data[KEY_BankName] = toUtf(task_data->BankName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryContractBank(data, error, task->task_id, task->task_last);
 };
@@ -6538,50 +7452,50 @@ void FuturesTdApi::processRspQryParkedOrder(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcParkedOrderField *task_data = (CThostFtdcParkedOrderField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrderPriceType"] = task_data->OrderPriceType;
-		data["Direction"] = task_data->Direction;
-		data["CombOffsetFlag"] = toUtf(task_data->CombOffsetFlag);
-		data["CombHedgeFlag"] = toUtf(task_data->CombHedgeFlag);
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeTotalOriginal"] = task_data->VolumeTotalOriginal;
-		data["TimeCondition"] = task_data->TimeCondition;
-		data["GTDDate"] = toUtf(task_data->GTDDate);
-		data["VolumeCondition"] = task_data->VolumeCondition;
-		data["MinVolume"] = task_data->MinVolume;
-		data["ContingentCondition"] = task_data->ContingentCondition;
-		data["StopPrice"] = task_data->StopPrice;
-		data["ForceCloseReason"] = task_data->ForceCloseReason;
-		data["IsAutoSuspend"] = task_data->IsAutoSuspend;
-		data["BusinessUnit"] = toUtf(task_data->BusinessUnit);
-		data["RequestID"] = task_data->RequestID;
-		data["UserForceClose"] = task_data->UserForceClose;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["ParkedOrderID"] = toUtf(task_data->ParkedOrderID);
-		data["UserType"] = task_data->UserType;
-		data["Status"] = task_data->Status;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["IsSwapOrder"] = task_data->IsSwapOrder;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["ClientID"] = toUtf(task_data->ClientID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrderPriceType] = task_data->OrderPriceType;
+		data[KEY_Direction] = task_data->Direction;
+		data[KEY_CombOffsetFlag] = toUtf(task_data->CombOffsetFlag);
+		data[KEY_CombHedgeFlag] = toUtf(task_data->CombHedgeFlag);
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeTotalOriginal] = task_data->VolumeTotalOriginal;
+		data[KEY_TimeCondition] = task_data->TimeCondition;
+		data[KEY_GTDDate] = toUtf(task_data->GTDDate);
+		data[KEY_VolumeCondition] = task_data->VolumeCondition;
+		data[KEY_MinVolume] = task_data->MinVolume;
+		data[KEY_ContingentCondition] = task_data->ContingentCondition;
+		data[KEY_StopPrice] = task_data->StopPrice;
+		data[KEY_ForceCloseReason] = task_data->ForceCloseReason;
+		data[KEY_IsAutoSuspend] = task_data->IsAutoSuspend;
+		data[KEY_BusinessUnit] = toUtf(task_data->BusinessUnit);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_UserForceClose] = task_data->UserForceClose;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_ParkedOrderID] = toUtf(task_data->ParkedOrderID);
+		data[KEY_UserType] = task_data->UserType;
+		data[KEY_Status] = task_data->Status;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_IsSwapOrder] = task_data->IsSwapOrder;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_ClientID] = toUtf(task_data->ClientID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryParkedOrder(data, error, task->task_id, task->task_last);
 };
@@ -6593,37 +7507,37 @@ void FuturesTdApi::processRspQryParkedOrderAction(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcParkedOrderActionField *task_data = (CThostFtdcParkedOrderActionField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["OrderActionRef"] = task_data->OrderActionRef;
-		data["OrderRef"] = toUtf(task_data->OrderRef);
-		data["RequestID"] = task_data->RequestID;
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["OrderSysID"] = toUtf(task_data->OrderSysID);
-		data["ActionFlag"] = task_data->ActionFlag;
-		data["LimitPrice"] = task_data->LimitPrice;
-		data["VolumeChange"] = task_data->VolumeChange;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ParkedOrderActionID"] = toUtf(task_data->ParkedOrderActionID);
-		data["UserType"] = task_data->UserType;
-		data["Status"] = task_data->Status;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		data["IPAddress"] = toUtf(task_data->IPAddress);
-		data["MacAddress"] = toUtf(task_data->MacAddress);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_OrderActionRef] = task_data->OrderActionRef;
+		data[KEY_OrderRef] = toUtf(task_data->OrderRef);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_FrontID] = task_data->FrontID;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_OrderSysID] = toUtf(task_data->OrderSysID);
+		data[KEY_ActionFlag] = task_data->ActionFlag;
+		data[KEY_LimitPrice] = task_data->LimitPrice;
+		data[KEY_VolumeChange] = task_data->VolumeChange;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_ParkedOrderActionID] = toUtf(task_data->ParkedOrderActionID);
+		data[KEY_UserType] = task_data->UserType;
+		data[KEY_Status] = task_data->Status;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		data[KEY_IPAddress] = toUtf(task_data->IPAddress);
+		data[KEY_MacAddress] = toUtf(task_data->MacAddress);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryParkedOrderAction(data, error, task->task_id, task->task_last);
 };
@@ -6635,24 +7549,24 @@ void FuturesTdApi::processRspQryTradingNotice(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcTradingNoticeField *task_data = (CThostFtdcTradingNoticeField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorRange"] = task_data->InvestorRange;
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["SequenceSeries"] = task_data->SequenceSeries;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["SendTime"] = toUtf(task_data->SendTime);
-		data["SequenceNo"] = task_data->SequenceNo;
-		data["FieldContent"] = toUtf(task_data->FieldContent);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorRange] = task_data->InvestorRange;
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_SequenceSeries] = task_data->SequenceSeries;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_SendTime] = toUtf(task_data->SendTime);
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		data[KEY_FieldContent] = toUtf(task_data->FieldContent);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTradingNotice(data, error, task->task_id, task->task_last);
 };
@@ -6664,23 +7578,23 @@ void FuturesTdApi::processRspQryBrokerTradingParams(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcBrokerTradingParamsField *task_data = (CThostFtdcBrokerTradingParamsField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["MarginPriceType"] = task_data->MarginPriceType;
-		data["Algorithm"] = task_data->Algorithm;
-		data["AvailIncludeCloseProfit"] = task_data->AvailIncludeCloseProfit;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["OptionRoyaltyPriceType"] = task_data->OptionRoyaltyPriceType;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_MarginPriceType] = task_data->MarginPriceType;
+		data[KEY_Algorithm] = task_data->Algorithm;
+		data[KEY_AvailIncludeCloseProfit] = task_data->AvailIncludeCloseProfit;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_OptionRoyaltyPriceType] = task_data->OptionRoyaltyPriceType;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryBrokerTradingParams(data, error, task->task_id, task->task_last);
 };
@@ -6692,21 +7606,21 @@ void FuturesTdApi::processRspQryBrokerTradingAlgos(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcBrokerTradingAlgosField *task_data = (CThostFtdcBrokerTradingAlgosField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["HandlePositionAlgoID"] = task_data->HandlePositionAlgoID;
-		data["FindMarginRateAlgoID"] = task_data->FindMarginRateAlgoID;
-		data["HandleTradingAccountAlgoID"] = task_data->HandleTradingAccountAlgoID;
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_ExchangeID] = toUtf(task_data->ExchangeID);
+		data[KEY_InstrumentID] = toUtf(task_data->InstrumentID);
+		data[KEY_HandlePositionAlgoID] = task_data->HandlePositionAlgoID;
+		data[KEY_FindMarginRateAlgoID] = task_data->FindMarginRateAlgoID;
+		data[KEY_HandleTradingAccountAlgoID] = task_data->HandleTradingAccountAlgoID;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryBrokerTradingAlgos(data, error, task->task_id, task->task_last);
 };
@@ -6718,18 +7632,18 @@ void FuturesTdApi::processRspQueryCFMMCTradingAccountToken(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcQueryCFMMCTradingAccountTokenField *task_data = (CThostFtdcQueryCFMMCTradingAccountTokenField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["InvestorID"] = toUtf(task_data->InvestorID);
-		data["InvestUnitID"] = toUtf(task_data->InvestUnitID);
-		delete task_data;
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_InvestorID] = toUtf(task_data->InvestorID);
+		data[KEY_InvestUnitID] = toUtf(task_data->InvestUnitID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQueryCFMMCTradingAccountToken(data, error, task->task_id, task->task_last);
 };
@@ -6741,53 +7655,53 @@ void FuturesTdApi::processRtnFromBankToFutureByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspTransferField *task_data = (CThostFtdcRspTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnFromBankToFutureByBank(data);
 };
@@ -6799,53 +7713,53 @@ void FuturesTdApi::processRtnFromFutureToBankByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspTransferField *task_data = (CThostFtdcRspTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnFromFutureToBankByBank(data);
 };
@@ -6857,60 +7771,60 @@ void FuturesTdApi::processRtnRepealFromBankToFutureByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspRepealField *task_data = (CThostFtdcRspRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnRepealFromBankToFutureByBank(data);
 };
@@ -6922,60 +7836,60 @@ void FuturesTdApi::processRtnRepealFromFutureToBankByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspRepealField *task_data = (CThostFtdcRspRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnRepealFromFutureToBankByBank(data);
 };
@@ -6987,53 +7901,53 @@ void FuturesTdApi::processRtnFromBankToFutureByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspTransferField *task_data = (CThostFtdcRspTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnFromBankToFutureByFuture(data);
 };
@@ -7045,53 +7959,53 @@ void FuturesTdApi::processRtnFromFutureToBankByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspTransferField *task_data = (CThostFtdcRspTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnFromFutureToBankByFuture(data);
 };
@@ -7103,60 +8017,60 @@ void FuturesTdApi::processRtnRepealFromBankToFutureByFutureManual(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspRepealField *task_data = (CThostFtdcRspRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnRepealFromBankToFutureByFutureManual(data);
 };
@@ -7168,60 +8082,60 @@ void FuturesTdApi::processRtnRepealFromFutureToBankByFutureManual(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspRepealField *task_data = (CThostFtdcRspRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnRepealFromFutureToBankByFutureManual(data);
 };
@@ -7233,48 +8147,48 @@ void FuturesTdApi::processRtnQueryBankBalanceByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcNotifyQueryAccountField *task_data = (CThostFtdcNotifyQueryAccountField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["InstallID"] = task_data->InstallID;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["BankUseAmount"] = task_data->BankUseAmount;
-		data["BankFetchAmount"] = task_data->BankFetchAmount;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_BankUseAmount] = task_data->BankUseAmount;
+		data[KEY_BankFetchAmount] = task_data->BankFetchAmount;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnQueryBankBalanceByFuture(data);
 };
@@ -7286,59 +8200,59 @@ void FuturesTdApi::processErrRtnBankToFutureByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqTransferField *task_data = (CThostFtdcReqTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnBankToFutureByFuture(data, error);
 };
@@ -7350,59 +8264,59 @@ void FuturesTdApi::processErrRtnFutureToBankByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqTransferField *task_data = (CThostFtdcReqTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnFutureToBankByFuture(data, error);
 };
@@ -7414,66 +8328,66 @@ void FuturesTdApi::processErrRtnRepealBankToFutureByFutureManual(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqRepealField *task_data = (CThostFtdcReqRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnRepealBankToFutureByFutureManual(data, error);
 };
@@ -7485,66 +8399,66 @@ void FuturesTdApi::processErrRtnRepealFutureToBankByFutureManual(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqRepealField *task_data = (CThostFtdcReqRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnRepealFutureToBankByFutureManual(data, error);
 };
@@ -7556,52 +8470,52 @@ void FuturesTdApi::processErrRtnQueryBankBalanceByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqQueryAccountField *task_data = (CThostFtdcReqQueryAccountField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["InstallID"] = task_data->InstallID;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onErrRtnQueryBankBalanceByFuture(data, error);
 };
@@ -7613,60 +8527,60 @@ void FuturesTdApi::processRtnRepealFromBankToFutureByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspRepealField *task_data = (CThostFtdcRspRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnRepealFromBankToFutureByFuture(data);
 };
@@ -7678,60 +8592,60 @@ void FuturesTdApi::processRtnRepealFromFutureToBankByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcRspRepealField *task_data = (CThostFtdcRspRepealField*)task->task_data;
-		data["RepealTimeInterval"] = task_data->RepealTimeInterval;
-		data["RepealedTimes"] = task_data->RepealedTimes;
-		data["BankRepealFlag"] = task_data->BankRepealFlag;
-		data["BrokerRepealFlag"] = task_data->BrokerRepealFlag;
-		data["PlateRepealSerial"] = task_data->PlateRepealSerial;
-		data["BankRepealSerial"] = toUtf(task_data->BankRepealSerial);
-		data["FutureRepealSerial"] = task_data->FutureRepealSerial;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_RepealTimeInterval] = task_data->RepealTimeInterval;
+		data[KEY_RepealedTimes] = task_data->RepealedTimes;
+		data[KEY_BankRepealFlag] = task_data->BankRepealFlag;
+		data[KEY_BrokerRepealFlag] = task_data->BrokerRepealFlag;
+		data[KEY_PlateRepealSerial] = task_data->PlateRepealSerial;
+		data[KEY_BankRepealSerial] = toUtf(task_data->BankRepealSerial);
+		data[KEY_FutureRepealSerial] = task_data->FutureRepealSerial;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnRepealFromFutureToBankByFuture(data);
 };
@@ -7743,59 +8657,59 @@ void FuturesTdApi::processRspFromBankToFutureByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqTransferField *task_data = (CThostFtdcReqTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspFromBankToFutureByFuture(data, error, task->task_id, task->task_last);
 };
@@ -7807,59 +8721,59 @@ void FuturesTdApi::processRspFromFutureToBankByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqTransferField *task_data = (CThostFtdcReqTransferField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["TradeAmount"] = task_data->TradeAmount;
-		data["FutureFetchAmount"] = task_data->FutureFetchAmount;
-		data["FeePayFlag"] = task_data->FeePayFlag;
-		data["CustFee"] = task_data->CustFee;
-		data["BrokerFee"] = task_data->BrokerFee;
-		data["Message"] = toUtf(task_data->Message);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["TransferStatus"] = task_data->TransferStatus;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_TradeAmount] = task_data->TradeAmount;
+		data[KEY_FutureFetchAmount] = task_data->FutureFetchAmount;
+		data[KEY_FeePayFlag] = task_data->FeePayFlag;
+		data[KEY_CustFee] = task_data->CustFee;
+		data[KEY_BrokerFee] = task_data->BrokerFee;
+		data[KEY_Message] = toUtf(task_data->Message);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_TransferStatus] = task_data->TransferStatus;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspFromFutureToBankByFuture(data, error, task->task_id, task->task_last);
 };
@@ -7871,52 +8785,52 @@ void FuturesTdApi::processRspQueryBankAccountMoneyByFuture(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcReqQueryAccountField *task_data = (CThostFtdcReqQueryAccountField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["CustType"] = task_data->CustType;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["FutureSerial"] = task_data->FutureSerial;
-		data["InstallID"] = task_data->InstallID;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["RequestID"] = task_data->RequestID;
-		data["TID"] = task_data->TID;
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_FutureSerial] = task_data->FutureSerial;
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_RequestID] = task_data->RequestID;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQueryBankAccountMoneyByFuture(data, error, task->task_id, task->task_last);
 };
@@ -7928,54 +8842,54 @@ void FuturesTdApi::processRtnOpenAccountByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcOpenAccountField *task_data = (CThostFtdcOpenAccountField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["Gender"] = task_data->Gender;
-		data["CountryCode"] = toUtf(task_data->CountryCode);
-		data["CustType"] = task_data->CustType;
-		data["Address"] = toUtf(task_data->Address);
-		data["ZipCode"] = toUtf(task_data->ZipCode);
-		data["Telephone"] = toUtf(task_data->Telephone);
-		data["MobilePhone"] = toUtf(task_data->MobilePhone);
-		data["Fax"] = toUtf(task_data->Fax);
-		data["EMail"] = toUtf(task_data->EMail);
-		data["MoneyAccountStatus"] = task_data->MoneyAccountStatus;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["CashExchangeCode"] = task_data->CashExchangeCode;
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["TID"] = task_data->TID;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_Gender] = task_data->Gender;
+		data[KEY_CountryCode] = toUtf(task_data->CountryCode);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_Address] = toUtf(task_data->Address);
+		data[KEY_ZipCode] = toUtf(task_data->ZipCode);
+		data[KEY_Telephone] = toUtf(task_data->Telephone);
+		data[KEY_MobilePhone] = toUtf(task_data->MobilePhone);
+		data[KEY_Fax] = toUtf(task_data->Fax);
+		data[KEY_EMail] = toUtf(task_data->EMail);
+		data[KEY_MoneyAccountStatus] = task_data->MoneyAccountStatus;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_CashExchangeCode] = task_data->CashExchangeCode;
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_TID] = task_data->TID;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnOpenAccountByBank(data);
 };
@@ -7987,54 +8901,54 @@ void FuturesTdApi::processRtnCancelAccountByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcCancelAccountField *task_data = (CThostFtdcCancelAccountField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["Gender"] = task_data->Gender;
-		data["CountryCode"] = toUtf(task_data->CountryCode);
-		data["CustType"] = task_data->CustType;
-		data["Address"] = toUtf(task_data->Address);
-		data["ZipCode"] = toUtf(task_data->ZipCode);
-		data["Telephone"] = toUtf(task_data->Telephone);
-		data["MobilePhone"] = toUtf(task_data->MobilePhone);
-		data["Fax"] = toUtf(task_data->Fax);
-		data["EMail"] = toUtf(task_data->EMail);
-		data["MoneyAccountStatus"] = task_data->MoneyAccountStatus;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["InstallID"] = task_data->InstallID;
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["CashExchangeCode"] = task_data->CashExchangeCode;
-		data["Digest"] = toUtf(task_data->Digest);
-		data["BankAccType"] = task_data->BankAccType;
-		data["DeviceID"] = toUtf(task_data->DeviceID);
-		data["BankSecuAccType"] = task_data->BankSecuAccType;
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankSecuAcc"] = toUtf(task_data->BankSecuAcc);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["OperNo"] = toUtf(task_data->OperNo);
-		data["TID"] = task_data->TID;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_Gender] = task_data->Gender;
+		data[KEY_CountryCode] = toUtf(task_data->CountryCode);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_Address] = toUtf(task_data->Address);
+		data[KEY_ZipCode] = toUtf(task_data->ZipCode);
+		data[KEY_Telephone] = toUtf(task_data->Telephone);
+		data[KEY_MobilePhone] = toUtf(task_data->MobilePhone);
+		data[KEY_Fax] = toUtf(task_data->Fax);
+		data[KEY_EMail] = toUtf(task_data->EMail);
+		data[KEY_MoneyAccountStatus] = task_data->MoneyAccountStatus;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_CashExchangeCode] = task_data->CashExchangeCode;
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_DeviceID] = toUtf(task_data->DeviceID);
+		data[KEY_BankSecuAccType] = task_data->BankSecuAccType;
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankSecuAcc] = toUtf(task_data->BankSecuAcc);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_OperNo] = toUtf(task_data->OperNo);
+		data[KEY_TID] = task_data->TID;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnCancelAccountByBank(data);
 };
@@ -8046,50 +8960,50 @@ void FuturesTdApi::processRtnChangeAccountByBank(Task *task)
 	if (task->task_data)
 	{
 		CThostFtdcChangeAccountField *task_data = (CThostFtdcChangeAccountField*)task->task_data;
-		data["TradeCode"] = toUtf(task_data->TradeCode);
-		data["BankID"] = toUtf(task_data->BankID);
-		data["BankBranchID"] = toUtf(task_data->BankBranchID);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["BrokerBranchID"] = toUtf(task_data->BrokerBranchID);
-		data["TradeDate"] = toUtf(task_data->TradeDate);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["BankSerial"] = toUtf(task_data->BankSerial);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PlateSerial"] = task_data->PlateSerial;
-		data["LastFragment"] = task_data->LastFragment;
-		data["SessionID"] = task_data->SessionID;
-		data["CustomerName"] = toUtf(task_data->CustomerName);
-		data["IdCardType"] = task_data->IdCardType;
-		data["IdentifiedCardNo"] = toUtf(task_data->IdentifiedCardNo);
-		data["Gender"] = task_data->Gender;
-		data["CountryCode"] = toUtf(task_data->CountryCode);
-		data["CustType"] = task_data->CustType;
-		data["Address"] = toUtf(task_data->Address);
-		data["ZipCode"] = toUtf(task_data->ZipCode);
-		data["Telephone"] = toUtf(task_data->Telephone);
-		data["MobilePhone"] = toUtf(task_data->MobilePhone);
-		data["Fax"] = toUtf(task_data->Fax);
-		data["EMail"] = toUtf(task_data->EMail);
-		data["MoneyAccountStatus"] = task_data->MoneyAccountStatus;
-		data["BankAccount"] = toUtf(task_data->BankAccount);
-		data["BankPassWord"] = toUtf(task_data->BankPassWord);
-		data["NewBankAccount"] = toUtf(task_data->NewBankAccount);
-		data["NewBankPassWord"] = toUtf(task_data->NewBankPassWord);
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["Password"] = toUtf(task_data->Password);
-		data["BankAccType"] = task_data->BankAccType;
-		data["InstallID"] = task_data->InstallID;
-		data["VerifyCertNoFlag"] = task_data->VerifyCertNoFlag;
-		data["CurrencyID"] = toUtf(task_data->CurrencyID);
-		data["BrokerIDByBank"] = toUtf(task_data->BrokerIDByBank);
-		data["BankPwdFlag"] = task_data->BankPwdFlag;
-		data["SecuPwdFlag"] = task_data->SecuPwdFlag;
-		data["TID"] = task_data->TID;
-		data["Digest"] = toUtf(task_data->Digest);
-		data["ErrorID"] = task_data->ErrorID;
-		data["ErrorMsg"] = toUtf(task_data->ErrorMsg);
-		data["LongCustomerName"] = toUtf(task_data->LongCustomerName);
-		delete task_data;
+		data[KEY_TradeCode] = toUtf(task_data->TradeCode);
+		data[KEY_BankID] = toUtf(task_data->BankID);
+		data[KEY_BankBranchID] = toUtf(task_data->BankBranchID);
+		data[KEY_BrokerID] = toUtf(task_data->BrokerID);
+		data[KEY_BrokerBranchID] = toUtf(task_data->BrokerBranchID);
+		data[KEY_TradeDate] = toUtf(task_data->TradeDate);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_BankSerial] = toUtf(task_data->BankSerial);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PlateSerial] = task_data->PlateSerial;
+		data[KEY_LastFragment] = task_data->LastFragment;
+		data[KEY_SessionID] = task_data->SessionID;
+		data[KEY_CustomerName] = toUtf(task_data->CustomerName);
+		data[KEY_IdCardType] = task_data->IdCardType;
+		data[KEY_IdentifiedCardNo] = toUtf(task_data->IdentifiedCardNo);
+		data[KEY_Gender] = task_data->Gender;
+		data[KEY_CountryCode] = toUtf(task_data->CountryCode);
+		data[KEY_CustType] = task_data->CustType;
+		data[KEY_Address] = toUtf(task_data->Address);
+		data[KEY_ZipCode] = toUtf(task_data->ZipCode);
+		data[KEY_Telephone] = toUtf(task_data->Telephone);
+		data[KEY_MobilePhone] = toUtf(task_data->MobilePhone);
+		data[KEY_Fax] = toUtf(task_data->Fax);
+		data[KEY_EMail] = toUtf(task_data->EMail);
+		data[KEY_MoneyAccountStatus] = task_data->MoneyAccountStatus;
+		data[KEY_BankAccount] = toUtf(task_data->BankAccount);
+		data[KEY_BankPassWord] = toUtf(task_data->BankPassWord);
+		data[KEY_NewBankAccount] = toUtf(task_data->NewBankAccount);
+		data[KEY_NewBankPassWord] = toUtf(task_data->NewBankPassWord);
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_Password] = toUtf(task_data->Password);
+		data[KEY_BankAccType] = task_data->BankAccType;
+		data[KEY_InstallID] = task_data->InstallID;
+		data[KEY_VerifyCertNoFlag] = task_data->VerifyCertNoFlag;
+		data[KEY_CurrencyID] = toUtf(task_data->CurrencyID);
+		data[KEY_BrokerIDByBank] = toUtf(task_data->BrokerIDByBank);
+		data[KEY_BankPwdFlag] = task_data->BankPwdFlag;
+		data[KEY_SecuPwdFlag] = task_data->SecuPwdFlag;
+		data[KEY_TID] = task_data->TID;
+		data[KEY_Digest] = toUtf(task_data->Digest);
+		data[KEY_ErrorID] = task_data->ErrorID;
+		data[KEY_ErrorMsg] = toUtf(task_data->ErrorMsg);
+		data[KEY_LongCustomerName] = toUtf(task_data->LongCustomerName);
+		releaseTaskData(task_data);
 	}
 	this->onRtnChangeAccountByBank(data);
 };
@@ -8117,6 +9031,7 @@ void FuturesTdApi::release()
 
 void FuturesTdApi::init()
 {
+	this->throttle.start();
 	this->active = true;
 	this->task_thread = thread(&FuturesTdApi::processTask, this);
 
@@ -8131,6 +9046,7 @@ int FuturesTdApi::join()
 
 int FuturesTdApi::exit()
 {
+	this->throttle.stop();
 	this->active = false;
 	this->task_queue.terminate();
 	this->task_thread.join();
@@ -8311,6 +9227,7 @@ int FuturesTdApi::reqOrderInsert(const dict &req, int reqid)
 	getString(req, "ClientID", myreq.ClientID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqOrderInsert(&myreq, reqid);
 	return i;
 };
@@ -8354,6 +9271,7 @@ int FuturesTdApi::reqParkedOrderInsert(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqParkedOrderInsert(&myreq, reqid);
 	return i;
 };
@@ -8384,6 +9302,7 @@ int FuturesTdApi::reqParkedOrderAction(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqParkedOrderAction(&myreq, reqid);
 	return i;
 };
@@ -8409,6 +9328,7 @@ int FuturesTdApi::reqOrderAction(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqOrderAction(&myreq, reqid);
 	return i;
 };
@@ -8426,6 +9346,8 @@ int FuturesTdApi::reqQueryMaxOrderVolume(const dict &req, int reqid)
 	getInt(req, "MaxVolume", &myreq.MaxVolume);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQueryMaxOrderVolume(&myreq, reqid); });
 	int i = this->api->ReqQueryMaxOrderVolume(&myreq, reqid);
 	return i;
 };
@@ -8465,6 +9387,7 @@ int FuturesTdApi::reqRemoveParkedOrderAction(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "ParkedOrderActionID", myreq.ParkedOrderActionID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqRemoveParkedOrderAction(&myreq, reqid);
 	return i;
 };
@@ -8494,6 +9417,7 @@ int FuturesTdApi::reqExecOrderInsert(const dict &req, int reqid)
 	getString(req, "ClientID", myreq.ClientID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqExecOrderInsert(&myreq, reqid);
 	return i;
 };
@@ -8517,6 +9441,7 @@ int FuturesTdApi::reqExecOrderAction(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqExecOrderAction(&myreq, reqid);
 	return i;
 };
@@ -8535,6 +9460,7 @@ int FuturesTdApi::reqForQuoteInsert(const dict &req, int reqid)
 	getString(req, "ClientID", myreq.ClientID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqForQuoteInsert(&myreq, reqid);
 	return i;
 };
@@ -8566,6 +9492,7 @@ int FuturesTdApi::reqQuoteInsert(const dict &req, int reqid)
 	getString(req, "ClientID", myreq.ClientID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqQuoteInsert(&myreq, reqid);
 	return i;
 };
@@ -8589,6 +9516,7 @@ int FuturesTdApi::reqQuoteAction(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqQuoteAction(&myreq, reqid);
 	return i;
 };
@@ -8608,6 +9536,7 @@ int FuturesTdApi::reqBatchOrderAction(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqBatchOrderAction(&myreq, reqid);
 	return i;
 };
@@ -8633,6 +9562,7 @@ int FuturesTdApi::reqOptionSelfCloseInsert(const dict &req, int reqid)
 	getString(req, "ClientID", myreq.ClientID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqOptionSelfCloseInsert(&myreq, reqid);
 	return i;
 };
@@ -8656,6 +9586,7 @@ int FuturesTdApi::reqOptionSelfCloseAction(const dict &req, int reqid)
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
+	this->throttle.acquire_order();
 	int i = this->api->ReqOptionSelfCloseAction(&myreq, reqid);
 	return i;
 };
@@ -8677,6 +9608,7 @@ int FuturesTdApi::reqCombActionInsert(const dict &req, int reqid)
 	getString(req, "IPAddress", myreq.IPAddress);
 	getString(req, "MacAddress", myreq.MacAddress);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqCombActionInsert(&myreq, reqid);
 	return i;
 };
@@ -8693,6 +9625,8 @@ int FuturesTdApi::reqQryOrder(const dict &req, int reqid)
 	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOrder(&myreq, reqid); });
 	int i = this->api->ReqQryOrder(&myreq, reqid);
 	return i;
 };
@@ -8709,6 +9643,8 @@ int FuturesTdApi::reqQryTrade(const dict &req, int reqid)
 	getString(req, "TradeTimeStart", myreq.TradeTimeStart);
 	getString(req, "TradeTimeEnd", myreq.TradeTimeEnd);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTrade(&myreq, reqid); });
 	int i = this->api->ReqQryTrade(&myreq, reqid);
 	return i;
 };
@@ -8722,6 +9658,8 @@ int FuturesTdApi::reqQryInvestorPosition(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInvestorPosition(&myreq, reqid); });
 	int i = this->api->ReqQryInvestorPosition(&myreq, reqid);
 	return i;
 };
@@ -8735,6 +9673,8 @@ int FuturesTdApi::reqQryTradingAccount(const dict &req, int reqid)
 	getString(req, "CurrencyID", myreq.CurrencyID);
 	getChar(req, "BizType", &myreq.BizType);
 	getString(req, "AccountID", myreq.AccountID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTradingAccount(&myreq, reqid); });
 	int i = this->api->ReqQryTradingAccount(&myreq, reqid);
 	return i;
 };
@@ -8745,6 +9685,8 @@ int FuturesTdApi::reqQryInvestor(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInvestor(&myreq, reqid); });
 	int i = this->api->ReqQryInvestor(&myreq, reqid);
 	return i;
 };
@@ -8759,6 +9701,8 @@ int FuturesTdApi::reqQryTradingCode(const dict &req, int reqid)
 	getString(req, "ClientID", myreq.ClientID);
 	getChar(req, "ClientIDType", &myreq.ClientIDType);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTradingCode(&myreq, reqid); });
 	int i = this->api->ReqQryTradingCode(&myreq, reqid);
 	return i;
 };
@@ -8773,6 +9717,8 @@ int FuturesTdApi::reqQryInstrumentMarginRate(const dict &req, int reqid)
 	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInstrumentMarginRate(&myreq, reqid); });
 	int i = this->api->ReqQryInstrumentMarginRate(&myreq, reqid);
 	return i;
 };
@@ -8786,6 +9732,8 @@ int FuturesTdApi::reqQryInstrumentCommissionRate(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInstrumentCommissionRate(&myreq, reqid); });
 	int i = this->api->ReqQryInstrumentCommissionRate(&myreq, reqid);
 	return i;
 };
@@ -8795,6 +9743,8 @@ int FuturesTdApi::reqQryExchange(const dict &req, int reqid)
 	CThostFtdcQryExchangeField myreq = CThostFtdcQryExchangeField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryExchange(&myreq, reqid); });
 	int i = this->api->ReqQryExchange(&myreq, reqid);
 	return i;
 };
@@ -8806,6 +9756,8 @@ int FuturesTdApi::reqQryProduct(const dict &req, int reqid)
 	getString(req, "ProductID", myreq.ProductID);
 	getChar(req, "ProductClass", &myreq.ProductClass);
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryProduct(&myreq, reqid); });
 	int i = this->api->ReqQryProduct(&myreq, reqid);
 	return i;
 };
@@ -8818,6 +9770,8 @@ int FuturesTdApi::reqQryInstrument(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "ExchangeInstID", myreq.ExchangeInstID);
 	getString(req, "ProductID", myreq.ProductID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInstrument(&myreq, reqid); });
 	int i = this->api->ReqQryInstrument(&myreq, reqid);
 	return i;
 };
@@ -8828,6 +9782,8 @@ int FuturesTdApi::reqQryDepthMarketData(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryDepthMarketData(&myreq, reqid); });
 	int i = this->api->ReqQryDepthMarketData(&myreq, reqid);
 	return i;
 };
@@ -8841,6 +9797,8 @@ int FuturesTdApi::reqQrySettlementInfo(const dict &req, int reqid)
 	getString(req, "TradingDay", myreq.TradingDay);
 	getString(req, "AccountID", myreq.AccountID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQrySettlementInfo(&myreq, reqid); });
 	int i = this->api->ReqQrySettlementInfo(&myreq, reqid);
 	return i;
 };
@@ -8851,6 +9809,8 @@ int FuturesTdApi::reqQryTransferBank(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BankID", myreq.BankID);
 	getString(req, "BankBrchID", myreq.BankBrchID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTransferBank(&myreq, reqid); });
 	int i = this->api->ReqQryTransferBank(&myreq, reqid);
 	return i;
 };
@@ -8864,6 +9824,8 @@ int FuturesTdApi::reqQryInvestorPositionDetail(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInvestorPositionDetail(&myreq, reqid); });
 	int i = this->api->ReqQryInvestorPositionDetail(&myreq, reqid);
 	return i;
 };
@@ -8873,6 +9835,8 @@ int FuturesTdApi::reqQryNotice(const dict &req, int reqid)
 	CThostFtdcQryNoticeField myreq = CThostFtdcQryNoticeField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryNotice(&myreq, reqid); });
 	int i = this->api->ReqQryNotice(&myreq, reqid);
 	return i;
 };
@@ -8885,6 +9849,8 @@ int FuturesTdApi::reqQrySettlementInfoConfirm(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "AccountID", myreq.AccountID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQrySettlementInfoConfirm(&myreq, reqid); });
 	int i = this->api->ReqQrySettlementInfoConfirm(&myreq, reqid);
 	return i;
 };
@@ -8898,6 +9864,8 @@ int FuturesTdApi::reqQryInvestorPositionCombineDetail(const dict &req, int reqid
 	getString(req, "CombInstrumentID", myreq.CombInstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInvestorPositionCombineDetail(&myreq, reqid); });
 	int i = this->api->ReqQryInvestorPositionCombineDetail(&myreq, reqid);
 	return i;
 };
@@ -8908,6 +9876,8 @@ int FuturesTdApi::reqQryCFMMCTradingAccountKey(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryCFMMCTradingAccountKey(&myreq, reqid); });
 	int i = this->api->ReqQryCFMMCTradingAccountKey(&myreq, reqid);
 	return i;
 };
@@ -8921,6 +9891,8 @@ int FuturesTdApi::reqQryEWarrantOffset(const dict &req, int reqid)
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryEWarrantOffset(&myreq, reqid); });
 	int i = this->api->ReqQryEWarrantOffset(&myreq, reqid);
 	return i;
 };
@@ -8935,6 +9907,8 @@ int FuturesTdApi::reqQryInvestorProductGroupMargin(const dict &req, int reqid)
 	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInvestorProductGroupMargin(&myreq, reqid); });
 	int i = this->api->ReqQryInvestorProductGroupMargin(&myreq, reqid);
 	return i;
 };
@@ -8947,6 +9921,8 @@ int FuturesTdApi::reqQryExchangeMarginRate(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryExchangeMarginRate(&myreq, reqid); });
 	int i = this->api->ReqQryExchangeMarginRate(&myreq, reqid);
 	return i;
 };
@@ -8958,6 +9934,8 @@ int FuturesTdApi::reqQryExchangeMarginRateAdjust(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryExchangeMarginRateAdjust(&myreq, reqid); });
 	int i = this->api->ReqQryExchangeMarginRateAdjust(&myreq, reqid);
 	return i;
 };
@@ -8969,6 +9947,8 @@ int FuturesTdApi::reqQryExchangeRate(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "FromCurrencyID", myreq.FromCurrencyID);
 	getString(req, "ToCurrencyID", myreq.ToCurrencyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryExchangeRate(&myreq, reqid); });
 	int i = this->api->ReqQryExchangeRate(&myreq, reqid);
 	return i;
 };
@@ -8981,6 +9961,8 @@ int FuturesTdApi::reqQrySecAgentACIDMap(const dict &req, int reqid)
 	getString(req, "UserID", myreq.UserID);
 	getString(req, "AccountID", myreq.AccountID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQrySecAgentACIDMap(&myreq, reqid); });
 	int i = this->api->ReqQrySecAgentACIDMap(&myreq, reqid);
 	return i;
 };
@@ -8991,6 +9973,8 @@ int FuturesTdApi::reqQryProductExchRate(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ProductID", myreq.ProductID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryProductExchRate(&myreq, reqid); });
 	int i = this->api->ReqQryProductExchRate(&myreq, reqid);
 	return i;
 };
@@ -9001,6 +9985,8 @@ int FuturesTdApi::reqQryProductGroup(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "ProductID", myreq.ProductID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryProductGroup(&myreq, reqid); });
 	int i = this->api->ReqQryProductGroup(&myreq, reqid);
 	return i;
 };
@@ -9012,6 +9998,8 @@ int FuturesTdApi::reqQryMMInstrumentCommissionRate(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryMMInstrumentCommissionRate(&myreq, reqid); });
 	int i = this->api->ReqQryMMInstrumentCommissionRate(&myreq, reqid);
 	return i;
 };
@@ -9023,6 +10011,8 @@ int FuturesTdApi::reqQryMMOptionInstrCommRate(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryMMOptionInstrCommRate(&myreq, reqid); });
 	int i = this->api->ReqQryMMOptionInstrCommRate(&myreq, reqid);
 	return i;
 };
@@ -9034,6 +10024,8 @@ int FuturesTdApi::reqQryInstrumentOrderCommRate(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInstrumentOrderCommRate(&myreq, reqid); });
 	int i = this->api->ReqQryInstrumentOrderCommRate(&myreq, reqid);
 	return i;
 };
@@ -9047,6 +10039,8 @@ int FuturesTdApi::reqQrySecAgentTradingAccount(const dict &req, int reqid)
 	getString(req, "CurrencyID", myreq.CurrencyID);
 	getChar(req, "BizType", &myreq.BizType);
 	getString(req, "AccountID", myreq.AccountID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQrySecAgentTradingAccount(&myreq, reqid); });
 	int i = this->api->ReqQrySecAgentTradingAccount(&myreq, reqid);
 	return i;
 };
@@ -9057,6 +10051,8 @@ int FuturesTdApi::reqQrySecAgentCheckMode(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQrySecAgentCheckMode(&myreq, reqid); });
 	int i = this->api->ReqQrySecAgentCheckMode(&myreq, reqid);
 	return i;
 };
@@ -9073,6 +10069,8 @@ int FuturesTdApi::reqQryOptionInstrTradeCost(const dict &req, int reqid)
 	getDouble(req, "UnderlyingPrice", &myreq.UnderlyingPrice);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOptionInstrTradeCost(&myreq, reqid); });
 	int i = this->api->ReqQryOptionInstrTradeCost(&myreq, reqid);
 	return i;
 };
@@ -9086,6 +10084,8 @@ int FuturesTdApi::reqQryOptionInstrCommRate(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOptionInstrCommRate(&myreq, reqid); });
 	int i = this->api->ReqQryOptionInstrCommRate(&myreq, reqid);
 	return i;
 };
@@ -9101,6 +10101,8 @@ int FuturesTdApi::reqQryExecOrder(const dict &req, int reqid)
 	getString(req, "ExecOrderSysID", myreq.ExecOrderSysID);
 	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryExecOrder(&myreq, reqid); });
 	int i = this->api->ReqQryExecOrder(&myreq, reqid);
 	return i;
 };
@@ -9116,6 +10118,8 @@ int FuturesTdApi::reqQryForQuote(const dict &req, int reqid)
 	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryForQuote(&myreq, reqid); });
 	int i = this->api->ReqQryForQuote(&myreq, reqid);
 	return i;
 };
@@ -9132,6 +10136,8 @@ int FuturesTdApi::reqQryQuote(const dict &req, int reqid)
 	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryQuote(&myreq, reqid); });
 	int i = this->api->ReqQryQuote(&myreq, reqid);
 	return i;
 };
@@ -9147,6 +10153,8 @@ int FuturesTdApi::reqQryOptionSelfClose(const dict &req, int reqid)
 	getString(req, "OptionSelfCloseSysID", myreq.OptionSelfCloseSysID);
 	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
 	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOptionSelfClose(&myreq, reqid); });
 	int i = this->api->ReqQryOptionSelfClose(&myreq, reqid);
 	return i;
 };
@@ -9158,6 +10166,8 @@ int FuturesTdApi::reqQryInvestUnit(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryInvestUnit(&myreq, reqid); });
 	int i = this->api->ReqQryInvestUnit(&myreq, reqid);
 	return i;
 };
@@ -9169,6 +10179,8 @@ int FuturesTdApi::reqQryCombInstrumentGuard(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryCombInstrumentGuard(&myreq, reqid); });
 	int i = this->api->ReqQryCombInstrumentGuard(&myreq, reqid);
 	return i;
 };
@@ -9182,6 +10194,8 @@ int FuturesTdApi::reqQryCombAction(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryCombAction(&myreq, reqid); });
 	int i = this->api->ReqQryCombAction(&myreq, reqid);
 	return i;
 };
@@ -9194,6 +10208,8 @@ int FuturesTdApi::reqQryTransferSerial(const dict &req, int reqid)
 	getString(req, "AccountID", myreq.AccountID);
 	getString(req, "BankID", myreq.BankID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTransferSerial(&myreq, reqid); });
 	int i = this->api->ReqQryTransferSerial(&myreq, reqid);
 	return i;
 };
@@ -9207,6 +10223,8 @@ int FuturesTdApi::reqQryAccountregister(const dict &req, int reqid)
 	getString(req, "BankID", myreq.BankID);
 	getString(req, "BankBranchID", myreq.BankBranchID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryAccountregister(&myreq, reqid); });
 	int i = this->api->ReqQryAccountregister(&myreq, reqid);
 	return i;
 };
@@ -9218,6 +10236,8 @@ int FuturesTdApi::reqQryContractBank(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "BankID", myreq.BankID);
 	getString(req, "BankBrchID", myreq.BankBrchID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryContractBank(&myreq, reqid); });
 	int i = this->api->ReqQryContractBank(&myreq, reqid);
 	return i;
 };
@@ -9231,6 +10251,8 @@ int FuturesTdApi::reqQryParkedOrder(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryParkedOrder(&myreq, reqid); });
 	int i = this->api->ReqQryParkedOrder(&myreq, reqid);
 	return i;
 };
@@ -9244,6 +10266,8 @@ int FuturesTdApi::reqQryParkedOrderAction(const dict &req, int reqid)
 	getString(req, "InstrumentID", myreq.InstrumentID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryParkedOrderAction(&myreq, reqid); });
 	int i = this->api->ReqQryParkedOrderAction(&myreq, reqid);
 	return i;
 };
@@ -9255,6 +10279,8 @@ int FuturesTdApi::reqQryTradingNotice(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTradingNotice(&myreq, reqid); });
 	int i = this->api->ReqQryTradingNotice(&myreq, reqid);
 	return i;
 };
@@ -9267,6 +10293,8 @@ int FuturesTdApi::reqQryBrokerTradingParams(const dict &req, int reqid)
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "CurrencyID", myreq.CurrencyID);
 	getString(req, "AccountID", myreq.AccountID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryBrokerTradingParams(&myreq, reqid); });
 	int i = this->api->ReqQryBrokerTradingParams(&myreq, reqid);
 	return i;
 };
@@ -9278,6 +10306,8 @@ int FuturesTdApi::reqQryBrokerTradingAlgos(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "ExchangeID", myreq.ExchangeID);
 	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryBrokerTradingAlgos(&myreq, reqid); });
 	int i = this->api->ReqQryBrokerTradingAlgos(&myreq, reqid);
 	return i;
 };
@@ -9289,6 +10319,8 @@ int FuturesTdApi::reqQueryCFMMCTradingAccountToken(const dict &req, int reqid)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "InvestorID", myreq.InvestorID);
 	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQueryCFMMCTradingAccountToken(&myreq, reqid); });
 	int i = this->api->ReqQueryCFMMCTradingAccountToken(&myreq, reqid);
 	return i;
 };
@@ -9438,10 +10470,195 @@ int FuturesTdApi::reqQueryBankAccountMoneyByFuture(const dict &req, int reqid)
 	getInt(req, "RequestID", &myreq.RequestID);
 	getInt(req, "TID", &myreq.TID);
 	getString(req, "LongCustomerName", myreq.LongCustomerName);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQueryBankAccountMoneyByFuture(&myreq, reqid); });
 	int i = this->api->ReqQueryBankAccountMoneyByFuture(&myreq, reqid);
 	return i;
 };
 
+dict FuturesTdApi::getQueueStats()
+{
+	dict stats = this->task_stats.to_dict(TASK_NAMES, sizeof(TASK_NAMES) / sizeof(TASK_NAMES[0]));
+	stats["depth"] = this->task_queue.depth();
+	stats["high_water"] = this->task_queue.high_water();
+	return stats;
+};
+
+void FuturesTdApi::setRequestLimit(double rate, int burst, int reserve)
+{
+	//rate为每秒请求数，burst为允许的突发请求数，reserve为查询请求不可占用、留给委托撤单的令牌数
+	this->throttle.set_limit(rate, burst, reserve);
+};
+
+dict FuturesTdApi::getThrottleStats()
+{
+	return this->throttle.to_dict();
+};
+
+void FuturesTdApi::setOrderInsertTemplate(const dict &req)
+{
+	//设置报单请求中固定不变的字段，例如经纪商、投资者代码和投机套保标志等
+	CThostFtdcInputOrderField myreq = CThostFtdcInputOrderField();
+	memset(&myreq, 0, sizeof(myreq));
+	getString(req, "BrokerID", myreq.BrokerID);
+	getString(req, "InvestorID", myreq.InvestorID);
+	getString(req, "UserID", myreq.UserID);
+	getString(req, "CombHedgeFlag", myreq.CombHedgeFlag);
+	getString(req, "GTDDate", myreq.GTDDate);
+	getInt(req, "MinVolume", &myreq.MinVolume);
+	getChar(req, "ContingentCondition", &myreq.ContingentCondition);
+	getDouble(req, "StopPrice", &myreq.StopPrice);
+	getChar(req, "ForceCloseReason", &myreq.ForceCloseReason);
+	getInt(req, "IsAutoSuspend", &myreq.IsAutoSuspend);
+	getString(req, "BusinessUnit", myreq.BusinessUnit);
+	getInt(req, "UserForceClose", &myreq.UserForceClose);
+	getInt(req, "IsSwapOrder", &myreq.IsSwapOrder);
+	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	getString(req, "AccountID", myreq.AccountID);
+	getString(req, "CurrencyID", myreq.CurrencyID);
+	getString(req, "ClientID", myreq.ClientID);
+	getString(req, "IPAddress", myreq.IPAddress);
+	getString(req, "MacAddress", myreq.MacAddress);
+
+	//重新登录后模板编号保持不变，已生成的报单模板只更新基础字段，保留各自的合约、方向和价格条件
+	for (CThostFtdcInputOrderField &item : this->order_templates)
+	{
+		CThostFtdcInputOrderField updated = myreq;
+		memcpy(updated.InstrumentID, item.InstrumentID, sizeof(updated.InstrumentID));
+		memcpy(updated.ExchangeID, item.ExchangeID, sizeof(updated.ExchangeID));
+		memcpy(updated.CombOffsetFlag, item.CombOffsetFlag, sizeof(updated.CombOffsetFlag));
+		updated.OrderPriceType = item.OrderPriceType;
+		updated.Direction = item.Direction;
+		updated.TimeCondition = item.TimeCondition;
+		updated.VolumeCondition = item.VolumeCondition;
+
+		//模板中单独指定过的套保标志和最小成交量不被基础模板覆盖
+		if (memcmp(item.CombHedgeFlag, this->order_template.CombHedgeFlag, sizeof(item.CombHedgeFlag)))
+			memcpy(updated.CombHedgeFlag, item.CombHedgeFlag, sizeof(updated.CombHedgeFlag));
+		if (item.MinVolume != this->order_template.MinVolume)
+			updated.MinVolume = item.MinVolume;
+
+		item = updated;
+	}
+
+	this->order_template = myreq;
+};
+
+int FuturesTdApi::addOrderTemplate(const dict &req)
+{
+	//在报单模板基础上填写合约、方向、开平和价格条件等字段，返回模板编号
+	CThostFtdcInputOrderField myreq = this->order_template;
+	getString(req, "InstrumentID", myreq.InstrumentID);
+	getString(req, "ExchangeID", myreq.ExchangeID);
+	getChar(req, "OrderPriceType", &myreq.OrderPriceType);
+	getChar(req, "Direction", &myreq.Direction);
+	getString(req, "CombOffsetFlag", myreq.CombOffsetFlag);
+	getString(req, "CombHedgeFlag", myreq.CombHedgeFlag);
+	getChar(req, "TimeCondition", &myreq.TimeCondition);
+	getChar(req, "VolumeCondition", &myreq.VolumeCondition);
+	getInt(req, "MinVolume", &myreq.MinVolume);
+	this->order_templates.push_back(myreq);
+	return (int)this->order_templates.size() - 1;
+};
+
+int FuturesTdApi::reqOrderInsertByTemplate(int template_id, double price, int volume, string order_ref, int reqid)
+{
+	if (template_id < 0 || template_id >= (int)this->order_templates.size())
+		throw index_error("invalid order template id");
+
+	//只需填写价格、数量和报单引用
+	CThostFtdcInputOrderField myreq = this->order_templates[template_id];
+	setString(myreq.OrderRef, order_ref);
+	myreq.LimitPrice = price;
+	myreq.VolumeTotalOriginal = volume;
+	this->throttle.acquire_order();
+	int i = this->api->ReqOrderInsert(&myreq, reqid);
+	return i;
+};
+
+pybind11::list FuturesTdApi::reqOrderInsertBatch(const pybind11::list &orders, int reqid)
+{
+	//每个元素为(模板编号, 价格, 数量, 报单引用)，先在持有GIL时全部转换为原生结构体
+	vector<CThostFtdcInputOrderField> reqs;
+	reqs.reserve(orders.size());
+
+	for (handle item : orders)
+	{
+		pybind11::tuple order = item.cast<pybind11::tuple>();
+
+		int template_id = order[0].cast<int>();
+		if (template_id < 0 || template_id >= (int)this->order_templates.size())
+			throw index_error("invalid order template id");
+
+		CThostFtdcInputOrderField myreq = this->order_templates[template_id];
+		myreq.LimitPrice = order[1].cast<double>();
+		myreq.VolumeTotalOriginal = order[2].cast<int>();
+		setString(myreq.OrderRef, order[3].cast<string>());
+		reqs.push_back(myreq);
+	}
+
+	//发送期间释放GIL，请求编号从reqid开始依次递增
+	vector<int> results(reqs.size());
+	{
+		gil_scoped_release release;
+		for (size_t n = 0; n < reqs.size(); n++)
+		{
+			this->throttle.wait_order();
+			results[n] = this->api->ReqOrderInsert(&reqs[n], reqid + (int)n);
+		}
+	}
+
+	pybind11::list data;
+	for (int i : results)
+	{
+		data.append(i);
+	}
+	return data;
+};
+
+pybind11::list FuturesTdApi::reqOrderActionBatch(const pybind11::list &orders, int reqid)
+{
+	//每个元素为(合约代码, 交易所代码, 报单引用, 前置编号, 会话编号)，经纪商和投资者代码取自报单模板
+	vector<CThostFtdcInputOrderActionField> reqs;
+	reqs.reserve(orders.size());
+
+	for (handle item : orders)
+	{
+		pybind11::tuple order = item.cast<pybind11::tuple>();
+
+		CThostFtdcInputOrderActionField myreq = CThostFtdcInputOrderActionField();
+		memset(&myreq, 0, sizeof(myreq));
+		memcpy(myreq.BrokerID, this->order_template.BrokerID, sizeof(myreq.BrokerID));
+		memcpy(myreq.InvestorID, this->order_template.InvestorID, sizeof(myreq.InvestorID));
+		memcpy(myreq.UserID, this->order_template.UserID, sizeof(myreq.UserID));
+		setString(myreq.InstrumentID, order[0].cast<string>());
+		setString(myreq.ExchangeID, order[1].cast<string>());
+		setString(myreq.OrderRef, order[2].cast<string>());
+		myreq.FrontID = order[3].cast<int>();
+		myreq.SessionID = order[4].cast<int>();
+		myreq.ActionFlag = THOST_FTDC_AF_Delete;
+		reqs.push_back(myreq);
+	}
+
+	//发送期间释放GIL，请求编号从reqid开始依次递增
+	vector<int> results(reqs.size());
+	{
+		gil_scoped_release release;
+		for (size_t n = 0; n < reqs.size(); n++)
+		{
+			this->throttle.wait_order();
+			results[n] = this->api->ReqOrderAction(&reqs[n], reqid + (int)n);
+		}
+	}
+
+	pybind11::list data;
+	for (int i : results)
+	{
+		data.append(i);
+	}
+	return data;
+};
+
 ///-------------------------------------------------------------------------------------
 ///Boost.Python封装
 ///-------------------------------------------------------------------------------------
@@ -10919,6 +12136,8 @@ public:
 
 PYBIND11_MODULE(vnnhfutures, m)
 {
+	initDictKeys();
+
 	class_<FuturesTdApi, PyFuturesTdApi> FuturesTdApi(m, "FuturesTdApi", module_local());
 	FuturesTdApi
 		.def(init<>())
@@ -10928,6 +12147,9 @@ PYBIND11_MODULE(vnnhfutures, m)
 		.def("init", &FuturesTdApi::init)
 		.def("join", &FuturesTdApi::join)
 		.def("exit", &FuturesTdApi::exit)
+		.def("getQueueStats", &FuturesTdApi::getQueueStats)
+		.def("setRequestLimit", &FuturesTdApi::setRequestLimit)
+		.def("getThrottleStats", &FuturesTdApi::getThrottleStats)
 		.def("getTradingDay", &FuturesTdApi::getTradingDay)
 		.def("registerFront", &FuturesTdApi::registerFront)
 		.def("registerNameServer", &FuturesTdApi::registerNameServer)
@@ -10942,6 +12164,11 @@ PYBIND11_MODULE(vnnhfutures, m)
 		.def("reqUserLogin2", &FuturesTdApi::reqUserLogin2)
 		.def("reqUserPasswordUpdate2", &FuturesTdApi::reqUserPasswordUpdate2)
 		.def("reqOrderInsert", &FuturesTdApi::reqOrderInsert)
+		.def("setOrderInsertTemplate", &FuturesTdApi::setOrderInsertTemplate)
+		.def("addOrderTemplate", &FuturesTdApi::addOrderTemplate)
+		.def("reqOrderInsertByTemplate", &FuturesTdApi::reqOrderInsertByTemplate)
+		.def("reqOrderInsertBatch", &FuturesTdApi::reqOrderInsertBatch)
+		.def("reqOrderActionBatch", &FuturesTdApi::reqOrderActionBatch)
 		.def("reqParkedOrderInsert", &FuturesTdApi::reqParkedOrderInsert)
 		.def("reqParkedOrderAction", &FuturesTdApi::reqParkedOrderAction)
 		.def("reqOrderAction", &FuturesTdApi::reqOrderAction)
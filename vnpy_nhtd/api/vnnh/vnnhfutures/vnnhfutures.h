@@ -136,6 +136,132 @@ using namespace nhtd;
 #define ONRTNCANCELACCOUNTBYBANK 120
 #define ONRTNCHANGEACCOUNTBYBANK 121
 
+//صƣ˳
+static const char *TASK_NAMES[] = {
+	"onFrontConnected",
+	"onFrontDisconnected",
+	"onHeartBeatWarning",
+	"onRspAuthenticate",
+	"onRspUserLogin",
+	"onRspUserLogout",
+	"onRspUserPasswordUpdate",
+	"onRspTradingAccountPasswordUpdate",
+	"onRspOrderInsert",
+	"onRspParkedOrderInsert",
+	"onRspParkedOrderAction",
+	"onRspOrderAction",
+	"onRspQueryMaxOrderVolume",
+	"onRspSettlementInfoConfirm",
+	"onRspRemoveParkedOrder",
+	"onRspRemoveParkedOrderAction",
+	"onRspExecOrderInsert",
+	"onRspExecOrderAction",
+	"onRspForQuoteInsert",
+	"onRspQuoteInsert",
+	"onRspQuoteAction",
+	"onRspBatchOrderAction",
+	"onRspOptionSelfCloseInsert",
+	"onRspOptionSelfCloseAction",
+	"onRspCombActionInsert",
+	"onRspQryOrder",
+	"onRspQryTrade",
+	"onRspQryInvestorPosition",
+	"onRspQryTradingAccount",
+	"onRspQryInvestor",
+	"onRspQryTradingCode",
+	"onRspQryInstrumentMarginRate",
+	"onRspQryInstrumentCommissionRate",
+	"onRspQryExchange",
+	"onRspQryProduct",
+	"onRspQryInstrument",
+	"onRspQryDepthMarketData",
+	"onRspQrySettlementInfo",
+	"onRspQryTransferBank",
+	"onRspQryInvestorPositionDetail",
+	"onRspQryNotice",
+	"onRspQrySettlementInfoConfirm",
+	"onRspQryInvestorPositionCombineDetail",
+	"onRspQryCFMMCTradingAccountKey",
+	"onRspQryEWarrantOffset",
+	"onRspQryInvestorProductGroupMargin",
+	"onRspQryExchangeMarginRate",
+	"onRspQryExchangeMarginRateAdjust",
+	"onRspQryExchangeRate",
+	"onRspQrySecAgentACIDMap",
+	"onRspQryProductExchRate",
+	"onRspQryProductGroup",
+	"onRspQryMMInstrumentCommissionRate",
+	"onRspQryMMOptionInstrCommRate",
+	"onRspQryInstrumentOrderCommRate",
+	"onRspQrySecAgentTradingAccount",
+	"onRspQrySecAgentCheckMode",
+	"onRspQryOptionInstrTradeCost",
+	"onRspQryOptionInstrCommRate",
+	"onRspQryExecOrder",
+	"onRspQryForQuote",
+	"onRspQryQuote",
+	"onRspQryOptionSelfClose",
+	"onRspQryInvestUnit",
+	"onRspQryCombInstrumentGuard",
+	"onRspQryCombAction",
+	"onRspQryTransferSerial",
+	"onRspQryAccountregister",
+	"onRspForQuote",
+	"onRspError",
+	"onRtnOrder",
+	"onRtnTrade",
+	"onErrRtnOrderInsert",
+	"onErrRtnOrderAction",
+	"onRtnInstrumentStatus",
+	"onRtnBulletin",
+	"onRtnTradingNotice",
+	"onRtnErrorConditionalOrder",
+	"onRtnExecOrder",
+	"onErrRtnExecOrderInsert",
+	"onErrRtnExecOrderAction",
+	"onErrRtnForQuoteInsert",
+	"onRtnQuote",
+	"onErrRtnQuoteInsert",
+	"onErrRtnQuoteAction",
+	"onRtnForQuote",
+	"onRtnCFMMCTradingAccountToken",
+	"onErrRtnBatchOrderAction",
+	"onRtnOptionSelfClose",
+	"onErrRtnOptionSelfCloseInsert",
+	"onErrRtnOptionSelfCloseAction",
+	"onRtnCombAction",
+	"onErrRtnCombActionInsert",
+	"onRspQryContractBank",
+	"onRspQryParkedOrder",
+	"onRspQryParkedOrderAction",
+	"onRspQryTradingNotice",
+	"onRspQryBrokerTradingParams",
+	"onRspQryBrokerTradingAlgos",
+	"onRspQueryCFMMCTradingAccountToken",
+	"onRtnFromBankToFutureByBank",
+	"onRtnFromFutureToBankByBank",
+	"onRtnRepealFromBankToFutureByBank",
+	"onRtnRepealFromFutureToBankByBank",
+	"onRtnFromBankToFutureByFuture",
+	"onRtnFromFutureToBankByFuture",
+	"onRtnRepealFromBankToFutureByFutureManual",
+	"onRtnRepealFromFutureToBankByFutureManual",
+	"onRtnQueryBankBalanceByFuture",
+	"onErrRtnBankToFutureByFuture",
+	"onErrRtnFutureToBankByFuture",
+	"onErrRtnRepealBankToFutureByFutureManual",
+	"onErrRtnRepealFutureToBankByFutureManual",
+	"onErrRtnQueryBankBalanceByFuture",
+	"onRtnRepealFromBankToFutureByFuture",
+	"onRtnRepealFromFutureToBankByFuture",
+	"onRspFromBankToFutureByFuture",
+	"onRspFromFutureToBankByFuture",
+	"onRspQueryBankAccountMoneyByFuture",
+	"onRtnOpenAccountByBank",
+	"onRtnCancelAccountByBank",
+	"onRtnChangeAccountByBank",
+};
+
 
 ///-------------------------------------------------------------------------------------
 ///C++ SPIĻصʵ
@@ -148,6 +274,11 @@ private:
 	CThostFtdcTraderApi* api;			//API
 	thread task_thread;					//ָ߳루pythonݣ
 	TaskQueue task_queue;			    //
+	TaskStats task_stats;				//ͳ
+	RequestThrottle throttle;			//
+
+	CThostFtdcInputOrderField order_template = CThostFtdcInputOrderField();	//ģ
+	vector<CThostFtdcInputOrderField> order_templates;	//Լ򡢿ƽԤõı
 	bool active = false;				//״̬
 
 public:
@@ -1059,6 +1190,12 @@ public:
 
 	int exit();
 
+	dict getQueueStats();
+
+	void setRequestLimit(double rate, int burst, int reserve);
+
+	dict getThrottleStats();
+
 	string getTradingDay();
 
 	void registerFront(string address);
@@ -1224,4 +1361,14 @@ public:
 	int reqFromFutureToBankByFuture(const dict &req, int reqid);
 
 	int reqQueryBankAccountMoneyByFuture(const dict &req, int reqid);
+
+	void setOrderInsertTemplate(const dict &req);
+
+	int addOrderTemplate(const dict &req);
+
+	int reqOrderInsertByTemplate(int template_id, double price, int volume, string order_ref, int reqid);
+
+	pybind11::list reqOrderInsertBatch(const pybind11::list &orders, int reqid);
+
+	pybind11::list reqOrderActionBatch(const pybind11::list &orders, int reqid);
 };
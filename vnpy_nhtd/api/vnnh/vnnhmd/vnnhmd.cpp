@@ -4,6 +4,236 @@
 #include "vnnhmd.h"
 
 
+///-------------------------------------------------------------------------------------
+///Python字典键，在模块导入时创建一次并重复使用
+///-------------------------------------------------------------------------------------
+
+static handle KEY_error_code;
+static handle KEY_error_message;
+static handle KEY_response_code;
+static handle KEY_response_string;
+static handle KEY_utp_server_id;
+static handle KEY_oms_server_id;
+static handle KEY_trading_day;
+static handle KEY_update_time;
+static handle KEY_update_millisec;
+static handle KEY_update_sequence;
+static handle KEY_instrument_id;
+static handle KEY_exchange_id;
+static handle KEY_exchange_inst_id;
+static handle KEY_instrument_status;
+static handle KEY_last_price;
+static handle KEY_volume;
+static handle KEY_last_volume;
+static handle KEY_turnover;
+static handle KEY_open_interest;
+static handle KEY_open_price;
+static handle KEY_highest_price;
+static handle KEY_lowest_price;
+static handle KEY_close_price;
+static handle KEY_settlement_price;
+static handle KEY_average_price;
+static handle KEY_change_price;
+static handle KEY_change_markup;
+static handle KEY_change_swing;
+static handle KEY_upper_limit_price;
+static handle KEY_lower_limit_price;
+static handle KEY_pre_settlement_price;
+static handle KEY_pre_close_price;
+static handle KEY_pre_open_interest;
+static handle KEY_pre_delta;
+static handle KEY_curr_delta;
+static handle KEY_best_ask_price;
+static handle KEY_best_ask_volume;
+static handle KEY_best_bid_price;
+static handle KEY_best_bid_volume;
+static handle KEY_ask_price1;
+static handle KEY_ask_volume1;
+static handle KEY_bid_price1;
+static handle KEY_bid_volume1;
+static handle KEY_ask_price2;
+static handle KEY_ask_volume2;
+static handle KEY_bid_price2;
+static handle KEY_bid_volume2;
+static handle KEY_ask_price3;
+static handle KEY_ask_volume3;
+static handle KEY_bid_price3;
+static handle KEY_bid_volume3;
+static handle KEY_ask_price4;
+static handle KEY_ask_volume4;
+static handle KEY_bid_price4;
+static handle KEY_bid_volume4;
+static handle KEY_ask_price5;
+static handle KEY_ask_volume5;
+static handle KEY_bid_price5;
+static handle KEY_bid_volume5;
+static handle KEY_ask_price6;
+static handle KEY_ask_volume6;
+static handle KEY_bid_price6;
+static handle KEY_bid_volume6;
+static handle KEY_ask_price7;
+static handle KEY_ask_volume7;
+static handle KEY_bid_price7;
+static handle KEY_bid_volume7;
+static handle KEY_ask_price8;
+static handle KEY_ask_volume8;
+static handle KEY_bid_price8;
+static handle KEY_bid_volume8;
+static handle KEY_ask_price9;
+static handle KEY_ask_volume9;
+static handle KEY_bid_price9;
+static handle KEY_bid_volume9;
+static handle KEY_ask_price10;
+static handle KEY_ask_volume10;
+static handle KEY_bid_price10;
+static handle KEY_bid_volume10;
+static handle KEY_md_source;
+static handle KEY_session_public_key;
+static handle KEY_utp_checking_server_id;
+static handle KEY_utp_checking_server_time;
+static handle KEY_last_login_ip_address;
+static handle KEY_last_login_time;
+static handle KEY_session_encrypted;
+static handle KEY_routing_key;
+static handle KEY_exchange_name;
+static handle KEY_exchange_status;
+static handle KEY_product_id;
+static handle KEY_product_name;
+static handle KEY_product_class;
+static handle KEY_instrument_name;
+static handle KEY_instrument_class;
+static handle KEY_delivery_year;
+static handle KEY_delivery_month;
+static handle KEY_volume_multiple;
+static handle KEY_price_tick;
+static handle KEY_price_tick_dividend;
+static handle KEY_max_marketorder_volume;
+static handle KEY_min_marketorder_volume;
+static handle KEY_max_limitorder_volume;
+static handle KEY_min_limitorder_volume;
+static handle KEY_create_date;
+static handle KEY_open_date;
+static handle KEY_expire_date;
+static handle KEY_last_trading_date;
+static handle KEY_start_delivery_date;
+static handle KEY_end_delivery_date;
+static handle KEY_first_notice_date;
+
+void initDictKeys()
+{
+	KEY_error_code = PyUnicode_InternFromString("error_code");
+	KEY_error_message = PyUnicode_InternFromString("error_message");
+	KEY_response_code = PyUnicode_InternFromString("response_code");
+	KEY_response_string = PyUnicode_InternFromString("response_string");
+	KEY_utp_server_id = PyUnicode_InternFromString("utp_server_id");
+	KEY_oms_server_id = PyUnicode_InternFromString("oms_server_id");
+	KEY_trading_day = PyUnicode_InternFromString("trading_day");
+	KEY_update_time = PyUnicode_InternFromString("update_time");
+	KEY_update_millisec = PyUnicode_InternFromString("update_millisec");
+	KEY_update_sequence = PyUnicode_InternFromString("update_sequence");
+	KEY_instrument_id = PyUnicode_InternFromString("instrument_id");
+	KEY_exchange_id = PyUnicode_InternFromString("exchange_id");
+	KEY_exchange_inst_id = PyUnicode_InternFromString("exchange_inst_id");
+	KEY_instrument_status = PyUnicode_InternFromString("instrument_status");
+	KEY_last_price = PyUnicode_InternFromString("last_price");
+	KEY_volume = PyUnicode_InternFromString("volume");
+	KEY_last_volume = PyUnicode_InternFromString("last_volume");
+	KEY_turnover = PyUnicode_InternFromString("turnover");
+	KEY_open_interest = PyUnicode_InternFromString("open_interest");
+	KEY_open_price = PyUnicode_InternFromString("open_price");
+	KEY_highest_price = PyUnicode_InternFromString("highest_price");
+	KEY_lowest_price = PyUnicode_InternFromString("lowest_price");
+	KEY_close_price = PyUnicode_InternFromString("close_price");
+	KEY_settlement_price = PyUnicode_InternFromString("settlement_price");
+	KEY_average_price = PyUnicode_InternFromString("average_price");
+	KEY_change_price = PyUnicode_InternFromString("change_price");
+	KEY_change_markup = PyUnicode_InternFromString("change_markup");
+	KEY_change_swing = PyUnicode_InternFromString("change_swing");
+	KEY_upper_limit_price = PyUnicode_InternFromString("upper_limit_price");
+	KEY_lower_limit_price = PyUnicode_InternFromString("lower_limit_price");
+	KEY_pre_settlement_price = PyUnicode_InternFromString("pre_settlement_price");
+	KEY_pre_close_price = PyUnicode_InternFromString("pre_close_price");
+	KEY_pre_open_interest = PyUnicode_InternFromString("pre_open_interest");
+	KEY_pre_delta = PyUnicode_InternFromString("pre_delta");
+	KEY_curr_delta = PyUnicode_InternFromString("curr_delta");
+	KEY_best_ask_price = PyUnicode_InternFromString("best_ask_price");
+	KEY_best_ask_volume = PyUnicode_InternFromString("best_ask_volume");
+	KEY_best_bid_price = PyUnicode_InternFromString("best_bid_price");
+	KEY_best_bid_volume = PyUnicode_InternFromString("best_bid_volume");
+	KEY_ask_price1 = PyUnicode_InternFromString("ask_price1");
+	KEY_ask_volume1 = PyUnicode_InternFromString("ask_volume1");
+	KEY_bid_price1 = PyUnicode_InternFromString("bid_price1");
+	KEY_bid_volume1 = PyUnicode_InternFromString("bid_volume1");
+	KEY_ask_price2 = PyUnicode_InternFromString("ask_price2");
+	KEY_ask_volume2 = PyUnicode_InternFromString("ask_volume2");
+	KEY_bid_price2 = PyUnicode_InternFromString("bid_price2");
+	KEY_bid_volume2 = PyUnicode_InternFromString("bid_volume2");
+	KEY_ask_price3 = PyUnicode_InternFromString("ask_price3");
+	KEY_ask_volume3 = PyUnicode_InternFromString("ask_volume3");
+	KEY_bid_price3 = PyUnicode_InternFromString("bid_price3");
+	KEY_bid_volume3 = PyUnicode_InternFromString("bid_volume3");
+	KEY_ask_price4 = PyUnicode_InternFromString("ask_price4");
+	KEY_ask_volume4 = PyUnicode_InternFromString("ask_volume4");
+	KEY_bid_price4 = PyUnicode_InternFromString("bid_price4");
+	KEY_bid_volume4 = PyUnicode_InternFromString("bid_volume4");
+	KEY_ask_price5 = PyUnicode_InternFromString("ask_price5");
+	KEY_ask_volume5 = PyUnicode_InternFromString("ask_volume5");
+	KEY_bid_price5 = PyUnicode_InternFromString("bid_price5");
+	KEY_bid_volume5 = PyUnicode_InternFromString("bid_volume5");
+	KEY_ask_price6 = PyUnicode_InternFromString("ask_price6");
+	KEY_ask_volume6 = PyUnicode_InternFromString("ask_volume6");
+	KEY_bid_price6 = PyUnicode_InternFromString("bid_price6");
+	KEY_bid_volume6 = PyUnicode_InternFromString("bid_volume6");
+	KEY_ask_price7 = PyUnicode_InternFromString("ask_price7");
+	KEY_ask_volume7 = PyUnicode_InternFromString("ask_volume7");
+	KEY_bid_price7 = PyUnicode_InternFromString("bid_price7");
+	KEY_bid_volume7 = PyUnicode_InternFromString("bid_volume7");
+	KEY_ask_price8 = PyUnicode_InternFromString("ask_price8");
+	KEY_ask_volume8 = PyUnicode_InternFromString("ask_volume8");
+	KEY_bid_price8 = PyUnicode_InternFromString("bid_price8");
+	KEY_bid_volume8 = PyUnicode_InternFromString("bid_volume8");
+	KEY_ask_price9 = PyUnicode_InternFromString("ask_price9");
+	KEY_ask_volume9 = PyUnicode_InternFromString("ask_volume9");
+	KEY_bid_price9 = PyUnicode_InternFromString("bid_price9");
+	KEY_bid_volume9 = PyUnicode_InternFromString("bid_volume9");
+	KEY_ask_price10 = PyUnicode_InternFromString("ask_price10");
+	KEY_ask_volume10 = PyUnicode_InternFromString("ask_volume10");
+	KEY_bid_price10 = PyUnicode_InternFromString("bid_price10");
+	KEY_bid_volume10 = PyUnicode_InternFromString("bid_volume10");
+	KEY_md_source = PyUnicode_InternFromString("md_source");
+	KEY_session_public_key = PyUnicode_InternFromString("session_public_key");
+	KEY_utp_checking_server_id = PyUnicode_InternFromString("utp_checking_server_id");
+	KEY_utp_checking_server_time = PyUnicode_InternFromString("utp_checking_server_time");
+	KEY_last_login_ip_address = PyUnicode_InternFromString("last_login_ip_address");
+	KEY_last_login_time = PyUnicode_InternFromString("last_login_time");
+	KEY_session_encrypted = PyUnicode_InternFromString("session_encrypted");
+	KEY_routing_key = PyUnicode_InternFromString("routing_key");
+	KEY_exchange_name = PyUnicode_InternFromString("exchange_name");
+	KEY_exchange_status = PyUnicode_InternFromString("exchange_status");
+	KEY_product_id = PyUnicode_InternFromString("product_id");
+	KEY_product_name = PyUnicode_InternFromString("product_name");
+	KEY_product_class = PyUnicode_InternFromString("product_class");
+	KEY_instrument_name = PyUnicode_InternFromString("instrument_name");
+	KEY_instrument_class = PyUnicode_InternFromString("instrument_class");
+	KEY_delivery_year = PyUnicode_InternFromString("delivery_year");
+	KEY_delivery_month = PyUnicode_InternFromString("delivery_month");
+	KEY_volume_multiple = PyUnicode_InternFromString("volume_multiple");
+	KEY_price_tick = PyUnicode_InternFromString("price_tick");
+	KEY_price_tick_dividend = PyUnicode_InternFromString("price_tick_dividend");
+	KEY_max_marketorder_volume = PyUnicode_InternFromString("max_marketorder_volume");
+	KEY_min_marketorder_volume = PyUnicode_InternFromString("min_marketorder_volume");
+	KEY_max_limitorder_volume = PyUnicode_InternFromString("max_limitorder_volume");
+	KEY_min_limitorder_volume = PyUnicode_InternFromString("min_limitorder_volume");
+	KEY_create_date = PyUnicode_InternFromString("create_date");
+	KEY_open_date = PyUnicode_InternFromString("open_date");
+	KEY_expire_date = PyUnicode_InternFromString("expire_date");
+	KEY_last_trading_date = PyUnicode_InternFromString("last_trading_date");
+	KEY_start_delivery_date = PyUnicode_InternFromString("start_delivery_date");
+	KEY_end_delivery_date = PyUnicode_InternFromString("end_delivery_date");
+	KEY_first_notice_date = PyUnicode_InternFromString("first_notice_date");
+};
+
+
 ///-------------------------------------------------------------------------------------
 ///C++的回调函数将数据保存到队列中
 ///-------------------------------------------------------------------------------------
@@ -28,7 +258,7 @@ void MdApi::OnHeartBeatWarning(int nTimeLapse)
 	Task task = Task();
 	task.task_name = ONHEARTBEATWARNING;
 
-	int *task_data = new int();
+	int *task_data = createTaskData<int>();
 	*task_data = nTimeLapse;
 	task.task_data = task_data;
 
@@ -40,7 +270,7 @@ void MdApi::OnRspError(ERRORMSGINFO_t &pRspInfo, TSequenceIDType nRequestID)
 	Task task = Task();
 	task.task_name = ONRSPERROR;
 
-	ERRORMSGINFO_t *task_error = new ERRORMSGINFO_t();
+	ERRORMSGINFO_t *task_error = createTaskData<ERRORMSGINFO_t>();
 	*task_error = pRspInfo;
 	task.task_error = task_error;
 
@@ -51,10 +281,59 @@ void MdApi::OnRspError(ERRORMSGINFO_t &pRspInfo, TSequenceIDType nRequestID)
 
 void MdApi::OnRtnMarketData(STKMarketData_t &pData)
 {
+	//缓冲区模式下直接拷贝原始结构体，不再逐笔创建任务
+	if (!this->buffer.empty())
+	{
+		//写入前后更新槽位序号（奇数表示正在写入），读取方据此判断数据是否完整
+		long long cursor = this->buffer_cursor.load(memory_order_relaxed);
+		size_t slot = cursor % this->buffer.size();
+		atomic<long long> &seq = this->buffer_seq[slot];
+
+		seq.store(cursor * 2 + 1, memory_order_relaxed);
+		atomic_thread_fence(memory_order_release);
+		this->buffer[slot] = pData;
+		seq.store(cursor * 2 + 2, memory_order_release);
+
+		this->buffer_cursor.store(cursor + 1, memory_order_release);
+
+		//只有在上一次通知被处理后，才推送新的通知任务
+		if (!this->buffer_notified.exchange(true))
+		{
+			Task task = Task();
+			task.task_name = ONRTNMARKETDATABUFFER;
+			this->task_queue.push(task);
+		}
+		return;
+	}
+
 	Task task = Task();
 	task.task_name = ONRTNMARKETDATA;
 
-	STKMarketData_t *task_data = new STKMarketData_t();
+	//合并模式下，同一合约只保留一条待处理的行情，新行情直接覆盖为最新快照
+	if (this->conflate_mode)
+	{
+		string key = string(pData.exchange_id) + "." + pData.instrument_id;
+
+		unique_lock<mutex> mlock(this->conflate_mutex);
+		auto it = this->conflate_pending.find(key);
+		if (it != this->conflate_pending.end())
+		{
+			*(it->second) = pData;
+			this->conflated_count++;
+			return;
+		}
+
+		STKMarketData_t *task_data = createTaskData<STKMarketData_t>();
+		*task_data = pData;
+		this->conflate_pending[key] = task_data;
+		mlock.unlock();
+
+		task.task_data = task_data;
+		this->task_queue.push(task);
+		return;
+	}
+
+	STKMarketData_t *task_data = createTaskData<STKMarketData_t>();
 	*task_data = pData;
 	task.task_data = task_data;
 
@@ -66,7 +345,7 @@ void MdApi::OnRspUtpLogin(const RspUtpLoginField_t& rsp, TSequenceIDType nReques
 	Task task = Task();
 	task.task_name = ONRSPUTPLOGIN;
 
-	RspUtpLoginField_t *task_data = new RspUtpLoginField_t();
+	RspUtpLoginField_t *task_data = createTaskData<RspUtpLoginField_t>();
 	*task_data = rsp;
 	task.task_data = task_data;
 
@@ -80,7 +359,7 @@ void MdApi::OnRspUtpLogout(const RspUtpLogoutField_t& rsp, TSequenceIDType nRequ
 	Task task = Task();
 	task.task_name = ONRSPUTPLOGOUT;
 
-	RspUtpLogoutField_t *task_data = new RspUtpLogoutField_t();
+	RspUtpLogoutField_t *task_data = createTaskData<RspUtpLogoutField_t>();
 	*task_data = rsp;
 	task.task_data = task_data;
 
@@ -94,7 +373,7 @@ void MdApi::OnRspSubscribe(const RspSubscribeField_t& rsp, TSequenceIDType nRequ
 	Task task = Task();
 	task.task_name = ONRSPSUBSCRIBE;
 
-	RspSubscribeField_t *task_data = new RspSubscribeField_t();
+	RspSubscribeField_t *task_data = createTaskData<RspSubscribeField_t>();
 	*task_data = rsp;
 	task.task_data = task_data;
 
@@ -108,7 +387,7 @@ void MdApi::OnRspUnSubscribe(const RspUnSubscribeField_t& rsp, TSequenceIDType n
 	Task task = Task();
 	task.task_name = ONRSPUNSUBSCRIBE;
 
-	RspUnSubscribeField_t *task_data = new RspUnSubscribeField_t();
+	RspUnSubscribeField_t *task_data = createTaskData<RspUnSubscribeField_t>();
 	*task_data = rsp;
 	task.task_data = task_data;
 
@@ -122,7 +401,7 @@ void MdApi::OnRspQryExchange(const RspQryExchangeField_t& rsp, TSequenceIDType n
 	Task task = Task();
 	task.task_name = ONRSPQRYEXCHANGE;
 
-	RspQryExchangeField_t *task_data = new RspQryExchangeField_t();
+	RspQryExchangeField_t *task_data = createTaskData<RspQryExchangeField_t>();
 	*task_data = rsp;
 	task.task_data = task_data;
 
@@ -136,7 +415,7 @@ void MdApi::OnRspQryInstrument(const RspQryInstrumentField_t& rsp, TSequenceIDTy
 	Task task = Task();
 	task.task_name = ONRSPQRYINSTRUMENT;
 
-	RspQryInstrumentField_t *task_data = new RspQryInstrumentField_t();
+	RspQryInstrumentField_t *task_data = createTaskData<RspQryInstrumentField_t>();
 	*task_data = rsp;
 	task.task_data = task_data;
 
@@ -157,6 +436,7 @@ void MdApi::processTask()
 		while (this->active)
 		{
 			Task task = this->task_queue.pop();
+			long long start = getTimestamp();
 
 			switch (task.task_name)
 			{
@@ -186,7 +466,14 @@ void MdApi::processTask()
 
 			case ONRTNMARKETDATA:
 			{
-				this->processRtnMarketData(&task);
+				if (this->batch_mode)
+				{
+					this->processRtnMarketDataBatch(&task);
+				}
+				else
+				{
+					this->processRtnMarketData(&task);
+				}
 				break;
 			}
 
@@ -225,7 +512,16 @@ void MdApi::processTask()
 				this->processRspQryInstrument(&task);
 				break;
 			}
+
+			case ONRTNMARKETDATABUFFER:
+			{
+				this->processRtnMarketDataBuffer(&task);
+				break;
+			}
 			};
+
+			//记录入队到分发的延时以及回调处理耗时
+			this->task_stats.record(task.task_name, start - task.task_time, getTimestamp() - start);
 		}
 	}
 	catch (const TerminatedError&)
@@ -258,13 +554,13 @@ void MdApi::processRspError(Task *task)
 	if (task->task_data)
 	{
 		ERRORMSGINFO_t *task_data = (ERRORMSGINFO_t*)task->task_data;
-		data["error_code"] = task_data->error_code;
-		data["error_message"] = toUtf(task_data->error_message);
-		data["response_code"] = task_data->response_code;
-		data["response_string"] = toUtf(task_data->response_string);
-		data["utp_server_id"] = task_data->utp_server_id;
-		data["oms_server_id"] = task_data->oms_server_id;
-		delete task_data;
+		data[KEY_error_code] = task_data->error_code;
+		data[KEY_error_message] = toUtf(task_data->error_message);
+		data[KEY_response_code] = task_data->response_code;
+		data[KEY_response_string] = toUtf(task_data->response_string);
+		data[KEY_utp_server_id] = task_data->utp_server_id;
+		data[KEY_oms_server_id] = task_data->oms_server_id;
+		releaseTaskData(task_data);
 	}
 	this->onRspError(data, task->task_id);
 };
@@ -276,85 +572,147 @@ void MdApi::processRtnMarketData(Task *task)
 	if (task->task_data)
 	{
 		STKMarketData_t *task_data = (STKMarketData_t*)task->task_data;
-		data["trading_day"] = toUtf(task_data->trading_day);
-		data["update_time"] = toUtf(task_data->update_time);
-		data["update_millisec"] = task_data->update_millisec;
-		data["update_sequence"] = task_data->update_sequence;
-		data["instrument_id"] = toUtf(task_data->instrument_id);
-		data["exchange_id"] = toUtf(task_data->exchange_id);
-		data["exchange_inst_id"] = toUtf(task_data->exchange_inst_id);
-		data["instrument_status"] = task_data->instrument_status;
-		data["last_price"] = task_data->last_price;
-		data["volume"] = task_data->volume;
-		data["last_volume"] = task_data->last_volume;
-		data["turnover"] = task_data->turnover;
-		data["open_interest"] = task_data->open_interest;
-		data["open_price"] = task_data->open_price;
-		data["highest_price"] = task_data->highest_price;
-		data["lowest_price"] = task_data->lowest_price;
-		data["close_price"] = task_data->close_price;
-		data["settlement_price"] = task_data->settlement_price;
-		data["average_price"] = task_data->average_price;
-		data["change_price"] = task_data->change_price;
-		data["change_markup"] = task_data->change_markup;
-		data["change_swing"] = task_data->change_swing;
-		data["upper_limit_price"] = task_data->upper_limit_price;
-		data["lower_limit_price"] = task_data->lower_limit_price;
-		data["pre_settlement_price"] = task_data->pre_settlement_price;
-		data["pre_close_price"] = task_data->pre_close_price;
-		data["pre_open_interest"] = task_data->pre_open_interest;
-		data["pre_delta"] = task_data->pre_delta;
-		data["curr_delta"] = task_data->curr_delta;
-		data["best_ask_price"] = task_data->best_ask_price;
-		data["best_ask_volume"] = task_data->best_ask_volume;
-		data["best_bid_price"] = task_data->best_bid_price;
-		data["best_bid_volume"] = task_data->best_bid_volume;
-		data["ask_price1"] = task_data->ask_price1;
-		data["ask_volume1"] = task_data->ask_volume1;
-		data["bid_price1"] = task_data->bid_price1;
-		data["bid_volume1"] = task_data->bid_volume1;
-		data["ask_price2"] = task_data->ask_price2;
-		data["ask_volume2"] = task_data->ask_volume2;
-		data["bid_price2"] = task_data->bid_price2;
-		data["bid_volume2"] = task_data->bid_volume2;
-		data["ask_price3"] = task_data->ask_price3;
-		data["ask_volume3"] = task_data->ask_volume3;
-		data["bid_price3"] = task_data->bid_price3;
-		data["bid_volume3"] = task_data->bid_volume3;
-		data["ask_price4"] = task_data->ask_price4;
-		data["ask_volume4"] = task_data->ask_volume4;
-		data["bid_price4"] = task_data->bid_price4;
-		data["bid_volume4"] = task_data->bid_volume4;
-		data["ask_price5"] = task_data->ask_price5;
-		data["ask_volume5"] = task_data->ask_volume5;
-		data["bid_price5"] = task_data->bid_price5;
-		data["bid_volume5"] = task_data->bid_volume5;
-		data["ask_price6"] = task_data->ask_price6;
-		data["ask_volume6"] = task_data->ask_volume6;
-		data["bid_price6"] = task_data->bid_price6;
-		data["bid_volume6"] = task_data->bid_volume6;
-		data["ask_price7"] = task_data->ask_price7;
-		data["ask_volume7"] = task_data->ask_volume7;
-		data["bid_price7"] = task_data->bid_price7;
-		data["bid_volume7"] = task_data->bid_volume7;
-		data["ask_price8"] = task_data->ask_price8;
-		data["ask_volume8"] = task_data->ask_volume8;
-		data["bid_price8"] = task_data->bid_price8;
-		data["bid_volume8"] = task_data->bid_volume8;
-		data["ask_price9"] = task_data->ask_price9;
-		data["ask_volume9"] = task_data->ask_volume9;
-		data["bid_price9"] = task_data->bid_price9;
-		data["bid_volume9"] = task_data->bid_volume9;
-		data["ask_price10"] = task_data->ask_price10;
-		data["ask_volume10"] = task_data->ask_volume10;
-		data["bid_price10"] = task_data->bid_price10;
-		data["bid_volume10"] = task_data->bid_volume10;
-		data["md_source"] = toUtf(task_data->md_source);
-		delete task_data;
+		this->removeConflated(task_data);
+		data = this->convertMarketData(task_data);
+		releaseTaskData(task_data);
 	}
 	this->onRtnMarketData(data);
 };
 
+void MdApi::processRtnMarketDataBatch(Task *task)
+{
+	gil_scoped_acquire acquire;
+	pybind11::list data_list;
+
+	//在同一次GIL获取中，取出队列中连续的行情推送，单次最多MARKET_DATA_BATCH_SIZE条
+	//超出部分留在队列中由下一次循环处理，避免长时间占用GIL
+	Task next = *task;
+	int count = 0;
+	do
+	{
+		if (next.task_data)
+		{
+			STKMarketData_t *task_data = (STKMarketData_t*)next.task_data;
+			this->removeConflated(task_data);
+			data_list.append(this->convertMarketData(task_data));
+			releaseTaskData(task_data);
+		}
+	} while (++count < MARKET_DATA_BATCH_SIZE && this->task_queue.pop_if(ONRTNMARKETDATA, next));
+
+	this->onRtnMarketDataBatch(data_list);
+};
+
+void MdApi::removeConflated(STKMarketData_t *task_data)
+{
+	//移出待处理集合后，该合约的新行情将生成新的任务，不会再覆盖当前数据
+	if (!this->conflate_mode)
+		return;
+
+	lock_guard<mutex> mlock(this->conflate_mutex);
+	string key = string(task_data->exchange_id) + "." + task_data->instrument_id;
+	this->conflate_pending.erase(key);
+};
+
+dict MdApi::convertMarketData(STKMarketData_t *task_data)
+{
+	dict data;
+	//一档行情及网关生成Tick所需的基础字段
+	data[KEY_trading_day] = toUtfCached(task_data->trading_day);
+	data[KEY_update_time] = toUtfCached(task_data->update_time);
+	data[KEY_update_millisec] = task_data->update_millisec;
+	data[KEY_instrument_id] = toUtfCached(task_data->instrument_id);
+	data[KEY_exchange_id] = toUtfCached(task_data->exchange_id);
+	data[KEY_last_price] = task_data->last_price;
+	data[KEY_volume] = task_data->volume;
+	data[KEY_open_interest] = task_data->open_interest;
+	data[KEY_open_price] = task_data->open_price;
+	data[KEY_highest_price] = task_data->highest_price;
+	data[KEY_lowest_price] = task_data->lowest_price;
+	data[KEY_upper_limit_price] = task_data->upper_limit_price;
+	data[KEY_lower_limit_price] = task_data->lower_limit_price;
+	data[KEY_pre_close_price] = task_data->pre_close_price;
+	data[KEY_ask_price1] = task_data->ask_price1;
+	data[KEY_ask_volume1] = task_data->ask_volume1;
+	data[KEY_bid_price1] = task_data->bid_price1;
+	data[KEY_bid_volume1] = task_data->bid_volume1;
+
+	//二至五档行情
+	if (this->market_data_level >= 5)
+	{
+		data[KEY_ask_price2] = task_data->ask_price2;
+		data[KEY_ask_volume2] = task_data->ask_volume2;
+		data[KEY_bid_price2] = task_data->bid_price2;
+		data[KEY_bid_volume2] = task_data->bid_volume2;
+		data[KEY_ask_price3] = task_data->ask_price3;
+		data[KEY_ask_volume3] = task_data->ask_volume3;
+		data[KEY_bid_price3] = task_data->bid_price3;
+		data[KEY_bid_volume3] = task_data->bid_volume3;
+		data[KEY_ask_price4] = task_data->ask_price4;
+		data[KEY_ask_volume4] = task_data->ask_volume4;
+		data[KEY_bid_price4] = task_data->bid_price4;
+		data[KEY_bid_volume4] = task_data->bid_volume4;
+		data[KEY_ask_price5] = task_data->ask_price5;
+		data[KEY_ask_volume5] = task_data->ask_volume5;
+		data[KEY_bid_price5] = task_data->bid_price5;
+		data[KEY_bid_volume5] = task_data->bid_volume5;
+	}
+
+	//六至十档行情及其余全部字段
+	if (this->market_data_level >= 10)
+	{
+		data[KEY_update_sequence] = task_data->update_sequence;
+		data[KEY_exchange_inst_id] = toUtfCached(task_data->exchange_inst_id);
+		data[KEY_instrument_status] = task_data->instrument_status;
+		data[KEY_last_volume] = task_data->last_volume;
+		data[KEY_turnover] = task_data->turnover;
+		data[KEY_close_price] = task_data->close_price;
+		data[KEY_settlement_price] = task_data->settlement_price;
+		data[KEY_average_price] = task_data->average_price;
+		data[KEY_change_price] = task_data->change_price;
+		data[KEY_change_markup] = task_data->change_markup;
+		data[KEY_change_swing] = task_data->change_swing;
+		data[KEY_pre_settlement_price] = task_data->pre_settlement_price;
+		data[KEY_pre_open_interest] = task_data->pre_open_interest;
+		data[KEY_pre_delta] = task_data->pre_delta;
+		data[KEY_curr_delta] = task_data->curr_delta;
+		data[KEY_best_ask_price] = task_data->best_ask_price;
+		data[KEY_best_ask_volume] = task_data->best_ask_volume;
+		data[KEY_best_bid_price] = task_data->best_bid_price;
+		data[KEY_best_bid_volume] = task_data->best_bid_volume;
+		data[KEY_ask_price6] = task_data->ask_price6;
+		data[KEY_ask_volume6] = task_data->ask_volume6;
+		data[KEY_bid_price6] = task_data->bid_price6;
+		data[KEY_bid_volume6] = task_data->bid_volume6;
+		data[KEY_ask_price7] = task_data->ask_price7;
+		data[KEY_ask_volume7] = task_data->ask_volume7;
+		data[KEY_bid_price7] = task_data->bid_price7;
+		data[KEY_bid_volume7] = task_data->bid_volume7;
+		data[KEY_ask_price8] = task_data->ask_price8;
+		data[KEY_ask_volume8] = task_data->ask_volume8;
+		data[KEY_bid_price8] = task_data->bid_price8;
+		data[KEY_bid_volume8] = task_data->bid_volume8;
+		data[KEY_ask_price9] = task_data->ask_price9;
+		data[KEY_ask_volume9] = task_data->ask_volume9;
+		data[KEY_bid_price9] = task_data->bid_price9;
+		data[KEY_bid_volume9] = task_data->bid_volume9;
+		data[KEY_ask_price10] = task_data->ask_price10;
+		data[KEY_ask_volume10] = task_data->ask_volume10;
+		data[KEY_bid_price10] = task_data->bid_price10;
+		data[KEY_bid_volume10] = task_data->bid_volume10;
+		data[KEY_md_source] = toUtfCached(task_data->md_source);
+	}
+	return data;
+};
+
+void MdApi::processRtnMarketDataBuffer(Task *task)
+{
+	this->buffer_notified.store(false);
+	long long cursor = this->buffer_cursor.load(memory_order_acquire);
+
+	gil_scoped_acquire acquire;
+	this->onRtnMarketDataBuffer(cursor);
+};
+
 void MdApi::processRspUtpLogin(Task *task)
 {
 	gil_scoped_acquire acquire;
@@ -362,15 +720,15 @@ void MdApi::processRspUtpLogin(Task *task)
 	if (task->task_data)
 	{
 		RspUtpLoginField_t *task_data = (RspUtpLoginField_t*)task->task_data;
-		data["response_code"] = task_data->response_code;
-		data["response_string"] = toUtf(task_data->response_string);
-		data["session_public_key"] = toUtf(task_data->session_public_key);
-		data["utp_checking_server_id"] = toUtf(task_data->utp_checking_server_id);
-		data["utp_checking_server_time"] = task_data->utp_checking_server_time;
-		data["last_login_ip_address"] = toUtf(task_data->last_login_ip_address);
-		data["last_login_time"] = task_data->last_login_time;
-		data["session_encrypted"] = task_data->session_encrypted;
-		delete task_data;
+		data[KEY_response_code] = task_data->response_code;
+		data[KEY_response_string] = toUtf(task_data->response_string);
+		data[KEY_session_public_key] = toUtf(task_data->session_public_key);
+		data[KEY_utp_checking_server_id] = toUtf(task_data->utp_checking_server_id);
+		data[KEY_utp_checking_server_time] = task_data->utp_checking_server_time;
+		data[KEY_last_login_ip_address] = toUtf(task_data->last_login_ip_address);
+		data[KEY_last_login_time] = task_data->last_login_time;
+		data[KEY_session_encrypted] = task_data->session_encrypted;
+		releaseTaskData(task_data);
 	}
 	this->onRspUtpLogin(data, task->task_id);
 };
@@ -382,10 +740,10 @@ void MdApi::processRspUtpLogout(Task *task)
 	if (task->task_data)
 	{
 		RspUtpLogoutField_t *task_data = (RspUtpLogoutField_t*)task->task_data;
-		data["response_code"] = task_data->response_code;
-		data["response_string"] = toUtf(task_data->response_string);
-		data["utp_server_id"] = task_data->utp_server_id;
-		delete task_data;
+		data[KEY_response_code] = task_data->response_code;
+		data[KEY_response_string] = toUtf(task_data->response_string);
+		data[KEY_utp_server_id] = task_data->utp_server_id;
+		releaseTaskData(task_data);
 	}
 	this->onRspUtpLogout(data, task->task_id);
 };
@@ -397,10 +755,10 @@ void MdApi::processRspSubscribe(Task *task)
 	if (task->task_data)
 	{
 		RspSubscribeField_t *task_data = (RspSubscribeField_t*)task->task_data;
-		data["response_code"] = task_data->response_code;
-		data["response_string"] = toUtf(task_data->response_string);
-		data["routing_key"] = toUtf(task_data->routing_key[0]);
-		delete task_data;
+		data[KEY_response_code] = task_data->response_code;
+		data[KEY_response_string] = toUtf(task_data->response_string);
+		data[KEY_routing_key] = toUtf(task_data->routing_key[0]);
+		releaseTaskData(task_data);
 	}
 	this->onRspSubscribe(data, task->task_id);
 };
@@ -412,10 +770,10 @@ void MdApi::processRspUnSubscribe(Task *task)
 	if (task->task_data)
 	{
 		RspUnSubscribeField_t *task_data = (RspUnSubscribeField_t*)task->task_data;
-		data["response_code"] = task_data->response_code;
-		data["response_string"] = toUtf(task_data->response_string);
-		data["routing_key"] = toUtf(task_data->routing_key[0]);
-		delete task_data;
+		data[KEY_response_code] = task_data->response_code;
+		data[KEY_response_string] = toUtf(task_data->response_string);
+		data[KEY_routing_key] = toUtf(task_data->routing_key[0]);
+		releaseTaskData(task_data);
 	}
 	this->onRspUnSubscribe(data, task->task_id);
 };
@@ -427,14 +785,14 @@ void MdApi::processRspQryExchange(Task *task)
 	if (task->task_data)
 	{
 		RspQryExchangeField_t *task_data = (RspQryExchangeField_t*)task->task_data;
-		data["response_code"] = task_data->response_code;
-		data["response_string"] = toUtf(task_data->response_string);
-		data["utp_server_id"] = task_data->utp_server_id;
-		data["oms_server_id"] = task_data->oms_server_id;
-		data["exchange_id"] = toUtf(task_data->exchange_id);
-		data["exchange_name"] = toUtf(task_data->exchange_name);
-		data["exchange_status"] = task_data->exchange_status;
-		delete task_data;
+		data[KEY_response_code] = task_data->response_code;
+		data[KEY_response_string] = toUtf(task_data->response_string);
+		data[KEY_utp_server_id] = task_data->utp_server_id;
+		data[KEY_oms_server_id] = task_data->oms_server_id;
+		data[KEY_exchange_id] = toUtfCached(task_data->exchange_id);
+		data[KEY_exchange_name] = toUtf(task_data->exchange_name);
+		data[KEY_exchange_status] = task_data->exchange_status;
+		releaseTaskData(task_data);
 	}
 	this->onRspQryExchange(data, task->task_id);
 };
@@ -446,35 +804,35 @@ void MdApi::processRspQryInstrument(Task *task)
 	if (task->task_data)
 	{
 		RspQryInstrumentField_t *task_data = (RspQryInstrumentField_t*)task->task_data;
-		data["response_code"] = task_data->response_code;
-		data["response_string"] = toUtf(task_data->response_string);
-		data["utp_server_id"] = task_data->utp_server_id;
-		data["oms_server_id"] = task_data->oms_server_id;
-		data["product_id"] = toUtf(task_data->product_id);
-		data["product_name"] = toUtf(task_data->product_name);
-		data["exchange_id"] = toUtf(task_data->exchange_id);
-		data["product_class"] = task_data->product_class;
-		data["instrument_id"] = toUtf(task_data->instrument_id);
-		data["instrument_name"] = toUtf(task_data->instrument_name);
-		data["instrument_class"] = task_data->instrument_class;
-		data["instrument_status"] = task_data->instrument_status;
-		data["delivery_year"] = task_data->delivery_year;
-		data["delivery_month"] = task_data->delivery_month;
-		data["volume_multiple"] = task_data->volume_multiple;
-		data["price_tick"] = task_data->price_tick;
-		data["price_tick_dividend"] = task_data->price_tick_dividend;
-		data["max_marketorder_volume"] = task_data->max_marketorder_volume;
-		data["min_marketorder_volume"] = task_data->min_marketorder_volume;
-		data["max_limitorder_volume"] = task_data->max_limitorder_volume;
-		data["min_limitorder_volume"] = task_data->min_limitorder_volume;
-		data["create_date"] = toUtf(task_data->create_date);
-		data["open_date"] = toUtf(task_data->open_date);
-		data["expire_date"] = toUtf(task_data->expire_date);
-		data["last_trading_date"] = toUtf(task_data->last_trading_date);
-		data["start_delivery_date"] = toUtf(task_data->start_delivery_date);
-		data["end_delivery_date"] = toUtf(task_data->end_delivery_date);
-		data["first_notice_date"] = toUtf(task_data->first_notice_date);
-		delete task_data;
+		data[KEY_response_code] = task_data->response_code;
+		data[KEY_response_string] = toUtf(task_data->response_string);
+		data[KEY_utp_server_id] = task_data->utp_server_id;
+		data[KEY_oms_server_id] = task_data->oms_server_id;
+		data[KEY_product_id] = toUtf(task_data->product_id);
+		data[KEY_product_name] = toUtf(task_data->product_name);
+		data[KEY_exchange_id] = toUtfCached(task_data->exchange_id);
+		data[KEY_product_class] = task_data->product_class;
+		data[KEY_instrument_id] = toUtfCached(task_data->instrument_id);
+		data[KEY_instrument_name] = toUtf(task_data->instrument_name);
+		data[KEY_instrument_class] = task_data->instrument_class;
+		data[KEY_instrument_status] = task_data->instrument_status;
+		data[KEY_delivery_year] = task_data->delivery_year;
+		data[KEY_delivery_month] = task_data->delivery_month;
+		data[KEY_volume_multiple] = task_data->volume_multiple;
+		data[KEY_price_tick] = task_data->price_tick;
+		data[KEY_price_tick_dividend] = task_data->price_tick_dividend;
+		data[KEY_max_marketorder_volume] = task_data->max_marketorder_volume;
+		data[KEY_min_marketorder_volume] = task_data->min_marketorder_volume;
+		data[KEY_max_limitorder_volume] = task_data->max_limitorder_volume;
+		data[KEY_min_limitorder_volume] = task_data->min_limitorder_volume;
+		data[KEY_create_date] = toUtf(task_data->create_date);
+		data[KEY_open_date] = toUtf(task_data->open_date);
+		data[KEY_expire_date] = toUtf(task_data->expire_date);
+		data[KEY_last_trading_date] = toUtf(task_data->last_trading_date);
+		data[KEY_start_delivery_date] = toUtf(task_data->start_delivery_date);
+		data[KEY_end_delivery_date] = toUtf(task_data->end_delivery_date);
+		data[KEY_first_notice_date] = toUtf(task_data->first_notice_date);
+		releaseTaskData(task_data);
 	}
 	this->onRspQryInstrument(data, task->task_id);
 };
@@ -577,6 +935,40 @@ int MdApi::reqUnSubscribe(string symbol, int reqid)
 	return i;
 };
 
+int MdApi::reqSubscribeBatch(const pybind11::list &keys, int reqid)
+{
+	//一次请求最多订阅100条
+	ReqSubscribeField_t myreq = ReqSubscribeField_t();
+	memset(&myreq, 0, sizeof(myreq));
+
+	size_t count = keys.size();
+	if (count > sizeof(myreq.routing_key) / sizeof(myreq.routing_key[0]))
+		throw value_error("too many routing keys");
+
+	for (size_t n = 0; n < count; ++n)
+		setString(myreq.routing_key[n], keys[n].cast<string>());
+
+	int i = this->api->ReqSubscribe(myreq, reqid);
+	return i;
+};
+
+int MdApi::reqUnSubscribeBatch(const pybind11::list &keys, int reqid)
+{
+	//一次请求最多取消100条
+	ReqUnSubscribeField_t myreq = ReqUnSubscribeField_t();
+	memset(&myreq, 0, sizeof(myreq));
+
+	size_t count = keys.size();
+	if (count > sizeof(myreq.routing_key) / sizeof(myreq.routing_key[0]))
+		throw value_error("too many routing keys");
+
+	for (size_t n = 0; n < count; ++n)
+		setString(myreq.routing_key[n], keys[n].cast<string>());
+
+	int i = this->api->ReqUnSubscribe(myreq, reqid);
+	return i;
+};
+
 int MdApi::reqAuthUserPasswor(const dict &req, int reqid)
 {
 	ReqAuthUserPassworField_t myreq = ReqAuthUserPassworField_t();
@@ -612,6 +1004,104 @@ int MdApi::reqQryInstrument(const dict &req, int reqid)
 	return i;
 };
 
+void MdApi::setBatchMode(bool enabled)
+{
+	this->batch_mode = enabled;
+};
+
+void MdApi::setConflateMode(bool enabled)
+{
+	//需要在init之前调用
+	this->conflate_mode = enabled;
+};
+
+long long MdApi::getConflatedCount()
+{
+	return this->conflated_count.load();
+};
+
+void MdApi::setMarketDataLevel(int level)
+{
+	//1为仅一档，5为五档，10为十档及全部字段
+	this->market_data_level = level;
+};
+
+void registerMarketDataDtype()
+{
+	//只在启用缓冲区时注册，导入模块时不依赖numpy
+	static bool registered = false;
+	if (registered)
+		return;
+
+	PYBIND11_NUMPY_DTYPE(STKMarketData_t, trading_day, update_time, update_millisec, update_sequence, instrument_id, exchange_id, exchange_inst_id, instrument_status, last_price, volume, last_volume, turnover, open_interest, open_price, highest_price, lowest_price, close_price, settlement_price, average_price, change_price, change_markup, change_swing, upper_limit_price, lower_limit_price, pre_settlement_price, pre_close_price, pre_open_interest, pre_delta, curr_delta, best_ask_price, best_ask_volume, best_bid_price, best_bid_volume, ask_price1, ask_volume1, bid_price1, bid_volume1, ask_price2, ask_volume2, bid_price2, bid_volume2, ask_price3, ask_volume3, bid_price3, bid_volume3, ask_price4, ask_volume4, bid_price4, bid_volume4, ask_price5, ask_volume5, bid_price5, bid_volume5, ask_price6, ask_volume6, bid_price6, bid_volume6, ask_price7, ask_volume7, bid_price7, bid_volume7, ask_price8, ask_volume8, bid_price8, bid_volume8, ask_price9, ask_volume9, bid_price9, bid_volume9, ask_price10, ask_volume10, bid_price10, bid_volume10, md_source);
+	registered = true;
+};
+
+void MdApi::enableMarketDataBuffer(int size)
+{
+	//回调线程启动后不能再调整缓冲区，size为0时关闭缓冲区模式
+	if (this->active)
+		throw runtime_error("enableMarketDataBuffer must be called before init");
+
+	if (size > 0)
+		registerMarketDataDtype();
+
+	this->buffer = vector<STKMarketData_t>(size);
+	this->buffer_seq.reset(size > 0 ? new atomic<long long>[size] : nullptr);
+	for (int i = 0; i < size; ++i)
+		this->buffer_seq[i].store(0, memory_order_relaxed);
+	this->buffer_cursor = 0;
+};
+
+pybind11::array MdApi::readMarketDataBuffer(long long start, long long end)
+{
+	//拷贝累计序号在[start, end)范围内的行情，已被覆盖或正在写入的槽位会被跳过
+	if (this->buffer.empty())
+		throw runtime_error("market data buffer is not enabled");
+
+	long long size = this->buffer.size();
+	long long cursor = this->buffer_cursor.load(memory_order_acquire);
+
+	end = min(end, cursor);
+	start = max(start, max(end - size, 0LL));
+
+	vector<STKMarketData_t> records;
+	records.reserve(max(end - start, 0LL));
+
+	for (long long n = start; n < end; ++n)
+	{
+		size_t slot = n % size;
+		atomic<long long> &seq = this->buffer_seq[slot];
+
+		long long before = seq.load(memory_order_acquire);
+		if (before != n * 2 + 2)
+			continue;
+
+		STKMarketData_t record = this->buffer[slot];
+		atomic_thread_fence(memory_order_acquire);
+
+		if (seq.load(memory_order_relaxed) != before)
+			continue;
+
+		records.push_back(record);
+	}
+
+	return pybind11::array_t<STKMarketData_t>(records.size(), records.data());
+};
+
+long long MdApi::getMarketDataCursor()
+{
+	return this->buffer_cursor.load(memory_order_acquire);
+};
+
+dict MdApi::getQueueStats()
+{
+	dict stats = this->task_stats.to_dict(TASK_NAMES, sizeof(TASK_NAMES) / sizeof(TASK_NAMES[0]));
+	stats["depth"] = this->task_queue.depth();
+	stats["high_water"] = this->task_queue.high_water();
+	return stats;
+};
+
 
 ///-------------------------------------------------------------------------------------
 ///Boost.Python封装
@@ -682,6 +1172,30 @@ public:
 		}
 	};
 
+	void onRtnMarketDataBatch(const pybind11::list &data) override
+	{
+		try
+		{
+			PYBIND11_OVERLOAD(void, MdApi, onRtnMarketDataBatch, data);
+		}
+		catch (const error_already_set &e)
+		{
+			cout << e.what() << endl;
+		}
+	};
+
+	void onRtnMarketDataBuffer(long long cursor) override
+	{
+		try
+		{
+			PYBIND11_OVERLOAD(void, MdApi, onRtnMarketDataBuffer, cursor);
+		}
+		catch (const error_already_set &e)
+		{
+			cout << e.what() << endl;
+		}
+	};
+
 	void onRspUtpLogin(const dict &data, int reqid) override
 	{
 		try
@@ -758,6 +1272,8 @@ public:
 
 PYBIND11_MODULE(vnnhmd, m)
 {
+	initDictKeys();
+
 	class_<MdApi, PyMdApi> mdapi(m, "MdApi", module_local());
 	mdapi
 		.def(init<>())
@@ -768,19 +1284,31 @@ PYBIND11_MODULE(vnnhmd, m)
 		.def("registerFront", &MdApi::registerFront)
 		.def("registerNameServer", &MdApi::registerNameServer)
 		.def("exit", &MdApi::exit)
+		.def("getQueueStats", &MdApi::getQueueStats)
 		.def("reqUtpLogin", &MdApi::reqUtpLogin)
 		.def("reqUtpLogout", &MdApi::reqUtpLogout)
 		.def("reqSubscribe", &MdApi::reqSubscribe)
 		.def("reqUnSubscribe", &MdApi::reqUnSubscribe)
+		.def("reqSubscribeBatch", &MdApi::reqSubscribeBatch)
+		.def("reqUnSubscribeBatch", &MdApi::reqUnSubscribeBatch)
 		.def("reqAuthUserPasswor", &MdApi::reqAuthUserPasswor)
 		.def("reqQryExchange", &MdApi::reqQryExchange)
 		.def("reqQryInstrument", &MdApi::reqQryInstrument)
+		.def("setBatchMode", &MdApi::setBatchMode)
+		.def("setMarketDataLevel", &MdApi::setMarketDataLevel)
+		.def("setConflateMode", &MdApi::setConflateMode)
+		.def("getConflatedCount", &MdApi::getConflatedCount)
+		.def("enableMarketDataBuffer", &MdApi::enableMarketDataBuffer)
+		.def("readMarketDataBuffer", &MdApi::readMarketDataBuffer)
+		.def("getMarketDataCursor", &MdApi::getMarketDataCursor)
 
 		.def("onFrontConnected", &MdApi::onFrontConnected)
 		.def("onFrontDisConnected", &MdApi::onFrontDisConnected)
 		.def("onHeartBeatWarning", &MdApi::onHeartBeatWarning)
 		.def("onRspError", &MdApi::onRspError)
 		.def("onRtnMarketData", &MdApi::onRtnMarketData)
+		.def("onRtnMarketDataBatch", &MdApi::onRtnMarketDataBatch)
+		.def("onRtnMarketDataBuffer", &MdApi::onRtnMarketDataBuffer)
 		.def("onRspUtpLogin", &MdApi::onRspUtpLogin)
 		.def("onRspUtpLogout", &MdApi::onRspUtpLogout)
 		.def("onRspSubscribe", &MdApi::onRspSubscribe)
@@ -3,8 +3,13 @@
 #include "stdafx.h"
 #endif
 
+#include <atomic>
+#include <memory>
+#include <vector>
+
 #include "vnnh.h"
 #include "pybind11/pybind11.h"
+#include "pybind11/numpy.h"
 #include "nh/md/CNhMdApi.h"
 
 
@@ -22,6 +27,26 @@ using namespace pybind11;
 #define ONRSPUNSUBSCRIBE 8
 #define ONRSPQRYEXCHANGE 9
 #define ONRSPQRYINSTRUMENT 10
+#define ONRTNMARKETDATABUFFER 11
+
+//ģʽµλص
+#define MARKET_DATA_BATCH_SIZE 256
+
+//صƣ˳
+static const char *TASK_NAMES[] = {
+	"onFrontConnected",
+	"onFrontDisConnected",
+	"onHeartBeatWarning",
+	"onRspError",
+	"onRtnMarketData",
+	"onRspUtpLogin",
+	"onRspUtpLogout",
+	"onRspSubscribe",
+	"onRspUnSubscribe",
+	"onRspQryExchange",
+	"onRspQryInstrument",
+	"onRtnMarketDataBuffer",
+};
 
 
 ///-------------------------------------------------------------------------------------
@@ -35,7 +60,20 @@ private:
 	CNhMdApi* api;						//API
 	thread task_thread;					//ָ߳루pythonݣ
 	TaskQueue task_queue;			    //
+	TaskStats task_stats;				//ͳ
 	bool active = false;				//״̬
+	bool batch_mode = false;			//ģʽ
+	int market_data_level = 10;			//͵ȵλ
+
+	vector<STKMarketData_t> buffer;		//黷λ
+	unique_ptr<atomic<long long>[]> buffer_seq;	//λдţڼȡʱǷ񱻸
+	atomic<long long> buffer_cursor{ 0 };	//ۼд
+	atomic<bool> buffer_notified{ false };	//ǷдĻ֪ͨ
+
+	bool conflate_mode = false;			//ϲģʽ
+	mutex conflate_mutex;				//黥
+	unordered_map<string, STKMarketData_t*> conflate_pending;	//Լ
+	atomic<long long> conflated_count{ 0 };	//ϲ
 
 public:
 	MdApi()
@@ -147,6 +185,14 @@ public:
 
 	void processRtnMarketData(Task *task);
 
+	void processRtnMarketDataBatch(Task *task);
+
+	void removeConflated(STKMarketData_t *task_data);
+
+	dict convertMarketData(STKMarketData_t *task_data);
+
+	void processRtnMarketDataBuffer(Task *task);
+
 	void processRspUtpLogin(Task *task);
 
 	void processRspUtpLogout(Task *task);
@@ -177,6 +223,10 @@ public:
 
 	virtual void onRtnMarketData(const dict &data) {};
 
+	virtual void onRtnMarketDataBatch(const pybind11::list &data) {};
+
+	virtual void onRtnMarketDataBuffer(long long cursor) {};
+
 	virtual void onRspUtpLogin(const dict &data, int reqid) {};
 
 	virtual void onRspUtpLogout(const dict &data, int reqid) {};
@@ -207,6 +257,8 @@ public:
 
 	int exit();
 
+	dict getQueueStats();
+
 	int reqUtpLogin(const dict &req, int reqid);
 
 	int reqUtpLogout(int reqid);
@@ -215,9 +267,27 @@ public:
 
 	int reqUnSubscribe(string symbol, int reqid);
 
+	int reqSubscribeBatch(const pybind11::list &keys, int reqid);
+
+	int reqUnSubscribeBatch(const pybind11::list &keys, int reqid);
+
 	int reqAuthUserPasswor(const dict &req, int reqid);
 
 	int reqQryExchange(const dict &req, int reqid);
 
 	int reqQryInstrument(const dict &req, int reqid);
+
+	void setBatchMode(bool enabled);
+
+	void setMarketDataLevel(int level);
+
+	void setConflateMode(bool enabled);
+
+	long long getConflatedCount();
+
+	void enableMarketDataBuffer(int size);
+
+	pybind11::array readMarketDataBuffer(long long start, long long end);
+
+	long long getMarketDataCursor();
 };
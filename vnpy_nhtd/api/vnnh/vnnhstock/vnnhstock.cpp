@@ -4,6 +4,268 @@
 #include "vnnhstock.h"
 
 
+///-------------------------------------------------------------------------------------
+///Python字典键，在模块导入时创建一次并重复使用
+///-------------------------------------------------------------------------------------
+
+static handle KEY_SequenceSeries;
+static handle KEY_SequenceNo;
+static handle KEY_ErrorID;
+static handle KEY_ErrorMsg;
+static handle KEY_TradingDay;
+static handle KEY_LoginTime;
+static handle KEY_MaxClOrdID;
+static handle KEY_UserID;
+static handle KEY_TradingSystemName;
+static handle KEY_DataCenterID;
+static handle KEY_PrivateFlowSize;
+static handle KEY_UserFlowSize;
+static handle KEY_ActionDay;
+static handle KEY_OldPassword;
+static handle KEY_NewPassword;
+static handle KEY_OrderID;
+static handle KEY_InsertDate;
+static handle KEY_InsertTime;
+static handle KEY_ClOrdID;
+static handle KEY_SecurityID;
+static handle KEY_OrdType;
+static handle KEY_Price;
+static handle KEY_OrderQty;
+static handle KEY_Side;
+static handle KEY_PartyID;
+static handle KEY_Qty2;
+static handle KEY_OrigClOrdId;
+static handle KEY_ExecType;
+static handle KEY_OrdStatus;
+static handle KEY_TransactTimeOnly;
+static handle KEY_DiscretionPrice;
+static handle KEY_LeavesQty;
+static handle KEY_OrigClOrdID;
+static handle KEY_OwnerType;
+static handle KEY_QuoteReqID;
+static handle KEY_BidPx;
+static handle KEY_AskPx;
+static handle KEY_BidSize;
+static handle KEY_AskSize;
+static handle KEY_BidPositionEffect;
+static handle KEY_AskPositionEffect;
+static handle KEY_PreBalance;
+static handle KEY_Balance;
+static handle KEY_Available;
+static handle KEY_CurrMargin;
+static handle KEY_FrozenMargin;
+static handle KEY_CombMargin;
+static handle KEY_Premium;
+static handle KEY_FrozenPremium;
+static handle KEY_Commi;
+static handle KEY_FrozenCommi;
+static handle KEY_CloseProfit;
+static handle KEY_PosiProfit;
+static handle KEY_Deposit;
+static handle KEY_Withdraw;
+static handle KEY_BaseReserve;
+static handle KEY_SaveDouble1;
+static handle KEY_SaveDouble2;
+static handle KEY_SaveDouble3;
+static handle KEY_PositionEffect;
+static handle KEY_TimeInForce;
+static handle KEY_CoveredOrUncovered;
+static handle KEY_TradeID;
+static handle KEY_TradeTime;
+static handle KEY_TradeVolume;
+static handle KEY_Cjjg;
+static handle KEY_Cjje;
+static handle KEY_ExecID;
+static handle KEY_LastPx;
+static handle KEY_LastQty;
+static handle KEY_OrigTime;
+static handle KEY_TotalValueTraded;
+static handle KEY_Converd;
+static handle KEY_YdPosition;
+static handle KEY_Position;
+static handle KEY_TodayPosition;
+static handle KEY_BuyTradeVolume;
+static handle KEY_SellTradeVolume;
+static handle KEY_PositionCost;
+static handle KEY_YdPositionCost;
+static handle KEY_UseMargin;
+static handle KEY_contractmultiplierunit;
+static handle KEY_startdate;
+static handle KEY_enddate;
+static handle KEY_totallongposition;
+static handle KEY_securityclosepx;
+static handle KEY_settlprice;
+static handle KEY_underlyingclosepx;
+static handle KEY_dailypriceuplimit;
+static handle KEY_dailypricedownlimit;
+static handle KEY_marginunit;
+static handle KEY_marginratioparam1;
+static handle KEY_marginratioparam2;
+static handle KEY_roundlot;
+static handle KEY_lmtordminfloor;
+static handle KEY_lmtordmaxfloor;
+static handle KEY_mktordminfloor;
+static handle KEY_mktordmaxfloor;
+static handle KEY_ticksize;
+static handle KEY_lastprice;
+static handle KEY_contractid;
+static handle KEY_contractsymbol;
+static handle KEY_underlyingsecurityid;
+static handle KEY_optiontype;
+static handle KEY_callorput;
+static handle KEY_exerciseprice;
+static handle KEY_exercisedate;
+static handle KEY_deliverydate;
+static handle KEY_expiredate;
+static handle KEY_TradeQty;
+static handle KEY_CancelQty;
+static handle KEY_OrdRejReason;
+static handle KEY_Margin;
+static handle KEY_Status;
+static handle KEY_MarginRatio;
+static handle KEY_MinMarginRatio;
+static handle KEY_AccountID;
+static handle KEY_deposit;
+static handle KEY_withdraw;
+static handle KEY_CombID;
+static handle KEY_commargin;
+static handle KEY_PosiQty;
+static handle KEY_LegSecurityID1;
+static handle KEY_LegOrderQty1;
+static handle KEY_LegSecurityID2;
+static handle KEY_LegOrderQty2;
+
+void initDictKeys()
+{
+	KEY_SequenceSeries = PyUnicode_InternFromString("SequenceSeries");
+	KEY_SequenceNo = PyUnicode_InternFromString("SequenceNo");
+	KEY_ErrorID = PyUnicode_InternFromString("ErrorID");
+	KEY_ErrorMsg = PyUnicode_InternFromString("ErrorMsg");
+	KEY_TradingDay = PyUnicode_InternFromString("TradingDay");
+	KEY_LoginTime = PyUnicode_InternFromString("LoginTime");
+	KEY_MaxClOrdID = PyUnicode_InternFromString("MaxClOrdID");
+	KEY_UserID = PyUnicode_InternFromString("UserID");
+	KEY_TradingSystemName = PyUnicode_InternFromString("TradingSystemName");
+	KEY_DataCenterID = PyUnicode_InternFromString("DataCenterID");
+	KEY_PrivateFlowSize = PyUnicode_InternFromString("PrivateFlowSize");
+	KEY_UserFlowSize = PyUnicode_InternFromString("UserFlowSize");
+	KEY_ActionDay = PyUnicode_InternFromString("ActionDay");
+	KEY_OldPassword = PyUnicode_InternFromString("OldPassword");
+	KEY_NewPassword = PyUnicode_InternFromString("NewPassword");
+	KEY_OrderID = PyUnicode_InternFromString("OrderID");
+	KEY_InsertDate = PyUnicode_InternFromString("InsertDate");
+	KEY_InsertTime = PyUnicode_InternFromString("InsertTime");
+	KEY_ClOrdID = PyUnicode_InternFromString("ClOrdID");
+	KEY_SecurityID = PyUnicode_InternFromString("SecurityID");
+	KEY_OrdType = PyUnicode_InternFromString("OrdType");
+	KEY_Price = PyUnicode_InternFromString("Price");
+	KEY_OrderQty = PyUnicode_InternFromString("OrderQty");
+	KEY_Side = PyUnicode_InternFromString("Side");
+	KEY_PartyID = PyUnicode_InternFromString("PartyID");
+	KEY_Qty2 = PyUnicode_InternFromString("Qty2");
+	KEY_OrigClOrdId = PyUnicode_InternFromString("OrigClOrdId");
+	KEY_ExecType = PyUnicode_InternFromString("ExecType");
+	KEY_OrdStatus = PyUnicode_InternFromString("OrdStatus");
+	KEY_TransactTimeOnly = PyUnicode_InternFromString("TransactTimeOnly");
+	KEY_DiscretionPrice = PyUnicode_InternFromString("DiscretionPrice");
+	KEY_LeavesQty = PyUnicode_InternFromString("LeavesQty");
+	KEY_OrigClOrdID = PyUnicode_InternFromString("OrigClOrdID");
+	KEY_OwnerType = PyUnicode_InternFromString("OwnerType");
+	KEY_QuoteReqID = PyUnicode_InternFromString("QuoteReqID");
+	KEY_BidPx = PyUnicode_InternFromString("BidPx");
+	KEY_AskPx = PyUnicode_InternFromString("AskPx");
+	KEY_BidSize = PyUnicode_InternFromString("BidSize");
+	KEY_AskSize = PyUnicode_InternFromString("AskSize");
+	KEY_BidPositionEffect = PyUnicode_InternFromString("BidPositionEffect");
+	KEY_AskPositionEffect = PyUnicode_InternFromString("AskPositionEffect");
+	KEY_PreBalance = PyUnicode_InternFromString("PreBalance");
+	KEY_Balance = PyUnicode_InternFromString("Balance");
+	KEY_Available = PyUnicode_InternFromString("Available");
+	KEY_CurrMargin = PyUnicode_InternFromString("CurrMargin");
+	KEY_FrozenMargin = PyUnicode_InternFromString("FrozenMargin");
+	KEY_CombMargin = PyUnicode_InternFromString("CombMargin");
+	KEY_Premium = PyUnicode_InternFromString("Premium");
+	KEY_FrozenPremium = PyUnicode_InternFromString("FrozenPremium");
+	KEY_Commi = PyUnicode_InternFromString("Commi");
+	KEY_FrozenCommi = PyUnicode_InternFromString("FrozenCommi");
+	KEY_CloseProfit = PyUnicode_InternFromString("CloseProfit");
+	KEY_PosiProfit = PyUnicode_InternFromString("PosiProfit");
+	KEY_Deposit = PyUnicode_InternFromString("Deposit");
+	KEY_Withdraw = PyUnicode_InternFromString("Withdraw");
+	KEY_BaseReserve = PyUnicode_InternFromString("BaseReserve");
+	KEY_SaveDouble1 = PyUnicode_InternFromString("SaveDouble1");
+	KEY_SaveDouble2 = PyUnicode_InternFromString("SaveDouble2");
+	KEY_SaveDouble3 = PyUnicode_InternFromString("SaveDouble3");
+	KEY_PositionEffect = PyUnicode_InternFromString("PositionEffect");
+	KEY_TimeInForce = PyUnicode_InternFromString("TimeInForce");
+	KEY_CoveredOrUncovered = PyUnicode_InternFromString("CoveredOrUncovered");
+	KEY_TradeID = PyUnicode_InternFromString("TradeID");
+	KEY_TradeTime = PyUnicode_InternFromString("TradeTime");
+	KEY_TradeVolume = PyUnicode_InternFromString("TradeVolume");
+	KEY_Cjjg = PyUnicode_InternFromString("Cjjg");
+	KEY_Cjje = PyUnicode_InternFromString("Cjje");
+	KEY_ExecID = PyUnicode_InternFromString("ExecID");
+	KEY_LastPx = PyUnicode_InternFromString("LastPx");
+	KEY_LastQty = PyUnicode_InternFromString("LastQty");
+	KEY_OrigTime = PyUnicode_InternFromString("OrigTime");
+	KEY_TotalValueTraded = PyUnicode_InternFromString("TotalValueTraded");
+	KEY_Converd = PyUnicode_InternFromString("Converd");
+	KEY_YdPosition = PyUnicode_InternFromString("YdPosition");
+	KEY_Position = PyUnicode_InternFromString("Position");
+	KEY_TodayPosition = PyUnicode_InternFromString("TodayPosition");
+	KEY_BuyTradeVolume = PyUnicode_InternFromString("BuyTradeVolume");
+	KEY_SellTradeVolume = PyUnicode_InternFromString("SellTradeVolume");
+	KEY_PositionCost = PyUnicode_InternFromString("PositionCost");
+	KEY_YdPositionCost = PyUnicode_InternFromString("YdPositionCost");
+	KEY_UseMargin = PyUnicode_InternFromString("UseMargin");
+	KEY_contractmultiplierunit = PyUnicode_InternFromString("contractmultiplierunit");
+	KEY_startdate = PyUnicode_InternFromString("startdate");
+	KEY_enddate = PyUnicode_InternFromString("enddate");
+	KEY_totallongposition = PyUnicode_InternFromString("totallongposition");
+	KEY_securityclosepx = PyUnicode_InternFromString("securityclosepx");
+	KEY_settlprice = PyUnicode_InternFromString("settlprice");
+	KEY_underlyingclosepx = PyUnicode_InternFromString("underlyingclosepx");
+	KEY_dailypriceuplimit = PyUnicode_InternFromString("dailypriceuplimit");
+	KEY_dailypricedownlimit = PyUnicode_InternFromString("dailypricedownlimit");
+	KEY_marginunit = PyUnicode_InternFromString("marginunit");
+	KEY_marginratioparam1 = PyUnicode_InternFromString("marginratioparam1");
+	KEY_marginratioparam2 = PyUnicode_InternFromString("marginratioparam2");
+	KEY_roundlot = PyUnicode_InternFromString("roundlot");
+	KEY_lmtordminfloor = PyUnicode_InternFromString("lmtordminfloor");
+	KEY_lmtordmaxfloor = PyUnicode_InternFromString("lmtordmaxfloor");
+	KEY_mktordminfloor = PyUnicode_InternFromString("mktordminfloor");
+	KEY_mktordmaxfloor = PyUnicode_InternFromString("mktordmaxfloor");
+	KEY_ticksize = PyUnicode_InternFromString("ticksize");
+	KEY_lastprice = PyUnicode_InternFromString("lastprice");
+	KEY_contractid = PyUnicode_InternFromString("contractid");
+	KEY_contractsymbol = PyUnicode_InternFromString("contractsymbol");
+	KEY_underlyingsecurityid = PyUnicode_InternFromString("underlyingsecurityid");
+	KEY_optiontype = PyUnicode_InternFromString("optiontype");
+	KEY_callorput = PyUnicode_InternFromString("callorput");
+	KEY_exerciseprice = PyUnicode_InternFromString("exerciseprice");
+	KEY_exercisedate = PyUnicode_InternFromString("exercisedate");
+	KEY_deliverydate = PyUnicode_InternFromString("deliverydate");
+	KEY_expiredate = PyUnicode_InternFromString("expiredate");
+	KEY_TradeQty = PyUnicode_InternFromString("TradeQty");
+	KEY_CancelQty = PyUnicode_InternFromString("CancelQty");
+	KEY_OrdRejReason = PyUnicode_InternFromString("OrdRejReason");
+	KEY_Margin = PyUnicode_InternFromString("Margin");
+	KEY_Status = PyUnicode_InternFromString("Status");
+	KEY_MarginRatio = PyUnicode_InternFromString("MarginRatio");
+	KEY_MinMarginRatio = PyUnicode_InternFromString("MinMarginRatio");
+	KEY_AccountID = PyUnicode_InternFromString("AccountID");
+	KEY_deposit = PyUnicode_InternFromString("deposit");
+	KEY_withdraw = PyUnicode_InternFromString("withdraw");
+	KEY_CombID = PyUnicode_InternFromString("CombID");
+	KEY_commargin = PyUnicode_InternFromString("commargin");
+	KEY_PosiQty = PyUnicode_InternFromString("PosiQty");
+	KEY_LegSecurityID1 = PyUnicode_InternFromString("LegSecurityID1");
+	KEY_LegOrderQty1 = PyUnicode_InternFromString("LegOrderQty1");
+	KEY_LegSecurityID2 = PyUnicode_InternFromString("LegSecurityID2");
+	KEY_LegOrderQty2 = PyUnicode_InternFromString("LegOrderQty2");
+};
+
+
 ///-------------------------------------------------------------------------------------
 ///C++的回调函数将数据保存到队列中
 ///-------------------------------------------------------------------------------------
@@ -45,13 +307,13 @@ void StockTdApi::OnRspSubscribeTopic(CStockFtdcDisseminationField *pDisseminatio
 	task.task_name = ONRSPSUBSCRIBETOPIC;
 	if (pDissemination)
 	{
-		CStockFtdcDisseminationField *task_data = new CStockFtdcDisseminationField();
+		CStockFtdcDisseminationField *task_data = createTaskData<CStockFtdcDisseminationField>();
 		*task_data = *pDissemination;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -66,13 +328,13 @@ void StockTdApi::OnRspUserLogin(CStockFtdcRspUserLoginField *pRspUserLogin, CSto
 	task.task_name = ONRSPUSERLOGIN;
 	if (pRspUserLogin)
 	{
-		CStockFtdcRspUserLoginField *task_data = new CStockFtdcRspUserLoginField();
+		CStockFtdcRspUserLoginField *task_data = createTaskData<CStockFtdcRspUserLoginField>();
 		*task_data = *pRspUserLogin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -87,13 +349,13 @@ void StockTdApi::OnRspUserLogout(CStockFtdcRspUserLogoutField *pRspUserLogout, C
 	task.task_name = ONRSPUSERLOGOUT;
 	if (pRspUserLogout)
 	{
-		CStockFtdcRspUserLogoutField *task_data = new CStockFtdcRspUserLogoutField();
+		CStockFtdcRspUserLogoutField *task_data = createTaskData<CStockFtdcRspUserLogoutField>();
 		*task_data = *pRspUserLogout;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -108,13 +370,13 @@ void StockTdApi::OnRspUserPasswordUpdate(CStockFtdcUserPasswordUpdateField *pUse
 	task.task_name = ONRSPUSERPASSWORDUPDATE;
 	if (pUserPasswordUpdate)
 	{
-		CStockFtdcUserPasswordUpdateField *task_data = new CStockFtdcUserPasswordUpdateField();
+		CStockFtdcUserPasswordUpdateField *task_data = createTaskData<CStockFtdcUserPasswordUpdateField>();
 		*task_data = *pUserPasswordUpdate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -129,13 +391,13 @@ void StockTdApi::OnRspStockInsert(CStockFtdcStockInsertRspField *pStockInsert, C
 	task.task_name = ONRSPSTOCKINSERT;
 	if (pStockInsert)
 	{
-		CStockFtdcStockInsertRspField *task_data = new CStockFtdcStockInsertRspField();
+		CStockFtdcStockInsertRspField *task_data = createTaskData<CStockFtdcStockInsertRspField>();
 		*task_data = *pStockInsert;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -150,13 +412,13 @@ void StockTdApi::OnRspStockCancel(CStockFtdcStockCancelRspField *pStockCancel, C
 	task.task_name = ONRSPSTOCKCANCEL;
 	if (pStockCancel)
 	{
-		CStockFtdcStockCancelRspField *task_data = new CStockFtdcStockCancelRspField();
+		CStockFtdcStockCancelRspField *task_data = createTaskData<CStockFtdcStockCancelRspField>();
 		*task_data = *pStockCancel;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -171,13 +433,13 @@ void StockTdApi::OnRspOptionsInsert(CStockFtdcOptionsInsertRspField *pOptionsIns
 	task.task_name = ONRSPOPTIONSINSERT;
 	if (pOptionsInsert)
 	{
-		CStockFtdcOptionsInsertRspField *task_data = new CStockFtdcOptionsInsertRspField();
+		CStockFtdcOptionsInsertRspField *task_data = createTaskData<CStockFtdcOptionsInsertRspField>();
 		*task_data = *pOptionsInsert;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -192,13 +454,13 @@ void StockTdApi::OnRspOptionsCancel(CStockFtdcOptionsCancelRspField *pOptionsCan
 	task.task_name = ONRSPOPTIONSCANCEL;
 	if (pOptionsCancel)
 	{
-		CStockFtdcOptionsCancelRspField *task_data = new CStockFtdcOptionsCancelRspField();
+		CStockFtdcOptionsCancelRspField *task_data = createTaskData<CStockFtdcOptionsCancelRspField>();
 		*task_data = *pOptionsCancel;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -213,13 +475,13 @@ void StockTdApi::OnRspQuoteInsert(CStockFtdcQuoteInsertRspField *pQuoteInsert, C
 	task.task_name = ONRSPQUOTEINSERT;
 	if (pQuoteInsert)
 	{
-		CStockFtdcQuoteInsertRspField *task_data = new CStockFtdcQuoteInsertRspField();
+		CStockFtdcQuoteInsertRspField *task_data = createTaskData<CStockFtdcQuoteInsertRspField>();
 		*task_data = *pQuoteInsert;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -234,13 +496,13 @@ void StockTdApi::OnRspForQuote(CStockFtdcForQuoteRspField *pForQuote, CStockFtdc
 	task.task_name = ONRSPFORQUOTE;
 	if (pForQuote)
 	{
-		CStockFtdcForQuoteRspField *task_data = new CStockFtdcForQuoteRspField();
+		CStockFtdcForQuoteRspField *task_data = createTaskData<CStockFtdcForQuoteRspField>();
 		*task_data = *pForQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -255,13 +517,13 @@ void StockTdApi::OnRspQuoteCancel(CStockFtdcQuoteCancelRspField *pQuoteCancel, C
 	task.task_name = ONRSPQUOTECANCEL;
 	if (pQuoteCancel)
 	{
-		CStockFtdcQuoteCancelRspField *task_data = new CStockFtdcQuoteCancelRspField();
+		CStockFtdcQuoteCancelRspField *task_data = createTaskData<CStockFtdcQuoteCancelRspField>();
 		*task_data = *pQuoteCancel;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -276,13 +538,13 @@ void StockTdApi::OnRspStockLock(CStockFtdcStockLockRspField *pStockLock, CStockF
 	task.task_name = ONRSPSTOCKLOCK;
 	if (pStockLock)
 	{
-		CStockFtdcStockLockRspField *task_data = new CStockFtdcStockLockRspField();
+		CStockFtdcStockLockRspField *task_data = createTaskData<CStockFtdcStockLockRspField>();
 		*task_data = *pStockLock;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -297,13 +559,13 @@ void StockTdApi::OnRspExercise(CStockFtdcExerciseRspField *pExercise, CStockFtdc
 	task.task_name = ONRSPEXERCISE;
 	if (pExercise)
 	{
-		CStockFtdcExerciseRspField *task_data = new CStockFtdcExerciseRspField();
+		CStockFtdcExerciseRspField *task_data = createTaskData<CStockFtdcExerciseRspField>();
 		*task_data = *pExercise;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -318,13 +580,13 @@ void StockTdApi::OnRspExerciseCancel(CStockFtdcExerciseCancelRspField *pExercise
 	task.task_name = ONRSPEXERCISECANCEL;
 	if (pExercise)
 	{
-		CStockFtdcExerciseCancelRspField *task_data = new CStockFtdcExerciseCancelRspField();
+		CStockFtdcExerciseCancelRspField *task_data = createTaskData<CStockFtdcExerciseCancelRspField>();
 		*task_data = *pExercise;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -339,13 +601,13 @@ void StockTdApi::OnRspQryPartAccount(CStockFtdcRspPartAccountField *pRspPartAcco
 	task.task_name = ONRSPQRYPARTACCOUNT;
 	if (pRspPartAccount)
 	{
-		CStockFtdcRspPartAccountField *task_data = new CStockFtdcRspPartAccountField();
+		CStockFtdcRspPartAccountField *task_data = createTaskData<CStockFtdcRspPartAccountField>();
 		*task_data = *pRspPartAccount;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -360,13 +622,13 @@ void StockTdApi::OnRspQryStockOrder(CStockFtdcRspQryStockOrderField *pOrder, CSt
 	task.task_name = ONRSPQRYSTOCKORDER;
 	if (pOrder)
 	{
-		CStockFtdcRspQryStockOrderField *task_data = new CStockFtdcRspQryStockOrderField();
+		CStockFtdcRspQryStockOrderField *task_data = createTaskData<CStockFtdcRspQryStockOrderField>();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -381,13 +643,13 @@ void StockTdApi::OnRspQryOptionsOrder(CStockFtdcRspQryOptionsOrderField *pOrder,
 	task.task_name = ONRSPQRYOPTIONSORDER;
 	if (pOrder)
 	{
-		CStockFtdcRspQryOptionsOrderField *task_data = new CStockFtdcRspQryOptionsOrderField();
+		CStockFtdcRspQryOptionsOrderField *task_data = createTaskData<CStockFtdcRspQryOptionsOrderField>();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -402,13 +664,13 @@ void StockTdApi::OnRspQryQuoteOrder(CStockFtdcRspQryQuoteOrderField *pQuote, CSt
 	task.task_name = ONRSPQRYQUOTEORDER;
 	if (pQuote)
 	{
-		CStockFtdcRspQryQuoteOrderField *task_data = new CStockFtdcRspQryQuoteOrderField();
+		CStockFtdcRspQryQuoteOrderField *task_data = createTaskData<CStockFtdcRspQryQuoteOrderField>();
 		*task_data = *pQuote;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -423,13 +685,13 @@ void StockTdApi::OnRspQryStockTrade(CStockFtdcStockTradeField *pTrade, CStockFtd
 	task.task_name = ONRSPQRYSTOCKTRADE;
 	if (pTrade)
 	{
-		CStockFtdcStockTradeField *task_data = new CStockFtdcStockTradeField();
+		CStockFtdcStockTradeField *task_data = createTaskData<CStockFtdcStockTradeField>();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -444,13 +706,13 @@ void StockTdApi::OnRspQryOptionsTrade(CStockFtdcOptionsTradeField *pTrade, CStoc
 	task.task_name = ONRSPQRYOPTIONSTRADE;
 	if (pTrade)
 	{
-		CStockFtdcOptionsTradeField *task_data = new CStockFtdcOptionsTradeField();
+		CStockFtdcOptionsTradeField *task_data = createTaskData<CStockFtdcOptionsTradeField>();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -465,13 +727,13 @@ void StockTdApi::OnRspQryPosition(CStockFtdcRspPositionField *pPosition, CStockF
 	task.task_name = ONRSPQRYPOSITION;
 	if (pPosition)
 	{
-		CStockFtdcRspPositionField *task_data = new CStockFtdcRspPositionField();
+		CStockFtdcRspPositionField *task_data = createTaskData<CStockFtdcRspPositionField>();
 		*task_data = *pPosition;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -486,13 +748,13 @@ void StockTdApi::OnRspQryTopic(CStockFtdcDisseminationField *pDissemination, CSt
 	task.task_name = ONRSPQRYTOPIC;
 	if (pDissemination)
 	{
-		CStockFtdcDisseminationField *task_data = new CStockFtdcDisseminationField();
+		CStockFtdcDisseminationField *task_data = createTaskData<CStockFtdcDisseminationField>();
 		*task_data = *pDissemination;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -507,13 +769,13 @@ void StockTdApi::OnRspQryStock(CStockFtdcRspQryStockField *pStock, CStockFtdcRsp
 	task.task_name = ONRSPQRYSTOCK;
 	if (pStock)
 	{
-		CStockFtdcRspQryStockField *task_data = new CStockFtdcRspQryStockField();
+		CStockFtdcRspQryStockField *task_data = createTaskData<CStockFtdcRspQryStockField>();
 		*task_data = *pStock;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -528,13 +790,13 @@ void StockTdApi::OnRspQryOptions(CStockFtdcRspQryOptionsField *pOptions, CStockF
 	task.task_name = ONRSPQRYOPTIONS;
 	if (pOptions)
 	{
-		CStockFtdcRspQryOptionsField *task_data = new CStockFtdcRspQryOptionsField();
+		CStockFtdcRspQryOptionsField *task_data = createTaskData<CStockFtdcRspQryOptionsField>();
 		*task_data = *pOptions;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -549,7 +811,7 @@ void StockTdApi::OnRtnOptionsOrder(CStockFtdcOptionsOrderField *pOrder)
 	task.task_name = ONRTNOPTIONSORDER;
 	if (pOrder)
 	{
-		CStockFtdcOptionsOrderField *task_data = new CStockFtdcOptionsOrderField();
+		CStockFtdcOptionsOrderField *task_data = createTaskData<CStockFtdcOptionsOrderField>();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
@@ -562,7 +824,7 @@ void StockTdApi::OnRtnStockOrder(CStockFtdcStockOrderField *pOrder)
 	task.task_name = ONRTNSTOCKORDER;
 	if (pOrder)
 	{
-		CStockFtdcStockOrderField *task_data = new CStockFtdcStockOrderField();
+		CStockFtdcStockOrderField *task_data = createTaskData<CStockFtdcStockOrderField>();
 		*task_data = *pOrder;
 		task.task_data = task_data;
 	}
@@ -575,7 +837,7 @@ void StockTdApi::OnRtnQuoteOrder(CStockFtdcQuoteOrderField *pQuote)
 	task.task_name = ONRTNQUOTEORDER;
 	if (pQuote)
 	{
-		CStockFtdcQuoteOrderField *task_data = new CStockFtdcQuoteOrderField();
+		CStockFtdcQuoteOrderField *task_data = createTaskData<CStockFtdcQuoteOrderField>();
 		*task_data = *pQuote;
 		task.task_data = task_data;
 	}
@@ -588,7 +850,7 @@ void StockTdApi::OnRtnOptionsTrade(CStockFtdcOptionsTradeField *pTrade)
 	task.task_name = ONRTNOPTIONSTRADE;
 	if (pTrade)
 	{
-		CStockFtdcOptionsTradeField *task_data = new CStockFtdcOptionsTradeField();
+		CStockFtdcOptionsTradeField *task_data = createTaskData<CStockFtdcOptionsTradeField>();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
@@ -601,7 +863,7 @@ void StockTdApi::OnRtnStockTrade(CStockFtdcStockTradeField *pTrade)
 	task.task_name = ONRTNSTOCKTRADE;
 	if (pTrade)
 	{
-		CStockFtdcStockTradeField *task_data = new CStockFtdcStockTradeField();
+		CStockFtdcStockTradeField *task_data = createTaskData<CStockFtdcStockTradeField>();
 		*task_data = *pTrade;
 		task.task_data = task_data;
 	}
@@ -614,7 +876,7 @@ void StockTdApi::OnRtnExercise(CStockFtdcExerciseRtnField *pExercise)
 	task.task_name = ONRTNEXERCISE;
 	if (pExercise)
 	{
-		CStockFtdcExerciseRtnField *task_data = new CStockFtdcExerciseRtnField();
+		CStockFtdcExerciseRtnField *task_data = createTaskData<CStockFtdcExerciseRtnField>();
 		*task_data = *pExercise;
 		task.task_data = task_data;
 	}
@@ -627,13 +889,13 @@ void StockTdApi::OnRspQryRate(CStockFtdcRspQryRateField *pRate, CStockFtdcRspInf
 	task.task_name = ONRSPQRYRATE;
 	if (pRate)
 	{
-		CStockFtdcRspQryRateField *task_data = new CStockFtdcRspQryRateField();
+		CStockFtdcRspQryRateField *task_data = createTaskData<CStockFtdcRspQryRateField>();
 		*task_data = *pRate;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -648,13 +910,13 @@ void StockTdApi::OnRspQryClient(CStockFtdcRspClientField *pRspClient, CStockFtdc
 	task.task_name = ONRSPQRYCLIENT;
 	if (pRspClient)
 	{
-		CStockFtdcRspClientField *task_data = new CStockFtdcRspClientField();
+		CStockFtdcRspClientField *task_data = createTaskData<CStockFtdcRspClientField>();
 		*task_data = *pRspClient;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -669,13 +931,13 @@ void StockTdApi::OnRspQryClientMargin(CStockFtdcRspQryClientMarginField *pRspMar
 	task.task_name = ONRSPQRYCLIENTMARGIN;
 	if (pRspMargin)
 	{
-		CStockFtdcRspQryClientMarginField *task_data = new CStockFtdcRspQryClientMarginField();
+		CStockFtdcRspQryClientMarginField *task_data = createTaskData<CStockFtdcRspQryClientMarginField>();
 		*task_data = *pRspMargin;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -690,13 +952,13 @@ void StockTdApi::OnRspQryExercise(CStockFtdcExerciseRtnField *pExercise, CStockF
 	task.task_name = ONRSPQRYEXERCISE;
 	if (pExercise)
 	{
-		CStockFtdcExerciseRtnField *task_data = new CStockFtdcExerciseRtnField();
+		CStockFtdcExerciseRtnField *task_data = createTaskData<CStockFtdcExerciseRtnField>();
 		*task_data = *pExercise;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -711,7 +973,7 @@ void StockTdApi::OnRtnWithdrawDeposit(CStockFtdcWithdrawDepositRtnField *pWithdr
 	task.task_name = ONRTNWITHDRAWDEPOSIT;
 	if (pWithdrawDeposit)
 	{
-		CStockFtdcWithdrawDepositRtnField *task_data = new CStockFtdcWithdrawDepositRtnField();
+		CStockFtdcWithdrawDepositRtnField *task_data = createTaskData<CStockFtdcWithdrawDepositRtnField>();
 		*task_data = *pWithdrawDeposit;
 		task.task_data = task_data;
 	}
@@ -724,13 +986,13 @@ void StockTdApi::OnRspMarginCombAction(CStockFtdcMarginCombActionRspField *pMarg
 	task.task_name = ONRSPMARGINCOMBACTION;
 	if (pMarginCombAction)
 	{
-		CStockFtdcMarginCombActionRspField *task_data = new CStockFtdcMarginCombActionRspField();
+		CStockFtdcMarginCombActionRspField *task_data = createTaskData<CStockFtdcMarginCombActionRspField>();
 		*task_data = *pMarginCombAction;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -745,7 +1007,7 @@ void StockTdApi::OnRtnMarginCombAction(CStockFtdcMarginCombActionRtnField *pMarg
 	task.task_name = ONRTNMARGINCOMBACTION;
 	if (pMarginCombAction)
 	{
-		CStockFtdcMarginCombActionRtnField *task_data = new CStockFtdcMarginCombActionRtnField();
+		CStockFtdcMarginCombActionRtnField *task_data = createTaskData<CStockFtdcMarginCombActionRtnField>();
 		*task_data = *pMarginCombAction;
 		task.task_data = task_data;
 	}
@@ -758,13 +1020,13 @@ void StockTdApi::OnRspQrySseCombPosition(CStockFtdcCombPositionRspField *pPosi,
 	task.task_name = ONRSPQRYSSECOMBPOSITION;
 	if (pPosi)
 	{
-		CStockFtdcCombPositionRspField *task_data = new CStockFtdcCombPositionRspField();
+		CStockFtdcCombPositionRspField *task_data = createTaskData<CStockFtdcCombPositionRspField>();
 		*task_data = *pPosi;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -779,13 +1041,13 @@ void StockTdApi::OnRspCombExercise(CStockFtdcCombExerciseRspField *pExercise, CS
 	task.task_name = ONRSPCOMBEXERCISE;
 	if (pExercise)
 	{
-		CStockFtdcCombExerciseRspField *task_data = new CStockFtdcCombExerciseRspField();
+		CStockFtdcCombExerciseRspField *task_data = createTaskData<CStockFtdcCombExerciseRspField>();
 		*task_data = *pExercise;
 		task.task_data = task_data;
 	}
 	if (pRspInfo)
 	{
-		CStockFtdcRspInfoField *task_error = new CStockFtdcRspInfoField();
+		CStockFtdcRspInfoField *task_error = createTaskData<CStockFtdcRspInfoField>();
 		*task_error = *pRspInfo;
 		task.task_error = task_error;
 	}
@@ -806,6 +1068,8 @@ void StockTdApi::processTask()
 		while (this->active)
 		{
 			Task task = this->task_queue.pop();
+			long long start = getTimestamp();
+
 			switch (task.task_name)
 			{
 			case ONFRONTCONNECTED:
@@ -1061,6 +1325,9 @@ void StockTdApi::processTask()
 				break;
 			}
 			};
+
+			//记录入队到分发的延时以及回调处理耗时
+			this->task_stats.record(task.task_name, start - task.task_time, getTimestamp() - start);
 		}
 	}
 	catch (const TerminatedError&)
@@ -1093,17 +1360,17 @@ void StockTdApi::processRspSubscribeTopic(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcDisseminationField *task_data = (CStockFtdcDisseminationField*)task->task_data;
-		data["SequenceSeries"] = task_data->SequenceSeries;
-		data["SequenceNo"] = task_data->SequenceNo;
-		delete task_data;
+		data[KEY_SequenceSeries] = task_data->SequenceSeries;
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspSubscribeTopic(data, error, task->task_id, task->task_last);
 };
@@ -1115,24 +1382,24 @@ void StockTdApi::processRspUserLogin(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspUserLoginField *task_data = (CStockFtdcRspUserLoginField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["LoginTime"] = toUtf(task_data->LoginTime);
-		data["MaxClOrdID"] = task_data->MaxClOrdID;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["TradingSystemName"] = toUtf(task_data->TradingSystemName);
-		data["DataCenterID"] = task_data->DataCenterID;
-		data["PrivateFlowSize"] = task_data->PrivateFlowSize;
-		data["UserFlowSize"] = task_data->UserFlowSize;
-		data["ActionDay"] = toUtf(task_data->ActionDay);
-		delete task_data;
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_LoginTime] = toUtf(task_data->LoginTime);
+		data[KEY_MaxClOrdID] = task_data->MaxClOrdID;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_TradingSystemName] = toUtf(task_data->TradingSystemName);
+		data[KEY_DataCenterID] = task_data->DataCenterID;
+		data[KEY_PrivateFlowSize] = task_data->PrivateFlowSize;
+		data[KEY_UserFlowSize] = task_data->UserFlowSize;
+		data[KEY_ActionDay] = toUtf(task_data->ActionDay);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspUserLogin(data, error, task->task_id, task->task_last);
 };
@@ -1144,16 +1411,16 @@ void StockTdApi::processRspUserLogout(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspUserLogoutField *task_data = (CStockFtdcRspUserLogoutField*)task->task_data;
-		data["UserID"] = toUtf(task_data->UserID);
-		delete task_data;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspUserLogout(data, error, task->task_id, task->task_last);
 };
@@ -1165,18 +1432,18 @@ void StockTdApi::processRspUserPasswordUpdate(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcUserPasswordUpdateField *task_data = (CStockFtdcUserPasswordUpdateField*)task->task_data;
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OldPassword"] = toUtf(task_data->OldPassword);
-		data["NewPassword"] = toUtf(task_data->NewPassword);
-		delete task_data;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OldPassword] = toUtf(task_data->OldPassword);
+		data[KEY_NewPassword] = toUtf(task_data->NewPassword);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspUserPasswordUpdate(data, error, task->task_id, task->task_last);
 };
@@ -1188,26 +1455,26 @@ void StockTdApi::processRspStockInsert(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcStockInsertRspField *task_data = (CStockFtdcStockInsertRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OrdType"] = task_data->OrdType;
-		data["Price"] = task_data->Price;
-		data["OrderQty"] = task_data->OrderQty;
-		data["Side"] = task_data->Side;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["Qty2"] = task_data->Qty2;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OrdType] = task_data->OrdType;
+		data[KEY_Price] = task_data->Price;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_Qty2] = task_data->Qty2;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspStockInsert(data, error, task->task_id, task->task_last);
 };
@@ -1219,26 +1486,26 @@ void StockTdApi::processRspStockCancel(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcStockCancelRspField *task_data = (CStockFtdcStockCancelRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["Price"] = task_data->Price;
-		data["OrderQty"] = task_data->OrderQty;
-		data["Side"] = task_data->Side;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["OrigClOrdId"] = task_data->OrigClOrdId;
-		data["Qty2"] = task_data->Qty2;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_Price] = task_data->Price;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_OrigClOrdId] = task_data->OrigClOrdId;
+		data[KEY_Qty2] = task_data->Qty2;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspStockCancel(data, error, task->task_id, task->task_last);
 };
@@ -1250,23 +1517,23 @@ void StockTdApi::processRspOptionsInsert(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcOptionsInsertRspField *task_data = (CStockFtdcOptionsInsertRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ExecType"] = task_data->ExecType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["DiscretionPrice"] = task_data->DiscretionPrice;
-		data["LeavesQty"] = task_data->LeavesQty;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_DiscretionPrice] = task_data->DiscretionPrice;
+		data[KEY_LeavesQty] = task_data->LeavesQty;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspOptionsInsert(data, error, task->task_id, task->task_last);
 };
@@ -1278,24 +1545,24 @@ void StockTdApi::processRspOptionsCancel(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcOptionsCancelRspField *task_data = (CStockFtdcOptionsCancelRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ExecType"] = task_data->ExecType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["OrigClOrdID"] = task_data->OrigClOrdID;
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["DiscretionPrice"] = task_data->DiscretionPrice;
-		data["LeavesQty"] = task_data->LeavesQty;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_OrigClOrdID] = task_data->OrigClOrdID;
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_DiscretionPrice] = task_data->DiscretionPrice;
+		data[KEY_LeavesQty] = task_data->LeavesQty;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspOptionsCancel(data, error, task->task_id, task->task_last);
 };
@@ -1307,29 +1574,29 @@ void StockTdApi::processRspQuoteInsert(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcQuoteInsertRspField *task_data = (CStockFtdcQuoteInsertRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ExecType"] = task_data->ExecType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["QuoteReqID"] = toUtf(task_data->QuoteReqID);
-		data["BidPx"] = task_data->BidPx;
-		data["AskPx"] = task_data->AskPx;
-		data["BidSize"] = task_data->BidSize;
-		data["AskSize"] = task_data->AskSize;
-		data["BidPositionEffect"] = task_data->BidPositionEffect;
-		data["AskPositionEffect"] = task_data->AskPositionEffect;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_QuoteReqID] = toUtf(task_data->QuoteReqID);
+		data[KEY_BidPx] = task_data->BidPx;
+		data[KEY_AskPx] = task_data->AskPx;
+		data[KEY_BidSize] = task_data->BidSize;
+		data[KEY_AskSize] = task_data->AskSize;
+		data[KEY_BidPositionEffect] = task_data->BidPositionEffect;
+		data[KEY_AskPositionEffect] = task_data->AskPositionEffect;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQuoteInsert(data, error, task->task_id, task->task_last);
 };
@@ -1341,20 +1608,20 @@ void StockTdApi::processRspForQuote(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcForQuoteRspField *task_data = (CStockFtdcForQuoteRspField*)task->task_data;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["QuoteReqID"] = toUtf(task_data->QuoteReqID);
-		delete task_data;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_QuoteReqID] = toUtf(task_data->QuoteReqID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspForQuote(data, error, task->task_id, task->task_last);
 };
@@ -1366,21 +1633,21 @@ void StockTdApi::processRspQuoteCancel(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcQuoteCancelRspField *task_data = (CStockFtdcQuoteCancelRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ExecType"] = task_data->ExecType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["OrigClOrdID"] = task_data->OrigClOrdID;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_OrigClOrdID] = task_data->OrigClOrdID;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQuoteCancel(data, error, task->task_id, task->task_last);
 };
@@ -1392,19 +1659,19 @@ void StockTdApi::processRspStockLock(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcStockLockRspField *task_data = (CStockFtdcStockLockRspField*)task->task_data;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OrderQty"] = task_data->OrderQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		delete task_data;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspStockLock(data, error, task->task_id, task->task_last);
 };
@@ -1416,21 +1683,21 @@ void StockTdApi::processRspExercise(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcExerciseRspField *task_data = (CStockFtdcExerciseRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrderQty"] = task_data->OrderQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspExercise(data, error, task->task_id, task->task_last);
 };
@@ -1442,16 +1709,16 @@ void StockTdApi::processRspExerciseCancel(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcExerciseCancelRspField *task_data = (CStockFtdcExerciseCancelRspField*)task->task_data;
-		data["OrigClOrdID"] = task_data->OrigClOrdID;
-		delete task_data;
+		data[KEY_OrigClOrdID] = task_data->OrigClOrdID;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspExerciseCancel(data, error, task->task_id, task->task_last);
 };
@@ -1463,35 +1730,35 @@ void StockTdApi::processRspQryPartAccount(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspPartAccountField *task_data = (CStockFtdcRspPartAccountField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["PreBalance"] = task_data->PreBalance;
-		data["Balance"] = task_data->Balance;
-		data["Available"] = task_data->Available;
-		data["CurrMargin"] = task_data->CurrMargin;
-		data["FrozenMargin"] = task_data->FrozenMargin;
-		data["CombMargin"] = task_data->CombMargin;
-		data["Premium"] = task_data->Premium;
-		data["FrozenPremium"] = task_data->FrozenPremium;
-		data["Commi"] = task_data->Commi;
-		data["FrozenCommi"] = task_data->FrozenCommi;
-		data["CloseProfit"] = task_data->CloseProfit;
-		data["PosiProfit"] = task_data->PosiProfit;
-		data["Deposit"] = task_data->Deposit;
-		data["Withdraw"] = task_data->Withdraw;
-		data["BaseReserve"] = task_data->BaseReserve;
-		data["SaveDouble1"] = task_data->SaveDouble1;
-		data["SaveDouble2"] = task_data->SaveDouble2;
-		data["SaveDouble3"] = task_data->SaveDouble3;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_TradingDay] = toUtf(task_data->TradingDay);
+		data[KEY_PreBalance] = task_data->PreBalance;
+		data[KEY_Balance] = task_data->Balance;
+		data[KEY_Available] = task_data->Available;
+		data[KEY_CurrMargin] = task_data->CurrMargin;
+		data[KEY_FrozenMargin] = task_data->FrozenMargin;
+		data[KEY_CombMargin] = task_data->CombMargin;
+		data[KEY_Premium] = task_data->Premium;
+		data[KEY_FrozenPremium] = task_data->FrozenPremium;
+		data[KEY_Commi] = task_data->Commi;
+		data[KEY_FrozenCommi] = task_data->FrozenCommi;
+		data[KEY_CloseProfit] = task_data->CloseProfit;
+		data[KEY_PosiProfit] = task_data->PosiProfit;
+		data[KEY_Deposit] = task_data->Deposit;
+		data[KEY_Withdraw] = task_data->Withdraw;
+		data[KEY_BaseReserve] = task_data->BaseReserve;
+		data[KEY_SaveDouble1] = task_data->SaveDouble1;
+		data[KEY_SaveDouble2] = task_data->SaveDouble2;
+		data[KEY_SaveDouble3] = task_data->SaveDouble3;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryPartAccount(data, error, task->task_id, task->task_last);
 };
@@ -1503,26 +1770,26 @@ void StockTdApi::processRspQryStockOrder(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryStockOrderField *task_data = (CStockFtdcRspQryStockOrderField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OrdType"] = task_data->OrdType;
-		data["Price"] = task_data->Price;
-		data["OrderQty"] = task_data->OrderQty;
-		data["Side"] = task_data->Side;
-		data["Qty2"] = task_data->Qty2;
-		data["OrdStatus"] = task_data->OrdStatus;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OrdType] = task_data->OrdType;
+		data[KEY_Price] = task_data->Price;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_Qty2] = task_data->Qty2;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryStockOrder(data, error, task->task_id, task->task_last);
 };
@@ -1534,33 +1801,33 @@ void StockTdApi::processRspQryOptionsOrder(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryOptionsOrderField *task_data = (CStockFtdcRspQryOptionsOrderField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ExecType"] = task_data->ExecType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["DiscretionPrice"] = task_data->DiscretionPrice;
-		data["LeavesQty"] = task_data->LeavesQty;
-		data["OwnerType"] = task_data->OwnerType;
-		data["Price"] = task_data->Price;
-		data["OrderQty"] = task_data->OrderQty;
-		data["Side"] = task_data->Side;
-		data["PositionEffect"] = task_data->PositionEffect;
-		data["OrdType"] = task_data->OrdType;
-		data["TimeInForce"] = task_data->TimeInForce;
-		data["CoveredOrUncovered"] = task_data->CoveredOrUncovered;
-		data["UserID"] = toUtf(task_data->UserID);
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_DiscretionPrice] = task_data->DiscretionPrice;
+		data[KEY_LeavesQty] = task_data->LeavesQty;
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_Price] = task_data->Price;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_PositionEffect] = task_data->PositionEffect;
+		data[KEY_OrdType] = task_data->OrdType;
+		data[KEY_TimeInForce] = task_data->TimeInForce;
+		data[KEY_CoveredOrUncovered] = task_data->CoveredOrUncovered;
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOptionsOrder(data, error, task->task_id, task->task_last);
 };
@@ -1572,28 +1839,28 @@ void StockTdApi::processRspQryQuoteOrder(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryQuoteOrderField *task_data = (CStockFtdcRspQryQuoteOrderField*)task->task_data;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["QuoteReqID"] = toUtf(task_data->QuoteReqID);
-		data["BidPx"] = task_data->BidPx;
-		data["AskPx"] = task_data->AskPx;
-		data["BidSize"] = task_data->BidSize;
-		data["AskSize"] = task_data->AskSize;
-		data["BidPositionEffect"] = task_data->BidPositionEffect;
-		data["AskPositionEffect"] = task_data->AskPositionEffect;
-		delete task_data;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_QuoteReqID] = toUtf(task_data->QuoteReqID);
+		data[KEY_BidPx] = task_data->BidPx;
+		data[KEY_AskPx] = task_data->AskPx;
+		data[KEY_BidSize] = task_data->BidSize;
+		data[KEY_AskSize] = task_data->AskSize;
+		data[KEY_BidPositionEffect] = task_data->BidPositionEffect;
+		data[KEY_AskPositionEffect] = task_data->AskPositionEffect;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryQuoteOrder(data, error, task->task_id, task->task_last);
 };
@@ -1605,27 +1872,27 @@ void StockTdApi::processRspQryStockTrade(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcStockTradeField *task_data = (CStockFtdcStockTradeField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["TradeVolume"] = task_data->TradeVolume;
-		data["Side"] = task_data->Side;
-		data["Cjjg"] = task_data->Cjjg;
-		data["Cjje"] = task_data->Cjje;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_TradeID] = toUtf(task_data->TradeID);
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_TradeVolume] = task_data->TradeVolume;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_Cjjg] = task_data->Cjjg;
+		data[KEY_Cjje] = task_data->Cjje;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryStockTrade(data, error, task->task_id, task->task_last);
 };
@@ -1637,32 +1904,32 @@ void StockTdApi::processRspQryOptionsTrade(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcOptionsTradeField *task_data = (CStockFtdcOptionsTradeField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["ExecID"] = toUtf(task_data->ExecID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["LastPx"] = task_data->LastPx;
-		data["LastQty"] = task_data->LastQty;
-		data["LeavesQty"] = task_data->LeavesQty;
-		data["Side"] = task_data->Side;
-		data["PositionEffect"] = task_data->PositionEffect;
-		data["CoveredOrUncovered"] = task_data->CoveredOrUncovered;
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["OrigTime"] = toUtf(task_data->OrigTime);
-		data["ExecType"] = task_data->ExecType;
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["TotalValueTraded"] = task_data->TotalValueTraded;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_ExecID] = toUtf(task_data->ExecID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_LastPx] = task_data->LastPx;
+		data[KEY_LastQty] = task_data->LastQty;
+		data[KEY_LeavesQty] = task_data->LeavesQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_PositionEffect] = task_data->PositionEffect;
+		data[KEY_CoveredOrUncovered] = task_data->CoveredOrUncovered;
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_OrigTime] = toUtf(task_data->OrigTime);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_TotalValueTraded] = task_data->TotalValueTraded;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOptionsTrade(data, error, task->task_id, task->task_last);
 };
@@ -1674,27 +1941,27 @@ void StockTdApi::processRspQryPosition(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspPositionField *task_data = (CStockFtdcRspPositionField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["Converd"] = task_data->Converd;
-		data["Side"] = task_data->Side;
-		data["YdPosition"] = task_data->YdPosition;
-		data["Position"] = task_data->Position;
-		data["TodayPosition"] = task_data->TodayPosition;
-		data["BuyTradeVolume"] = task_data->BuyTradeVolume;
-		data["SellTradeVolume"] = task_data->SellTradeVolume;
-		data["PositionCost"] = task_data->PositionCost;
-		data["YdPositionCost"] = task_data->YdPositionCost;
-		data["UseMargin"] = task_data->UseMargin;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_Converd] = task_data->Converd;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_YdPosition] = task_data->YdPosition;
+		data[KEY_Position] = task_data->Position;
+		data[KEY_TodayPosition] = task_data->TodayPosition;
+		data[KEY_BuyTradeVolume] = task_data->BuyTradeVolume;
+		data[KEY_SellTradeVolume] = task_data->SellTradeVolume;
+		data[KEY_PositionCost] = task_data->PositionCost;
+		data[KEY_YdPositionCost] = task_data->YdPositionCost;
+		data[KEY_UseMargin] = task_data->UseMargin;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryPosition(data, error, task->task_id, task->task_last);
 };
@@ -1706,17 +1973,17 @@ void StockTdApi::processRspQryTopic(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcDisseminationField *task_data = (CStockFtdcDisseminationField*)task->task_data;
-		data["SequenceSeries"] = task_data->SequenceSeries;
-		data["SequenceNo"] = task_data->SequenceNo;
-		delete task_data;
+		data[KEY_SequenceSeries] = task_data->SequenceSeries;
+		data[KEY_SequenceNo] = task_data->SequenceNo;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryTopic(data, error, task->task_id, task->task_last);
 };
@@ -1728,35 +1995,35 @@ void StockTdApi::processRspQryStock(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryStockField *task_data = (CStockFtdcRspQryStockField*)task->task_data;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["contractmultiplierunit"] = task_data->contractmultiplierunit;
-		data["startdate"] = toUtf(task_data->startdate);
-		data["enddate"] = toUtf(task_data->enddate);
-		data["totallongposition"] = task_data->totallongposition;
-		data["securityclosepx"] = task_data->securityclosepx;
-		data["settlprice"] = task_data->settlprice;
-		data["underlyingclosepx"] = task_data->underlyingclosepx;
-		data["dailypriceuplimit"] = task_data->dailypriceuplimit;
-		data["dailypricedownlimit"] = task_data->dailypricedownlimit;
-		data["marginunit"] = task_data->marginunit;
-		data["marginratioparam1"] = task_data->marginratioparam1;
-		data["marginratioparam2"] = task_data->marginratioparam2;
-		data["roundlot"] = task_data->roundlot;
-		data["lmtordminfloor"] = task_data->lmtordminfloor;
-		data["lmtordmaxfloor"] = task_data->lmtordmaxfloor;
-		data["mktordminfloor"] = task_data->mktordminfloor;
-		data["mktordmaxfloor"] = task_data->mktordmaxfloor;
-		data["ticksize"] = task_data->ticksize;
-		data["lastprice"] = task_data->lastprice;
-		delete task_data;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_contractmultiplierunit] = task_data->contractmultiplierunit;
+		data[KEY_startdate] = toUtf(task_data->startdate);
+		data[KEY_enddate] = toUtf(task_data->enddate);
+		data[KEY_totallongposition] = task_data->totallongposition;
+		data[KEY_securityclosepx] = task_data->securityclosepx;
+		data[KEY_settlprice] = task_data->settlprice;
+		data[KEY_underlyingclosepx] = task_data->underlyingclosepx;
+		data[KEY_dailypriceuplimit] = task_data->dailypriceuplimit;
+		data[KEY_dailypricedownlimit] = task_data->dailypricedownlimit;
+		data[KEY_marginunit] = task_data->marginunit;
+		data[KEY_marginratioparam1] = task_data->marginratioparam1;
+		data[KEY_marginratioparam2] = task_data->marginratioparam2;
+		data[KEY_roundlot] = task_data->roundlot;
+		data[KEY_lmtordminfloor] = task_data->lmtordminfloor;
+		data[KEY_lmtordmaxfloor] = task_data->lmtordmaxfloor;
+		data[KEY_mktordminfloor] = task_data->mktordminfloor;
+		data[KEY_mktordmaxfloor] = task_data->mktordmaxfloor;
+		data[KEY_ticksize] = task_data->ticksize;
+		data[KEY_lastprice] = task_data->lastprice;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryStock(data, error, task->task_id, task->task_last);
 };
@@ -1768,44 +2035,44 @@ void StockTdApi::processRspQryOptions(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryOptionsField *task_data = (CStockFtdcRspQryOptionsField*)task->task_data;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["contractid"] = toUtf(task_data->contractid);
-		data["contractsymbol"] = toUtf(task_data->contractsymbol);
-		data["underlyingsecurityid"] = toUtf(task_data->underlyingsecurityid);
-		data["optiontype"] = task_data->optiontype;
-		data["callorput"] = task_data->callorput;
-		data["contractmultiplierunit"] = task_data->contractmultiplierunit;
-		data["exerciseprice"] = task_data->exerciseprice;
-		data["startdate"] = toUtf(task_data->startdate);
-		data["enddate"] = toUtf(task_data->enddate);
-		data["exercisedate"] = toUtf(task_data->exercisedate);
-		data["deliverydate"] = toUtf(task_data->deliverydate);
-		data["expiredate"] = toUtf(task_data->expiredate);
-		data["totallongposition"] = task_data->totallongposition;
-		data["securityclosepx"] = task_data->securityclosepx;
-		data["settlprice"] = task_data->settlprice;
-		data["underlyingclosepx"] = task_data->underlyingclosepx;
-		data["dailypriceuplimit"] = task_data->dailypriceuplimit;
-		data["dailypricedownlimit"] = task_data->dailypricedownlimit;
-		data["marginunit"] = task_data->marginunit;
-		data["marginratioparam1"] = task_data->marginratioparam1;
-		data["marginratioparam2"] = task_data->marginratioparam2;
-		data["roundlot"] = task_data->roundlot;
-		data["lmtordminfloor"] = task_data->lmtordminfloor;
-		data["lmtordmaxfloor"] = task_data->lmtordmaxfloor;
-		data["mktordminfloor"] = task_data->mktordminfloor;
-		data["mktordmaxfloor"] = task_data->mktordmaxfloor;
-		data["ticksize"] = task_data->ticksize;
-		data["lastprice"] = task_data->lastprice;
-		delete task_data;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_contractid] = toUtf(task_data->contractid);
+		data[KEY_contractsymbol] = toUtf(task_data->contractsymbol);
+		data[KEY_underlyingsecurityid] = toUtf(task_data->underlyingsecurityid);
+		data[KEY_optiontype] = task_data->optiontype;
+		data[KEY_callorput] = task_data->callorput;
+		data[KEY_contractmultiplierunit] = task_data->contractmultiplierunit;
+		data[KEY_exerciseprice] = task_data->exerciseprice;
+		data[KEY_startdate] = toUtf(task_data->startdate);
+		data[KEY_enddate] = toUtf(task_data->enddate);
+		data[KEY_exercisedate] = toUtf(task_data->exercisedate);
+		data[KEY_deliverydate] = toUtf(task_data->deliverydate);
+		data[KEY_expiredate] = toUtf(task_data->expiredate);
+		data[KEY_totallongposition] = task_data->totallongposition;
+		data[KEY_securityclosepx] = task_data->securityclosepx;
+		data[KEY_settlprice] = task_data->settlprice;
+		data[KEY_underlyingclosepx] = task_data->underlyingclosepx;
+		data[KEY_dailypriceuplimit] = task_data->dailypriceuplimit;
+		data[KEY_dailypricedownlimit] = task_data->dailypricedownlimit;
+		data[KEY_marginunit] = task_data->marginunit;
+		data[KEY_marginratioparam1] = task_data->marginratioparam1;
+		data[KEY_marginratioparam2] = task_data->marginratioparam2;
+		data[KEY_roundlot] = task_data->roundlot;
+		data[KEY_lmtordminfloor] = task_data->lmtordminfloor;
+		data[KEY_lmtordmaxfloor] = task_data->lmtordmaxfloor;
+		data[KEY_mktordminfloor] = task_data->mktordminfloor;
+		data[KEY_mktordmaxfloor] = task_data->mktordmaxfloor;
+		data[KEY_ticksize] = task_data->ticksize;
+		data[KEY_lastprice] = task_data->lastprice;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryOptions(data, error, task->task_id, task->task_last);
 };
@@ -1817,26 +2084,26 @@ void StockTdApi::processRtnOptionsOrder(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcOptionsOrderField *task_data = (CStockFtdcOptionsOrderField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["TradeQty"] = task_data->TradeQty;
-		data["CancelQty"] = task_data->CancelQty;
-		data["Price"] = task_data->Price;
-		data["OrderQty"] = task_data->OrderQty;
-		data["Side"] = task_data->Side;
-		data["DiscretionPrice"] = task_data->DiscretionPrice;
-		data["PositionEffect"] = task_data->PositionEffect;
-		data["CoveredOrUncovered"] = task_data->CoveredOrUncovered;
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["OrdType"] = task_data->OrdType;
-		data["TimeInForce"] = task_data->TimeInForce;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OrdRejReason"] = task_data->OrdRejReason;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_TradeQty] = task_data->TradeQty;
+		data[KEY_CancelQty] = task_data->CancelQty;
+		data[KEY_Price] = task_data->Price;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_DiscretionPrice] = task_data->DiscretionPrice;
+		data[KEY_PositionEffect] = task_data->PositionEffect;
+		data[KEY_CoveredOrUncovered] = task_data->CoveredOrUncovered;
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_OrdType] = task_data->OrdType;
+		data[KEY_TimeInForce] = task_data->TimeInForce;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OrdRejReason] = task_data->OrdRejReason;
+		releaseTaskData(task_data);
 	}
 	this->onRtnOptionsOrder(data);
 };
@@ -1848,21 +2115,21 @@ void StockTdApi::processRtnStockOrder(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcStockOrderField *task_data = (CStockFtdcStockOrderField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["Price"] = task_data->Price;
-		data["OrderQty"] = task_data->OrderQty;
-		data["Side"] = task_data->Side;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["Qty2"] = task_data->Qty2;
-		data["TradeQty"] = task_data->TradeQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["TimeInForce"] = task_data->TimeInForce;
-		data["OrdRejReason"] = task_data->OrdRejReason;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_Price] = task_data->Price;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_Qty2] = task_data->Qty2;
+		data[KEY_TradeQty] = task_data->TradeQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_TimeInForce] = task_data->TimeInForce;
+		data[KEY_OrdRejReason] = task_data->OrdRejReason;
+		releaseTaskData(task_data);
 	}
 	this->onRtnStockOrder(data);
 };
@@ -1874,21 +2141,21 @@ void StockTdApi::processRtnQuoteOrder(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcQuoteOrderField *task_data = (CStockFtdcQuoteOrderField*)task->task_data;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["QuoteReqID"] = toUtf(task_data->QuoteReqID);
-		data["BidPx"] = task_data->BidPx;
-		data["AskPx"] = task_data->AskPx;
-		data["BidSize"] = task_data->BidSize;
-		data["AskSize"] = task_data->AskSize;
-		data["BidPositionEffect"] = task_data->BidPositionEffect;
-		data["AskPositionEffect"] = task_data->AskPositionEffect;
-		data["OrdRejReason"] = task_data->OrdRejReason;
-		delete task_data;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_UserID] = toUtf(task_data->UserID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_QuoteReqID] = toUtf(task_data->QuoteReqID);
+		data[KEY_BidPx] = task_data->BidPx;
+		data[KEY_AskPx] = task_data->AskPx;
+		data[KEY_BidSize] = task_data->BidSize;
+		data[KEY_AskSize] = task_data->AskSize;
+		data[KEY_BidPositionEffect] = task_data->BidPositionEffect;
+		data[KEY_AskPositionEffect] = task_data->AskPositionEffect;
+		data[KEY_OrdRejReason] = task_data->OrdRejReason;
+		releaseTaskData(task_data);
 	}
 	this->onRtnQuoteOrder(data);
 };
@@ -1900,24 +2167,24 @@ void StockTdApi::processRtnOptionsTrade(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcOptionsTradeField *task_data = (CStockFtdcOptionsTradeField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["ExecID"] = toUtf(task_data->ExecID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["LastPx"] = task_data->LastPx;
-		data["LastQty"] = task_data->LastQty;
-		data["LeavesQty"] = task_data->LeavesQty;
-		data["Side"] = task_data->Side;
-		data["PositionEffect"] = task_data->PositionEffect;
-		data["CoveredOrUncovered"] = task_data->CoveredOrUncovered;
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["OrigTime"] = toUtf(task_data->OrigTime);
-		data["ExecType"] = task_data->ExecType;
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrdStatus"] = task_data->OrdStatus;
-		data["TotalValueTraded"] = task_data->TotalValueTraded;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_ExecID] = toUtf(task_data->ExecID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_LastPx] = task_data->LastPx;
+		data[KEY_LastQty] = task_data->LastQty;
+		data[KEY_LeavesQty] = task_data->LeavesQty;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_PositionEffect] = task_data->PositionEffect;
+		data[KEY_CoveredOrUncovered] = task_data->CoveredOrUncovered;
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_OrigTime] = toUtf(task_data->OrigTime);
+		data[KEY_ExecType] = task_data->ExecType;
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrdStatus] = task_data->OrdStatus;
+		data[KEY_TotalValueTraded] = task_data->TotalValueTraded;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		releaseTaskData(task_data);
 	}
 	this->onRtnOptionsTrade(data);
 };
@@ -1929,19 +2196,19 @@ void StockTdApi::processRtnStockTrade(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcStockTradeField *task_data = (CStockFtdcStockTradeField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["TradeID"] = toUtf(task_data->TradeID);
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["InsertDate"] = toUtf(task_data->InsertDate);
-		data["InsertTime"] = toUtf(task_data->InsertTime);
-		data["TradeTime"] = toUtf(task_data->TradeTime);
-		data["TradeVolume"] = task_data->TradeVolume;
-		data["Side"] = task_data->Side;
-		data["Cjjg"] = task_data->Cjjg;
-		data["Cjje"] = task_data->Cjje;
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_TradeID] = toUtf(task_data->TradeID);
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_InsertDate] = toUtf(task_data->InsertDate);
+		data[KEY_InsertTime] = toUtf(task_data->InsertTime);
+		data[KEY_TradeTime] = toUtf(task_data->TradeTime);
+		data[KEY_TradeVolume] = task_data->TradeVolume;
+		data[KEY_Side] = task_data->Side;
+		data[KEY_Cjjg] = task_data->Cjjg;
+		data[KEY_Cjje] = task_data->Cjje;
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		releaseTaskData(task_data);
 	}
 	this->onRtnStockTrade(data);
 };
@@ -1953,14 +2220,14 @@ void StockTdApi::processRtnExercise(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcExerciseRtnField *task_data = (CStockFtdcExerciseRtnField*)task->task_data;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrderQty"] = task_data->OrderQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		delete task_data;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		releaseTaskData(task_data);
 	}
 	this->onRtnExercise(data);
 };
@@ -1972,18 +2239,18 @@ void StockTdApi::processRspQryRate(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryRateField *task_data = (CStockFtdcRspQryRateField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["Margin"] = task_data->Margin;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_Margin] = task_data->Margin;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryRate(data, error, task->task_id, task->task_last);
 };
@@ -1995,17 +2262,17 @@ void StockTdApi::processRspQryClient(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspClientField *task_data = (CStockFtdcRspClientField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["Status"] = task_data->Status;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_Status] = task_data->Status;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryClient(data, error, task->task_id, task->task_last);
 };
@@ -2017,20 +2284,20 @@ void StockTdApi::processRspQryClientMargin(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcRspQryClientMarginField *task_data = (CStockFtdcRspQryClientMarginField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["Margin"] = task_data->Margin;
-		data["MarginRatio"] = task_data->MarginRatio;
-		data["MinMarginRatio"] = task_data->MinMarginRatio;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_Margin] = task_data->Margin;
+		data[KEY_MarginRatio] = task_data->MarginRatio;
+		data[KEY_MinMarginRatio] = task_data->MinMarginRatio;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryClientMargin(data, error, task->task_id, task->task_last);
 };
@@ -2042,22 +2309,22 @@ void StockTdApi::processRspQryExercise(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcExerciseRtnField *task_data = (CStockFtdcExerciseRtnField*)task->task_data;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["SecurityID"] = toUtf(task_data->SecurityID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrderQty"] = task_data->OrderQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		delete task_data;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_SecurityID] = toUtf(task_data->SecurityID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQryExercise(data, error, task->task_id, task->task_last);
 };
@@ -2069,11 +2336,11 @@ void StockTdApi::processRtnWithdrawDeposit(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcWithdrawDepositRtnField *task_data = (CStockFtdcWithdrawDepositRtnField*)task->task_data;
-		data["AccountID"] = toUtf(task_data->AccountID);
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["deposit"] = task_data->deposit;
-		data["withdraw"] = task_data->withdraw;
-		delete task_data;
+		data[KEY_AccountID] = toUtf(task_data->AccountID);
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_deposit] = task_data->deposit;
+		data[KEY_withdraw] = task_data->withdraw;
+		releaseTaskData(task_data);
 	}
 	this->onRtnWithdrawDeposit(data);
 };
@@ -2085,21 +2352,21 @@ void StockTdApi::processRspMarginCombAction(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcMarginCombActionRspField *task_data = (CStockFtdcMarginCombActionRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["CombID"] = toUtf(task_data->CombID);
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrderQty"] = task_data->OrderQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_CombID] = toUtf(task_data->CombID);
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspMarginCombAction(data, error, task->task_id, task->task_last);
 };
@@ -2111,15 +2378,15 @@ void StockTdApi::processRtnMarginCombAction(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcMarginCombActionRtnField *task_data = (CStockFtdcMarginCombActionRtnField*)task->task_data;
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["ExecID"] = toUtf(task_data->ExecID);
-		data["CombID"] = toUtf(task_data->CombID);
-		data["TransactTimeOnly"] = toUtf(task_data->TransactTimeOnly);
-		data["OrigTime"] = toUtf(task_data->OrigTime);
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["LastQty"] = task_data->LastQty;
-		data["commargin"] = task_data->commargin;
-		delete task_data;
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_ExecID] = toUtf(task_data->ExecID);
+		data[KEY_CombID] = toUtf(task_data->CombID);
+		data[KEY_TransactTimeOnly] = toUtf(task_data->TransactTimeOnly);
+		data[KEY_OrigTime] = toUtf(task_data->OrigTime);
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_LastQty] = task_data->LastQty;
+		data[KEY_commargin] = task_data->commargin;
+		releaseTaskData(task_data);
 	}
 	this->onRtnMarginCombAction(data);
 };
@@ -2131,18 +2398,18 @@ void StockTdApi::processRspQrySseCombPosition(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcCombPositionRspField *task_data = (CStockFtdcCombPositionRspField*)task->task_data;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["PosiQty"] = task_data->PosiQty;
-		data["commargin"] = task_data->commargin;
-		delete task_data;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_PosiQty] = task_data->PosiQty;
+		data[KEY_commargin] = task_data->commargin;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspQrySseCombPosition(data, error, task->task_id, task->task_last);
 };
@@ -2154,24 +2421,24 @@ void StockTdApi::processRspCombExercise(Task *task)
 	if (task->task_data)
 	{
 		CStockFtdcCombExerciseRspField *task_data = (CStockFtdcCombExerciseRspField*)task->task_data;
-		data["OrderID"] = toUtf(task_data->OrderID);
-		data["ClOrdID"] = task_data->ClOrdID;
-		data["OwnerType"] = task_data->OwnerType;
-		data["OrderQty"] = task_data->OrderQty;
-		data["PartyID"] = toUtf(task_data->PartyID);
-		data["LegSecurityID1"] = toUtf(task_data->LegSecurityID1);
-		data["LegOrderQty1"] = task_data->LegOrderQty1;
-		data["LegSecurityID2"] = toUtf(task_data->LegSecurityID2);
-		data["LegOrderQty2"] = task_data->LegOrderQty2;
-		delete task_data;
+		data[KEY_OrderID] = toUtf(task_data->OrderID);
+		data[KEY_ClOrdID] = task_data->ClOrdID;
+		data[KEY_OwnerType] = task_data->OwnerType;
+		data[KEY_OrderQty] = task_data->OrderQty;
+		data[KEY_PartyID] = toUtf(task_data->PartyID);
+		data[KEY_LegSecurityID1] = toUtf(task_data->LegSecurityID1);
+		data[KEY_LegOrderQty1] = task_data->LegOrderQty1;
+		data[KEY_LegSecurityID2] = toUtf(task_data->LegSecurityID2);
+		data[KEY_LegOrderQty2] = task_data->LegOrderQty2;
+		releaseTaskData(task_data);
 	}
 	dict error;
 	if (task->task_error)
 	{
 		CStockFtdcRspInfoField *task_error = (CStockFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		error[KEY_ErrorID] = task_error->ErrorID;
+		error[KEY_ErrorMsg] = toUtf(task_error->ErrorMsg);
+		releaseTaskData(task_error);
 	}
 	this->onRspCombExercise(data, error, task->task_id, task->task_last);
 };
@@ -2199,6 +2466,7 @@ void StockTdApi::release()
 
 void StockTdApi::init(string localIp, string netWorkCard)
 {
+	this->throttle.start();
 	this->active = true;
 	this->task_thread = thread(&StockTdApi::processTask, this);
 
@@ -2207,6 +2475,7 @@ void StockTdApi::init(string localIp, string netWorkCard)
 
 int StockTdApi::exit()
 {
+	this->throttle.stop();
 	this->active = false;
 	this->task_queue.terminate();
 	this->task_thread.join();
@@ -2301,6 +2570,7 @@ int StockTdApi::reqStockInsert(const dict &req, int reqid)
 	getString(req, "PartyID", myreq.PartyID);
 	getInt(req, "OwnerType", &myreq.OwnerType);
 	getChar(req, "TimeInForce", &myreq.TimeInForce);
+	this->throttle.acquire_order();
 	int i = this->api->ReqStockInsert(&myreq, reqid);
 	return i;
 };
@@ -2312,6 +2582,7 @@ int StockTdApi::reqStockCancel(const dict &req, int reqid)
 	getInt(req, "ClOrdID", &myreq.ClOrdID);
 	getInt(req, "OrigClOrdID", &myreq.OrigClOrdID);
 	getString(req, "OrderID", myreq.OrderID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqStockCancel(&myreq, reqid);
 	return i;
 };
@@ -2348,6 +2619,7 @@ int StockTdApi::reqOptionsInsert(const dict &req, int reqid)
 	getInt(req, "CoveredOrUncovered", &buf);
 	myreq.CoveredOrUncovered = buf;
 
+	this->throttle.acquire_order();
 	int i = this->api->ReqOptionsInsert(&myreq, reqid);
 	return i;
 };
@@ -2359,6 +2631,7 @@ int StockTdApi::reqOptionsCancel(const dict &req, int reqid)
 	getInt(req, "ClOrdID", &myreq.ClOrdID);
 	getInt(req, "OrigClOrdID", &myreq.OrigClOrdID);
 	getString(req, "OrderID", myreq.OrderID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqOptionsCancel(&myreq, reqid);
 	return i;
 };
@@ -2378,6 +2651,7 @@ int StockTdApi::reqQuoteInsert(const dict &req, int reqid)
 	getInt(req, "AskSize", &myreq.AskSize);
 	getChar(req, "BidPositionEffect", &myreq.BidPositionEffect);
 	getChar(req, "AskPositionEffect", &myreq.AskPositionEffect);
+	this->throttle.acquire_order();
 	int i = this->api->ReqQuoteInsert(&myreq, reqid);
 	return i;
 };
@@ -2389,6 +2663,7 @@ int StockTdApi::reqQuoteCancel(const dict &req, int reqid)
 	getInt(req, "ClOrdID", &myreq.ClOrdID);
 	getInt(req, "OrigClOrdID", &myreq.OrigClOrdID);
 	getString(req, "OrderID", myreq.OrderID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqQuoteCancel(&myreq, reqid);
 	return i;
 };
@@ -2425,6 +2700,7 @@ int StockTdApi::reqExerciseCancel(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getInt(req, "OrigClOrdID", &myreq.OrigClOrdID);
 	getString(req, "OrderID", myreq.OrderID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqExerciseCancel(&myreq, reqid);
 	return i;
 };
@@ -2434,6 +2710,8 @@ int StockTdApi::reqQryPartAccount(const dict &req, int reqid)
 	CStockFtdcQryPartAccountField myreq = CStockFtdcQryPartAccountField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "PartyID", myreq.PartyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryPartAccount(&myreq, reqid); });
 	int i = this->api->ReqQryPartAccount(&myreq, reqid);
 	return i;
 };
@@ -2445,6 +2723,8 @@ int StockTdApi::reqQryStockOrder(const dict &req, int reqid)
 	getString(req, "PartyID", myreq.PartyID);
 	getInt(req, "ClOrdID", &myreq.ClOrdID);
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryStockOrder(&myreq, reqid); });
 	int i = this->api->ReqQryStockOrder(&myreq, reqid);
 	return i;
 };
@@ -2456,6 +2736,8 @@ int StockTdApi::reqQryOptionsOrder(const dict &req, int reqid)
 	getString(req, "PartyID", myreq.PartyID);
 	getInt(req, "ClOrdID", &myreq.ClOrdID);
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOptionsOrder(&myreq, reqid); });
 	int i = this->api->ReqQryOptionsOrder(&myreq, reqid);
 	return i;
 };
@@ -2467,6 +2749,8 @@ int StockTdApi::reqQryQuoteOrder(const dict &req, int reqid)
 	getString(req, "PartyID", myreq.PartyID);
 	getInt(req, "ClOrdID", &myreq.ClOrdID);
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryQuoteOrder(&myreq, reqid); });
 	int i = this->api->ReqQryQuoteOrder(&myreq, reqid);
 	return i;
 };
@@ -2478,6 +2762,8 @@ int StockTdApi::reqQryStockTrade(const dict &req, int reqid)
 	getString(req, "PartyID", myreq.PartyID);
 	getString(req, "SecurityID", myreq.SecurityID);
 	getString(req, "TradeID", myreq.TradeID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryStockTrade(&myreq, reqid); });
 	int i = this->api->ReqQryStockTrade(&myreq, reqid);
 	return i;
 };
@@ -2489,6 +2775,8 @@ int StockTdApi::reqQryOptionsTrade(const dict &req, int reqid)
 	getString(req, "PartyID", myreq.PartyID);
 	getString(req, "SecurityID", myreq.SecurityID);
 	getString(req, "ExecID", myreq.ExecID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOptionsTrade(&myreq, reqid); });
 	int i = this->api->ReqQryOptionsTrade(&myreq, reqid);
 	return i;
 };
@@ -2499,6 +2787,8 @@ int StockTdApi::reqQryPosition(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "PartyID", myreq.PartyID);
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryPosition(&myreq, reqid); });
 	int i = this->api->ReqQryPosition(&myreq, reqid);
 	return i;
 };
@@ -2509,6 +2799,8 @@ int StockTdApi::reqQryTopic(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getInt(req, "SequenceSeries", &myreq.SequenceSeries);
 	getInt(req, "SequenceNo", &myreq.SequenceNo);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryTopic(&myreq, reqid); });
 	int i = this->api->ReqQryTopic(&myreq, reqid);
 	return i;
 };
@@ -2518,6 +2810,8 @@ int StockTdApi::reqQryStock(const dict &req, int reqid)
 	CStockFtdcQryStockField myreq = CStockFtdcQryStockField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryStock(&myreq, reqid); });
 	int i = this->api->ReqQryStock(&myreq, reqid);
 	return i;
 };
@@ -2527,6 +2821,8 @@ int StockTdApi::reqQryOptions(const dict &req, int reqid)
 	CStockFtdcQryOptionsField myreq = CStockFtdcQryOptionsField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryOptions(&myreq, reqid); });
 	int i = this->api->ReqQryOptions(&myreq, reqid);
 	return i;
 };
@@ -2537,12 +2833,16 @@ int StockTdApi::reqQryRate(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "PartyID", myreq.PartyID);
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryRate(&myreq, reqid); });
 	int i = this->api->ReqQryRate(&myreq, reqid);
 	return i;
 };
 
 int StockTdApi::reqQryClient(int reqid)
 {
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() { return this->api->ReqQryClient(reqid); });
 	int i = this->api->ReqQryClient(reqid);
 	return i;
 };
@@ -2554,6 +2854,8 @@ int StockTdApi::reqQryClientMargin(const dict &req, int reqid)
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "PartyID", myreq.PartyID);
 	getString(req, "SecurityID", myreq.SecurityID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryClientMargin(&myreq, reqid); });
 	int i = this->api->ReqQryClientMargin(&myreq, reqid);
 	return i;
 };
@@ -2563,6 +2865,8 @@ int StockTdApi::reqQryExercise(const dict &req, int reqid)
 	CStockFtdcQryExerciseField myreq = CStockFtdcQryExerciseField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "PartyID", myreq.PartyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQryExercise(&myreq, reqid); });
 	int i = this->api->ReqQryExercise(&myreq, reqid);
 	return i;
 };
@@ -2576,6 +2880,7 @@ int StockTdApi::reqMarginCombAction(const dict &req, int reqid)
 	getInt(req, "OwnerType", &myreq.OwnerType);
 	getInt(req, "OrderQty", &myreq.OrderQty);
 	getString(req, "PartyID", myreq.PartyID);
+	this->throttle.acquire_order();
 	int i = this->api->ReqMarginCombAction(&myreq, reqid);
 	return i;
 };
@@ -2585,6 +2890,8 @@ int StockTdApi::reqQrySseCombPosition(const dict &req, int reqid)
 	CStockFtdcCombPositionField myreq = CStockFtdcCombPositionField();
 	memset(&myreq, 0, sizeof(myreq));
 	getString(req, "PartyID", myreq.PartyID);
+	if (!this->throttle.acquire_query())
+		return this->throttle.defer([=]() mutable { return this->api->ReqQrySseCombPosition(&myreq, reqid); });
 	int i = this->api->ReqQrySseCombPosition(&myreq, reqid);
 	return i;
 };
@@ -2605,6 +2912,101 @@ int StockTdApi::reqCombExercise(const dict &req, int reqid)
 	return i;
 };
 
+int StockTdApi::addOptionsTemplate(const dict &req)
+{
+	//预先填写合约、方向、开平和委托类型等固定字段，返回模板编号
+	CStockFtdcOptionsInsertReqField myreq = CStockFtdcOptionsInsertReqField();
+	memset(&myreq, 0, sizeof(myreq));
+	getString(req, "SecurityID", myreq.SecurityID);
+	getInt(req, "OwnerType", &myreq.OwnerType);
+	getChar(req, "Side", &myreq.Side);
+	getChar(req, "PositionEffect", &myreq.PositionEffect);
+	getChar(req, "OrdType", &myreq.OrdType);
+	getChar(req, "TimeInForce", &myreq.TimeInForce);
+	getString(req, "PartyID", myreq.PartyID);
+
+	int buf = 0;
+	getInt(req, "CoveredOrUncovered", &buf);
+	myreq.CoveredOrUncovered = buf;
+
+	this->options_templates.push_back(myreq);
+	return (int)this->options_templates.size() - 1;
+};
+
+int StockTdApi::reqOptionsInsertByTemplate(int template_id, double price, int volume, int clordid, int reqid)
+{
+	if (template_id < 0 || template_id >= (int)this->options_templates.size())
+		throw index_error("invalid options template id");
+
+	//只需填写价格、数量和委托编号
+	CStockFtdcOptionsInsertReqField myreq = this->options_templates[template_id];
+	myreq.ClOrdID = clordid;
+	myreq.Price = price;
+	myreq.OrderQty = volume;
+	this->throttle.acquire_order();
+	int i = this->api->ReqOptionsInsert(&myreq, reqid);
+	return i;
+};
+
+pybind11::list StockTdApi::reqOptionsInsertBatch(const pybind11::list &orders, int reqid)
+{
+	//每个元素为(模板编号, 价格, 数量, 委托编号)，先在持有GIL时全部转换为原生结构体
+	vector<CStockFtdcOptionsInsertReqField> reqs;
+	reqs.reserve(orders.size());
+
+	for (handle item : orders)
+	{
+		pybind11::tuple order = item.cast<pybind11::tuple>();
+
+		int template_id = order[0].cast<int>();
+		if (template_id < 0 || template_id >= (int)this->options_templates.size())
+			throw index_error("invalid options template id");
+
+		CStockFtdcOptionsInsertReqField myreq = this->options_templates[template_id];
+		myreq.Price = order[1].cast<double>();
+		myreq.OrderQty = order[2].cast<int>();
+		myreq.ClOrdID = order[3].cast<int>();
+		reqs.push_back(myreq);
+	}
+
+	//发送期间释放GIL，请求编号从reqid开始依次递增
+	vector<int> results(reqs.size());
+	{
+		gil_scoped_release release;
+		for (size_t n = 0; n < reqs.size(); n++)
+		{
+			this->throttle.wait_order();
+			results[n] = this->api->ReqOptionsInsert(&reqs[n], reqid + (int)n);
+		}
+	}
+
+	pybind11::list data;
+	for (int i : results)
+	{
+		data.append(i);
+	}
+	return data;
+};
+
+dict StockTdApi::getQueueStats()
+{
+	dict stats = this->task_stats.to_dict(TASK_NAMES, sizeof(TASK_NAMES) / sizeof(TASK_NAMES[0]));
+	stats["depth"] = this->task_queue.depth();
+	stats["high_water"] = this->task_queue.high_water();
+	return stats;
+};
+
+void StockTdApi::setRequestLimit(double rate, int burst, int reserve)
+{
+	//rate为每秒请求数，burst为允许的突发请求数，reserve为查询请求不可占用、留给委托撤单的令牌数
+	this->throttle.set_limit(rate, burst, reserve);
+};
+
+dict StockTdApi::getThrottleStats()
+{
+	return this->throttle.to_dict();
+};
+
 ///-------------------------------------------------------------------------------------
 ///Boost.Python封装
 ///-------------------------------------------------------------------------------------
@@ -3122,6 +3524,8 @@ public:
 
 PYBIND11_MODULE(vnnhstock, m)
 {
+	initDictKeys();
+
 	class_<StockTdApi, PyStockTdApi> StockTdApi(m, "StockTdApi", module_local());
 	StockTdApi
 		.def(init<>())
@@ -3130,6 +3534,9 @@ PYBIND11_MODULE(vnnhstock, m)
 		.def("release", &StockTdApi::release)
 		.def("init", &StockTdApi::init)
 		.def("exit", &StockTdApi::exit)
+		.def("getQueueStats", &StockTdApi::getQueueStats)
+		.def("setRequestLimit", &StockTdApi::setRequestLimit)
+		.def("getThrottleStats", &StockTdApi::getThrottleStats)
 		.def("getTradingDay", &StockTdApi::getTradingDay)
 		.def("registerFront", &StockTdApi::registerFront)
 		.def("subscribePrivateTopic", &StockTdApi::subscribePrivateTopic)
@@ -3143,6 +3550,9 @@ PYBIND11_MODULE(vnnhstock, m)
 		.def("reqStockCancel", &StockTdApi::reqStockCancel)
 		.def("reqStockLock", &StockTdApi::reqStockLock)
 		.def("reqOptionsInsert", &StockTdApi::reqOptionsInsert)
+		.def("addOptionsTemplate", &StockTdApi::addOptionsTemplate)
+		.def("reqOptionsInsertByTemplate", &StockTdApi::reqOptionsInsertByTemplate)
+		.def("reqOptionsInsertBatch", &StockTdApi::reqOptionsInsertBatch)
 		.def("reqOptionsCancel", &StockTdApi::reqOptionsCancel)
 		.def("reqQuoteInsert", &StockTdApi::reqQuoteInsert)
 		.def("reqQuoteCancel", &StockTdApi::reqQuoteCancel)
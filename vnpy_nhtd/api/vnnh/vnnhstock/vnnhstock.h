@@ -58,6 +58,54 @@ using namespace nhtd;
 #define ONRSPQRYSSECOMBPOSITION 42
 #define ONRSPCOMBEXERCISE 43
 
+//صƣ˳
+static const char *TASK_NAMES[] = {
+	"onFrontConnected",
+	"onFrontDisconnected",
+	"onHeartBeatWarning",
+	"onPackageStart",
+	"onPackageEnd",
+	"onRspSubscribeTopic",
+	"onRspUserLogin",
+	"onRspUserLogout",
+	"onRspUserPasswordUpdate",
+	"onRspStockInsert",
+	"onRspStockCancel",
+	"onRspOptionsInsert",
+	"onRspOptionsCancel",
+	"onRspQuoteInsert",
+	"onRspForQuote",
+	"onRspQuoteCancel",
+	"onRspStockLock",
+	"onRspExercise",
+	"onRspExerciseCancel",
+	"onRspQryPartAccount",
+	"onRspQryStockOrder",
+	"onRspQryOptionsOrder",
+	"onRspQryQuoteOrder",
+	"onRspQryStockTrade",
+	"onRspQryOptionsTrade",
+	"onRspQryPosition",
+	"onRspQryTopic",
+	"onRspQryStock",
+	"onRspQryOptions",
+	"onRtnOptionsOrder",
+	"onRtnStockOrder",
+	"onRtnQuoteOrder",
+	"onRtnOptionsTrade",
+	"onRtnStockTrade",
+	"onRtnExercise",
+	"onRspQryRate",
+	"onRspQryClient",
+	"onRspQryClientMargin",
+	"onRspQryExercise",
+	"onRtnWithdrawDeposit",
+	"onRspMarginCombAction",
+	"onRtnMarginCombAction",
+	"onRspQrySseCombPosition",
+	"onRspCombExercise",
+};
+
 
 ///-------------------------------------------------------------------------------------
 ///C++ SPIĻصʵ
@@ -70,6 +118,10 @@ private:
 	CNhStockTraderApi* api;				//API
 	thread task_thread;					//ָ߳루pythonݣ
 	TaskQueue task_queue;			    //
+	TaskStats task_stats;				//ͳ
+	RequestThrottle throttle;			//
+
+	vector<CStockFtdcOptionsInsertReqField> options_templates;	//Լ򡢿ƽԤõȨί
 	bool active = false;				//״̬
 
 public:
@@ -428,6 +480,12 @@ public:
 
 	int exit();
 
+	dict getQueueStats();
+
+	void setRequestLimit(double rate, int burst, int reserve);
+
+	dict getThrottleStats();
+
 	string getTradingDay();
 
 	void registerFront(string address);
@@ -499,4 +557,10 @@ public:
 	int reqQrySseCombPosition(const dict &req, int reqid);
 
 	int reqCombExercise(const dict &req, int reqid);
+
+	int addOptionsTemplate(const dict &req);
+
+	int reqOptionsInsertByTemplate(int template_id, double price, int volume, int clordid, int reqid);
+
+	pybind11::list reqOptionsInsertBatch(const pybind11::list &orders, int reqid);
 };
@@ -1,9 +1,10 @@
 import sys
+import pickle
 import pytz
 from datetime import datetime
-from time import sleep
-from typing import Dict, List, Tuple, Any, Set
+from typing import Dict, List, Tuple, Any, Set, Optional
 from copy import copy
+from dataclasses import dataclass
 from vnpy.event.engine import EventEngine
 from pathlib import Path
 
@@ -152,6 +153,11 @@ MAX_FLOAT = sys.float_info.max                  # 浮点数极限值
 CHINA_TZ = pytz.timezone("Asia/Shanghai")       # 中国时区
 EVENT_NH_EXERCISE = "eNhExercise"
 EVENT_NH_EXERCISE_LOG = "eNhExerciseLog"
+EVENT_NH_OPTION_CHAIN = "eNhOptionChain"
+CONTRACT_CACHE_VERSION = 1                      # 合约缓存文件版本
+CONTRACT_CACHE_NAME = "contract_cache.pkl"      # 合约缓存文件名
+SUBSCRIBE_BATCH_SIZE = 100                      # 单次订阅请求的最大条数
+SUBSCRIBE_BATCH_COUNT = 5                       # 每次定时事件发送的订阅请求数
 
 # 股票委托状态映射
 STATUS_STOCK2VT: Dict[str, Status] = {
@@ -208,8 +214,387 @@ OPTIONTYPE_STOCK2VT: Dict[str, OptionType] = {
     SZSE_FTDC_CallOrPut_A: OptionType.PUT
 }
 
-# 合约数据全局缓存字典
-symbol_contract_map: Dict[str, ContractData] = {}
+# 行情深度档位映射
+MD_LEVEL_SETTING: Dict[str, int] = {
+    "L1": 1,
+    "L5": 5,
+    "L10": 10
+}
+
+
+@dataclass
+class DepthTickData(TickData):
+    """
+    十档深度行情数据，在TickData的基础上增加六至十档盘口。
+    """
+
+    bid_price_6: float = 0
+    bid_price_7: float = 0
+    bid_price_8: float = 0
+    bid_price_9: float = 0
+    bid_price_10: float = 0
+
+    ask_price_6: float = 0
+    ask_price_7: float = 0
+    ask_price_8: float = 0
+    ask_price_9: float = 0
+    ask_price_10: float = 0
+
+    bid_volume_6: float = 0
+    bid_volume_7: float = 0
+    bid_volume_8: float = 0
+    bid_volume_9: float = 0
+    bid_volume_10: float = 0
+
+    ask_volume_6: float = 0
+    ask_volume_7: float = 0
+    ask_volume_8: float = 0
+    ask_volume_9: float = 0
+    ask_volume_10: float = 0
+
+
+class ContractRegistry:
+    """
+    合约注册表，由每个接口独立持有。
+    支持按代码、交易所加代码、期权产品、标的和到期日快速查询。
+    """
+
+    __slots__ = (
+        "symbol_map",
+        "exchange_map",
+        "portfolio_map",
+        "underlying_map",
+        "expiry_map",
+        "chain_map",
+        "changed_portfolios"
+    )
+
+    def __init__(self) -> None:
+        """构造函数"""
+        self.symbol_map: Dict[str, ContractData] = {}
+        self.exchange_map: Dict[Tuple[Exchange, str], ContractData] = {}
+
+        # 二级索引：键 -> {代码: 合约}
+        self.portfolio_map: Dict[str, Dict[str, ContractData]] = {}
+        self.underlying_map: Dict[str, Dict[str, ContractData]] = {}
+        self.expiry_map: Dict[datetime, Dict[str, ContractData]] = {}
+
+        # 期权链：产品 -> 到期日 -> 行权价 -> 看涨看跌 -> 合约
+        self.chain_map: Dict[str, Dict[datetime, Dict[float, Dict[OptionType, ContractData]]]] = {}
+        self.changed_portfolios: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.symbol_map)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.symbol_map
+
+    def __getitem__(self, symbol: str) -> ContractData:
+        return self.symbol_map[symbol]
+
+    def add(self, contract: ContractData) -> bool:
+        """添加合约，返回合约是否为新增或有变化"""
+        old: Optional[ContractData] = self.symbol_map.get(contract.symbol, None)
+        if old == contract:
+            return False
+
+        if old:
+            self.remove(old)
+
+        self.symbol_map[contract.symbol] = contract
+        self.exchange_map[(contract.exchange, contract.symbol)] = contract
+
+        if contract.option_portfolio:
+            self.portfolio_map.setdefault(contract.option_portfolio, {})[contract.symbol] = contract
+
+        if contract.option_underlying:
+            self.underlying_map.setdefault(contract.option_underlying, {})[contract.symbol] = contract
+
+        if contract.option_expiry:
+            self.expiry_map.setdefault(contract.option_expiry, {})[contract.symbol] = contract
+
+        if contract.option_type and contract.option_portfolio:
+            strikes: Dict[float, Dict[OptionType, ContractData]] = (
+                self.chain_map
+                .setdefault(contract.option_portfolio, {})
+                .setdefault(contract.option_expiry, {})
+            )
+            strikes.setdefault(contract.option_strike, {})[contract.option_type] = contract
+            self.changed_portfolios.add(contract.option_portfolio)
+
+        return True
+
+    def remove(self, contract: ContractData) -> None:
+        """移除合约及其全部索引"""
+        self.symbol_map.pop(contract.symbol, None)
+        self.exchange_map.pop((contract.exchange, contract.symbol), None)
+
+        for index, key in [
+            (self.portfolio_map, contract.option_portfolio),
+            (self.underlying_map, contract.option_underlying),
+            (self.expiry_map, contract.option_expiry)
+        ]:
+            contracts: Optional[Dict[str, ContractData]] = index.get(key, None)
+            if contracts is None:
+                continue
+
+            contracts.pop(contract.symbol, None)
+            if not contracts:
+                index.pop(key)
+
+        if contract.option_type and contract.option_portfolio:
+            self.remove_chain(contract)
+
+    def remove_chain(self, contract: ContractData) -> None:
+        """从期权链中移除合约"""
+        portfolio: str = contract.option_portfolio
+        self.changed_portfolios.add(portfolio)
+
+        expiries: dict = self.chain_map.get(portfolio, {})
+        strikes: dict = expiries.get(contract.option_expiry, {})
+        options: dict = strikes.get(contract.option_strike, {})
+
+        if options.get(contract.option_type, None) is not contract:
+            return
+        options.pop(contract.option_type)
+
+        if not options:
+            strikes.pop(contract.option_strike)
+        if not strikes:
+            expiries.pop(contract.option_expiry)
+        if not expiries:
+            self.chain_map.pop(portfolio)
+
+    def retain(self, symbols: Set[str]) -> List[ContractData]:
+        """只保留指定代码的合约，返回被移除的合约"""
+        removed: List[ContractData] = [
+            contract for symbol, contract in self.symbol_map.items() if symbol not in symbols
+        ]
+
+        for contract in removed:
+            self.remove(contract)
+
+        return removed
+
+    def get(self, symbol: str) -> Optional[ContractData]:
+        """按代码查询合约"""
+        return self.symbol_map.get(symbol, None)
+
+    def get_by_exchange(self, exchange: Exchange, symbol: str) -> Optional[ContractData]:
+        """按交易所和代码查询合约"""
+        return self.exchange_map.get((exchange, symbol), None)
+
+    def get_by_portfolio(self, portfolio: str) -> List[ContractData]:
+        """查询期权产品下的全部合约"""
+        return list(self.portfolio_map.get(portfolio, {}).values())
+
+    def get_by_underlying(self, underlying: str) -> List[ContractData]:
+        """查询同一标的下的全部期权合约"""
+        return list(self.underlying_map.get(underlying, {}).values())
+
+    def get_by_expiry(self, expiry: datetime) -> List[ContractData]:
+        """查询同一到期日的全部期权合约"""
+        return list(self.expiry_map.get(expiry, {}).values())
+
+    def get_all(self) -> List[ContractData]:
+        """获取全部合约"""
+        return list(self.symbol_map.values())
+
+    def get_option_portfolios(self) -> List[str]:
+        """获取全部期权产品"""
+        return list(self.chain_map.keys())
+
+    def get_option_chain(self, portfolio: str, expiry: datetime = None) -> dict:
+        """
+        查询期权链，返回到期日 -> 行权价 -> 看涨看跌 -> 合约的嵌套字典副本。
+        传入expiry时只返回该到期日的行权价字典。
+        """
+        expiries: dict = self.chain_map.get(portfolio, {})
+
+        if expiry:
+            strikes: dict = expiries.get(expiry, {})
+            return {strike: dict(options) for strike, options in sorted(strikes.items())}
+
+        return {
+            expiry: {strike: dict(options) for strike, options in sorted(strikes.items())}
+            for expiry, strikes in sorted(expiries.items())
+        }
+
+    def pop_changed_portfolios(self) -> List[str]:
+        """获取并清空期权链有变化的产品"""
+        portfolios: List[str] = [p for p in self.changed_portfolios if p in self.chain_map]
+        self.changed_portfolios.clear()
+        return portfolios
+
+
+class PositionBook:
+    """
+    持仓簿，按(本地代码, 方向)持久缓存持仓。
+    根据成交和委托推送增量更新，查询结果用于校准，只返回有变化的持仓。
+    """
+
+    def __init__(self, gateway_name: str) -> None:
+        """构造函数"""
+        self.gateway_name: str = gateway_name
+
+        self.positions: Dict[Tuple[str, Direction], PositionData] = {}
+        self.order_frozen: Dict[str, float] = {}
+        self.trade_ids: Set[str] = set()
+
+        # 上次查询发出后有变动的持仓
+        self.changed_keys: Set[Tuple[str, Direction]] = set()
+
+        self.inited: bool = False
+        self.drift: bool = True
+
+        # 查询发出前的状态，查询未能发出时恢复
+        self.query_backup: Optional[tuple] = None
+
+    def start_query(self) -> None:
+        """合约信息就绪后、发出持仓查询前调用，开始记录查询期间的变动"""
+        self.query_backup = (self.changed_keys, self.drift)
+
+        self.changed_keys = set()
+        self.drift = False
+
+    def cancel_query(self) -> None:
+        """持仓查询未能发出时调用，恢复查询前的状态"""
+        changed_keys, self.drift = self.query_backup
+        self.changed_keys |= changed_keys
+
+    def get_key(self, data: Any) -> Tuple[str, Direction]:
+        """获取委托或成交对应的持仓键"""
+        if data.offset == Offset.OPEN:
+            direction: Direction = data.direction
+        elif data.direction == Direction.LONG:
+            direction = Direction.SHORT
+        else:
+            direction = Direction.LONG
+
+        return (data.vt_symbol, direction)
+
+    def update_order(self, order: OrderData) -> Optional[PositionData]:
+        """根据平仓委托的剩余数量更新持仓冻结"""
+        frozen: float = 0
+        if order.offset not in {Offset.OPEN, Offset.NONE} and order.is_active():
+            frozen = order.volume - order.traded
+
+        previous: float = self.order_frozen.pop(order.vt_orderid, 0)
+        if frozen:
+            self.order_frozen[order.vt_orderid] = frozen
+
+        if frozen == previous:
+            return None
+
+        key: Tuple[str, Direction] = self.get_key(order)
+        self.changed_keys.add(key)
+
+        if not self.inited:
+            return None
+
+        position: Optional[PositionData] = self.positions.get(key, None)
+        if not position:
+            return None
+
+        position.frozen = max(position.frozen + frozen - previous, 0)
+        if position.frozen > position.volume:
+            self.drift = True
+
+        return position
+
+    def update_trade(self, trade: TradeData) -> Optional[PositionData]:
+        """根据成交更新持仓数量和均价"""
+        # 断线重连后柜台会重新推送当日成交，需要过滤
+        if trade.vt_tradeid in self.trade_ids:
+            return None
+        self.trade_ids.add(trade.vt_tradeid)
+
+        key: Tuple[str, Direction] = self.get_key(trade)
+        self.changed_keys.add(key)
+
+        # 首次持仓查询完成前的成交已包含在查询结果中，只记录编号而不累加
+        if not self.inited:
+            return None
+
+        position: Optional[PositionData] = self.positions.get(key, None)
+
+        if trade.offset == Offset.OPEN:
+            if not position:
+                position = PositionData(
+                    symbol=trade.symbol,
+                    exchange=trade.exchange,
+                    direction=key[1],
+                    gateway_name=self.gateway_name
+                )
+                self.positions[key] = position
+
+            cost: float = position.price * position.volume + trade.price * trade.volume
+            position.volume += trade.volume
+            position.price = cost / position.volume
+        else:
+            # 平仓数量超出缓存持仓，说明缓存已偏离柜台数据
+            if not position or position.volume < trade.volume:
+                self.drift = True
+                return None
+
+            position.volume -= trade.volume
+
+            # 平仓和平昨优先平昨仓
+            if trade.offset != Offset.CLOSETODAY:
+                position.yd_volume = max(position.yd_volume - trade.volume, 0)
+
+        return position
+
+    def update_position(self, position: PositionData) -> bool:
+        """用查询结果校准单个持仓，返回是否有变化"""
+        key: Tuple[str, Direction] = (position.vt_symbol, position.direction)
+
+        # 查询发出后该持仓又有变动，查询结果可能已过时
+        if key in self.changed_keys:
+            self.drift = True
+
+        old: Optional[PositionData] = self.positions.get(key, None)
+        self.positions[key] = position
+
+        if not old:
+            return True
+
+        return (
+            old.volume != position.volume
+            or old.yd_volume != position.yd_volume
+            or old.frozen != position.frozen
+            or old.price != position.price
+            or old.pnl != position.pnl
+        )
+
+    def reconcile(self, positions: List[PositionData]) -> List[PositionData]:
+        """用全量查询结果校准持仓簿，返回有变化的持仓"""
+        changed: List[PositionData] = [p for p in positions if self.update_position(p)]
+
+        # 查询结果中不存在的持仓已被平掉
+        keys: Set[Tuple[str, Direction]] = {(p.vt_symbol, p.direction) for p in positions}
+
+        for key, position in list(self.positions.items()):
+            if key in keys:
+                continue
+
+            if key in self.changed_keys:
+                self.drift = True
+                continue
+
+            self.positions.pop(key)
+
+            if position.volume:
+                position.volume = 0
+                position.yd_volume = 0
+                position.frozen = 0
+                position.pnl = 0
+                changed.append(position)
+
+        # 首次查询完成后开始根据成交和委托增量更新
+        self.inited = True
+
+        return changed
 
 
 class NhGateway(BaseGateway):
@@ -230,16 +615,38 @@ class NhGateway(BaseGateway):
         "开发者编码": "",
         "开发者授权": "",
         "行情服务器登录用户": "",
-        "行情服务器登录密码": ""
+        "行情服务器登录密码": "",
+        "行情批量推送": ["否", "是"],
+        "行情深度档位": ["L5", "L1", "L10"],
+        "行情合并推送": ["否", "是"],
+        "每秒请求上限": 0,
+        "持仓增量更新": ["否", "是"],
+        "持仓校准间隔": 60,
+        "全量刷新间隔": 0
     }
 
     def __init__(self, event_engine: EventEngine, td_class: Any, gateway_name: str) -> None:
         """构造函数"""
         super().__init__(event_engine, gateway_name)
 
+        self.contracts: ContractRegistry = ContractRegistry()
+
         self.md_api: "NhMdApi" = NhMdApi(self)
         self.td_api = td_class(self)
 
+        self.position_book: PositionBook = PositionBook(gateway_name)
+
+        # 增量持仓模式：只在校准间隔到达或检测到偏差时全量查询持仓
+        self.incremental_position: bool = False
+        self.reconcile_interval: int = 30
+        self.reconcile_count: int = 0
+        self.account_dirty: bool = True
+
+        # 资金和持仓只在变化时推送，可定期全量推送一次
+        self.accounts: Dict[str, AccountData] = {}
+        self.refresh_interval: int = 0
+        self.refresh_count: int = 0
+
     def connect(self, setting: dict) -> None:
         """连接交易接口"""
         userid: str = setting["用户名"]
@@ -253,6 +660,16 @@ class NhGateway(BaseGateway):
         license: str = setting["开发者授权"]
         md_userid: str = setting["行情服务器登录用户"]
         md_password: str = setting["行情服务器登录密码"]
+        md_batch: bool = setting["行情批量推送"] == "是"
+        md_level: int = MD_LEVEL_SETTING[setting["行情深度档位"]]
+        md_conflate: bool = setting["行情合并推送"] == "是"
+        request_limit: int = int(setting["每秒请求上限"])
+        self.incremental_position = setting["持仓增量更新"] == "是"
+        # 定时查询每2秒执行一次，校准间隔换算为执行次数
+        self.reconcile_interval = max(int(setting["持仓校准间隔"]) // 2, 1)
+        refresh_seconds: int = int(setting["全量刷新间隔"])
+        if refresh_seconds > 0:
+            self.refresh_interval = max(refresh_seconds // 2, 1)
 
         if not td_address.startswith("tcp://"):
             td_address = "tcp://" + td_address
@@ -260,8 +677,21 @@ class NhGateway(BaseGateway):
         if not md_address.startswith("tcp://"):
             md_address = "tcp://" + md_address
 
+        # 请求流控，保留一半令牌给委托和撤单，查询超限时延后到补充令牌后发送
+        if request_limit > 0:
+            self.td_api.setRequestLimit(request_limit, request_limit, request_limit // 2)
+
         self.td_api.connect(td_address, userid, password, party_id, appid, auth_code)
-        self.md_api.connect(md_address, md_userid, md_password, code, license)
+        self.md_api.connect(
+            md_address,
+            md_userid,
+            md_password,
+            code,
+            license,
+            md_batch,
+            md_level,
+            md_conflate
+        )
 
         self.init_query()
 
@@ -269,22 +699,54 @@ class NhGateway(BaseGateway):
         """订阅行情"""
         self.md_api.subscribe(req)
 
+    def unsubscribe(self, req: SubscribeRequest) -> None:
+        """退订行情，同一合约的订阅次数全部退订后才向服务器退订"""
+        self.md_api.unsubscribe(req)
+
+    def subscribe_many(self, reqs: List[SubscribeRequest]) -> None:
+        """批量订阅行情"""
+        self.md_api.subscribe_many(reqs)
+
+    def unsubscribe_many(self, reqs: List[SubscribeRequest]) -> None:
+        """批量退订行情"""
+        self.md_api.unsubscribe_many(reqs)
+
     def send_order(self, req: OrderRequest) -> str:
         """委托下单"""
         vt_orderid = self.td_api.send_order(req)
         return vt_orderid
 
+    def send_orders(self, reqs: List[OrderRequest]) -> List[str]:
+        """批量委托下单"""
+        vt_orderids: List[str] = self.td_api.send_orders(reqs)
+        return vt_orderids
+
     def cancel_order(self, req: CancelRequest) -> None:
         """委托撤单"""
         self.td_api.cancel_order(req)
 
+    def cancel_orders(self, reqs: List[CancelRequest]) -> None:
+        """批量委托撤单"""
+        self.td_api.cancel_orders(reqs)
+
+    def cancel_all(self, symbol: str = None) -> None:
+        """全部撤单，传入symbol时只撤该合约的委托"""
+        self.td_api.cancel_all(symbol)
+
     def query_account(self) -> None:
         """查询资金"""
         self.td_api.query_account()
 
     def query_position(self) -> None:
-        """查询持仓"""
-        self.td_api.query_position()
+        """查询持仓，合约信息就绪且查询实际发出后才开始新一轮校准"""
+        if not self.td_api.contract_inited:
+            return
+
+        # 先记录校准起点再发出查询，避免遗漏查询期间的持仓变动
+        self.position_book.start_query()
+
+        if not self.td_api.query_position():
+            self.position_book.cancel_query()
 
     def close(self) -> None:
         """关闭接口"""
@@ -301,6 +763,60 @@ class NhGateway(BaseGateway):
         msg: str = f"{msg}，代码：{error_id}，信息：{error_msg}"
         self.write_log(msg)
 
+    def on_order(self, order: OrderData) -> None:
+        """委托推送，同时更新持仓冻结数量"""
+        super().on_order(order)
+
+        self.account_dirty = True
+
+        position: Optional[PositionData] = self.position_book.update_order(order)
+        if position:
+            super().on_position(copy(position))
+
+    def on_trade(self, trade: TradeData) -> None:
+        """成交推送，同时更新持仓数量"""
+        super().on_trade(trade)
+
+        self.account_dirty = True
+
+        position: Optional[PositionData] = self.position_book.update_trade(trade)
+        if position:
+            super().on_position(copy(position))
+
+    def on_position(self, position: PositionData) -> None:
+        """单条持仓查询结果推送，只推送有变化的持仓"""
+        if self.position_book.update_position(position):
+            super().on_position(copy(position))
+
+    def on_account(self, account: AccountData) -> None:
+        """资金推送，只推送有变化的资金"""
+        old: Optional[AccountData] = self.accounts.get(account.accountid, None)
+        if (
+            old
+            and old.balance == account.balance
+            and old.frozen == account.frozen
+            and old.available == account.available
+        ):
+            return
+
+        self.accounts[account.accountid] = account
+        super().on_account(account)
+
+    def refresh_all(self) -> None:
+        """全量推送缓存的资金和持仓"""
+        for account in list(self.accounts.values()):
+            super().on_account(copy(account))
+
+        # 持仓簿的每次变化都已推送，数量为0的持仓在清零时已推送过，无需重复推送
+        for position in list(self.position_book.positions.values()):
+            if position.volume:
+                super().on_position(copy(position))
+
+    def on_positions(self, positions: List[PositionData]) -> None:
+        """全量持仓查询结果推送，校准持仓簿后只推送有变化的持仓"""
+        for position in self.position_book.reconcile(positions):
+            super().on_position(copy(position))
+
     def process_timer_event(self, event) -> None:
         """定时事件处理"""
         self.count += 1
@@ -308,18 +824,54 @@ class NhGateway(BaseGateway):
             return
         self.count = 0
 
-        func = self.query_functions.pop(0)
-        func()
-        self.query_functions.append(func)
+        if self.incremental_position:
+            self.process_incremental_query()
+        else:
+            func = self.query_functions.pop(0)
+            func()
+            self.query_functions.append(func)
+
+        if self.refresh_interval:
+            self.refresh_count += 1
+            if self.refresh_count >= self.refresh_interval:
+                self.refresh_count = 0
+                self.refresh_all()
 
         self.md_api.update_date()
 
+    def process_incremental_query(self) -> None:
+        """增量模式下仅在需要时发起查询"""
+        self.reconcile_count += 1
+
+        # 到达校准间隔或检测到偏差时全量查询持仓
+        if self.position_book.drift or self.reconcile_count >= self.reconcile_interval:
+            self.reconcile_count = 0
+            self.account_dirty = True
+            self.query_position()
+        # 资金只在委托成交变化后查询
+        elif self.account_dirty:
+            self.account_dirty = False
+            self.query_account()
+
     def init_query(self) -> None:
         """初始化查询任务"""
         self.count: int = 0
         self.query_functions: list = [self.query_account, self.query_position]
         self.event_engine.register(EVENT_TIMER, self.process_timer_event)
 
+    def get_option_chain(self, portfolio: str, expiry: datetime = None) -> dict:
+        """查询期权链"""
+        return self.contracts.get_option_chain(portfolio, expiry)
+
+    def on_option_chains(self) -> None:
+        """推送有变化的期权链"""
+        for portfolio in self.contracts.pop_changed_portfolios():
+            chain: dict = {
+                "portfolio": portfolio,
+                "chain": self.contracts.get_option_chain(portfolio)
+            }
+            self.on_event(EVENT_NH_OPTION_CHAIN, chain)
+
     def send_exercise(self, req: dict) -> None:
         """委托行权"""
         self.td_api.send_exercise(req)
@@ -364,12 +916,14 @@ class NhMdApi(MdApi):
 
         self.gateway = gateway
         self.gateway_name: str = gateway.gateway_name
+        self.contracts: ContractRegistry = gateway.contracts
 
         self.reqid: int = 0
 
         self.connect_status: bool = False
         self.login_status: bool = False
-        self.subscribed: Set = set()
+        # 订阅键 -> 引用计数，计数归零时才向服务器退订
+        self.subscribed: Dict[str, int] = {}
 
         self.userid: str = ""
         self.password: str = ""
@@ -377,17 +931,40 @@ class NhMdApi(MdApi):
         self.license: str = "xwx123"
 
         self.current_date: str = datetime.now().strftime("%Y%m%d")
+        self.midnight_date: str = ""
+        self.midnight: datetime = None
+
+        self.market_data_level: int = 5
+
+        # 本地代码到订阅键的缓存，以及排队等待发送的订阅键
+        self.subscribe_keys: Dict[str, str] = {}
+        self.pending_keys: List[str] = []
+        self.pending_total: int = 0
 
-    def connect(self, address: str, userid: str, password: str, code: str, license: str) -> None:
+    def connect(
+        self,
+        address: str,
+        userid: str,
+        password: str,
+        code: str,
+        license: str,
+        batch: bool = False,
+        level: int = 5,
+        conflate: bool = False
+    ) -> None:
         """连接服务器"""
         self.userid = userid
         self.password = password
         self.code = code
         self.license = license
+        self.market_data_level = level
 
         # 如果没有连接，就先发起连接
         if not self.connect_status:
             self.createMdApi()
+            self.setBatchMode(batch)
+            self.setMarketDataLevel(level)
+            self.setConflateMode(conflate)
             self.registerFront(address)
             self.init()
 
@@ -408,8 +985,12 @@ class NhMdApi(MdApi):
         self.reqid += 1
         self.reqUtpLogin(req, self.reqid)
 
-    def subscribe(self, req: SubscribeRequest) -> None:
-        """订阅行情"""
+    def get_subscribe_key(self, req: SubscribeRequest) -> str:
+        """获取订阅键，首次生成后缓存"""
+        key: Optional[str] = self.subscribe_keys.get(req.vt_symbol, None)
+        if key:
+            return key
+
         exchange_str: str = EXCHANGE_VT2MD[req.exchange]
 
         if req.exchange in {Exchange.SSE, Exchange.SZSE}:
@@ -418,15 +999,124 @@ class NhMdApi(MdApi):
             # 债券: MD003
             # ETF: MD004
             # 期权: M0301
-            key: str = f"{exchange_str}.M0301.{req.symbol}"
+            key = f"{exchange_str}.M0301.{req.symbol}"
         else:
-            key: str = f"{exchange_str}.{req.symbol}"
+            key = f"{exchange_str}.{req.symbol}"
 
-        if self.login_status:
+        self.subscribe_keys[req.vt_symbol] = key
+        return key
+
+    def add_subscription(self, req: SubscribeRequest) -> Optional[str]:
+        """增加订阅引用计数，首次订阅时返回订阅键"""
+        key: str = self.get_subscribe_key(req)
+
+        count: int = self.subscribed.get(key, 0)
+        self.subscribed[key] = count + 1
+
+        if count:
+            return None
+        return key
+
+    def remove_subscription(self, req: SubscribeRequest) -> Optional[str]:
+        """减少订阅引用计数，计数归零时返回订阅键"""
+        key: str = self.get_subscribe_key(req)
+
+        count: int = self.subscribed.get(key, 0)
+        if not count:
+            return None
+
+        if count > 1:
+            self.subscribed[key] = count - 1
+            return None
+
+        self.subscribed.pop(key)
+        return key
+
+    def subscribe(self, req: SubscribeRequest) -> None:
+        """订阅行情"""
+        key: Optional[str] = self.add_subscription(req)
+
+        if key and self.login_status:
             self.reqid += 1
             self.reqSubscribe(key, self.reqid)
 
-        self.subscribed.add(key)
+    def unsubscribe(self, req: SubscribeRequest) -> None:
+        """退订行情"""
+        self.unsubscribe_many([req])
+
+    def subscribe_many(self, reqs: List[SubscribeRequest]) -> None:
+        """批量订阅行情，登录后排队分批发送"""
+        keys: List[str] = []
+        for req in reqs:
+            key: Optional[str] = self.add_subscription(req)
+            if key:
+                keys.append(key)
+
+        if self.login_status:
+            self.queue_subscribe(keys)
+
+    def unsubscribe_many(self, reqs: List[SubscribeRequest]) -> None:
+        """批量退订行情"""
+        keys: List[str] = []
+        for req in reqs:
+            key: Optional[str] = self.remove_subscription(req)
+            if key:
+                keys.append(key)
+
+        if not keys:
+            return
+
+        # 尚未发出的订阅直接从队列移除，无需向服务器退订
+        removed: Set[str] = set(keys)
+        pending: Set[str] = {key for key in self.pending_keys if key in removed}
+
+        if pending:
+            self.pending_keys = [key for key in self.pending_keys if key not in pending]
+            self.pending_total -= len(pending)
+            keys = [key for key in keys if key not in pending]
+
+        if not keys or not self.login_status:
+            return
+
+        if len(keys) == 1:
+            self.reqid += 1
+            self.reqUnSubscribe(keys[0], self.reqid)
+            return
+
+        for i in range(0, len(keys), SUBSCRIBE_BATCH_SIZE):
+            self.reqid += 1
+            self.reqUnSubscribeBatch(keys[i:i + SUBSCRIBE_BATCH_SIZE], self.reqid)
+
+    def queue_subscribe(self, keys: List[str]) -> None:
+        """将订阅键加入发送队列，由定时事件分批发送"""
+        if not keys:
+            return
+
+        if not self.pending_keys:
+            self.pending_total = 0
+
+        self.pending_keys.extend(keys)
+        self.pending_total += len(keys)
+        self.gateway.event_engine.register(EVENT_TIMER, self.process_subscribe_queue)
+
+    def process_subscribe_queue(self, event: Event) -> None:
+        """每次定时事件最多发送SUBSCRIBE_BATCH_COUNT个订阅请求"""
+        if not self.login_status or not self.pending_keys:
+            self.pending_keys = []
+            self.gateway.event_engine.unregister(EVENT_TIMER, self.process_subscribe_queue)
+            return
+
+        for _ in range(SUBSCRIBE_BATCH_COUNT):
+            keys: List[str] = self.pending_keys[:SUBSCRIBE_BATCH_SIZE]
+            if not keys:
+                break
+            del self.pending_keys[:SUBSCRIBE_BATCH_SIZE]
+
+            self.reqid += 1
+            self.reqSubscribeBatch(keys, self.reqid)
+
+        sent: int = self.pending_total - len(self.pending_keys)
+        self.gateway.write_log(f"行情订阅进度：{sent}/{self.pending_total}")
 
     def close(self) -> None:
         """关闭连接"""
@@ -454,17 +1144,37 @@ class NhMdApi(MdApi):
 
     def onRtnMarketData(self, data: dict) -> None:
         """订阅行情回报"""
+        tick: Optional[TickData] = self.convert_tick(data)
+        if tick:
+            self.gateway.on_tick(tick)
+
+    def onRtnMarketDataBatch(self, data_list: List[dict]) -> None:
+        """批量行情回报"""
+        convert_tick = self.convert_tick
+        ticks: List[TickData] = [convert_tick(data) for data in data_list]
+
+        on_tick = self.gateway.on_tick
+        for tick in ticks:
+            if tick:
+                on_tick(tick)
+
+    def convert_tick(self, data: dict) -> Optional[TickData]:
+        """将行情字典转换为TickData"""
         symbol: str = data["instrument_id"]
 
-        contract: ContractData = symbol_contract_map.get(symbol, None)
+        contract: ContractData = self.contracts.get(symbol)
         if not contract:
-            return
+            return None
 
-        timestamp: str = f"{self.current_date} {data['update_time']}.{int(data['update_millisec']/100)}"
-        dt: datetime = datetime.strptime(timestamp, "%Y%m%d %H:%M:%S.%f")
-        dt: datetime = CHINA_TZ.localize(dt)
+        dt: datetime = self.get_tick_datetime(data["update_time"], data["update_millisec"])
+
+        # 十档模式下使用扩展的行情数据对象
+        if self.market_data_level >= 10:
+            tick_class: type = DepthTickData
+        else:
+            tick_class: type = TickData
 
-        tick: TickData = TickData(
+        tick: TickData = tick_class(
             symbol=symbol,
             exchange=contract.exchange,
             datetime=dt,
@@ -485,6 +1195,9 @@ class NhMdApi(MdApi):
             gateway_name=self.gateway_name
         )
 
+        if self.market_data_level < 5:
+            return tick
+
         if data["bid_volume2"] or data["ask_volume2"]:
             tick.bid_price_2 = adjust_price(data["bid_price2"])
             tick.bid_price_3 = adjust_price(data["bid_price3"])
@@ -506,7 +1219,57 @@ class NhMdApi(MdApi):
             tick.ask_volume_4 = data["ask_volume4"]
             tick.ask_volume_5 = data["ask_volume5"]
 
-        self.gateway.on_tick(tick)
+        if self.market_data_level < 10:
+            return tick
+
+        tick.turnover = data["turnover"]
+
+        if data["bid_volume6"] or data["ask_volume6"]:
+            tick.bid_price_6 = adjust_price(data["bid_price6"])
+            tick.bid_price_7 = adjust_price(data["bid_price7"])
+            tick.bid_price_8 = adjust_price(data["bid_price8"])
+            tick.bid_price_9 = adjust_price(data["bid_price9"])
+            tick.bid_price_10 = adjust_price(data["bid_price10"])
+
+            tick.ask_price_6 = adjust_price(data["ask_price6"])
+            tick.ask_price_7 = adjust_price(data["ask_price7"])
+            tick.ask_price_8 = adjust_price(data["ask_price8"])
+            tick.ask_price_9 = adjust_price(data["ask_price9"])
+            tick.ask_price_10 = adjust_price(data["ask_price10"])
+
+            tick.bid_volume_6 = data["bid_volume6"]
+            tick.bid_volume_7 = data["bid_volume7"]
+            tick.bid_volume_8 = data["bid_volume8"]
+            tick.bid_volume_9 = data["bid_volume9"]
+            tick.bid_volume_10 = data["bid_volume10"]
+
+            tick.ask_volume_6 = data["ask_volume6"]
+            tick.ask_volume_7 = data["ask_volume7"]
+            tick.ask_volume_8 = data["ask_volume8"]
+            tick.ask_volume_9 = data["ask_volume9"]
+            tick.ask_volume_10 = data["ask_volume10"]
+
+        return tick
+
+    def get_tick_datetime(self, update_time: str, update_millisec: int) -> datetime:
+        """生成行情时间戳，复用当日零点对象以避免逐笔解析字符串"""
+        if self.midnight_date != self.current_date:
+            self.midnight = CHINA_TZ.localize(datetime.strptime(self.current_date, "%Y%m%d"))
+            self.midnight_date = self.current_date
+
+        # 标准格式HH:MM:SS直接按位置取值
+        if len(update_time) == 8 and 0 <= update_millisec < 1000:
+            return self.midnight.replace(
+                hour=int(update_time[0:2]),
+                minute=int(update_time[3:5]),
+                second=int(update_time[6:8]),
+                microsecond=int(update_millisec / 100) * 100000
+            )
+
+        # 其他格式沿用字符串解析
+        timestamp: str = f"{self.current_date} {update_time}.{int(update_millisec/100)}"
+        dt: datetime = datetime.strptime(timestamp, "%Y%m%d %H:%M:%S.%f")
+        return CHINA_TZ.localize(dt)
 
     def onRspUtpLogin(self, data: dict, reqid: int) -> None:
         """用户登录请求回报"""
@@ -514,9 +1277,9 @@ class NhMdApi(MdApi):
             self.login_status = True
             self.gateway.write_log("行情服务器登录成功")
 
-            for key in self.subscribed:
-                self.reqid += 1
-                self.reqSubscribe(key, self.reqid)
+            # 断线重连后重新订阅，分批按节奏发送
+            self.pending_keys = []
+            self.queue_subscribe(list(self.subscribed))
         else:
             msg: str = f"行情服务器登录失败，错误信息{data['response_string']}"
             self.gateway.write_log(msg)
@@ -527,6 +1290,12 @@ class NhMdApi(MdApi):
             msg: str = f"行情订阅失败，错误信息{data['response_string']}"
             self.gateway.write_log(msg)
 
+    def onRspUnSubscribe(self, data: dict, reqid: int) -> None:
+        """退订行情回报"""
+        if data["response_code"]:
+            msg: str = f"行情退订失败，错误信息{data['response_string']}"
+            self.gateway.write_log(msg)
+
 
 class NhFuturesTdApi(FuturesTdApi):
     """"""
@@ -537,6 +1306,7 @@ class NhFuturesTdApi(FuturesTdApi):
 
         self.gateway = gateway
         self.gateway_name: str = gateway.gateway_name
+        self.contracts: ContractRegistry = gateway.contracts
 
         self.reqid: int = 0
         self.order_ref: int = 0
@@ -553,14 +1323,27 @@ class NhFuturesTdApi(FuturesTdApi):
         self.appid: str = ""
         self.product_info: str = ""
 
+        self.brokerid: str = ""
         self.frontid: int = 0
         self.sessionid: int = 0
+        self.trading_day: str = ""
 
         self.order_data: List[dict] = []
         self.trade_data: List[dict] = []
-        self.positions: Dict[str, PositionData] = {}
+        self.query_contracts: List[ContractData] = []
+        self.positions: Dict[Tuple[str, str], PositionData] = {}
         self.sysid_orderid_map: Dict[str, str] = {}
 
+        self.order_templates: Dict[tuple, int] = {}
+
+        # 活动委托的撤单参数：合约代码、交易所、报单引用、前置编号、会话编号
+        self.active_orders: Dict[str, tuple] = {}
+        self.batch_action_enabled: bool = True
+
+        # 合约查询失败后的重试倒计时和退避间隔（秒）
+        self.instrument_countdown: int = 0
+        self.instrument_interval: int = 1
+
     def onFrontConnected(self) -> None:
         """服务器连接成功回报"""
         self.gateway.write_log("交易服务器连接成功")
@@ -587,11 +1370,30 @@ class NhFuturesTdApi(FuturesTdApi):
     def onRspUserLogin(self, data: dict, error: dict, reqid: int, last: bool) -> None:
         """用户登录请求回报"""
         if not error["ErrorID"]:
+            self.brokerid = data["BrokerID"]
             self.frontid = data["FrontID"]
             self.sessionid = data["SessionID"]
+            self.trading_day = data["TradingDay"]
             self.login_status = True
             self.gateway.write_log("交易服务器登录成功")
 
+            # 先从本地缓存推送合约，柜台查询结果到达后再推送差异
+            self.load_contract_cache()
+
+            # 设置报单模板，下单时只需填写委托相关字段
+            template: dict = {
+                "BrokerID": self.brokerid,
+                "InvestorID": self.userid,
+                "UserID": self.userid,
+                "CombHedgeFlag": THOST_FTDC_HF_Speculation,
+                "ContingentCondition": THOST_FTDC_CC_Immediately,
+                "ForceCloseReason": THOST_FTDC_FCC_NotForceClose,
+                "IsAutoSuspend": 0,
+                "MinVolume": 1
+            }
+            # 重新登录时已有模板编号保持有效，只更新其中的经纪商和投资者代码等字段
+            self.setOrderInsertTemplate(template)
+
             # 自动确认结算单
             req: dict = {
                 "InvestorID": self.userid
@@ -609,7 +1411,7 @@ class NhFuturesTdApi(FuturesTdApi):
         orderid: str = f"{self.frontid}_{self.sessionid}_{order_ref}"
 
         symbol: str = data["InstrumentID"]
-        contract: ContractData = symbol_contract_map[symbol]
+        contract: ContractData = self.contracts[symbol]
 
         order: OrderData = OrderData(
             symbol=symbol,
@@ -623,6 +1425,7 @@ class NhFuturesTdApi(FuturesTdApi):
             gateway_name=self.gateway_name
         )
         self.gateway.on_order(order)
+        self.active_orders.pop(orderid, None)
 
         self.gateway.write_error("交易委托失败", error)
 
@@ -630,31 +1433,63 @@ class NhFuturesTdApi(FuturesTdApi):
         """委托撤单失败回报"""
         self.gateway.write_error("交易撤单失败", error)
 
+    def onRspBatchOrderAction(self, data: dict, error: dict, reqid: int, last: bool) -> None:
+        """批量撤单失败回报"""
+        if error["ErrorID"]:
+            self.process_batch_action_error(data, error)
+
+    def onErrRtnBatchOrderAction(self, data: dict, error: dict) -> None:
+        """批量撤单错误推送"""
+        if error["ErrorID"]:
+            self.process_batch_action_error(data, error)
+
+    def process_batch_action_error(self, data: dict, error: dict) -> None:
+        """柜台不支持批量撤单时，改为逐笔撤销该交易所的委托"""
+        self.batch_action_enabled = False
+        self.gateway.write_error("批量撤单失败，改为逐笔撤单", error)
+
+        exchange: str = data.get("ExchangeID", "")
+        items: List[tuple] = [
+            params for params in self.active_orders.values()
+            if params[3] == self.frontid and params[4] == self.sessionid
+            and (not exchange or params[1] == exchange)
+        ]
+        self.send_order_actions(items)
+
     def onRspSettlementInfoConfirm(self, data: dict, error: dict, reqid: int, last: bool) -> None:
         """确认结算单回报"""
         self.gateway.write_log("结算信息确认成功")
 
-        while True:
-            self.reqid += 1
-            n: int = self.reqQryInstrument({}, self.reqid)
+        # 在定时器中发起合约查询，避免阻塞回调线程
+        self.instrument_countdown = 1
+        self.instrument_interval = 1
+        self.gateway.event_engine.register(EVENT_TIMER, self.query_instrument)
 
-            if not n:
-                break
-            else:
-                sleep(1)
+    def query_instrument(self, event: Event) -> None:
+        """查询合约，发送失败时按退避间隔重试"""
+        self.instrument_countdown -= 1
+        if self.instrument_countdown > 0:
+            return
 
-    def onRspQryInvestorPosition(self, data: dict, error: dict, reqid: int, last: bool) -> None:
-        """持仓查询回报"""
-        if not data:
+        self.reqid += 1
+        n: int = self.reqQryInstrument({}, self.reqid)
+
+        if not n:
+            self.gateway.event_engine.unregister(EVENT_TIMER, self.query_instrument)
             return
 
+        self.instrument_interval = min(self.instrument_interval * 2, 16)
+        self.instrument_countdown = self.instrument_interval
+
+    def onRspQryInvestorPosition(self, data: dict, error: dict, reqid: int, last: bool) -> None:
+        """持仓查询回报"""
         # 必须已经收到了合约信息后才能处理
-        symbol: str = data["InstrumentID"]
-        contract: ContractData = symbol_contract_map.get(symbol, None)
+        symbol: str = data.get("InstrumentID", "")
+        contract: ContractData = self.contracts.get(symbol)
 
         if contract:
-            # 获取之前缓存的持仓数据缓存
-            key: str = f"{data['InstrumentID'], data['PosiDirection']}"
+            # 上期所今昨仓分两条返回，需要先合并
+            key: Tuple[str, str] = (symbol, data["PosiDirection"])
             position: PositionData = self.positions.get(key, None)
             if not position:
                 position: PositionData = PositionData(
@@ -695,9 +1530,7 @@ class NhFuturesTdApi(FuturesTdApi):
                 position.frozen += data["LongFrozen"]
 
         if last:
-            for position in self.positions.values():
-                self.gateway.on_position(position)
-
+            self.gateway.on_positions(list(self.positions.values()))
             self.positions.clear()
 
     def onRspQryTradingAccount(self, data: dict, error: dict, reqid: int, last: bool) -> None:
@@ -742,13 +1575,20 @@ class NhFuturesTdApi(FuturesTdApi):
                 contract.option_index = str(data["StrikePrice"])
                 contract.option_expiry = datetime.strptime(data["ExpireDate"], "%Y%m%d")
 
-            self.gateway.on_contract(contract)
+            self.query_contracts.append(contract)
 
-            symbol_contract_map[contract.symbol] = contract
+            # 只推送与缓存不同的合约
+            if self.contracts.add(contract):
+                self.gateway.on_contract(contract)
 
         if last:
+            save_contract_cache(self.gateway_name, self.trading_day, self.query_contracts)
+            self.remove_expired_contracts()
+            self.query_contracts = []
+
             self.contract_inited = True
             self.gateway.write_log("合约信息查询成功")
+            self.gateway.on_option_chains()
 
             for data in self.order_data:
                 self.onRtnOrder(data)
@@ -758,6 +1598,37 @@ class NhFuturesTdApi(FuturesTdApi):
                 self.onRtnTrade(data)
             self.trade_data.clear()
 
+    def load_contract_cache(self) -> None:
+        """加载当前交易日的本地合约缓存"""
+        # 断线重连时合约已推送过，无需重复加载
+        if self.contract_inited:
+            return
+
+        contracts: List[ContractData] = load_contract_cache(self.gateway_name, self.trading_day)
+        if not contracts:
+            return
+
+        for contract in contracts:
+            self.contracts.add(contract)
+            self.gateway.on_contract(contract)
+
+        self.contract_inited = True
+        self.gateway.write_log("合约信息缓存加载成功")
+        self.gateway.on_option_chains()
+
+    def remove_expired_contracts(self) -> None:
+        """移除缓存中存在但柜台查询结果中没有的合约"""
+        # 查询结果为空时无法判断，保留现有合约
+        if not self.query_contracts:
+            return
+
+        symbols: Set[str] = {contract.symbol for contract in self.query_contracts}
+        removed: List[ContractData] = self.contracts.retain(symbols)
+
+        if removed:
+            names: str = "、".join(contract.symbol for contract in removed[:10])
+            self.gateway.write_log(f"移除{len(removed)}个已失效的缓存合约：{names}")
+
     def onRtnOrder(self, data: dict) -> None:
         """委托更新推送"""
         if not self.contract_inited:
@@ -765,7 +1636,7 @@ class NhFuturesTdApi(FuturesTdApi):
             return
 
         symbol: str = data["InstrumentID"]
-        contract: ContractData = symbol_contract_map[symbol]
+        contract: ContractData = self.contracts[symbol]
 
         frontid: int = data["FrontID"]
         sessionid: int = data["SessionID"]
@@ -794,6 +1665,11 @@ class NhFuturesTdApi(FuturesTdApi):
 
         self.sysid_orderid_map[data["OrderSysID"]] = orderid
 
+        if order.is_active():
+            self.active_orders[orderid] = (symbol, data["ExchangeID"], order_ref, frontid, sessionid)
+        else:
+            self.active_orders.pop(orderid, None)
+
     def onRtnTrade(self, data: dict) -> None:
         """成交数据推送"""
         if not self.contract_inited:
@@ -801,7 +1677,7 @@ class NhFuturesTdApi(FuturesTdApi):
             return
 
         symbol: str = data["InstrumentID"]
-        contract: ContractData = symbol_contract_map[symbol]
+        contract: ContractData = self.contracts[symbol]
 
         orderid: str = self.sysid_orderid_map[data["OrderSysID"]]
 
@@ -900,26 +1776,101 @@ class NhFuturesTdApi(FuturesTdApi):
             return ""
 
         self.order_ref += 1
+        template_id: int = self.get_order_template(req)
 
+        self.reqid += 1
+        n: int = self.reqOrderInsertByTemplate(
+            template_id,
+            req.price,
+            int(req.volume),
+            str(self.order_ref),
+            self.reqid
+        )
+
+        orderid: str = f"{self.frontid}_{self.sessionid}_{self.order_ref}"
+        order: OrderData = req.create_order_data(orderid, self.gateway_name)
+
+        if n:
+            self.reject_order(order, n)
+        else:
+            self.active_orders[orderid] = (
+                req.symbol, req.exchange.value, str(self.order_ref), self.frontid, self.sessionid
+            )
+
+        self.gateway.on_order(order)
+        return order.vt_orderid
+
+    def send_orders(self, reqs: List[OrderRequest]) -> List[str]:
+        """批量委托下单"""
+        vt_orderids: List[str] = []
+        orders: List[OrderData] = []
+        items: List[tuple] = []
+
+        for req in reqs:
+            if req.offset not in OFFSET_VT2FUTURES:
+                self.gateway.write_log("请选择开平方向")
+                vt_orderids.append("")
+                continue
+
+            if req.type not in ORDERTYPE_VT2FUTURES:
+                self.gateway.write_log(f"当前接口不支持该类型的委托{req.type.value}")
+                vt_orderids.append("")
+                continue
+
+            self.order_ref += 1
+            template_id: int = self.get_order_template(req)
+            items.append((template_id, req.price, int(req.volume), str(self.order_ref)))
+
+            orderid: str = f"{self.frontid}_{self.sessionid}_{self.order_ref}"
+            order: OrderData = req.create_order_data(orderid, self.gateway_name)
+            orders.append(order)
+            vt_orderids.append(order.vt_orderid)
+
+            self.active_orders[orderid] = (
+                req.symbol, req.exchange.value, str(self.order_ref), self.frontid, self.sessionid
+            )
+
+        # 一次调用发送全部委托，请求编号依次递增
+        if items:
+            results: List[int] = self.reqOrderInsertBatch(items, self.reqid + 1)
+            self.reqid += len(items)
+
+            for order, n in zip(orders, results):
+                if n:
+                    self.reject_order(order, n)
+
+        for order in orders:
+            self.gateway.on_order(order)
+
+        return vt_orderids
+
+    def reject_order(self, order: OrderData, n: int) -> None:
+        """委托请求发送失败时标记为拒单"""
+        order.status = Status.REJECTED
+        self.active_orders.pop(order.orderid, None)
+        self.gateway.write_log(f"交易委托失败，请求发送返回码：{n}")
+
+    def get_order_template(self, req: OrderRequest) -> int:
+        """获取报单模板编号，同一合约、类型、开平和方向的委托复用同一模板"""
+        key: tuple = (req.symbol, req.exchange, req.type, req.offset, req.direction)
+
+        template_id: Optional[int] = self.order_templates.get(key, None)
+        if template_id is None:
+            template_id = self.add_order_template(req)
+            self.order_templates[key] = template_id
+
+        return template_id
+
+    def add_order_template(self, req: OrderRequest) -> int:
+        """生成报单模板，经纪商、投资者代码等固定字段已在登录时写入"""
         nh_req: dict = {
             "InstrumentID": req.symbol,
             "ExchangeID": req.exchange.value,
-            "LimitPrice": req.price,
-            "VolumeTotalOriginal": int(req.volume),
-            "OrderPriceType": ORDERTYPE_VT2FUTURES.get(req.type, ""),
-            "Direction": DIRECTION_VT2FUTURES.get(req.direction, ""),
-            "CombOffsetFlag": OFFSET_VT2FUTURES.get(req.offset, ""),
-            "OrderRef": str(self.order_ref),
-            "InvestorID": self.userid,
-            "UserID": self.userid,
-            "BrokerID": self.brokerid,
-            "CombHedgeFlag": THOST_FTDC_HF_Speculation,
-            "ContingentCondition": THOST_FTDC_CC_Immediately,
-            "ForceCloseReason": THOST_FTDC_FCC_NotForceClose,
-            "IsAutoSuspend": 0,
+            "OrderPriceType": ORDERTYPE_VT2FUTURES[req.type],
+            "Direction": DIRECTION_VT2FUTURES[req.direction],
+            "CombOffsetFlag": OFFSET_VT2FUTURES[req.offset],
             "TimeCondition": THOST_FTDC_TC_GFD,
-            "VolumeCondition": THOST_FTDC_VC_AV,
-            "MinVolume": 1
+            "VolumeCondition": THOST_FTDC_VC_AV
         }
 
         if req.type == OrderType.FAK:
@@ -931,14 +1882,7 @@ class NhFuturesTdApi(FuturesTdApi):
             nh_req["TimeCondition"] = THOST_FTDC_TC_IOC
             nh_req["VolumeCondition"] = THOST_FTDC_VC_CV
 
-        self.reqid += 1
-        self.reqOrderInsert(nh_req, self.reqid)
-
-        orderid: str = f"{self.frontid}_{self.sessionid}_{self.order_ref}"
-        order: OrderData = req.create_order_data(orderid, self.gateway_name)
-        self.gateway.on_order(order)
-
-        return order.vt_orderid
+        return self.addOrderTemplate(nh_req)
 
     def cancel_order(self, req: CancelRequest) -> None:
         """委托撤单"""
@@ -958,6 +1902,63 @@ class NhFuturesTdApi(FuturesTdApi):
         self.reqid += 1
         self.reqOrderAction(nh_req, self.reqid)
 
+    def cancel_orders(self, reqs: List[CancelRequest]) -> None:
+        """批量委托撤单"""
+        items: List[tuple] = []
+
+        for req in reqs:
+            # 优先使用下单时保存的撤单参数
+            params: Optional[tuple] = self.active_orders.get(req.orderid, None)
+            if not params:
+                frontid, sessionid, order_ref = req.orderid.split("_")
+                params = (req.symbol, req.exchange.value, order_ref, int(frontid), int(sessionid))
+            items.append(params)
+
+        self.send_order_actions(items)
+
+    def cancel_all(self, symbol: str = None) -> None:
+        """全部撤单"""
+        if symbol or not self.batch_action_enabled:
+            items: List[tuple] = [
+                params for params in self.active_orders.values()
+                if not symbol or params[0] == symbol
+            ]
+            self.send_order_actions(items)
+            return
+
+        # 当前会话的委托按交易所批量撤单，其他会话的委托逐笔撤单
+        exchanges: Set[str] = set()
+        items: List[tuple] = []
+
+        for params in self.active_orders.values():
+            if params[3] == self.frontid and params[4] == self.sessionid:
+                exchanges.add(params[1])
+            else:
+                items.append(params)
+
+        for exchange in exchanges:
+            nh_req: dict = {
+                "BrokerID": self.brokerid,
+                "InvestorID": self.userid,
+                "UserID": self.userid,
+                "ExchangeID": exchange,
+                "FrontID": self.frontid,
+                "SessionID": self.sessionid
+            }
+
+            self.reqid += 1
+            self.reqBatchOrderAction(nh_req, self.reqid)
+
+        self.send_order_actions(items)
+
+    def send_order_actions(self, items: List[tuple]) -> None:
+        """一次调用发送多笔撤单请求"""
+        if not items:
+            return
+
+        self.reqOrderActionBatch(items, self.reqid + 1)
+        self.reqid += len(items)
+
     def send_rfq(self, req: OrderRequest) -> str:
         """询价请求"""
         self.order_ref += 1
@@ -983,10 +1984,10 @@ class NhFuturesTdApi(FuturesTdApi):
         self.reqid += 1
         self.reqQryTradingAccount({}, self.reqid)
 
-    def query_position(self) -> None:
-        """查询持仓"""
-        if not symbol_contract_map:
-            return
+    def query_position(self) -> bool:
+        """查询持仓，返回查询是否已发出"""
+        if not self.contract_inited:
+            return False
 
         req: dict = {
             "BrokerID": self.brokerid,
@@ -994,7 +1995,8 @@ class NhFuturesTdApi(FuturesTdApi):
         }
 
         self.reqid += 1
-        self.reqQryInvestorPosition(req, self.reqid)
+        n: int = self.reqQryInvestorPosition(req, self.reqid)
+        return not n
 
     def close(self) -> None:
         """关闭接口"""
@@ -1011,6 +2013,7 @@ class NhStockTdApi(StockTdApi):
 
         self.gateway = gateway
         self.gateway_name: str = gateway.gateway_name
+        self.contracts: ContractRegistry = gateway.contracts
 
         self.reqid: int = 0
 
@@ -1034,10 +2037,16 @@ class NhStockTdApi(StockTdApi):
         self.today_date: str = ""
         self.order_data: List[dict] = []
         self.trade_data: List[dict] = []
+        self.query_contracts: List[ContractData] = []
 
         self.orders: Dict[str, OrderData] = {}
+        self.active_orders: Dict[str, OrderData] = {}
+        self.options_templates: Dict[tuple, int] = {}
+        self.positions: Dict[Tuple[str, Direction], PositionData] = {}
 
+        # 合约查询失败后的重试倒计时和退避间隔（秒）
         self.instrument_countdown: int = 0
+        self.instrument_interval: int = 1
 
     def connect(
         self,
@@ -1096,31 +2105,105 @@ class NhStockTdApi(StockTdApi):
             return ""
 
         self.order_ref += 1
+        template_id: int = self.get_options_template(req)
+
+        self.reqid += 1
+        n: int = self.reqOptionsInsertByTemplate(
+            template_id,
+            req.price,
+            int(req.volume),
+            self.order_ref,
+            self.reqid
+        )
+
+        orderid: str = str(self.order_ref)
+        order: OrderData = req.create_order_data(orderid, self.gateway_name)
+        self.orders[orderid] = order
+
+        if n:
+            self.reject_order(order, n)
+        else:
+            self.active_orders[orderid] = order
+
+        self.gateway.on_order(copy(order))
+        return order.vt_orderid
+
+    def send_orders(self, reqs: List[OrderRequest]) -> List[str]:
+        """批量委托下单"""
+        vt_orderids: List[str] = []
+        orders: List[OrderData] = []
+        items: List[tuple] = []
+
+        for req in reqs:
+            if req.offset not in OFFSET_VT2STOCK:
+                self.gateway.write_log("请选择开平方向")
+                vt_orderids.append("")
+                continue
+
+            if req.type not in ORDERTYPE_VT2STOCK:
+                self.gateway.write_log(f"当前接口不支持该类型的委托{req.type.value}")
+                vt_orderids.append("")
+                continue
+
+            self.order_ref += 1
+            template_id: int = self.get_options_template(req)
+            items.append((template_id, req.price, int(req.volume), self.order_ref))
+
+            orderid: str = str(self.order_ref)
+            order: OrderData = req.create_order_data(orderid, self.gateway_name)
+            self.orders[orderid] = order
+            self.active_orders[orderid] = order
+
+            orders.append(order)
+            vt_orderids.append(order.vt_orderid)
+
+        # 一次调用发送全部委托，请求编号依次递增
+        if items:
+            results: List[int] = self.reqOptionsInsertBatch(items, self.reqid + 1)
+            self.reqid += len(items)
+
+            for order, n in zip(orders, results):
+                if n:
+                    self.reject_order(order, n)
+
+        for order in orders:
+            self.gateway.on_order(copy(order))
+
+        return vt_orderids
+
+    def reject_order(self, order: OrderData, n: int) -> None:
+        """委托请求发送失败时标记为拒单"""
+        order.status = Status.REJECTED
+        self.active_orders.pop(order.orderid, None)
+        self.gateway.write_log(f"交易委托失败，请求发送返回码：{n}")
+
+    def get_options_template(self, req: OrderRequest) -> int:
+        """获取委托模板编号，同一合约、类型、开平和方向的委托复用同一模板"""
+        key: tuple = (req.symbol, req.type, req.offset, req.direction)
+
+        template_id: Optional[int] = self.options_templates.get(key, None)
+        if template_id is None:
+            template_id = self.add_options_template(req)
+            self.options_templates[key] = template_id
+
+        return template_id
+
+    def add_options_template(self, req: OrderRequest) -> int:
+        """生成委托模板"""
         ord_type, time_in_force = ORDERTYPE_VT2STOCK[req.type]
 
         nh_req: dict = {
             "SecurityID": req.symbol,
-            "Price": req.price,
-            "OrderQty": int(req.volume),
             "OrdType": ord_type,
             "Side": DIRECTION_VT2STOCK[req.direction],
             "PositionEffect": OFFSET_VT2STOCK[req.offset],
             "TimeInForce": time_in_force,
-            "ClOrdID": self.order_ref,
             "PartyID": self.party_id,
             "CoveredOrUncovered": 1,
             "OwnerType": 1
         }
 
-        self.reqid += 1
-        self.reqOptionsInsert(nh_req, self.reqid)
-
-        orderid: str = str(self.order_ref)
-        order: OrderData = req.create_order_data(orderid, self.gateway_name)
-        self.orders[orderid] = order
-
-        self.gateway.on_order(order)
-        return order.vt_orderid
+        return self.addOptionsTemplate(nh_req)
 
     def cancel_order(self, req: CancelRequest) -> None:
         """委托撤单"""
@@ -1136,15 +2219,34 @@ class NhStockTdApi(StockTdApi):
         self.reqid += 1
         self.reqOptionsCancel(nh_req, self.reqid)
 
+    def cancel_orders(self, reqs: List[CancelRequest]) -> None:
+        """批量委托撤单"""
+        for req in reqs:
+            self.cancel_order(req)
+
+    def cancel_all(self, symbol: str = None) -> None:
+        """全部撤单"""
+        reqs: List[CancelRequest] = [
+            order.create_cancel_request() for order in self.active_orders.values()
+            if not symbol or order.symbol == symbol
+        ]
+        self.cancel_orders(reqs)
+
     def query_instrument(self, event: Event) -> None:
-        """查询合约"""
+        """查询合约，发送失败时按退避间隔重试"""
         self.instrument_countdown -= 1
-        if self.instrument_countdown:
+        if self.instrument_countdown > 0:
             return
-        self.gateway.event_engine.unregister(EVENT_TIMER, self.query_instrument)
 
         self.reqid += 1
-        self.reqQryOptions({}, self.reqid)
+        n: int = self.reqQryOptions({}, self.reqid)
+
+        if not n:
+            self.gateway.event_engine.unregister(EVENT_TIMER, self.query_instrument)
+            return
+
+        self.instrument_interval = min(self.instrument_interval * 2, 16)
+        self.instrument_countdown = self.instrument_interval
 
     def query_client(self) -> None:
         """查询投资者账户"""
@@ -1160,14 +2262,15 @@ class NhStockTdApi(StockTdApi):
         self.reqid += 1
         self.reqQryPartAccount(req, self.reqid)
 
-    def query_position(self) -> None:
-        """查询持仓"""
-        if not self.party_id:
-            return
+    def query_position(self) -> bool:
+        """查询持仓，返回查询是否已发出"""
+        if not self.party_id or not self.contract_inited:
+            return False
         req: dict = {"PartyID": self.party_id}
 
         self.reqid += 1
-        self.reqQryPosition(req, self.reqid)
+        n: int = self.reqQryPosition(req, self.reqid)
+        return not n
 
     def close(self) -> None:
         """关闭连接"""
@@ -1240,7 +2343,11 @@ class NhStockTdApi(StockTdApi):
             self.order_ref: int = max(self.order_ref, data["MaxClOrdID"])
             self.today_date: str = data["TradingDay"]
 
-            self.instrument_countdown: int = 10
+            # 先从本地缓存推送合约，柜台查询结果到达后再推送差异
+            self.load_contract_cache()
+
+            self.instrument_countdown = 10
+            self.instrument_interval = 1
             self.gateway.event_engine.register(EVENT_TIMER, self.query_instrument)
         else:
             self.login_failed = True
@@ -1253,6 +2360,7 @@ class NhStockTdApi(StockTdApi):
             order: OrderData = self.orders[orderid]
             order.status = Status.REJECTED
             self.gateway.on_order(copy(order))
+            self.active_orders.pop(orderid, None)
 
             self.gateway.write_error("交易委托失败", error)
 
@@ -1307,24 +2415,46 @@ class NhStockTdApi(StockTdApi):
         """持仓查询回报"""
 
         # 必须已经收到了合约信息后才能处理
-        symbol: str = data["SecurityID"]
-        contract: ContractData = symbol_contract_map.get(symbol, None)
+        symbol: str = data.get("SecurityID", "")
+        contract: ContractData = self.contracts.get(symbol)
 
         if contract:
+            direction: Direction = DIRECTION_STOCK2VT[data["Side"]]
+            key: Tuple[str, Direction] = (symbol, direction)
+
+            position: PositionData = self.positions.get(key, None)
+            if not position:
+                position = PositionData(
+                    symbol=symbol,
+                    exchange=contract.exchange,
+                    direction=direction,
+                    gateway_name=self.gateway_name
+                )
+
+                # 柜台不返回冻结数量，沿用持仓簿根据委托计算的冻结
+                cached: Optional[PositionData] = self.gateway.position_book.positions.get(
+                    (position.vt_symbol, direction), None
+                )
+                if cached:
+                    position.frozen = cached.frozen
+
+                self.positions[key] = position
+
+            # 同一合约方向有多条记录时累加数量和成本
             size: int = contract.size
-            price: float = data["PositionCost"] / (data["Position"] * size)
-
-            position: PositionData = PositionData(
-                symbol=data["SecurityID"],
-                exchange=contract.exchange,
-                direction=DIRECTION_STOCK2VT[data["Side"]],
-                volume=data["Position"],
-                yd_volume=data["YdPosition"],
-                price=price,
-                gateway_name=self.gateway_name
-            )
+            cost: float = position.price * position.volume * size
+
+            position.volume += data["Position"]
+            position.yd_volume += data["YdPosition"]
 
-            self.gateway.on_position(position)
+            if position.volume and size:
+                cost += data["PositionCost"]
+                position.price = cost / (position.volume * size)
+
+        # 全部回报到达后统一校准，查询结果中不存在的持仓会被清零
+        if last:
+            self.gateway.on_positions(list(self.positions.values()))
+            self.positions.clear()
 
     def onRspQryOptions(self, data: dict, error: dict, reqid: int, last: bool) -> None:
         """合约查询回报"""
@@ -1354,13 +2484,20 @@ class NhStockTdApi(StockTdApi):
                 data["contractsymbol"]
             )
 
-            self.gateway.on_contract(contract)
+            self.query_contracts.append(contract)
 
-            symbol_contract_map[contract.symbol] = contract
+            # 只推送与缓存不同的合约
+            if self.contracts.add(contract):
+                self.gateway.on_contract(contract)
 
         if last:
+            save_contract_cache(self.gateway_name, self.today_date, self.query_contracts)
+            self.remove_expired_contracts()
+            self.query_contracts = []
+
             self.contract_inited = True
             self.gateway.write_log("合约信息查询成功")
+            self.gateway.on_option_chains()
 
             for data in self.order_data:
                 self.onRtnOptionsOrder(data)
@@ -1370,6 +2507,37 @@ class NhStockTdApi(StockTdApi):
                 self.onRtnOptionsTrade(data)
             self.trade_data.clear()
 
+    def load_contract_cache(self) -> None:
+        """加载当前交易日的本地合约缓存"""
+        # 断线重连时合约已推送过，无需重复加载
+        if self.contract_inited:
+            return
+
+        contracts: List[ContractData] = load_contract_cache(self.gateway_name, self.today_date)
+        if not contracts:
+            return
+
+        for contract in contracts:
+            self.contracts.add(contract)
+            self.gateway.on_contract(contract)
+
+        self.contract_inited = True
+        self.gateway.write_log("合约信息缓存加载成功")
+        self.gateway.on_option_chains()
+
+    def remove_expired_contracts(self) -> None:
+        """移除缓存中存在但柜台查询结果中没有的合约"""
+        # 查询结果为空时无法判断，保留现有合约
+        if not self.query_contracts:
+            return
+
+        symbols: Set[str] = {contract.symbol for contract in self.query_contracts}
+        removed: List[ContractData] = self.contracts.retain(symbols)
+
+        if removed:
+            names: str = "、".join(contract.symbol for contract in removed[:10])
+            self.gateway.write_log(f"移除{len(removed)}个已失效的缓存合约：{names}")
+
     def onRtnOptionsOrder(self, data: dict) -> None:
         """委托更新推送"""
         if not self.contract_inited:
@@ -1377,7 +2545,7 @@ class NhStockTdApi(StockTdApi):
             return
 
         symbol: str = data["SecurityID"]
-        contract: ContractData = symbol_contract_map[symbol]
+        contract: ContractData = self.contracts[symbol]
         orderid: str = str(data["ClOrdID"])
 
         if orderid not in self.orders:
@@ -1405,6 +2573,11 @@ class NhStockTdApi(StockTdApi):
         )
         self.gateway.on_order(order)
 
+        if order.is_active():
+            self.active_orders[orderid] = order
+        else:
+            self.active_orders.pop(orderid, None)
+
     def onRtnOptionsTrade(self, data: dict) -> None:
         """成交更新推送"""
         if not self.contract_inited:
@@ -1412,7 +2585,7 @@ class NhStockTdApi(StockTdApi):
             return
 
         symbol: str = data["SecurityID"]
-        contract: ContractData = symbol_contract_map[symbol]
+        contract: ContractData = self.contracts[symbol]
         orderid: str = str(data["ClOrdID"])
 
         timestamp: str = f"{self.today_date} {data['TransactTimeOnly']}"
@@ -1495,3 +2668,40 @@ def get_option_index(strike_price: float, exchange_instrument_id: str) -> str:
     option_index = f"{strike_price:.3f}-{index}"
 
     return option_index
+
+
+def load_contract_cache(gateway_name: str, trading_day: str) -> List[ContractData]:
+    """读取本地合约缓存，版本或交易日不一致时返回空列表"""
+    path: Path = get_folder_path(gateway_name.lower()).joinpath(CONTRACT_CACHE_NAME)
+    if not path.exists():
+        return []
+
+    try:
+        with open(path, "rb") as f:
+            data: dict = pickle.load(f)
+    except Exception:
+        return []
+
+    if data.get("version", None) != CONTRACT_CACHE_VERSION:
+        return []
+
+    if data.get("trading_day", None) != trading_day:
+        return []
+
+    return data["contracts"]
+
+
+def save_contract_cache(gateway_name: str, trading_day: str, contracts: List[ContractData]) -> None:
+    """保存合约缓存，先写临时文件再替换，避免读到不完整的文件"""
+    path: Path = get_folder_path(gateway_name.lower()).joinpath(CONTRACT_CACHE_NAME)
+    temp_path: Path = path.with_suffix(".tmp")
+
+    data: dict = {
+        "version": CONTRACT_CACHE_VERSION,
+        "trading_day": trading_day,
+        "contracts": contracts
+    }
+
+    with open(temp_path, "wb") as f:
+        pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+    temp_path.replace(path)